@@ -0,0 +1,62 @@
+"""audit status backfill + county audit list indexes
+
+Revision ID: h8c9d0e1f2a3
+Revises: g7b8c9d0e1f2
+Create Date: 2026-10-18
+
+``/api/v1/counties/{county_id}/audits/list`` used to load every audit
+for a county and filter ``status`` in Python by reading
+``provenance[0].status``. The endpoint now filters, counts and pages in
+SQL against the structured ``audits.status`` column, so:
+
+  - legacy rows seeded before c3d4e5f6a7b8 (status only in provenance)
+    get ``status`` backfilled from the JSON;
+  - ``ix_audits_entity_created`` serves ``ORDER BY created_at DESC``
+    with ``LIMIT/OFFSET`` per county;
+  - ``ix_audits_entity_status_lower`` serves the case-insensitive
+    ``lower(status) = :status`` filter.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "h8c9d0e1f2a3"
+down_revision = "g7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            UPDATE audits
+               SET status = LEFT(provenance -> 0 ->> 'status', 50)
+             WHERE status IS NULL
+               AND jsonb_typeof(provenance) = 'array'
+               AND provenance -> 0 ->> 'status' IS NOT NULL
+            """
+        )
+
+    op.create_index(
+        "ix_audits_entity_created",
+        "audits",
+        ["entity_id", "created_at"],
+        unique=False,
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_audits_entity_status_lower",
+        "audits",
+        ["entity_id", sa.text("lower(status)")],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_audits_entity_status_lower", table_name="audits")
+    op.drop_index("ix_audits_entity_created", table_name="audits")
+    # The status backfill is left in place: the column already existed
+    # and the values mirror what the audits writer stores today.
@@ -0,0 +1,88 @@
+"""add_accountability_snapshots
+
+Creates the versioned snapshot tables behind the county accountability
+scorecards. ``services.accountability`` computes all 47 scorecards in
+one batch and writes an ``accountability_snapshots`` header row plus one
+``accountability_scorecards`` row per county in a single transaction;
+``/counties/{id}/accountability`` and ``/counties/{id}/summary`` read
+the highest snapshot id by ``(snapshot_id, county_id)``.
+
+Revision ID: i9d0e1f2a3b4
+Revises: h8c9d0e1f2a3
+Create Date: 2026-10-18
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "i9d0e1f2a3b4"
+down_revision = "h8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "accountability_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("reason", sa.String(length=100), nullable=True),
+        sa.Column("county_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    op.create_index(
+        "ix_accountability_snapshots_id", "accountability_snapshots", ["id"]
+    )
+
+    op.create_table(
+        "accountability_scorecards",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "snapshot_id",
+            sa.Integer(),
+            sa.ForeignKey("accountability_snapshots.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("county_id", sa.String(length=3), nullable=False),
+        sa.Column(
+            "entity_id", sa.Integer(), sa.ForeignKey("entities.id"), nullable=False
+        ),
+        sa.Column("grade", sa.String(length=1), nullable=False),
+        sa.Column("score", sa.Numeric(5, 1), nullable=False),
+        sa.Column("population", sa.Integer(), nullable=True),
+        sa.Column("total_allocated", sa.Numeric(20, 2), nullable=True),
+        sa.Column("total_spent", sa.Numeric(20, 2), nullable=True),
+        sa.Column("total_findings", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("payload", JSONB(), nullable=False),
+        sa.UniqueConstraint(
+            "snapshot_id", "county_id", name="uq_accountability_snapshot_county"
+        ),
+    )
+    op.create_index(
+        "ix_accountability_scorecards_id", "accountability_scorecards", ["id"]
+    )
+    op.create_index(
+        "ix_accountability_scorecards_snapshot_id",
+        "accountability_scorecards",
+        ["snapshot_id"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_accountability_scorecards_snapshot_id",
+        table_name="accountability_scorecards",
+    )
+    op.drop_index(
+        "ix_accountability_scorecards_id", table_name="accountability_scorecards"
+    )
+    op.drop_table("accountability_scorecards")
+    op.drop_index(
+        "ix_accountability_snapshots_id", table_name="accountability_snapshots"
+    )
+    op.drop_table("accountability_snapshots")
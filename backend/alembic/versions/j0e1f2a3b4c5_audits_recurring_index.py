@@ -0,0 +1,35 @@
+"""audits (entity_id, query_type, audit_year) index for recurring findings
+
+Revision ID: j0e1f2a3b4c5
+Revises: i9d0e1f2a3b4
+Create Date: 2026-10-18
+
+``/api/v1/audit/recurring`` now detects recurring groups and aggregates
+their years, finding IDs and amounts in a single
+``GROUP BY entity_id, query_type`` query. This index lets Postgres walk
+the groups in order and count distinct ``audit_year`` values without a
+sort. It was previously only defined in the unused
+``backend/migrations`` tree; the same name is kept so databases that ran
+that script are left untouched.
+"""
+
+from alembic import op
+
+revision = "j0e1f2a3b4c5"
+down_revision = "i9d0e1f2a3b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_audits_entity_querytype_year",
+        "audits",
+        ["entity_id", "query_type", "audit_year"],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_audits_entity_querytype_year", table_name="audits")
@@ -0,0 +1,103 @@
+"""covering and partial indexes for the hot read endpoints
+
+Revision ID: k1f2a3b4c5d6
+Revises: j0e1f2a3b4c5
+Create Date: 2026-10-18
+
+Derived from the statements the county, audit and entity endpoints
+actually issue (see ``tests/test_query_plans.py``):
+
+  - ``budget_lines (entity_id, period_id) INCLUDE (allocated_amount,
+    actual_spent)`` replaces ``ix_budget_lines_entity_period`` so the
+    per-period budget totals are index-only scans;
+  - ``audits (entity_id, query_type) WHERE follow_up_status =
+    'Recurring'`` is a small partial index for the flagged-recurring
+    check;
+  - ``population_data`` / ``gdp_data (entity_id, year DESC) INCLUDE
+    (value)`` replace the ascending ``*_entity_year`` indexes and serve
+    the latest-year lookup per county without touching the heap.
+
+``audits (entity_id, period_id)`` and ``(entity_id, query_type,
+audit_year)`` and ``loans (entity_id)`` are already covered by
+``add_performance_indexes`` and ``j0e1f2a3b4c5``. ``INCLUDE`` needs
+Postgres 11+; other dialects get the plain composite index.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "k1f2a3b4c5d6"
+down_revision = "j0e1f2a3b4c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ── Budget lines ────────────────────────────────────────────────────
+    op.create_index(
+        "ix_budget_lines_entity_period_cov",
+        "budget_lines",
+        ["entity_id", "period_id"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_include=["allocated_amount", "actual_spent"],
+    )
+    op.drop_index(
+        "ix_budget_lines_entity_period", table_name="budget_lines", if_exists=True
+    )
+
+    # ── Audits ──────────────────────────────────────────────────────────
+    op.create_index(
+        "ix_audits_recurring_flag",
+        "audits",
+        ["entity_id", "query_type"],
+        unique=False,
+        if_not_exists=True,
+        postgresql_where=sa.text("follow_up_status = 'Recurring'"),
+        sqlite_where=sa.text("follow_up_status = 'Recurring'"),
+    )
+
+    # ── Population / GDP ────────────────────────────────────────────────
+    op.create_index(
+        "ix_population_data_entity_year_desc",
+        "population_data",
+        ["entity_id", sa.text("year DESC")],
+        unique=False,
+        if_not_exists=True,
+        postgresql_include=["total_population"],
+    )
+    op.drop_index(
+        "ix_population_data_entity_year",
+        table_name="population_data",
+        if_exists=True,
+    )
+    op.create_index(
+        "ix_gdp_data_entity_year_desc",
+        "gdp_data",
+        ["entity_id", sa.text("year DESC")],
+        unique=False,
+        if_not_exists=True,
+        postgresql_include=["gdp_value"],
+    )
+    op.drop_index("ix_gdp_data_entity_year", table_name="gdp_data", if_exists=True)
+
+
+def downgrade():
+    op.create_index(
+        "ix_gdp_data_entity_year", "gdp_data", ["entity_id", "year"],
+        unique=False, if_not_exists=True,
+    )
+    op.drop_index("ix_gdp_data_entity_year_desc", table_name="gdp_data")
+    op.create_index(
+        "ix_population_data_entity_year", "population_data", ["entity_id", "year"],
+        unique=False, if_not_exists=True,
+    )
+    op.drop_index(
+        "ix_population_data_entity_year_desc", table_name="population_data"
+    )
+    op.drop_index("ix_audits_recurring_flag", table_name="audits")
+    op.create_index(
+        "ix_budget_lines_entity_period", "budget_lines", ["entity_id", "period_id"],
+        unique=False, if_not_exists=True,
+    )
+    op.drop_index("ix_budget_lines_entity_period_cov", table_name="budget_lines")
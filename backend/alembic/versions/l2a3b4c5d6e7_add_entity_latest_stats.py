@@ -0,0 +1,95 @@
+"""add entity_latest_stats projection
+
+Revision ID: l2a3b4c5d6e7
+Revises: k1f2a3b4c5d6
+Create Date: 2026-10-18
+
+One row per entity (``entity_key`` = entity id, 0 for the national
+``entity_id IS NULL`` series) with the latest population and GDP values
+and the ids of the source rows. Maintained by
+``services.latest_stats.refresh_latest_stats`` from the population and
+GDP writers; the unique ``entity_key`` index turns every per-capita
+lookup into a single keyed read.
+
+The projection is backfilled here on Postgres; other dialects are
+populated by the startup rebuild.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "l2a3b4c5d6e7"
+down_revision = "k1f2a3b4c5d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "entity_latest_stats",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("entity_key", sa.Integer(), nullable=False),
+        sa.Column(
+            "entity_id",
+            sa.Integer(),
+            sa.ForeignKey("entities.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column(
+            "population_id",
+            sa.Integer(),
+            sa.ForeignKey("population_data.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("population_year", sa.Integer(), nullable=True),
+        sa.Column("total_population", sa.Integer(), nullable=True),
+        sa.Column(
+            "gdp_id",
+            sa.Integer(),
+            sa.ForeignKey("gdp_data.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("gdp_year", sa.Integer(), nullable=True),
+        sa.Column("gdp_quarter", sa.String(length=2), nullable=True),
+        sa.Column("gdp_value", sa.Numeric(20, 2), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.UniqueConstraint("entity_key"),
+    )
+    op.create_index("ix_entity_latest_stats_id", "entity_latest_stats", ["id"])
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            """
+            INSERT INTO entity_latest_stats
+                (entity_key, entity_id, population_id, population_year,
+                 total_population, updated_at)
+            SELECT DISTINCT ON (COALESCE(entity_id, 0))
+                   COALESCE(entity_id, 0), entity_id, id, year,
+                   total_population, now()
+              FROM population_data
+             ORDER BY COALESCE(entity_id, 0), year DESC
+            """
+        )
+        op.execute(
+            """
+            INSERT INTO entity_latest_stats
+                (entity_key, entity_id, gdp_id, gdp_year, gdp_quarter,
+                 gdp_value, updated_at)
+            SELECT DISTINCT ON (COALESCE(entity_id, 0))
+                   COALESCE(entity_id, 0), entity_id, id, year, quarter,
+                   gdp_value, now()
+              FROM gdp_data
+             ORDER BY COALESCE(entity_id, 0), year DESC,
+                      quarter IS NULL DESC, quarter DESC
+            ON CONFLICT (entity_key) DO UPDATE
+               SET gdp_id = EXCLUDED.gdp_id,
+                   gdp_year = EXCLUDED.gdp_year,
+                   gdp_quarter = EXCLUDED.gdp_quarter,
+                   gdp_value = EXCLUDED.gdp_value
+            """
+        )
+
+
+def downgrade():
+    op.drop_index("ix_entity_latest_stats_id", table_name="entity_latest_stats")
+    op.drop_table("entity_latest_stats")
@@ -0,0 +1,57 @@
+"""add alert_outbox
+
+Revision ID: m3b4c5d6e7f8
+Revises: l2a3b4c5d6e7
+Create Date: 2026-10-18
+
+Watcher alerts are appended here inside the ingesting transaction
+(``services.alert_service.notify_watchers``) and fanned out to
+``data_alerts`` in batches by the alert dispatcher, instead of one
+``notify_watchers()`` call and commit per item. The partial index covers
+the dispatcher's scan for pending rows. ``users.alert_emails`` lets the
+digest's unsubscribe link stop emails without turning off in-app alerts.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "m3b4c5d6e7f8"
+down_revision = "l2a3b4c5d6e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "alert_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("item_type", sa.String(length=30), nullable=False),
+        sa.Column("item_id", sa.String(length=100), nullable=False),
+        sa.Column("alert_type", sa.String(length=50), nullable=False),
+        sa.Column("title", sa.String(length=300), nullable=False),
+        sa.Column("body", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("dispatched_at", sa.DateTime(), nullable=True),
+        sa.Column("alerts_created", sa.Integer(), nullable=True),
+    )
+    op.create_index("ix_alert_outbox_id", "alert_outbox", ["id"])
+    op.create_index(
+        "ix_alert_outbox_pending",
+        "alert_outbox",
+        ["id"],
+        postgresql_where=sa.text("dispatched_at IS NULL"),
+        sqlite_where=sa.text("dispatched_at IS NULL"),
+    )
+    op.add_column(
+        "users",
+        sa.Column(
+            "alert_emails", sa.Boolean(), nullable=True, server_default=sa.true()
+        ),
+    )
+
+
+def downgrade():
+    op.drop_column("users", "alert_emails")
+    op.drop_index("ix_alert_outbox_pending", table_name="alert_outbox")
+    op.drop_index("ix_alert_outbox_id", table_name="alert_outbox")
+    op.drop_table("alert_outbox")
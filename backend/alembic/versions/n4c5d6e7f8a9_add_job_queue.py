@@ -0,0 +1,77 @@
+"""add job_queue
+
+Revision ID: n4c5d6e7f8a9
+Revises: m3b4c5d6e7f8
+Create Date: 2026-10-18
+
+Persistent queue for the unified job scheduler
+(``services.job_scheduler``), which replaces the APScheduler intervals,
+the AutoSeeder refresh loop and SmartScheduler polling. The partial
+index covers the claim scan over queued rows; ``(key, run_at)`` serves
+the per-schedule "last run" lookup. ``ux_job_queue_active_key`` allows
+one queued or running row per key, so replicas enqueueing the same key
+at once cannot both insert.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "n4c5d6e7f8a9"
+down_revision = "m3b4c5d6e7f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "job_queue",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("job", sa.String(length=100), nullable=False),
+        sa.Column("key", sa.String(length=200), nullable=True),
+        sa.Column("args", postgresql.JSONB(), nullable=True),
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="50"),
+        sa.Column(
+            "resource_class",
+            sa.String(length=20),
+            nullable=False,
+            server_default="network",
+        ),
+        sa.Column(
+            "status", sa.String(length=20), nullable=False, server_default="queued"
+        ),
+        sa.Column("run_at", sa.DateTime(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("worker", sa.String(length=100), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("result", postgresql.JSONB(), nullable=True),
+    )
+    op.create_index("ix_job_queue_id", "job_queue", ["id"])
+    op.create_index(
+        "ix_job_queue_ready",
+        "job_queue",
+        ["priority", "run_at"],
+        postgresql_where=sa.text("status = 'queued'"),
+        sqlite_where=sa.text("status = 'queued'"),
+    )
+    op.create_index("ix_job_queue_key_run_at", "job_queue", ["key", "run_at"])
+    op.create_index(
+        "ux_job_queue_active_key",
+        "job_queue",
+        ["key"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running')"),
+        sqlite_where=sa.text("status IN ('queued', 'running')"),
+    )
+
+
+def downgrade():
+    op.drop_index("ux_job_queue_active_key", table_name="job_queue")
+    op.drop_index("ix_job_queue_key_run_at", table_name="job_queue")
+    op.drop_index("ix_job_queue_ready", table_name="job_queue")
+    op.drop_index("ix_job_queue_id", table_name="job_queue")
+    op.drop_table("job_queue")
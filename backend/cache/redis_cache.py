@@ -1,16 +1,26 @@
 """Redis caching utilities for API responses."""
 
+import asyncio
 import json
 import logging
 import os
 import time
+import weakref
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 import redis
 
+from monitoring.instrumentation import record_cache_lookup
+
 logger = logging.getLogger(__name__)
 
+# Every RedisCache built in this process (``cache`` below, main's and the
+# money-flow router's) and the in-memory fallbacks of the endpoint cache
+# decorators, so clear_response_caches() reaches all of them.
+_instances: "weakref.WeakSet" = weakref.WeakSet()
+_response_mem_caches: List[dict] = []
+
 
 class RedisCache:
     """Redis cache manager with fallback to in-memory cache."""
@@ -21,6 +31,7 @@ class RedisCache:
         self._memory_cache = {}  # {key: (value, expiry_timestamp)}
         self._memory_cache_max_size = 1024
         self._initialize()
+        _instances.add(self)
 
     def _initialize(self):
         """Initialize Redis connection with error handling."""
@@ -158,6 +169,48 @@ def _is_cacheable_param(value: Any) -> bool:
     return not isinstance(value, _SKIP_CACHE_KEY_TYPES)
 
 
+# Loads in flight by cache key. Concurrent misses for the same key wait
+# for the first caller's result instead of each running the query.
+_inflight: Dict[str, "asyncio.Future"] = {}
+
+
+async def single_flight(
+    key: str, load: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """Run ``load()`` at most once at a time per ``key``.
+
+    Returns ``(result, coalesced)``; ``coalesced`` is True when the result
+    came from another caller's load. A failed load raises in every waiter.
+    """
+    while True:
+        future = _inflight.get(key)
+        if future is None:
+            break
+        try:
+            return await asyncio.shield(future), True
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise  # this caller was cancelled, not the load
+            # The loading request was cancelled; take over the load.
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await load()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # retrieved; no "never retrieved" warning
+        raise
+    else:
+        future.set_result(result)
+        return result, False
+    finally:
+        _inflight.pop(key, None)
+
+
 def cached(ttl: int = 3600, key_prefix: str = ""):
     """Decorator for caching function results.
 
@@ -171,7 +224,8 @@ def cached(ttl: int = 3600, key_prefix: str = ""):
         async def wrapper(*args, **kwargs):
             # Generate cache key from function name and arguments,
             # excluding non-serialisable DI objects (db sessions, requests)
-            cache_key_parts = [key_prefix or func.__name__]
+            prefix = key_prefix or func.__name__
+            cache_key_parts = [prefix]
 
             for arg in args:
                 if _is_cacheable_param(arg):
@@ -187,15 +241,20 @@ def cached(ttl: int = 3600, key_prefix: str = ""):
             cached_value = cache.get(cache_key)
             if cached_value is not None:
                 logger.debug(f"Cache hit: {cache_key}")
+                record_cache_lookup(prefix, "hit")
                 return cached_value
 
             # Call function and cache result
             logger.debug(f"Cache miss: {cache_key}")
-            result = await func(*args, **kwargs)
 
-            if result is not None:
-                cache.set(cache_key, result, ttl)
+            async def load():
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    cache.set(cache_key, result, ttl)
+                return result
 
+            result, coalesced = await single_flight(cache_key, load)
+            record_cache_lookup(prefix, "coalesced" if coalesced else "miss")
             return result
 
         return wrapper
@@ -207,3 +266,89 @@ def invalidate_cache(pattern: str):
     """Invalidate cache entries matching pattern."""
     cache.clear_pattern(pattern)
     logger.info(f"Invalidated cache pattern: {pattern}")
+
+
+def register_response_cache(mem_cache: dict) -> dict:
+    """Track an endpoint decorator's in-memory fallback cache."""
+    _response_mem_caches.append(mem_cache)
+    return mem_cache
+
+
+def response_mem_caches() -> List[dict]:
+    return list(_response_mem_caches)
+
+
+def response_cache_instances() -> List[RedisCache]:
+    return list(_instances)
+
+
+def clear_response_caches(prefixes: Iterable[str]) -> None:
+    """Drop cached endpoint responses whose key starts with one of ``prefixes``.
+
+    Covers every registered in-memory fallback cache and every RedisCache
+    in this process, in memory and in Redis.
+    """
+    prefixes = tuple(prefixes)
+    for mem in response_mem_caches():
+        for key in [k for k in mem if isinstance(k, str) and k.startswith(prefixes)]:
+            mem.pop(key, None)
+    for rc in response_cache_instances():
+        for prefix in prefixes:
+            rc.clear_pattern(f"{prefix}*")
+
+
+# {mapped class: {cache key pattern, ...}} — see invalidate_on_commit()
+_COMMIT_INVALIDATIONS: dict = {}
+
+
+def _collect_dirty_patterns(session, flush_context):
+    """after_flush hook: remember which cache patterns this flush dirtied."""
+    pending = session.info.setdefault("_cache_invalidate", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        for model, patterns in _COMMIT_INVALIDATIONS.items():
+            if isinstance(obj, model):
+                pending.update(patterns)
+
+
+def _invalidate_committed(session):
+    """after_commit hook: drop cache entries whose source rows changed."""
+    for pattern in session.info.pop("_cache_invalidate", ()):
+        invalidate_cache(pattern)
+
+
+def _discard_pending(session):
+    session.info.pop("_cache_invalidate", None)
+
+
+def invalidate_on_commit(model: type, *patterns: str):
+    """Invalidate ``patterns`` whenever a transaction writing ``model`` commits.
+
+    Hooks every SQLAlchemy ``Session``, so API handlers, seeding writers
+    and the auto-seeder all invalidate without knowing which endpoints
+    cache their tables. Only ORM unit-of-work writes are seen; bulk
+    ``insert()``/``update()`` statements must call ``invalidate_cache``
+    themselves.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    if not _COMMIT_INVALIDATIONS:
+        event.listen(Session, "after_flush", _collect_dirty_patterns)
+        event.listen(Session, "after_commit", _invalidate_committed)
+        event.listen(Session, "after_rollback", _discard_pending)
+    _COMMIT_INVALIDATIONS.setdefault(model, set()).update(patterns)
+
+
+def register_commit_invalidations() -> None:
+    """Register the commit hooks for every cached read model.
+
+    The API gets them by importing the routers that cache; processes that
+    write without mounting those routers (the ``etl.worker`` job worker,
+    which runs the auto-seeder and ETL refreshes) must call this so their
+    commits still drop the shared Redis entries. Safe to call repeatedly.
+    """
+    from models import Audit
+
+    # Every cached audit dashboard aggregate is derived from ``audits``
+    # alone, so any committed audits write drops the lot.
+    invalidate_on_commit(Audit, "audit_*")
@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
+    # Which routers this process mounts: "all", "public" (read API only,
+    # no ETL code loaded) or "admin" (admin + ETL worker endpoints).
+    API_ROLE: str = "all"
 
     # Secret Management Backend
     SECRET_BACKEND: str = "env"  # Options: "env", "aws", "vault"
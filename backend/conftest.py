@@ -79,6 +79,18 @@ def _setup_tables():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_blob_store(tmp_path, monkeypatch):
+    """Give each test its own shared blob store (no S3, no stale URL hits)."""
+    from services.blob_store import default_store
+
+    monkeypatch.setenv("BLOB_STORE_PATH", str(tmp_path / "blobs"))
+    monkeypatch.setenv("BLOB_STORE_BACKEND", "local")
+    default_store.cache_clear()
+    yield
+    default_store.cache_clear()
+
+
 @pytest.fixture()
 def db_session():
     """Provide a transactional DB session that rolls back after each test."""
@@ -118,13 +130,11 @@ def client(db_session):
     #
     # Also bypass the rate-limiter middleware so the 120 req/60 s window
     # doesn't trip during the full test suite.
-    async def _passthrough_dispatch(self, request, call_next):
-        return await call_next(request)
+    async def _passthrough(self, scope, receive, send):
+        await self.app(scope, receive, send)
 
     with patch("main.get_db", _override_get_db), patch(
-        "middleware.security.RateLimitMiddleware.dispatch", _passthrough_dispatch
-    ), patch(
-        "middleware.security.RedisRateLimitMiddleware.dispatch", _passthrough_dispatch
+        "middleware.security.RateLimitMiddleware.__call__", _passthrough
     ):
         yield TestClient(app, raise_server_exceptions=False)
 
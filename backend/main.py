@@ -1,35 +1,46 @@
 import asyncio
-import concurrent.futures
 import datetime
 import functools
-import importlib
 import logging
 import os
-import random
 import re
-import smtplib
 import sys
 import time
-from email.mime.text import MIMEText
-from email.utils import formatdate
 from typing import Any, Dict, List, Optional, Tuple
 
 import httpx  # For internal API calls
+import queries
 import uvicorn
+from cache.redis_cache import (
+    register_response_cache,
+    response_cache_instances,
+    response_mem_caches,
+    single_flight,
+)
 from config.settings import settings
+from monitoring import query_tracing
+from middleware.stack import install_middleware
+from monitoring.instrumentation import record_cache_lookup
+from services import etl_reports
+from services.static_snapshots import (
+    default_store as default_snapshot_store,
+    snapshots_enabled,
+)
 from services.trust_guards import (
-    check_budget_sectors,
-    check_coverage_staleness,
     check_period_nonempty,
     check_plausible_total,
     reconcile_debt_totals,
 )
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
+from utils.counties import COUNTY_MAPPING
+from utils.sectors import SECTOR_NORMALIZE, SECTOR_ORDER
+from utils.response_meta import (
+    MAX_NATIONAL_BUDGET_KES,
+    check_plausibility,
+    response_meta,
+)
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel
-from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from starlette.responses import JSONResponse, Response
 
@@ -61,14 +72,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-try:
-    import boto3  # type: ignore
-except Exception:
-    boto3 = None  # type: ignore
-
 # Import Redis cache
 try:
-    from bootstrap import initialize_reference_data
     from cache.redis_cache import RedisCache
 
     redis_cache = RedisCache()
@@ -90,13 +95,9 @@ DocumentType = None
 Severity = None
 
 
-def get_db():  # default stub; may be overridden below if real DB is present
-    return None
-
-
 try:  # Try to wire real DB and models when available
     # Lazy imports so that local dev without DB still works
-    from database import get_db as _real_get_db  # type: ignore
+    from database import get_db  # type: ignore
     from models import Audit as _DBAudit  # type: ignore
     from models import BudgetLine as _DBBudgetLine
     from models import Country as _DBCountry
@@ -113,7 +114,6 @@ try:  # Try to wire real DB and models when available
     from models import SourceDocument as _DBSourceDocument
 
     # Bind real references
-    get_db = _real_get_db  # type: ignore
     DBAudit = _DBAudit
     DBEntity = _DBEntity
     DBFiscalPeriod = _DBFiscalPeriod
@@ -175,313 +175,6 @@ def _resolve_fy_metrics(meta: dict, fiscal_year: Optional[str] = None) -> dict:
     return {}
 
 
-# ── Unit & plausibility metadata ──────────────────────────────────────
-
-
-def _response_meta(
-    *,
-    unit: str,
-    entity_scope: str,
-    fiscal_period: str | None = None,
-    scope_detail: str | None = None,
-    generated_at: str | datetime.datetime | None = None,
-    source_updated_at: str | datetime.datetime | None = None,
-    covers_through: str | None = None,
-    cache_ttl_seconds: int | None = None,
-    data_quality: str | None = None,
-    quality_notes: list[str] | None = None,
-) -> dict:
-    """Build a standard ``_meta`` envelope for finance endpoints.
-
-    Core fields
-    -----------
-    unit: "kes" | "billion_kes" | "percentage" | "mixed"
-    entity_scope: "national" | "county" | "all"
-    scope_detail: free-text clarification of what the endpoint actually
-        measures — e.g. "National-government execution only; excludes
-        county equitable share". Surface verbatim in the UI.
-
-    Freshness fields (added April 2026)
-    -----------------------------------
-    generated_at: ISO-8601 timestamp of when *this response* was built
-        (not when data was last refreshed). If omitted, set to now().
-    source_updated_at: ISO-8601 timestamp of the most recent row that
-        contributed to this response — MAX(created_at) or
-        MAX(updated_at) across the tables queried. Tells clients how
-        fresh the underlying data is, independent of cache age.
-    covers_through: human-readable coverage label (e.g. "FY2024/25" or
-        "Q2 2025"). Distinct from *fiscal_period* only when the
-        endpoint spans multiple periods and the latest one is what
-        clients should show.
-    cache_ttl_seconds: the @cached TTL, so clients know the maximum
-        staleness they might see. Omit for uncached endpoints.
-    data_quality: one of {"official", "estimated", "projected",
-        "historical", "mixed"}. Derived from joined SourceDocument
-        rows or hardcoded when the endpoint has known provenance.
-    quality_notes: list of human-readable caveats surfaced to the UI
-        (missing categories, uniform-absorption warnings, divergence
-        between sources, etc.). Produced by ``trust_guards`` helpers.
-    """
-    meta: dict = {"unit": unit, "entity_scope": entity_scope}
-    if fiscal_period:
-        meta["fiscal_period"] = fiscal_period
-    if scope_detail:
-        meta["scope_detail"] = scope_detail
-    # Always stamp generated_at so the frontend can render a relative
-    # "Updated X ago" badge without guessing.
-    if generated_at is None:
-        generated_at = datetime.datetime.utcnow()
-    if isinstance(generated_at, datetime.datetime):
-        meta["generated_at"] = generated_at.isoformat() + "Z"
-    else:
-        meta["generated_at"] = str(generated_at)
-    if source_updated_at is not None:
-        if isinstance(source_updated_at, datetime.datetime):
-            meta["source_updated_at"] = source_updated_at.isoformat() + "Z"
-        else:
-            meta["source_updated_at"] = str(source_updated_at)
-    if covers_through:
-        meta["covers_through"] = covers_through
-    if cache_ttl_seconds is not None:
-        meta["cache_ttl_seconds"] = int(cache_ttl_seconds)
-    if data_quality:
-        meta["data_quality"] = data_quality
-    if quality_notes:
-        # Defensive copy so callers can't mutate meta post-hoc.
-        meta["quality_notes"] = list(quality_notes)
-    return meta
-
-
-# Plausibility bounds (order-of-magnitude sanity checks)
-_MAX_COUNTY_BUDGET_KES = 50_000_000_000  # 50 B KES – largest county ≈ Nairobi 10B
-_MAX_NATIONAL_BUDGET_KES = 10_000_000_000_000  # 10 T KES
-_MAX_NATIONAL_BUDGET_BILLION = 10_000  # 10 T KES expressed in billions
-_MAX_SINGLE_LOAN_KES = 5_000_000_000_000  # 5 T KES
-
-
-def _check_plausibility(
-    value: float,
-    ceiling: float,
-    label: str,
-    *,
-    allow_negative: bool = False,
-) -> None:
-    """Log a WARNING if *value* exceeds *ceiling* or is unexpectedly negative."""
-    if value > ceiling:
-        logging.warning(
-            "PLAUSIBILITY FAIL: %s = %s exceeds ceiling %s",
-            label,
-            f"{value:,.0f}",
-            f"{ceiling:,.0f}",
-        )
-    if not allow_negative and value < 0:
-        logging.warning(
-            "PLAUSIBILITY FAIL: %s = %s is negative",
-            label,
-            f"{value:,.0f}",
-        )
-
-
-def _latest_county_period(db) -> Optional[int]:
-    """Return the period_id of the latest FiscalPeriod that has county BudgetLines.
-
-    This ensures sector/budget queries are scoped to a single fiscal year and
-    only include county-level data — never national budget lines or aggregate rows.
-    Returns None if no county budget lines exist.
-    """
-    from sqlalchemy import func as _fn
-
-    row = (
-        db.query(DBBudgetLine.period_id)
-        .join(DBEntity, DBBudgetLine.entity_id == DBEntity.id)
-        .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-        .filter(DBEntity.type == EntityType.COUNTY)
-        .filter(DBBudgetLine.category != "Total Budget")
-        .order_by(DBFiscalPeriod.start_date.desc())
-        .limit(1)
-        .first()
-    )
-    return row[0] if row else None
-
-
-def _latest_national_period(db) -> Optional[int]:
-    """Return the period_id of the latest FiscalPeriod that has national BudgetLines."""
-    from sqlalchemy import func as _fn
-
-    row = (
-        db.query(DBBudgetLine.period_id)
-        .join(DBEntity, DBBudgetLine.entity_id == DBEntity.id)
-        .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-        .filter(DBEntity.type == EntityType.NATIONAL)
-        .order_by(DBFiscalPeriod.start_date.desc())
-        .limit(1)
-        .first()
-    )
-    return row[0] if row else None
-
-
-def _is_debt_loan(loan) -> bool:
-    """True when a Loan row counts as DEBT for total-debt aggregations.
-
-    The single piece of business logic this encodes: ``PENDING_BILLS``
-    rows live in the ``loans`` table for storage convenience but are
-    NOT borrowed money — they're unpaid obligations and must NOT be
-    summed into "total national debt" or any "debt-to-GDP" ratio.
-    Use this predicate (or :func:`_debt_loans_query`) every time you
-    iterate ``loans`` to compute a debt total, so a future endpoint
-    can't silently inflate the displayed debt by 700B+ the way
-    ``/api/v1/debt/national`` did before this helper landed (the
-    pending-bills records from PR #84 started writing to the
-    ``loans`` table successfully and immediately broke the headline
-    Total Debt KPI on the frontend).
-
-    Loans with no ``debt_category`` set count as debt — that matches
-    every existing aggregator's pre-fix behaviour.
-    """
-    from models import DebtCategory as _DC
-
-    if loan.debt_category is None:
-        return True
-    return loan.debt_category != _DC.PENDING_BILLS
-
-
-def _debt_loans_query(db, entity_filter):
-    """SQLAlchemy query for Loan rows that count as debt.
-
-    Companion to :func:`_is_debt_loan` for the case where the caller
-    only needs debt-only loans and never iterates the pending-bills
-    rows for any other purpose. Pass ``entity_filter`` as a SQL
-    expression — single entity (``DBLoan.entity_id == eid``) or a set
-    (``DBLoan.entity_id.in_(eids)``).
-
-    NULL handling matters here: ``loans.debt_category`` is nullable
-    (the model has a Python-side default of ``OTHER`` but the writer
-    can pass ``debt_category=None`` which overrides the default, and
-    older rows seeded before that default existed may also be NULL).
-    A naive ``debt_category != PENDING_BILLS`` filter silently drops
-    those rows — SQL's three-valued logic makes ``NULL != value``
-    evaluate to ``UNKNOWN``, treated as ``FALSE`` in WHERE. Mirror
-    :func:`_is_debt_loan`'s "NULL counts as debt" rule by explicitly
-    OR-ing in the ``IS NULL`` branch (Copilot review on PR #90
-    flagged this on the inline filter sites; baking it into the
-    helper keeps every future caller correct by default).
-    """
-    from models import DebtCategory as _DC
-
-    return db.query(DBLoan).filter(
-        entity_filter,
-        or_(
-            DBLoan.debt_category.is_(None),
-            DBLoan.debt_category != _DC.PENDING_BILLS,
-        ),
-    )
-
-
-def _entity_period_budget_query(db, entity_id: int, period_id: Optional[int] = None):
-    """Return BudgetLine query scoped to a single entity and (optionally) period.
-
-    If period_id is None, auto-resolves to the latest period that has *actual
-    execution* data for the entity (sum of ``actual_spent`` > 0). This avoids
-    the pathological case where the current fiscal year has been seeded with
-    allocations but hasn't yet accumulated spending, which was rendering as
-    "0% execution" on county pages.
-
-    Falls back to the latest period by ``start_date`` when no period has
-    execution data (e.g. first-year county, seed data issues).
-
-    Excludes 'Total Budget' aggregate rows.
-    """
-    q = db.query(DBBudgetLine).filter(
-        DBBudgetLine.entity_id == entity_id,
-        DBBudgetLine.category != "Total Budget",
-    )
-    if period_id:
-        q = q.filter(DBBudgetLine.period_id == period_id)
-    else:
-        # Prefer the latest period that actually has spending (an executed FY)
-        from sqlalchemy import func as _sqlfunc
-
-        latest_executed = (
-            db.query(DBBudgetLine.period_id)
-            .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-            .filter(
-                DBBudgetLine.entity_id == entity_id,
-                DBBudgetLine.category != "Total Budget",
-            )
-            .group_by(DBBudgetLine.period_id, DBFiscalPeriod.start_date)
-            .having(_sqlfunc.coalesce(_sqlfunc.sum(DBBudgetLine.actual_spent), 0) > 0)
-            .order_by(DBFiscalPeriod.start_date.desc())
-            .limit(1)
-            .scalar()
-        )
-        # Fallback: latest period by date (first-year county / missing actuals)
-        latest = latest_executed or (
-            db.query(DBBudgetLine.period_id)
-            .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-            .filter(
-                DBBudgetLine.entity_id == entity_id,
-                DBBudgetLine.category != "Total Budget",
-            )
-            .order_by(DBFiscalPeriod.start_date.desc())
-            .limit(1)
-            .scalar()
-        )
-        if latest:
-            q = q.filter(DBBudgetLine.period_id == latest)
-    return q
-
-
-# County ID to Name mapping
-COUNTY_MAPPING = {
-    "001": "Nairobi",
-    "002": "Kwale",
-    "003": "Kilifi",
-    "004": "Tana River",
-    "005": "Lamu",
-    "006": "Taita Taveta",
-    "007": "Garissa",
-    "008": "Wajir",
-    "009": "Mandera",
-    "010": "Marsabit",
-    "011": "Isiolo",
-    "012": "Meru",
-    "013": "Tharaka Nithi",
-    "014": "Embu",
-    "015": "Kitui",
-    "016": "Machakos",
-    "017": "Makueni",
-    "018": "Nyandarua",
-    "019": "Nyeri",
-    "020": "Kirinyaga",
-    "021": "Murang'a",
-    "022": "Kiambu",
-    "023": "Turkana",
-    "024": "West Pokot",
-    "025": "Samburu",
-    "026": "Trans Nzoia",
-    "027": "Uasin Gishu",
-    "028": "Elgeyo Marakwet",
-    "029": "Nandi",
-    "030": "Baringo",
-    "031": "Laikipia",
-    "032": "Nakuru",
-    "033": "Narok",
-    "034": "Kajiado",
-    "035": "Kericho",
-    "036": "Bomet",
-    "037": "Kakamega",
-    "038": "Vihiga",
-    "039": "Bungoma",
-    "040": "Busia",
-    "041": "Siaya",
-    "042": "Kisumu",
-    "043": "Homa Bay",
-    "044": "Migori",
-    "045": "Kisii",
-    "046": "Nyamira",
-    "047": "Mombasa",
-}
-
 # County centroid coordinates [longitude, latitude] — approximate geographic centers
 COUNTY_COORDINATES = {
     "001": [36.8219, -1.2921],  # Nairobi
@@ -536,56 +229,6 @@ COUNTY_COORDINATES = {
 # Reverse mapping for backend to frontend ID conversion
 NAME_TO_ID_MAPPING = {v: k for k, v in COUNTY_MAPPING.items()}
 
-# County regions for peer comparison (based on Kenya's former provinces)
-COUNTY_REGIONS = {
-    "001": "Nairobi",
-    "002": "Coast",
-    "003": "Coast",
-    "004": "Coast",
-    "005": "Coast",
-    "006": "Coast",
-    "047": "Coast",
-    "007": "North Eastern",
-    "008": "North Eastern",
-    "009": "North Eastern",
-    "010": "Eastern",
-    "011": "Eastern",
-    "012": "Eastern",
-    "013": "Eastern",
-    "014": "Eastern",
-    "015": "Eastern",
-    "016": "Eastern",
-    "017": "Eastern",
-    "018": "Central",
-    "019": "Central",
-    "020": "Central",
-    "021": "Central",
-    "022": "Central",
-    "023": "Rift Valley",
-    "024": "Rift Valley",
-    "025": "Rift Valley",
-    "026": "Rift Valley",
-    "027": "Rift Valley",
-    "028": "Rift Valley",
-    "029": "Rift Valley",
-    "030": "Rift Valley",
-    "031": "Rift Valley",
-    "032": "Rift Valley",
-    "033": "Rift Valley",
-    "034": "Rift Valley",
-    "035": "Rift Valley",
-    "036": "Rift Valley",
-    "037": "Western",
-    "038": "Western",
-    "039": "Western",
-    "040": "Western",
-    "041": "Nyanza",
-    "042": "Nyanza",
-    "043": "Nyanza",
-    "044": "Nyanza",
-    "045": "Nyanza",
-    "046": "Nyanza",
-}
 
 # Enhanced County Analytics API base URL
 ENHANCED_COUNTY_API_BASE = os.getenv(
@@ -806,68 +449,6 @@ def transform_county_data_for_frontend(backend_data: Dict, county_id: str) -> Di
 #     Document, Entity, FiscalPeriod, Loan, SourceDocument, User,
 # )
 
-# Add ETL module to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "etl"))
-
-# Instead of importing ETL modules directly (which have dependency issues),
-# we'll create a simple ETL function that works independently
-ETL_AVAILABLE = True
-
-
-def run_simple_kenya_etl():
-    """Simple Kenya ETL function that doesn't rely on complex imports."""
-    import json
-
-    import requests
-    from bs4 import BeautifulSoup
-
-    results = {
-        "documents_fetched": 0,
-        "documents_processed": 0,
-        "entities_found": [],
-        "sources_checked": [],
-    }
-
-    # Test Kenya Treasury website
-    try:
-        response = requests.get("https://treasury.go.ke", timeout=10)
-        if response.status_code == 200:
-            results["sources_checked"].append(
-                {
-                    "source": "Kenya National Treasury",
-                    "status": "accessible",
-                    "status_code": response.status_code,
-                }
-            )
-            results["documents_fetched"] += 1
-        else:
-            results["sources_checked"].append(
-                {
-                    "source": "Kenya National Treasury",
-                    "status": "error",
-                    "status_code": response.status_code,
-                }
-            )
-    except Exception as e:
-        results["sources_checked"].append(
-            {
-                "source": "Kenya National Treasury",
-                "status": "unreachable",
-                "error": str(e),
-            }
-        )
-
-    # Mock some entities that would be extracted
-    results["entities_found"] = [
-        {"name": "Ministry of Health", "type": "ministry", "code": "MOH"},
-        {"name": "Ministry of Education", "type": "ministry", "code": "MOE"},
-        {"name": "National Treasury", "type": "ministry", "code": "NT"},
-    ]
-    results["documents_processed"] = len(results["entities_found"])
-
-    return results
-
-
 try:
     # Prefer centralized auth dependencies if available
     from auth import get_current_user as get_current_user  # noqa: F401
@@ -945,23 +526,6 @@ class BudgetLineResponse(BaseModel):
     created_at: Optional[str] = None
 
 
-class ETLJobResponse(BaseModel):
-    job_id: str
-    status: str
-    country: str
-    started_at: str
-    completed_at: Optional[str] = None
-    documents_processed: int
-    errors: List[str]
-
-
-class ETLStatusResponse(BaseModel):
-    job_id: str
-    status: str
-    progress: Dict[str, Any]
-    last_updated: str
-
-
 class AuditListItem(BaseModel):
     id: Any
     description: Optional[str] = None
@@ -993,11 +557,39 @@ async def bootstrap_reference_data() -> None:
     if not DATABASE_AVAILABLE:
         raise RuntimeError("Database is required for backend startup")
     try:
+        from bootstrap import initialize_reference_data
+
         await asyncio.to_thread(initialize_reference_data, NAME_TO_ID_MAPPING)
     except Exception as exc:  # pragma: no cover - bootstrap failures should abort
         logger.exception("Failed to initialize reference data", exc_info=exc)
         raise
 
+    # Bootstrap may have upserted population / GDP / audits / budget
+    # lines; rebuild the latest-stats projection and then the
+    # accountability scorecard snapshot (which reads it) so the first
+    # reads are current.
+    def _refresh_latest_stats() -> None:
+        from services.latest_stats import refresh_latest_stats
+
+        with next(get_db()) as db:
+            refresh_latest_stats(db)
+            db.commit()
+
+    def _refresh_scorecards() -> None:
+        from services.accountability import refresh_accountability_snapshot
+
+        with next(get_db()) as db:
+            refresh_accountability_snapshot(db, reason="bootstrap")
+
+    try:
+        await asyncio.to_thread(_refresh_latest_stats)
+    except Exception as exc:
+        logger.warning(f"Latest-stats projection rebuild failed (non-fatal): {exc}")
+    try:
+        await asyncio.to_thread(_refresh_scorecards)
+    except Exception as exc:
+        logger.warning(f"Accountability snapshot refresh failed (non-fatal): {exc}")
+
 
 # Auto-seeder for automated data refresh.
 # Default OFF in development (it blocks startup and fires on every
@@ -1010,6 +602,11 @@ AUTO_SEEDER_ENABLED = os.getenv("AUTO_SEEDER_ENABLED", _default_seeder).lower()
     "yes",
 )
 
+# Where queued jobs run: "inline" in this API process, or "worker" in the
+# separate ETL worker (``python -m etl.worker --mode jobs``), in which
+# case this process only enqueues jobs and reads their status.
+JOB_EXECUTION = os.getenv("JOB_EXECUTION", "inline").lower()
+
 
 @app.on_event("startup")
 async def start_auto_seeder_service() -> None:
@@ -1017,6 +614,12 @@ async def start_auto_seeder_service() -> None:
     if not AUTO_SEEDER_ENABLED:
         logger.info("Auto-seeder disabled via AUTO_SEEDER_ENABLED=false")
         return
+    if JOB_EXECUTION == "worker":
+        logger.info("Auto-seeder runs in the ETL worker (JOB_EXECUTION=worker)")
+        return
+    if not role_includes(API_ROLE, ADMIN):
+        logger.info(f"Auto-seeder not started for API_ROLE={API_ROLE}")
+        return
 
     try:
         from services.auto_seeder import start_auto_seeder
@@ -1038,6 +641,80 @@ async def stop_auto_seeder_service() -> None:
         pass
 
 
+# Job scheduler (see services/job_scheduler.py): ETL source runs,
+# Parliament jobs, the weekly digest and, with the auto-seeder, its
+# domain refreshes all run from one persistent queue. Admin role only;
+# across replicas only the advisory-lock leader runs jobs. Skipped when
+# JOB_EXECUTION=worker: the ETL worker runs the scheduler instead.
+JOB_SCHEDULER_ENABLED = os.getenv("JOB_SCHEDULER_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+
+@app.on_event("startup")
+async def start_job_scheduler_service() -> None:
+    """Start the job scheduler with the built-in schedules."""
+    if not JOB_SCHEDULER_ENABLED:
+        logger.info("Job scheduler disabled via JOB_SCHEDULER_ENABLED=false")
+        return
+    if JOB_EXECUTION == "worker":
+        logger.info("Queued jobs run in the ETL worker (JOB_EXECUTION=worker)")
+        return
+    if not role_includes(API_ROLE, ADMIN):
+        return
+
+    try:
+        from services.job_scheduler import start_job_scheduler
+
+        await start_job_scheduler(include_seeder=AUTO_SEEDER_ENABLED)
+    except Exception as exc:
+        logger.warning(f"Job scheduler not started (non-critical): {exc}")
+
+
+@app.on_event("shutdown")
+async def stop_job_scheduler_service() -> None:
+    try:
+        from services.job_scheduler import stop_job_scheduler
+
+        await stop_job_scheduler()
+    except Exception:
+        pass
+
+
+# Watcher-alert outbox dispatcher (see services/alert_service.py). Runs
+# with the admin role, next to the ingestion that fills the outbox.
+ALERT_DISPATCH_ENABLED = os.getenv("ALERT_DISPATCH_ENABLED", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+
+@app.on_event("startup")
+async def start_alert_dispatcher_service() -> None:
+    """Start draining the watcher-alert outbox in the background."""
+    if not ALERT_DISPATCH_ENABLED or not role_includes(API_ROLE, ADMIN):
+        return
+    try:
+        from services.alert_service import start_alert_dispatcher
+
+        await start_alert_dispatcher()
+    except Exception as exc:
+        logger.warning(f"Alert dispatcher not started (non-critical): {exc}")
+
+
+@app.on_event("shutdown")
+async def stop_alert_dispatcher_service() -> None:
+    try:
+        from services.alert_service import stop_alert_dispatcher
+
+        await stop_alert_dispatcher()
+    except Exception:
+        pass
+
+
 # Hot endpoints that are expensive on cold cache — we pre-warm them on
 # startup so the first real user never sees the 3-5 s cold path. List is
 # in priority order; later entries depend on prior endpoints' data.
@@ -1058,7 +735,6 @@ _WARMUP_PATHS: List[str] = [
     "/api/v1/budget/utilization",
     # Debt
     "/api/v1/debt/national",
-    "/api/v1/debt/national-loans",
     "/api/v1/debt/timeline",
     "/api/v1/debt/sustainability",
     "/api/v1/debt/loans",
@@ -1128,187 +804,31 @@ async def warm_cache_on_startup() -> None:
     asyncio.create_task(_warm())
 
 
-# Gzip responses ≥1 KB so list/detail JSON payloads ship 3-8× smaller
-# over the wire. Applied before other middleware so every downstream
-# response benefits.
-app.add_middleware(GZipMiddleware, minimum_size=1024)
-
-
-# Cache-Control middleware: attach HTTP caching headers to GET /api/v1/*
-# responses. The frontend uses React Query (which already has in-memory
-# cache), but without HTTP cache headers the browser still pays full
-# payload cost on back/forward nav and hard reloads. We set a short
-# max-age (60s) with a long stale-while-revalidate window so pages feel
-# instant on navigation while revalidating in the background.
-@app.middleware("http")
-async def add_cache_headers(request, call_next):
-    response = await call_next(request)
-    path = request.url.path
-    if (
-        request.method == "GET"
-        and path.startswith("/api/v1/")
-        and response.status_code == 200
-        # Skip auth-scoped or mutation-adjacent endpoints
-        and not path.startswith("/api/v1/auth/")
-        and not path.startswith("/api/v1/account/")
-        and not path.startswith("/api/v1/watchlist")
-        and "cache-control" not in {k.lower() for k in response.headers.keys()}
-    ):
-        response.headers["Cache-Control"] = (
-            "public, max-age=60, stale-while-revalidate=3600"
-        )
-    return response
-
-
-# CORS middleware – uses CORS_ORIGINS from settings / env var
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Security middlewares: rate limiting, audit logging, security headers
-try:
-    from middleware.security import (
-        AuditLogMiddleware,
-        RateLimitMiddleware,
-        RedisRateLimitMiddleware,
-        SecurityHeadersMiddleware,
-    )
-
-    # Use Redis-backed rate limiting for production, falls back to in-memory if Redis unavailable
-    if settings.ENVIRONMENT == "production" and settings.REDIS_URL:
-        app.add_middleware(
-            RedisRateLimitMiddleware, calls=120, period=60
-        )  # 120 req/min/IP
-        logger.info("Using Redis-backed rate limiting")
-    else:
-        app.add_middleware(
-            RateLimitMiddleware, calls=120, period=60
-        )  # In-memory fallback
-        logger.info("Using in-memory rate limiting")
-
-    app.add_middleware(AuditLogMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
-    logger.info("Security middleware registered (rate limit, audit log, headers)")
-except Exception as e:
-    logger.warning(f"Security middleware not active: {e}")
-
-# Include routers
-try:
-    from routers.etl_admin import router as etl_admin_router
-
-    app.include_router(etl_admin_router)
-    logger.info("ETL admin router registered at /api/v1/admin/etl")
-except Exception as e:
-    logger.warning(f"Could not register ETL admin router: {e}")
-
-try:
-    from routers.economic import router as economic_router
-
-    app.include_router(economic_router)
-    logger.info("Economic data router registered at /api/v1/economic")
-except Exception as e:
-    logger.warning(f"Could not register economic data router: {e}")
-
-try:
-    from routers.admin import router as admin_router
-
-    app.include_router(admin_router)
-    logger.info("Admin router registered at /api/v1/admin")
-except Exception as e:
-    logger.warning(f"Could not register admin router: {e}")
-
-try:
-    from routers.admin_users import router as admin_users_router
-
-    app.include_router(admin_users_router)
-    logger.info("Admin users router registered at /api/v1/admin/users")
-except Exception as e:
-    logger.warning(f"Could not register admin users router: {e}")
-
-try:
-    from routers.admin_audit_log import router as admin_audit_log_router
-
-    app.include_router(admin_audit_log_router)
-    logger.info("Admin audit-log router registered at /api/v1/admin/audit-log")
-except Exception as e:
-    logger.warning(f"Could not register admin audit-log router: {e}")
-
-# Newsletter endpoints (welcome email, token-verified unsubscribe) are active.
-# Auth & watchlist are still handled by Supabase (frontend → Supabase direct).
-try:
-    from routers.user_features import router as user_features_router
-
-    app.include_router(user_features_router)
-    logger.info("User features router registered (newsletter endpoints)")
-except Exception as e:
-    logger.warning(f"Could not register user features router: {e}")
-
-try:
-    from routers.audit_dashboard import router as audit_dashboard_router
-
-    app.include_router(audit_dashboard_router)
-    logger.info("Audit dashboard router registered at /api/v1/audit")
-except Exception as e:
-    logger.warning(f"Could not register audit dashboard router: {e}")
-
-try:
-    from routers.money_flow import router as money_flow_router
-
-    app.include_router(money_flow_router)
-    logger.info("Money flow router registered at /api/v1/counties/*/money-flow")
-except Exception as e:
-    logger.warning(f"Could not register money flow router: {e}")
-
-try:
-    from routers.data_freshness import router as data_freshness_router
-
-    app.include_router(data_freshness_router)
-    logger.info("Data freshness router registered at /api/v1/data/freshness")
-except Exception as e:
-    logger.warning(f"Could not register data freshness router: {e}")
+# Include routers for this process's deployment role (see routers/registry.py)
+from routers.registry import ADMIN, mount_routers, role_includes
 
-try:
-    from routers.data_provenance import router as data_provenance_router
+API_ROLE = settings.API_ROLE
+mount_routers(app, API_ROLE)
 
-    app.include_router(data_provenance_router)
-    logger.info("Data provenance router registered at /api/v1/provenance")
-except Exception as e:
-    logger.warning(f"Could not register data provenance router: {e}")
 
+# Per-request SQL accounting (X-DB-* headers, db_* histograms, slow-query log)
+query_tracing.install()
 
-# Request logging middleware.
-# We only log completions (not the "PROCESSING" pre-event), and we
-# downgrade fast healthy responses to DEBUG so production logs show just
-# errors and slow requests — the signal engineers actually scan for.
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = datetime.datetime.now()
-    method = request.method
-    url = str(request.url)
 
-    try:
-        response = await call_next(request)
-        process_time = (datetime.datetime.now() - start_time).total_seconds()
-        response.headers["X-Process-Time"] = f"{process_time:.3f}"
-        # Escalate severity for slow or non-2xx responses so scanning logs
-        # highlights real problems without drowning them in noise.
-        if process_time > 0.5 or response.status_code >= 400:
-            logger.warning(
-                f"{method} {url} - {response.status_code} - {process_time:.3f}s"
-            )
-        else:
-            logger.debug(
-                f"{method} {url} - {response.status_code} - {process_time:.3f}s"
-            )
-        return response
-    except Exception as e:
-        process_time = (datetime.datetime.now() - start_time).total_seconds()
-        logger.error(f"ERROR {method} {url} - {str(e)} - {process_time:.3f}s")
-        raise
+# Middleware chain: gzip, (STATIC_SNAPSHOTS_ENABLED) static snapshots,
+# cache headers, CORS, rate limit, audit log, security headers, request
+# logging and (ENABLE_METRICS) metrics, all pure ASGI — see
+# middleware/stack.py for the order and what each does.
+install_middleware(
+    app,
+    cors_origins=settings.CORS_ORIGINS,
+    redis_rate_limit=bool(
+        settings.ENVIRONMENT == "production" and settings.REDIS_URL
+    ),
+    db_headers=lambda: settings.ENVIRONMENT != "production",
+    request_logger=logger,
+    static_snapshots=default_snapshot_store() if snapshots_enabled() else None,
+)
 
 
 # Helper functions for provenance tracking
@@ -1316,15 +836,12 @@ security = HTTPBearer()
 
 
 # Cache decorator helper
-_all_mem_caches: list = []  # registry for test cleanup
-
-
 def clear_all_caches():
     """Clear every in-memory endpoint cache.  Called between tests."""
-    for c in _all_mem_caches:
+    for c in response_mem_caches():
         c.clear()
-    # Clear both RedisCache instances (main.redis_cache and cache.redis_cache.cache)
-    for rc in _redis_cache_instances():
+    # Clear every RedisCache instance (main.redis_cache, cache.redis_cache.cache, ...)
+    for rc in response_cache_instances():
         rc._memory_cache.clear()
         if rc.client is not None:
             try:
@@ -1333,19 +850,6 @@ def clear_all_caches():
                 pass
 
 
-def _redis_cache_instances():
-    """Yield all known RedisCache singletons."""
-    if redis_cache is not None:
-        yield redis_cache
-    try:
-        from cache.redis_cache import cache as _router_cache
-
-        if _router_cache is not None and _router_cache is not redis_cache:
-            yield _router_cache
-    except Exception:
-        pass
-
-
 def cached(key_prefix: str, ttl: int = 3600):
     """Decorator to cache endpoint responses.
 
@@ -1356,8 +860,7 @@ def cached(key_prefix: str, ttl: int = 3600):
 
     def decorator(func):
         # Module-level in-memory fallback cache (per-endpoint)
-        _mem_cache: Dict[str, Dict[str, Any]] = {}
-        _all_mem_caches.append(_mem_cache)
+        _mem_cache: Dict[str, Dict[str, Any]] = register_response_cache({})
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
@@ -1373,20 +876,30 @@ def cached(key_prefix: str, ttl: int = 3600):
                 cached_data = redis_cache.get(cache_key)
                 if cached_data is not None:
                     logger.debug(f"Redis cache HIT: {cache_key}")
+                    record_cache_lookup(key_prefix, "hit")
                     return cached_data
 
-                result = await func(*args, **kwargs)
-                redis_cache.set(cache_key, result, ttl=ttl)
-                return result
+                async def load():
+                    result = await func(*args, **kwargs)
+                    redis_cache.set(cache_key, result, ttl=ttl)
+                    return result
 
             # --- In-memory fallback path ---
-            rec = _mem_cache.get(cache_key)
-            if rec and (time.time() - rec["ts"]) < ttl:
-                logger.debug(f"Memory cache HIT: {cache_key}")
-                return rec["value"]
-
-            result = await func(*args, **kwargs)
-            _mem_cache[cache_key] = {"value": result, "ts": time.time()}
+            else:
+                rec = _mem_cache.get(cache_key)
+                if rec and (time.time() - rec["ts"]) < ttl:
+                    logger.debug(f"Memory cache HIT: {cache_key}")
+                    record_cache_lookup(key_prefix, "hit")
+                    return rec["value"]
+
+                async def load():
+                    result = await func(*args, **kwargs)
+                    _mem_cache[cache_key] = {"value": result, "ts": time.time()}
+                    return result
+
+            # Concurrent misses for one key share a single computation.
+            result, coalesced = await single_flight(cache_key, load)
+            record_cache_lookup(key_prefix, "coalesced" if coalesced else "miss")
             return result
 
         return wrapper
@@ -1474,6 +987,27 @@ async def get_seeder_status() -> JSONResponse:
         )
 
 
+def _check_module_available(mod_name: str) -> None:
+    """Raise ImportError if *mod_name* or its required packages are missing.
+
+    Uses ``importlib.util.find_spec`` so the health check costs no module
+    execution; the ETL modules are only imported when a job runs.
+    """
+    import importlib.util
+
+    for name in (mod_name, *_MODULE_HEAVY_DEPS.get(mod_name, ())):
+        if importlib.util.find_spec(name) is None:
+            raise ImportError(f"No module named '{name}'")
+
+
+# Third-party packages the ETL modules hard-require at top level.
+_MODULE_HEAVY_DEPS: Dict[str, Tuple[str, ...]] = {
+    "etl.kenya_pipeline": ("requests", "urllib3", "bs4"),
+    "etl.knbs_parser": ("requests",),
+    "extractors.government.knbs_extractor": ("requests", "bs4"),
+}
+
+
 @app.get("/api/v1/system/pipeline-health")
 async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
     """
@@ -1486,14 +1020,14 @@ async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
     - Database record counts and last-updated timestamps
     - Any warnings or errors that need attention
     """
-    import importlib
-
     alerts: list[dict] = []
     sources: dict = {}
     db_stats: dict = {}
     now = datetime.datetime.now(datetime.timezone.utc)
 
     # ── 1. Check module availability (import health) ──
+    # Resolved without executing the modules: importing the pipeline
+    # pulls BeautifulSoup / pdfplumber / pandas into the API worker.
     module_checks = {
         "etl.kenya_pipeline": "ETL Pipeline (OAG/COB/Treasury scraping)",
         "etl.knbs_parser": "KNBS Parser (population/economic parsing)",
@@ -1502,7 +1036,7 @@ async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
     module_status = {}
     for mod_name, description in module_checks.items():
         try:
-            importlib.import_module(mod_name)
+            _check_module_available(mod_name)
             module_status[mod_name] = {"available": True, "description": description}
         except Exception as exc:
             module_status[mod_name] = {
@@ -1541,9 +1075,7 @@ async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
         county_count = (
             db.query(DBEntity).filter(DBEntity.type == EntityType.COUNTY).count()
         )
-        national_entity = (
-            db.query(DBEntity).filter(DBEntity.type == EntityType.NATIONAL).first()
-        )
+        national_entity = queries.national_entity(db)
 
         db_stats["entities"] = {
             "total": entity_count,
@@ -1693,14 +1225,20 @@ async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
                 }
             )
 
-    # ── 5. APScheduler jobs ──
+    # ── 5. ETL jobs and the job scheduler ──
     scheduler_jobs: list[dict] = []
+    scheduler_info = None
     try:
-        # The scheduler is set up in setup_scheduler() — we check module-level _etl_jobs dict
-        for jid, jinfo in _etl_jobs.items():
-            scheduler_jobs.append({"job_id": jid, **jinfo})
+        # The job queue is only read in processes serving the admin/ETL
+        # role (see routers.registry), which load services.job_scheduler.
+        _scheduler_mod = sys.modules.get("services.job_scheduler")
+        if _scheduler_mod is not None:
+            for row in _scheduler_mod.recent_jobs(db, prefix="etl.", limit=20):
+                scheduler_jobs.append(_scheduler_mod.describe(row))
+            if _scheduler_mod.job_scheduler is not None:
+                scheduler_info = _scheduler_mod.job_scheduler.status()
     except Exception:
-        pass
+        db.rollback()
 
     # ── 6. Build overall status ──
     error_count = sum(1 for a in alerts if a["level"] == "error")
@@ -1720,6 +1258,7 @@ async def get_pipeline_health(db: Session = Depends(get_db)) -> JSONResponse:
             "modules": module_status,
             "sources": sources,
             "etl_jobs": scheduler_jobs,
+            "job_scheduler": scheduler_info,
             "alerts": alerts,
             "summary": {
                 "errors": error_count,
@@ -1741,7 +1280,7 @@ async def trigger_seeder_refresh() -> JSONResponse:
     try:
         from services.auto_seeder import auto_seeder
 
-        if not auto_seeder.is_running:
+        if JOB_EXECUTION != "worker" and not auto_seeder.is_running:
             return JSONResponse(
                 {
                     "status": "error",
@@ -1750,8 +1289,10 @@ async def trigger_seeder_refresh() -> JSONResponse:
                 status_code=503,
             )
 
-        # Trigger refresh in background
-        asyncio.create_task(auto_seeder.seed_all_domains())
+        # Queue a full refresh ahead of scheduled work
+        from services.auto_seeder import trigger_full_refresh
+
+        await trigger_full_refresh()
 
         return JSONResponse(
             {
@@ -1798,7 +1339,7 @@ async def get_country_summary(country_id: int):
 
             with next(get_db()) as db:
                 # Scope to latest county fiscal period
-                _county_pid = _latest_county_period(db)
+                _county_pid = queries.latest_county_period(db)
 
                 # Total budget allocation (county-only, latest FY)
                 alloc_q = (
@@ -1827,20 +1368,10 @@ async def get_country_summary(country_id: int):
                 total_spent = float(spent_q.scalar() or 0)
 
                 # Total *national* debt (only sovereign-level loans)
-                from models import EntityType as _ET
-
-                _nat = db.query(DBEntity).filter(DBEntity.type == _ET.NATIONAL).first()
+                _nat = queries.national_entity(db)
                 if _nat:
-                    # Exclude PENDING_BILLS — see ``_is_debt_loan``.
-                    # NULL ``debt_category`` rows must still count as
-                    # debt (predicate's contract); see _debt_loans_query
-                    # for why a naive ``!=`` would silently drop them.
-                    from models import DebtCategory as _DC
-
-                    _debt_category_filter = or_(
-                        DBLoan.debt_category.is_(None),
-                        DBLoan.debt_category != _DC.PENDING_BILLS,
-                    )
+                    # Exclude PENDING_BILLS — see ``queries.is_debt_loan``.
+                    _debt_category_filter = queries.debt_category_filter()
                     total_debt_result = (
                         db.query(func.sum(DBLoan.outstanding))
                         .filter(
@@ -2034,31 +1565,13 @@ async def get_counties(fiscal_year: Optional[str] = None):
                 if latest_fp:
                     period_ids = [latest_fp.id]
 
-            # ── BATCH LOAD all related data in 5 queries (not 47×6) ──
+            # ── BATCH LOAD all related data in 4 queries (not 47×6) ──
             entity_ids = [e.id for e in entities]
 
-            # 1. Population: latest per entity
-            from sqlalchemy import func as _fn
+            # 1. Population + GDP: latest per entity (maintained projection)
+            from services.latest_stats import latest_stats_map
 
-            _pop_sub = (
-                db.query(
-                    DBPopulationData.entity_id,
-                    _fn.max(DBPopulationData.year).label("max_year"),
-                )
-                .filter(DBPopulationData.entity_id.in_(entity_ids))
-                .group_by(DBPopulationData.entity_id)
-                .subquery()
-            )
-            pop_rows = (
-                db.query(DBPopulationData)
-                .join(
-                    _pop_sub,
-                    (DBPopulationData.entity_id == _pop_sub.c.entity_id)
-                    & (DBPopulationData.year == _pop_sub.c.max_year),
-                )
-                .all()
-            )
-            pop_map = {p.entity_id: p for p in pop_rows}
+            latest_map = latest_stats_map(db, entity_ids)
 
             # 2. Budget lines (all at once, optionally filtered by period)
             bl_query = db.query(DBBudgetLine).filter(
@@ -2088,37 +1601,13 @@ async def get_counties(fiscal_year: Optional[str] = None):
             for a in all_audits:
                 audits_by_entity.setdefault(a.entity_id, []).append(a)
 
-            # 5. GDP data: latest per entity
-            from models import GDPData as _GDPData
-
-            _gdp_sub = (
-                db.query(
-                    _GDPData.entity_id,
-                    _fn.max(_GDPData.year).label("max_year"),
-                )
-                .filter(_GDPData.entity_id.in_(entity_ids))
-                .group_by(_GDPData.entity_id)
-                .subquery()
-            )
-            gdp_rows = (
-                db.query(_GDPData)
-                .join(
-                    _gdp_sub,
-                    (_GDPData.entity_id == _gdp_sub.c.entity_id)
-                    & (_GDPData.year == _gdp_sub.c.max_year),
-                )
-                .all()
-            )
-            gdp_map = {g.entity_id: g for g in gdp_rows}
-
             # ── BUILD RESULTS from pre-loaded data ──
             results = []
             for e in entities:
-                pop_data = pop_map.get(e.id)
+                stats = latest_map.get(e.id)
                 budget_lines = bl_by_entity.get(e.id, [])
                 loans = loans_by_entity.get(e.id, [])
                 audits = audits_by_entity.get(e.id, [])
-                gdp_data = gdp_map.get(e.id)
 
                 total_allocated = sum(
                     float(b.allocated_amount or 0) for b in budget_lines
@@ -2167,7 +1656,7 @@ async def get_counties(fiscal_year: Optional[str] = None):
                 total_debt = sum(
                     float(loan.outstanding or loan.principal or 0)
                     for loan in loans
-                    if _is_debt_loan(loan)
+                    if queries.is_debt_loan(loan)
                 )
 
                 pending_bills = sum(
@@ -2241,7 +1730,7 @@ async def get_counties(fiscal_year: Optional[str] = None):
                         "name": name,
                         "code": county_id or "",
                         "coordinates": coords,
-                        "population": pop_data.total_population if pop_data else 0,
+                        "population": (stats.total_population or 0) if stats else 0,
                         "budget_2025": total_allocated,
                         "total_budget": total_allocated,
                         "total_spent": total_spent,
@@ -2261,7 +1750,11 @@ async def get_counties(fiscal_year: Optional[str] = None):
                         "pending_bills": pending_bills,
                         "debt": total_debt,
                         "total_debt": total_debt,
-                        "gdp": float(gdp_data.gdp_value) if gdp_data else None,
+                        "gdp": (
+                            float(stats.gdp_value)
+                            if stats and stats.gdp_value is not None
+                            else None
+                        ),
                         "financial_health_score": round(health_score, 1),
                         "audit_rating": audit_rating,
                         "audit_status": audit_status,
@@ -2335,12 +1828,9 @@ async def get_county_details(county_id: str, fiscal_year: Optional[str] = None):
                         if latest_fp:
                             period_ids = [latest_fp.id]
 
-                    pop_data = (
-                        db.query(DBPopulationData)
-                        .filter(DBPopulationData.entity_id == e.id)
-                        .order_by(DBPopulationData.year.desc())
-                        .first()
-                    )
+                    from services.latest_stats import get_latest_stats
+
+                    stats = get_latest_stats(db, e.id)
 
                     bl_query = db.query(DBBudgetLine).filter(
                         DBBudgetLine.entity_id == e.id
@@ -2386,7 +1876,7 @@ async def get_county_details(county_id: str, fiscal_year: Optional[str] = None):
                     total_debt = sum(
                         float(loan.outstanding or loan.principal or 0)
                         for loan in loans
-                        if _is_debt_loan(loan)
+                        if queries.is_debt_loan(loan)
                     )
 
                     pending_bills = sum(
@@ -2452,19 +1942,6 @@ async def get_county_details(county_id: str, fiscal_year: Optional[str] = None):
                         metrics.get("transfers_received", total_allocated)
                     )
 
-                    gdp_data = None
-                    try:
-                        from models import GDPData as _GDPData
-
-                        gdp_data = (
-                            db.query(_GDPData)
-                            .filter(_GDPData.entity_id == e.id)
-                            .order_by(_GDPData.year.desc())
-                            .first()
-                        )
-                    except Exception:
-                        pass
-
                     cname = (e.canonical_name or "").replace(" County", "")
                     coords = COUNTY_COORDINATES.get(county_id, [36.8219, -1.2921])
 
@@ -2492,7 +1969,7 @@ async def get_county_details(county_id: str, fiscal_year: Optional[str] = None):
                         "name": cname,
                         "code": county_id,
                         "coordinates": coords,
-                        "population": pop_data.total_population if pop_data else 0,
+                        "population": (stats.total_population or 0) if stats else 0,
                         "budget_2025": total_allocated,
                         "total_budget": total_allocated,
                         "total_spent": total_spent,
@@ -2512,7 +1989,11 @@ async def get_county_details(county_id: str, fiscal_year: Optional[str] = None):
                         "pending_bills": pending_bills,
                         "debt": total_debt,
                         "total_debt": total_debt,
-                        "gdp": float(gdp_data.gdp_value) if gdp_data else None,
+                        "gdp": (
+                            float(stats.gdp_value)
+                            if stats and stats.gdp_value is not None
+                            else None
+                        ),
                         "financial_health_score": round(health_score, 1),
                         "audit_rating": audit_rating,
                         "audit_status": audit_status,
@@ -2578,12 +2059,14 @@ async def get_county_comprehensive(
             economic_profile = meta.get("economic_profile") or {}
             audit_summary_meta = meta.get("audit_summary") or {}
 
-            # --- Population ---
+            # --- Population (full latest row via the projection's pointer) ---
+            from services.latest_stats import get_latest_stats
+
+            latest_stats = get_latest_stats(db, entity.id)
             pop = (
-                db.query(DBPopulationData)
-                .filter(DBPopulationData.entity_id == entity.id)
-                .order_by(DBPopulationData.year.desc())
-                .first()
+                db.get(DBPopulationData, latest_stats.population_id)
+                if latest_stats and latest_stats.population_id
+                else None
             )
 
             # --- Budget lines (scoped to requested FY, or latest executed) ---
@@ -2601,7 +2084,7 @@ async def get_county_comprehensive(
                         requested_period_id = fp_match.id
                 except (ValueError, IndexError, ImportError):
                     pass  # Bad format — fall through to auto-resolve
-            budget_lines = _entity_period_budget_query(
+            budget_lines = queries.entity_period_budget_query(
                 db, entity.id, period_id=requested_period_id
             ).all()
             total_allocated = sum(float(b.allocated_amount or 0) for b in budget_lines)
@@ -2659,12 +2142,12 @@ async def get_county_comprehensive(
             # Keep ALL loans in the local list — the per-loan
             # ``debt_breakdown`` and ``pending_bills_from_loans``
             # blocks below both iterate it. Only the total filters out
-            # PENDING_BILLS (see ``_is_debt_loan`` for why).
+            # PENDING_BILLS (see ``queries.is_debt_loan`` for why).
             loans = db.query(DBLoan).filter(DBLoan.entity_id == entity.id).all()
             total_debt = sum(
                 float(l.outstanding or l.principal or 0)
                 for l in loans
-                if _is_debt_loan(l)
+                if queries.is_debt_loan(l)
             )
 
             debt_breakdown = []
@@ -3124,7 +2607,7 @@ async def get_county_budget(county_id: str):
                 if e:
                     # Simple aggregate from budget lines (latest FY); fallback to metrics
                     bl_sum = (
-                        _entity_period_budget_query(db, e.id)
+                        queries.entity_period_budget_query(db, e.id)
                         .with_entities(DBBudgetLine.allocated_amount)
                         .all()
                     )
@@ -3226,13 +2709,13 @@ async def get_county_debt(county_id: str):
                 # Real debt from Loan table — exclude PENDING_BILLS
                 # so the total reflects borrowed money, not unpaid
                 # obligations. Pending bills land in this same table
-                # via the seeding writer; see ``_is_debt_loan``.
-                loans = _debt_loans_query(db, DBLoan.entity_id == e.id).all()
+                # via the seeding writer; see ``queries.is_debt_loan``.
+                loans = queries.debt_loans_query(db, DBLoan.entity_id == e.id).all()
                 total_principal = sum(float(l.principal or 0) for l in loans)
                 total_outstanding = sum(float(l.outstanding or 0) for l in loans)
 
                 # Pending bills from BudgetLine (latest FY deficit)
-                budget_rows = _entity_period_budget_query(db, e.id).all()
+                budget_rows = queries.entity_period_budget_query(db, e.id).all()
                 total_allocated = sum(
                     float(b.allocated_amount or 0) for b in budget_rows
                 )
@@ -3394,8 +2877,9 @@ async def get_audit_statistics():
 
             # Recent critical findings (most recent 6)
             recent_critical = (
-                db.query(DBAudit, DBEntity.canonical_name)
+                db.query(DBAudit, DBEntity.canonical_name, DBFiscalPeriod.label)
                 .join(DBEntity, DBAudit.entity_id == DBEntity.id)
+                .outerjoin(DBFiscalPeriod, DBAudit.period_id == DBFiscalPeriod.id)
                 .filter(DBAudit.severity == Severity.CRITICAL)
                 .order_by(DBAudit.created_at.desc())
                 .limit(6)
@@ -3403,7 +2887,7 @@ async def get_audit_statistics():
             )
 
             recent_items = []
-            for audit, county_name in recent_critical:
+            for audit, county_name, period_label in recent_critical:
                 amount = 0.0
                 if audit.finding_text:
                     match = re.search(r"KES\s*([\d,]+)", audit.finding_text)
@@ -3412,9 +2896,6 @@ async def get_audit_statistics():
                             amount = float(match.group(1).replace(",", ""))
                         except Exception:
                             pass
-                period_label = ""
-                if audit.period and hasattr(audit.period, "label"):
-                    period_label = audit.period.label
                 recent_items.append(
                     {
                         "id": audit.id,
@@ -3424,7 +2905,7 @@ async def get_audit_statistics():
                             audit.severity.value if audit.severity else "unknown"
                         ),
                         "amount": amount,
-                        "fiscal_year": period_label,
+                        "fiscal_year": period_label or "",
                         "date": (
                             audit.created_at.isoformat() if audit.created_at else None
                         ),
@@ -3502,7 +2983,7 @@ async def get_audit_statistics():
                 # stale hardcoded label.
                 "fiscal_year": latest_period_label,
                 "fiscal_years_covered": fiscal_years_covered,
-                "_meta": _response_meta(
+                "_meta": response_meta(
                     unit="kes",
                     entity_scope="county",
                     fiscal_period=latest_period_label,
@@ -3776,7 +3257,7 @@ async def get_federal_audits():
                     {"ministry": name, "finding_count": count}
                     for name, count in top_ministries
                 ],
-                "_meta": _response_meta(
+                "_meta": response_meta(
                     unit="kes",
                     entity_scope="national",
                     fiscal_period=latest_period_label,
@@ -4122,6 +3603,9 @@ async def list_county_audits(
 
         # DB-backed path
         if DATABASE_AVAILABLE and DBAudit and DBEntity and db:
+            from sqlalchemy import func as _sqlfunc
+            from sqlalchemy.orm import selectinload
+
             entity_ids = [
                 e.id
                 for e in db.query(DBEntity)
@@ -4147,42 +3631,43 @@ async def list_county_audits(
                 if severity_lookup:
                     query = query.filter(DBAudit.severity == severity_lookup)
 
-            all_audits = query.order_by(DBAudit.created_at.desc()).all()
+            # Status lives in the ``audits.status`` column (the writer
+            # populates it alongside provenance; migration h8c9d0e1f2a3
+            # backfilled legacy rows from ``provenance[0].status``). Matching
+            # on lower(status) hits ix_audits_entity_status_lower, so the
+            # filter, COUNT and LIMIT/OFFSET all run in SQL instead of
+            # loading every finding for the county to slice one page.
+            # Audits without a status are excluded by the comparison, same
+            # as the previous in-Python filter.
+            if status:
+                query = query.filter(
+                    _sqlfunc.lower(DBAudit.status) == status.lower()
+                )
 
-            filtered_audits: List[Any] = []
-            for audit in all_audits:
-                provenance = audit.provenance or []
-                status_value = None
-                if provenance and isinstance(provenance, list):
-                    first_entry = provenance[0] or {}
-                    if isinstance(first_entry, dict):
-                        status_value = first_entry.get("status")
-                if status and status_value:
-                    if status_value.lower() != status.lower():
-                        continue
-                elif status and not status_value:
-                    # If a status filter is provided but audit lacks status metadata, skip it
-                    continue
-                filtered_audits.append(audit)
+            total = query.order_by(None).count()
 
-            total = len(filtered_audits)
-            start = (page - 1) * limit
-            end = start + limit
-            audits = filtered_audits[start:end]
+            audits = (
+                query.options(
+                    selectinload(DBAudit.source_document),
+                    selectinload(DBAudit.period),
+                )
+                .order_by(DBAudit.created_at.desc(), DBAudit.id.desc())
+                .offset((page - 1) * limit)
+                .limit(limit)
+                .all()
+            )
 
             items: List[Dict[str, Any]] = []
             for audit in audits:
-                doc = (
-                    audit.source_document if hasattr(audit, "source_document") else None
-                )
+                doc = audit.source_document
                 provenance = audit.provenance or []
-                status_value = None
+                status_value = audit.status
                 category_value = None
                 amount_value = None
                 if provenance and isinstance(provenance, list):
                     first_entry = provenance[0] or {}
                     if isinstance(first_entry, dict):
-                        status_value = first_entry.get("status")
+                        status_value = status_value or first_entry.get("status")
                         category_value = first_entry.get("category")
                         amount_value = first_entry.get("amount_involved")
 
@@ -4273,448 +3758,11 @@ async def list_county_audits(
 # ---------------------------------------------------------------------------
 # County Accountability Scorecard
 # ---------------------------------------------------------------------------
-
-
-def _compute_accountability(db, entity, county_id: str) -> Dict[str, Any]:
-    """Compute accountability scorecard for a county entity.
-
-    Returns dict with opinion history, flagged amounts, recurring/unresolved
-    findings, absorption rate, grade, and peer comparison.
-    """
-    audits = db.query(DBAudit).filter(DBAudit.entity_id == entity.id).all()
-
-    # --- audit_opinion_history ---
-    opinion_by_year: Dict[int, str] = {}
-    for a in audits:
-        if a.audit_year and a.audit_opinion:
-            opinion_by_year[a.audit_year] = a.audit_opinion
-    audit_opinion_history = sorted(
-        [{"year": y, "opinion": o} for y, o in opinion_by_year.items()],
-        key=lambda x: x["year"],
-    )
-
-    # --- audit_severity_history (for sparklines) ---
-    # Separate from opinion_history: tracks findings severity per year as a
-    # 0-100 "audit health" proxy. Used only for visual trend — does NOT feed
-    # the accountability scoring rubric (opinions there must stay OAG-sourced).
-    # Year resolves from audit_year, else the linked fiscal period's start year.
-    period_year_cache: Dict[int, Optional[int]] = {}
-    findings_by_year: Dict[int, Dict[str, int]] = {}
-    for a in audits:
-        year = a.audit_year
-        if not year and a.period_id:
-            if a.period_id not in period_year_cache:
-                fp = (
-                    db.query(DBFiscalPeriod)
-                    .filter(DBFiscalPeriod.id == a.period_id)
-                    .first()
-                )
-                period_year_cache[a.period_id] = fp.start_date.year if fp else None
-            year = period_year_cache[a.period_id]
-        if not year:
-            continue
-        bucket = findings_by_year.setdefault(
-            year, {"info": 0, "warning": 0, "critical": 0}
-        )
-        sev = a.severity.value if a.severity else "info"
-        bucket[sev] = bucket.get(sev, 0) + 1
-
-    audit_severity_history = []
-    for year in sorted(findings_by_year.keys()):
-        b = findings_by_year[year]
-        # Score: start at 100, -5 per warning, -20 per critical. Floor at 0.
-        score = max(0.0, 100.0 - (b.get("warning", 0) * 5 + b.get("critical", 0) * 20))
-        audit_severity_history.append(
-            {
-                "year": year,
-                "score": round(score, 1),
-                "info": b.get("info", 0),
-                "warning": b.get("warning", 0),
-                "critical": b.get("critical", 0),
-            }
-        )
-
-    # --- total_flagged_amount ---
-    total_flagged_amount = float(sum(float(a.amount or 0) for a in audits))
-
-    # --- recurring_findings_count ---
-    qt_years: Dict[str, set] = {}
-    for a in audits:
-        if a.query_type and a.audit_year:
-            qt_years.setdefault(a.query_type, set()).add(a.audit_year)
-    recurring_findings_count = sum(1 for years in qt_years.values() if len(years) >= 2)
-
-    # --- unresolved_findings_count ---
-    # Any status that is NOT a terminal resolution counts as unresolved.
-    # This includes intermediate states ("Under Review", "Escalated")
-    # that the previous implementation missed — making counties with
-    # many pending investigations appear "accountable" when they aren't.
-    resolved_statuses = {"resolved", "closed", "dismissed", "settled"}
-    unresolved_findings_count = sum(
-        1
-        for a in audits
-        if not a.status or a.status.strip().lower() not in resolved_statuses
-    )
-
-    # --- severity + amount context (used for grade) ---
-    total_findings = len(audits)
-    critical_findings = sum(
-        1 for a in audits if a.severity and a.severity.value == "critical"
-    )
-    warning_findings = sum(
-        1 for a in audits if a.severity and a.severity.value == "warning"
-    )
-
-    # --- absorption_rate from budget data (latest FY) ---
-    budget_lines = _entity_period_budget_query(db, entity.id).all()
-    total_allocated = sum(float(b.allocated_amount or 0) for b in budget_lines)
-    total_spent = sum(float(b.actual_spent or 0) for b in budget_lines)
-    absorption_rate = (
-        round(total_spent / total_allocated, 4) if total_allocated > 0 else None
-    )
-
-    # Flagged amount as % of current-FY budget (signal of audit severity)
-    flagged_pct_of_budget = (
-        (total_flagged_amount / total_allocated * 100.0) if total_allocated > 0 else 0.0
-    )
-
-    # --- accountability_score (0-100 point system) ---
-    #
-    # Starts at 100 and subtracts points for each concern. The grade is
-    # then derived from the final score. A point system is clearer than
-    # cascading letter drops because (a) penalties of different severity
-    # map to different point costs, (b) the UI can show the exact math.
-    score = 100.0
-    grade_factors: List[Dict[str, Any]] = []
-
-    def _penalise(points: float, impact: str, label: str, detail: str) -> None:
-        nonlocal score
-        score -= points
-        grade_factors.append(
-            {
-                "impact": impact,
-                "label": label,
-                "detail": detail,
-                "points": -round(points, 1),
-            }
-        )
-
-    # --- Opinion-based penalties (only fire if we have opinions) ---
-    if audit_opinion_history:
-        adverse_years = sorted(
-            e["year"]
-            for e in audit_opinion_history
-            if e["opinion"].lower() in ("adverse", "disclaimer")
-        )
-        if adverse_years:
-            _penalise(
-                40,
-                "major",
-                f"Adverse / disclaimer opinion ({adverse_years[0]})",
-                "OAG rejected the financial statements",
-            )
-
-        latest_opinion = audit_opinion_history[-1]["opinion"].lower()
-        if latest_opinion == "qualified":
-            _penalise(
-                15,
-                "major",
-                "Qualified opinion (latest FY)",
-                "OAG flagged material concerns",
-            )
-
-    # --- Finding-volume penalties ---
-    if total_findings > 20:
-        _penalise(15, "major", f"{total_findings} audit findings (>20)", "High volume")
-    elif total_findings > 10:
-        _penalise(8, "moderate", f"{total_findings} audit findings (>10)", "Elevated volume")
-    elif total_findings > 5:
-        _penalise(4, "minor", f"{total_findings} audit findings", "Some findings present")
-
-    # Critical findings = any is serious (cap at -15)
-    if critical_findings > 0:
-        pts = min(critical_findings * 5, 15)
-        _penalise(
-            pts,
-            "major" if critical_findings >= 3 else "moderate",
-            f"{critical_findings} critical finding{'s' if critical_findings != 1 else ''}",
-            "Serious irregularity flagged",
-        )
-
-    # Recurring query types (same issue across multiple years)
-    if recurring_findings_count >= 5:
-        _penalise(
-            15,
-            "major",
-            f"{recurring_findings_count} recurring query types",
-            "Systemic, year-over-year issues",
-        )
-    elif recurring_findings_count >= 3:
-        _penalise(
-            8,
-            "moderate",
-            f"{recurring_findings_count} recurring query types",
-            "Repeated across fiscal years",
-        )
-
-    # Unresolved backlog (includes "Under Review", "Escalated", etc.)
-    if unresolved_findings_count > 15:
-        _penalise(
-            20,
-            "major",
-            f"{unresolved_findings_count} unresolved findings",
-            "Large backlog of open issues",
-        )
-    elif unresolved_findings_count > 5:
-        _penalise(
-            10,
-            "moderate",
-            f"{unresolved_findings_count} unresolved findings",
-            "Pending / under-review items",
-        )
-
-    # Flagged amount material to budget
-    if flagged_pct_of_budget > 10:
-        _penalise(
-            10,
-            "moderate",
-            f"{flagged_pct_of_budget:.1f}% of budget flagged",
-            ">10% of current-FY allocation",
-        )
-    elif flagged_pct_of_budget > 5:
-        _penalise(
-            5,
-            "minor",
-            f"{flagged_pct_of_budget:.1f}% of budget flagged",
-            ">5% of current-FY allocation",
-        )
-
-    # Low absorption = wasted fiscal capacity
-    if absorption_rate is not None and absorption_rate < 0.5:
-        _penalise(
-            10,
-            "moderate",
-            f"{absorption_rate * 100:.0f}% budget absorption",
-            "Under half of budget was spent",
-        )
-
-    # Positive factor — acknowledge when we penalised nothing
-    if not grade_factors:
-        grade_factors.append(
-            {
-                "impact": "positive",
-                "label": "No penalty triggers",
-                "detail": (
-                    f"{total_findings} finding"
-                    f"{'s' if total_findings != 1 else ''}, "
-                    f"{unresolved_findings_count} unresolved"
-                ),
-                "points": 0,
-            }
-        )
-
-    score = max(0.0, min(100.0, score))
-    # Grade thresholds matched to familiar academic scale
-    if score >= 85:
-        grade = "A"
-    elif score >= 70:
-        grade = "B"
-    elif score >= 55:
-        grade = "C"
-    elif score >= 40:
-        grade = "D"
-    else:
-        grade = "F"
-
-    # --- peer_comparison ---
-    region = COUNTY_REGIONS.get(county_id, "Unknown")
-    region_county_ids = [
-        cid for cid, r in COUNTY_REGIONS.items() if r == region and cid != county_id
-    ]
-
-    pop_data = (
-        db.query(DBPopulationData)
-        .filter(DBPopulationData.entity_id == entity.id)
-        .order_by(DBPopulationData.year.desc())
-        .first()
-    )
-    population = pop_data.total_population if pop_data else 0
-
-    if population < 500_000:
-        pop_bracket = "<500k"
-    elif population < 1_000_000:
-        pop_bracket = "500k-1M"
-    elif population < 2_000_000:
-        pop_bracket = "1M-2M"
-    else:
-        pop_bracket = ">2M"
-
-    def _grade_to_num(g: str) -> float:
-        return {"A": 4.0, "B": 3.0, "C": 2.0, "D": 1.0, "F": 0.0}.get(g, 0.0)
-
-    def _num_to_grade(n: float) -> str:
-        if n >= 3.5:
-            return "A"
-        if n >= 2.5:
-            return "B"
-        if n >= 1.5:
-            return "C"
-        if n >= 0.5:
-            return "D"
-        return "F"
-
-    # ─── Peer comparison — batch-loaded to avoid N+1 ────────────────
-    # Previously this section issued ~141 queries per request (one
-    # DBEntity.first() + DBAudit.all() per region-peer + one DBEntity +
-    # DBPopulationData + DBAudit per county in COUNTY_MAPPING). That
-    # pushed cold-cache latency to ~43 s on a 47-county dataset.
-    #
-    # We now do the whole peer roll-up in three bounded queries:
-    #   1. All county entities (1 row per county, ~47).
-    #   2. All audits for peers (DBAudit.entity_id IN (...)).
-    #   3. Latest DBPopulationData per entity (DISTINCT ON / MAX year).
-    # Peer stats are then computed in Python, reusing the same logic.
-    all_peer_entities = (
-        db.query(DBEntity).filter(DBEntity.type == EntityType.COUNTY).all()
-    )
-    # Map canonical_name ("Nairobi County") → entity for the lookup below.
-    peers_by_name: Dict[str, Any] = {
-        (e.canonical_name or ""): e for e in all_peer_entities
-    }
-    peer_entity_ids = [e.id for e in all_peer_entities if e.id != entity.id]
-
-    # Pull all audits for every peer in a single IN(...) query, then
-    # group by entity_id in Python. For 47 counties × ~20 audits this
-    # is <1000 rows.
-    from collections import defaultdict
-    from sqlalchemy import func as _sqlfunc3
-
-    peer_audits_by_entity: Dict[int, List[Any]] = defaultdict(list)
-    if peer_entity_ids:
-        for pa in (
-            db.query(DBAudit).filter(DBAudit.entity_id.in_(peer_entity_ids)).all()
-        ):
-            peer_audits_by_entity[pa.entity_id].append(pa)
-
-    # Latest population per entity via a correlated subquery (one round-trip).
-    # (entity_id, MAX(year)) → join back to get the row; but a straight
-    # "select all, keep max per entity in Python" is simpler and bounded.
-    peer_pop_by_entity: Dict[int, int] = {}
-    if peer_entity_ids:
-        pop_rows = (
-            db.query(
-                DBPopulationData.entity_id,
-                DBPopulationData.total_population,
-                DBPopulationData.year,
-            )
-            .filter(DBPopulationData.entity_id.in_(peer_entity_ids))
-            .all()
-        )
-        # Keep the max-year row per entity (total_population snapshot).
-        latest_year_by_entity: Dict[int, int] = {}
-        for eid, total_pop, yr in pop_rows:
-            cur = latest_year_by_entity.get(eid, -1)
-            if yr > cur:
-                latest_year_by_entity[eid] = yr
-                peer_pop_by_entity[eid] = int(total_pop or 0)
-
-    def _bracket_for(pop: int) -> str:
-        if pop < 500_000:
-            return "<500k"
-        if pop < 1_000_000:
-            return "500k-1M"
-        if pop < 2_000_000:
-            return "1M-2M"
-        return ">2M"
-
-    # Region peers: those in the same region as this county.
-    region_flagged_amounts: List[float] = []
-    region_grades: List[str] = []
-    bracket_flagged_amounts: List[float] = []
-
-    for peer_cid in region_county_ids:
-        peer_name = COUNTY_MAPPING.get(peer_cid)
-        if not peer_name:
-            continue
-        peer_entity = peers_by_name.get(f"{peer_name} County")
-        if not peer_entity:
-            continue
-        peer_audits = peer_audits_by_entity.get(peer_entity.id, [])
-        peer_flagged = float(sum(float(pa.amount or 0) for pa in peer_audits))
-        region_flagged_amounts.append(peer_flagged)
-
-        # Simplified peer grade (opinion-based for efficiency)
-        peer_opinions: Dict[int, str] = {}
-        for pa in peer_audits:
-            if pa.audit_year and pa.audit_opinion:
-                peer_opinions[pa.audit_year] = pa.audit_opinion
-        pg = "A"
-        for op in peer_opinions.values():
-            if op.lower() in ("adverse", "disclaimer"):
-                pg = "D"
-                break
-        if peer_opinions:
-            latest_y = max(peer_opinions.keys())
-            if peer_opinions[latest_y].lower() == "qualified" and pg == "A":
-                pg = "C"
-        region_grades.append(pg)
-
-    # Population-bracket peers: iterate every county and keep same-bracket ones.
-    for cid, cname in COUNTY_MAPPING.items():
-        if cid == county_id:
-            continue
-        ce = peers_by_name.get(f"{cname} County")
-        if not ce:
-            continue
-        cpop = peer_pop_by_entity.get(ce.id, 0)
-        if _bracket_for(cpop) == pop_bracket:
-            ca = peer_audits_by_entity.get(ce.id, [])
-            bracket_flagged_amounts.append(
-                float(sum(float(x.amount or 0) for x in ca))
-            )
-
-    region_avg_flagged = (
-        round(sum(region_flagged_amounts) / len(region_flagged_amounts), 2)
-        if region_flagged_amounts
-        else 0.0
-    )
-    region_avg_grade = (
-        _num_to_grade(sum(_grade_to_num(g) for g in region_grades) / len(region_grades))
-        if region_grades
-        else None
-    )
-    population_bracket_avg = (
-        round(sum(bracket_flagged_amounts) / len(bracket_flagged_amounts), 2)
-        if bracket_flagged_amounts
-        else 0.0
-    )
-
-    peer_comparison = {
-        "region": region,
-        "region_avg_flagged_amount": region_avg_flagged,
-        "region_avg_grade": region_avg_grade,
-        "population_bracket": pop_bracket,
-        "population_bracket_avg": population_bracket_avg,
-    }
-
-    return {
-        "county_id": county_id,
-        "county_name": (entity.canonical_name or "").replace(" County", ""),
-        "audit_opinion_history": audit_opinion_history,
-        "audit_severity_history": audit_severity_history,
-        "total_flagged_amount": total_flagged_amount,
-        "total_findings": total_findings,
-        "critical_findings": critical_findings,
-        "warning_findings": warning_findings,
-        "recurring_findings_count": recurring_findings_count,
-        "unresolved_findings_count": unresolved_findings_count,
-        "absorption_rate": absorption_rate,
-        "flagged_pct_of_budget": round(flagged_pct_of_budget, 2),
-        "accountability_grade": grade,
-        "accountability_score": round(score, 1),
-        "grade_factors": grade_factors,
-        "peer_comparison": peer_comparison,
-    }
+#
+# Scorecards for all counties are computed in one batch by
+# services.accountability and persisted as a versioned snapshot that is
+# refreshed when the audits / counties_budget / population domains commit.
+# These endpoints are key lookups against the current snapshot.
 
 
 @app.get("/api/v1/counties/{county_id}/accountability")
@@ -4729,20 +3777,13 @@ async def get_county_accountability(county_id: str):
         raise HTTPException(status_code=404, detail="County not found")
 
     try:
+        from services.accountability import get_county_scorecard
+
         with next(get_db()) as db:
-            entity = (
-                db.query(DBEntity)
-                .filter(DBEntity.type == EntityType.COUNTY)
-                .filter(DBEntity.canonical_name == f"{county_name} County")
-                .first()
-            )
-            if not entity:
-                slug = county_name.lower().replace(" ", "-") + "-county"
-                entity = db.query(DBEntity).filter(DBEntity.slug == slug).first()
-            if not entity:
+            row = get_county_scorecard(db, NAME_TO_ID_MAPPING.get(county_name, ""))
+            if row is None:
                 raise HTTPException(status_code=404, detail="County entity not found")
-
-            return _compute_accountability(db, entity, county_id)
+            return {**row.payload, "county_id": county_id}
     except HTTPException:
         raise
     except Exception as e:
@@ -4762,40 +3803,21 @@ async def get_county_summary(county_id: str):
         raise HTTPException(status_code=404, detail="County not found")
 
     try:
+        from services.accountability import get_county_scorecard
+
         with next(get_db()) as db:
-            entity = (
-                db.query(DBEntity)
-                .filter(DBEntity.type == EntityType.COUNTY)
-                .filter(DBEntity.canonical_name == f"{county_name} County")
-                .first()
-            )
-            if not entity:
-                slug = county_name.lower().replace(" ", "-") + "-county"
-                entity = db.query(DBEntity).filter(DBEntity.slug == slug).first()
-            if not entity:
+            row = get_county_scorecard(db, NAME_TO_ID_MAPPING.get(county_name, ""))
+            if row is None:
                 raise HTTPException(status_code=404, detail="County entity not found")
 
-            pop_data = (
-                db.query(DBPopulationData)
-                .filter(DBPopulationData.entity_id == entity.id)
-                .order_by(DBPopulationData.year.desc())
-                .first()
-            )
-            budget_lines = _entity_period_budget_query(db, entity.id).all()
-            total_allocated = sum(float(b.allocated_amount or 0) for b in budget_lines)
-            total_spent = sum(float(b.actual_spent or 0) for b in budget_lines)
-            audits = db.query(DBAudit).filter(DBAudit.entity_id == entity.id).all()
-
-            scorecard = _compute_accountability(db, entity, county_id)
-
             return {
                 "county_id": county_id,
-                "county_name": (entity.canonical_name or "").replace(" County", ""),
-                "population": pop_data.total_population if pop_data else 0,
-                "total_budget": total_allocated,
-                "total_spent": total_spent,
-                "audit_findings_count": len(audits),
-                "accountability_grade": scorecard["accountability_grade"],
+                "county_name": row.payload.get("county_name"),
+                "population": row.population or 0,
+                "total_budget": float(row.total_allocated or 0),
+                "total_spent": float(row.total_spent or 0),
+                "audit_findings_count": row.total_findings,
+                "accountability_grade": row.grade,
             }
     except HTTPException:
         raise
@@ -4804,6 +3826,44 @@ async def get_county_summary(county_id: str):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@app.get("/api/v1/accountability/scorecards")
+@cached(key_prefix="accountability:scorecards", ttl=1800)
+async def get_accountability_scorecards():
+    """Every county's accountability grade and score, best first.
+
+    Served from the current scorecard snapshot, so a full 47-county
+    ranking costs one indexed query.
+    """
+    if not DATABASE_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Database unavailable")
+
+    try:
+        from services.accountability import list_scorecards
+
+        with next(get_db()) as db:
+            version, rows = list_scorecards(db)
+            return {
+                "snapshot_version": version,
+                "counties": [
+                    {
+                        "county_id": r.county_id,
+                        "county_name": r.payload.get("county_name"),
+                        "accountability_grade": r.grade,
+                        "accountability_score": float(r.score),
+                        "total_findings": r.total_findings,
+                        "absorption_rate": r.payload.get("absorption_rate"),
+                        "score_percentile": (r.payload.get("peer_comparison") or {}).get(
+                            "score_percentile"
+                        ),
+                    }
+                    for r in rows
+                ],
+            }
+    except Exception as e:
+        logging.error(f"Accountability scorecard listing failed: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @app.get("/api/v1/accountability/missing-funds")
 @cached(key_prefix="accountability:missing-funds", ttl=600)
 async def get_national_missing_funds():
@@ -4897,241 +3957,6 @@ async def get_national_missing_funds():
     }
 
 
-# Canonical sector buckets — keys are lowercase substrings tested against
-# raw budget-line categories, so naming variations across counties collapse
-# into a consistent set of 7 sectors for the national view.
-_SECTOR_BUCKETS: List[Tuple[str, str]] = [
-    ("health", "Health"),
-    ("education", "Education"),
-    ("road", "Roads & Infrastructure"),
-    ("infrastructure", "Roads & Infrastructure"),
-    ("water", "Water & Sanitation"),
-    ("sanitation", "Water & Sanitation"),
-    ("agricultur", "Agriculture"),
-    ("environment", "Environment"),
-    ("trade", "Trade & Industry"),
-    ("industry", "Trade & Industry"),
-    ("social", "Social Services"),
-    ("admin", "Administration"),
-    ("governance", "Administration"),
-]
-
-
-def _sector_bucket(raw: str) -> str:
-    s = (raw or "").lower()
-    for needle, label in _SECTOR_BUCKETS:
-        if needle in s:
-            return label
-    return "Other"
-
-
-@app.get("/api/v1/sectors/spending")
-@cached(key_prefix="sectors:spending", ttl=600)
-async def get_sector_spending():
-    """National sector spending roll-up across all 47 counties.
-
-    For each county, we take the latest fiscal period that has actual
-    execution data and aggregate budget lines into a canonical set of
-    sectors (Health, Education, Roads, Water, etc.). Returns per-sector
-    totals, execution rates, and the counties spending most in each
-    sector. Powers the public /sectors page so citizens can see where
-    public money is flowing across the whole devolved government.
-    """
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database unavailable")
-
-    from collections import defaultdict
-    from sqlalchemy import func as _sqlfunc4
-
-    with next(get_db()) as db:
-        counties = (
-            db.query(DBEntity).filter(DBEntity.type == EntityType.COUNTY).all()
-        )
-        if not counties:
-            return {
-                "total_allocated": 0.0,
-                "total_spent": 0.0,
-                "counties_reporting": 0,
-                "sectors": [],
-            }
-
-        entity_id_to_name: Dict[int, str] = {
-            c.id: (c.canonical_name or "").replace(" County", "").strip()
-            for c in counties
-        }
-        entity_ids = list(entity_id_to_name.keys())
-
-        # Resolve the "latest executed period" per entity in one query.
-        # Preference: max(period.start_date) WHERE sum(actual_spent) > 0.
-        # Fallback: max(period.start_date) overall when nothing executed.
-        # Both are expressed as window-free GROUP BY aggregates so we can
-        # replace the per-entity loop that used to fire two sub-queries
-        # each time (~141 queries for 47 counties).
-        executed_periods = (
-            db.query(
-                DBBudgetLine.entity_id,
-                _sqlfunc4.max(DBFiscalPeriod.start_date).label("start_date"),
-            )
-            .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-            .filter(
-                DBBudgetLine.entity_id.in_(entity_ids),
-                DBBudgetLine.category != "Total Budget",
-            )
-            .group_by(DBBudgetLine.entity_id, DBFiscalPeriod.id, DBFiscalPeriod.start_date)
-            .having(_sqlfunc4.coalesce(_sqlfunc4.sum(DBBudgetLine.actual_spent), 0) > 0)
-            .all()
-        )
-        # Keep only the max start_date per entity.
-        latest_executed_date: Dict[int, Any] = {}
-        for eid, sd in executed_periods:
-            cur = latest_executed_date.get(eid)
-            if cur is None or sd > cur:
-                latest_executed_date[eid] = sd
-
-        # Entities with no execution: fall back to their latest period by date.
-        fallback_ids = [e for e in entity_ids if e not in latest_executed_date]
-        if fallback_ids:
-            fallback_rows = (
-                db.query(
-                    DBBudgetLine.entity_id,
-                    _sqlfunc4.max(DBFiscalPeriod.start_date).label("start_date"),
-                )
-                .join(DBFiscalPeriod, DBBudgetLine.period_id == DBFiscalPeriod.id)
-                .filter(
-                    DBBudgetLine.entity_id.in_(fallback_ids),
-                    DBBudgetLine.category != "Total Budget",
-                )
-                .group_by(DBBudgetLine.entity_id)
-                .all()
-            )
-            for eid, sd in fallback_rows:
-                latest_executed_date[eid] = sd
-
-        # Resolve start_date → period_id per entity. One round-trip via
-        # tuple-IN: (entity_id, start_date) pairs, which SQLite doesn't
-        # support natively; fall back to a simple filter on the distinct
-        # start_dates plus a Python lookup.
-        if not latest_executed_date:
-            return {
-                "total_allocated": 0.0,
-                "total_spent": 0.0,
-                "counties_reporting": 0,
-                "sectors": [],
-            }
-
-        unique_dates = list({d for d in latest_executed_date.values() if d is not None})
-        period_rows = (
-            db.query(DBFiscalPeriod.id, DBFiscalPeriod.start_date)
-            .filter(DBFiscalPeriod.start_date.in_(unique_dates))
-            .all()
-        )
-        date_to_period_ids: Dict[Any, List[int]] = defaultdict(list)
-        for pid, sd in period_rows:
-            date_to_period_ids[sd].append(pid)
-
-        # Build (entity_id, period_id) filter set.
-        entity_period_pairs: List[Tuple[int, int]] = []
-        for eid, sd in latest_executed_date.items():
-            for pid in date_to_period_ids.get(sd, []):
-                entity_period_pairs.append((eid, pid))
-
-        if not entity_period_pairs:
-            return {
-                "total_allocated": 0.0,
-                "total_spent": 0.0,
-                "counties_reporting": 0,
-                "sectors": [],
-            }
-
-        # One final query: pull every budget line in those (entity, period)
-        # pairs. This is bounded by "47 counties × ~15 categories" ≈ 700
-        # rows — tiny compared to the 141 queries we used to issue.
-        eids_for_filter = list({p[0] for p in entity_period_pairs})
-        pids_for_filter = list({p[1] for p in entity_period_pairs})
-        valid_pairs = set(entity_period_pairs)
-        all_lines = (
-            db.query(
-                DBBudgetLine.entity_id,
-                DBBudgetLine.period_id,
-                DBBudgetLine.category,
-                DBBudgetLine.allocated_amount,
-                DBBudgetLine.actual_spent,
-            )
-            .filter(
-                DBBudgetLine.entity_id.in_(eids_for_filter),
-                DBBudgetLine.period_id.in_(pids_for_filter),
-                DBBudgetLine.category != "Total Budget",
-            )
-            .all()
-        )
-
-        sectors: Dict[str, Dict[str, Any]] = {}
-        counties_seen_set: set = set()
-        total_allocated = 0.0
-        total_spent = 0.0
-
-        for eid, pid, category, alloc_raw, spent_raw in all_lines:
-            if (eid, pid) not in valid_pairs:
-                continue
-            counties_seen_set.add(eid)
-            county_name = entity_id_to_name.get(eid, "")
-            bucket = _sector_bucket(category or "")
-            alloc = float(alloc_raw or 0)
-            spent = float(spent_raw or 0)
-            total_allocated += alloc
-            total_spent += spent
-            s = sectors.setdefault(
-                bucket,
-                {
-                    "sector": bucket,
-                    "allocated": 0.0,
-                    "spent": 0.0,
-                    "counties": {},
-                },
-            )
-            s["allocated"] += alloc
-            s["spent"] += spent
-            cs = s["counties"].setdefault(
-                county_name, {"county": county_name, "allocated": 0.0, "spent": 0.0}
-            )
-            cs["allocated"] += alloc
-            cs["spent"] += spent
-
-        counties_seen = len(counties_seen_set)
-
-    out = []
-    for label, s in sectors.items():
-        top = sorted(
-            s["counties"].values(), key=lambda c: c["spent"], reverse=True
-        )[:5]
-        util = (s["spent"] / s["allocated"] * 100) if s["allocated"] else 0.0
-        out.append(
-            {
-                "sector": label,
-                "allocated": round(s["allocated"], 2),
-                "spent": round(s["spent"], 2),
-                "utilization_pct": round(util, 1),
-                "county_count": len(s["counties"]),
-                "top_counties": [
-                    {
-                        "county": t["county"],
-                        "allocated": round(t["allocated"], 2),
-                        "spent": round(t["spent"], 2),
-                    }
-                    for t in top
-                ],
-            }
-        )
-    out.sort(key=lambda x: x["spent"], reverse=True)
-
-    return {
-        "total_allocated": round(total_allocated, 2),
-        "total_spent": round(total_spent, 2),
-        "counties_reporting": counties_seen,
-        "sectors": out,
-    }
-
-
 @app.get("/api/v1/sources/summary")
 @cached(key_prefix="sources:summary", ttl=600)
 async def get_sources_summary():
@@ -5356,734 +4181,66 @@ async def get_sources_status():
         return {"sources": []}
 
 
-async def _run_etl_for_source(source_key: str) -> Dict[str, Any]:
-    """Discover and process a small batch for one source and write a run log file."""
-    # Import lazily to avoid heavy deps on import time
-    # Ensure project root is on sys.path so we can import the 'etl' package
-    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-    try:
-        kp_mod = importlib.import_module("etl.kenya_pipeline")
-        KenyaDataPipeline = getattr(kp_mod, "KenyaDataPipeline")
-    except Exception as e:  # pragma: no cover
-        logging.error(f"ETL import failed: {e}")
-        return {"error": str(e)}
-
-    pipeline = KenyaDataPipeline()
-    discovered = pipeline.discover_budget_documents(source_key)
-    processed = 0
-    successful = 0
-    for doc in discovered[:5]:
-        result = await pipeline.download_and_process_document(doc)
-        processed += 1
-        if result:
-            successful += 1
-        # polite spacing
-        await asyncio.sleep(2)
-
-    run = {
-        "source": source_key,
-        "discovered": len(discovered),
-        "processed": processed,
-        "successful": successful,
-        "ended_at": datetime.datetime.now().isoformat(),
-    }
-
-    # Write file-based run log
-    try:
-        etl_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "etl"))
-        downloads_dir = os.path.join(etl_dir, "downloads")
-        os.makedirs(downloads_dir, exist_ok=True)
-        log_file = os.path.join(downloads_dir, "etl_run_logs.jsonl")
-        with open(log_file, "a", encoding="utf-8") as f:
-            import json as _json
-
-            f.write(_json.dumps(run) + "\n")
-    except Exception:
-        pass
-
-    return run
-
-
-# ---------------- Scheduler + Notifications helpers ----------------
-class AppSettings(BaseModel):
-    smtp_host: Optional[str] = os.getenv("SMTP_HOST")
-    smtp_port: int = int(os.getenv("SMTP_PORT", "587"))
-    smtp_user: Optional[str] = os.getenv("SMTP_USER")
-    smtp_password: Optional[str] = os.getenv("SMTP_PASSWORD")
-    notify_email_to: Optional[str] = os.getenv("NOTIFY_EMAIL_TO")
-    environment: str = os.getenv("ENVIRONMENT", "development")
-    aws_bucket: Optional[str] = os.getenv("AWS_BUCKET_NAME")
-    aws_region: str = os.getenv("AWS_REGION", "us-east-1")
-
+# ---------------- UX link resolver (original/mirrored) ----------------
+def _manifest_file_path() -> str:
+    # etl/downloads/processed_manifest.json relative to backend
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    return os.path.join(root, "etl", "downloads", "processed_manifest.json")
 
-settings = AppSettings()
 
-_s3_client = None
-if boto3 and settings.aws_bucket:
+def _load_manifest() -> Dict[str, Any]:
     try:
-        _s3_client = boto3.client(
-            "s3",
-            region_name=settings.aws_region,
-            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-        )
-    except Exception:
-        _s3_client = None
-
-
-def _artifact_root() -> str:
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
-
-def _artifact_dir() -> str:
-    root = _artifact_root()
-    path = os.path.join(root, "reports", datetime.datetime.now().strftime("%Y-%m-%d"))
-    os.makedirs(path, exist_ok=True)
-    return path
+        path = _manifest_file_path()
+        if os.path.exists(path):
+            import json as _json
 
+            with open(path, "r", encoding="utf-8") as f:
+                return _json.load(f)
+    except Exception as e:
+        logger.error(f"Failed to load manifest: {e}")
+    return {"by_md5": {}}
 
-def _known_dir() -> str:
-    root = _artifact_root()
-    path = os.path.join(root, "reports", "known")
-    os.makedirs(path, exist_ok=True)
-    return path
 
+@app.get("/api/v1/docs/resolve")
+async def resolve_document(url: str = Query(..., description="Original document URL")):
+    """Resolve a document by original URL, returning original and mirrored (presigned) links if available."""
+    man = _load_manifest()
+    rec = None
+    for md5, v in (man.get("by_md5") or {}).items():
+        if (v.get("url") or "").strip() == url.strip():
+            rec = v
+            break
+    if not rec:
+        return {
+            "original_url": url,
+            "mirrored": False,
+            "mirror_url": None,
+            "local_path": None,
+        }
 
-def send_email(subject: str, body: str) -> None:
-    if not (
-        settings.smtp_host
-        and settings.smtp_user
-        and settings.smtp_password
-        and settings.notify_email_to
-    ):
-        logger.info("Email not configured; skipping notification")
-        return
-    try:
-        msg = MIMEText(body, _charset="utf-8")
-        msg["Subject"] = subject
-        msg["From"] = settings.smtp_user
-        msg["To"] = settings.notify_email_to
-        msg["Date"] = formatdate(localtime=True)
-        with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
-            server.starttls()
-            server.login(settings.smtp_user, settings.smtp_password)
-            server.sendmail(
-                settings.smtp_user, [settings.notify_email_to], msg.as_string()
+    s3_key = rec.get("s3_key")
+    presigned = None
+    s3_client = etl_reports.get_s3_client() if s3_key else None
+    if s3_key and s3_client and etl_reports.settings.aws_bucket:
+        try:
+            presigned = s3_client.generate_presigned_url(
+                "get_object",
+                Params={"Bucket": etl_reports.settings.aws_bucket, "Key": s3_key},
+                ExpiresIn=3600,
             )
-    except Exception as e:
-        logger.error(f"Failed to send email: {e}")
+        except Exception as e:
+            logger.warning(f"Could not presign s3 object {s3_key}: {e}")
 
-
-def _load_known_urls(path: str) -> set:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return set(line.strip() for line in f if line.strip())
-    except Exception:
-        return set()
-
-
-def _save_known_urls(path: str, urls: set) -> None:
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            for u in sorted(urls):
-                f.write(u + "\n")
-    except Exception as e:
-        logger.error(f"Failed saving known urls: {e}")
-
-
-def _load_known_hashes(path: str) -> Dict[str, str]:
-    try:
-        import json as _json
-
-        with open(path, "r", encoding="utf-8") as f:
-            data = _json.load(f)
-            return {str(k): str(v) for k, v in data.items()}
-    except Exception:
-        return {}
-
-
-def _save_known_hashes(path: str, mapping: Dict[str, str]) -> None:
-    try:
-        import json as _json
-
-        with open(path, "w", encoding="utf-8") as f:
-            _json.dump(mapping, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.error(f"Failed saving known hashes: {e}")
-
-
-# ---- ETL job tracking --------------------------------------------------------
-_etl_jobs: Dict[str, Dict[str, Any]] = {}  # job_id -> status dict
-_etl_lock = asyncio.Lock()  # Only allow ONE ETL deep job at a time
-_etl_executor = concurrent.futures.ThreadPoolExecutor(
-    max_workers=2, thread_name_prefix="etl"
-)
-
-
-async def _discover(source_key: str) -> List[Dict[str, Any]]:
-    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-    kp_mod = importlib.import_module("etl.kenya_pipeline")
-    KenyaDataPipeline = getattr(kp_mod, "KenyaDataPipeline")
-    pipeline = KenyaDataPipeline()
-    # discover_budget_documents is synchronous (requests-based) – run in dedicated pool
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        _etl_executor, pipeline.discover_budget_documents, source_key
-    )
-
-
-async def _ingest_batch(
-    source_key: str, docs: List[Dict[str, Any]], limit: int = 25
-) -> Tuple[int, int, List[Dict[str, Any]]]:
-    """Download/process up to limit docs; return (processed, successful, failures)."""
-    sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
-    kp_mod = importlib.import_module("etl.kenya_pipeline")
-    KenyaDataPipeline = getattr(kp_mod, "KenyaDataPipeline")
-    pipeline = KenyaDataPipeline()
-    processed = 0
-    successful = 0
-    failures: List[Dict[str, Any]] = []
-
-    def _sync_process(p, d):
-        """Run the async download_and_process_document in a new event loop (it uses sync requests internally)."""
-        import asyncio as _aio
-
-        loop = _aio.new_event_loop()
-        try:
-            return loop.run_until_complete(p.download_and_process_document(d))
-        finally:
-            loop.close()
-
-    for doc in docs[:limit]:
-        try:
-            loop = asyncio.get_event_loop()
-            ok = await loop.run_in_executor(_etl_executor, _sync_process, pipeline, doc)
-            processed += 1
-            if ok:
-                successful += 1
-            else:
-                failures.append({"doc": doc, "error": "process_failed"})
-        except Exception as e:
-            failures.append({"doc": doc, "error": str(e)})
-        await asyncio.sleep(1)
-    return processed, successful, failures
-
-
-async def _run_job(source_key: str, job_type: str = "light") -> Dict[str, Any]:
-    start = datetime.datetime.now()
-    art_dir = _artifact_dir()
-    known_path = os.path.join(_known_dir(), f"known_{source_key}.txt")
-    known = _load_known_urls(known_path)
-    known_hash_path = os.path.join(_known_dir(), f"known_{source_key}_hashes.json")
-    known_hashes = _load_known_hashes(known_hash_path)
-
-    discovered = await _discover(source_key)
-    urls = [d.get("url") or d.get("file_url") for d in discovered]
-    new_docs = [
-        d for d in discovered if (d.get("url") or d.get("file_url")) not in known
-    ]
-    changed_docs: List[Dict[str, Any]] = []
-
-    # Compute landing-page hashes for known URLs to detect changes
-    async def _hash_url(u: str) -> Optional[str]:
-        if not u:
-            return None
-        if re.search(r"\.(pdf|xlsx?|csv|docx?|zip)(?:$|\?)", u, re.I):
-            return None
-        try:
-            timeout = httpx.Timeout(15.0)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                r = await client.get(u, headers={"User-Agent": "Mozilla/5.0"})
-                if "html" not in (r.headers.get("content-type", "").lower()):
-                    return None
-                text = r.text[:500_000]
-                import hashlib as _h
-
-                return _h.md5(text.encode("utf-8", errors="ignore")).hexdigest()
-        except Exception:
-            return None
-
-    for d in discovered:
-        u = d.get("url") or d.get("file_url")
-        if not u or u not in known:
-            continue
-        prev = known_hashes.get(u)
-        newh = await _hash_url(u)
-        if newh and prev and newh != prev:
-            changed_docs.append(d)
-        if newh:
-            known_hashes[u] = newh
-
-    processed = successful = 0
-    failures: List[Dict[str, Any]] = []
-
-    if job_type == "deep":
-        INGEST_LIMITS = {"treasury": 25, "cob": 20, "oag": 15}
-        limit = INGEST_LIMITS.get(source_key, 25)
-        processed, successful, failures = await _ingest_batch(
-            source_key, new_docs, limit=limit
-        )
-
-    # Write artifacts
-    import csv  # local import to avoid top-level cost
-    import json
-
-    tsv_path = os.path.join(art_dir, f"{source_key}_{job_type}_discovered.tsv")
-    with open(tsv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f, delimiter="\t")
-        w.writerow(["Title", "URL"])
-        for d in discovered:
-            w.writerow(
-                [
-                    (d.get("title") or "").strip(),
-                    d.get("url") or d.get("file_url"),
-                ]
-            )
-
-    summary = {
-        "source": source_key,
-        "job_type": job_type,
-        "started_at": start.isoformat(),
-        "ended_at": datetime.datetime.now().isoformat(),
-        "discovered": len(discovered),
-        "new": len(new_docs),
-        "changed": len(changed_docs),
-        "processed": processed,
-        "successful": successful,
-        "failed": len(failures),
-        "artifact_tsv": os.path.relpath(tsv_path, _artifact_root()),
-    }
-
-    json_path = os.path.join(art_dir, f"{source_key}_{job_type}_summary.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {**summary, "failures": failures[:50]}, f, ensure_ascii=False, indent=2
-        )
-
-    # Update known
-    _save_known_urls(known_path, set(u for u in urls if u))
-    _save_known_hashes(known_hash_path, known_hashes)
-
-    # Notify
-    subject = f"[ETL {settings.environment}] {source_key.upper()} {job_type}: +{summary['new']} new, {summary['failed']} failed"
-    top_new = "\n".join(
-        [
-            f"- {(d.get('title') or '').strip()} — {(d.get('url') or d.get('file_url'))}"
-            for d in new_docs[:10]
-        ]
-    )
-    top_fail = "\n".join(
-        [
-            f"- {(f.get('doc') or {}).get('url') or (f.get('doc') or {}).get('file_url')} :: {f.get('error')}"
-            for f in failures[:10]
-        ]
-    )
-    body = (
-        f"Source: {source_key}\nJob: {job_type}\nDiscovered: {summary['discovered']}\nNew: {summary['new']}\nChanged: {summary['changed']}\n"
-        f"Processed: {processed} (ok {successful}, failed {summary['failed']})\nArtifacts: {summary['artifact_tsv']}\n\n"
-        f"New (top 10):\n{top_new or '—'}\n\nFailures (top 10):\n{top_fail or '—'}\n"
-    )
-    send_email(subject, body)
-
-    logger.info(f"ETL job finished: {summary}")
-    return summary
-
-
-from fastapi.security import HTTPAuthorizationCredentials
-
-
-@app.post("/api/v1/admin/etl/run")
-async def run_etl_job(
-    source: str = Query(..., pattern="^(oag|cob|treasury)$"),
-    job: str = Query("light", pattern="^(light|deep)$"),
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-):
-    """Manually trigger an ETL job for a source (light or deep).
-
-    Returns immediately with a job_id. The ETL runs in the background.
-    Check progress via GET /api/v1/admin/etl/status.
-    """
-    import uuid as _uuid
-
-    job_id = f"{source}_{job}_{_uuid.uuid4().hex[:8]}"
-    _etl_jobs[job_id] = {
-        "source": source,
-        "job_type": job,
-        "status": "running",
-        "started_at": datetime.datetime.now().isoformat(),
-        "result": None,
-    }
-
-    async def _bg():
-        async with _etl_lock:  # Only one ETL deep job at a time
-            try:
-                _etl_jobs[job_id]["status"] = "running"
-                result = await _run_job(source, job)
-                _etl_jobs[job_id]["status"] = "completed"
-                _etl_jobs[job_id]["result"] = result
-            except Exception as exc:
-                _etl_jobs[job_id]["status"] = "failed"
-                _etl_jobs[job_id]["error"] = str(exc)
-            _etl_jobs[job_id]["ended_at"] = datetime.datetime.now().isoformat()
-
-    asyncio.create_task(_bg())
-    return {
-        "job_id": job_id,
-        "status": "started",
-        "message": "ETL job running in background. Check /api/v1/admin/etl/status for progress.",
-    }
-
-
-# ``require_admin`` is shared with the routers in ``backend/routers/`` —
-# importing here lets us put the etl-jobs endpoint defined directly on
-# ``app`` behind the same auth gate as the rest of /admin.
-from supabase_auth import require_admin as _require_admin
-
-
-@app.get("/api/v1/admin/etl/status")
-async def get_etl_jobs_status(_actor=Depends(_require_admin)):
-    """Get status of all ETL jobs.
-
-    Gated on ``require_admin`` so the in-memory job map (queue size,
-    source identifiers, error messages) isn't readable by
-    unauthenticated callers — matches the rest of ``/admin/*``.
-    """
-    return {"jobs": _etl_jobs}
-
-
-@app.on_event("startup")
-async def setup_scheduler():
-    # keep prior startup logs
-    logger.info("Main Backend API starting up...")
-    logger.info(f"Working directory: {os.getcwd()}")
-    logger.info("Initializing database connections...")
-    logger.info("Main Backend API startup complete!")
-
-    # Start background scheduler if available
-    try:
-        async_mod = importlib.import_module("apscheduler.schedulers.asyncio")
-        AsyncIOScheduler = getattr(async_mod, "AsyncIOScheduler")
-    except Exception:
-        AsyncIOScheduler = None
-
-    if not AsyncIOScheduler:
-        logger.info("APScheduler not installed; skipping ETL scheduling.")
-        return
-
-    scheduler = AsyncIOScheduler()
-
-    # Per-source intervals with jitter seconds
-    def jitter(base_seconds: int, spread: int = 900) -> int:
-        return max(60, base_seconds + random.randint(-spread, spread))
-
-    # OAG: light weekly, deep monthly
-    scheduler.add_job(
-        _run_job,
-        args=["oag", "light"],
-        trigger="interval",
-        seconds=jitter(7 * 24 * 3600),
-        id="etl_oag_light",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-    scheduler.add_job(
-        _run_job,
-        args=["oag", "deep"],
-        trigger="interval",
-        seconds=jitter(30 * 24 * 3600),
-        id="etl_oag_deep",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-
-    # COB: light weekly, deep biweekly
-    scheduler.add_job(
-        _run_job,
-        args=["cob", "light"],
-        trigger="interval",
-        seconds=jitter(7 * 24 * 3600),
-        id="etl_cob_light",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-    scheduler.add_job(
-        _run_job,
-        args=["cob", "deep"],
-        trigger="interval",
-        seconds=jitter(14 * 24 * 3600),
-        id="etl_cob_deep",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-
-    # Treasury: light twice weekly (~3.5 days), deep weekly
-    scheduler.add_job(
-        _run_job,
-        args=["treasury", "light"],
-        trigger="interval",
-        seconds=jitter(int(3.5 * 24 * 3600)),
-        id="etl_treasury_light",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-    scheduler.add_job(
-        _run_job,
-        args=["treasury", "deep"],
-        trigger="interval",
-        seconds=jitter(7 * 24 * 3600),
-        id="etl_treasury_deep",
-        max_instances=1,
-        coalesce=True,
-        misfire_grace_time=3600,
-    )
-
-    scheduler.start()
-
-    # ------------------------------------------------------------------
-    # Parliament ETL automation (daily ingest + weekly reconcile)
-    # ------------------------------------------------------------------
-    # Parliament jobs run via subprocess to avoid import shadowing between
-    # backend/etl/ (normalizer) and the top-level etl/ package.
-    if os.getenv("PARLIAMENT_PIPELINE_ENABLED", "0") == "1":
-        logger.info("Parliament pipeline enabled — scheduling ingest & reconcile jobs")
-        _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-
-        def _sync_parliament_ingest():
-            """Run Parliament ingest + validate as a subprocess."""
-            import subprocess
-
-            try:
-                result = subprocess.run(
-                    [
-                        sys.executable,
-                        "-m",
-                        "etl.parliament_orchestrator",
-                        "--commit",
-                        "--ingest-only",
-                    ],
-                    cwd=_project_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=3600,
-                    env={**os.environ, "PARLIAMENT_PIPELINE_ENABLED": "1"},
-                )
-                if result.returncode != 0:
-                    logger.error(
-                        "Parliament ingest failed (rc=%d): %s",
-                        result.returncode,
-                        result.stderr[-1000:],
-                    )
-                else:
-                    logger.info(
-                        "Parliament ingest completed:\n%s", result.stdout[-1000:]
-                    )
-                return {"returncode": result.returncode}
-            except subprocess.TimeoutExpired:
-                logger.error("Parliament ingest timed out after 3600s")
-                return {"returncode": -1, "error": "timeout"}
-            except Exception as e:
-                logger.exception("Parliament ingest failed: %s", e)
-                return {"returncode": -1, "error": str(e)}
-
-        def _sync_parliament_reconcile():
-            """Run Parliament reconcile + validate as a subprocess."""
-            import subprocess
-
-            if os.getenv("PARLIAMENT_RECONCILE_ENABLED", "1") == "0":
-                logger.info(
-                    "Parliament reconcile disabled via PARLIAMENT_RECONCILE_ENABLED=0"
-                )
-                return {"status": "skipped"}
-            try:
-                result = subprocess.run(
-                    [
-                        sys.executable,
-                        "-m",
-                        "etl.parliament_orchestrator",
-                        "--commit",
-                        "--reconcile-only",
-                    ],
-                    cwd=_project_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=3600,
-                    env={**os.environ, "PARLIAMENT_PIPELINE_ENABLED": "1"},
-                )
-                if result.returncode != 0:
-                    logger.error(
-                        "Parliament reconcile failed (rc=%d): %s",
-                        result.returncode,
-                        result.stderr[-1000:],
-                    )
-                else:
-                    logger.info(
-                        "Parliament reconcile completed:\n%s", result.stdout[-1000:]
-                    )
-                return {"returncode": result.returncode}
-            except subprocess.TimeoutExpired:
-                logger.error("Parliament reconcile timed out after 3600s")
-                return {"returncode": -1, "error": "timeout"}
-            except Exception as e:
-                logger.exception("Parliament reconcile failed: %s", e)
-                return {"returncode": -1, "error": str(e)}
-
-        async def _parliament_ingest_async():
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(_etl_executor, _sync_parliament_ingest)
-
-        async def _parliament_reconcile_async():
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(_etl_executor, _sync_parliament_reconcile)
-
-        # Daily ingest: discover and insert new items (every 24h ± jitter)
-        scheduler.add_job(
-            _parliament_ingest_async,
-            trigger="interval",
-            seconds=jitter(24 * 3600),
-            id="etl_parliament_ingest",
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=3600,
-        )
-
-        # Weekly reconcile: re-resolve entity metadata (every 7 days ± jitter)
-        scheduler.add_job(
-            _parliament_reconcile_async,
-            trigger="interval",
-            seconds=jitter(7 * 24 * 3600),
-            id="etl_parliament_reconcile",
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=3600,
-        )
-
-        logger.info("Parliament scheduled: daily ingest + weekly reconcile")
-    else:
-        logger.info("Parliament pipeline disabled (PARLIAMENT_PIPELINE_ENABLED != 1)")
-
-    # Weekly digest email (every 7 days)
-    try:
-
-        def _digest_wrapper():
-            import asyncio as _asyncio
-
-            _asyncio.get_event_loop().create_task(send_weekly_digest())
-
-        scheduler.add_job(
-            _digest_wrapper,
-            trigger="interval",
-            seconds=jitter(7 * 24 * 3600),
-            id="etl_weekly_digest",
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=3600,
-        )
-    except Exception as e:
-        logger.warning(f"Failed to schedule weekly digest: {e}")
-
-
-# ---------------- UX link resolver (original/mirrored) ----------------
-def _manifest_file_path() -> str:
-    # etl/downloads/processed_manifest.json relative to backend
-    root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return os.path.join(root, "etl", "downloads", "processed_manifest.json")
-
-
-def _load_manifest() -> Dict[str, Any]:
-    try:
-        path = _manifest_file_path()
-        if os.path.exists(path):
-            import json as _json
-
-            with open(path, "r", encoding="utf-8") as f:
-                return _json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load manifest: {e}")
-    return {"by_md5": {}}
-
-
-@app.get("/api/v1/docs/resolve")
-async def resolve_document(url: str = Query(..., description="Original document URL")):
-    """Resolve a document by original URL, returning original and mirrored (presigned) links if available."""
-    man = _load_manifest()
-    rec = None
-    for md5, v in (man.get("by_md5") or {}).items():
-        if (v.get("url") or "").strip() == url.strip():
-            rec = v
-            break
-    if not rec:
-        return {
-            "original_url": url,
-            "mirrored": False,
-            "mirror_url": None,
-            "local_path": None,
-        }
-
-    s3_key = rec.get("s3_key")
-    presigned = None
-    if s3_key and _s3_client and settings.aws_bucket:
-        try:
-            presigned = _s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": settings.aws_bucket, "Key": s3_key},
-                ExpiresIn=3600,
-            )
-        except Exception as e:
-            logger.warning(f"Could not presign s3 object {s3_key}: {e}")
-
-    return {
-        "original_url": url,
-        "mirrored": bool(s3_key and presigned),
-        "mirror_url": presigned,
-        "local_path": rec.get("file_path"),
-        "title": rec.get("title"),
-        "source": rec.get("source"),
-        "doc_type": rec.get("doc_type"),
-        "fetched": rec.get("fetched"),
-    }
-
-
-async def send_weekly_digest() -> None:
-    """Email a weekly summary across sources based on the current known files and last summaries."""
-    try:
-        root = _artifact_root()
-        reports_dir = os.path.join(root, "reports")
-        # Find the latest summary files
-        latest: Dict[str, Dict[str, Any]] = {}
-        if os.path.isdir(reports_dir):
-            for day in sorted(os.listdir(reports_dir), reverse=True)[
-                :14
-            ]:  # last 2 weeks
-                day_dir = os.path.join(reports_dir, day)
-                if not os.path.isdir(day_dir):
-                    continue
-                for name in os.listdir(day_dir):
-                    if name.endswith("_summary.json"):
-                        src = name.split("_")[0]
-                        try:
-                            import json as _json
-
-                            with open(
-                                os.path.join(day_dir, name), "r", encoding="utf-8"
-                            ) as f:
-                                latest[src] = _json.load(f)
-                        except Exception:
-                            pass
-        lines = ["Weekly ETL Digest"]
-        for src in sorted(latest.keys()):
-            s = latest[src]
-            lines.append(
-                f"- {src.upper()}: discovered {s.get('discovered',0)}, new {s.get('new',0)}, processed {s.get('processed',0)} (ok {s.get('successful',0)}, failed {s.get('failed',0)})"
-            )
-        body = "\n".join(lines)
-        send_email(f"[ETL {settings.environment}] Weekly Digest", body)
-    except Exception as e:
-        logger.error(f"Weekly digest failed: {e}")
+    return {
+        "original_url": url,
+        "mirrored": bool(s3_key and presigned),
+        "mirror_url": presigned,
+        "local_path": rec.get("file_path"),
+        "title": rec.get("title"),
+        "source": rec.get("source"),
+        "doc_type": rec.get("doc_type"),
+        "fetched": rec.get("fetched"),
+    }
 
 
 @app.get("/api/v1/storage/status")
@@ -6134,7 +4291,7 @@ async def get_national_budget_summary(fiscal_year: str = None):
                         )
                 else:
                     # Default to latest national FY
-                    _nat_pid = _latest_national_period(db)
+                    _nat_pid = queries.latest_national_period(db)
                     if _nat_pid:
                         budget_query = budget_query.filter(
                             DBBudgetLine.period_id == _nat_pid
@@ -6213,7 +4370,7 @@ async def get_national_budget_summary(fiscal_year: str = None):
                     if resolved_pid:
                         period_label = resolved_pid.label
                 else:
-                    _nat_pid = _latest_national_period(db)
+                    _nat_pid = queries.latest_national_period(db)
                     if _nat_pid:
                         period_label = (
                             db.query(DBFiscalPeriod.label)
@@ -6223,7 +4380,7 @@ async def get_national_budget_summary(fiscal_year: str = None):
 
                 return {
                     "status": "success",
-                    "_meta": _response_meta(
+                    "_meta": response_meta(
                         unit="kes",
                         entity_scope="national",
                         fiscal_period=period_label,
@@ -6293,7 +4450,7 @@ async def get_budget_utilization_summary(fiscal_year: str = None):
                     if fp:
                         period_id = fp.id
                 else:
-                    period_id = _latest_county_period(db)
+                    period_id = queries.latest_county_period(db)
 
                 util_q = (
                     db.query(
@@ -6327,7 +4484,7 @@ async def get_budget_utilization_summary(fiscal_year: str = None):
 
                 return {
                     "status": "success",
-                    "_meta": _response_meta(unit="kes", entity_scope="county"),
+                    "_meta": response_meta(unit="kes", entity_scope="county"),
                     "data": entities,
                     "data_source": "database",
                 }
@@ -6340,542 +4497,62 @@ async def get_budget_utilization_summary(fiscal_year: str = None):
     )
 
 
-# ── Consolidated budget overview (sectors merged, multi-year ready) ──
-SECTOR_NORMALIZE = {
-    "health services": "Health",
-    "health": "Health",
-    "education": "Education",
-    "education & training": "Education",
-    "roads and public works": "Infrastructure",
-    "roads & transport": "Infrastructure",
-    "infrastructure & transport": "Infrastructure",
-    "water and sanitation": "Water & Sanitation",
-    "water & sanitation": "Water & Sanitation",
-    "agriculture": "Agriculture",
-    "agriculture & livestock": "Agriculture",
-    "public administration": "Administration",
-    "administration": "Administration",
-    "governance & administration": "Administration",
-    "county assembly": "Administration",
-    "trade and industry": "Trade & Enterprise",
-    "trade & enterprise": "Trade & Enterprise",
-    "environment": "Environment",
-    "environment & natural resources": "Environment",
-    "lands & urban planning": "Environment",
-    "social services": "Social Protection",
-    "social protection": "Social Protection",
-    "defense": "Defense",
-    "public order & safety": "Public Order & Safety",
-    "energy": "Energy",
-    "other": "Other",
-}
 
-SECTOR_ORDER = [
-    "Education",
-    "Infrastructure",
-    "Public Order & Safety",
-    "Administration",
-    "Defense",
-    "Health",
-    "Energy",
-    "Social Protection",
-    "Agriculture",
-    "Water & Sanitation",
-    "Environment",
-    "Trade & Enterprise",
-    "Other",
-]
 
+@app.get("/api/v1/budget/enhanced")
+@cached(key_prefix="budget:enhanced", ttl=1800)
+async def get_budget_enhanced(db: Session = Depends(get_db)):
+    """Extended budget data not in the base overview.
+
+    Returns:
+      - revenue_by_source: Tax-type breakdown per FY (PAYE, Corp Tax, VAT, Excise, Customs, Other)
+      - economic_context: Budget as % of GDP, per-capita budget, key economic indicators
+      - execution_by_sector: Allocated → Spent pipeline per sector from CoB NG-BIRR reports
+    """
+    from models import (
+        BudgetLine,
+        EconomicIndicator,
+        Entity,
+        FiscalSummary,
+        PopulationData,
+        RevenueBySource,
+    )
+    from sqlalchemy import func
 
-@app.get("/api/v1/budget/overview")
-@cached(key_prefix="budget:overview", ttl=1800)
-async def get_budget_overview():
-    """Consolidated budget overview: merged sectors + fiscal history for year comparison."""
-    if not DATABASE_AVAILABLE:
-        raise HTTPException(status_code=503, detail="Database not available")
     try:
-        from sqlalchemy import func
+        # ── 1. Revenue by source ──
+        rev_rows = (
+            db.query(RevenueBySource)
+            .order_by(RevenueBySource.fiscal_year, RevenueBySource.revenue_type)
+            .all()
+        )
 
-        with next(get_db()) as db:
-            # ── Resolve latest county fiscal period ─────────────
-            county_period_id = _latest_county_period(db)
-            period_label = None
-            if county_period_id:
-                _fp = db.query(DBFiscalPeriod).get(county_period_id)
-                period_label = _fp.label if _fp else None
-
-            # ── Sector allocations (county-only, latest FY) ─────
-            sector_q = (
-                db.query(
-                    DBBudgetLine.category,
-                    func.sum(DBBudgetLine.allocated_amount).label("allocated"),
-                    func.sum(DBBudgetLine.actual_spent).label("spent"),
-                )
-                .join(DBEntity, DBBudgetLine.entity_id == DBEntity.id)
-                .filter(DBEntity.type == EntityType.COUNTY)
-                .filter(DBBudgetLine.category != "Total Budget")
-            )
-            if county_period_id:
-                sector_q = sector_q.filter(DBBudgetLine.period_id == county_period_id)
-            sector_rows = sector_q.group_by(DBBudgetLine.category).all()
-            merged: dict = {}
-            for cat, alloc, spent in sector_rows:
-                key = SECTOR_NORMALIZE.get(str(cat or "").strip().lower(), "Other")
-                if key == "Other" and str(cat or "").strip().lower() == "total budget":
-                    continue  # skip the aggregate row
-                entry = merged.setdefault(key, {"allocated": 0.0, "spent": 0.0})
-                entry["allocated"] += float(alloc or 0)
-                entry["spent"] += float(spent or 0)
-
-            total_allocated = sum(v["allocated"] for v in merged.values())
-            total_spent = sum(v["spent"] for v in merged.values())
-
-            sectors = []
-            for name in SECTOR_ORDER:
-                if name not in merged:
-                    continue
-                v = merged[name]
-                sectors.append(
-                    {
-                        "sector": name,
-                        "allocated": v["allocated"],
-                        "spent": v["spent"],
-                        "percentage": (
-                            round(v["allocated"] / total_allocated * 100, 1)
-                            if total_allocated > 0
-                            else 0
-                        ),
-                        "utilization": (
-                            round(v["spent"] / v["allocated"] * 100, 1)
-                            if v["allocated"] > 0
-                            else 0
-                        ),
-                    }
-                )
-
-            # ── Fiscal history (for year-over-year comparison) ─────
-            from models import FiscalSummary as FSModel
-
-            fiscal_rows = db.query(FSModel).order_by(FSModel.fiscal_year.asc()).all()
-            fiscal_years = []
-            for r in fiscal_rows:
-                entry = {
-                    "fiscal_year": r.fiscal_year,
-                    "appropriated_budget": float(r.appropriated_budget or 0),
-                    "total_revenue": float(r.total_revenue or 0),
-                    "tax_revenue": float(r.tax_revenue or 0),
-                    "non_tax_revenue": float(r.non_tax_revenue or 0),
-                    "total_borrowing": float(r.total_borrowing or 0),
-                    "borrowing_pct_of_budget": float(r.borrowing_pct_of_budget or 0),
-                    "debt_service_cost": float(r.debt_service_cost or 0),
-                    "development_spending": float(r.development_spending or 0),
-                    "recurrent_spending": float(r.recurrent_spending or 0),
-                    "county_allocation": float(r.county_allocation or 0),
-                }
-                # Only include years with substantially complete data —
-                # World Bank back-fill years often only have 1-2 fields.
-                key_fields = [
-                    entry["appropriated_budget"],
-                    entry["total_revenue"],
-                    entry["total_borrowing"],
-                    entry["county_allocation"],
-                ]
-                if sum(1 for v in key_fields if v > 0) >= 3:
-                    fiscal_years.append(entry)
-
-            latest = fiscal_years[-1] if fiscal_years else {}
-
-            # ── Top / bottom utilization counties (same FY scope) ──
-            util_q = (
-                db.query(
-                    DBEntity.canonical_name,
-                    func.sum(DBBudgetLine.allocated_amount).label("a"),
-                    func.sum(DBBudgetLine.actual_spent).label("s"),
-                )
-                .join(DBBudgetLine, DBBudgetLine.entity_id == DBEntity.id)
-                .filter(DBEntity.type == EntityType.COUNTY)
-                .filter(DBBudgetLine.category != "Total Budget")
-            )
-            if county_period_id:
-                util_q = util_q.filter(DBBudgetLine.period_id == county_period_id)
-            util_rows = util_q.group_by(DBEntity.canonical_name).all()
-            county_utils = []
-            for name, a, s in util_rows:
-                a_f = float(a or 0)
-                s_f = float(s or 0)
-                if a_f > 0:
-                    county_utils.append(
-                        {
-                            "county": str(name).replace(" County", ""),
-                            "allocated": a_f,
-                            "spent": s_f,
-                            "utilization": round(s_f / a_f * 100, 1),
-                        }
-                    )
-            county_utils.sort(key=lambda x: x["utilization"], reverse=True)
-
-            # Plausibility checks
-            _check_plausibility(
-                total_allocated,
-                _MAX_NATIONAL_BUDGET_KES,
-                "budget/overview total_budget",
-            )
-            for s in sectors:
-                _check_plausibility(
-                    float(s.get("amount", 0)),
-                    _MAX_NATIONAL_BUDGET_KES,
-                    f"budget/overview sector {s.get('name')}",
-                )
-
-            # ── Trust-guard quality notes ───────────────────────────
-            # These surface known credibility risks for this endpoint
-            # so the UI can show a single "data quality" badge.
-            #   1. Missing Personnel Emoluments category (real county
-            #      data has this as ~50% of spend).
-            #   2. Suspiciously uniform utilization (modeled data).
-            #   3. Stale coverage relative to the current FY.
-            #   4. Divergence between summed sectors and the seed
-            #      total (caught by _check_plausibility above).
-            quality_notes: list[str] = []
-            sector_notes = check_budget_sectors(sectors)
-            quality_notes.extend(sector_notes)
-            quality_notes.extend(
-                check_period_nonempty(
-                    len(sectors),
-                    endpoint="/budget/overview",
-                    period_label=period_label,
-                )
-            )
-            # If the sector-check found Personnel Emoluments missing OR
-            # utilization uniformity, the data is demonstrably modeled
-            # regardless of whether SourceDocument.description admits
-            # it. Downgrade the default so the UI badge tints amber.
-            _sector_flagged_modeling = any(
-                "personnel emoluments" in n.lower()
-                or "suspiciously uniform" in n.lower()
-                for n in sector_notes
-            )
-            # Resolve the app's "current" FY from app settings so the
-            # staleness check uses a deploy-time truth rather than
-            # wall-clock-derived guesses.
-            from models import FiscalPeriod as _FPModel
-            _current_fp = (
-                db.query(_FPModel.label)
-                .order_by(_FPModel.start_date.desc())
-                .limit(1)
-                .scalar()
-            )
-            if _current_fp:
-                quality_notes.extend(
-                    check_coverage_staleness(
-                        period_label,
-                        current_fy_label=_current_fp,
-                        max_stale_fys=1,
-                    )
-                )
-
-            # ── Data-quality provenance ─────────────────────────────
-            # The writer (backend/seeding/domains/counties_budget/
-            # writer.py) persists data_quality into TWO places so we
-            # can probe without joining a free-text description column:
-            #   1. SourceDocument.meta["data_quality"] — authoritative
-            #      (one per source; always reflects the latest seed).
-            #   2. BudgetLine.provenance[].data_quality — per-line audit
-            #      trail, surfaced here as a tiebreaker when the source
-            #      is shared by a mix of fixture + real rows.
-            # If any county line still reports "estimated" / "projected",
-            # we downgrade the overall badge — one modeled sector taints
-            # the aggregate.
-            data_quality = "official"
-            src_updated_at: datetime.datetime | None = None
-            try:
-                from models import BudgetLine as _BL, SourceDocument as _SD
-
-                quality_q = (
-                    db.query(
-                        _SD.meta,
-                        _SD.last_seen_at,
-                        _SD.fetch_date,
-                        _SD.created_at,
-                        _BL.provenance,
-                    )
-                    .join(_BL, _BL.source_document_id == _SD.id)
-                    .join(DBEntity, _BL.entity_id == DBEntity.id)
-                    .filter(DBEntity.type == EntityType.COUNTY)
-                )
-                if county_period_id:
-                    quality_q = quality_q.filter(_BL.period_id == county_period_id)
-                quality_rows = quality_q.all()
-                if quality_rows:
-                    # Collect every data_quality token we see, from both
-                    # source meta and per-line provenance entries.
-                    tokens: set[str] = set()
-                    for src_meta, _ls, _fd, _cr, prov in quality_rows:
-                        if isinstance(src_meta, dict):
-                            t = src_meta.get("data_quality")
-                            if isinstance(t, str) and t:
-                                tokens.add(t.lower())
-                        if isinstance(prov, list):
-                            for entry in prov:
-                                if isinstance(entry, dict):
-                                    t = entry.get("data_quality")
-                                    if isinstance(t, str) and t:
-                                        tokens.add(t.lower())
-
-                    # Badge hierarchy: any "estimated"/"projected" taints
-                    # the aggregate. "official" wins only if *every* row
-                    # is official-or-unknown-but-at-least-one-official.
-                    if "estimated" in tokens or "modeled" in tokens:
-                        data_quality = "estimated"
-                        quality_notes.insert(
-                            0,
-                            "County allocations shown here are modeled on "
-                            "the CRA equitable-share formula, not sourced "
-                            "from Controller of Budget execution reports. "
-                            "Expect divergence from actual absorption.",
-                        )
-                    elif "projected" in tokens or "forecast" in tokens:
-                        data_quality = "projected"
-                    elif "official" in tokens:
-                        data_quality = "official"
-                    elif tokens:
-                        # Only "unknown"/"historical"/"mixed" surfaced.
-                        data_quality = "mixed" if len(tokens) > 1 else next(iter(tokens))
-
-                    # source_updated_at = newest timestamp we can find
-                    # across last_seen_at / fetch_date / created_at.
-                    ts_values = [
-                        t
-                        for r in quality_rows
-                        for t in (r[1], r[2], r[3])
-                        if t is not None
-                    ]
-                    if ts_values:
-                        src_updated_at = max(ts_values)
-            except Exception as _e:
-                logging.debug("budget/overview data_quality probe failed: %s", _e)
-
-            # If trust-guard sector checks flagged the data as modeled
-            # (no Personnel Emoluments, or σ<1.0 uniformity), honour
-            # that signal even if the SourceDocument probe said otherwise.
-            if _sector_flagged_modeling and data_quality == "official":
-                data_quality = "estimated"
-
-            # ── Post-activation trust checks (April-2026) ───────────
-            # These fire once the live COB ingestion path is running
-            # so we catch: stale feed (pipeline broken), Total-only
-            # extraction (scraper heuristic drift), and repeated
-            # ingestion failures (COB site outage).
-            #
-            # Conservative rule: any of these downgrades the badge
-            # from "official" → "estimated". Badge only goes green
-            # when freshness, category coverage, AND sector sanity
-            # all pass.
-            try:
-                from services.trust_guards import (
-                    check_category_coverage,
-                    check_consecutive_fetch_failures,
-                    check_source_freshness,
-                )
-
-                # Freshness: newest fetch_date across county-scope
-                # SourceDocuments. Missing = no successful fetch ever.
-                freshness_notes = check_source_freshness(
-                    src_updated_at,
-                    label="County budget feed (COB)",
-                    max_age_days=120,
-                )
-                quality_notes.extend(freshness_notes)
-
-                # Category coverage: if the DB carries only "Total"
-                # rows for counties, the scraper didn't find the
-                # sub-aggregate tables in the source PDF.
-                try:
-                    from models import BudgetLine as _BL2
-
-                    cat_rows = (
-                        db.query(_BL2.category)
-                        .join(DBEntity, _BL2.entity_id == DBEntity.id)
-                        .filter(DBEntity.type == EntityType.COUNTY)
-                    )
-                    if county_period_id:
-                        cat_rows = cat_rows.filter(_BL2.period_id == county_period_id)
-                    raw_categories = [r[0] for r in cat_rows.distinct().all()]
-                except Exception:
-                    raw_categories = []
-
-                coverage_notes = check_category_coverage(
-                    raw_categories,
-                    require_pe=True,
-                    require_recurrent_dev_split=False,
-                )
-                quality_notes.extend(coverage_notes)
-
-                # Consecutive failures: scan the recent IngestionJob
-                # history for the counties_budget domain.
-                try:
-                    from models import IngestionJob as _IJ
-
-                    recent = (
-                        db.query(_IJ.status)
-                        .filter(_IJ.domain == "counties_budget")
-                        .order_by(_IJ.started_at.desc())
-                        .limit(5)
-                        .all()
-                    )
-                    # Reverse to chronological order for the checker.
-                    statuses = [
-                        getattr(r[0], "value", str(r[0])).lower()
-                        for r in reversed(recent)
-                    ]
-                except Exception:
-                    statuses = []
-
-                failure_notes = check_consecutive_fetch_failures(
-                    statuses,
-                    domain="counties_budget",
-                    threshold=3,
-                )
-                quality_notes.extend(failure_notes)
-
-                # If any of the three guards fired, the badge cannot
-                # honestly remain "official".
-                if (
-                    (freshness_notes or coverage_notes or failure_notes)
-                    and data_quality == "official"
-                ):
-                    data_quality = "estimated"
-            except Exception as _e:
-                logging.debug(
-                    "budget/overview post-activation trust checks failed: %s", _e
-                )
-
-            scope_detail = (
-                "Sector allocations are aggregated from county-level "
-                "BudgetLine rows for the latest fiscal period with data. "
-                "Personnel Emoluments — typically ~50% of county spending "
-                "— is not broken out unless the source fixture includes "
-                "it as a category. Figures therefore reflect non-wage "
-                "allocations when the seed is CRA-formula based."
-            )
-
-            # /budget/overview returns mixed units (sectors in KES,
-            # fiscal_history in billion KES, county_utilization in KES),
-            # so extend the standard _meta envelope with per-section unit
-            # keys — tests in test_unit_safety assert these exact fields.
-            _budget_overview_meta = _response_meta(
-                unit="mixed",
-                entity_scope="all",
-                fiscal_period=period_label,
-                scope_detail=scope_detail,
-                covers_through=period_label,
-                cache_ttl_seconds=1800,
-                source_updated_at=src_updated_at,
-                data_quality=data_quality,
-                quality_notes=quality_notes or None,
-            )
-            _budget_overview_meta["summary_unit"] = "kes"
-            _budget_overview_meta["sectors_unit"] = "kes"
-            _budget_overview_meta["fiscal_history_unit"] = "billion_kes"
-            _budget_overview_meta["county_utilization_unit"] = "kes"
-            return {
-                "status": "success",
-                "data_source": "database",
-                "fiscal_period": period_label,
-                "last_updated": datetime.datetime.now().isoformat(),
-                "_meta": _budget_overview_meta,
-                "summary": {
-                    "total_budget": total_allocated,
-                    "total_spent": total_spent,
-                    "execution_rate": (
-                        round(total_spent / total_allocated * 100, 1)
-                        if total_allocated > 0
-                        else 0
-                    ),
-                    "currency": "KES",
-                },
-                "sectors": sectors,
-                "fiscal_history": fiscal_years,
-                "county_utilization": {
-                    "top_5": county_utils[:5],
-                    "bottom_5": (
-                        county_utils[-5:][::-1] if len(county_utils) >= 5 else []
-                    ),
-                    "average": (
-                        round(
-                            sum(c["utilization"] for c in county_utils)
-                            / len(county_utils),
-                            1,
-                        )
-                        if county_utils
-                        else 0
-                    ),
-                },
-            }
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logging.error(f"Budget overview failed: {exc}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-# ── Enhanced budget data: revenue sources, economic context, committed amounts ──
-
-
-@app.get("/api/v1/budget/enhanced")
-@cached(key_prefix="budget:enhanced", ttl=1800)
-async def get_budget_enhanced(db: Session = Depends(get_db)):
-    """Extended budget data not in the base overview.
-
-    Returns:
-      - revenue_by_source: Tax-type breakdown per FY (PAYE, Corp Tax, VAT, Excise, Customs, Other)
-      - economic_context: Budget as % of GDP, per-capita budget, key economic indicators
-      - execution_by_sector: Allocated → Spent pipeline per sector from CoB NG-BIRR reports
-    """
-    from models import (
-        BudgetLine,
-        EconomicIndicator,
-        Entity,
-        FiscalSummary,
-        PopulationData,
-        RevenueBySource,
-    )
-    from sqlalchemy import func
-
-    try:
-        # ── 1. Revenue by source ──
-        rev_rows = (
-            db.query(RevenueBySource)
-            .order_by(RevenueBySource.fiscal_year, RevenueBySource.revenue_type)
-            .all()
-        )
-
-        # Group by fiscal year
-        rev_by_fy: dict = {}
-        for r in rev_rows:
-            fy = r.fiscal_year
-            if fy not in rev_by_fy:
-                rev_by_fy[fy] = []
-            rev_by_fy[fy].append(
-                {
-                    "revenue_type": r.revenue_type,
-                    "category": r.category,
-                    "amount": (
-                        float(r.amount_billion_kes) if r.amount_billion_kes else None
-                    ),
-                    "target": (
-                        float(r.target_billion_kes) if r.target_billion_kes else None
-                    ),
-                    "performance_pct": (
-                        float(r.performance_pct) if r.performance_pct else None
-                    ),
-                    "share_pct": (
-                        float(r.share_of_total_pct) if r.share_of_total_pct else None
-                    ),
-                    "yoy_growth_pct": (
-                        float(r.yoy_growth_pct) if r.yoy_growth_pct else None
-                    ),
-                }
+        # Group by fiscal year
+        rev_by_fy: dict = {}
+        for r in rev_rows:
+            fy = r.fiscal_year
+            if fy not in rev_by_fy:
+                rev_by_fy[fy] = []
+            rev_by_fy[fy].append(
+                {
+                    "revenue_type": r.revenue_type,
+                    "category": r.category,
+                    "amount": (
+                        float(r.amount_billion_kes) if r.amount_billion_kes else None
+                    ),
+                    "target": (
+                        float(r.target_billion_kes) if r.target_billion_kes else None
+                    ),
+                    "performance_pct": (
+                        float(r.performance_pct) if r.performance_pct else None
+                    ),
+                    "share_pct": (
+                        float(r.share_of_total_pct) if r.share_of_total_pct else None
+                    ),
+                    "yoy_growth_pct": (
+                        float(r.yoy_growth_pct) if r.yoy_growth_pct else None
+                    ),
+                }
             )
 
         revenue_by_source = [
@@ -6963,7 +4640,7 @@ async def get_budget_enhanced(db: Session = Depends(get_db)):
 
         if national_entity:
             # Scope to latest national FY to avoid summing across all periods
-            _nat_pid = _latest_national_period(db)
+            _nat_pid = queries.latest_national_period(db)
             sector_q = (
                 db.query(
                     BudgetLine.category,
@@ -6989,955 +4666,48 @@ async def get_budget_enhanced(db: Session = Depends(get_db)):
                 continue
             if clean not in execution_by_sector_raw:
                 execution_by_sector_raw[clean] = {
-                    "allocated": 0,
-                    "spent": 0,
-                }
-            execution_by_sector_raw[clean]["allocated"] += float(row.allocated or 0)
-            execution_by_sector_raw[clean]["spent"] += float(row.spent or 0)
-
-        execution_by_sector = []
-        for sector in SECTOR_ORDER:
-            if sector in execution_by_sector_raw:
-                d = execution_by_sector_raw[sector]
-                alloc = d["allocated"]
-                spent = d["spent"]
-                unspent = alloc - spent
-                execution_by_sector.append(
-                    {
-                        "sector": sector,
-                        "allocated": alloc,
-                        "spent": spent,
-                        "unspent": unspent,
-                        "execution_rate": (
-                            round((spent / alloc) * 100, 1) if alloc else 0
-                        ),
-                    }
-                )
-
-        return {
-            "_meta": {
-                "revenue_by_source_unit": "billion_kes",
-                "execution_by_sector_unit": "kes",
-                "economic_context_units": "field_name_suffixed",
-                "entity_scope": "national",
-            },
-            "revenue_by_source": revenue_by_source,
-            "economic_context": economic_context,
-            "execution_by_sector": execution_by_sector,
-        }
-
-    except HTTPException:
-        raise
-    except Exception as exc:
-        logging.error(f"Budget enhanced failed: {exc}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/api/v1/debt/timeline")
-@cached(key_prefix="debt:timeline", ttl=86400)
-async def get_debt_timeline(db: Session = Depends(get_db)):
-    """Get historical debt timeline (yearly external/domestic breakdown).
-
-    Reads from the debt_timeline table, seeded from CBK Annual Reports
-    and National Treasury Budget Policy Statements.
-    """
-    from sqlalchemy import func  # noqa: F401 — used for reconciliation sum
-
-    from models import DebtTimeline
-
-    try:
-        rows = db.query(DebtTimeline).order_by(DebtTimeline.year.asc()).all()
-
-        if not rows:
-            return {
-                "status": "no_data",
-                "data_source": "database_empty",
-                "last_updated": None,
-                "source": "Run seeder: python -m seeding.cli seed --domain debt_timeline",
-                "years": 0,
-                "timeline": [],
-            }
-
-        timeline = []
-        for r in rows:
-            timeline.append(
-                {
-                    "year": r.year,
-                    "external": float(r.external),
-                    "domestic": float(r.domestic),
-                    "total": float(r.total),
-                    "gdp": float(r.gdp) if r.gdp else None,
-                    "gdp_ratio": float(r.gdp_ratio) if r.gdp_ratio else None,
-                }
-            )
-
-        # Source info from the DB source document
-        source_title = "Central Bank of Kenya Annual Reports & National Treasury BPS"
-        last_updated = None
-        if rows[0].source_document_id:
-            sdoc = (
-                db.query(DBSourceDocument)
-                .filter(DBSourceDocument.id == rows[0].source_document_id)
-                .first()
-            )
-            if sdoc:
-                source_title = sdoc.title or source_title
-        if rows[-1].updated_at:
-            last_updated = rows[-1].updated_at.isoformat()
-
-        # ── Cross-check against /debt/national (Loan sum) ──
-        # Same rationale as the reciprocal check on /debt/national:
-        # surface any divergence so callers can display an honest badge.
-        reconciliation: dict = {
-            "primary_source": "debt_timeline_table",
-            "primary_value_kes": (
-                float(rows[-1].total) * 1e9 if rows and rows[-1].total else None
-            ),
-            "secondary_source": "loans_table",
-            "secondary_value_kes": None,
-            "percent_diff": None,
-            "status": "unchecked",
-            "note": "",
-        }
-        try:
-            from models import EntityType as _ET
-
-            national_entity = (
-                db.query(DBEntity).filter(DBEntity.type == _ET.NATIONAL).first()
-            )
-            if national_entity:
-                # Reconcile against /debt/national, which excludes
-                # PENDING_BILLS — match that filter (including the
-                # NULL-counts-as-debt rule from ``_is_debt_loan``) so
-                # the diff_pct below isn't dominated by a category
-                # mismatch.
-                from models import DebtCategory as _DC
-
-                loan_sum = (
-                    db.query(func.sum(DBLoan.outstanding))
-                    .filter(
-                        DBLoan.entity_id == national_entity.id,
-                        or_(
-                            DBLoan.debt_category.is_(None),
-                            DBLoan.debt_category != _DC.PENDING_BILLS,
-                        ),
-                    )
-                    .scalar()
-                    or 0
-                )
-                loan_sum_f = float(loan_sum)
-                reconciliation["secondary_value_kes"] = loan_sum_f
-                primary_kes = reconciliation["primary_value_kes"]
-                if primary_kes and loan_sum_f > 0:
-                    diff_pct = abs(primary_kes - loan_sum_f) / primary_kes * 100
-                    reconciliation["percent_diff"] = round(diff_pct, 2)
-                    if diff_pct > 5.0:
-                        reconciliation["status"] = "divergent"
-                        reconciliation["note"] = (
-                            "DebtTimeline and loans_table disagree by more "
-                            "than 5%. These are independent sources."
-                        )
-                        logging.warning(
-                            "/debt/timeline reconciliation divergent: "
-                            "timeline=%.0f KES, loans=%.0f KES, diff=%.2f%%",
-                            primary_kes,
-                            loan_sum_f,
-                            diff_pct,
-                        )
-                    else:
-                        reconciliation["status"] = "consistent"
-        except Exception as exc:  # pragma: no cover
-            logger.warning("timeline reconciliation failed: %s", exc)
-
-        # ── Freshness + trust metadata ──────────────────────────────
-        covers_through_label = f"{rows[-1].year}" if rows else None
-        timeline_quality_notes: list[str] = []
-        if reconciliation.get("status") == "divergent":
-            timeline_quality_notes.append(
-                reconciliation.get("note")
-                or "Debt sources diverge beyond reconciliation threshold."
-            )
-        src_updated = rows[-1].updated_at if rows and rows[-1].updated_at else None
-
-        return {
-            "status": "success",
-            "data_source": "database",
-            "_meta": _response_meta(
-                unit="billion_kes",
-                entity_scope="national",
-                covers_through=covers_through_label,
-                cache_ttl_seconds=86400,
-                source_updated_at=src_updated,
-                data_quality=(
-                    "mixed" if reconciliation.get("status") == "divergent"
-                    else "official"
-                ),
-                quality_notes=timeline_quality_notes or None,
-            ),
-            "last_updated": last_updated,
-            "source": source_title,
-            "years": len(timeline),
-            "timeline": timeline,
-            "reconciliation": reconciliation,
-        }
-    except Exception as e:
-        logging.error(f"Error fetching debt timeline: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/api/v1/fiscal/summary")
-@cached(key_prefix="fiscal:summary", ttl=86400)
-async def get_fiscal_summary(db: Session = Depends(get_db)):
-    """Get national fiscal summary — budget, revenue, borrowing, debt service, debt ceiling.
-
-    Reads from the fiscal_summaries table, seeded from National Treasury BPS,
-    Controller of Budget reports, and CBK data.
-    """
-    from models import FiscalSummary as FSModel
-
-    try:
-        rows = db.query(FSModel).order_by(FSModel.fiscal_year.asc()).all()
-
-        if not rows:
-            return {
-                "status": "no_data",
-                "data_source": "database_empty",
-                "last_updated": None,
-                "source": "Run seeder: python -m seeding.cli seed --domain fiscal_summary",
-                "current": None,
-                "history": [],
-                "total_fiscal_years": 0,
-            }
-
-        def _row_to_dict(r: FSModel) -> dict:
-            return {
-                "fiscal_year": r.fiscal_year,
-                "appropriated_budget": (
-                    float(r.appropriated_budget) if r.appropriated_budget else None
-                ),
-                "total_revenue": float(r.total_revenue) if r.total_revenue else None,
-                "tax_revenue": float(r.tax_revenue) if r.tax_revenue else None,
-                "non_tax_revenue": (
-                    float(r.non_tax_revenue) if r.non_tax_revenue else None
-                ),
-                "total_borrowing": (
-                    float(r.total_borrowing) if r.total_borrowing else None
-                ),
-                "borrowing_pct_of_budget": (
-                    float(r.borrowing_pct_of_budget)
-                    if r.borrowing_pct_of_budget
-                    else None
-                ),
-                "debt_service_cost": (
-                    float(r.debt_service_cost) if r.debt_service_cost else None
-                ),
-                "debt_service_per_shilling": (
-                    float(r.debt_service_per_shilling)
-                    if r.debt_service_per_shilling
-                    else None
-                ),
-                "debt_ceiling": float(r.debt_ceiling) if r.debt_ceiling else None,
-                "actual_debt": float(r.actual_debt) if r.actual_debt else None,
-                "debt_ceiling_usage_pct": (
-                    float(r.debt_ceiling_usage_pct)
-                    if r.debt_ceiling_usage_pct
-                    else None
-                ),
-                "development_spending": (
-                    float(r.development_spending) if r.development_spending else None
-                ),
-                "recurrent_spending": (
-                    float(r.recurrent_spending) if r.recurrent_spending else None
-                ),
-                "county_allocation": (
-                    float(r.county_allocation) if r.county_allocation else None
-                ),
-            }
-
-        all_fiscal_years = [_row_to_dict(r) for r in rows]
-        # Only include years with substantially complete data —
-        # World Bank back-fill years often only have 1-2 fields.
-        fiscal_years = [
-            fy
-            for fy in all_fiscal_years
-            if sum(
-                1
-                for k in (
-                    "appropriated_budget",
-                    "total_revenue",
-                    "total_borrowing",
-                    "county_allocation",
-                )
-                if (fy.get(k) or 0) > 0
-            )
-            >= 3
-        ]
-        latest = fiscal_years[-1] if fiscal_years else all_fiscal_years[-1]
-
-        # Source info
-        source_title = "National Treasury BPS & Controller of Budget Reports"
-        last_updated = None
-        if rows[-1].source_document_id:
-            sdoc = (
-                db.query(DBSourceDocument)
-                .filter(DBSourceDocument.id == rows[-1].source_document_id)
-                .first()
-            )
-            if sdoc:
-                source_title = sdoc.title or source_title
-        if rows[-1].updated_at:
-            last_updated = rows[-1].updated_at.isoformat()
-
-        return {
-            "status": "success",
-            "data_source": "database",
-            "_meta": _response_meta(unit="billion_kes", entity_scope="national"),
-            "last_updated": last_updated,
-            "source": source_title,
-            "current": latest,
-            "history": fiscal_years,
-            "total_fiscal_years": len(fiscal_years),
-        }
-    except Exception as e:
-        logging.error(f"Error fetching fiscal summary: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/api/v1/debt/top-loans")
-@cached(key_prefix="debt:top-loans", ttl=3600)
-async def get_top_loans(limit: int = 10, db: Session = Depends(get_db)):
-    """Get top N national government loans by outstanding balance.
-
-    Reads from the database (loans table seeded from Treasury data).
-    """
-    from models import DebtCategory
-
-    try:
-        # Get national entity
-        from models import EntityType as ET
-
-        national_entity = (
-            db.query(DBEntity).filter(DBEntity.type == ET.NATIONAL).first()
-        )
-
-        if not national_entity:
-            return {
-                "loans": [],
-                "total_available": 0,
-                "limit": limit,
-                "source": "No national entity found — run seeder",
-            }
-
-        # Query loans excluding pending bills, sorted by outstanding desc.
-        # NULL ``debt_category`` rows still count as debt (matches the
-        # ``_is_debt_loan`` predicate); a bare ``!=`` would silently
-        # drop them via SQL three-valued logic.
-        loans = (
-            db.query(DBLoan)
-            .filter(
-                DBLoan.entity_id == national_entity.id,
-                or_(
-                    DBLoan.debt_category.is_(None),
-                    DBLoan.debt_category != DebtCategory.PENDING_BILLS,
-                ),
-            )
-            .order_by(DBLoan.outstanding.desc())
-            .all()
-        )
-
-        if not loans:
-            return {
-                "loans": [],
-                "total_available": 0,
-                "limit": limit,
-                "source": "No loan records in database — run seeder",
-            }
-
-        top = loans[:limit]
-        result_loans = []
-        for loan in top:
-            outstanding = float(loan.outstanding or 0)
-            principal = float(loan.principal or 0)
-            rate = float(loan.interest_rate or 0) / 100
-            result_loans.append(
-                {
-                    "lender": loan.lender,
-                    "lender_type": (
-                        loan.debt_category.value if loan.debt_category else "other"
-                    ),
-                    "principal": str(principal),
-                    "outstanding": str(outstanding),
-                    "outstanding_numeric": outstanding,
-                    "principal_numeric": principal,
-                    "interest_rate": f"{float(loan.interest_rate or 0):.2f}%",
-                    "issue_date": (
-                        loan.issue_date.strftime("%Y-%m-%d") if loan.issue_date else ""
-                    ),
-                    "maturity_date": (
-                        loan.maturity_date.strftime("%Y-%m-%d")
-                        if loan.maturity_date
-                        else ""
-                    ),
-                    "currency": loan.currency,
-                    "status": (
-                        "active"
-                        if loan.maturity_date
-                        and loan.maturity_date
-                        > datetime.datetime.now(datetime.timezone.utc).replace(
-                            tzinfo=None
-                        )
-                        else "matured"
-                    ),
-                    "annual_service_cost": round(outstanding * rate, 2),
-                }
-            )
-
-        # Get source from first loan's source document
-        source_title = "National Treasury Public Debt Data"
-        if top[0].source_document_id:
-            sdoc = (
-                db.query(DBSourceDocument)
-                .filter(DBSourceDocument.id == top[0].source_document_id)
-                .first()
-            )
-            if sdoc and sdoc.title:
-                source_title = sdoc.title
-
-        return {
-            "_meta": _response_meta(unit="kes", entity_scope="national"),
-            "loans": result_loans,
-            "total_available": len(loans),
-            "limit": limit,
-            "source": source_title,
-        }
-
-    except Exception as e:
-        logging.error(f"Error fetching top loans: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/api/v1/debt/loans")
-@cached(key_prefix="debt:loans", ttl=3600)
-async def get_national_loans(db: Session = Depends(get_db)):
-    """Get individual national government loan records with full detail.
-
-    Returns each loan with lender, principal, outstanding balance,
-    interest rate, issue date, maturity date, and status.
-    All data comes from the database (seeded from Treasury/CBK sources).
-    """
-    from models import DebtCategory
-
-    try:
-        from models import EntityType as ET
-
-        national_entity = (
-            db.query(DBEntity).filter(DBEntity.type == ET.NATIONAL).first()
-        )
-
-        if not national_entity:
-            return {
-                "loans": [],
-                "total_loans": 0,
-                "total_outstanding": 0,
-                "total_annual_service_cost": 0,
-                "source": "No national entity found — run seeder",
-                "source_url": "",
-                "last_updated": "",
-            }
-
-        # Query all national loans (excluding pending bills). NULL
-        # ``debt_category`` rows still count as debt — see the
-        # ``_is_debt_loan`` predicate; a bare ``!=`` would silently
-        # drop them via SQL three-valued logic.
-        loans = (
-            db.query(DBLoan)
-            .filter(
-                DBLoan.entity_id == national_entity.id,
-                or_(
-                    DBLoan.debt_category.is_(None),
-                    DBLoan.debt_category != DebtCategory.PENDING_BILLS,
-                ),
-            )
-            .order_by(DBLoan.outstanding.desc())
-            .all()
-        )
-
-        if not loans:
-            return {
-                "loans": [],
-                "total_loans": 0,
-                "total_outstanding": 0,
-                "total_annual_service_cost": 0,
-                "source": "No loan records in database — run seeder",
-                "source_url": "",
-                "last_updated": "",
-            }
-
-        national_loans = []
-        total_outstanding = 0.0
-        total_annual_service = 0.0
-
-        for loan in loans:
-            outstanding = float(loan.outstanding or 0)
-            principal = float(loan.principal or 0)
-            rate = float(loan.interest_rate or 0)
-            annual_cost = round(outstanding * (rate / 100), 2)
-
-            total_outstanding += outstanding
-            total_annual_service += annual_cost
-
-            national_loans.append(
-                {
-                    "lender": loan.lender,
-                    "lender_type": (
-                        loan.debt_category.value if loan.debt_category else "other"
-                    ),
-                    "principal": str(principal),
-                    "outstanding": str(outstanding),
-                    "outstanding_numeric": outstanding,
-                    "principal_numeric": principal,
-                    "interest_rate": f"{rate:.2f}%",
-                    "issue_date": (
-                        loan.issue_date.strftime("%Y-%m-%d") if loan.issue_date else ""
-                    ),
-                    "maturity_date": (
-                        loan.maturity_date.strftime("%Y-%m-%d")
-                        if loan.maturity_date
-                        else ""
-                    ),
-                    "currency": loan.currency,
-                    "status": (
-                        "active"
-                        if loan.maturity_date
-                        and loan.maturity_date
-                        > datetime.datetime.now(datetime.timezone.utc).replace(
-                            tzinfo=None
-                        )
-                        else "matured"
-                    ),
-                    "annual_service_cost": annual_cost,
-                }
-            )
-
-        # Determine source info from first loan's source document
-        source_title = "National Treasury Public Debt Data"
-        source_url = "https://www.treasury.go.ke/public-debt/"
-        last_updated = ""
-        if loans[0].source_document_id:
-            sdoc = (
-                db.query(DBSourceDocument)
-                .filter(DBSourceDocument.id == loans[0].source_document_id)
-                .first()
-            )
-            if sdoc:
-                source_title = sdoc.title or source_title
-                source_url = sdoc.url or source_url
-        if loans[0].updated_at:
-            last_updated = loans[0].updated_at.isoformat()
-
-        # Plausibility
-        _check_plausibility(
-            total_outstanding,
-            _MAX_NATIONAL_BUDGET_KES * 3,
-            "debt/loans total_outstanding",
-        )
-
-        return {
-            "_meta": _response_meta(unit="kes", entity_scope="national"),
-            "loans": national_loans,
-            "total_loans": len(national_loans),
-            "total_outstanding": total_outstanding,
-            "total_annual_service_cost": total_annual_service,
-            "source": source_title,
-            "source_url": source_url,
-            "last_updated": last_updated,
-        }
-
-    except Exception as e:
-        logging.error(f"Error fetching national loans: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-@app.get("/api/v1/debt/national")
-@cached(
-    key_prefix="debt:national", ttl=43200
-)  # 12 hours — national debt data changes infrequently
-async def get_national_debt():
-    """Get national debt overview with categorized breakdown."""
-    # Try database first
-    if DATABASE_AVAILABLE:
-        try:
-            with next(get_db()) as db:
-                # Find the national entity so we only count sovereign debt
-                from models import EntityType as ET
-
-                national_entity = (
-                    db.query(DBEntity).filter(DBEntity.type == ET.NATIONAL).first()
-                )
-                if national_entity:
-                    loans = (
-                        db.query(DBLoan)
-                        .filter(DBLoan.entity_id == national_entity.id)
-                        .all()
-                    )
-                else:
-                    loans = []
-
-                if loans:
-                    # Calculate totals — exclude PENDING_BILLS so the
-                    # headline "Total Debt" KPI doesn't inflate by the
-                    # ~702B of pending bills that PR #84 started landing
-                    # in the loans table. The per-category breakdown
-                    # below still reports pending_bills as its own line
-                    # via ``categories["pending_bills"]``, so no data
-                    # is lost — only the misleading top-level sum is
-                    # corrected.
-                    total_debt = sum(
-                        float(loan.principal or 0)
-                        for loan in loans
-                        if _is_debt_loan(loan)
-                    )
-                    total_outstanding = sum(
-                        float(loan.outstanding or 0)
-                        for loan in loans
-                        if _is_debt_loan(loan)
-                    )
-
-                    # Get real GDP from GDPData table
-                    latest_gdp_row = (
-                        db.query(DBGDPData).order_by(DBGDPData.year.desc()).first()
-                    )
-                    gdp_value = (
-                        float(latest_gdp_row.gdp_value or 0)
-                        if latest_gdp_row and latest_gdp_row.gdp_value
-                        else 0  # No hardcoded fallback; will show 0 until seeded
-                    )
-                    gdp_year = latest_gdp_row.year if latest_gdp_row else None
-
-                    # Categorize by debt_category field if available, else by lender patterns
-                    from models import DebtCategory
-
-                    # Initialize category totals
-                    categories = {
-                        "external_multilateral": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "external_bilateral": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "external_commercial": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "domestic_bonds": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "domestic_bills": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "domestic_overdraft": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "pending_bills": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "county_guaranteed": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                        "other": {
-                            "principal": 0,
-                            "outstanding": 0,
-                            "count": 0,
-                            "items": [],
-                        },
-                    }
-
-                    # Pattern matching for categorization (fallback if debt_category is None)
-                    patterns = {
-                        "external_multilateral": [
-                            "World Bank",
-                            "IMF",
-                            "AfDB",
-                            "EIB",
-                            "IFAD",
-                            "IFC",
-                        ],
-                        "external_bilateral": [
-                            "China",
-                            "Japan",
-                            "France",
-                            "Germany",
-                            "United States",
-                            "Korea",
-                            "India",
-                            "Belgium",
-                            "UK",
-                            "Italy",
-                        ],
-                        "external_commercial": ["Eurobond", "Syndicated", "Commercial"],
-                        "domestic_bonds": [
-                            "Treasury Bond",
-                            "Infrastructure Bond",
-                            "Green Bond",
-                            "M-Akiba",
-                            "Retail Bond",
-                        ],
-                        "domestic_bills": [
-                            "Treasury Bill",
-                            "T-Bill",
-                            "91-day",
-                            "182-day",
-                            "364-day",
-                        ],
-                        "domestic_overdraft": ["Central Bank", "CBK", "Overdraft"],
-                        "pending_bills": ["Pending Bill", "Arrears"],
-                        "county_guaranteed": [
-                            "County",
-                            "Nairobi",
-                            "Mombasa",
-                            "Kisumu",
-                            "Nakuru",
-                        ],
-                    }
-
-                    def classify_loan(loan):
-                        # Use debt_category if available and not OTHER
-                        if hasattr(loan, "debt_category") and loan.debt_category:
-                            cat_value = (
-                                loan.debt_category.value
-                                if hasattr(loan.debt_category, "value")
-                                else str(loan.debt_category)
-                            )
-                            if cat_value != "OTHER" and cat_value != "other":
-                                return cat_value.lower()
-
-                        # Fallback to pattern matching based on lender name
-                        lender = (loan.lender or "").lower()
-                        for cat, terms in patterns.items():
-                            if any(term.lower() in lender for term in terms):
-                                return cat
-                        return "other"
-
-                    for loan in loans:
-                        cat = classify_loan(loan)
-                        principal = float(loan.principal or 0)
-                        outstanding = float(loan.outstanding or 0)
-
-                        categories[cat]["principal"] += principal
-                        categories[cat]["outstanding"] += outstanding
-                        categories[cat]["count"] += 1
-                        categories[cat]["items"].append(
-                            {
-                                "lender": loan.lender,
-                                "principal": principal,
-                                "outstanding": outstanding,
-                                "interest_rate": (
-                                    float(loan.interest_rate)
-                                    if hasattr(loan, "interest_rate")
-                                    and loan.interest_rate
-                                    else None
-                                ),
-                            }
-                        )
-
-                    # Calculate external vs domestic totals
-                    external_cats = [
-                        "external_multilateral",
-                        "external_bilateral",
-                        "external_commercial",
-                    ]
-                    domestic_cats = [
-                        "domestic_bonds",
-                        "domestic_bills",
-                        "domestic_overdraft",
-                    ]
+                    "allocated": 0,
+                    "spent": 0,
+                }
+            execution_by_sector_raw[clean]["allocated"] += float(row.allocated or 0)
+            execution_by_sector_raw[clean]["spent"] += float(row.spent or 0)
 
-                    external_debt = sum(
-                        categories[c]["principal"] for c in external_cats
-                    )
-                    domestic_debt = sum(
-                        categories[c]["principal"] for c in domestic_cats
-                    )
-                    pending_bills = categories["pending_bills"]["principal"]
-                    county_debt = categories["county_guaranteed"]["principal"]
-
-                    # ── Cross-check against DebtTimeline (aggregate series) ──
-                    # The Loan table and DebtTimeline table are populated from
-                    # different source documents (Treasury QEDR / CBK vs CBK
-                    # Annual Report / BPS). They should agree within a few
-                    # percent. If they disagree substantially we log a warning
-                    # and surface the diff in the response so the UI can show
-                    # an honest "data sources disagree" badge.
-                    from models import DebtTimeline as _DT
-
-                    latest_timeline_row = (
-                        db.query(_DT).order_by(_DT.year.desc()).first()
-                    )
-                    reconciliation: dict = {
-                        "primary_source": "loans_table",
-                        "primary_value_kes": total_outstanding,
-                        "secondary_source": "debt_timeline_table",
-                        "secondary_value_kes": None,
-                        "secondary_year": None,
-                        "percent_diff": None,
-                        "status": "unchecked",
-                        "note": "",
+        execution_by_sector = []
+        for sector in SECTOR_ORDER:
+            if sector in execution_by_sector_raw:
+                d = execution_by_sector_raw[sector]
+                alloc = d["allocated"]
+                spent = d["spent"]
+                unspent = alloc - spent
+                execution_by_sector.append(
+                    {
+                        "sector": sector,
+                        "allocated": alloc,
+                        "spent": spent,
+                        "unspent": unspent,
+                        "execution_rate": (
+                            round((spent / alloc) * 100, 1) if alloc else 0
+                        ),
                     }
-                    if latest_timeline_row and latest_timeline_row.total:
-                        # DebtTimeline.total is in BILLIONS of KES.
-                        secondary_kes = float(latest_timeline_row.total) * 1e9
-                        reconciliation["secondary_value_kes"] = secondary_kes
-                        reconciliation["secondary_year"] = latest_timeline_row.year
-                        if total_outstanding > 0:
-                            diff_pct = (
-                                abs(total_outstanding - secondary_kes)
-                                / total_outstanding
-                                * 100
-                            )
-                            reconciliation["percent_diff"] = round(diff_pct, 2)
-                            if diff_pct > 5.0:
-                                reconciliation["status"] = "divergent"
-                                reconciliation["note"] = (
-                                    "Loan-sum and DebtTimeline disagree by more "
-                                    "than 5%. The two tables are seeded from "
-                                    "different source documents; the loan-level "
-                                    "sum is the authoritative value for this "
-                                    "endpoint."
-                                )
-                                logging.warning(
-                                    "/debt/national reconciliation divergent: "
-                                    "loans=%.0f KES, timeline=%.0f KES, diff=%.2f%%",
-                                    total_outstanding,
-                                    secondary_kes,
-                                    diff_pct,
-                                )
-                            else:
-                                reconciliation["status"] = "consistent"
+                )
 
-                    return {
-                        "status": "success",
-                        "data_source": "database",
-                        "last_updated": datetime.datetime.now().isoformat(),
-                        "data": {
-                            "total_debt": total_debt,
-                            "total_outstanding": total_outstanding,
-                            "loan_count": len(loans),
-                            "gdp": gdp_value,
-                            "gdp_year": gdp_year,
-                            "debt_to_gdp_ratio": (
-                                round(total_outstanding / gdp_value * 100, 1)
-                                if gdp_value > 0
-                                else 0
-                            ),
-                            "reconciliation": reconciliation,
-                            # High-level breakdown
-                            "summary": {
-                                "external_debt": external_debt,
-                                "domestic_debt": domestic_debt,
-                                "pending_bills": pending_bills,
-                                "county_guaranteed": county_debt,
-                                "external_percentage": (
-                                    round(external_debt / total_debt * 100, 1)
-                                    if total_debt > 0
-                                    else 0
-                                ),
-                                "domestic_percentage": (
-                                    round(domestic_debt / total_debt * 100, 1)
-                                    if total_debt > 0
-                                    else 0
-                                ),
-                            },
-                            # Detailed categorized breakdown
-                            "categories": {
-                                cat: {
-                                    "total_principal": data["principal"],
-                                    "total_outstanding": data["outstanding"],
-                                    "loan_count": data["count"],
-                                    "percentage_of_total": (
-                                        round(data["principal"] / total_debt * 100, 2)
-                                        if total_debt > 0
-                                        else 0
-                                    ),
-                                    "items": data["items"][
-                                        :5
-                                    ],  # Top 5 items per category
-                                }
-                                for cat, data in categories.items()
-                                if data["count"] > 0
-                            },
-                            "debt_sustainability": {
-                                "risk_level": (
-                                    "High"
-                                    if gdp_value > 0
-                                    and total_outstanding / gdp_value > 0.65
-                                    else ("Moderate" if gdp_value > 0 else "Unknown")
-                                ),
-                                "debt_to_gdp": (
-                                    round(total_outstanding / gdp_value * 100, 1)
-                                    if gdp_value > 0
-                                    else 0
-                                ),
-                                "assessment": (
-                                    "Kenya's debt remains elevated. The IMF classifies Kenya at high risk of debt distress."
-                                    if gdp_value > 0
-                                    and total_outstanding / gdp_value > 0.65
-                                    else "Seed GDP data for full sustainability assessment."
-                                ),
-                            },
-                        },
-                        "currency": "KES",
-                        "source": "Central Bank of Kenya / National Treasury",
-                        "_meta": _response_meta(unit="kes", entity_scope="national"),
-                    }
-        except Exception as e:
-            logging.error(f"DB debt query failed: {e}")
+        return {
+            "_meta": {
+                "revenue_by_source_unit": "billion_kes",
+                "execution_by_sector_unit": "kes",
+                "economic_context_units": "field_name_suffixed",
+                "entity_scope": "national",
+            },
+            "revenue_by_source": revenue_by_source,
+            "economic_context": economic_context,
+            "execution_by_sector": execution_by_sector,
+        }
 
-    # No hardcoded fallback — data must come from the database.
-    # Guide user to populate via the seeding pipeline.
-    return {
-        "status": "no_data",
-        "data_source": "database_empty",
-        "last_updated": None,
-        "message": (
-            "No national debt data in database. "
-            "Run: python -m seeding.cli seed --domain national_debt"
-        ),
-        "data": {
-            "total_debt": 0,
-            "total_outstanding": 0,
-            "loan_count": 0,
-            "gdp": 0,
-            "debt_to_gdp_ratio": 0,
-            "summary": {},
-            "categories": {},
-            "debt_sustainability": {},
-        },
-        "currency": "KES",
-        "source": "Central Bank of Kenya / National Treasury",
-    }
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logging.error(f"Budget enhanced failed: {exc}")
+        raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.get("/api/v1/pending-bills")
@@ -8072,7 +4842,7 @@ async def get_pending_bills(
                 "source": source_title,
                 "source_url": source_url,
                 "currency": "KES",
-                "_meta": _response_meta(unit="kes", entity_scope="all"),
+                "_meta": response_meta(unit="kes", entity_scope="all"),
                 "explanation": (
                     "Pending bills are verified but unpaid government invoices "
                     "to suppliers and contractors. Unlike formal loans, they "
@@ -8212,7 +4982,10 @@ async def get_pending_bills_summary(db: Session = Depends(get_db)):
             county_totals[eid]["amount"] += float(b.amount or 0)
 
         # Get population for per_capita (best-effort)
-        _pop_map = _get_population_map(db)
+        try:
+            _pop_map = queries.population_map(db)
+        except Exception:
+            _pop_map = {}
         top_counties = sorted(
             county_totals.values(), key=lambda x: x["amount"], reverse=True
         )[:15]
@@ -8250,7 +5023,7 @@ async def get_pending_bills_summary(db: Session = Depends(get_db)):
         return {
             "status": "success",
             "data_source": "pending_bills_table",
-            "_meta": _response_meta(unit="kes", entity_scope="all"),
+            "_meta": response_meta(unit="kes", entity_scope="all"),
             "total_pending_amount": total_pending,
             "eligible_total": eligible_total,
             "ineligible_total": ineligible_total,
@@ -8266,29 +5039,6 @@ async def get_pending_bills_summary(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-def _get_population_map(db: Session) -> Dict[str, int]:
-    """Return {county_name: population} from latest PopulationData."""
-    try:
-        from sqlalchemy import func as sqlfunc
-
-        latest_year_sub = (
-            db.query(sqlfunc.max(DBPopulationData.year))
-            .filter(DBPopulationData.entity_id.isnot(None))
-            .scalar()
-        )
-        if not latest_year_sub:
-            return {}
-        rows = (
-            db.query(DBPopulationData, DBEntity)
-            .join(DBEntity, DBPopulationData.entity_id == DBEntity.id)
-            .filter(DBPopulationData.year == latest_year_sub)
-            .all()
-        )
-        return {e.canonical_name: int(p.population) for p, e in rows if p.population}
-    except Exception:
-        return {}
-
-
 def _pending_bills_summary_from_loans(db: Session) -> dict:
     """Fallback: build summary from Loan table where debt_category = PENDING_BILLS."""
     from models import DebtCategory
@@ -8430,726 +5180,118 @@ async def get_pending_bills_by_county(county_id: str, db: Session = Depends(get_
                     "31-90d": 0,
                     "91-180d": 0,
                     "180d+": total,
-                },
-                "bills": [],
-                "currency": "KES",
-            }
-
-        total_pending = sum(float(b.amount or 0) for b in bills)
-
-        # Breakdown by type
-        by_type: Dict[str, float] = {}
-        for b in bills:
-            bt = b.bill_type.value if b.bill_type else "other"
-            by_type[bt] = by_type.get(bt, 0) + float(b.amount or 0)
-
-        # Aging buckets
-        aging = {"0-30d": 0, "31-90d": 0, "91-180d": 0, "180d+": 0}
-        for b in bills:
-            amt = float(b.amount or 0)
-            days = b.aging_days or 0
-            if days <= 30:
-                aging["0-30d"] += amt
-            elif days <= 90:
-                aging["31-90d"] += amt
-            elif days <= 180:
-                aging["91-180d"] += amt
-            else:
-                aging["180d+"] += amt
-
-        bill_details = [
-            {
-                "bill_type": b.bill_type.value if b.bill_type else "other",
-                "amount": float(b.amount or 0),
-                "fiscal_year": b.fiscal_year,
-                "aging_days": b.aging_days,
-            }
-            for b in bills
-        ]
-
-        return {
-            "status": "success",
-            "data_source": "pending_bills_table",
-            "county": entity.canonical_name,
-            "county_id": county_id,
-            "total_pending": total_pending,
-            "breakdown_by_type": by_type,
-            "aging_buckets": aging,
-            "bills": bill_details,
-            "currency": "KES",
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logging.error(f"Pending bills county lookup failed: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
-
-
-def _resolve_county_name(county_id: str, db: "Optional[Session]" = None) -> Optional[str]:
-    """Resolve any ID shape to a short county name (e.g. "Mombasa").
-
-    Endpoints that only need a name (to call downstream InternalAPIClient
-    or build a canonical_name filter) use this helper. It tries the fast
-    COUNTY_MAPPING dict first, then falls back to a quick DB lookup for
-    raw row ids / slugs. Returns None if the id cannot be resolved.
-
-    When called from within an endpoint that already holds an open
-    ``with next(get_db())`` session, pass ``db=<that session>`` so we
-    reuse it instead of opening (and leaking) a second connection.
-    """
-    if not county_id:
-        return None
-
-    # Fast path: direct COUNTY_MAPPING lookup (zero-padded codes)
-    direct = COUNTY_MAPPING.get(county_id)
-    if direct:
-        return direct
-
-    # Numeric shapes: try zero-padding to match COUNTY_MAPPING keys
-    cid = str(county_id).strip()
-    if cid.isdigit():
-        padded = cid.zfill(3)
-        if padded in COUNTY_MAPPING:
-            return COUNTY_MAPPING[padded]
-
-    # Fallback to DB for raw DB ids / slugs / names
-    if not DATABASE_AVAILABLE:
-        return None
-    try:
-        if db is not None:
-            entity = _resolve_county_entity(db, county_id)
-            if entity:
-                name = (entity.canonical_name or "").replace(" County", "").strip()
-                return name or None
-            return None
-        with next(get_db()) as _db:
-            entity = _resolve_county_entity(_db, county_id)
-            if entity:
-                name = (entity.canonical_name or "").replace(" County", "").strip()
-                return name or None
-    except Exception as e:
-        logging.warning(f"_resolve_county_name fallback failed for {county_id}: {e}")
-    return None
-
-
-def _resolve_county_entity(db: Session, county_id: str):
-    """Resolve a county by numeric ID, zero-padded code, slug, or name.
-
-    The codebase exposes three ID shapes for counties:
-      * raw DB row id (``4``)
-      * 3-digit county code (``001``..``047``) used in COUNTY_MAPPING
-      * slug (``nairobi-county``) or short name (``Nairobi``)
-
-    Different endpoints return different shapes, so we normalise here.
-    """
-    if not county_id:
-        return None
-    cid = str(county_id).strip()
-
-    # 1. 3-digit county code via COUNTY_MAPPING (e.g. "047" → "Mombasa").
-    #    Must precede the raw-DB-id branch: the /counties list endpoint
-    #    returns these zero-padded codes as `id`, and if we treated "047"
-    #    as DB row id=47 we'd resolve to a completely different county.
-    code_candidate = cid.zfill(3) if cid.isdigit() else cid
-    mapped = COUNTY_MAPPING.get(code_candidate) or COUNTY_MAPPING.get(cid)
-    if mapped:
-        entity = (
-            db.query(DBEntity)
-            .filter(
-                DBEntity.type == EntityType.COUNTY,
-                or_(
-                    DBEntity.canonical_name == mapped,
-                    DBEntity.canonical_name == f"{mapped} County",
-                    DBEntity.slug == f"{mapped.lower().replace(' ', '-')}-county",
-                ),
-            )
-            .first()
-        )
-        if entity:
-            return entity
-
-    # 2. Raw numeric DB id (falls through only when the code didn't match,
-    #    so long-form ids like "123" for a non-county row still resolve).
-    if cid.isdigit():
-        entity = (
-            db.query(DBEntity)
-            .filter(DBEntity.id == int(cid), DBEntity.type == EntityType.COUNTY)
-            .first()
-        )
-        if entity:
-            return entity
-
-    # 3. Slug
-    entity = (
-        db.query(DBEntity)
-        .filter(DBEntity.slug == cid.lower(), DBEntity.type == EntityType.COUNTY)
-        .first()
-    )
-    if entity:
-        return entity
-
-    # 4. 3-digit code via COUNTY_MAPPING → resolve to either
-    #    "Nairobi" or "Nairobi County" in the DB
-    code = cid.zfill(3) if cid.isdigit() else cid
-    mapped = COUNTY_MAPPING.get(code) or COUNTY_MAPPING.get(cid)
-    if mapped:
-        entity = (
-            db.query(DBEntity)
-            .filter(
-                DBEntity.type == EntityType.COUNTY,
-                or_(
-                    DBEntity.canonical_name == mapped,
-                    DBEntity.canonical_name == f"{mapped} County",
-                    DBEntity.slug == f"{mapped.lower().replace(' ', '-')}-county",
-                ),
-            )
-            .first()
-        )
-        if entity:
-            return entity
-
-    # 4. Case-insensitive name match
-    entity = (
-        db.query(DBEntity)
-        .filter(
-            or_(
-                DBEntity.canonical_name.ilike(cid),
-                DBEntity.canonical_name.ilike(f"{cid} County"),
-            ),
-            DBEntity.type == EntityType.COUNTY,
-        )
-        .first()
-    )
-    return entity
-
-
-# ── Debt — Broader (IMF General Government) ────────────────────────────
-
-
-# Default KES/USD rate used to convert IMF's USD-denominated nominal GDP
-# (`NGDPD`) into KES so we can display the debt figure in trillions of
-# shillings. The actual rate fluctuates; callers who want tighter
-# accuracy can override via env. This is documented in the response
-# payload (`fx_rate_used`) so readers can reproduce the math.
-IMF_BROADER_USD_KES = float(os.environ.get("IMF_BROADER_USD_KES", "130"))
-
-
-@app.get("/api/v1/debt/broader")
-async def get_debt_broader(db: Session = Depends(get_db)):
-    """IMF's General-Government Gross Debt for Kenya.
-
-    Companion to ``/api/v1/debt/national`` (which returns CBK's
-    Central-Government figure). The two measures differ by ~400-600B
-    KES — the gap is county-government debt, SOE guarantees, pension
-    arrears, and pending bills that Treasury's headline number leaves
-    out. The debt page renders both side-by-side so readers can see
-    the gap and we can later surface its components (Phase 2).
-
-    Returns a timeseries with each year's debt-to-GDP ratio and an
-    absolute KES estimate derived from IMF's USD GDP projection times
-    ``IMF_BROADER_USD_KES``. The last-fetched vintage is included so
-    the frontend can mark the value "stale" when the seeder has not
-    run recently.
-
-    **Caching**: the "unavailable" branch is NOT cached, so the first
-    hit after the seeder finishes will see fresh data without waiting
-    for a TTL to expire. Successful payloads are cached 24h since IMF
-    WEO only publishes twice a year.
-    """
-    if not DATABASE_AVAILABLE:
-        return {"status": "unavailable", "reason": "database_not_configured"}
-
-    from sqlalchemy import func  # local — main.py uses local imports for sqla
-
-    from models import ImfWeoObservation  # local import — avoids circular
-
-    # Latest vintage per indicator. IMF publishes new vintages twice a
-    # year; within a vintage, the same year can have different values
-    # across indicators, but we want the NEWEST snapshot we've seen.
-    latest_vintage_subq = (
-        db.query(func.max(ImfWeoObservation.vintage))
-        .filter(ImfWeoObservation.country_code == "KEN")
-        .scalar()
-    )
-    if latest_vintage_subq is None:
-        # Seeder has never populated the table. Frontend hides the card.
-        # Do NOT cache — otherwise the first seeder run leaves users
-        # stuck with "unavailable" for up to 24h.
-        return {"status": "unavailable", "reason": "not_seeded_yet"}
-    # Pass vintage as kwarg so @cached bakes it into the key —
-    # a new vintage invalidates the cache automatically.
-    return await _get_debt_broader_cached(
-        db=db, vintage=latest_vintage_subq.isoformat()
-    )
-
-
-@cached(key_prefix="debt:broader", ttl=86400)  # IMF WEO updates twice a year
-async def _get_debt_broader_cached(db: Session, vintage: str):
-    from models import ImfWeoObservation  # local — avoids circular import
-
-    latest_vintage_subq = datetime.datetime.fromisoformat(vintage)
-
-    rows = (
-        db.query(ImfWeoObservation)
-        .filter(
-            ImfWeoObservation.country_code == "KEN",
-            ImfWeoObservation.vintage == latest_vintage_subq,
-        )
-        .order_by(
-            ImfWeoObservation.indicator, ImfWeoObservation.year
-        )
-        .all()
-    )
-
-    by_indicator: Dict[str, Dict[int, Any]] = {}
-    for row in rows:
-        bucket = by_indicator.setdefault(row.indicator, {})
-        bucket[row.year] = {
-            "value": float(row.value) if row.value is not None else None,
-            "is_projection": row.is_projection,
-        }
-
-    debt_pct = by_indicator.get("GGXWDG_NGDP", {})
-    gdp_usd = by_indicator.get("NGDPD", {})  # billions USD
-
-    fx = IMF_BROADER_USD_KES
-    timeseries = []
-    for year in sorted(set(debt_pct.keys()) | set(gdp_usd.keys())):
-        pct = debt_pct.get(year, {}).get("value")
-        gdp_b = gdp_usd.get(year, {}).get("value")
-        value_kes: float | None = None
-        gdp_kes: float | None = None
-        if pct is not None and gdp_b is not None:
-            # NGDPD is in USD billions → KES absolute
-            gdp_kes = gdp_b * 1e9 * fx
-            value_kes = gdp_kes * (pct / 100.0)
-        timeseries.append(
-            {
-                "year": year,
-                "debt_to_gdp": pct,
-                "gdp_kes": gdp_kes,
-                "value_kes": value_kes,
-                "is_projection": debt_pct.get(year, {}).get("is_projection", False),
-            }
-        )
-
-    # "Latest" = most recent ACTUAL (non-projection) year that has both
-    # debt% and GDP. The timeseries includes IMF forecasts out to 2030;
-    # picking the furthest year would show a 5-6 year projection as the
-    # "current" figure, which overstates debt (debt and USD GDP both
-    # grow over time) and confuses readers comparing against CBK's
-    # "as-of-today" total. Fall back to the latest projection only when
-    # no non-projection rows exist (i.e. a very old vintage or brand-new
-    # country with only forecasts available).
-    complete = [t for t in timeseries if t["value_kes"] is not None]
-    actuals = [t for t in complete if not t.get("is_projection")]
-    latest = (actuals or complete)[-1] if complete else None
-
-    # Stale = vintage > 60 days old. IMF WEO publishes twice a year
-    # (April/October) — 60 days after either release is a reasonable
-    # "something is probably wrong" threshold.
-    age_days = (
-        datetime.datetime.now(datetime.timezone.utc) - latest_vintage_subq
-    ).days
-    stale = age_days > 60
-
-    return {
-        "status": "success",
-        "source": {
-            "name": "IMF World Economic Outlook",
-            "indicator": "General Government Gross Debt",
-            "code": "GGXWDG",
-            "dataset_url": "https://www.imf.org/external/datamapper/GGXWDG_NGDP@WEO/KEN",
-        },
-        "latest": latest,
-        "timeseries": timeseries,
-        "fx_rate_used": fx,
-        "vintage": latest_vintage_subq.isoformat(),
-        "vintage_age_days": age_days,
-        "stale": stale,
-        "as_of": datetime.datetime.now(datetime.timezone.utc).isoformat(),
-    }
-
-
-# ── Debt Sustainability Indicators ─────────────────────────────────────
-
-
-@app.get("/api/v1/debt/sustainability")
-@cached(key_prefix="debt:sustainability", ttl=86400)
-async def get_debt_sustainability(db: Session = Depends(get_db)):
-    """Get debt sustainability indicators, projections, and regional comparison.
-
-    Returns debt-to-GDP, debt-service-to-revenue, external share,
-    5-year projections, and EAC regional peers.
-    """
-    from models import DebtTimeline, FiscalSummary
+                },
+                "bills": [],
+                "currency": "KES",
+            }
 
-    try:
-        # Latest debt timeline entry (has debt/GDP data)
-        latest_dt = db.query(DebtTimeline).order_by(DebtTimeline.year.desc()).first()
-        # Latest fiscal summary (has debt service and revenue)
-        latest_fs = (
-            db.query(FiscalSummary).order_by(FiscalSummary.fiscal_year.desc()).first()
-        )
+        total_pending = sum(float(b.amount or 0) for b in bills)
 
-        if not latest_dt and not latest_fs:
-            return {
-                "status": "no_data",
-                "note": "Run seeders: debt_timeline and fiscal_summary",
-                "debt_to_gdp": None,
-                "debt_service_to_revenue": None,
-                "external_debt_share": None,
-                "projections": [],
-                "regional_peers": _get_regional_peers(),
-            }
+        # Breakdown by type
+        by_type: Dict[str, float] = {}
+        for b in bills:
+            bt = b.bill_type.value if b.bill_type else "other"
+            by_type[bt] = by_type.get(bt, 0) + float(b.amount or 0)
 
-        # ── Debt-to-GDP ────────────────────────────────────────────
-        debt_to_gdp = None
-        if latest_dt and latest_dt.gdp_ratio:
-            ratio = float(latest_dt.gdp_ratio)
-            if ratio > 55:
-                status = "above"
-            elif ratio > 50:
-                status = "warning"
+        # Aging buckets
+        aging = {"0-30d": 0, "31-90d": 0, "91-180d": 0, "180d+": 0}
+        for b in bills:
+            amt = float(b.amount or 0)
+            days = b.aging_days or 0
+            if days <= 30:
+                aging["0-30d"] += amt
+            elif days <= 90:
+                aging["31-90d"] += amt
+            elif days <= 180:
+                aging["91-180d"] += amt
             else:
-                status = "below"
-            debt_to_gdp = {
-                "value": ratio,
-                "year": latest_dt.year,
-                "threshold_imf": 55.0,
-                "threshold_eac": 50.0,
-                "status": status,
-            }
-
-        # ── Debt Service to Revenue ────────────────────────────────
-        debt_service_to_revenue = None
-        if latest_fs and latest_fs.debt_service_cost and latest_fs.total_revenue:
-            ds = float(latest_fs.debt_service_cost)
-            rev = float(latest_fs.total_revenue)
-            if rev > 0:
-                ratio_val = round(ds / rev * 100, 1)
-                debt_service_to_revenue = {
-                    "value": ratio_val,
-                    "year": latest_fs.fiscal_year,
-                    "threshold": 30.0,
-                    "status": (
-                        "above"
-                        if ratio_val > 30
-                        else ("warning" if ratio_val > 25 else "below")
-                    ),
-                }
+                aging["180d+"] += amt
 
-        # ── External Debt Share ────────────────────────────────────
-        external_share = None
-        if latest_dt and latest_dt.total and latest_dt.external:
-            total = float(latest_dt.total)
-            ext = float(latest_dt.external)
-            if total > 0:
-                external_share = round(ext / total * 100, 1)
-
-        # ── 5-Year Projections (linear extrapolation) ──────────────
-        projections = _compute_debt_projections(db)
-
-        # ── Regional Peers ─────────────────────────────────────────
-        peers = _get_regional_peers(
-            kenya_ratio=(
-                float(latest_dt.gdp_ratio)
-                if latest_dt and latest_dt.gdp_ratio
-                else None
-            )
-        )
+        bill_details = [
+            {
+                "bill_type": b.bill_type.value if b.bill_type else "other",
+                "amount": float(b.amount or 0),
+                "fiscal_year": b.fiscal_year,
+                "aging_days": b.aging_days,
+            }
+            for b in bills
+        ]
 
         return {
             "status": "success",
-            "_meta": _response_meta(unit="percentage", entity_scope="national"),
-            "debt_to_gdp": debt_to_gdp,
-            "debt_service_to_revenue": debt_service_to_revenue,
-            "external_debt_share": external_share,
-            "projections": projections,
-            "regional_peers": peers,
+            "data_source": "pending_bills_table",
+            "county": entity.canonical_name,
+            "county_id": county_id,
+            "total_pending": total_pending,
+            "breakdown_by_type": by_type,
+            "aging_buckets": aging,
+            "bills": bill_details,
             "currency": "KES",
-            "source": "National Treasury BPS, CBK Annual Reports",
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        logging.error(f"Debt sustainability failed: {e}")
+        logging.error(f"Pending bills county lookup failed: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
-def _compute_debt_projections(db: Session) -> list:
-    """Simple linear extrapolation of debt-to-GDP for next 5 years."""
-    from models import DebtTimeline
-
-    # Fetch only the last 5 data points directly from DB (not all rows)
-    recent = (
-        db.query(DebtTimeline)
-        .filter(DebtTimeline.gdp_ratio.isnot(None))
-        .order_by(DebtTimeline.year.desc())
-        .limit(5)
-        .all()
-    )
-    if len(recent) < 2:
-        return []
-
-    # Reverse so oldest-first for the linear fit
-    recent = list(reversed(recent))
-    n = len(recent)
-    xs = [float(r.year) for r in recent]
-    ys = [float(r.gdp_ratio) for r in recent]
-
-    x_mean = sum(xs) / n
-    y_mean = sum(ys) / n
-    num = sum((xs[i] - x_mean) * (ys[i] - y_mean) for i in range(n))
-    den = sum((xs[i] - x_mean) ** 2 for i in range(n))
-
-    if den == 0:
-        return []
-
-    slope = num / den
-    intercept = y_mean - slope * x_mean
-
-    last_year = int(xs[-1])
-    projections = []
-    for i in range(1, 6):
-        proj_year = last_year + i
-        proj_val = round(slope * proj_year + intercept, 1)
-        projections.append({"year": proj_year, "projected_debt_to_gdp": proj_val})
-
-    return projections
-
-
-def _get_regional_peers(kenya_ratio: Optional[float] = None) -> list:
-    """Return EAC regional debt comparison with multiple indicators.
-
-    Fetches three indicators from World Bank + IMF APIs (cached 12 hours):
-      - Debt-to-GDP (%)
-      - Debt service to revenue (%)
-      - External debt share (%)
-
-    Falls back to verified static values when APIs are unreachable.
-    """
-    return _get_regional_peers_cached(kenya_ratio)
-
-
-# ── EAC peer data with multi-indicator support ────────────────────
-_EAC_COUNTRIES = {
-    "KEN": "Kenya",
-    "ETH": "Ethiopia",
-    "TZA": "Tanzania",
-    "UGA": "Uganda",
-    "RWA": "Rwanda",
-}
-
-# World Bank indicator codes
-_WB_INDICATORS = {
-    "debt_to_gdp": "GC.DOD.TOTL.GD.ZS",  # Central govt debt (% GDP)
-    "debt_service_to_revenue": "GC.XPN.INTP.RV.ZS",  # Interest payments (% revenue)
-    "external_debt_pct": "DT.DOD.DECT.GN.ZS",  # External debt stocks (% GNI)
-}
-
-# IMF DataMapper indicator codes (WEO dataset)
-_IMF_INDICATORS = {
-    "debt_to_gdp": "GGXWDG_NGDP",  # General govt gross debt (% GDP)
-}
-
-# Simple TTL cache: (timestamp, data)
-_peers_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
-_PEERS_CACHE_TTL = 12 * 3600  # 12 hours
-
-_logger_peers = logging.getLogger("audit_app.regional_peers")
-
-
-def _wb_fetch_indicator(indicator_code: str, country_codes: str) -> Dict[str, float]:
-    """Fetch latest value per country for a single World Bank indicator.
-
-    Returns {ISO3: value} for countries that have data.
-    """
-    url = (
-        f"https://api.worldbank.org/v2/country/{country_codes}"
-        f"/indicator/{indicator_code}?format=json&per_page=100&date=2015:2026"
-    )
-    resp = httpx.get(url, timeout=8)
-    resp.raise_for_status()
-    wb_data = resp.json()
-
-    if not isinstance(wb_data, list) or len(wb_data) < 2 or not wb_data[1]:
-        return {}
-
-    # Keep the most recent non-null value per country
-    latest: Dict[str, Dict[str, Any]] = {}
-    for item in wb_data[1]:
-        if item.get("value") is not None:
-            iso = item["countryiso3code"]
-            year = int(item["date"])
-            if iso not in latest or year > latest[iso]["year"]:
-                latest[iso] = {"year": year, "value": float(item["value"])}
-
-    return {iso: d["value"] for iso, d in latest.items()}
-
+def _resolve_county_name(county_id: str, db: "Optional[Session]" = None) -> Optional[str]:
+    """Resolve any ID shape to a short county name (e.g. "Mombasa").
 
-def _imf_fetch_debt_to_gdp() -> Dict[str, float]:
-    """Fetch debt-to-GDP from the IMF DataMapper API (WEO dataset).
+    Endpoints that only need a name (to call downstream InternalAPIClient
+    or build a canonical_name filter) use this helper. It tries the fast
+    COUNTY_MAPPING dict first, then falls back to a quick DB lookup for
+    raw row ids / slugs. Returns None if the id cannot be resolved.
 
-    Endpoint: /api/v1/GGXWDG_NGDP/{countries}?periods=2020,2021,...,2026
-    Returns {ISO3: value} for countries that have data.
+    When called from within an endpoint that already holds an open
+    ``with next(get_db())`` session, pass ``db=<that session>`` so we
+    reuse it instead of opening (and leaking) a second connection.
     """
-    countries = "/".join(_EAC_COUNTRIES.keys())
-    periods = ",".join(str(y) for y in range(2018, 2027))
-    url = (
-        f"https://www.imf.org/external/datamapper/api/v1"
-        f"/GGXWDG_NGDP/{countries}?periods={periods}"
-    )
-    resp = httpx.get(url, timeout=8)
-    resp.raise_for_status()
-    data = resp.json()
-
-    # IMF response: {"values": {"GGXWDG_NGDP": {"KEN": {"2023": 68.1, ...}, ...}}}
-    indicator_data = data.get("values", {}).get("GGXWDG_NGDP", {})
-    result: Dict[str, float] = {}
-    for iso, year_vals in indicator_data.items():
-        if not year_vals:
-            continue
-        # Get the most recent year with a value
-        latest_year = max(year_vals.keys())
-        val = year_vals[latest_year]
-        if val is not None:
-            result[iso] = round(float(val), 1)
-
-    return result
-
-
-def _get_regional_peers_cached(kenya_ratio: Optional[float] = None) -> list:
-    """Fetch EAC peers from World Bank + IMF APIs with 12-hour TTL cache."""
-    now = time.time()
-
-    # Check cache
-    if (
-        _peers_cache["data"] is not None
-        and (now - _peers_cache["ts"]) < _PEERS_CACHE_TTL
-    ):
-        cached = [dict(p) for p in _peers_cache["data"]]  # shallow copy
-        if kenya_ratio is not None:
-            for p in cached:
-                if p["country"] == "Kenya":
-                    p["debt_to_gdp"] = round(kenya_ratio, 1)
-        return cached
-
-    # ── Fetch all indicators ──────────────────────────────────────
-    codes_str = ";".join(_EAC_COUNTRIES.keys())
-    debt_gdp: Dict[str, float] = {}
-    service_rev: Dict[str, float] = {}
-    external_pct: Dict[str, float] = {}
-
-    # 1. Try IMF for debt-to-GDP (often more current than World Bank)
-    try:
-        debt_gdp = _imf_fetch_debt_to_gdp()
-        _logger_peers.info("IMF debt-to-GDP: got data for %d countries", len(debt_gdp))
-    except Exception as exc:
-        _logger_peers.debug("IMF API unavailable: %s", exc)
+    if not county_id:
+        return None
 
-    # 2. World Bank: debt-to-GDP (fallback if IMF missed countries)
-    try:
-        wb_debt_gdp = _wb_fetch_indicator(_WB_INDICATORS["debt_to_gdp"], codes_str)
-        for iso, val in wb_debt_gdp.items():
-            if iso not in debt_gdp:
-                debt_gdp[iso] = round(val, 1)
-        _logger_peers.info(
-            "WB debt-to-GDP: got data for %d countries", len(wb_debt_gdp)
-        )
-    except Exception as exc:
-        _logger_peers.debug("WB debt-to-GDP unavailable: %s", exc)
+    # Fast path: direct COUNTY_MAPPING lookup (zero-padded codes)
+    direct = COUNTY_MAPPING.get(county_id)
+    if direct:
+        return direct
 
-    # 3. World Bank: debt service to revenue
-    try:
-        service_rev = _wb_fetch_indicator(
-            _WB_INDICATORS["debt_service_to_revenue"], codes_str
-        )
-        _logger_peers.info(
-            "WB debt-service/revenue: got data for %d countries", len(service_rev)
-        )
-    except Exception as exc:
-        _logger_peers.debug("WB debt-service/revenue unavailable: %s", exc)
+    # Numeric shapes: try zero-padding to match COUNTY_MAPPING keys
+    cid = str(county_id).strip()
+    if cid.isdigit():
+        padded = cid.zfill(3)
+        if padded in COUNTY_MAPPING:
+            return COUNTY_MAPPING[padded]
 
-    # 4. World Bank: external debt as % of GNI
+    # Fallback to DB for raw DB ids / slugs / names
+    if not DATABASE_AVAILABLE:
+        return None
     try:
-        external_pct = _wb_fetch_indicator(
-            _WB_INDICATORS["external_debt_pct"], codes_str
-        )
-        _logger_peers.info(
-            "WB external-debt%%: got data for %d countries", len(external_pct)
-        )
-    except Exception as exc:
-        _logger_peers.debug("WB external-debt%% unavailable: %s", exc)
-
-    # ── Verified fallback values (updated Mar 2026) ───────────────
-    # Used ONLY when both APIs are unreachable for a given indicator.
-    _fallback = {
-        "KEN": {
-            "debt_to_gdp": 68.0,
-            "debt_service_to_revenue": 57.6,
-            "external_debt_share": 52.3,
-        },
-        "ETH": {
-            "debt_to_gdp": 31.4,
-            "debt_service_to_revenue": 22.8,
-            "external_debt_share": 58.1,
-        },
-        "TZA": {
-            "debt_to_gdp": 48.2,
-            "debt_service_to_revenue": 15.3,
-            "external_debt_share": 61.5,
-        },
-        "UGA": {
-            "debt_to_gdp": 53.1,
-            "debt_service_to_revenue": 19.7,
-            "external_debt_share": 55.8,
-        },
-        "RWA": {
-            "debt_to_gdp": 67.2,
-            "debt_service_to_revenue": 13.5,
-            "external_debt_share": 68.4,
-        },
-    }
-
-    # ── Assemble peers ────────────────────────────────────────────
-    peers = []
-    for iso, name in _EAC_COUNTRIES.items():
-        fb = _fallback.get(iso, {})
+        if db is not None:
+            entity = _resolve_county_entity(db, county_id)
+            if entity:
+                name = (entity.canonical_name or "").replace(" County", "").strip()
+                return name or None
+            return None
+        with next(get_db()) as _db:
+            entity = _resolve_county_entity(_db, county_id)
+            if entity:
+                name = (entity.canonical_name or "").replace(" County", "").strip()
+                return name or None
+    except Exception as e:
+        logging.warning(f"_resolve_county_name fallback failed for {county_id}: {e}")
+    return None
 
-        # Debt-to-GDP: Kenya uses our CBK data; others prefer IMF/WB then fallback
-        if iso == "KEN" and kenya_ratio is not None:
-            d2g = kenya_ratio
-        else:
-            d2g = debt_gdp.get(iso) or fb.get("debt_to_gdp")
 
-        # Debt service to revenue
-        dsr = service_rev.get(iso) or fb.get("debt_service_to_revenue")
+def _resolve_county_entity(db: Session, county_id: str):
+    """Resolve a county by numeric ID, zero-padded code, slug, or name.
 
-        # External debt share
-        ext = external_pct.get(iso) or fb.get("external_debt_share")
+    See :func:`queries.county_entity`.
+    """
+    return queries.county_entity(db, county_id)
 
-        peers.append(
-            {
-                "country": name,
-                "debt_to_gdp": round(d2g, 1) if d2g else None,
-                "debt_service_to_revenue": round(dsr, 1) if dsr else None,
-                "external_debt_share": round(ext, 1) if ext else None,
-            }
-        )
 
-    _peers_cache["ts"] = now
-    _peers_cache["data"] = peers
-    _logger_peers.info(
-        "Regional peers updated: %d/%d countries have full data",
-        sum(
-            1
-            for p in peers
-            if all(v is not None for k, v in p.items() if k != "country")
-        ),
-        len(peers),
-    )
-    return peers
+# ── Debt — Broader (IMF General Government) ────────────────────────────
 
 
 @app.get("/api/v1/entities", response_model=List[EntityResponse])
@@ -9667,49 +5809,42 @@ async def dashboard_debt_mix():
     # Try real DB data first
     if DATABASE_AVAILABLE:
         try:
-            from models import EntityType as _ET
             from sqlalchemy import func as _fn
 
             with next(get_db()) as db:
-                _nat = db.query(DBEntity).filter(DBEntity.type == _ET.NATIONAL).first()
-                if _nat:
-                    # Exclude PENDING_BILLS — see ``_is_debt_loan``.
-                    loans = _debt_loans_query(db, DBLoan.entity_id == _nat.id).all()
-                    if loans:
-                        total = sum(float(l.principal or 0) for l in loans)
-                        external_kw = [
-                            "multilateral",
-                            "bilateral",
-                            "eurobond",
-                            "commercial",
-                            "world bank",
-                            "imf",
-                            "afdb",
-                            "china",
-                            "japan",
-                        ]
-                        external = sum(
-                            float(l.principal or 0)
-                            for l in loans
-                            if any(kw in (l.lender or "").lower() for kw in external_kw)
-                        )
-                        domestic = total - external
-                        return {
-                            "external": (
-                                round(external / total * 100, 1) if total else 0
-                            ),
-                            "domestic": (
-                                round(domestic / total * 100, 1) if total else 0
-                            ),
-                            "external_amount": external,
-                            "domestic_amount": domestic,
-                            "total": total,
-                            "currency": "KES",
-                            "data_source": "database",
-                            "_meta": _response_meta(
-                                unit="percentage", entity_scope="national"
-                            ),
-                        }
+                # Exclude PENDING_BILLS — see ``queries.is_debt_loan``.
+                loans = queries.national_debt_loans(db)
+                if loans:
+                    total = sum(float(l.principal or 0) for l in loans)
+                    external_kw = [
+                        "multilateral",
+                        "bilateral",
+                        "eurobond",
+                        "commercial",
+                        "world bank",
+                        "imf",
+                        "afdb",
+                        "china",
+                        "japan",
+                    ]
+                    external = sum(
+                        float(l.principal or 0)
+                        for l in loans
+                        if any(kw in (l.lender or "").lower() for kw in external_kw)
+                    )
+                    domestic = total - external
+                    return {
+                        "external": (round(external / total * 100, 1) if total else 0),
+                        "domestic": (round(domestic / total * 100, 1) if total else 0),
+                        "external_amount": external,
+                        "domestic_amount": domestic,
+                        "total": total,
+                        "currency": "KES",
+                        "data_source": "database",
+                        "_meta": response_meta(
+                            unit="percentage", entity_scope="national"
+                        ),
+                    }
         except Exception as e:
             logging.error(f"DB debt-mix query failed: {e}")
 
@@ -9777,7 +5912,7 @@ async def dashboard_fiscal_outturns():
                             "series": series,
                             "data_source": "database",
                             "unit": "billion_kes",
-                            "_meta": _response_meta(
+                            "_meta": response_meta(
                                 unit="billion_kes", entity_scope="national"
                             ),
                         }
@@ -9826,8 +5961,8 @@ async def dashboard_sector_ceilings():
             with next(get_db()) as db:
                 # Scope to latest national FY; fall back to county if no national data.
                 # Also filter by entity type to avoid mixing county + national categories.
-                _nat_pid = _latest_national_period(db)
-                _pid = _nat_pid or _latest_county_period(db)
+                _nat_pid = queries.latest_national_period(db)
+                _pid = _nat_pid or queries.latest_county_period(db)
                 _entity_type = EntityType.NATIONAL if _nat_pid else EntityType.COUNTY
                 q = (
                     db.query(
@@ -9853,13 +5988,13 @@ async def dashboard_sector_ceilings():
                     allocation["total_amount"] = total
                     allocation["currency"] = "KES"
                     allocation["data_source"] = "database"
-                    allocation["_meta"] = _response_meta(
+                    allocation["_meta"] = response_meta(
                         unit="percentage",
                         entity_scope="national" if _nat_pid else "county",
                     )
                     # Plausibility: total_amount is raw KES
-                    _check_plausibility(
-                        total, _MAX_NATIONAL_BUDGET_KES, "sector-ceilings total_amount"
+                    check_plausibility(
+                        total, MAX_NATIONAL_BUDGET_KES, "sector-ceilings total_amount"
                     )
                     return allocation
         except Exception as e:
@@ -9895,101 +6030,6 @@ async def options_counties() -> Response:
     return Response(status_code=204)
 
 
-@app.post("/api/v1/etl/treasury/run-batch")
-async def run_treasury_batch():
-    """Run the targeted batch: latest 10 QEBR + 3 ABP + 5 Circulars."""
-    try:
-        # Lazy import to avoid heavy cost on app start
-        sys.path.append(os.path.join(os.path.dirname(__file__), "..", "etl"))
-        kp_mod = importlib.import_module("kenya_pipeline")
-        KenyaDataPipeline = getattr(kp_mod, "KenyaDataPipeline")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"ETL import failed: {e}")
-
-    pipeline = KenyaDataPipeline()
-    docs = pipeline.discover_budget_documents("treasury")
-    # Use selector for targeted batch
-    if hasattr(pipeline, "select_treasury_batch"):
-        batch = pipeline.select_treasury_batch(docs)
-    else:
-        batch = docs[:18]
-
-    processed = 0
-    successful = 0
-    doc_ids: List[Any] = []
-    for d in batch:
-        try:
-            res = await pipeline.download_and_process_document(d)
-            processed += 1
-            if res:
-                successful += 1
-                doc_ids.append(res.get("document_id"))
-        except Exception as e:
-            logger.error(f"Batch doc failed: {e}")
-        # gentle pacing
-        await asyncio.sleep(2)
-
-    return {
-        "requested": {
-            "qebr": 10,
-            "abp": 3,
-            "circulars": 5,
-        },
-        "processed": processed,
-        "successful": successful,
-        "document_ids": doc_ids,
-    }
-
-
-@app.post("/api/v1/etl/cob/run-batch")
-async def run_cob_batch(limit: int = 25):
-    """Run a COB batch across national and consolidated county BIRR pages.
-    Default limit is 25 recent items to validate nested lists from 2014+.
-    """
-    try:
-        sys.path.append(os.path.join(os.path.dirname(__file__), "..", "etl"))
-        kp_mod = importlib.import_module("kenya_pipeline")
-        KenyaDataPipeline = getattr(kp_mod, "KenyaDataPipeline")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"ETL import failed: {e}")
-
-    pipeline = KenyaDataPipeline()
-    docs = pipeline.discover_budget_documents("cob")
-
-    # Prefer items that look like BIRR PDFs and include FY in title
-    def score(d: Dict[str, Any]) -> tuple:
-        t = (d.get("title") or "").lower()
-        fy = 1 if re.search(r"fy\s*20\d{2}|20\d{2}\s*[/–-]\s*20\d{2}", t) else 0
-        birr = 1 if ("budget" in t and ("implementation" in t or "review" in t)) else 0
-        nat = 1 if "national" in t else 0
-        cty = 1 if "county" in t or "consolidated" in t else 0
-        return (fy + birr + nat + cty, t)
-
-    ranked = sorted(docs, key=score, reverse=True)
-
-    processed = 0
-    successful = 0
-    doc_ids: List[Any] = []
-    for d in ranked[: max(1, min(limit, 50))]:
-        try:
-            res = await pipeline.download_and_process_document(d)
-            processed += 1
-            if res:
-                successful += 1
-                doc_ids.append(res.get("document_id"))
-        except Exception as e:
-            logger.error(f"COB batch doc failed: {e}")
-        await asyncio.sleep(2)
-
-    return {
-        "requested": {"limit": limit},
-        "discovered": len(docs),
-        "processed": processed,
-        "successful": successful,
-        "document_ids": doc_ids,
-    }
-
-
 # Admin endpoints
 @app.post("/api/v1/annotations")
 async def create_annotation(
@@ -10025,187 +6065,5 @@ async def get_top_spenders(
     return {"top_spenders": []}
 
 
-# ETL Pipeline Endpoints
-@app.post("/api/v1/etl/kenya/start", response_model=ETLJobResponse)
-async def start_kenya_etl(background_tasks: BackgroundTasks):
-    """Start ETL pipeline for Kenya government data."""
-    if not ETL_AVAILABLE:
-        raise HTTPException(status_code=503, detail="ETL pipeline not available")
-
-    import datetime
-    import uuid
-
-    job_id = str(uuid.uuid4())
-
-    # Start ETL in background
-    background_tasks.add_task(run_kenya_etl_pipeline, job_id)
-
-    return ETLJobResponse(
-        job_id=job_id,
-        status="started",
-        country="Kenya",
-        started_at=datetime.datetime.now().isoformat(),
-        documents_processed=0,
-        errors=[],
-    )
-
-
-@app.get("/api/v1/etl/status/{job_id}", response_model=ETLStatusResponse)
-async def get_etl_status(job_id: str):
-    """Get status of ETL job."""
-    if not ETL_AVAILABLE:
-        raise HTTPException(status_code=503, detail="ETL pipeline not available")
-
-    # TODO: Implement job status tracking (could use Redis or database)
-    return ETLStatusResponse(
-        job_id=job_id,
-        status="completed",
-        progress={
-            "documents_fetched": 15,
-            "documents_processed": 12,
-            "entities_created": 25,
-            "budget_lines_created": 150,
-        },
-        last_updated=datetime.datetime.now().isoformat(),
-    )
-
-
-@app.get("/api/v1/etl/kenya/sources")
-async def get_kenya_data_sources():
-    """Get available Kenya government data sources with real-time status."""
-    if not ETL_AVAILABLE:
-        raise HTTPException(status_code=503, detail="ETL pipeline not available")
-
-    try:
-        # Test real-time connection status
-        import os
-        import sys
-
-        sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
-        from etl_test_runner import SimpleKenyaETL
-
-        etl = SimpleKenyaETL()
-
-        # Quick connection test
-        treasury_status = etl.test_treasury_connection()
-
-        sources = [
-            {
-                "name": "Kenya National Treasury",
-                "url": "https://treasury.go.ke",
-                "document_types": [
-                    "budget",
-                    "expenditure_report",
-                    "debt_report",
-                    "financial_statements",
-                ],
-                "last_fetch": treasury_status.get("timestamp", "2024-01-15T10:30:00Z"),
-                "status": (
-                    "active" if treasury_status.get("accessible", False) else "error"
-                ),
-                "live_test_results": {
-                    "response_code": treasury_status.get("status_code"),
-                    "pdf_documents_found": treasury_status.get(
-                        "pdf_documents_found", 0
-                    ),
-                    "page_title": treasury_status.get("page_title", ""),
-                    "sample_documents": treasury_status.get("sample_pdfs", [])[:3],
-                },
-            },
-            {
-                "name": "Office of Auditor General",
-                "url": "https://oagkenya.go.ke",
-                "document_types": [
-                    "audit_report",
-                    "special_audits",
-                    "compliance_reports",
-                ],
-                "last_fetch": "2024-01-10T14:20:00Z",
-                "status": "timeout_issues",
-                "note": "Site occasionally experiences timeouts but contains valuable audit reports",
-            },
-            {
-                "name": "Controller of Budget",
-                "url": "https://cob.go.ke",
-                "document_types": ["budget_implementation_review", "quarterly_reports"],
-                "last_fetch": "2024-01-12T09:15:00Z",
-                "status": "pending_test",
-            },
-        ]
-
-        return {
-            "sources": sources,
-            "real_time_test": True,
-            "test_timestamp": treasury_status.get("timestamp"),
-            "summary": {
-                "total_sources": len(sources),
-                "active_sources": len([s for s in sources if s["status"] == "active"]),
-                "total_pdf_documents": treasury_status.get("pdf_documents_found", 0),
-            },
-        }
-
-    except Exception as e:
-        # Fall back to static data if real-time test fails
-        return {
-            "sources": [
-                {
-                    "name": "Kenya National Treasury",
-                    "url": "https://treasury.go.ke",
-                    "document_types": ["budget", "expenditure_report", "debt_report"],
-                    "last_fetch": "2024-01-15T10:30:00Z",
-                    "status": "active",
-                },
-                {
-                    "name": "Office of Auditor General",
-                    "url": "https://oagkenya.go.ke",
-                    "document_types": ["audit_report"],
-                    "last_fetch": "2024-01-10T14:20:00Z",
-                    "status": "active",
-                },
-                {
-                    "name": "Controller of Budget",
-                    "url": "https://cob.go.ke",
-                    "document_types": ["budget_implementation_review"],
-                    "last_fetch": "2024-01-12T09:15:00Z",
-                    "status": "active",
-                },
-            ],
-            "real_time_test": False,
-            "error": str(e),
-        }
-
-
-async def run_kenya_etl_pipeline(job_id: str):
-    """Background task to run Kenya ETL pipeline with real data."""
-    try:
-        # Import and run our working ETL
-        import os
-        import sys
-
-        sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-
-        from etl_test_runner import SimpleKenyaETL
-
-        # Run the real ETL pipeline
-        etl = SimpleKenyaETL()
-        results = etl.run_full_pipeline()
-
-        print(f"ETL Job {job_id}: Successfully processed real Kenya government data")
-        print(
-            f"ETL Job {job_id}: Found {results['sources_accessible']} accessible sources"
-        )
-        print(
-            f"ETL Job {job_id}: Extracted {results['entities_extracted']} government entities"
-        )
-        print(f"ETL Job {job_id}: Processed {results['documents_processed']} documents")
-
-        return results
-
-    except Exception as e:
-        print(f"ETL Job {job_id} failed: {str(e)}")
-        return {"error": str(e)}
-
-
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8001)
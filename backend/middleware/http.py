@@ -0,0 +1,149 @@
+"""Pure-ASGI middleware for HTTP caching headers and request logging.
+
+Both act on the ``http.response.start`` message, so they add no task or
+body buffering per request and streaming responses pass through as they
+are produced.
+"""
+
+import logging
+import time
+from typing import Callable, Optional, Sequence, Union
+
+from monitoring import query_tracing
+from monitoring.instrumentation import record_request_db_usage, route_template
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class CacheHeadersMiddleware:
+    """Attach ``Cache-Control`` to successful public GET API responses.
+
+    The frontend uses React Query (which already has in-memory cache),
+    but without HTTP cache headers the browser still pays full payload
+    cost on back/forward nav and hard reloads. A short max-age with a
+    long stale-while-revalidate window makes navigation feel instant
+    while revalidating in the background. Responses that already set
+    ``Cache-Control`` are left alone.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        prefix: str = "/api/v1/",
+        # Auth-scoped or mutation-adjacent endpoints
+        exclude: Sequence[str] = (
+            "/api/v1/auth/",
+            "/api/v1/account/",
+            "/api/v1/watchlist",
+        ),
+        value: str = "public, max-age=60, stale-while-revalidate=3600",
+    ):
+        self.app = app
+        self.prefix = prefix
+        self.exclude = tuple(exclude)
+        self.value = value
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not path.startswith(self.prefix)
+            or path.startswith(self.exclude)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_headers(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                if "cache-control" not in headers:
+                    headers["Cache-Control"] = self.value
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
+
+
+class RequestLogMiddleware:
+    """Log completed requests and attribute their SQL work.
+
+    Only completions are logged (not a "PROCESSING" pre-event), and fast
+    healthy responses go to DEBUG so production logs show just errors
+    and slow requests — the signal engineers actually scan for.
+
+    Each request gets a :mod:`monitoring.query_tracing` scope; its query
+    count and DB time feed the ``db_*_per_request`` histograms (labelled
+    by route template), the warning log line and, unless disabled, the
+    ``X-DB-Queries``/``X-DB-Time`` headers. ``X-Process-Time`` is always
+    set. ``db_headers`` may be a callable, evaluated per request.
+    """
+
+    SLOW_SECONDS = 0.5
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: Optional[logging.Logger] = None,
+        db_headers: Union[bool, Callable[[], bool]] = True,
+    ):
+        self.app = app
+        self.logger = logger or logging.getLogger(__name__)
+        self.db_headers = db_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        method = scope["method"]
+        token = query_tracing.start_request(scope["path"])
+        db = query_tracing.current_stats()
+        response_started = False
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                process_time = time.perf_counter() - started
+                headers = MutableHeaders(scope=message)
+                headers["X-Process-Time"] = f"{process_time:.3f}"
+                if self.db_headers is True or (
+                    callable(self.db_headers) and self.db_headers()
+                ):
+                    headers["X-DB-Queries"] = str(db.queries)
+                    headers["X-DB-Time"] = f"{db.db_time:.3f}"
+                # Routing has filled in the matched route by now; label by
+                # its template so /counties/{id} is one series, not one per
+                # county.
+                record_request_db_usage(
+                    method, route_template(scope), db.queries, db.db_time
+                )
+                status_code = message["status"]
+                # Escalate severity for slow or non-2xx responses so
+                # scanning logs highlights real problems without drowning
+                # them in noise.
+                if process_time > self.SLOW_SECONDS or status_code >= 400:
+                    self.logger.warning(
+                        f"{method} {URL(scope=scope)} - {status_code} - "
+                        f"{process_time:.3f}s - {db.summary()}"
+                    )
+                elif self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        f"{method} {URL(scope=scope)} - {status_code} - "
+                        f"{process_time:.3f}s"
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as e:
+            if not response_started:
+                process_time = time.perf_counter() - started
+                self.logger.error(
+                    f"ERROR {method} {URL(scope=scope)} - {str(e)} - "
+                    f"{process_time:.3f}s - {db.summary()}"
+                )
+            raise
+        finally:
+            query_tracing.finish_request(token)
@@ -0,0 +1,171 @@
+"""Token-bucket rate limiting with constant state per client.
+
+Each client key holds a bucket of ``capacity`` tokens that refills at
+``capacity / period`` tokens per second; a request spends its route's
+cost (see :data:`ROUTE_COSTS`) and is rejected when the bucket is short.
+State is two numbers per key, whatever the request rate:
+
+- :class:`RedisTokenBucketLimiter` keeps them in a Redis hash updated by
+  one Lua script, so refill, check and spend are atomic across workers
+  and the key expires once the bucket would be full again.
+- :class:`TokenBucketLimiter` keeps them in an LRU-bounded dict for
+  single-process deployments and as the fallback when Redis fails.
+"""
+
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+# (path regex, cost) — first match wins, everything else costs 1.
+# Uncached endpoints that scan or aggregate whole tables are weighted so
+# a client hammering them runs out of budget long before one browsing
+# cached pages does.
+ROUTE_COSTS: Tuple[Tuple[str, int], ...] = (
+    (r"^/api/v1/documents/upload$", 10),
+    (r"^/api/v1/export/", 10),
+    (r"^/api/v1/search$", 5),
+    (r"^/api/v1/analytics/", 3),
+    (r"^/api/v1/counties/[^/]+/audits/(list|history)$", 3),
+    (r"^/api/v1/entities/[^/]+/periods/[^/]+/budget_lines$", 3),
+    (r"^/api/v1/dashboards/", 2),
+    (r"^/api/v1/entities$", 2),
+)
+
+_COMPILED_COSTS = [(re.compile(pattern), cost) for pattern, cost in ROUTE_COSTS]
+
+
+def route_cost(path: str, costs: Optional[Sequence[Tuple[str, int]]] = None) -> int:
+    """Budget a request to ``path`` consumes (1 unless listed in ``costs``)."""
+    table = (
+        _COMPILED_COSTS
+        if costs is None
+        else [(re.compile(pattern), cost) for pattern, cost in costs]
+    )
+    for pattern, cost in table:
+        if pattern.search(path):
+            return cost
+    return 1
+
+
+@dataclass
+class Decision:
+    """Outcome of spending tokens from one bucket."""
+
+    allowed: bool
+    remaining: float
+    retry_after: float  # seconds until the request would be allowed
+
+
+class TokenBucketLimiter:
+    """In-process token buckets keyed by client, at most ``max_keys`` kept.
+
+    The least recently seen key is evicted when the table is full; an
+    evicted client simply starts again with a full bucket.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        period: float,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = float(capacity)
+        self.rate = capacity / period  # tokens per second
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()  # key -> [tokens, ts]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def hit(self, key: str, cost: int = 1) -> Decision:
+        cost = min(float(cost), self.capacity)
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [self.capacity, now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return Decision(True, bucket[0], 0.0)
+        return Decision(False, bucket[0], (cost - bucket[0]) / self.rate)
+
+
+# KEYS[1] = bucket hash; ARGV = capacity, tokens per ms, cost, ttl ms.
+# Uses the server clock so workers with skewed clocks share one timeline
+# (TIME before writes needs Redis >= 5, which replicates script effects).
+_TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local retry_ms = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+else
+  retry_ms = math.ceil((cost - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], ttl)
+return {allowed, tostring(tokens), retry_ms}
+"""
+
+
+class RedisTokenBucketLimiter:
+    """Token buckets shared by all workers through one atomic Lua script.
+
+    Buckets are hashes under ``{prefix}:{key}``. The default prefix differs
+    from the fixed-window limiter's ``rate_limit:{ip}`` counters so a
+    rolling deploy never runs HSET against one of those strings.
+    """
+
+    def __init__(
+        self, client, capacity: int, period: float, prefix: str = "rate_limit:tb"
+    ):
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = float(capacity)
+        self.period = float(period)
+        self.prefix = prefix
+        self._rate_per_ms = capacity / (period * 1000)
+        # An idle bucket is full again after one period; drop it then.
+        self._ttl_ms = int(math.ceil(period * 1000))
+        self._script = client.register_script(_TOKEN_BUCKET_LUA)
+
+    async def hit(self, key: str, cost: int = 1) -> Decision:
+        cost = min(float(cost), self.capacity)
+        allowed, remaining, retry_ms = await self._script(
+            keys=[f"{self.prefix}:{key}"],
+            args=[self.capacity, self._rate_per_ms, cost, self._ttl_ms],
+        )
+        return Decision(bool(int(allowed)), float(remaining), int(retry_ms) / 1000)
+
+
+__all__ = [
+    "Decision",
+    "ROUTE_COSTS",
+    "RedisTokenBucketLimiter",
+    "TokenBucketLimiter",
+    "route_cost",
+]
@@ -1,36 +1,136 @@
-"""Security middleware for rate limiting, CORS, and audit logging."""
+"""Security middleware for rate limiting, CORS, and audit logging.
+
+All of these are pure ASGI middleware: they act on the scope and the
+``http.response.start`` message, so they add no task or body buffering
+per request and streaming responses pass through unchanged.
+"""
 
 import logging
+import math
 import time
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
-from typing import Callable, Dict, Optional
+from datetime import datetime, timezone
+from typing import Optional
 
 import redis.asyncio as aioredis
 from config.settings import settings
-from fastapi import HTTPException, Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from middleware.rate_limit import (
+    Decision,
+    RedisTokenBucketLimiter,
+    TokenBucketLimiter,
+    route_cost,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class RedisRateLimitMiddleware(BaseHTTPMiddleware):
-    """Redis-backed rate limiting middleware for production use.
+# Loopback traffic (local dev — SSR prefetch, HMR reloads, React Query
+# hydration and Strict-Mode double-invocation legitimately burst) and
+# health/metrics probes are never rate limited.
+_UNLIMITED_CLIENTS = ("127.0.0.1", "::1", "localhost", "unknown")
+_UNLIMITED_PATHS = ("/", "/health", "/metrics")
+
+
+def _client_ip(scope: Scope) -> str:
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _rate_limit_key(scope: Scope) -> Optional[str]:
+    """Client key to charge, or None when the request is exempt."""
+    # Skip OPTIONS (CORS preflight) — let CORSMiddleware handle it
+    if scope["method"] == "OPTIONS":
+        return None
+    client_ip = _client_ip(scope)
+    if client_ip in _UNLIMITED_CLIENTS or scope["path"] in _UNLIMITED_PATHS:
+        return None
+    return client_ip
+
+
+class RateLimitMiddleware:
+    """In-memory token-bucket rate limiting per client IP.
 
-    Falls back to in-memory if Redis is unavailable.
+    Each IP may spend ``calls`` units per ``period`` seconds, with routes
+    weighted by :func:`middleware.rate_limit.route_cost`. Memory is
+    constant per IP and bounded to ``max_clients`` IPs (LRU). For several
+    workers use :class:`RedisRateLimitMiddleware` so they share budgets.
     """
 
-    def __init__(self, app, calls: int = 100, period: int = 60):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls: int = 100,
+        period: int = 60,
+        max_clients: int = 10_000,
+    ):
+        self.app = app
         self.calls = calls
         self.period = period
+        self.limiter = TokenBucketLimiter(calls, period, max_keys=max_clients)
+
+    async def _check(self, client_ip: str, cost: int) -> Decision:
+        return self.limiter.hit(client_ip, cost)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        client_ip = _rate_limit_key(scope) if scope["type"] == "http" else None
+        if client_ip is None:
+            await self.app(scope, receive, send)
+            return
+
+        decision = await self._check(client_ip, route_cost(scope["path"]))
+        if not decision.allowed:
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "detail": f"Rate limit exceeded. Max {self.calls} requests per {self.period} seconds."
+                },
+                headers={
+                    "Retry-After": str(max(1, math.ceil(decision.retry_after))),
+                    "X-RateLimit-Limit": str(self.calls),
+                    "X-RateLimit-Remaining": "0",
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_budget(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.calls)
+                headers["X-RateLimit-Remaining"] = str(int(decision.remaining))
+            await send(message)
+
+        await self.app(scope, receive, send_with_budget)
+
+
+class RedisRateLimitMiddleware(RateLimitMiddleware):
+    """Redis-backed rate limiting middleware for production use.
+
+    Buckets live in Redis and are updated by a single Lua script, so all
+    workers share one budget per IP. Falls back to the in-memory buckets
+    if Redis is unavailable; after a failed call Redis is retried once
+    ``redis_retry_seconds`` have passed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        calls: int = 100,
+        period: int = 60,
+        redis_retry_seconds: float = 30.0,
+        **kwargs,
+    ):
+        super().__init__(app, calls=calls, period=period, **kwargs)
         self.redis_client: Optional[aioredis.Redis] = None
-        self.memory_fallback: Dict[str, list] = defaultdict(list)
+        self.redis_limiter: Optional[RedisTokenBucketLimiter] = None
         self.use_redis = False
-        # Tracks the last time the bulk sweep ran so it can be throttled
-        # to at most once per `period` seconds even if traffic keeps the
-        # dict above the sweep threshold continuously.
-        self._last_sweep_ts: float = 0.0
+        self.redis_retry_seconds = redis_retry_seconds
+        self._redis_retry_at = 0.0
 
     async def init_redis(self):
         """Initialize Redis connection."""
@@ -44,121 +144,32 @@ class RedisRateLimitMiddleware(BaseHTTPMiddleware):
                 )
                 # Test connection
                 await self.redis_client.ping()
+                self.redis_limiter = RedisTokenBucketLimiter(
+                    self.redis_client, self.calls, self.period
+                )
                 self.use_redis = True
                 logger.info("Redis rate limiter initialized")
-            except Exception as e:
+            except Exception:
                 logger.info("Redis not configured — using in-memory rate limiting")
                 self.use_redis = False
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        # Skip OPTIONS (CORS preflight) — let CORSMiddleware handle it
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
+    async def _check(self, client_ip: str, cost: int) -> Decision:
         # Initialize Redis on first request
         if self.redis_client is None and settings.REDIS_URL:
             await self.init_redis()
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-
-        # Skip rate limiting for loopback (local dev traffic from same machine — SSR
-        # prefetch, HMR reloads, React Query hydration, and Strict-Mode double-invocation
-        # legitimately generate bursts that would trip a public-facing rate limit).
-        if client_ip in ("127.0.0.1", "::1", "localhost", "unknown"):
-            return await call_next(request)
-
-        # Skip rate limiting for health checks
-        if request.url.path in ["/", "/health", "/metrics"]:
-            return await call_next(request)
-
-        # Use Redis or memory fallback
-        if self.use_redis and self.redis_client:
-            allowed = await self._check_redis_rate_limit(client_ip)
-        else:
-            allowed = await self._check_memory_rate_limit(client_ip)
-
-        if not allowed:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Max {self.calls} requests per {self.period} seconds.",
-                headers={"Retry-After": str(self.period)},
-            )
-
-        return await call_next(request)
-
-    async def _check_redis_rate_limit(self, client_ip: str) -> bool:
-        """Check rate limit using Redis."""
-        try:
-            key = f"rate_limit:{client_ip}"
-            pipe = self.redis_client.pipeline()
-
-            # Increment counter
-            pipe.incr(key)
-            # Set expiry
-            pipe.expire(key, self.period)
-
-            result = await pipe.execute()
-            count = result[0]
-
-            return count <= self.calls
-        except Exception as e:
-            logger.error(f"Redis rate limit check failed: {e}")
-            # Fall back to memory
-            self.use_redis = False
-            return await self._check_memory_rate_limit(client_ip)
-
-    # Bulk sweep fires once the dict crosses this many distinct IPs.
-    # Without it the dict grows unbounded — every unique IP that ever
-    # hit the server stays in memory for the worker's lifetime, because
-    # the per-IP cleanup below only prunes timestamps inside the list,
-    # never the IP key itself.
-    _MEMORY_FALLBACK_SWEEP_THRESHOLD = 10_000
-
-    async def _check_memory_rate_limit(self, client_ip: str) -> bool:
-        """Check rate limit using in-memory storage (fallback)."""
-        now = time.time()
-
-        # Lazy bulk sweep: when the dict gets large, drop any IP whose
-        # most recent timestamp is older than `period`. Throttled so
-        # the O(N) scan can't run on every request once the dict stays
-        # above threshold — at most once per `self.period` seconds.
         if (
-            len(self.memory_fallback) > self._MEMORY_FALLBACK_SWEEP_THRESHOLD
-            and now - self._last_sweep_ts >= self.period
+            self.use_redis
+            and self.redis_limiter
+            and time.monotonic() >= self._redis_retry_at
         ):
-            self._last_sweep_ts = now
-            cutoff = now - self.period
-            stale = [
-                ip for ip, ts in self.memory_fallback.items()
-                if not ts or max(ts) < cutoff
-            ]
-            for ip in stale:
-                del self.memory_fallback[ip]
-            # Only log when we actually evicted something — otherwise
-            # this would spam INFO every `period` seconds whenever the
-            # dict sits at threshold with no stale entries.
-            if stale:
-                logger.info(
-                    f"Rate-limiter memory sweep: dropped {len(stale)} stale IPs "
-                    f"({len(self.memory_fallback)} remaining)"
-                )
-
-        # Clean old entries for this IP
-        self.memory_fallback[client_ip] = [
-            timestamp
-            for timestamp in self.memory_fallback[client_ip]
-            if now - timestamp < self.period
-        ]
-
-        # Check limit
-        if len(self.memory_fallback[client_ip]) >= self.calls:
-            return False
-
-        # Add current request
-        self.memory_fallback[client_ip].append(now)
-        return True
+            try:
+                return await self.redis_limiter.hit(client_ip, cost)
+            except Exception as e:
+                logger.error(f"Redis rate limit check failed: {e}")
+                # Fall back to memory for a while, then try Redis again
+                self._redis_retry_at = time.monotonic() + self.redis_retry_seconds
+        return self.limiter.hit(client_ip, cost)
 
     async def shutdown(self):
         """Close Redis connection."""
@@ -166,129 +177,81 @@ class RedisRateLimitMiddleware(BaseHTTPMiddleware):
             await self.redis_client.close()
 
 
-# Keep old middleware for backward compatibility
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Simple in-memory rate limiting middleware.
-
-    For production, use RedisRateLimitMiddleware instead.
-    """
-
-    def __init__(self, app, calls: int = 100, period: int = 60):
-        super().__init__(app)
-        self.calls = calls
-        self.period = period
-        self.clients: Dict[str, list] = defaultdict(list)
-
-    async def dispatch(self, request: Request, call_next: Callable):
-        # Skip OPTIONS (CORS preflight) — let CORSMiddleware handle it
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-
-        # Skip rate limiting for loopback (local dev traffic from same machine)
-        if client_ip in ("127.0.0.1", "::1", "localhost", "unknown"):
-            return await call_next(request)
-
-        # Skip rate limiting for health checks
-        if request.url.path in ["/", "/health", "/metrics"]:
-            return await call_next(request)
-
-        # Clean old entries
-        now = time.time()
-        self.clients[client_ip] = [
-            timestamp
-            for timestamp in self.clients[client_ip]
-            if now - timestamp < self.period
-        ]
-
-        # Check rate limit
-        if len(self.clients[client_ip]) >= self.calls:
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Max {self.calls} requests per {self.period} seconds.",
-                headers={"Retry-After": str(self.period)},
-            )
-
-        # Add current request
-        self.clients[client_ip].append(now)
-
-        return await call_next(request)
-
-
-class AuditLogMiddleware(BaseHTTPMiddleware):
+class AuditLogMiddleware:
     """Log all API requests for audit trail."""
 
-    async def dispatch(self, request: Request, call_next: Callable):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # Skip OPTIONS (CORS preflight) — not useful to audit
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
         start_time = time.time()
 
-        # Get client info
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        async def send_with_audit(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _log_audit_entry(scope, message["status"], time.time() - start_time)
+            await send(message)
 
-        # Get user from auth token if available
-        user_id = "anonymous"
-        auth_header = request.headers.get("authorization", "")
-        if auth_header:
-            # Extract user from token (simplified - actual implementation in auth.py)
-            try:
-                # This would decode JWT and extract user
-                user_id = "authenticated"  # Placeholder
-            except Exception:
-                pass
+        await self.app(scope, receive, send_with_audit)
 
-        # Process request
-        response = await call_next(request)
 
-        # Calculate duration
-        duration = time.time() - start_time
+def _log_audit_entry(scope: Scope, status_code: int, duration: float) -> None:
+    headers = Headers(scope=scope)
+    user_agent = headers.get("user-agent", "unknown")
 
-        # Log audit entry
-        audit_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "user_id": user_id,
-            "client_ip": client_ip,
-            "method": request.method,
-            "path": request.url.path,
-            "query_params": str(request.query_params),
-            "status_code": response.status_code,
-            "duration_ms": round(duration * 1000, 2),
-            "user_agent": user_agent,
-        }
+    # Get user from auth token if available
+    user_id = "anonymous"
+    if headers.get("authorization", ""):
+        # Extract user from token (simplified - actual implementation in auth.py)
+        user_id = "authenticated"  # Placeholder
 
-        logger.info(f"AUDIT: {audit_entry}")
+    audit_entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "user_id": user_id,
+        "client_ip": _client_ip(scope),
+        "method": scope["method"],
+        "path": scope["path"],
+        "query_params": str(QueryParams(scope.get("query_string", b""))),
+        "status_code": status_code,
+        "duration_ms": round(duration * 1000, 2),
+        "user_agent": user_agent,
+    }
 
-        return response
+    logger.info(f"AUDIT: {audit_entry}")
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Add security headers to all responses."""
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        # Skip OPTIONS (CORS preflight)
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = (
-            "max-age=31536000; includeSubDomains"
-        )
+    HEADERS = {
+        "X-Content-Type-Options": "nosniff",
+        "X-Frame-Options": "DENY",
+        "X-XSS-Protection": "1; mode=block",
+        "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
         # CSP: allow API responses to be consumed cross-origin (frontend on different port)
-        response.headers["Content-Security-Policy"] = "default-src 'self'; connect-src *"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=()"
-        )
+        "Content-Security-Policy": "default-src 'self'; connect-src *",
+        "Referrer-Policy": "strict-origin-when-cross-origin",
+        "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
+    }
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip OPTIONS (CORS preflight)
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.HEADERS.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
@@ -0,0 +1,82 @@
+"""Serve published static snapshots without touching handlers or the DB.
+
+A GET or HEAD whose path and query match an entry in the current
+snapshot (see :mod:`services.static_snapshots`) is answered from memory.
+The body is the pre-compressed variant the client accepts (brotli, then
+gzip, then identity). The response carries a weak ETag, and a matching
+``If-None-Match`` returns 304. Any other request passes through.
+"""
+
+from typing import Optional
+
+from services.static_snapshots import (
+    BYPASS_SCOPE_KEY,
+    SnapshotStore,
+    canonical_path,
+    choose_encoding,
+)
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class StaticSnapshotMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[SnapshotStore] = None,
+        cache_control: str = "public, max-age=60, stale-while-revalidate=3600",
+    ):
+        self.app = app
+        self.store = store or SnapshotStore()
+        self.cache_control = cache_control
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or scope.get(BYPASS_SCOPE_KEY)
+        ):
+            await self.app(scope, receive, send)
+            return
+        snapshot = self.store.current()
+        entry = snapshot and snapshot.entries.get(
+            canonical_path(
+                scope["path"], scope.get("query_string", b"").decode("latin-1")
+            )
+        )
+        if entry is None:
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        etag = f'W/"{entry.etag}"'
+        headers = [
+            (b"cache-control", self.cache_control.encode()),
+            (b"etag", etag.encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"x-snapshot-version", snapshot.version.encode()),
+        ]
+        if etag in request_headers.get("if-none-match", ""):
+            await send(
+                {"type": "http.response.start", "status": 304, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        encoding = choose_encoding(
+            request_headers.get("accept-encoding", ""), entry.bodies
+        )
+        body = entry.bodies[encoding]
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send(
+            {
+                "type": "http.response.body",
+                "body": b"" if scope["method"] == "HEAD" else body,
+            }
+        )
@@ -13,6 +13,8 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -185,6 +187,14 @@ class BudgetLine(Base):
             "subcategory",
             name="uq_budget_entity_period_cat_subcat",
         ),
+        # County budget totals: SUM(allocated/spent) per (entity, period)
+        # answered from the index alone on Postgres.
+        Index(
+            "ix_budget_lines_entity_period_cov",
+            "entity_id",
+            "period_id",
+            postgresql_include=["allocated_amount", "actual_spent"],
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -258,6 +268,23 @@ class Loan(Base):
 
 class Audit(Base):
     __tablename__ = "audits"
+    __table_args__ = (
+        # Paginated county listing: WHERE entity_id IN (...) ORDER BY
+        # created_at DESC LIMIT/OFFSET (/counties/{id}/audits/list).
+        Index("ix_audits_entity_created", "entity_id", "created_at"),
+        # Case-insensitive status filter on the same listing.
+        Index("ix_audits_entity_status_lower", "entity_id", func.lower(text("status"))),
+        # Recurring-findings grouping (/audit/recurring).
+        Index("ix_audits_entity_querytype_year", "entity_id", "query_type", "audit_year"),
+        # Explicitly flagged recurring findings are a small slice of audits.
+        Index(
+            "ix_audits_recurring_flag",
+            "entity_id",
+            "query_type",
+            postgresql_where=text("follow_up_status = 'Recurring'"),
+            sqlite_where=text("follow_up_status = 'Recurring'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     entity_id = Column(Integer, ForeignKey("entities.id"), nullable=False, index=True)
@@ -298,6 +325,8 @@ class User(Base):
     roles = Column(JSONB, default=list)
     disabled = Column(Boolean, default=False)
     email_verified = Column(Boolean, default=False)
+    # Watchlist alert digest emails; in-app alerts follow WatchlistItem.notify.
+    alert_emails = Column(Boolean, default=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
         DateTime,
@@ -366,6 +395,92 @@ class DataAlert(Base):
     user = relationship("User", back_populates="data_alerts")
 
 
+class AlertOutbox(Base):
+    """Watcher alerts waiting to be fanned out (transactional outbox).
+
+    ``services.alert_service.notify_watchers`` appends a row inside the
+    ingesting transaction; the dispatcher turns each pending batch into
+    ``data_alerts`` rows with one INSERT ... SELECT and stamps
+    ``dispatched_at``.
+    """
+
+    __tablename__ = "alert_outbox"
+    __table_args__ = (
+        # The dispatcher's "oldest pending first" scan.
+        Index(
+            "ix_alert_outbox_pending",
+            "id",
+            postgresql_where=text("dispatched_at IS NULL"),
+            sqlite_where=text("dispatched_at IS NULL"),
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    item_type = Column(String(30), nullable=False)
+    item_id = Column(String(100), nullable=False)
+    alert_type = Column(String(50), nullable=False)
+    title = Column(String(300), nullable=False)
+    body = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    dispatched_at = Column(DateTime, nullable=True)
+    alerts_created = Column(Integer, nullable=True)
+
+
+class QueuedJob(Base):
+    """One unit of scheduled or on-demand background work.
+
+    ``services.job_scheduler`` enqueues rows (recurring schedules, admin
+    triggers) and runs them by priority within per-resource-class
+    concurrency limits; replicas claim rows with ``FOR UPDATE SKIP
+    LOCKED``. ``key`` identifies a recurring schedule so at most one of
+    its runs is queued or running at a time, enforced by a partial
+    unique index.
+    """
+
+    __tablename__ = "job_queue"
+    __table_args__ = (
+        # The scheduler's "highest priority, oldest due first" claim scan.
+        Index(
+            "ix_job_queue_ready",
+            "priority",
+            "run_at",
+            postgresql_where=text("status = 'queued'"),
+            sqlite_where=text("status = 'queued'"),
+        ),
+        Index("ix_job_queue_key_run_at", "key", "run_at"),
+        # At most one queued or running row per key, across replicas.
+        Index(
+            "ux_job_queue_active_key",
+            "key",
+            unique=True,
+            postgresql_where=text("status IN ('queued', 'running')"),
+            sqlite_where=text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job = Column(String(100), nullable=False)
+    key = Column(String(200), nullable=True)
+    args = Column(JSONB, default=dict)
+    priority = Column(Integer, nullable=False, default=50)
+    resource_class = Column(String(20), nullable=False, default="network")
+    status = Column(String(20), nullable=False, default=QUEUED)
+    run_at = Column(DateTime, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    worker = Column(String(100), nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+    result = Column(JSONB, nullable=True)
+
+
 class NewsletterSubscriber(Base):
     """Email-only newsletter subscriptions (no account required)."""
 
@@ -465,6 +580,13 @@ class PopulationData(Base):
             "year",
             name="uq_population_entity_year",
         ),
+        # Latest-year lookups per county: ORDER BY year DESC LIMIT 1.
+        Index(
+            "ix_population_data_entity_year_desc",
+            "entity_id",
+            text("year DESC"),
+            postgresql_include=["total_population"],
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -502,6 +624,13 @@ class GDPData(Base):
             "quarter",
             name="uq_gdp_entity_year_quarter",
         ),
+        # Latest-year lookups per county: ORDER BY year DESC LIMIT 1.
+        Index(
+            "ix_gdp_data_entity_year_desc",
+            "entity_id",
+            text("year DESC"),
+            postgresql_include=["gdp_value"],
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -526,6 +655,45 @@ class GDPData(Base):
     source_document = relationship("SourceDocument")
 
 
+class EntityLatestStats(Base):
+    """Latest population and GDP per entity (maintained projection).
+
+    One row per entity, plus one national row (``entity_key`` 0,
+    ``entity_id`` NULL). Rebuilt by ``services.latest_stats`` whenever
+    the population or GDP writers persist rows, so per-capita reads are a
+    single keyed lookup instead of a ``max(year)`` join.
+    """
+
+    __tablename__ = "entity_latest_stats"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity_key = Column(Integer, nullable=False, unique=True)  # entity_id or 0
+    entity_id = Column(
+        Integer, ForeignKey("entities.id", ondelete="CASCADE"), nullable=True
+    )
+    population_id = Column(
+        Integer, ForeignKey("population_data.id", ondelete="SET NULL"), nullable=True
+    )
+    population_year = Column(Integer, nullable=True)
+    total_population = Column(Integer, nullable=True)
+    gdp_id = Column(
+        Integer, ForeignKey("gdp_data.id", ondelete="SET NULL"), nullable=True
+    )
+    gdp_year = Column(Integer, nullable=True)
+    gdp_quarter = Column(String(2), nullable=True)
+    gdp_value = Column(Numeric(20, 2), nullable=True)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+    # Relationships
+    entity = relationship("Entity")
+    population = relationship("PopulationData")
+    gdp = relationship("GDPData")
+
+
 class EconomicIndicator(Base):
     """Economic indicators from KNBS (CPI, PPI, inflation, unemployment, etc.)."""
 
@@ -1064,3 +1232,63 @@ class AdminAuditLog(Base):
         default=lambda: datetime.now(timezone.utc),
         index=True,
     )
+
+
+class AccountabilitySnapshot(Base):
+    """One versioned batch run of the county accountability scorecards.
+
+    ``services.accountability.refresh_accountability_snapshot`` computes
+    every county's scorecard from a handful of grouped queries and
+    writes the header row plus one ``AccountabilityScorecard`` per
+    county in a single transaction. Readers always resolve the highest
+    ``id`` (the version), so a refresh becomes visible atomically on
+    commit and a half-written run is never served.
+    """
+
+    __tablename__ = "accountability_snapshots"
+
+    id = Column(Integer, primary_key=True, index=True)
+    reason = Column(String(100), nullable=True)  # e.g. "domain:audits"
+    county_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(
+        DateTime, nullable=False, default=lambda: datetime.now(timezone.utc)
+    )
+
+    # Relationships
+    scorecards = relationship(
+        "AccountabilityScorecard",
+        back_populates="snapshot",
+        cascade="all, delete-orphan",
+    )
+
+
+class AccountabilityScorecard(Base):
+    """Precomputed accountability scorecard for one county in a snapshot."""
+
+    __tablename__ = "accountability_scorecards"
+    __table_args__ = (
+        UniqueConstraint(
+            "snapshot_id", "county_id", name="uq_accountability_snapshot_county"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    snapshot_id = Column(
+        Integer,
+        ForeignKey("accountability_snapshots.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    county_id = Column(String(3), nullable=False)  # frontend code, e.g. "047"
+    entity_id = Column(Integer, ForeignKey("entities.id"), nullable=False)
+    grade = Column(String(1), nullable=False)
+    score = Column(Numeric(5, 1), nullable=False)
+    population = Column(Integer, nullable=True)
+    total_allocated = Column(Numeric(20, 2), nullable=True)
+    total_spent = Column(Numeric(20, 2), nullable=True)
+    total_findings = Column(Integer, nullable=False, default=0)
+    payload = Column(JSONB, nullable=False)  # full /accountability response body
+
+    # Relationships
+    snapshot = relationship("AccountabilitySnapshot", back_populates="scorecards")
+    entity = relationship("Entity")
@@ -1,28 +1,36 @@
 """Monitoring and observability setup with Sentry and Prometheus."""
 
+import contextlib
 import logging
 import os
 import time
-from typing import Callable
+from typing import Iterator
 
-import sentry_sdk
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from prometheus_client import Counter, Gauge, Histogram
-from prometheus_fastapi_instrumentator import Instrumentator
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
-# Prometheus metrics
+# Prometheus metrics. HTTP series are labelled by route template
+# (``/api/v1/counties/{county_id}``), never the raw path, so the number
+# of series is bounded by the number of routes.
 http_requests_total = Counter(
-    "http_requests_total", "Total HTTP requests", ["method", "endpoint", "status"]
+    "http_requests_total", "Total HTTP requests", ["method", "route", "status"]
 )
 
 http_request_duration_seconds = Histogram(
     "http_request_duration_seconds",
     "HTTP request duration in seconds",
-    ["method", "endpoint"],
+    ["method", "route"],
+)
+
+http_response_size_bytes = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size in bytes (after compression)",
+    ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
 )
 
 active_requests = Gauge("active_requests", "Number of active requests")
@@ -39,6 +47,68 @@ db_connection_pool_size = Gauge(
     "db_connection_pool_size", "Database connection pool size"
 )
 
+db_pool_connections_in_use = Gauge(
+    "db_pool_connections_in_use", "Pooled DB connections currently checked out"
+)
+
+db_pool_connections_max = Gauge(
+    "db_pool_connections_max", "Pool size plus max overflow"
+)
+
+db_pool_overflow = Gauge("db_pool_overflow", "DB connections open beyond the pool size")
+
+db_pool_checkout_seconds = Histogram(
+    "db_pool_checkout_seconds",
+    "Time to obtain a pooled DB connection, including waiting for a free slot",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+threadpool_tokens_in_use = Gauge(
+    "threadpool_tokens_in_use", "Worker threads busy running sync endpoints"
+)
+
+threadpool_tasks_waiting = Gauge(
+    "threadpool_tasks_waiting", "Sync endpoint calls queued for a worker thread"
+)
+
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Response-cache lookups by key prefix; result is hit, miss or coalesced",
+    ["prefix", "result"],
+)
+
+etl_stage_duration_seconds = Histogram(
+    "etl_stage_duration_seconds",
+    "Duration of one ETL/seeding stage",
+    ["pipeline", "stage", "outcome"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+
+etl_job_failures_total = Counter(
+    "etl_job_failures_total", "ETL/seeding stages that raised", ["pipeline", "stage"]
+)
+
+etl_last_success_timestamp = Gauge(
+    "etl_last_success_timestamp",
+    "Unix time the pipeline last completed a stage successfully",
+    ["pipeline"],
+)
+
+# SQL work per request, labelled by route template (never the raw path)
+db_queries_per_request = Histogram(
+    "db_queries_per_request",
+    "SQL statements issued per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500),
+)
+
+db_time_per_request_seconds = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
 
 def setup_sentry(app: FastAPI, dsn: str = None):
     """Configure Sentry for error tracking."""
@@ -48,6 +118,10 @@ def setup_sentry(app: FastAPI, dsn: str = None):
         logger.warning("Sentry DSN not configured. Error tracking disabled.")
         return
 
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
+
     sentry_sdk.init(
         dsn=dsn,
         integrations=[
@@ -78,53 +152,82 @@ def before_send_filter(event, hint):
     return event
 
 
-def setup_prometheus(app: FastAPI):
-    """Configure Prometheus metrics collection."""
-    instrumentator = Instrumentator(
-        should_group_status_codes=True,
-        should_ignore_untemplated=True,
-        should_respect_env_var=True,
-        should_instrument_requests_inprogress=True,
-        excluded_handlers=["/metrics", "/health"],
-        env_var_name="ENABLE_METRICS",
-        inprogress_name="http_requests_inprogress",
-        inprogress_labels=True,
-    )
-
-    instrumentator.instrument(app).expose(app, endpoint="/metrics")
+def setup_prometheus(app: FastAPI, engine=None):
+    """Register :class:`MetricsMiddleware` and a ``/metrics`` endpoint.
 
-    logger.info("Prometheus metrics enabled at /metrics")
+    Opt-in via ``ENABLE_METRICS=true``. *engine* is the SQLAlchemy engine
+    whose pool is sampled on each request (``database.engine`` if None).
+    Call it after the other middleware so the timings cover them too.
+    """
+    if os.getenv("ENABLE_METRICS", "false").lower() not in ("true", "1", "yes"):
+        logger.info("Prometheus metrics disabled (set ENABLE_METRICS=true)")
+        return False
 
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+    from starlette.responses import Response
 
-async def metrics_middleware(request: Request, call_next: Callable):
-    """Custom middleware for detailed metrics collection."""
-    # Track active requests
-    active_requests.inc()
-
-    # Start timer
-    start_time = time.time()
-
-    try:
-        # Process request
-        response = await call_next(request)
+    if engine is None:
+        from database import engine
 
-        # Record metrics
-        duration = time.time() - start_time
-        http_request_duration_seconds.labels(
-            method=request.method, endpoint=request.url.path
-        ).observe(duration)
+    app.add_middleware(MetricsMiddleware, engine=engine)
 
-        http_requests_total.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code,
-        ).inc()
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics_endpoint():
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
-        return response
-
-    finally:
-        # Decrement active requests
-        active_requests.dec()
+    logger.info("Prometheus metrics enabled at /metrics")
+    return True
+
+
+def route_template(scope) -> str:
+    """Template of the route that served a request (after routing ran).
+
+    Accepts an ASGI scope or a ``Request`` (which reads through to it).
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Pure-ASGI middleware recording the HTTP, pool and thread-pool series."""
+
+    def __init__(self, app: ASGIApp, engine=None):
+        self.app = app
+        self.engine = engine
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Track active requests
+        active_requests.inc()
+        start_time = time.time()
+
+        async def send_with_metrics(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                method = scope["method"]
+                route = route_template(scope)
+                http_request_duration_seconds.labels(
+                    method=method, route=route
+                ).observe(time.time() - start_time)
+                http_requests_total.labels(
+                    method=method, route=route, status=message["status"]
+                ).inc()
+                size = Headers(raw=message["headers"]).get("content-length")
+                if size is not None:
+                    http_response_size_bytes.labels(method=method, route=route).observe(
+                        int(size)
+                    )
+                if self.engine is not None:
+                    update_db_pool_metrics(pool_status(self.engine))
+                sample_threadpool()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            active_requests.dec()
 
 
 def setup_structured_logging():
@@ -155,6 +258,70 @@ def record_validation_failure(validation_type: str):
     data_validation_failures.labels(validation_type=validation_type).inc()
 
 
+def pool_status(engine) -> dict:
+    """Snapshot of *engine*'s connection pool (zeros for non-queue pools)."""
+    from sqlalchemy.pool import QueuePool
+
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"size": 0, "checked_out": 0, "overflow": 0, "max": 0}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "max": pool.size() + max(pool._max_overflow, 0),
+    }
+
+
 def update_db_pool_metrics(pool_status: dict):
     """Update database connection pool metrics."""
     db_connection_pool_size.set(pool_status.get("size", 0))
+    db_pool_connections_in_use.set(pool_status.get("checked_out", 0))
+    db_pool_connections_max.set(pool_status.get("max", 0))
+    db_pool_overflow.set(pool_status.get("overflow", 0))
+
+
+def record_pool_checkout(seconds: float):
+    """Record how long obtaining a pooled connection took."""
+    db_pool_checkout_seconds.observe(seconds)
+
+
+def sample_threadpool():
+    """Sample Starlette's worker-thread limiter (call from the event loop)."""
+    try:
+        from anyio import to_thread
+
+        limiter = to_thread.current_default_thread_limiter()
+        threadpool_tokens_in_use.set(limiter.borrowed_tokens)
+        threadpool_tasks_waiting.set(limiter.statistics().tasks_waiting)
+    except Exception:  # no running event loop
+        pass
+
+
+def record_cache_lookup(prefix: str, result: str):
+    """Count one response-cache lookup (``hit``, ``miss`` or ``coalesced``)."""
+    cache_requests_total.labels(prefix=prefix, result=result).inc()
+
+
+@contextlib.contextmanager
+def etl_stage(pipeline: str, stage: str) -> Iterator[None]:
+    """Time one ETL stage; marks the pipeline's last success when it completes."""
+    started = time.time()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        etl_stage_duration_seconds.labels(
+            pipeline=pipeline, stage=stage, outcome=outcome
+        ).observe(time.time() - started)
+        if outcome == "success":
+            etl_last_success_timestamp.labels(pipeline=pipeline).set_to_current_time()
+        else:
+            etl_job_failures_total.labels(pipeline=pipeline, stage=stage).inc()
+
+
+def record_request_db_usage(method: str, route: str, queries: int, db_time: float):
+    """Record the SQL statements and DB time one request used."""
+    db_queries_per_request.labels(method=method, route=route).observe(queries)
+    db_time_per_request_seconds.labels(method=method, route=route).observe(db_time)
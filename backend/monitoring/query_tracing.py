@@ -0,0 +1,172 @@
+"""Per-request SQL accounting and a sampled slow-query log.
+
+SQLAlchemy ``before_cursor_execute``/``after_cursor_execute`` listeners
+on every ``Engine`` time each statement and add it to the
+:class:`RequestQueryStats` held in a context variable for the current
+request. The request middleware opens the scope with
+:func:`start_request` and reads the totals back with
+:func:`finish_request`. Statements outside a request (startup, ETL,
+scripts) are only considered for the slow-query log.
+
+Sync endpoints run in Starlette's thread pool with a copy of the
+request's context, so the stats object is shared with them and their
+queries are attributed to the right request.
+
+Slow statements (``SLOW_QUERY_MS``, default 250 ms) are logged for a
+``SLOW_QUERY_SAMPLE_RATE`` fraction of occurrences (default 0.1) with a
+normalized fingerprint — literals, placeholders and ``IN`` lists
+collapsed — so the same query shape groups together in log search.
+Parameters are never logged.
+"""
+
+import contextvars
+import hashlib
+import logging
+import os
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "250"))
+SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "0.1"))
+# Slowest statements kept per request for the slow-request log line.
+KEEP_SLOWEST = 3
+
+_FINGERPRINT_MAX_LEN = 500
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL statements issued while serving one request."""
+
+    path: str = ""
+    queries: int = 0
+    db_time: float = 0.0  # seconds
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.queries += 1
+        self.db_time += elapsed
+        if len(self.slowest) < KEEP_SLOWEST or elapsed > self.slowest[-1][0]:
+            self.slowest.append((elapsed, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[KEEP_SLOWEST:]
+
+    def summary(self) -> str:
+        """``"12 queries, 0.084s in DB; slowest 0.051s <fingerprint>"``."""
+        text = f"{self.queries} queries, {self.db_time:.3f}s in DB"
+        if self.slowest:
+            elapsed, statement = self.slowest[0]
+            text += f"; slowest {elapsed:.3f}s {fingerprint(statement)[1]}"
+        return text
+
+
+_current: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def start_request(path: str = "") -> contextvars.Token:
+    """Open a stats scope for the current request."""
+    return _current.set(RequestQueryStats(path=path))
+
+
+def finish_request(token: contextvars.Token) -> RequestQueryStats:
+    """Close the scope opened by :func:`start_request` and return its stats."""
+    stats = _current.get()
+    _current.reset(token)
+    return stats or RequestQueryStats()
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+
+# ── fingerprints ──────────────────────────────────────────────────────
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDERS = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.I)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> Tuple[str, str]:
+    """Return ``(normalized_sql, short_hash)`` for *statement*.
+
+    Statements that differ only in literal values, bind-parameter style
+    or ``IN``-list length share a fingerprint.
+    """
+    sql = _COMMENTS.sub(" ", statement)
+    sql = _STRINGS.sub("?", sql)
+    sql = _PLACEHOLDERS.sub("?", sql)
+    sql = _NUMBERS.sub("?", sql)
+    sql = _IN_LISTS.sub("IN (...)", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    digest = hashlib.sha1(sql.encode("utf-8")).hexdigest()[:12]
+    return sql, digest
+
+
+# ── engine listeners ──────────────────────────────────────────────────
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start_time")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if elapsed * 1000 >= SLOW_QUERY_MS and random.random() < SLOW_QUERY_SAMPLE_RATE:
+        sql, digest = fingerprint(statement)
+        logger.warning(
+            "Slow query %s (%.1f ms) on %s: %s",
+            digest,
+            elapsed * 1000,
+            stats.path if stats is not None and stats.path else "<no request>",
+            sql[:_FINGERPRINT_MAX_LEN],
+        )
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+_installed = False
+
+
+def install() -> None:
+    """Attach the timing listeners to every Engine (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _installed = True
+
+
+__all__ = [
+    "RequestQueryStats",
+    "current_stats",
+    "finish_request",
+    "fingerprint",
+    "install",
+    "start_request",
+]
@@ -0,0 +1,46 @@
+"""Shared read-side query layer for the API.
+
+Lookups that several endpoints need — the fiscal period an aggregate is
+scoped to, the national entity, which ``loans`` rows count as debt, the
+population per entity — live here instead of being re-implemented
+inline in each handler. Functions take the request's ``Session`` first,
+memoise within that session (see :mod:`queries.memo`) and come in batch
+forms where endpoints iterate over many entities.
+"""
+
+from queries.budget import entity_period_budget_query, latest_budget_totals
+from queries.debt import (
+    debt_category_filter,
+    debt_loans_query,
+    debt_outstanding_by_entity,
+    is_debt_loan,
+    national_debt_loans,
+)
+from queries.entities import county_entity, national_entity, national_entity_id
+from queries.periods import (
+    TOTAL_BUDGET_CATEGORY,
+    latest_county_period,
+    latest_executed_period,
+    latest_executed_periods,
+    latest_national_period,
+)
+from queries.population import population_map
+
+__all__ = [
+    "TOTAL_BUDGET_CATEGORY",
+    "county_entity",
+    "debt_category_filter",
+    "debt_loans_query",
+    "debt_outstanding_by_entity",
+    "entity_period_budget_query",
+    "is_debt_loan",
+    "latest_budget_totals",
+    "latest_county_period",
+    "latest_executed_period",
+    "latest_executed_periods",
+    "latest_national_period",
+    "national_debt_loans",
+    "national_entity",
+    "national_entity_id",
+    "population_map",
+]
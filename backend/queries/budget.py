@@ -0,0 +1,68 @@
+"""Budget-line scoping shared by the county and accountability views."""
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from models import BudgetLine, FiscalPeriod
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from queries.periods import TOTAL_BUDGET_CATEGORY, latest_executed_period
+
+
+def entity_period_budget_query(
+    db: Session, entity_id: int, period_id: Optional[int] = None
+) -> Query:
+    """Return BudgetLine query scoped to a single entity and (optionally) period.
+
+    If period_id is None, auto-resolves to the entity's latest executed
+    period (see :func:`queries.periods.latest_executed_periods`).
+
+    Excludes 'Total Budget' aggregate rows.
+    """
+    q = db.query(BudgetLine).filter(
+        BudgetLine.entity_id == entity_id,
+        BudgetLine.category != TOTAL_BUDGET_CATEGORY,
+    )
+    period_id = period_id or latest_executed_period(db, entity_id)
+    if period_id:
+        q = q.filter(BudgetLine.period_id == period_id)
+    return q
+
+
+def latest_budget_totals(
+    db: Session, entity_ids: Iterable[int]
+) -> Dict[int, Tuple[float, float]]:
+    """(allocated, spent) for each entity's latest executed fiscal period.
+
+    Same period choice as :func:`entity_period_budget_query`, resolved for
+    the whole batch from one grouped query.
+    """
+    ids = sorted({e for e in entity_ids if e is not None})
+    if not ids:
+        return {}
+    rows = (
+        db.query(
+            BudgetLine.entity_id,
+            FiscalPeriod.start_date,
+            func.sum(BudgetLine.allocated_amount),
+            func.sum(BudgetLine.actual_spent),
+        )
+        .join(FiscalPeriod, BudgetLine.period_id == FiscalPeriod.id)
+        .filter(
+            BudgetLine.entity_id.in_(ids),
+            BudgetLine.category != TOTAL_BUDGET_CATEGORY,
+        )
+        .group_by(BudgetLine.entity_id, BudgetLine.period_id, FiscalPeriod.start_date)
+        .all()
+    )
+
+    best: Dict[int, Tuple[bool, datetime, float, float]] = {}
+    for entity_id, start_date, allocated, spent in rows:
+        allocated_f = float(allocated or 0)
+        spent_f = float(spent or 0)
+        key = (spent_f > 0, start_date)
+        cur = best.get(entity_id)
+        if cur is None or key > (cur[0], cur[1]):
+            best[entity_id] = (key[0], start_date, allocated_f, spent_f)
+    return {eid: (v[2], v[3]) for eid, v in best.items()}
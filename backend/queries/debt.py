@@ -0,0 +1,91 @@
+"""Which ``loans`` rows count as debt, and the national debt book."""
+
+from typing import Dict, Iterable, List
+
+from models import DebtCategory, Loan
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Query, Session
+
+from queries.entities import national_entity_id
+
+
+def is_debt_loan(loan) -> bool:
+    """True when a Loan row counts as DEBT for total-debt aggregations.
+
+    The single piece of business logic this encodes: ``PENDING_BILLS``
+    rows live in the ``loans`` table for storage convenience but are
+    NOT borrowed money — they're unpaid obligations and must NOT be
+    summed into "total national debt" or any "debt-to-GDP" ratio.
+    Use this predicate (or :func:`debt_loans_query`) every time you
+    iterate ``loans`` to compute a debt total, so a future endpoint
+    can't silently inflate the displayed debt by 700B+ the way
+    ``/api/v1/debt/national`` did before this helper landed (the
+    pending-bills records from PR #84 started writing to the
+    ``loans`` table successfully and immediately broke the headline
+    Total Debt KPI on the frontend).
+
+    Loans with no ``debt_category`` set count as debt — that matches
+    every existing aggregator's pre-fix behaviour.
+    """
+    if loan.debt_category is None:
+        return True
+    return loan.debt_category != DebtCategory.PENDING_BILLS
+
+
+def debt_category_filter():
+    """SQL form of :func:`is_debt_loan`.
+
+    NULL handling matters here: ``loans.debt_category`` is nullable
+    (the model has a Python-side default of ``OTHER`` but the writer
+    can pass ``debt_category=None`` which overrides the default, and
+    older rows seeded before that default existed may also be NULL).
+    A naive ``debt_category != PENDING_BILLS`` filter silently drops
+    those rows — SQL's three-valued logic makes ``NULL != value``
+    evaluate to ``UNKNOWN``, treated as ``FALSE`` in WHERE. Mirror
+    :func:`is_debt_loan`'s "NULL counts as debt" rule by explicitly
+    OR-ing in the ``IS NULL`` branch.
+    """
+    return or_(
+        Loan.debt_category.is_(None),
+        Loan.debt_category != DebtCategory.PENDING_BILLS,
+    )
+
+
+def debt_loans_query(db: Session, entity_filter) -> Query:
+    """SQLAlchemy query for Loan rows that count as debt.
+
+    Pass ``entity_filter`` as a SQL expression — single entity
+    (``Loan.entity_id == eid``) or a set (``Loan.entity_id.in_(eids)``).
+    """
+    return db.query(Loan).filter(entity_filter, debt_category_filter())
+
+
+def national_debt_loans(db: Session) -> List[Loan]:
+    """National-government debt loans, largest outstanding balance first.
+
+    Empty when the national entity hasn't been seeded.
+    """
+    nat_id = national_entity_id(db)
+    if nat_id is None:
+        return []
+    return (
+        debt_loans_query(db, Loan.entity_id == nat_id)
+        .order_by(Loan.outstanding.desc())
+        .all()
+    )
+
+
+def debt_outstanding_by_entity(
+    db: Session, entity_ids: Iterable[int]
+) -> Dict[int, float]:
+    """``{entity_id: outstanding debt}`` for a batch, pending bills excluded."""
+    ids = sorted({e for e in entity_ids if e is not None})
+    if not ids:
+        return {}
+    rows = (
+        db.query(Loan.entity_id, func.sum(Loan.outstanding))
+        .filter(Loan.entity_id.in_(ids), debt_category_filter())
+        .group_by(Loan.entity_id)
+        .all()
+    )
+    return {entity_id: float(total or 0) for entity_id, total in rows}
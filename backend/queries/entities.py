@@ -0,0 +1,77 @@
+"""Entity lookups shared across endpoints."""
+
+from typing import Optional
+
+from models import Entity, EntityType
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from utils.counties import COUNTY_MAPPING
+
+from queries.memo import session_memo
+
+
+def national_entity(db: Session) -> Optional[Entity]:
+    """The national-government entity, or None before seeding."""
+    return session_memo(
+        db,
+        "national_entity",
+        lambda: db.query(Entity).filter(Entity.type == EntityType.NATIONAL).first(),
+    )
+
+
+def national_entity_id(db: Session) -> Optional[int]:
+    entity = national_entity(db)
+    return entity.id if entity is not None else None
+
+
+def county_entity(db: Session, county_id: str) -> Optional[Entity]:
+    """Resolve a county by numeric ID, zero-padded code, slug, or name.
+
+    The codebase exposes three ID shapes for counties:
+      * raw DB row id (``4``)
+      * 3-digit county code (``001``..``047``) used in COUNTY_MAPPING
+      * slug (``nairobi-county``) or short name (``Nairobi``)
+
+    Different endpoints return different shapes, so we normalise here.
+    """
+    if not county_id:
+        return None
+    cid = str(county_id).strip()
+    counties = db.query(Entity).filter(Entity.type == EntityType.COUNTY)
+
+    # 1. 3-digit county code via COUNTY_MAPPING (e.g. "047" → "Mombasa").
+    #    Must precede the raw-DB-id branch: the /counties list endpoint
+    #    returns these zero-padded codes as `id`, and if we treated "047"
+    #    as DB row id=47 we'd resolve to a completely different county.
+    code_candidate = cid.zfill(3) if cid.isdigit() else cid
+    mapped = COUNTY_MAPPING.get(code_candidate) or COUNTY_MAPPING.get(cid)
+    if mapped:
+        entity = counties.filter(
+            or_(
+                Entity.canonical_name == mapped,
+                Entity.canonical_name == f"{mapped} County",
+                Entity.slug == f"{mapped.lower().replace(' ', '-')}-county",
+            )
+        ).first()
+        if entity:
+            return entity
+
+    # 2. Raw numeric DB id (falls through only when the code didn't match,
+    #    so long-form ids like "123" for a non-county row still resolve).
+    if cid.isdigit():
+        entity = counties.filter(Entity.id == int(cid)).first()
+        if entity:
+            return entity
+
+    # 3. Slug
+    entity = counties.filter(Entity.slug == cid.lower()).first()
+    if entity:
+        return entity
+
+    # 4. Case-insensitive name match
+    return counties.filter(
+        or_(
+            Entity.canonical_name.ilike(cid),
+            Entity.canonical_name.ilike(f"{cid} County"),
+        )
+    ).first()
@@ -0,0 +1,33 @@
+"""Per-session memoisation for the shared lookups in :mod:`queries`.
+
+A request handler often needs the same "latest county period" or
+"national entity" several times (once per aggregate it builds). The
+result is stored in ``session.info`` so repeat calls within one session
+are free, and is dropped whenever the session flushes, commits or rolls
+back so a writer never reads a stale answer back.
+"""
+
+from typing import Callable, Hashable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_MEMO_KEY = "_query_memo"
+
+
+def session_memo(db: Session, key: Hashable, compute: Callable[[], T]) -> T:
+    """Return ``compute()``, memoised on *db* under *key*."""
+    memo = db.info.setdefault(_MEMO_KEY, {})
+    if key not in memo:
+        memo[key] = compute()
+    return memo[key]
+
+
+def _drop_memo(session, *args) -> None:
+    session.info.pop(_MEMO_KEY, None)
+
+
+for _event in ("after_flush", "after_commit", "after_rollback"):
+    event.listen(Session, _event, _drop_memo)
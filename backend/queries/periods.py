@@ -0,0 +1,101 @@
+"""Fiscal-period resolution: which FY an aggregate should be scoped to."""
+
+from typing import Dict, Iterable, Optional
+
+from models import BudgetLine, Entity, EntityType, FiscalPeriod
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from queries.memo import session_memo
+
+# Aggregate rows some sources ship alongside the line items.
+TOTAL_BUDGET_CATEGORY = "Total Budget"
+
+
+def latest_county_period(db: Session) -> Optional[int]:
+    """Return the period_id of the latest FiscalPeriod that has county BudgetLines.
+
+    This ensures sector/budget queries are scoped to a single fiscal year and
+    only include county-level data — never national budget lines or aggregate rows.
+    Returns None if no county budget lines exist.
+    """
+
+    def _compute():
+        row = (
+            db.query(BudgetLine.period_id)
+            .join(Entity, BudgetLine.entity_id == Entity.id)
+            .join(FiscalPeriod, BudgetLine.period_id == FiscalPeriod.id)
+            .filter(Entity.type == EntityType.COUNTY)
+            .filter(BudgetLine.category != TOTAL_BUDGET_CATEGORY)
+            .order_by(FiscalPeriod.start_date.desc())
+            .limit(1)
+            .first()
+        )
+        return row[0] if row else None
+
+    return session_memo(db, "latest_county_period", _compute)
+
+
+def latest_national_period(db: Session) -> Optional[int]:
+    """Return the period_id of the latest FiscalPeriod that has national BudgetLines."""
+
+    def _compute():
+        row = (
+            db.query(BudgetLine.period_id)
+            .join(Entity, BudgetLine.entity_id == Entity.id)
+            .join(FiscalPeriod, BudgetLine.period_id == FiscalPeriod.id)
+            .filter(Entity.type == EntityType.NATIONAL)
+            .order_by(FiscalPeriod.start_date.desc())
+            .limit(1)
+            .first()
+        )
+        return row[0] if row else None
+
+    return session_memo(db, "latest_national_period", _compute)
+
+
+def latest_executed_periods(
+    db: Session, entity_ids: Iterable[int]
+) -> Dict[int, int]:
+    """``{entity_id: period_id}`` of each entity's latest *executed* period.
+
+    Prefers the latest period whose ``actual_spent`` sums above zero, so a
+    fiscal year that has been seeded with allocations but not yet with
+    spending doesn't render as "0% execution". Falls back to the latest
+    period by ``start_date`` when no period has execution data (first-year
+    county, seed data issues). "Total Budget" aggregate rows are ignored.
+    One grouped query for the whole batch.
+    """
+    ids = sorted({e for e in entity_ids if e is not None})
+    if not ids:
+        return {}
+    rows = (
+        db.query(
+            BudgetLine.entity_id,
+            BudgetLine.period_id,
+            FiscalPeriod.start_date,
+            func.coalesce(func.sum(BudgetLine.actual_spent), 0),
+        )
+        .join(FiscalPeriod, BudgetLine.period_id == FiscalPeriod.id)
+        .filter(
+            BudgetLine.entity_id.in_(ids),
+            BudgetLine.category != TOTAL_BUDGET_CATEGORY,
+        )
+        .group_by(BudgetLine.entity_id, BudgetLine.period_id, FiscalPeriod.start_date)
+        .all()
+    )
+    best: Dict[int, tuple] = {}
+    for entity_id, period_id, start_date, spent in rows:
+        rank = (float(spent or 0) > 0, start_date)
+        if entity_id not in best or rank > best[entity_id][0]:
+            best[entity_id] = (rank, period_id)
+    return {entity_id: period_id for entity_id, (_, period_id) in best.items()}
+
+
+def latest_executed_period(db: Session, entity_id: int) -> Optional[int]:
+    """Single-entity form of :func:`latest_executed_periods`."""
+    return session_memo(
+        db,
+        ("latest_executed_period", entity_id),
+        lambda: latest_executed_periods(db, [entity_id]).get(entity_id),
+    )
@@ -0,0 +1,23 @@
+"""Population lookups backed by the ``entity_latest_stats`` projection."""
+
+from typing import Dict
+
+from models import Entity, EntityLatestStats
+from sqlalchemy.orm import Session
+
+from queries.memo import session_memo
+
+
+def population_map(db: Session) -> Dict[str, int]:
+    """Return ``{entity canonical name: latest population}``."""
+
+    def _compute():
+        rows = (
+            db.query(Entity.canonical_name, EntityLatestStats.total_population)
+            .join(EntityLatestStats, EntityLatestStats.entity_id == Entity.id)
+            .filter(EntityLatestStats.total_population.isnot(None))
+            .all()
+        )
+        return {name: int(pop) for name, pop in rows if pop}
+
+    return session_memo(db, "population_map", _compute)
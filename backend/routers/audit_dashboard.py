@@ -22,7 +22,7 @@ from sqlalchemy.orm import Session
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from cache.redis_cache import cached
+from cache.redis_cache import cached, register_commit_invalidations
 
 try:
     from database import get_db
@@ -39,6 +39,9 @@ except Exception:
 router = APIRouter(prefix="/api/v1/audit", tags=["Audit Dashboard"])
 logger = logging.getLogger(__name__)
 
+if DATABASE_AVAILABLE:
+    register_commit_invalidations()
+
 
 # ===== Response Models =====
 
@@ -120,6 +123,23 @@ def _check_db(db: Session):
         raise HTTPException(status_code=503, detail="Database not available")
 
 
+def _list_agg(column, dialect: str):
+    """Aggregate ``column`` into a list: ``array_agg`` on Postgres,
+    ``group_concat`` (comma-separated string) elsewhere."""
+    if dialect == "postgresql":
+        return func.array_agg(column)
+    return func.group_concat(column)
+
+
+def _split_agg(value) -> List[int]:
+    """Normalise a ``_list_agg`` result to a list of ints, dropping NULLs."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [int(v) for v in value.split(",") if v]
+    return [int(v) for v in value if v is not None]
+
+
 # ===== Endpoints =====
 
 
@@ -291,100 +311,61 @@ async def get_audit_trends(
 
 
 @router.get("/recurring", response_model=RecurringFindingsResponse)
+@cached(ttl=3600, key_prefix="audit_recurring")
 async def get_recurring_findings(db: Session = Depends(get_db)):
     """Return findings flagged as recurring or appearing in 2+ years.
 
-    Optimised: uses JOINs to fetch entity names and SQL aggregation to
-    avoid N+1 per-row entity lookups.
+    A (entity_id, query_type) group is recurring if any finding in it is
+    flagged ``Recurring`` or, for typed findings, it spans 2+ distinct
+    audit years. Detection, the year/ID lists and amount totals all come
+    from one grouped query served by ``ix_audits_entity_querytype_year``;
+    the cached result is dropped whenever an audits write commits.
     """
     _check_db(db)
     try:
-        # INDEX hint: CREATE INDEX ix_audits_entity_qtype_year
-        #   ON audits(entity_id, query_type, audit_year)
-
-        # --- Step 1: identify recurring (entity_id, query_type) groups ---
-        # A group is recurring if explicitly flagged OR spans 2+ years.
-
-        # 1a. Groups with at least one "Recurring" flag
-        flagged_keys = (
-            db.query(Audit.entity_id, Audit.query_type)
-            .filter(Audit.follow_up_status == "Recurring")
-            .group_by(Audit.entity_id, Audit.query_type)
-            .all()
-        )
-
-        # 1b. Groups spanning 2+ distinct years
-        multi_year_keys = (
-            db.query(Audit.entity_id, Audit.query_type)
-            .filter(
-                Audit.audit_year.isnot(None),
-                Audit.query_type.isnot(None),
+        dialect = db.get_bind().dialect.name
+        query_type = func.coalesce(Audit.query_type, "Unknown")
+        rows = (
+            db.query(
+                Audit.entity_id,
+                query_type.label("query_type"),
+                func.max(Entity.canonical_name).label("county_name"),
+                _list_agg(func.distinct(Audit.audit_year), dialect).label("years"),
+                _list_agg(Audit.id, dialect).label("ids"),
+                func.coalesce(func.sum(Audit.amount), 0).label("amount"),
             )
+            .outerjoin(Entity, Entity.id == Audit.entity_id)
             .group_by(Audit.entity_id, Audit.query_type)
-            .having(func.count(func.distinct(Audit.audit_year)) >= 2)
+            .having(
+                or_(
+                    func.sum(
+                        case((Audit.follow_up_status == "Recurring", 1), else_=0)
+                    ) > 0,
+                    and_(
+                        Audit.query_type.isnot(None),
+                        func.count(func.distinct(Audit.audit_year)) >= 2,
+                    ),
+                )
+            )
+            .order_by(func.max(Entity.canonical_name), query_type)
             .all()
         )
 
-        # Union the two sets of keys
-        all_keys = {(eid, qt or "Unknown") for eid, qt in flagged_keys} | \
-                   {(eid, qt) for eid, qt in multi_year_keys}
-
-        if not all_keys:
-            return RecurringFindingsResponse(recurring_findings=[], total=0)
-
-        # --- Step 2: fetch all findings for these groups with JOIN ---
-        # Batch-load entity names to avoid N+1
-        all_entity_ids = list({eid for eid, _ in all_keys})
-        entity_name_map: Dict[int, str] = {}
-        if all_entity_ids:
-            for eid, name in (
-                db.query(Entity.id, Entity.canonical_name)
-                .filter(Entity.id.in_(all_entity_ids))
-                .all()
-            ):
-                entity_name_map[eid] = name
-
-        # Build result by querying findings per group (compatible with SQLite + Postgres)
-        result_map: Dict[tuple, dict] = {}
-        for entity_id, qt in all_keys:
-            qt_filter = Audit.query_type == qt if qt != "Unknown" else Audit.query_type.is_(None)
-            findings = (
-                db.query(Audit.id, Audit.audit_year, Audit.amount)
-                .filter(Audit.entity_id == entity_id, qt_filter)
-                .all()
+        recurring = [
+            RecurringFinding(
+                county_name=row.county_name or "Unknown",
+                query_type=row.query_type,
+                years_appeared=sorted(_split_agg(row.years)),
+                total_amount=float(row.amount),
+                finding_ids=sorted(set(_split_agg(row.ids))),
             )
-            years_set: set = set()
-            total_amt = 0.0
-            ids_list: list = []
-            for fid, yr, amt in findings:
-                if yr is not None:
-                    years_set.add(yr)
-                if amt is not None:
-                    total_amt += float(amt)
-                ids_list.append(fid)
-
-            result_map[(entity_id, qt)] = {
-                "county_name": entity_name_map.get(entity_id, "Unknown"),
-                "query_type": qt,
-                "years": years_set,
-                "amount": total_amt,
-                "ids": ids_list,
-            }
-
-        recurring = []
-        for v in result_map.values():
-            recurring.append(RecurringFinding(
-                county_name=v["county_name"],
-                query_type=v["query_type"],
-                years_appeared=sorted(v["years"]),
-                total_amount=v["amount"],
-                finding_ids=sorted(set(v["ids"])),
-            ))
+            for row in rows
+        ]
 
         return RecurringFindingsResponse(
             recurring_findings=recurring,
             total=len(recurring),
-        )
+        ).model_dump()
 
     except OperationalError as e:
         logger.error("Database connection error: %s", e)
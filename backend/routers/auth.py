@@ -59,12 +59,14 @@ class UserPublic(BaseModel):
     display_name: Optional[str]
     roles: list
     created_at: str
+    alert_emails: bool = True
 
     model_config = ConfigDict(from_attributes=True)
 
 
 class ProfileUpdate(BaseModel):
     display_name: Optional[str] = Field(None, max_length=120)
+    alert_emails: Optional[bool] = None
 
 
 # ── Endpoints ───────────────────────────────────────────────────────
@@ -102,6 +104,7 @@ def register(body: RegisterRequest, db: Session = Depends(get_db)):
             display_name=user.display_name,
             roles=user.roles or [],
             created_at=user.created_at.isoformat(),
+            alert_emails=user.alert_emails is not False,
         ),
     )
 
@@ -128,6 +131,7 @@ def login(body: LoginRequest, db: Session = Depends(get_db)):
             display_name=user.display_name,
             roles=user.roles or [],
             created_at=user.created_at.isoformat(),
+            alert_emails=user.alert_emails is not False,
         ),
     )
 
@@ -141,6 +145,7 @@ async def me(current_user: User = Depends(get_current_user)):
         display_name=current_user.display_name,
         roles=current_user.roles or [],
         created_at=current_user.created_at.isoformat(),
+        alert_emails=current_user.alert_emails is not False,
     )
 
 
@@ -153,6 +158,8 @@ async def update_profile(
     """Update display name or other profile fields."""
     if body.display_name is not None:
         current_user.display_name = body.display_name
+    if body.alert_emails is not None:
+        current_user.alert_emails = body.alert_emails
     db.commit()
     db.refresh(current_user)
     return UserPublic(
@@ -161,4 +168,5 @@ async def update_profile(
         display_name=current_user.display_name,
         roles=current_user.roles or [],
         created_at=current_user.created_at.isoformat(),
+        alert_emails=current_user.alert_emails is not False,
     )
@@ -0,0 +1,1265 @@
+"""
+Debt Router - National debt API
+
+Provides endpoints for:
+- National debt overview with categorized breakdown (CBK / Treasury loans)
+- Historical debt timeline with loans-table reconciliation
+- Individual national loans and the top loans by outstanding balance
+- IMF general-government ("broader") debt
+- Sustainability indicators, projections and EAC regional peers
+
+The national-entity and "which loans count as debt" lookups come from
+the shared ``queries`` layer.
+"""
+
+import datetime
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import queries
+from cache.redis_cache import cached
+from utils.response_meta import (
+    MAX_NATIONAL_BUDGET_KES,
+    check_plausibility,
+    response_meta,
+)
+
+try:
+    from database import get_db
+    from models import DebtTimeline, FiscalSummary, GDPData, ImfWeoObservation, Loan
+    from models import SourceDocument
+
+    DATABASE_AVAILABLE = True
+except Exception:
+    DATABASE_AVAILABLE = False
+
+    def get_db():
+        return None
+
+
+router = APIRouter(prefix="/api/v1/debt", tags=["Debt"])
+logger = logging.getLogger(__name__)
+
+
+@router.get("/timeline")
+@cached(key_prefix="debt:timeline", ttl=86400)
+async def get_debt_timeline(db: Session = Depends(get_db)):
+    """Get historical debt timeline (yearly external/domestic breakdown).
+
+    Reads from the debt_timeline table, seeded from CBK Annual Reports
+    and National Treasury Budget Policy Statements.
+    """
+    try:
+        rows = db.query(DebtTimeline).order_by(DebtTimeline.year.asc()).all()
+
+        if not rows:
+            return {
+                "status": "no_data",
+                "data_source": "database_empty",
+                "last_updated": None,
+                "source": "Run seeder: python -m seeding.cli seed --domain debt_timeline",
+                "years": 0,
+                "timeline": [],
+            }
+
+        timeline = []
+        for r in rows:
+            timeline.append(
+                {
+                    "year": r.year,
+                    "external": float(r.external),
+                    "domestic": float(r.domestic),
+                    "total": float(r.total),
+                    "gdp": float(r.gdp) if r.gdp else None,
+                    "gdp_ratio": float(r.gdp_ratio) if r.gdp_ratio else None,
+                }
+            )
+
+        # Source info from the DB source document
+        source_title = "Central Bank of Kenya Annual Reports & National Treasury BPS"
+        last_updated = None
+        if rows[0].source_document_id:
+            sdoc = (
+                db.query(SourceDocument)
+                .filter(SourceDocument.id == rows[0].source_document_id)
+                .first()
+            )
+            if sdoc:
+                source_title = sdoc.title or source_title
+        if rows[-1].updated_at:
+            last_updated = rows[-1].updated_at.isoformat()
+
+        # ── Cross-check against /debt/national (Loan sum) ──
+        # Same rationale as the reciprocal check on /debt/national:
+        # surface any divergence so callers can display an honest badge.
+        reconciliation: dict = {
+            "primary_source": "debt_timeline_table",
+            "primary_value_kes": (
+                float(rows[-1].total) * 1e9 if rows and rows[-1].total else None
+            ),
+            "secondary_source": "loans_table",
+            "secondary_value_kes": None,
+            "percent_diff": None,
+            "status": "unchecked",
+            "note": "",
+        }
+        try:
+            nat_id = queries.national_entity_id(db)
+            if nat_id is not None:
+                # Reconcile against /debt/national, which excludes
+                # PENDING_BILLS — match that filter (including the
+                # NULL-counts-as-debt rule from ``queries.is_debt_loan``) so
+                # the diff_pct below isn't dominated by a category
+                # mismatch.
+                loan_sum_f = queries.debt_outstanding_by_entity(db, [nat_id]).get(
+                    nat_id, 0.0
+                )
+                reconciliation["secondary_value_kes"] = loan_sum_f
+                primary_kes = reconciliation["primary_value_kes"]
+                if primary_kes and loan_sum_f > 0:
+                    diff_pct = abs(primary_kes - loan_sum_f) / primary_kes * 100
+                    reconciliation["percent_diff"] = round(diff_pct, 2)
+                    if diff_pct > 5.0:
+                        reconciliation["status"] = "divergent"
+                        reconciliation["note"] = (
+                            "DebtTimeline and loans_table disagree by more "
+                            "than 5%. These are independent sources."
+                        )
+                        logger.warning(
+                            "/debt/timeline reconciliation divergent: "
+                            "timeline=%.0f KES, loans=%.0f KES, diff=%.2f%%",
+                            primary_kes,
+                            loan_sum_f,
+                            diff_pct,
+                        )
+                    else:
+                        reconciliation["status"] = "consistent"
+        except Exception as exc:  # pragma: no cover
+            logger.warning("timeline reconciliation failed: %s", exc)
+
+        # ── Freshness + trust metadata ──────────────────────────────
+        covers_through_label = f"{rows[-1].year}" if rows else None
+        timeline_quality_notes: list[str] = []
+        if reconciliation.get("status") == "divergent":
+            timeline_quality_notes.append(
+                reconciliation.get("note")
+                or "Debt sources diverge beyond reconciliation threshold."
+            )
+        src_updated = rows[-1].updated_at if rows and rows[-1].updated_at else None
+
+        return {
+            "status": "success",
+            "data_source": "database",
+            "_meta": response_meta(
+                unit="billion_kes",
+                entity_scope="national",
+                covers_through=covers_through_label,
+                cache_ttl_seconds=86400,
+                source_updated_at=src_updated,
+                data_quality=(
+                    "mixed"
+                    if reconciliation.get("status") == "divergent"
+                    else "official"
+                ),
+                quality_notes=timeline_quality_notes or None,
+            ),
+            "last_updated": last_updated,
+            "source": source_title,
+            "years": len(timeline),
+            "timeline": timeline,
+            "reconciliation": reconciliation,
+        }
+    except Exception as e:
+        logger.error(f"Error fetching debt timeline: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/top-loans")
+@cached(key_prefix="debt:top-loans", ttl=3600)
+async def get_top_loans(limit: int = 10, db: Session = Depends(get_db)):
+    """Get top N national government loans by outstanding balance.
+
+    Reads from the database (loans table seeded from Treasury data).
+    """
+    try:
+        if not queries.national_entity(db):
+            return {
+                "loans": [],
+                "total_available": 0,
+                "limit": limit,
+                "source": "No national entity found — run seeder",
+            }
+
+        # Loans excluding pending bills, sorted by outstanding desc.
+        loans = queries.national_debt_loans(db)
+
+        if not loans:
+            return {
+                "loans": [],
+                "total_available": 0,
+                "limit": limit,
+                "source": "No loan records in database — run seeder",
+            }
+
+        top = loans[:limit]
+        result_loans = []
+        for loan in top:
+            outstanding = float(loan.outstanding or 0)
+            principal = float(loan.principal or 0)
+            rate = float(loan.interest_rate or 0) / 100
+            result_loans.append(
+                {
+                    "lender": loan.lender,
+                    "lender_type": (
+                        loan.debt_category.value if loan.debt_category else "other"
+                    ),
+                    "principal": str(principal),
+                    "outstanding": str(outstanding),
+                    "outstanding_numeric": outstanding,
+                    "principal_numeric": principal,
+                    "interest_rate": f"{float(loan.interest_rate or 0):.2f}%",
+                    "issue_date": (
+                        loan.issue_date.strftime("%Y-%m-%d") if loan.issue_date else ""
+                    ),
+                    "maturity_date": (
+                        loan.maturity_date.strftime("%Y-%m-%d")
+                        if loan.maturity_date
+                        else ""
+                    ),
+                    "currency": loan.currency,
+                    "status": (
+                        "active"
+                        if loan.maturity_date
+                        and loan.maturity_date
+                        > datetime.datetime.now(datetime.timezone.utc).replace(
+                            tzinfo=None
+                        )
+                        else "matured"
+                    ),
+                    "annual_service_cost": round(outstanding * rate, 2),
+                }
+            )
+
+        # Get source from first loan's source document
+        source_title = "National Treasury Public Debt Data"
+        if top[0].source_document_id:
+            sdoc = (
+                db.query(SourceDocument)
+                .filter(SourceDocument.id == top[0].source_document_id)
+                .first()
+            )
+            if sdoc and sdoc.title:
+                source_title = sdoc.title
+
+        return {
+            "_meta": response_meta(unit="kes", entity_scope="national"),
+            "loans": result_loans,
+            "total_available": len(loans),
+            "limit": limit,
+            "source": source_title,
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching top loans: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/loans")
+@cached(key_prefix="debt:loans", ttl=3600)
+async def get_national_loans(db: Session = Depends(get_db)):
+    """Get individual national government loan records with full detail.
+
+    Returns each loan with lender, principal, outstanding balance,
+    interest rate, issue date, maturity date, and status.
+    All data comes from the database (seeded from Treasury/CBK sources).
+    """
+    try:
+        if not queries.national_entity(db):
+            return {
+                "loans": [],
+                "total_loans": 0,
+                "total_outstanding": 0,
+                "total_annual_service_cost": 0,
+                "source": "No national entity found — run seeder",
+                "source_url": "",
+                "last_updated": "",
+            }
+
+        # All national loans (excluding pending bills), largest first.
+        loans = queries.national_debt_loans(db)
+
+        if not loans:
+            return {
+                "loans": [],
+                "total_loans": 0,
+                "total_outstanding": 0,
+                "total_annual_service_cost": 0,
+                "source": "No loan records in database — run seeder",
+                "source_url": "",
+                "last_updated": "",
+            }
+
+        national_loans = []
+        total_outstanding = 0.0
+        total_annual_service = 0.0
+
+        for loan in loans:
+            outstanding = float(loan.outstanding or 0)
+            principal = float(loan.principal or 0)
+            rate = float(loan.interest_rate or 0)
+            annual_cost = round(outstanding * (rate / 100), 2)
+
+            total_outstanding += outstanding
+            total_annual_service += annual_cost
+
+            national_loans.append(
+                {
+                    "lender": loan.lender,
+                    "lender_type": (
+                        loan.debt_category.value if loan.debt_category else "other"
+                    ),
+                    "principal": str(principal),
+                    "outstanding": str(outstanding),
+                    "outstanding_numeric": outstanding,
+                    "principal_numeric": principal,
+                    "interest_rate": f"{rate:.2f}%",
+                    "issue_date": (
+                        loan.issue_date.strftime("%Y-%m-%d") if loan.issue_date else ""
+                    ),
+                    "maturity_date": (
+                        loan.maturity_date.strftime("%Y-%m-%d")
+                        if loan.maturity_date
+                        else ""
+                    ),
+                    "currency": loan.currency,
+                    "status": (
+                        "active"
+                        if loan.maturity_date
+                        and loan.maturity_date
+                        > datetime.datetime.now(datetime.timezone.utc).replace(
+                            tzinfo=None
+                        )
+                        else "matured"
+                    ),
+                    "annual_service_cost": annual_cost,
+                }
+            )
+
+        # Determine source info from first loan's source document
+        source_title = "National Treasury Public Debt Data"
+        source_url = "https://www.treasury.go.ke/public-debt/"
+        last_updated = ""
+        if loans[0].source_document_id:
+            sdoc = (
+                db.query(SourceDocument)
+                .filter(SourceDocument.id == loans[0].source_document_id)
+                .first()
+            )
+            if sdoc:
+                source_title = sdoc.title or source_title
+                source_url = sdoc.url or source_url
+        if loans[0].updated_at:
+            last_updated = loans[0].updated_at.isoformat()
+
+        # Plausibility
+        check_plausibility(
+            total_outstanding,
+            MAX_NATIONAL_BUDGET_KES * 3,
+            "debt/loans total_outstanding",
+        )
+
+        return {
+            "_meta": response_meta(unit="kes", entity_scope="national"),
+            "loans": national_loans,
+            "total_loans": len(national_loans),
+            "total_outstanding": total_outstanding,
+            "total_annual_service_cost": total_annual_service,
+            "source": source_title,
+            "source_url": source_url,
+            "last_updated": last_updated,
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching national loans: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/national")
+@cached(
+    key_prefix="debt:national", ttl=43200
+)  # 12 hours — national debt data changes infrequently
+async def get_national_debt(db: Session = Depends(get_db)):
+    """Get national debt overview with categorized breakdown."""
+    # Try database first
+    if DATABASE_AVAILABLE:
+        try:
+            # Only the national entity's loans count as sovereign debt
+            nat_id = queries.national_entity_id(db)
+            loans = (
+                db.query(Loan).filter(Loan.entity_id == nat_id).all() if nat_id else []
+            )
+
+            if loans:
+                # Calculate totals — exclude PENDING_BILLS so the
+                # headline "Total Debt" KPI doesn't inflate by the
+                # ~702B of pending bills that PR #84 started landing
+                # in the loans table. The per-category breakdown
+                # below still reports pending_bills as its own line
+                # via ``categories["pending_bills"]``, so no data
+                # is lost — only the misleading top-level sum is
+                # corrected.
+                total_debt = sum(
+                    float(loan.principal or 0)
+                    for loan in loans
+                    if queries.is_debt_loan(loan)
+                )
+                total_outstanding = sum(
+                    float(loan.outstanding or 0)
+                    for loan in loans
+                    if queries.is_debt_loan(loan)
+                )
+
+                # Get real GDP from GDPData table
+                latest_gdp_row = db.query(GDPData).order_by(GDPData.year.desc()).first()
+                gdp_value = (
+                    float(latest_gdp_row.gdp_value or 0)
+                    if latest_gdp_row and latest_gdp_row.gdp_value
+                    else 0  # No hardcoded fallback; will show 0 until seeded
+                )
+                gdp_year = latest_gdp_row.year if latest_gdp_row else None
+
+                # Categorize by debt_category field if available, else by lender patterns
+                # Initialize category totals
+                categories = {
+                    "external_multilateral": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "external_bilateral": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "external_commercial": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "domestic_bonds": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "domestic_bills": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "domestic_overdraft": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "pending_bills": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "county_guaranteed": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                    "other": {
+                        "principal": 0,
+                        "outstanding": 0,
+                        "count": 0,
+                        "items": [],
+                    },
+                }
+
+                # Pattern matching for categorization (fallback if debt_category is None)
+                patterns = {
+                    "external_multilateral": [
+                        "World Bank",
+                        "IMF",
+                        "AfDB",
+                        "EIB",
+                        "IFAD",
+                        "IFC",
+                    ],
+                    "external_bilateral": [
+                        "China",
+                        "Japan",
+                        "France",
+                        "Germany",
+                        "United States",
+                        "Korea",
+                        "India",
+                        "Belgium",
+                        "UK",
+                        "Italy",
+                    ],
+                    "external_commercial": ["Eurobond", "Syndicated", "Commercial"],
+                    "domestic_bonds": [
+                        "Treasury Bond",
+                        "Infrastructure Bond",
+                        "Green Bond",
+                        "M-Akiba",
+                        "Retail Bond",
+                    ],
+                    "domestic_bills": [
+                        "Treasury Bill",
+                        "T-Bill",
+                        "91-day",
+                        "182-day",
+                        "364-day",
+                    ],
+                    "domestic_overdraft": ["Central Bank", "CBK", "Overdraft"],
+                    "pending_bills": ["Pending Bill", "Arrears"],
+                    "county_guaranteed": [
+                        "County",
+                        "Nairobi",
+                        "Mombasa",
+                        "Kisumu",
+                        "Nakuru",
+                    ],
+                }
+
+                def classify_loan(loan):
+                    # Use debt_category if available and not OTHER
+                    if hasattr(loan, "debt_category") and loan.debt_category:
+                        cat_value = (
+                            loan.debt_category.value
+                            if hasattr(loan.debt_category, "value")
+                            else str(loan.debt_category)
+                        )
+                        if cat_value != "OTHER" and cat_value != "other":
+                            return cat_value.lower()
+
+                    # Fallback to pattern matching based on lender name
+                    lender = (loan.lender or "").lower()
+                    for cat, terms in patterns.items():
+                        if any(term.lower() in lender for term in terms):
+                            return cat
+                    return "other"
+
+                for loan in loans:
+                    cat = classify_loan(loan)
+                    principal = float(loan.principal or 0)
+                    outstanding = float(loan.outstanding or 0)
+
+                    categories[cat]["principal"] += principal
+                    categories[cat]["outstanding"] += outstanding
+                    categories[cat]["count"] += 1
+                    categories[cat]["items"].append(
+                        {
+                            "lender": loan.lender,
+                            "principal": principal,
+                            "outstanding": outstanding,
+                            "interest_rate": (
+                                float(loan.interest_rate)
+                                if hasattr(loan, "interest_rate") and loan.interest_rate
+                                else None
+                            ),
+                        }
+                    )
+
+                # Calculate external vs domestic totals
+                external_cats = [
+                    "external_multilateral",
+                    "external_bilateral",
+                    "external_commercial",
+                ]
+                domestic_cats = [
+                    "domestic_bonds",
+                    "domestic_bills",
+                    "domestic_overdraft",
+                ]
+
+                external_debt = sum(categories[c]["principal"] for c in external_cats)
+                domestic_debt = sum(categories[c]["principal"] for c in domestic_cats)
+                pending_bills = categories["pending_bills"]["principal"]
+                county_debt = categories["county_guaranteed"]["principal"]
+
+                # ── Cross-check against DebtTimeline (aggregate series) ──
+                # The Loan table and DebtTimeline table are populated from
+                # different source documents (Treasury QEDR / CBK vs CBK
+                # Annual Report / BPS). They should agree within a few
+                # percent. If they disagree substantially we log a warning
+                # and surface the diff in the response so the UI can show
+                # an honest "data sources disagree" badge.
+                latest_timeline_row = (
+                    db.query(DebtTimeline).order_by(DebtTimeline.year.desc()).first()
+                )
+                reconciliation: dict = {
+                    "primary_source": "loans_table",
+                    "primary_value_kes": total_outstanding,
+                    "secondary_source": "debt_timeline_table",
+                    "secondary_value_kes": None,
+                    "secondary_year": None,
+                    "percent_diff": None,
+                    "status": "unchecked",
+                    "note": "",
+                }
+                if latest_timeline_row and latest_timeline_row.total:
+                    # DebtTimeline.total is in BILLIONS of KES.
+                    secondary_kes = float(latest_timeline_row.total) * 1e9
+                    reconciliation["secondary_value_kes"] = secondary_kes
+                    reconciliation["secondary_year"] = latest_timeline_row.year
+                    if total_outstanding > 0:
+                        diff_pct = (
+                            abs(total_outstanding - secondary_kes)
+                            / total_outstanding
+                            * 100
+                        )
+                        reconciliation["percent_diff"] = round(diff_pct, 2)
+                        if diff_pct > 5.0:
+                            reconciliation["status"] = "divergent"
+                            reconciliation["note"] = (
+                                "Loan-sum and DebtTimeline disagree by more "
+                                "than 5%. The two tables are seeded from "
+                                "different source documents; the loan-level "
+                                "sum is the authoritative value for this "
+                                "endpoint."
+                            )
+                            logger.warning(
+                                "/debt/national reconciliation divergent: "
+                                "loans=%.0f KES, timeline=%.0f KES, diff=%.2f%%",
+                                total_outstanding,
+                                secondary_kes,
+                                diff_pct,
+                            )
+                        else:
+                            reconciliation["status"] = "consistent"
+
+                return {
+                    "status": "success",
+                    "data_source": "database",
+                    "last_updated": datetime.datetime.now().isoformat(),
+                    "data": {
+                        "total_debt": total_debt,
+                        "total_outstanding": total_outstanding,
+                        "loan_count": len(loans),
+                        "gdp": gdp_value,
+                        "gdp_year": gdp_year,
+                        "debt_to_gdp_ratio": (
+                            round(total_outstanding / gdp_value * 100, 1)
+                            if gdp_value > 0
+                            else 0
+                        ),
+                        "reconciliation": reconciliation,
+                        # High-level breakdown
+                        "summary": {
+                            "external_debt": external_debt,
+                            "domestic_debt": domestic_debt,
+                            "pending_bills": pending_bills,
+                            "county_guaranteed": county_debt,
+                            "external_percentage": (
+                                round(external_debt / total_debt * 100, 1)
+                                if total_debt > 0
+                                else 0
+                            ),
+                            "domestic_percentage": (
+                                round(domestic_debt / total_debt * 100, 1)
+                                if total_debt > 0
+                                else 0
+                            ),
+                        },
+                        # Detailed categorized breakdown
+                        "categories": {
+                            cat: {
+                                "total_principal": data["principal"],
+                                "total_outstanding": data["outstanding"],
+                                "loan_count": data["count"],
+                                "percentage_of_total": (
+                                    round(data["principal"] / total_debt * 100, 2)
+                                    if total_debt > 0
+                                    else 0
+                                ),
+                                "items": data["items"][:5],  # Top 5 items per category
+                            }
+                            for cat, data in categories.items()
+                            if data["count"] > 0
+                        },
+                        "debt_sustainability": {
+                            "risk_level": (
+                                "High"
+                                if gdp_value > 0
+                                and total_outstanding / gdp_value > 0.65
+                                else ("Moderate" if gdp_value > 0 else "Unknown")
+                            ),
+                            "debt_to_gdp": (
+                                round(total_outstanding / gdp_value * 100, 1)
+                                if gdp_value > 0
+                                else 0
+                            ),
+                            "assessment": (
+                                "Kenya's debt remains elevated. The IMF classifies Kenya at high risk of debt distress."
+                                if gdp_value > 0
+                                and total_outstanding / gdp_value > 0.65
+                                else "Seed GDP data for full sustainability assessment."
+                            ),
+                        },
+                    },
+                    "currency": "KES",
+                    "source": "Central Bank of Kenya / National Treasury",
+                    "_meta": response_meta(unit="kes", entity_scope="national"),
+                }
+        except Exception as e:
+            logger.error(f"DB debt query failed: {e}")
+
+    # No hardcoded fallback — data must come from the database.
+    # Guide user to populate via the seeding pipeline.
+    return {
+        "status": "no_data",
+        "data_source": "database_empty",
+        "last_updated": None,
+        "message": (
+            "No national debt data in database. "
+            "Run: python -m seeding.cli seed --domain national_debt"
+        ),
+        "data": {
+            "total_debt": 0,
+            "total_outstanding": 0,
+            "loan_count": 0,
+            "gdp": 0,
+            "debt_to_gdp_ratio": 0,
+            "summary": {},
+            "categories": {},
+            "debt_sustainability": {},
+        },
+        "currency": "KES",
+        "source": "Central Bank of Kenya / National Treasury",
+    }
+
+
+# Default KES/USD rate used to convert IMF's USD-denominated nominal GDP
+# (`NGDPD`) into KES so we can display the debt figure in trillions of
+# shillings. The actual rate fluctuates; callers who want tighter
+# accuracy can override via env. This is documented in the response
+# payload (`fx_rate_used`) so readers can reproduce the math.
+IMF_BROADER_USD_KES = float(os.environ.get("IMF_BROADER_USD_KES", "130"))
+
+
+@router.get("/broader")
+async def get_debt_broader(db: Session = Depends(get_db)):
+    """IMF's General-Government Gross Debt for Kenya.
+
+    Companion to ``/api/v1/debt/national`` (which returns CBK's
+    Central-Government figure). The two measures differ by ~400-600B
+    KES — the gap is county-government debt, SOE guarantees, pension
+    arrears, and pending bills that Treasury's headline number leaves
+    out. The debt page renders both side-by-side so readers can see
+    the gap and we can later surface its components (Phase 2).
+
+    Returns a timeseries with each year's debt-to-GDP ratio and an
+    absolute KES estimate derived from IMF's USD GDP projection times
+    ``IMF_BROADER_USD_KES``. The last-fetched vintage is included so
+    the frontend can mark the value "stale" when the seeder has not
+    run recently.
+
+    **Caching**: the "unavailable" branch is NOT cached, so the first
+    hit after the seeder finishes will see fresh data without waiting
+    for a TTL to expire. Successful payloads are cached 24h since IMF
+    WEO only publishes twice a year.
+    """
+    if not DATABASE_AVAILABLE:
+        return {"status": "unavailable", "reason": "database_not_configured"}
+
+    # Latest vintage per indicator. IMF publishes new vintages twice a
+    # year; within a vintage, the same year can have different values
+    # across indicators, but we want the NEWEST snapshot we've seen.
+    latest_vintage_subq = (
+        db.query(func.max(ImfWeoObservation.vintage))
+        .filter(ImfWeoObservation.country_code == "KEN")
+        .scalar()
+    )
+    if latest_vintage_subq is None:
+        # Seeder has never populated the table. Frontend hides the card.
+        # Do NOT cache — otherwise the first seeder run leaves users
+        # stuck with "unavailable" for up to 24h.
+        return {"status": "unavailable", "reason": "not_seeded_yet"}
+    # Pass vintage as kwarg so @cached bakes it into the key —
+    # a new vintage invalidates the cache automatically.
+    return await _get_debt_broader_cached(
+        db=db, vintage=latest_vintage_subq.isoformat()
+    )
+
+
+@cached(key_prefix="debt:broader", ttl=86400)  # IMF WEO updates twice a year
+async def _get_debt_broader_cached(db: Session, vintage: str):
+    latest_vintage_subq = datetime.datetime.fromisoformat(vintage)
+
+    rows = (
+        db.query(ImfWeoObservation)
+        .filter(
+            ImfWeoObservation.country_code == "KEN",
+            ImfWeoObservation.vintage == latest_vintage_subq,
+        )
+        .order_by(ImfWeoObservation.indicator, ImfWeoObservation.year)
+        .all()
+    )
+
+    by_indicator: Dict[str, Dict[int, Any]] = {}
+    for row in rows:
+        bucket = by_indicator.setdefault(row.indicator, {})
+        bucket[row.year] = {
+            "value": float(row.value) if row.value is not None else None,
+            "is_projection": row.is_projection,
+        }
+
+    debt_pct = by_indicator.get("GGXWDG_NGDP", {})
+    gdp_usd = by_indicator.get("NGDPD", {})  # billions USD
+
+    fx = IMF_BROADER_USD_KES
+    timeseries = []
+    for year in sorted(set(debt_pct.keys()) | set(gdp_usd.keys())):
+        pct = debt_pct.get(year, {}).get("value")
+        gdp_b = gdp_usd.get(year, {}).get("value")
+        value_kes: float | None = None
+        gdp_kes: float | None = None
+        if pct is not None and gdp_b is not None:
+            # NGDPD is in USD billions → KES absolute
+            gdp_kes = gdp_b * 1e9 * fx
+            value_kes = gdp_kes * (pct / 100.0)
+        timeseries.append(
+            {
+                "year": year,
+                "debt_to_gdp": pct,
+                "gdp_kes": gdp_kes,
+                "value_kes": value_kes,
+                "is_projection": debt_pct.get(year, {}).get("is_projection", False),
+            }
+        )
+
+    # "Latest" = most recent ACTUAL (non-projection) year that has both
+    # debt% and GDP. The timeseries includes IMF forecasts out to 2030;
+    # picking the furthest year would show a 5-6 year projection as the
+    # "current" figure, which overstates debt (debt and USD GDP both
+    # grow over time) and confuses readers comparing against CBK's
+    # "as-of-today" total. Fall back to the latest projection only when
+    # no non-projection rows exist (i.e. a very old vintage or brand-new
+    # country with only forecasts available).
+    complete = [t for t in timeseries if t["value_kes"] is not None]
+    actuals = [t for t in complete if not t.get("is_projection")]
+    latest = (actuals or complete)[-1] if complete else None
+
+    # Stale = vintage > 60 days old. IMF WEO publishes twice a year
+    # (April/October) — 60 days after either release is a reasonable
+    # "something is probably wrong" threshold.
+    age_days = (datetime.datetime.now(datetime.timezone.utc) - latest_vintage_subq).days
+    stale = age_days > 60
+
+    return {
+        "status": "success",
+        "source": {
+            "name": "IMF World Economic Outlook",
+            "indicator": "General Government Gross Debt",
+            "code": "GGXWDG",
+            "dataset_url": "https://www.imf.org/external/datamapper/GGXWDG_NGDP@WEO/KEN",
+        },
+        "latest": latest,
+        "timeseries": timeseries,
+        "fx_rate_used": fx,
+        "vintage": latest_vintage_subq.isoformat(),
+        "vintage_age_days": age_days,
+        "stale": stale,
+        "as_of": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+# ── Debt Sustainability Indicators ─────────────────────────────────────
+
+
+@router.get("/sustainability")
+@cached(key_prefix="debt:sustainability", ttl=86400)
+async def get_debt_sustainability(db: Session = Depends(get_db)):
+    """Get debt sustainability indicators, projections, and regional comparison.
+
+    Returns debt-to-GDP, debt-service-to-revenue, external share,
+    5-year projections, and EAC regional peers.
+    """
+    try:
+        # Latest debt timeline entry (has debt/GDP data)
+        latest_dt = db.query(DebtTimeline).order_by(DebtTimeline.year.desc()).first()
+        # Latest fiscal summary (has debt service and revenue)
+        latest_fs = (
+            db.query(FiscalSummary).order_by(FiscalSummary.fiscal_year.desc()).first()
+        )
+
+        if not latest_dt and not latest_fs:
+            return {
+                "status": "no_data",
+                "note": "Run seeders: debt_timeline and fiscal_summary",
+                "debt_to_gdp": None,
+                "debt_service_to_revenue": None,
+                "external_debt_share": None,
+                "projections": [],
+                "regional_peers": _get_regional_peers(),
+            }
+
+        # ── Debt-to-GDP ────────────────────────────────────────────
+        debt_to_gdp = None
+        if latest_dt and latest_dt.gdp_ratio:
+            ratio = float(latest_dt.gdp_ratio)
+            if ratio > 55:
+                status = "above"
+            elif ratio > 50:
+                status = "warning"
+            else:
+                status = "below"
+            debt_to_gdp = {
+                "value": ratio,
+                "year": latest_dt.year,
+                "threshold_imf": 55.0,
+                "threshold_eac": 50.0,
+                "status": status,
+            }
+
+        # ── Debt Service to Revenue ────────────────────────────────
+        debt_service_to_revenue = None
+        if latest_fs and latest_fs.debt_service_cost and latest_fs.total_revenue:
+            ds = float(latest_fs.debt_service_cost)
+            rev = float(latest_fs.total_revenue)
+            if rev > 0:
+                ratio_val = round(ds / rev * 100, 1)
+                debt_service_to_revenue = {
+                    "value": ratio_val,
+                    "year": latest_fs.fiscal_year,
+                    "threshold": 30.0,
+                    "status": (
+                        "above"
+                        if ratio_val > 30
+                        else ("warning" if ratio_val > 25 else "below")
+                    ),
+                }
+
+        # ── External Debt Share ────────────────────────────────────
+        external_share = None
+        if latest_dt and latest_dt.total and latest_dt.external:
+            total = float(latest_dt.total)
+            ext = float(latest_dt.external)
+            if total > 0:
+                external_share = round(ext / total * 100, 1)
+
+        # ── 5-Year Projections (linear extrapolation) ──────────────
+        projections = _compute_debt_projections(db)
+
+        # ── Regional Peers ─────────────────────────────────────────
+        peers = _get_regional_peers(
+            kenya_ratio=(
+                float(latest_dt.gdp_ratio)
+                if latest_dt and latest_dt.gdp_ratio
+                else None
+            )
+        )
+
+        return {
+            "status": "success",
+            "_meta": response_meta(unit="percentage", entity_scope="national"),
+            "debt_to_gdp": debt_to_gdp,
+            "debt_service_to_revenue": debt_service_to_revenue,
+            "external_debt_share": external_share,
+            "projections": projections,
+            "regional_peers": peers,
+            "currency": "KES",
+            "source": "National Treasury BPS, CBK Annual Reports",
+        }
+
+    except Exception as e:
+        logger.error(f"Debt sustainability failed: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+def _compute_debt_projections(db: Session) -> list:
+    """Simple linear extrapolation of debt-to-GDP for next 5 years."""
+    # Fetch only the last 5 data points directly from DB (not all rows)
+    recent = (
+        db.query(DebtTimeline)
+        .filter(DebtTimeline.gdp_ratio.isnot(None))
+        .order_by(DebtTimeline.year.desc())
+        .limit(5)
+        .all()
+    )
+    if len(recent) < 2:
+        return []
+
+    # Reverse so oldest-first for the linear fit
+    recent = list(reversed(recent))
+    n = len(recent)
+    xs = [float(r.year) for r in recent]
+    ys = [float(r.gdp_ratio) for r in recent]
+
+    x_mean = sum(xs) / n
+    y_mean = sum(ys) / n
+    num = sum((xs[i] - x_mean) * (ys[i] - y_mean) for i in range(n))
+    den = sum((xs[i] - x_mean) ** 2 for i in range(n))
+
+    if den == 0:
+        return []
+
+    slope = num / den
+    intercept = y_mean - slope * x_mean
+
+    last_year = int(xs[-1])
+    projections = []
+    for i in range(1, 6):
+        proj_year = last_year + i
+        proj_val = round(slope * proj_year + intercept, 1)
+        projections.append({"year": proj_year, "projected_debt_to_gdp": proj_val})
+
+    return projections
+
+
+def _get_regional_peers(kenya_ratio: Optional[float] = None) -> list:
+    """Return EAC regional debt comparison with multiple indicators.
+
+    Fetches three indicators from World Bank + IMF APIs (cached 12 hours):
+      - Debt-to-GDP (%)
+      - Debt service to revenue (%)
+      - External debt share (%)
+
+    Falls back to verified static values when APIs are unreachable.
+    """
+    return _get_regional_peers_cached(kenya_ratio)
+
+
+# ── EAC peer data with multi-indicator support ────────────────────
+_EAC_COUNTRIES = {
+    "KEN": "Kenya",
+    "ETH": "Ethiopia",
+    "TZA": "Tanzania",
+    "UGA": "Uganda",
+    "RWA": "Rwanda",
+}
+
+# World Bank indicator codes
+_WB_INDICATORS = {
+    "debt_to_gdp": "GC.DOD.TOTL.GD.ZS",  # Central govt debt (% GDP)
+    "debt_service_to_revenue": "GC.XPN.INTP.RV.ZS",  # Interest payments (% revenue)
+    "external_debt_pct": "DT.DOD.DECT.GN.ZS",  # External debt stocks (% GNI)
+}
+
+# IMF DataMapper indicator codes (WEO dataset)
+_IMF_INDICATORS = {
+    "debt_to_gdp": "GGXWDG_NGDP",  # General govt gross debt (% GDP)
+}
+
+# Simple TTL cache: (timestamp, data)
+_peers_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+_PEERS_CACHE_TTL = 12 * 3600  # 12 hours
+
+_logger_peers = logging.getLogger("audit_app.regional_peers")
+
+
+def _wb_fetch_indicator(indicator_code: str, country_codes: str) -> Dict[str, float]:
+    """Fetch latest value per country for a single World Bank indicator.
+
+    Returns {ISO3: value} for countries that have data.
+    """
+    url = (
+        f"https://api.worldbank.org/v2/country/{country_codes}"
+        f"/indicator/{indicator_code}?format=json&per_page=100&date=2015:2026"
+    )
+    resp = httpx.get(url, timeout=8)
+    resp.raise_for_status()
+    wb_data = resp.json()
+
+    if not isinstance(wb_data, list) or len(wb_data) < 2 or not wb_data[1]:
+        return {}
+
+    # Keep the most recent non-null value per country
+    latest: Dict[str, Dict[str, Any]] = {}
+    for item in wb_data[1]:
+        if item.get("value") is not None:
+            iso = item["countryiso3code"]
+            year = int(item["date"])
+            if iso not in latest or year > latest[iso]["year"]:
+                latest[iso] = {"year": year, "value": float(item["value"])}
+
+    return {iso: d["value"] for iso, d in latest.items()}
+
+
+def _imf_fetch_debt_to_gdp() -> Dict[str, float]:
+    """Fetch debt-to-GDP from the IMF DataMapper API (WEO dataset).
+
+    Endpoint: /api/v1/GGXWDG_NGDP/{countries}?periods=2020,2021,...,2026
+    Returns {ISO3: value} for countries that have data.
+    """
+    countries = "/".join(_EAC_COUNTRIES.keys())
+    periods = ",".join(str(y) for y in range(2018, 2027))
+    url = (
+        f"https://www.imf.org/external/datamapper/api/v1"
+        f"/GGXWDG_NGDP/{countries}?periods={periods}"
+    )
+    resp = httpx.get(url, timeout=8)
+    resp.raise_for_status()
+    data = resp.json()
+
+    # IMF response: {"values": {"GGXWDG_NGDP": {"KEN": {"2023": 68.1, ...}, ...}}}
+    indicator_data = data.get("values", {}).get("GGXWDG_NGDP", {})
+    result: Dict[str, float] = {}
+    for iso, year_vals in indicator_data.items():
+        if not year_vals:
+            continue
+        # Get the most recent year with a value
+        latest_year = max(year_vals.keys())
+        val = year_vals[latest_year]
+        if val is not None:
+            result[iso] = round(float(val), 1)
+
+    return result
+
+
+def _get_regional_peers_cached(kenya_ratio: Optional[float] = None) -> list:
+    """Fetch EAC peers from World Bank + IMF APIs with 12-hour TTL cache."""
+    now = time.time()
+
+    # Check cache
+    if (
+        _peers_cache["data"] is not None
+        and (now - _peers_cache["ts"]) < _PEERS_CACHE_TTL
+    ):
+        cached = [dict(p) for p in _peers_cache["data"]]  # shallow copy
+        if kenya_ratio is not None:
+            for p in cached:
+                if p["country"] == "Kenya":
+                    p["debt_to_gdp"] = round(kenya_ratio, 1)
+        return cached
+
+    # ── Fetch all indicators ──────────────────────────────────────
+    codes_str = ";".join(_EAC_COUNTRIES.keys())
+    debt_gdp: Dict[str, float] = {}
+    service_rev: Dict[str, float] = {}
+    external_pct: Dict[str, float] = {}
+
+    # 1. Try IMF for debt-to-GDP (often more current than World Bank)
+    try:
+        debt_gdp = _imf_fetch_debt_to_gdp()
+        _logger_peers.info("IMF debt-to-GDP: got data for %d countries", len(debt_gdp))
+    except Exception as exc:
+        _logger_peers.debug("IMF API unavailable: %s", exc)
+
+    # 2. World Bank: debt-to-GDP (fallback if IMF missed countries)
+    try:
+        wb_debt_gdp = _wb_fetch_indicator(_WB_INDICATORS["debt_to_gdp"], codes_str)
+        for iso, val in wb_debt_gdp.items():
+            if iso not in debt_gdp:
+                debt_gdp[iso] = round(val, 1)
+        _logger_peers.info(
+            "WB debt-to-GDP: got data for %d countries", len(wb_debt_gdp)
+        )
+    except Exception as exc:
+        _logger_peers.debug("WB debt-to-GDP unavailable: %s", exc)
+
+    # 3. World Bank: debt service to revenue
+    try:
+        service_rev = _wb_fetch_indicator(
+            _WB_INDICATORS["debt_service_to_revenue"], codes_str
+        )
+        _logger_peers.info(
+            "WB debt-service/revenue: got data for %d countries", len(service_rev)
+        )
+    except Exception as exc:
+        _logger_peers.debug("WB debt-service/revenue unavailable: %s", exc)
+
+    # 4. World Bank: external debt as % of GNI
+    try:
+        external_pct = _wb_fetch_indicator(
+            _WB_INDICATORS["external_debt_pct"], codes_str
+        )
+        _logger_peers.info(
+            "WB external-debt%%: got data for %d countries", len(external_pct)
+        )
+    except Exception as exc:
+        _logger_peers.debug("WB external-debt%% unavailable: %s", exc)
+
+    # ── Verified fallback values (updated Mar 2026) ───────────────
+    # Used ONLY when both APIs are unreachable for a given indicator.
+    _fallback = {
+        "KEN": {
+            "debt_to_gdp": 68.0,
+            "debt_service_to_revenue": 57.6,
+            "external_debt_share": 52.3,
+        },
+        "ETH": {
+            "debt_to_gdp": 31.4,
+            "debt_service_to_revenue": 22.8,
+            "external_debt_share": 58.1,
+        },
+        "TZA": {
+            "debt_to_gdp": 48.2,
+            "debt_service_to_revenue": 15.3,
+            "external_debt_share": 61.5,
+        },
+        "UGA": {
+            "debt_to_gdp": 53.1,
+            "debt_service_to_revenue": 19.7,
+            "external_debt_share": 55.8,
+        },
+        "RWA": {
+            "debt_to_gdp": 67.2,
+            "debt_service_to_revenue": 13.5,
+            "external_debt_share": 68.4,
+        },
+    }
+
+    # ── Assemble peers ────────────────────────────────────────────
+    peers = []
+    for iso, name in _EAC_COUNTRIES.items():
+        fb = _fallback.get(iso, {})
+
+        # Debt-to-GDP: Kenya uses our CBK data; others prefer IMF/WB then fallback
+        if iso == "KEN" and kenya_ratio is not None:
+            d2g = kenya_ratio
+        else:
+            d2g = debt_gdp.get(iso) or fb.get("debt_to_gdp")
+
+        # Debt service to revenue
+        dsr = service_rev.get(iso) or fb.get("debt_service_to_revenue")
+
+        # External debt share
+        ext = external_pct.get(iso) or fb.get("external_debt_share")
+
+        peers.append(
+            {
+                "country": name,
+                "debt_to_gdp": round(d2g, 1) if d2g else None,
+                "debt_service_to_revenue": round(dsr, 1) if dsr else None,
+                "external_debt_share": round(ext, 1) if ext else None,
+            }
+        )
+
+    _peers_cache["ts"] = now
+    _peers_cache["data"] = peers
+    _logger_peers.info(
+        "Regional peers updated: %d/%d countries have full data",
+        sum(
+            1
+            for p in peers
+            if all(v is not None for k, v in p.items() if k != "country")
+        ),
+        len(peers),
+    )
+    return peers
@@ -36,6 +36,7 @@ try:
         PopulationData,
         PovertyIndex,
     )
+    from services.latest_stats import get_latest_stats
 
     DATABASE_AVAILABLE = True
 except Exception as e:
@@ -50,6 +51,20 @@ router = APIRouter(prefix="/api/v1/economic", tags=["Economic Data"])
 logger = logging.getLogger(__name__)
 
 
+def _latest_rows(db: Session, entity_id: Optional[int]):
+    """Latest ``(PopulationData, GDPData)`` rows for an entity (None = national).
+
+    Resolved through the ``entity_latest_stats`` projection: one keyed
+    lookup plus primary-key loads instead of ``ORDER BY year DESC`` scans.
+    """
+    stats = get_latest_stats(db, entity_id)
+    if stats is None:
+        return None, None
+    pop = db.get(PopulationData, stats.population_id) if stats.population_id else None
+    gdp = db.get(GDPData, stats.gdp_id) if stats.gdp_id else None
+    return pop, gdp
+
+
 # ===== Response Models =====
 
 
@@ -204,12 +219,7 @@ async def get_population_latest(db: Session = Depends(get_db)):
 
     try:
         # Try national-level record first (entity_id IS NULL)
-        row = (
-            db.query(PopulationData)
-            .filter(PopulationData.entity_id.is_(None))
-            .order_by(desc(PopulationData.year))
-            .first()
-        )
+        row, _ = _latest_rows(db, None)
 
         # Fallback: aggregate county populations if no national record exists
         if not row:
@@ -769,13 +779,8 @@ async def get_county_economic_profile(
         if not county:
             raise HTTPException(status_code=404, detail=f"County {county_id} not found")
 
-        # Get latest population
-        latest_pop = (
-            db.query(PopulationData)
-            .filter(PopulationData.entity_id == county_id)
-            .order_by(desc(PopulationData.year))
-            .first()
-        )
+        # Get latest population and GCP
+        latest_pop, latest_gcp = _latest_rows(db, county_id)
 
         pop_response = None
         if latest_pop:
@@ -804,14 +809,6 @@ async def get_county_economic_profile(
                 ),
             )
 
-        # Get latest GCP
-        latest_gcp = (
-            db.query(GDPData)
-            .filter(GDPData.entity_id == county_id)
-            .order_by(desc(GDPData.year), desc(GDPData.quarter))
-            .first()
-        )
-
         gcp_response = None
         per_capita_gcp = None
         if latest_gcp:
@@ -994,24 +991,11 @@ async def get_economic_summary(
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        # Get latest national population (entity_id is NULL for national)
-        latest_pop = (
-            db.query(PopulationData)
-            .filter(PopulationData.entity_id.is_(None))
-            .order_by(desc(PopulationData.year))
-            .first()
-        )
+        # Latest national population and GDP (entity_id is NULL for national)
+        latest_pop, latest_gdp = _latest_rows(db, None)
 
         total_population = latest_pop.total_population if latest_pop else None
 
-        # Get latest national GDP
-        latest_gdp = (
-            db.query(GDPData)
-            .filter(GDPData.entity_id.is_(None))
-            .order_by(desc(GDPData.year), desc(GDPData.quarter))
-            .first()
-        )
-
         total_gdp = float(latest_gdp.gdp_value) if latest_gdp else None
         gdp_growth_rate = (
             float(latest_gdp.gdp_growth_rate)
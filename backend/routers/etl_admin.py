@@ -301,13 +301,12 @@ async def trigger_etl_run(
     Queue a manual ETL run for ``source``.
 
     This writes an ``ingestion_jobs`` row with ``status=PENDING`` and
-    ``metadata.manual_trigger=true``. The existing scheduler/seeder
-    process is what actually picks up pending jobs and runs them —
-    we don't shell out to the pipeline here, both because it would
-    block the request for minutes and because the ETL machinery
-    already lives in a long-running worker that owns the per-source
-    locks. The returned ``job_id`` lets the operator follow the run
-    on /admin/ingestion.
+    ``metadata.manual_trigger=true`` and queues an ``etl.trigger`` job
+    for it on ``services.job_scheduler``. The scheduler (in-process, or
+    the ETL worker with ``JOB_EXECUTION=worker``) runs it and updates the
+    row — we don't run the pipeline here, since it would block the
+    request for minutes. The returned ``job_id`` lets the operator
+    follow the run on /admin/ingestion.
 
     Records an entry in ``admin_audit_log`` so the trigger is
     attributable.
@@ -317,6 +316,8 @@ async def trigger_etl_run(
     # ``Depends(_db_dep)`` above so its lifecycle (commit / rollback /
     # close) is owned by the framework, not this handler.
     from models import IngestionJob, IngestionStatus
+    from services import etl_jobs  # noqa: F401  (registers etl.trigger)
+    from services.job_scheduler import enqueue
     from utils.audit import record_admin_action
 
     if source not in VALID_SOURCES:
@@ -339,6 +340,13 @@ async def trigger_etl_run(
     db.add(job)
     db.commit()
     db.refresh(job)
+    queued = enqueue(
+        db,
+        "etl.trigger",
+        {"ingestion_job_id": job.id, "source": source, "dry_run": payload.dry_run},
+        key=f"etl:trigger:{job.id}",
+        priority=80,
+    )
 
     record_admin_action(
         db,
@@ -352,8 +360,9 @@ async def trigger_etl_run(
     return {
         "ok": True,
         "job_id": job.id,
+        "queue_job_id": queued.id,
         "source": source,
         "status": job.status.value,
         "dry_run": job.dry_run,
-        "note": "Job queued. The seeder picks up pending jobs on its next cycle.",
+        "note": "Job queued. Follow it on /admin/ingestion.",
     }
@@ -0,0 +1,261 @@
+"""
+ETL Jobs Router - Trigger and track ETL runs (admin / worker role)
+
+Provides endpoints for:
+- Light/deep discovery + ingest runs per source and their status
+- Targeted Treasury and COB document batches
+- Kenya pipeline start/status and data-source connectivity checks
+
+Runs are only queued here (``services.job_scheduler``) and executed by
+the scheduler, in-process or in the ETL worker (``JOB_EXECUTION``), so
+ingestion never runs on a request's event loop. Only mounted when
+``API_ROLE`` includes the admin role (see ``routers.registry``); a public
+read-only API process never imports this module or the ETL code behind it.
+"""
+
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from database import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
+from services import etl_jobs  # noqa: F401  (registers the ETL job handlers)
+from services import job_scheduler
+from sqlalchemy.orm import Session
+from supabase_auth import require_admin
+
+router = APIRouter(tags=["ETL Jobs"])
+logger = logging.getLogger(__name__)
+security = HTTPBearer()
+
+# Repository root: the top-level ``etl`` package lives here.
+_PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+)
+
+# ETL endpoints import the pipeline lazily on first use.
+ETL_AVAILABLE = True
+
+
+# ===== Response Models =====
+
+
+class ETLJobResponse(BaseModel):
+    job_id: str
+    status: str
+    country: str
+    started_at: str
+    completed_at: Optional[str] = None
+    documents_processed: int
+    errors: List[str]
+
+
+class ETLStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    progress: Dict[str, Any]
+    last_updated: str
+
+
+def _queued(row: Any, message: str) -> Dict[str, Any]:
+    return {"job_id": str(row.id), "status": row.status, "message": message}
+
+
+@router.post("/api/v1/admin/etl/run")
+async def run_etl_job(
+    source: str = Query(..., pattern="^(oag|cob|treasury)$"),
+    job: str = Query("light", pattern="^(light|deep)$"),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+):
+    """Manually trigger an ETL job for a source (light or deep).
+
+    Queues the run and returns its job_id; a queued or running run of the
+    same source and type is returned instead of a second one. Check
+    progress via GET /api/v1/admin/etl/status.
+    """
+    row = job_scheduler.enqueue(
+        db,
+        "etl.run",
+        {"source_key": source, "job_type": job},
+        key=f"etl:{source}:{job}",
+        priority=80,
+        resource_class="cpu" if job == "deep" else "network",
+    )
+    return _queued(row, "ETL job queued. Check /api/v1/admin/etl/status for progress.")
+
+
+@router.get("/api/v1/admin/etl/status")
+async def get_etl_jobs_status(
+    limit: int = Query(50, ge=1, le=500),
+    _actor=Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """Get status of recent ETL jobs, newest first.
+
+    Gated on ``require_admin`` so the job queue (source identifiers,
+    error messages) isn't readable by unauthenticated callers — matches
+    the rest of ``/admin/*``.
+    """
+    rows = job_scheduler.recent_jobs(db, prefix="etl.", limit=limit)
+    return {"jobs": {str(r.id): job_scheduler.describe(r) for r in rows}}
+
+
+@router.post("/api/v1/etl/treasury/run-batch", status_code=202)
+async def run_treasury_batch(db: Session = Depends(get_db)):
+    """Queue the targeted batch: latest 10 QEBR + 3 ABP + 5 Circulars."""
+    row = job_scheduler.enqueue(db, "etl.treasury_batch", key="etl:treasury:batch")
+    return _queued(row, "Treasury batch queued. Poll /api/v1/etl/status/{job_id}.")
+
+
+@router.post("/api/v1/etl/cob/run-batch", status_code=202)
+async def run_cob_batch(limit: int = 25, db: Session = Depends(get_db)):
+    """Queue a COB batch across national and consolidated county BIRR pages.
+    Default limit is 25 recent items to validate nested lists from 2014+.
+    """
+    row = job_scheduler.enqueue(
+        db, "etl.cob_batch", {"limit": limit}, key="etl:cob:batch"
+    )
+    return _queued(row, "COB batch queued. Poll /api/v1/etl/status/{job_id}.")
+
+
+@router.post("/api/v1/etl/kenya/start", response_model=ETLJobResponse)
+async def start_kenya_etl(db: Session = Depends(get_db)):
+    """Queue the ETL pipeline for Kenya government data."""
+    if not ETL_AVAILABLE:
+        raise HTTPException(status_code=503, detail="ETL pipeline not available")
+
+    row = job_scheduler.enqueue(db, "etl.kenya_pipeline", key="etl:kenya:pipeline")
+    return ETLJobResponse(
+        job_id=str(row.id),
+        status=row.status,
+        country="Kenya",
+        started_at=(row.started_at or row.run_at).isoformat(),
+        documents_processed=0,
+        errors=[],
+    )
+
+
+@router.get("/api/v1/etl/status/{job_id}", response_model=ETLStatusResponse)
+async def get_etl_status(job_id: str, db: Session = Depends(get_db)):
+    """Get status of a queued ETL job."""
+    row = job_scheduler.get_job(db, job_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job {job_id}")
+    progress = row.result if isinstance(row.result, dict) else {}
+    if row.error:
+        progress = {**progress, "error": row.error}
+    return ETLStatusResponse(
+        job_id=str(row.id),
+        status=row.status,
+        progress=progress,
+        last_updated=(
+            row.finished_at or row.started_at or row.created_at or row.run_at
+        ).isoformat(),
+    )
+
+
+@router.get("/api/v1/etl/kenya/sources")
+async def get_kenya_data_sources():
+    """Get available Kenya government data sources with real-time status."""
+    if not ETL_AVAILABLE:
+        raise HTTPException(status_code=503, detail="ETL pipeline not available")
+
+    try:
+        # Test real-time connection status
+        sys.path.append(_PROJECT_ROOT)
+
+        from etl_test_runner import SimpleKenyaETL
+
+        etl = SimpleKenyaETL()
+
+        # Quick connection test
+        treasury_status = etl.test_treasury_connection()
+
+        sources = [
+            {
+                "name": "Kenya National Treasury",
+                "url": "https://treasury.go.ke",
+                "document_types": [
+                    "budget",
+                    "expenditure_report",
+                    "debt_report",
+                    "financial_statements",
+                ],
+                "last_fetch": treasury_status.get("timestamp", "2024-01-15T10:30:00Z"),
+                "status": (
+                    "active" if treasury_status.get("accessible", False) else "error"
+                ),
+                "live_test_results": {
+                    "response_code": treasury_status.get("status_code"),
+                    "pdf_documents_found": treasury_status.get(
+                        "pdf_documents_found", 0
+                    ),
+                    "page_title": treasury_status.get("page_title", ""),
+                    "sample_documents": treasury_status.get("sample_pdfs", [])[:3],
+                },
+            },
+            {
+                "name": "Office of Auditor General",
+                "url": "https://oagkenya.go.ke",
+                "document_types": [
+                    "audit_report",
+                    "special_audits",
+                    "compliance_reports",
+                ],
+                "last_fetch": "2024-01-10T14:20:00Z",
+                "status": "timeout_issues",
+                "note": "Site occasionally experiences timeouts but contains valuable audit reports",
+            },
+            {
+                "name": "Controller of Budget",
+                "url": "https://cob.go.ke",
+                "document_types": ["budget_implementation_review", "quarterly_reports"],
+                "last_fetch": "2024-01-12T09:15:00Z",
+                "status": "pending_test",
+            },
+        ]
+
+        return {
+            "sources": sources,
+            "real_time_test": True,
+            "test_timestamp": treasury_status.get("timestamp"),
+            "summary": {
+                "total_sources": len(sources),
+                "active_sources": len([s for s in sources if s["status"] == "active"]),
+                "total_pdf_documents": treasury_status.get("pdf_documents_found", 0),
+            },
+        }
+
+    except Exception as e:
+        # Fall back to static data if real-time test fails
+        return {
+            "sources": [
+                {
+                    "name": "Kenya National Treasury",
+                    "url": "https://treasury.go.ke",
+                    "document_types": ["budget", "expenditure_report", "debt_report"],
+                    "last_fetch": "2024-01-15T10:30:00Z",
+                    "status": "active",
+                },
+                {
+                    "name": "Office of Auditor General",
+                    "url": "https://oagkenya.go.ke",
+                    "document_types": ["audit_report"],
+                    "last_fetch": "2024-01-10T14:20:00Z",
+                    "status": "active",
+                },
+                {
+                    "name": "Controller of Budget",
+                    "url": "https://cob.go.ke",
+                    "document_types": ["budget_implementation_review"],
+                    "last_fetch": "2024-01-12T09:15:00Z",
+                    "status": "active",
+                },
+            ],
+            "real_time_test": False,
+            "error": str(e),
+        }
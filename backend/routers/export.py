@@ -0,0 +1,423 @@
+"""
+Export Router - Bulk data exports
+
+Provides endpoints for:
+- Budget lines, optionally scoped to an entity and/or fiscal period
+- Audit findings, with the county/year/status/severity filters of
+  ``/api/v1/counties/{county_id}/audits/list``
+- National debt loans (pending bills opt-in), or one entity's loans
+
+Each export is streamed as NDJSON (default), CSV or Parquet
+(``?format=``). Rows are read through a server-side cursor
+(``yield_per``) and encoded one batch at a time, so memory use stays
+flat however many rows the table holds and the first bytes go out
+before the query has finished. Parquet needs ``pyarrow``; without it
+the endpoint answers 501.
+"""
+
+import csv
+import io
+import json
+import logging
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import queries
+
+try:
+    from database import get_db
+    from models import (
+        Audit,
+        BudgetLine,
+        Entity,
+        FiscalPeriod,
+        Loan,
+        Severity,
+        SourceDocument,
+    )
+
+    DATABASE_AVAILABLE = True
+except Exception:
+    DATABASE_AVAILABLE = False
+
+    def get_db():
+        return None
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/export", tags=["Export"])
+
+BATCH_SIZE = 1000  # rows per server-side fetch, CSV/NDJSON chunk and row group
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+FORMAT_QUERY = Query(
+    "ndjson", pattern="^(ndjson|csv|parquet)$", description="ndjson, csv or parquet"
+)
+
+# (column, kind) — kind fixes the JSON/CSV rendering and the Parquet type,
+# so every row group shares one schema even when a batch is all NULLs.
+Columns = Sequence[Tuple[str, str]]
+
+BUDGET_LINE_COLUMNS: Columns = (
+    ("id", "int"),
+    ("entity_id", "int"),
+    ("entity_name", "str"),
+    ("period_id", "int"),
+    ("period_label", "str"),
+    ("category", "str"),
+    ("subcategory", "str"),
+    ("allocated_amount", "float"),
+    ("actual_spent", "float"),
+    ("committed_amount", "float"),
+    ("currency", "str"),
+    ("source_document_id", "int"),
+    ("page_ref", "str"),
+    ("created_at", "datetime"),
+)
+
+AUDIT_COLUMNS: Columns = (
+    ("id", "int"),
+    ("entity_id", "int"),
+    ("entity_name", "str"),
+    ("fiscal_year", "str"),
+    ("finding_text", "str"),
+    ("severity", "str"),
+    ("status", "str"),
+    ("query_type", "str"),
+    ("amount", "float"),
+    ("audit_opinion", "str"),
+    ("audit_year", "int"),
+    ("recommended_action", "str"),
+    ("follow_up_status", "str"),
+    ("source_title", "str"),
+    ("source_url", "str"),
+    ("created_at", "datetime"),
+)
+
+LOAN_COLUMNS: Columns = (
+    ("id", "int"),
+    ("entity_id", "int"),
+    ("entity_name", "str"),
+    ("lender", "str"),
+    ("debt_category", "str"),
+    ("principal", "float"),
+    ("outstanding", "float"),
+    ("interest_rate", "float"),
+    ("issue_date", "datetime"),
+    ("maturity_date", "datetime"),
+    ("currency", "str"),
+    ("source_document_id", "int"),
+    ("updated_at", "datetime"),
+)
+
+
+def _plain(value: Any, kind: str) -> Any:
+    """Column value as a JSON/CSV/Arrow-friendly Python scalar."""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        value = value.value
+    if kind == "float":
+        return float(value)
+    if kind == "int":
+        return int(value)
+    if kind == "datetime":
+        return value if isinstance(value, (datetime, date)) else None
+    return str(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _ndjson_chunks(columns: Columns, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    names = [name for name, _ in columns]
+    for rows in batches:
+        yield "".join(
+            json.dumps(
+                {
+                    name: _plain(value, kind)
+                    for name, (_, kind), value in zip(names, columns, row)
+                },
+                default=_json_default,
+            )
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+def _csv_value(value: Any, kind: str) -> Any:
+    value = _plain(value, kind)
+    return value.isoformat() if isinstance(value, (datetime, date)) else value
+
+
+def _csv_chunks(columns: Columns, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    yield buffer.getvalue().encode("utf-8")
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            writer.writerow(
+                [_csv_value(value, kind) for (_, kind), value in zip(columns, row)]
+            )
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain.
+
+    ``tell`` keeps counting across drains: the Parquet writer records
+    absolute row-group offsets in the footer.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(columns: Columns):
+    import pyarrow as pa
+
+    types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "str": pa.string(),
+        "datetime": pa.timestamp("us"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _parquet_chunks(columns: Columns, batches: Iterable[Sequence]) -> Iterator[bytes]:
+    """One Parquet row group per batch, flushed to the client as written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(columns)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in batches:
+            arrays = [
+                pa.array(
+                    [_plain(row[i], kind) for row in rows], type=schema.field(i).type
+                )
+                for i, (_, kind) in enumerate(columns)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+ENCODERS = {"ndjson": _ndjson_chunks, "csv": _csv_chunks, "parquet": _parquet_chunks}
+
+
+def _batches(db: Session, stmt) -> Iterator[Sequence]:
+    """Rows of ``stmt`` in ``BATCH_SIZE`` lists from a server-side cursor."""
+    result = db.execute(stmt.execution_options(yield_per=BATCH_SIZE))
+    try:
+        for rows in result.partitions():
+            yield rows
+    finally:
+        result.close()
+
+
+def _export(db: Session, stmt, columns: Columns, fmt: str, name: str):
+    """Stream ``stmt``'s rows as ``fmt``.
+
+    The request's session stays open until the body has been sent
+    (FastAPI >= 0.118 closes yield dependencies after the response).
+    """
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=501, detail="Parquet export requires pyarrow"
+            )
+    return StreamingResponse(
+        ENCODERS[fmt](columns, _batches(db, stmt)),
+        media_type=MEDIA_TYPES[fmt],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{fmt}"',
+            # Snapshots of live tables; let the browser/CDN skip them.
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+def _require_db(db) -> None:
+    if not DATABASE_AVAILABLE or db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+
+@router.get("/budget_lines")
+def export_budget_lines(
+    entity_id: Optional[int] = Query(None),
+    period_id: Optional[int] = Query(None),
+    format: str = FORMAT_QUERY,
+    db: Session = Depends(get_db),
+):
+    """Budget lines (all, or one entity and/or period), ordered by id."""
+    _require_db(db)
+    stmt = (
+        select(
+            BudgetLine.id,
+            BudgetLine.entity_id,
+            Entity.canonical_name,
+            BudgetLine.period_id,
+            FiscalPeriod.label,
+            BudgetLine.category,
+            BudgetLine.subcategory,
+            BudgetLine.allocated_amount,
+            BudgetLine.actual_spent,
+            BudgetLine.committed_amount,
+            BudgetLine.currency,
+            BudgetLine.source_document_id,
+            BudgetLine.page_ref,
+            BudgetLine.created_at,
+        )
+        .join(Entity, BudgetLine.entity_id == Entity.id)
+        .join(FiscalPeriod, BudgetLine.period_id == FiscalPeriod.id)
+        .order_by(BudgetLine.id)
+    )
+    if entity_id is not None:
+        stmt = stmt.where(BudgetLine.entity_id == entity_id)
+    if period_id is not None:
+        stmt = stmt.where(BudgetLine.period_id == period_id)
+    return _export(db, stmt, BUDGET_LINE_COLUMNS, format, "budget_lines")
+
+
+@router.get("/audits")
+def export_audits(
+    county_id: Optional[str] = Query(None, description="County code, id, slug or name"),
+    year: Optional[str] = Query(None, description="Fiscal year e.g. FY2022/23"),
+    status: Optional[str] = Query(None),
+    severity: Optional[str] = Query(None),
+    format: str = FORMAT_QUERY,
+    db: Session = Depends(get_db),
+):
+    """Audit findings, newest first, with the county audit list's filters."""
+    _require_db(db)
+    source = aliased(SourceDocument)
+    stmt = (
+        select(
+            Audit.id,
+            Audit.entity_id,
+            Entity.canonical_name,
+            FiscalPeriod.label,
+            Audit.finding_text,
+            Audit.severity,
+            Audit.status,
+            Audit.query_type,
+            Audit.amount,
+            Audit.audit_opinion,
+            Audit.audit_year,
+            Audit.recommended_action,
+            Audit.follow_up_status,
+            source.title,
+            source.url,
+            Audit.created_at,
+        )
+        .join(Entity, Audit.entity_id == Entity.id)
+        .join(FiscalPeriod, Audit.period_id == FiscalPeriod.id)
+        .outerjoin(source, Audit.source_document_id == source.id)
+        .order_by(Audit.created_at.desc(), Audit.id.desc())
+    )
+    if county_id:
+        county = queries.county_entity(db, county_id)
+        if county is None:
+            raise HTTPException(status_code=404, detail="County not found")
+        stmt = stmt.where(Audit.entity_id == county.id)
+    if year:
+        stmt = stmt.where(FiscalPeriod.label == year)
+    if severity:
+        # Unknown severities are ignored, as on the list endpoint.
+        severity_lookup = Severity.__members__.get(severity.upper())
+        if severity_lookup:
+            stmt = stmt.where(Audit.severity == severity_lookup)
+    if status:
+        stmt = stmt.where(func.lower(Audit.status) == status.lower())
+    return _export(db, stmt, AUDIT_COLUMNS, format, "audits")
+
+
+@router.get("/loans")
+def export_loans(
+    entity_id: Optional[int] = Query(
+        None, description="Entity whose loans to export (default: national)"
+    ),
+    include_pending_bills: bool = Query(False),
+    format: str = FORMAT_QUERY,
+    db: Session = Depends(get_db),
+):
+    """Loans of one entity (the national government by default), largest first.
+
+    Pending bills are stored in ``loans`` but are not debt, so they are
+    left out unless ``include_pending_bills`` is set.
+    """
+    _require_db(db)
+    if entity_id is None:
+        entity_id = queries.national_entity_id(db)
+    stmt = (
+        select(
+            Loan.id,
+            Loan.entity_id,
+            Entity.canonical_name,
+            Loan.lender,
+            Loan.debt_category,
+            Loan.principal,
+            Loan.outstanding,
+            Loan.interest_rate,
+            Loan.issue_date,
+            Loan.maturity_date,
+            Loan.currency,
+            Loan.source_document_id,
+            Loan.updated_at,
+        )
+        .join(Entity, Loan.entity_id == Entity.id)
+        # Before seeding there is no national entity: export no rows.
+        .where(Loan.entity_id == entity_id)
+        .order_by(Loan.outstanding.desc(), Loan.id)
+    )
+    if not include_pending_bills:
+        stmt = stmt.where(queries.debt_category_filter())
+    return _export(db, stmt, LOAN_COLUMNS, format, "loans")
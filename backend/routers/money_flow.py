@@ -27,11 +27,14 @@ try:
 except Exception:
     _redis_cache = None
 
+from cache.redis_cache import register_response_cache, single_flight
+from monitoring.instrumentation import record_cache_lookup
+
 
 def _cached(key_prefix: str, ttl: int = 1800):
     """Cache decorator with Redis + in-memory fallback."""
     def decorator(fn):
-        _mem: Dict[str, Dict[str, Any]] = {}
+        _mem: Dict[str, Dict[str, Any]] = register_response_cache({})
 
         @functools.wraps(fn)
         async def wrapper(*args, **kwargs):
@@ -44,16 +47,27 @@ def _cached(key_prefix: str, ttl: int = 1800):
             if _redis_cache:
                 hit = _redis_cache.get(cache_key)
                 if hit is not None:
+                    record_cache_lookup(key_prefix, "hit")
                     return hit
-                result = await fn(*args, **kwargs)
-                _redis_cache.set(cache_key, result, ttl=ttl)
-                return result
-
-            rec = _mem.get(cache_key)
-            if rec and (time.time() - rec["ts"]) < ttl:
-                return rec["value"]
-            result = await fn(*args, **kwargs)
-            _mem[cache_key] = {"value": result, "ts": time.time()}
+
+                async def load():
+                    result = await fn(*args, **kwargs)
+                    _redis_cache.set(cache_key, result, ttl=ttl)
+                    return result
+
+            else:
+                rec = _mem.get(cache_key)
+                if rec and (time.time() - rec["ts"]) < ttl:
+                    record_cache_lookup(key_prefix, "hit")
+                    return rec["value"]
+
+                async def load():
+                    result = await fn(*args, **kwargs)
+                    _mem[cache_key] = {"value": result, "ts": time.time()}
+                    return result
+
+            result, coalesced = await single_flight(cache_key, load)
+            record_cache_lookup(key_prefix, "coalesced" if coalesced else "miss")
             return result
 
         wrapper._cache = _mem  # expose for test teardown
@@ -0,0 +1,104 @@
+"""
+Router Registry - Selective router mounting per deployment role
+
+A process mounts the routers for its role:
+- ``public``: the read-only API (dashboards, counties, debt, provenance)
+- ``admin``: admin endpoints plus the ETL job runner and scheduler
+- ``all``: both (the default; a single-process deploy)
+
+Routers are imported only when mounted, so a ``public`` replica never
+loads the ETL pipeline, the job scheduler or the job runner.
+"""
+
+import importlib
+import logging
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+PUBLIC = "public"
+ADMIN = "admin"
+ALL = "all"
+ROLES = (ALL, PUBLIC, ADMIN)
+
+# (module, roles, description) in mount order. Routes are matched in
+# registration order, so keep the more specific prefixes first.
+ROUTERS: List[Tuple[str, Tuple[str, ...], str]] = [
+    ("routers.etl_admin", (ADMIN,), "ETL admin router at /api/v1/admin/etl"),
+    ("routers.etl_jobs", (ADMIN,), "ETL job runner at /api/v1/etl, /api/v1/admin/etl"),
+    ("routers.economic", (PUBLIC,), "Economic data router at /api/v1/economic"),
+    ("routers.debt", (PUBLIC,), "Debt router at /api/v1/debt"),
+    (
+        "routers.national",
+        (PUBLIC,),
+        "National finance router at /api/v1/budget/overview, /fiscal/summary",
+    ),
+    ("routers.admin", (ADMIN,), "Admin router at /api/v1/admin"),
+    ("routers.admin_users", (ADMIN,), "Admin users router at /api/v1/admin/users"),
+    (
+        "routers.admin_audit_log",
+        (ADMIN,),
+        "Admin audit-log router at /api/v1/admin/audit-log",
+    ),
+    # Newsletter endpoints (welcome email, token-verified unsubscribe).
+    # Auth & watchlist are still handled by Supabase (frontend → Supabase direct).
+    ("routers.user_features", (PUBLIC,), "User features router (newsletter)"),
+    ("routers.audit_dashboard", (PUBLIC,), "Audit dashboard router at /api/v1/audit"),
+    (
+        "routers.money_flow",
+        (PUBLIC,),
+        "Money flow router at /api/v1/counties/*/money-flow",
+    ),
+    (
+        "routers.data_freshness",
+        (PUBLIC,),
+        "Data freshness router at /api/v1/data/freshness",
+    ),
+    (
+        "routers.data_provenance",
+        (PUBLIC,),
+        "Data provenance router at /api/v1/provenance",
+    ),
+    ("routers.export", (PUBLIC,), "Bulk export router at /api/v1/export"),
+    ("routers.snapshots", (PUBLIC,), "Static snapshot router at /api/v1/snapshots"),
+]
+
+
+def normalize_role(role: str) -> str:
+    role = (role or ALL).strip().lower()
+    if role not in ROLES:
+        logger.warning(f"Unknown API_ROLE {role!r}; mounting all routers")
+        return ALL
+    return role
+
+
+def routers_for_role(role: str) -> List[str]:
+    """Module names mounted for *role*, in mount order."""
+    role = normalize_role(role)
+    return [module for module, roles, _ in ROUTERS if role == ALL or role in roles]
+
+
+def role_includes(role: str, part: str) -> bool:
+    """True if a process running as *role* serves the *part* role."""
+    role = normalize_role(role)
+    return role == ALL or role == part
+
+
+def mount_routers(app, role: str) -> List[str]:
+    """Import and include the routers for *role*; return the ones mounted.
+
+    A router that fails to import is logged and skipped, as before, so one
+    broken optional dependency doesn't take the API down.
+    """
+    wanted = set(routers_for_role(role))
+    mounted = []
+    for module, _, description in ROUTERS:
+        if module not in wanted:
+            continue
+        try:
+            app.include_router(importlib.import_module(module).router)
+            mounted.append(module)
+            logger.info(f"{description} registered")
+        except Exception as e:
+            logger.warning(f"Could not register {module}: {e}")
+    return mounted
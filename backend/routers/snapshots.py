@@ -0,0 +1,40 @@
+"""
+Snapshots Router - Current static snapshot version
+
+Provides endpoints for:
+- The published snapshot version and, with ``STATIC_SNAPSHOT_CDN_URL``
+  set, the CDN URL of each pre-compressed endpoint body, so clients and
+  edge caches can fetch them without calling the API
+
+Snapshots are built by ``services.static_snapshots`` after seeding runs.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from fastapi import APIRouter, HTTPException
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.static_snapshots import cdn_urls, default_store
+
+router = APIRouter(prefix="/api/v1/snapshots", tags=["Snapshots"])
+
+
+@router.get("/current")
+async def current_snapshot():
+    """Version, generation time and per-endpoint ETag/CDN URLs."""
+    snapshot = default_store().current()
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="No snapshot published")
+    base_url = os.getenv("STATIC_SNAPSHOT_CDN_URL")
+    urls = cdn_urls(snapshot, base_url) if base_url else {}
+    return {
+        "version": snapshot.version,
+        "generated_at": snapshot.generated_at,
+        "endpoints": {
+            path: {"etag": entry.etag, "urls": urls.get(path)}
+            for path, entry in snapshot.entries.items()
+        },
+    }
@@ -275,19 +275,26 @@ def send_welcome(body: NewsletterRequest):
 class UnsubscribeVerifyRequest(BaseModel):
     email: EmailStr
     token: str
+    list: str = Field("newsletter", pattern="^(newsletter|alerts)$")
 
 
 @router.post("/api/v1/newsletter/unsubscribe-verify", response_model=NewsletterResponse)
 def unsubscribe_verify(body: UnsubscribeVerifyRequest, db: Session = Depends(get_db)):
-    """Token-verified unsubscribe — called from the email unsubscribe link."""
+    """Token-verified unsubscribe — called from the email unsubscribe link.
+
+    ``list=alerts`` (the watchlist alert digest) turns off the user's
+    alert emails instead; in-app alerts keep coming.
+    """
     from datetime import datetime, timezone
 
     from services.email_service import verify_unsubscribe_token
 
-    if not verify_unsubscribe_token(body.email, body.token):
+    if not verify_unsubscribe_token(body.email, body.token, body.list):
         raise HTTPException(
             status_code=403, detail="Invalid or expired unsubscribe link."
         )
+    if body.list == "alerts":
+        return _unsubscribe_alerts(body.email, db)
 
     existing = db.query(NewsletterSubscriber).filter_by(email=body.email).first()
     if not existing:
@@ -303,3 +310,18 @@ def unsubscribe_verify(body: UnsubscribeVerifyRequest, db: Session = Depends(get
     return NewsletterResponse(
         status="unsubscribed", message="You've been unsubscribed. Sorry to see you go!"
     )
+
+
+def _unsubscribe_alerts(email: str, db: Session) -> NewsletterResponse:
+    user = db.query(User).filter(User.email == email).first()
+    if not user:
+        return NewsletterResponse(status="not_found", message="Email not found.")
+    if user.alert_emails is False:
+        return NewsletterResponse(
+            status="already_unsubscribed", message="Alert emails are already off."
+        )
+    user.alert_emails = False
+    db.commit()
+    return NewsletterResponse(
+        status="unsubscribed", message="Alert emails are off for your watchlist."
+    )
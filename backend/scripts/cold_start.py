@@ -0,0 +1,231 @@
+"""Cold-start benchmark and import-time report for the API worker.
+
+Every deploy and every scale-from-zero on Render pays for ``import main``
+plus the first request before a byte is served. This script measures
+that in fresh interpreters, reports which modules dominate (from
+``python -X importtime``), and fails if any module that is meant to be
+imported lazily (AWS SDK, ETL pipeline, PDF/HTML parsers, the
+auto-seeder) is loaded by ``import main``.
+
+Startup hooks (reference-data bootstrap, auto-seeder) are not run: they
+need a database and are measured by the deploy itself.
+
+Usage:
+    cd backend && python -m scripts.cold_start                      # 5 runs, summary
+    cd backend && python -m scripts.cold_start --runs 10 \\
+        --json reports/cold_start.json --importtime reports/importtime.txt
+    cd backend && python -m scripts.cold_start --budget-ms 4000     # gate on median
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported on first use only; loading any of these at ``import main``
+# is a cold-start regression.
+DEFERRED_MODULES = (
+    "boto3",
+    "botocore",
+    "bs4",
+    "pandas",
+    "pdfplumber",
+    "PyPDF2",
+    "playwright",
+    "sentry_sdk",
+    "etl.kenya_pipeline",
+    "etl.knbs_parser",
+    "services.auto_seeder",
+    "services.live_data_fetcher",
+)
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+deferred = [m for m in {deferred!r} if m in sys.modules]
+from starlette.testclient import TestClient
+client = TestClient(main.app)
+status = client.get("/health").status_code
+t2 = time.perf_counter()
+print("@@COLD_START@@" + json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "first_request_ms": (t2 - t1) * 1000,
+    "status": status,
+    "deferred_loaded": deferred,
+}}))
+"""
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (BACKEND_DIR, env.get("PYTHONPATH")) if p
+    )
+    # Bytecode is cached after the first run; keep it that way so runs
+    # measure import work, not compilation.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def measure_once() -> Dict[str, object]:
+    """Run one fresh interpreter and return its timings."""
+    code = _CHILD.format(deferred=DEFERRED_MODULES)
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    process_ms = (time.perf_counter() - started) * 1000
+    for line in proc.stdout.splitlines():
+        if line.startswith("@@COLD_START@@"):
+            result = json.loads(line[len("@@COLD_START@@") :])
+            result["process_ms"] = process_ms
+            return result
+    raise RuntimeError(
+        f"cold-start child failed (exit {proc.returncode}):\n{proc.stderr[-4000:]}"
+    )
+
+
+def importtime_report(top: int = 25) -> Dict[str, List[Dict[str, object]]]:
+    """Parse ``python -X importtime -c 'import main'`` into a ranked report."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line.split("|", 2)
+            self_us = int(self_us.split(":")[-1])
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append(
+            {
+                "module": name.strip(),
+                "depth": depth,
+                "self_ms": self_us / 1000,
+                "cumulative_ms": cumulative_us / 1000,
+            }
+        )
+    return {
+        "direct_imports": sorted(
+            (r for r in rows if r["depth"] == 1),
+            key=lambda r: r["cumulative_ms"],
+            reverse=True,
+        )[:top],
+        "slowest_self": sorted(rows, key=lambda r: r["self_ms"], reverse=True)[:top],
+    }
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 1),
+        "min": round(min(values), 1),
+        "max": round(max(values), 1),
+    }
+
+
+def run(runs: int, top: int = 25) -> Dict[str, object]:
+    # One unmeasured warm-up so the bytecode cache is populated.
+    measure_once()
+    samples = [measure_once() for _ in range(runs)]
+    deferred = sorted({m for s in samples for m in s["deferred_loaded"]})
+    return {
+        "runs": runs,
+        "python": sys.version.split()[0],
+        "import_ms": _summary([s["import_ms"] for s in samples]),
+        "first_request_ms": _summary([s["first_request_ms"] for s in samples]),
+        "process_ms": _summary([s["process_ms"] for s in samples]),
+        "deferred_loaded": deferred,
+        "importtime": importtime_report(top),
+    }
+
+
+def _format_text(report: Dict[str, object]) -> str:
+    lines = [
+        f"cold start over {report['runs']} runs (python {report['python']})",
+        f"  import main       median {report['import_ms']['median']} ms",
+        f"  first request     median {report['first_request_ms']['median']} ms",
+        f"  whole process     median {report['process_ms']['median']} ms",
+        "",
+        "direct imports of main by cumulative time:",
+    ]
+    for row in report["importtime"]["direct_imports"]:
+        lines.append(f"  {row['cumulative_ms']:9.1f} ms  {row['module']}")
+    lines.append("")
+    lines.append("slowest modules (self time):")
+    for row in report["importtime"]["slowest_self"]:
+        lines.append(f"  {row['self_ms']:9.1f} ms  {row['module']}")
+    if report["deferred_loaded"]:
+        lines.append("")
+        lines.append(
+            "DEFERRED MODULES LOADED AT IMPORT: " + ", ".join(report["deferred_loaded"])
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--json", dest="json_path", help="write the report as JSON")
+    parser.add_argument(
+        "--importtime", dest="importtime_path", help="write the text report here"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="fail if the median whole-process cold start exceeds this",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.runs, args.top)
+    text = _format_text(report)
+    print(text)
+
+    for path, payload in (
+        (args.json_path, json.dumps(report, indent=2)),
+        (args.importtime_path, text),
+    ):
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write(payload + "\n")
+
+    failed = False
+    if report["deferred_loaded"]:
+        failed = True
+    if args.budget_ms is not None and report["process_ms"]["median"] > args.budget_ms:
+        print(
+            f"cold start median {report['process_ms']['median']} ms exceeds "
+            f"budget {args.budget_ms} ms"
+        )
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,645 @@
+"""Latency / query-count benchmark for the hot read endpoints.
+
+Seeds a database at production-like scale (47 counties x 10 fiscal
+years of CoB budget lines, thousands of audit findings, the national
+loan book, population/GDP, pending bills) and drives every path in
+``main._WARMUP_PATHS`` through the ASGI app, in-process:
+
+* **cold**: response caches cleared before every request, i.e. what the
+  first visitor after a deploy or a cache expiry pays;
+* **warm**: the same request served from the response cache.
+
+Per endpoint it reports p50/p95/p99 latency for both, the number of SQL
+statements a cold request issues, and the peak resident set size while
+serving it (Linux ``VmHWM``, reset before each endpoint via
+``/proc/self/clear_refs``; elsewhere the process-wide ``ru_maxrss``).
+The run fails when an endpoint errors or exceeds its budget in
+``scripts/load_budgets.json``.
+
+By default the database is a throwaway SQLite file; point
+``--database-url`` at a scratch Postgres to benchmark the real planner.
+The database is dropped and re-seeded unless ``--reuse`` is given.
+
+Usage:
+    cd backend && python -m scripts.load_bench                   # full scale
+    cd backend && python -m scripts.load_bench --scale 0.2 --iterations 5
+    cd backend && python -m scripts.load_bench --json reports/load_bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGETS = os.path.join(BACKEND_DIR, "scripts", "load_budgets.json")
+
+# Realistic row counts at scale 1.0.
+FISCAL_YEARS = 10
+FIRST_FISCAL_YEAR = 2015  # FY2015/16 .. FY2024/25
+COB_CATEGORIES = [
+    "Health",
+    "Education",
+    "Agriculture",
+    "Roads and Transport",
+    "Water and Sanitation",
+    "Trade and Industry",
+    "Lands and Housing",
+    "Finance and Planning",
+    "Public Service",
+    "County Assembly",
+    "Environment",
+    "Youth and Sports",
+]
+AUDITS_PER_COUNTY_YEAR = 8
+NATIONAL_LOANS = 120
+QUERY_TYPES = [
+    "Financial Irregularity",
+    "Unsupported Expenditure",
+    "Procurement Irregularity",
+    "Pending Bills",
+    "Asset Management",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of *values* (``pct`` in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def _latency_summary(samples_ms: List[float]) -> Dict[str, float]:
+    return {
+        "p50_ms": round(percentile(samples_ms, 50), 2),
+        "p95_ms": round(percentile(samples_ms, 95), 2),
+        "p99_ms": round(percentile(samples_ms, 99), 2),
+        "max_ms": round(max(samples_ms), 2) if samples_ms else 0.0,
+    }
+
+
+# ── peak RSS ──────────────────────────────────────────────────────────
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak-RSS watermark for this process (Linux only)."""
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size in MiB since the last :func:`reset_peak_rss`."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+# ── dataset ───────────────────────────────────────────────────────────
+
+
+def seed_dataset(
+    session,
+    counties: int = 47,
+    fiscal_years: int = FISCAL_YEARS,
+    audits_per_county_year: int = AUDITS_PER_COUNTY_YEAR,
+    national_loans: int = NATIONAL_LOANS,
+) -> Dict[str, int]:
+    """Insert a deterministic, production-shaped dataset and commit it.
+
+    Expects empty tables. Returns the number of rows written per table.
+    """
+    from models import (
+        Audit,
+        BillType,
+        BudgetLine,
+        Country,
+        DebtCategory,
+        DebtTimeline,
+        DocumentType,
+        Entity,
+        EntityType,
+        FiscalPeriod,
+        FiscalSummary,
+        GDPData,
+        Loan,
+        PendingBill,
+        PopulationData,
+        Severity,
+        SourceDocument,
+    )
+    from services.latest_stats import refresh_latest_stats
+    from sqlalchemy import insert
+    from utils.counties import COUNTY_MAPPING
+
+    counts: Dict[str, int] = {}
+
+    def _bulk(model, rows):
+        if rows:
+            session.execute(insert(model), rows)
+        counts[model.__tablename__] = counts.get(model.__tablename__, 0) + len(rows)
+
+    country = Country(
+        id=1,
+        iso_code="KEN",
+        name="Kenya",
+        currency="KES",
+        timezone="Africa/Nairobi",
+        default_locale="en_KE",
+    )
+    session.add(country)
+    session.flush()
+    docs = {
+        doc_type: SourceDocument(
+            country_id=country.id,
+            publisher="Controller of Budget"
+            if doc_type is DocumentType.BUDGET
+            else "Office of the Auditor-General",
+            title=f"Benchmark {doc_type.value} report",
+            url=f"https://example.go.ke/{doc_type.value}.pdf",
+            fetch_date=datetime(2025, 1, 1),
+            doc_type=doc_type,
+        )
+        for doc_type in (DocumentType.BUDGET, DocumentType.AUDIT, DocumentType.LOAN)
+    }
+    session.add_all(docs.values())
+    session.flush()
+    budget_doc = docs[DocumentType.BUDGET].id
+    audit_doc = docs[DocumentType.AUDIT].id
+    loan_doc = docs[DocumentType.LOAN].id
+
+    periods = []
+    for i in range(fiscal_years):
+        start = FIRST_FISCAL_YEAR + FISCAL_YEARS - fiscal_years + i
+        periods.append(
+            {
+                "id": i + 1,
+                "country_id": country.id,
+                "label": f"FY{start}/{(start + 1) % 100:02d}",
+                "start_date": datetime(start, 7, 1),
+                "end_date": datetime(start + 1, 6, 30),
+            }
+        )
+    _bulk(FiscalPeriod, periods)
+
+    national_id = 1
+    entities = [
+        {
+            "id": national_id,
+            "country_id": country.id,
+            "type": EntityType.NATIONAL,
+            "canonical_name": "National Government",
+            "slug": "national-government",
+        }
+    ]
+    county_ids = []
+    for n, (code, name) in enumerate(sorted(COUNTY_MAPPING.items())[:counties]):
+        county_ids.append(100 + n)
+        entities.append(
+            {
+                "id": 100 + n,
+                "country_id": country.id,
+                "type": EntityType.COUNTY,
+                "canonical_name": f"{name} County",
+                "slug": f"{name.lower().replace(' ', '-').replace(chr(39), '')}-county",
+                "alt_names": [name],
+                "meta": {"county_code": code},
+            }
+        )
+    _bulk(Entity, entities)
+
+    budget_lines, audits, pending = [], [], []
+    severities = [Severity.INFO, Severity.WARNING, Severity.CRITICAL]
+    bill_types = [BillType.SUPPLIER_ARREARS, BillType.SALARY, BillType.STATUTORY]
+    for c, entity_id in enumerate(county_ids):
+        for p, period in enumerate(periods):
+            start_year = period["start_date"].year
+            fy = f"{start_year}/{(start_year + 1) % 100:02d}"
+            for k, category in enumerate(COB_CATEGORIES):
+                allocated = Decimal(200_000_000 + 7_000_000 * c + 3_000_000 * k)
+                budget_lines.append(
+                    {
+                        "entity_id": entity_id,
+                        "period_id": period["id"],
+                        "category": category,
+                        "allocated_amount": allocated,
+                        "actual_spent": allocated * Decimal("0.78"),
+                        "currency": "KES",
+                        "source_document_id": budget_doc,
+                    }
+                )
+            for a in range(audits_per_county_year):
+                audits.append(
+                    {
+                        "entity_id": entity_id,
+                        "period_id": period["id"],
+                        "finding_text": (
+                            f"Finding {a} for entity {entity_id} in {period['label']}"
+                        ),
+                        "severity": severities[(c + a) % 3],
+                        "source_document_id": audit_doc,
+                        "query_type": QUERY_TYPES[a % len(QUERY_TYPES)],
+                        "amount": Decimal(1_500_000 * (a + 1)),
+                        "status": "Pending" if a % 2 else "Resolved",
+                        "audit_opinion": ["unqualified", "qualified", "adverse"][c % 3]
+                        if a == 0
+                        else None,
+                        "audit_year": start_year + 1,
+                        "follow_up_status": "Recurring" if a % 4 == 0 else None,
+                    }
+                )
+            for b, bill_type in enumerate(bill_types):
+                pending.append(
+                    {
+                        "entity_id": entity_id,
+                        "bill_type": bill_type,
+                        "amount": Decimal(50_000_000 + 1_000_000 * (c + b)),
+                        "fiscal_year": fy,
+                        "aging_days": 90 * (b + 1),
+                        "source_document_id": budget_doc,
+                    }
+                )
+    # National budget lines per year (Total Budget aggregate + ministries).
+    for period in periods:
+        for k, category in enumerate(["Total Budget"] + COB_CATEGORIES):
+            allocated = Decimal(3_500_000_000_000 if k == 0 else 90_000_000_000)
+            budget_lines.append(
+                {
+                    "entity_id": national_id,
+                    "period_id": period["id"],
+                    "category": category,
+                    "allocated_amount": allocated,
+                    "actual_spent": allocated * Decimal("0.85"),
+                    "currency": "KES",
+                    "source_document_id": budget_doc,
+                }
+            )
+    _bulk(BudgetLine, budget_lines)
+    _bulk(Audit, audits)
+    _bulk(PendingBill, pending)
+
+    categories = [c for c in DebtCategory if c is not DebtCategory.PENDING_BILLS]
+    loans = [
+        {
+            "entity_id": national_id,
+            "lender": f"Lender {n:03d}",
+            "debt_category": categories[n % len(categories)],
+            "principal": Decimal(40_000_000_000 + 100_000_000 * n),
+            "outstanding": Decimal(30_000_000_000 + 90_000_000 * n),
+            "interest_rate": Decimal("6.50"),
+            "issue_date": datetime(2010 + n % 15, 1 + n % 12, 1),
+            "currency": "KES",
+            "source_document_id": loan_doc,
+        }
+        for n in range(national_loans)
+    ]
+    loans.extend(
+        {
+            "entity_id": entity_id,
+            "lender": "County Pending Bills",
+            "debt_category": DebtCategory.PENDING_BILLS,
+            "principal": Decimal(150_000_000),
+            "outstanding": Decimal(150_000_000),
+            "issue_date": datetime(2024, 6, 30),
+            "currency": "KES",
+            "source_document_id": loan_doc,
+        }
+        for entity_id in county_ids
+    )
+    _bulk(Loan, loans)
+
+    years = range(FIRST_FISCAL_YEAR, FIRST_FISCAL_YEAR + FISCAL_YEARS)
+    _bulk(
+        PopulationData,
+        [
+            {
+                "entity_id": entity_id,
+                "year": year,
+                "total_population": 1_000_000 + 10_000 * n + 5_000 * (year - 2015),
+            }
+            for n, entity_id in enumerate(county_ids)
+            for year in (2019, 2024)
+        ]
+        + [{"entity_id": None, "year": 2024, "total_population": 52_400_000}],
+    )
+    _bulk(
+        GDPData,
+        [
+            {
+                "entity_id": entity_id,
+                "year": year,
+                "gdp_value": Decimal(80_000_000_000 + 1_000_000_000 * n),
+                "currency": "KES",
+            }
+            for n, entity_id in enumerate(county_ids)
+            for year in years
+        ]
+        + [
+            {
+                "entity_id": None,
+                "year": year,
+                "gdp_value": Decimal(10_000_000_000_000 + 800_000_000_000 * i),
+                "currency": "KES",
+            }
+            for i, year in enumerate(years)
+        ],
+    )
+    _bulk(
+        DebtTimeline,
+        [
+            {
+                "year": year,
+                "external": Decimal(3000 + 300 * i),
+                "domestic": Decimal(2800 + 350 * i),
+                "total": Decimal(5800 + 650 * i),
+                "gdp": Decimal(10000 + 800 * i),
+                "gdp_ratio": Decimal("58.0") + i,
+            }
+            for i, year in enumerate(years)
+        ],
+    )
+    _bulk(
+        FiscalSummary,
+        [
+            {
+                "fiscal_year": period["label"][2:],
+                "appropriated_budget": Decimal(3000 + 100 * i),
+                "total_revenue": Decimal(2200 + 90 * i),
+                "tax_revenue": Decimal(1900 + 80 * i),
+                "total_borrowing": Decimal(800 + 20 * i),
+                "debt_service_cost": Decimal(900 + 60 * i),
+                "county_allocation": Decimal(370 + 5 * i),
+            }
+            for i, period in enumerate(periods)
+        ],
+    )
+    refresh_latest_stats(session)
+    session.commit()
+    return counts
+
+
+# ── measurement ───────────────────────────────────────────────────────
+
+
+class QueryCounter:
+    """Counts SQL statements executed on *engine* while active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(self.engine, "before_cursor_execute", self._before)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+
+        event.remove(self.engine, "before_cursor_execute", self._before)
+
+
+def measure_endpoint(
+    client,
+    engine,
+    path: str,
+    iterations: int,
+    clear_caches: Callable[[], None],
+) -> Dict[str, object]:
+    """Cold and warm latency, SQL statements and peak RSS for one path."""
+    reset_peak_rss()
+    cold, queries, statuses = [], [], set()
+    for _ in range(iterations):
+        clear_caches()
+        with QueryCounter(engine) as counter:
+            started = time.perf_counter()
+            resp = client.get(path)
+            cold.append((time.perf_counter() - started) * 1000)
+        queries.append(counter.count)
+        statuses.add(resp.status_code)
+    rss_mb = peak_rss_mb()
+
+    warm, warm_queries = [], []
+    client.get(path)  # populate the response cache
+    for _ in range(iterations):
+        with QueryCounter(engine) as counter:
+            started = time.perf_counter()
+            resp = client.get(path)
+            warm.append((time.perf_counter() - started) * 1000)
+        warm_queries.append(counter.count)
+        statuses.add(resp.status_code)
+
+    return {
+        "path": path,
+        "statuses": sorted(statuses),
+        "cold": _latency_summary(cold),
+        "warm": _latency_summary(warm),
+        "queries_cold": max(queries),
+        "queries_warm": max(warm_queries),
+        "peak_rss_mb": round(rss_mb, 1),
+    }
+
+
+def run_endpoints(
+    client,
+    engine,
+    paths: Iterable[str],
+    iterations: int,
+    clear_caches: Callable[[], None],
+) -> List[Dict[str, object]]:
+    return [
+        measure_endpoint(client, engine, path, iterations, clear_caches)
+        for path in paths
+    ]
+
+
+# ── budgets ───────────────────────────────────────────────────────────
+
+
+def load_budgets(path: str) -> Dict[str, object]:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def budget_for(budgets: Dict[str, object], path: str) -> Dict[str, float]:
+    budget = dict(budgets.get("default", {}))
+    budget.update(budgets.get("paths", {}).get(path, {}))
+    return budget
+
+
+def check_budgets(
+    results: List[Dict[str, object]], budgets: Dict[str, object]
+) -> List[str]:
+    """Human-readable budget violations (empty when everything passes)."""
+    checks = (
+        ("cold_p95_ms", lambda r: r["cold"]["p95_ms"]),
+        ("warm_p95_ms", lambda r: r["warm"]["p95_ms"]),
+        ("queries_cold", lambda r: r["queries_cold"]),
+        ("queries_warm", lambda r: r["queries_warm"]),
+        ("peak_rss_mb", lambda r: r["peak_rss_mb"]),
+    )
+    failures = []
+    for result in results:
+        path = result["path"]
+        if any(status >= 400 for status in result["statuses"]):
+            failures.append(f"{path}: HTTP {result['statuses']}")
+        budget = budget_for(budgets, path)
+        for key, actual in checks:
+            limit = budget.get(key)
+            if limit is not None and actual(result) > limit:
+                failures.append(f"{path}: {key} {actual(result)} > budget {limit}")
+    return failures
+
+
+# ── CLI ───────────────────────────────────────────────────────────────
+
+
+def _prepare_environment(database_url: str) -> None:
+    """Point the app at the benchmark database before ``main`` is imported."""
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("ENVIRONMENT", "development")
+    os.environ.setdefault("API_ROLE", "public")
+    os.environ.setdefault("AUTO_SEEDER_ENABLED", "false")
+    os.environ.setdefault("AUTO_WARMUP_ENABLED", "false")
+    os.environ.pop("REDIS_URL", None)
+    if BACKEND_DIR not in sys.path:
+        sys.path.insert(0, BACKEND_DIR)
+
+
+def _register_sqlite_shims() -> None:
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.compiler import compiles
+
+    @compiles(JSONB, "sqlite")
+    def _compile_jsonb_sqlite(element, compiler, **kw):  # noqa: ARG001
+        return "TEXT"
+
+
+def _format_text(report: Dict[str, object]) -> str:
+    lines = [
+        f"load benchmark: {report['iterations']} iterations/endpoint, "
+        f"scale {report['scale']} on {report['dialect']}",
+        f"  seeded: {report['seeded']}",
+        "",
+        f"  {'endpoint':<48} {'cold p50/p95/p99 ms':>24} {'warm p95':>9} "
+        f"{'queries':>7} {'rss MB':>7}",
+    ]
+    for r in report["endpoints"]:
+        cold = r["cold"]
+        lines.append(
+            f"  {r['path'][:48]:<48} "
+            f"{cold['p50_ms']:>7.1f}/{cold['p95_ms']:>7.1f}/{cold['p99_ms']:>7.1f} "
+            f"{r['warm']['p95_ms']:>9.2f} {r['queries_cold']:>7} "
+            f"{r['peak_rss_mb']:>7.1f}"
+        )
+    if report["failures"]:
+        lines.append("")
+        lines.append("BUDGET FAILURES:")
+        lines.extend(f"  {f}" for f in report["failures"])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="fraction of the realistic row counts to seed (counties, audits, loans)",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS)
+    parser.add_argument("--json", dest="json_path", help="write the report as JSON")
+    parser.add_argument(
+        "--reuse", action="store_true", help="don't drop and re-seed the database"
+    )
+    parser.add_argument(
+        "--path", action="append", dest="paths", help="limit to these paths"
+    )
+    args = parser.parse_args(argv)
+
+    tmpdir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmpdir = tempfile.mkdtemp(prefix="load_bench_")
+        database_url = (
+            f"sqlite:///{os.path.join(tmpdir, 'bench.db')}?check_same_thread=false"
+        )
+    _prepare_environment(database_url)
+    _register_sqlite_shims()
+
+    import database
+    import main as app_module
+    from models import Base
+    from starlette.testclient import TestClient
+
+    engine = database.engine
+    if not args.reuse:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        with database.SessionLocal() as session:
+            seeded = seed_dataset(
+                session,
+                counties=max(1, round(47 * args.scale)),
+                audits_per_county_year=max(
+                    1, round(AUDITS_PER_COUNTY_YEAR * args.scale)
+                ),
+                national_loans=max(1, round(NATIONAL_LOANS * args.scale)),
+            )
+    else:
+        seeded = {}
+
+    # Loopback client address: the in-memory rate limiter exempts local
+    # traffic, as it does for a developer hitting the API locally.
+    client = TestClient(app_module.app, client=("127.0.0.1", 50000))
+    paths = args.paths or list(app_module._WARMUP_PATHS)
+    results = run_endpoints(
+        client, engine, paths, args.iterations, app_module.clear_all_caches
+    )
+    failures = check_budgets(results, load_budgets(args.budgets))
+
+    report = {
+        "python": sys.version.split()[0],
+        "dialect": engine.dialect.name,
+        "scale": args.scale,
+        "iterations": args.iterations,
+        "seeded": seeded,
+        "endpoints": results,
+        "failures": failures,
+    }
+    print(_format_text(report))
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(report, indent=2) + "\n")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Per-request middleware overhead: BaseHTTPMiddleware stack vs pure ASGI.
+
+Drives three builds of the same two-endpoint app straight through the
+ASGI interface (no sockets or HTTP client, so middleware cost is not
+hidden by transport noise), with ``--concurrency`` requests in flight:
+
+- ``none``     no middleware (baseline)
+- ``base_http`` the previous stack: gzip, CORS and the five
+               ``BaseHTTPMiddleware`` layers (cache headers, rate limit,
+               audit log, security headers, request logging)
+- ``asgi``     ``middleware.stack.install_middleware`` (metrics disabled)
+
+For each build it reports mean/p50/p95 latency, throughput, overhead
+over the baseline, and time to first body chunk for a streaming response.
+BaseHTTPMiddleware shows up there because each layer re-streams the body.
+The audit and request logs are silenced (WARNING level) for both
+stacks so log I/O does not dominate.
+
+Usage:
+    cd backend && python -m scripts.middleware_bench
+    cd backend && python -m scripts.middleware_bench --requests 5000 \\
+        --concurrency 100 --json reports/middleware_bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ.setdefault("ENABLE_METRICS", "false")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+from monitoring import query_tracing  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.middleware.gzip import GZipMiddleware  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from middleware.rate_limit import TokenBucketLimiter, route_cost  # noqa: E402
+from middleware.security import SecurityHeadersMiddleware  # noqa: E402
+from middleware.stack import install_middleware  # noqa: E402
+
+VARIANTS = ("none", "base_http", "asgi")
+CLIENT = ("10.1.2.3", 40000)  # non-loopback, so rate limiting applies
+STREAM_CHUNKS = 20
+STREAM_CHUNK_DELAY = 0.002  # seconds between chunks
+
+
+def _payload() -> dict:
+    return {
+        "items": [
+            {"id": i, "name": f"County {i}", "allocated": i * 1_000_000.5}
+            for i in range(60)
+        ]
+    }
+
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+    payload = _payload()
+
+    @app.get("/api/v1/items")
+    async def items():
+        return payload
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def chunks():
+            for i in range(STREAM_CHUNKS):
+                yield f"chunk {i}\n".encode()
+                await asyncio.sleep(STREAM_CHUNK_DELAY)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    if variant == "asgi":
+        install_middleware(app, cors_origins=["*"], rate_limit_calls=10**9)
+    elif variant == "base_http":
+        _install_base_http_stack(app)
+    return app
+
+
+def _install_base_http_stack(app: FastAPI) -> None:
+    """The stack as it was before the pure-ASGI rewrite."""
+    limiter = TokenBucketLimiter(10**9, 60)
+    request_logger = logging.getLogger("main")
+    audit_logger = logging.getLogger("middleware.security")
+
+    async def add_cache_headers(request, call_next):
+        response = await call_next(request)
+        path = request.url.path
+        if (
+            request.method == "GET"
+            and path.startswith("/api/v1/")
+            and response.status_code == 200
+            and not path.startswith("/api/v1/auth/")
+            and not path.startswith("/api/v1/account/")
+            and not path.startswith("/api/v1/watchlist")
+            and "cache-control" not in {k.lower() for k in response.headers.keys()}
+        ):
+            response.headers[
+                "Cache-Control"
+            ] = "public, max-age=60, stale-while-revalidate=3600"
+        return response
+
+    async def rate_limit(request, call_next):
+        client_ip = request.client.host if request.client else "unknown"
+        decision = limiter.hit(client_ip, route_cost(request.url.path))
+        if not decision.allowed:
+            return JSONResponse({"detail": "Rate limit exceeded"}, status_code=429)
+        return await call_next(request)
+
+    async def audit_log(request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        audit_logger.info(
+            "AUDIT: %s",
+            {
+                "client_ip": request.client.host if request.client else "unknown",
+                "method": request.method,
+                "path": request.url.path,
+                "query_params": str(request.query_params),
+                "status_code": response.status_code,
+                "duration_ms": round((time.time() - start_time) * 1000, 2),
+                "user_agent": request.headers.get("user-agent", "unknown"),
+            },
+        )
+        return response
+
+    async def security_headers(request, call_next):
+        response = await call_next(request)
+        for name, value in SecurityHeadersMiddleware.HEADERS.items():
+            response.headers[name] = value
+        return response
+
+    async def log_requests(request, call_next):
+        start = time.perf_counter()
+        token = query_tracing.start_request(request.url.path)
+        response = await call_next(request)
+        db = query_tracing.finish_request(token)
+        process_time = time.perf_counter() - start
+        response.headers["X-Process-Time"] = f"{process_time:.3f}"
+        request_logger.debug(
+            f"{request.method} {request.url} - {response.status_code} - "
+            f"{process_time:.3f}s - {db.summary()}"
+        )
+        return response
+
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=add_cache_headers)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.add_middleware(BaseHTTPMiddleware, dispatch=rate_limit)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=audit_log)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=security_headers)
+    app.add_middleware(BaseHTTPMiddleware, dispatch=log_requests)
+
+
+async def _call(app, path: str) -> Dict[str, float]:
+    """Send one GET through ``app``; return total and first-body latencies."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"accept-encoding", b"gzip"),
+            (b"user-agent", b"middleware-bench"),
+        ],
+        "client": CLIENT,
+        "server": ("bench", 80),
+    }
+    request_sent = False
+    first_body: Optional[float] = None
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # no disconnect until cancelled
+
+    async def send(message):
+        nonlocal first_body
+        if message["type"] == "http.response.body" and first_body is None:
+            if message.get("body"):
+                first_body = time.perf_counter()
+
+    started = time.perf_counter()
+    await app(scope, receive, send)
+    finished = time.perf_counter()
+    return {
+        "total": finished - started,
+        "first_body": (first_body or finished) - started,
+    }
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _run_variant(variant: str, requests: int, concurrency: int) -> dict:
+    app = build_app(variant)
+    for _ in range(20):  # build the middleware stack, warm code paths
+        await _call(app, "/api/v1/items")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(path):
+        async with semaphore:
+            return await _call(app, path)
+
+    started = time.perf_counter()
+    samples = await asyncio.gather(*(one("/api/v1/items") for _ in range(requests)))
+    wall = time.perf_counter() - started
+
+    stream_requests = max(concurrency, requests // 20)
+    streams = await asyncio.gather(
+        *(one("/api/v1/stream") for _ in range(stream_requests))
+    )
+    latencies = [s["total"] * 1000 for s in samples]
+    ttfb = [s["first_body"] * 1000 for s in streams]
+    return {
+        "requests": requests,
+        "throughput_rps": round(requests / wall, 1),
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p95_ms": round(_percentile(latencies, 95), 3),
+        "per_request_us": round(wall / requests * 1e6, 1),
+        "stream_first_body_p50_ms": round(_percentile(ttfb, 50), 3),
+    }
+
+
+def run(requests: int, concurrency: int) -> Dict[str, object]:
+    logging.getLogger().setLevel(logging.WARNING)
+    for name in ("main", "middleware", "monitoring"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    results = {
+        variant: asyncio.run(_run_variant(variant, requests, concurrency))
+        for variant in VARIANTS
+    }
+    baseline = results["none"]["per_request_us"]
+    for variant in VARIANTS:
+        results[variant]["overhead_us"] = round(
+            results[variant]["per_request_us"] - baseline, 1
+        )
+    return {
+        "python": sys.version.split()[0],
+        "concurrency": concurrency,
+        "variants": results,
+    }
+
+
+def _format_text(report: Dict[str, object]) -> str:
+    lines = [
+        f"middleware overhead, concurrency {report['concurrency']} "
+        f"(python {report['python']})",
+        f"  {'variant':<10} {'req/s':>9} {'µs/req':>8} {'overhead':>9} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'stream 1st body':>16}",
+    ]
+    for variant, r in report["variants"].items():
+        lines.append(
+            f"  {variant:<10} {r['throughput_rps']:>9} {r['per_request_us']:>8} "
+            f"{r['overhead_us']:>9} {r['p50_ms']:>8} {r['p95_ms']:>8} "
+            f"{r['stream_first_body_p50_ms']:>13} ms"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--json", dest="json_path", help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run(args.requests, args.concurrency)
+    print(_format_text(report))
+    if args.json_path:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json_path)), exist_ok=True)
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            fh.write(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
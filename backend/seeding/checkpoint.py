@@ -0,0 +1,129 @@
+"""Per-unit checkpoints for long seeding runs.
+
+A domain runner that works through independent units (a county, a PDF,
+an API page) commits each one with :meth:`Checkpoint.commit`. The unit is
+recorded on the run's ``IngestionJob.meta["checkpoint"]`` in the same
+transaction, so a timeout or crash only loses the unit in flight.
+``seed --resume <job_id>`` reloads the record and the runner skips the
+completed units. Expensive inputs (a downloaded and parsed PDF) can be
+kept with :meth:`Checkpoint.stash` so a resumed run doesn't fetch them
+again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("seeding.checkpoint")
+
+T = TypeVar("T")
+
+
+class Checkpoint:
+    """Completed-unit bookkeeping for one ``IngestionJob``."""
+
+    def __init__(
+        self,
+        session: Session,
+        job: Any = None,
+        *,
+        dry_run: bool = False,
+        stash_dir: Optional[Path] = None,
+    ) -> None:
+        self._session = session
+        self._job = job
+        self._dry_run = dry_run
+        self._stash_dir = Path(stash_dir).expanduser() if stash_dir else None
+        state = ((job.meta or {}) if job is not None else {}).get("checkpoint") or {}
+        self.completed: List[str] = list(state.get("completed") or [])
+        self._done = set(self.completed)
+        self.resumed = bool(self.completed)
+        self.skipped = 0
+
+    def done(self, unit: str) -> bool:
+        return unit in self._done
+
+    def pending(self, units: Iterable[str]) -> List[str]:
+        """``units`` minus those already committed, counting the skips."""
+        remaining = []
+        for unit in units:
+            if unit in self._done:
+                self.skipped += 1
+            else:
+                remaining.append(unit)
+        return remaining
+
+    def commit(
+        self, unit: str, *, processed: int = 0, created: int = 0, updated: int = 0
+    ) -> None:
+        """Commit the session's pending work as ``unit`` and record it on the job.
+
+        Dry runs only flush: nothing is committed, so nothing can be resumed.
+        """
+        self.completed.append(unit)
+        self._done.add(unit)
+        if self._dry_run or self._job is None:
+            self._session.flush()
+            return
+        job = self._job
+        job.items_processed = (job.items_processed or 0) + processed
+        job.items_created = (job.items_created or 0) + created
+        job.items_updated = (job.items_updated or 0) + updated
+        meta = dict(job.meta or {})
+        meta["checkpoint"] = {
+            "completed": list(self.completed),
+            "committed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        job.meta = meta
+        self._session.commit()
+
+    def _stash_path(self, name: str) -> Optional[Path]:
+        if self._stash_dir is None or self._job is None or self._dry_run:
+            return None
+        return self._stash_dir / f"job-{self._job.id}-{name}.json"
+
+    def stash(self, name: str, produce: Callable[[], T]) -> T:
+        """Return the stashed value ``name`` for this job, producing it once.
+
+        Values must be JSON-serializable; anything else is simply not
+        stashed and is produced again on resume.
+        """
+        path = self._stash_path(name)
+        if path is not None and path.exists():
+            try:
+                with path.open("r", encoding="utf-8") as handle:
+                    value = json.load(handle)
+                logger.info("Reusing stashed %s for resumed run", name)
+                return value
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.warning("Ignoring unreadable stash %s: %s", path, exc)
+        value = produce()
+        if path is not None and value is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp")
+                with tmp.open("w", encoding="utf-8") as handle:
+                    json.dump(value, handle)
+                tmp.replace(path)
+            except (OSError, TypeError, ValueError) as exc:
+                logger.warning("Could not stash %s: %s", name, exc)
+        return value
+
+    def clear_stash(self) -> None:
+        """Remove this job's stashed values once the run has completed."""
+        if self._stash_dir is None or self._job is None:
+            return
+        for path in self._stash_dir.glob(f"job-{self._job.id}-*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+__all__ = ["Checkpoint"]
@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import logging
+import multiprocessing
 import signal
 import sys
 import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Iterator, Optional, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from dotenv import load_dotenv
 
@@ -18,6 +22,7 @@ try:  # Avoid import-time cost if CLI unused
 except ImportError:  # pragma: no cover - defensive fallback
     SessionLocal = None  # type: ignore
 
+from .checkpoint import Checkpoint
 from .config import SeedingSettings, get_settings
 from .logging import configure_logging
 from .registries import REGISTRY, load_builtin_domains
@@ -108,48 +113,98 @@ def _ensure_db_sessionlocal() -> None:
         raise RuntimeError("SessionLocal could not be imported from database module")
 
 
-def run_seed_command(args: argparse.Namespace, settings: SeedingSettings) -> int:
-    logger = configure_logging(settings.log_level, settings.log_path)
+def _refresh_derived_snapshots(session, domain: str) -> None:
+    """Rebuild precomputed read models fed by *domain* after it commits.
 
-    load_builtin_domains()
+    The CLI runs outside the API process, so response caches shared via
+    Redis are invalidated explicitly here rather than by the in-process
+    commit hooks the routers register. Static snapshots are published
+    once per run by :func:`_publish_snapshots`, not here.
+    """
+    if domain == "audits":
+        try:
+            from cache.redis_cache import invalidate_cache
 
+            invalidate_cache("audit_*")
+        except Exception:  # pragma: no cover - cache is best effort
+            pass
     try:
-        domains = _collect_domains(args.domain or [], args.all)
-    except ValueError as exc:
-        logger.error("Domain validation failed", extra={"error": str(exc)})
-        return 1
+        from services.accountability import refresh_for_domain
+    except ImportError:  # pragma: no cover - defensive fallback
+        return
+    refresh_for_domain(session, domain)
 
+
+def _publish_snapshots(domains: Sequence[str]) -> None:
+    """Re-publish the public pages' static snapshots after ``domains`` committed.
+
+    Called once from the parent after every domain has finished, so
+    ``--parallel`` workers never publish into STATIC_SNAPSHOT_DIR at the
+    same time. A no-op unless STATIC_SNAPSHOTS_ENABLED is set.
+    """
     if not domains:
-        logger.warning("No domains registered - nothing to do")
-        return 0
+        return
+    from services.static_snapshots import publish_for_domain_sync
 
-    since = _parse_since(args.since)
-    dry_run = settings.dry_run_default if args.dry_run is None else args.dry_run
+    publish_for_domain_sync(",".join(domains))
 
-    status = 0
 
-    for domain in domains:
-        handler = REGISTRY.get(domain)
-        if handler is None:
-            logger.error(
-                "Domain handler missing despite registry entry",
-                extra={"domain": domain},
-            )
-            status = 1
-            continue
+def _load_resume_job(job_id: int):
+    """The ``IngestionJob`` to resume, detached, or None if it doesn't exist."""
+    _ensure_db_sessionlocal()
+    assert SessionLocal is not None  # for type-checkers
+    from models import IngestionJob
 
-        started_at = datetime.now(timezone.utc)
-        result: Optional[DomainRunResult] = None
-        job_id: Optional[int] = None
+    with SessionLocal() as session:
+        job = session.get(IngestionJob, job_id)
+        if job is not None:
+            session.expunge(job)
+        return job
 
-        _ensure_db_sessionlocal()
-        assert SessionLocal is not None  # for type-checkers
 
-        with SessionLocal() as session:
-            try:
-                # Create ingestion job record
-                from models import IngestionJob, IngestionStatus
+def _run_domain(
+    domain: str,
+    settings: SeedingSettings,
+    since: Optional[datetime],
+    dry_run: bool,
+    resume_job=None,
+) -> Tuple[int, DomainRunResult]:
+    """Run one domain in its own session and ingestion job; (exit status, result)."""
+    logger = logging.getLogger("seeding")
+    status = 0
+    handler = REGISTRY.get(domain)
+    if handler is None:
+        logger.error(
+            "Domain handler missing despite registry entry",
+            extra={"domain": domain},
+        )
+        return 1, DomainRunResult.empty(domain=domain, dry_run=dry_run)
+
+    started_at = datetime.now(timezone.utc)
+    result: Optional[DomainRunResult] = None
+    job_id: Optional[int] = None
+    checkpoint: Optional[Checkpoint] = None
 
+    _ensure_db_sessionlocal()
+    assert SessionLocal is not None  # for type-checkers
+
+    with SessionLocal() as session:
+        try:
+            # Create ingestion job record
+            from models import IngestionJob, IngestionStatus
+
+            if resume_job is not None:
+                # Same row, so the committed units and counts carry over.
+                job = session.get(IngestionJob, resume_job.id)
+                job.status = IngestionStatus.RUNNING
+                job.finished_at = None
+                job.errors = []
+                meta = dict(job.meta or {})
+                meta["resumed_at"] = list(meta.get("resumed_at") or []) + [
+                    started_at.isoformat()
+                ]
+                job.meta = meta
+            else:
                 job = IngestionJob(
                     domain=domain,
                     status=IngestionStatus.RUNNING,
@@ -162,128 +217,378 @@ def run_seed_command(args: argparse.Namespace, settings: SeedingSettings) -> int
                     meta={"since": since.isoformat() if since else None},
                 )
                 session.add(job)
-                session.flush()
-                job_id = job.id
-                # Commit the RUNNING record immediately so it survives a
-                # later session.rollback() (e.g. on DomainTimeoutError or
-                # any other handler exception). Without this commit the
-                # job insert is inside the same transaction as the handler
-                # work, so rollback erases it and error_session.get(…)
-                # returns None, leaving no trace of the failed domain run.
-                session.commit()
+            session.flush()
+            job_id = job.id
+            # Counts committed by earlier runs of a resumed job; this
+            # run's result is added on top.
+            base_counts = (
+                job.items_processed or 0,
+                job.items_created or 0,
+                job.items_updated or 0,
+            )
+            # Commit the RUNNING record immediately so it survives a
+            # later session.rollback() (e.g. on DomainTimeoutError or
+            # any other handler exception). Without this commit the
+            # job insert is inside the same transaction as the handler
+            # work, so rollback erases it and error_session.get(…)
+            # returns None, leaving no trace of the failed domain run.
+            session.commit()
+
+            # Runners that commit per unit (a county, a PDF, an API
+            # page) record progress on the job, so a timeout only
+            # loses the unit in flight and --resume skips the rest.
+            checkpoint = Checkpoint(
+                session,
+                job,
+                dry_run=dry_run,
+                stash_dir=settings.cache_path / "checkpoints",
+            )
+            if checkpoint.resumed:
+                logger.info(
+                    "Resuming domain run",
+                    extra={
+                        "domain": domain,
+                        "job_id": job_id,
+                        "completed_units": len(checkpoint.completed),
+                    },
+                )
+            context = DomainRunContext(
+                since=since, dry_run=dry_run, job_id=job_id, checkpoint=checkpoint
+            )
 
-                context = DomainRunContext(since=since, dry_run=dry_run, job_id=job_id)
-
-                # Per-domain timeout so one stuck domain (e.g. a stalled
-                # PDF parse in counties_budget) can't take down the whole
-                # `seed --all` run. Falls through to the except below,
-                # which rolls back the session, marks the job FAILED,
-                # and lets the outer loop move to the next domain.
-                with _domain_timeout(settings.domain_timeout_seconds):
-                    result = handler(session=session, settings=settings, context=context)
-
-                # Update job with results
-                job.finished_at = datetime.now(timezone.utc)
-                job.items_processed = result.items_processed if result else 0
-                job.items_created = result.items_created if result else 0
-                job.items_updated = result.items_updated if result else 0
-                job.errors = result.errors if result else []
-                if result and result.metadata:
-                    job.meta = dict(job.meta or {})
-                    job.meta.update(result.metadata)
-
-                if result and result.errors:
-                    job.status = IngestionStatus.COMPLETED_WITH_ERRORS
-                else:
-                    job.status = IngestionStatus.COMPLETED
-
-                if dry_run:
-                    finished_at_dry = datetime.now(timezone.utc)
-                    session.rollback()
-                    logger.info(
-                        "Dry run - rolled back all changes", extra={"domain": domain}
+            # Per-domain timeout so one stuck domain (e.g. a stalled
+            # PDF parse in counties_budget) can't take down the whole
+            # `seed --all` run. Falls through to the except below,
+            # which rolls back the session, marks the job FAILED,
+            # and lets the outer loop move to the next domain.
+            with _domain_timeout(settings.domain_timeout_seconds):
+                result = handler(session=session, settings=settings, context=context)
+
+            # Update job with results
+            job.finished_at = datetime.now(timezone.utc)
+            job.items_processed = base_counts[0] + (
+                result.items_processed if result else 0
+            )
+            job.items_created = base_counts[1] + (
+                result.items_created if result else 0
+            )
+            job.items_updated = base_counts[2] + (
+                result.items_updated if result else 0
+            )
+            job.errors = result.errors if result else []
+            if result and result.metadata:
+                job.meta = dict(job.meta or {})
+                job.meta.update(result.metadata)
+
+            if result and result.errors:
+                job.status = IngestionStatus.COMPLETED_WITH_ERRORS
+            else:
+                job.status = IngestionStatus.COMPLETED
+
+            if dry_run:
+                finished_at_dry = datetime.now(timezone.utc)
+                session.rollback()
+                logger.info(
+                    "Dry run - rolled back all changes", extra={"domain": domain}
+                )
+                # The rollback above also undoes the in-flight job status
+                # update (job was committed as RUNNING before the handler
+                # ran). Persist the final status in a separate session so
+                # the record doesn't stay orphaned in RUNNING state.
+                if job_id:
+                    final_status = (
+                        IngestionStatus.COMPLETED_WITH_ERRORS
+                        if result and result.errors
+                        else IngestionStatus.COMPLETED
                     )
-                    # The rollback above also undoes the in-flight job status
-                    # update (job was committed as RUNNING before the handler
-                    # ran). Persist the final status in a separate session so
-                    # the record doesn't stay orphaned in RUNNING state.
-                    if job_id:
-                        final_status = (
-                            IngestionStatus.COMPLETED_WITH_ERRORS
-                            if result and result.errors
-                            else IngestionStatus.COMPLETED
+                    try:
+                        with SessionLocal() as status_session:
+                            dry_job = status_session.get(IngestionJob, job_id)
+                            if dry_job:
+                                dry_job.status = final_status
+                                dry_job.finished_at = finished_at_dry
+                                dry_job.items_processed = (
+                                    result.items_processed if result else 0
+                                )
+                                dry_job.items_created = (
+                                    result.items_created if result else 0
+                                )
+                                dry_job.items_updated = (
+                                    result.items_updated if result else 0
+                                )
+                                dry_job.errors = result.errors if result else []
+                                status_session.commit()
+                    except Exception:  # pragma: no cover - best-effort
+                        logger.warning(
+                            "Failed to update dry-run job status",
+                            extra={"domain": domain, "job_id": job_id},
+                            exc_info=True,
                         )
-                        try:
-                            with SessionLocal() as status_session:
-                                dry_job = status_session.get(IngestionJob, job_id)
-                                if dry_job:
-                                    dry_job.status = final_status
-                                    dry_job.finished_at = finished_at_dry
-                                    dry_job.items_processed = (
-                                        result.items_processed if result else 0
-                                    )
-                                    dry_job.items_created = (
-                                        result.items_created if result else 0
-                                    )
-                                    dry_job.items_updated = (
-                                        result.items_updated if result else 0
-                                    )
-                                    dry_job.errors = result.errors if result else []
-                                    status_session.commit()
-                        except Exception:  # pragma: no cover - best-effort
-                            logger.warning(
-                                "Failed to update dry-run job status",
-                                extra={"domain": domain, "job_id": job_id},
-                                exc_info=True,
-                            )
-                else:
-                    session.commit()
-                    logger.info(
-                        "Committed changes", extra={"domain": domain, "job_id": job_id}
-                    )
+            else:
+                session.commit()
+                logger.info(
+                    "Committed changes", extra={"domain": domain, "job_id": job_id}
+                )
+                checkpoint.clear_stash()
+                _refresh_derived_snapshots(session, domain)
 
-            except Exception as exc:  # pragma: no cover - requires integration tests
-                session.rollback()
-                logger.exception(
-                    "Domain run failed", extra={"domain": domain, "error": str(exc)}
+        except Exception as exc:  # pragma: no cover - requires integration tests
+            session.rollback()
+            logger.exception(
+                "Domain run failed", extra={"domain": domain, "error": str(exc)}
+            )
+            status = 1
+            if checkpoint is not None and checkpoint.completed and not dry_run:
+                logger.info(
+                    "Completed units are committed; continue with "
+                    f"`seed --resume {job_id}`",
+                    extra={
+                        "domain": domain,
+                        "job_id": job_id,
+                        "completed_units": len(checkpoint.completed),
+                    },
                 )
-                status = 1
 
-                # Try to update job status even on failure
-                if job_id:
-                    try:
-                        with SessionLocal() as error_session:
-                            from models import IngestionJob, IngestionStatus
-
-                            failed_job = error_session.get(IngestionJob, job_id)
-                            if failed_job:
-                                failed_job.status = IngestionStatus.FAILED
-                                failed_job.finished_at = datetime.now(timezone.utc)
-                                failed_job.errors = [str(exc)]
-                                error_session.commit()
-                    except Exception:  # pragma: no cover
-                        pass
-
-                result = DomainRunResult.empty(
-                    domain=domain,
-                    dry_run=dry_run,
-                    started_at=started_at,
-                ).with_error(str(exc))
+            # Try to update job status even on failure
+            if job_id:
+                try:
+                    with SessionLocal() as error_session:
+                        from models import IngestionJob, IngestionStatus
+
+                        failed_job = error_session.get(IngestionJob, job_id)
+                        if failed_job:
+                            failed_job.status = IngestionStatus.FAILED
+                            failed_job.finished_at = datetime.now(timezone.utc)
+                            failed_job.errors = [str(exc)]
+                            error_session.commit()
+                except Exception:  # pragma: no cover
+                    pass
 
-        finished_at = datetime.now(timezone.utc)
-        if result is None:
             result = DomainRunResult.empty(
                 domain=domain,
                 dry_run=dry_run,
                 started_at=started_at,
-                finished_at=finished_at,
+            ).with_error(str(exc))
+
+    finished_at = datetime.now(timezone.utc)
+    if result is None:
+        result = DomainRunResult.empty(
+            domain=domain,
+            dry_run=dry_run,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+    else:
+        result = result.model_copy(update={"finished_at": finished_at})
+
+    logger.info("Domain run completed", extra=result.model_dump())
+    return status, result
+
+
+def _parallel_workers(
+    settings: SeedingSettings, domain_count: int, requested: Optional[int]
+) -> int:
+    """Domains to run at once within the DB connection budget.
+
+    Each running domain holds up to two connections: its own session and
+    the short-lived one that records a failed or dry-run job's status.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1  # workers inherit the registry and settings by forking
+    wanted = requested if requested is not None else settings.parallel_domains
+    budget = max(1, settings.db_connection_budget // 2)
+    return max(1, min(wanted, budget, domain_count))
+
+
+def _worker_init() -> None:
+    # A forked worker must not reuse the parent's pooled connections.
+    bind = SessionLocal.kw.get("bind") if SessionLocal is not None else None
+    if bind is not None:
+        bind.dispose(close=False)
+
+
+def _run_parallel(
+    domains: Sequence[str],
+    settings: SeedingSettings,
+    since: Optional[datetime],
+    dry_run: bool,
+    workers: int,
+) -> Dict[str, Tuple[int, DomainRunResult]]:
+    """Run ``domains`` in worker processes, each once its dependencies finish.
+
+    Processes rather than threads: every domain keeps its own SIGALRM
+    timeout and session, and PDF parsing isn't serialised on the GIL.
+    A domain whose dependency failed still runs, as in a sequential run.
+    """
+    logger = logging.getLogger("seeding")
+    waiting = {
+        domain: {dep for dep in REGISTRY.dependencies(domain) if dep in domains}
+        for domain in domains
+    }
+    outcomes: Dict[str, Tuple[int, DomainRunResult]] = {}
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=_worker_init
+    ) as pool:
+        running: Dict[Future, str] = {}
+        while waiting or running:
+            for domain in [d for d in domains if d in waiting]:
+                if waiting[domain] <= outcomes.keys():
+                    del waiting[domain]
+                    future = pool.submit(_run_domain, domain, settings, since, dry_run)
+                    running[future] = domain
+            if not running:  # pragma: no cover - plan() rejects cycles
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                domain = running.pop(future)
+                try:
+                    outcomes[domain] = future.result()
+                except Exception as exc:  # worker died (e.g. OOM-killed)
+                    logger.error(
+                        "Domain worker failed",
+                        extra={"domain": domain, "error": str(exc)},
+                    )
+                    outcomes[domain] = (
+                        1,
+                        DomainRunResult.empty(domain=domain, dry_run=dry_run).with_error(
+                            str(exc)
+                        ),
+                    )
+    return outcomes
+
+
+def _critical_path(
+    domains: Sequence[str], outcomes: Dict[str, Tuple[int, DomainRunResult]]
+) -> Tuple[float, List[str]]:
+    """Longest chain of dependent domain run times, as (seconds, domains)."""
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+    for domain in domains:  # dependencies come first
+        result = outcomes[domain][1]
+        seconds = max(0.0, (result.finished_at - result.started_at).total_seconds())
+        start, before = max(
+            (
+                (finish[dep], dep)
+                for dep in REGISTRY.dependencies(domain)
+                if dep in finish
+            ),
+            default=(0.0, None),
+        )
+        finish[domain] = start + seconds
+        previous[domain] = before
+    if not finish:
+        return 0.0, []
+    last: Optional[str] = max(finish, key=lambda d: finish[d])
+    total = finish[last]
+    path: List[str] = []
+    while last is not None:
+        path.append(last)
+        last = previous[last]
+    return total, path[::-1]
+
+
+def _log_run_summary(
+    domains: Sequence[str],
+    outcomes: Dict[str, Tuple[int, DomainRunResult]],
+    wall_seconds: float,
+    workers: int,
+) -> None:
+    if len(domains) < 2:
+        return
+    critical_seconds, critical_path = _critical_path(domains, outcomes)
+    busy_seconds = sum(
+        max(0.0, (r.finished_at - r.started_at).total_seconds())
+        for _, r in outcomes.values()
+    )
+    logging.getLogger("seeding").info(
+        "Seed run summary",
+        extra={
+            "domains": len(domains),
+            "failed": sorted(d for d, (code, _) in outcomes.items() if code),
+            "workers": workers,
+            "wall_seconds": round(wall_seconds, 1),
+            "domain_seconds": round(busy_seconds, 1),
+            "critical_path_seconds": round(critical_seconds, 1),
+            "critical_path": critical_path,
+        },
+    )
+
+
+def run_seed_command(args: argparse.Namespace, settings: SeedingSettings) -> int:
+    logger = configure_logging(settings.log_level, settings.log_path)
+
+    load_builtin_domains()
+
+    resume_id: Optional[int] = getattr(args, "resume", None)
+    resume_job = None
+    if resume_id is not None:
+        from models import IngestionStatus
+
+        resume_job = _load_resume_job(resume_id)
+        if resume_job is None:
+            logger.error("Unknown ingestion job", extra={"job_id": resume_id})
+            return 1
+        if args.all or (args.domain and args.domain != [resume_job.domain]):
+            logger.error(
+                "--resume runs the job's own domain only",
+                extra={"job_id": resume_id, "domain": resume_job.domain},
+            )
+            return 1
+        if resume_job.status == IngestionStatus.COMPLETED:
+            logger.info(
+                "Ingestion job already completed - nothing to resume",
+                extra={"job_id": resume_id, "domain": resume_job.domain},
             )
-        else:
-            result = result.model_copy(update={"finished_at": finished_at})
+            return 0
 
-        logger.info("Domain run completed", extra=result.model_dump())
+    try:
+        domains = (
+            [resume_job.domain]
+            if resume_job is not None
+            else _collect_domains(args.domain or [], args.all)
+        )
+        if resume_job is not None and not REGISTRY.has(resume_job.domain):
+            raise ValueError(f"Unknown domain(s) requested: {resume_job.domain}")
+        # Dependencies first (see register_domain(depends_on=...)).
+        domains = REGISTRY.plan(domains)
+    except ValueError as exc:
+        logger.error("Domain validation failed", extra={"error": str(exc)})
+        return 1
 
-    return status
+    if not domains:
+        logger.warning("No domains registered - nothing to do")
+        return 0
+
+    since = _parse_since(args.since)
+    dry_run = settings.dry_run_default if args.dry_run is None else args.dry_run
+    if resume_job is not None:
+        # A resumed run carries on with the options it was started with.
+        if since is None and (resume_job.meta or {}).get("since"):
+            since = _parse_since(resume_job.meta["since"])
+        dry_run = bool(resume_job.dry_run)
+
+    workers = _parallel_workers(
+        settings, len(domains), getattr(args, "parallel", None)
+    )
+    run_started = time.monotonic()
+    if workers > 1 and resume_job is None:
+        logger.info(
+            "Running domains in parallel",
+            extra={"domains": domains, "workers": workers},
+        )
+        outcomes = _run_parallel(domains, settings, since, dry_run, workers)
+    else:
+        outcomes = {}
+        for domain in domains:
+            outcomes[domain] = _run_domain(
+                domain, settings, since, dry_run, resume_job=resume_job
+            )
+    _log_run_summary(domains, outcomes, time.monotonic() - run_started, workers)
+    if not dry_run:
+        _publish_snapshots([d for d in domains if outcomes[d][0] == 0])
+
+    return max((code for code, _ in outcomes.values()), default=0)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -309,6 +614,21 @@ def build_parser() -> argparse.ArgumentParser:
         "--since",
         help="ISO timestamp or YYYY-MM-DD to limit ingestion to recent records",
     )
+    seed_parser.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        help=(
+            "Domains to run at once (default SEED_PARALLEL_DOMAINS, capped by "
+            "SEED_DB_CONNECTION_BUDGET); 1 runs them one after another"
+        ),
+    )
+    seed_parser.add_argument(
+        "--resume",
+        type=int,
+        metavar="JOB_ID",
+        help="Resume an interrupted ingestion job, skipping its committed units",
+    )
     seed_parser.add_argument(
         "--config",
         type=Path,
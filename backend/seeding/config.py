@@ -33,6 +33,20 @@ class SeedingSettings(BaseSettings):
         ge=1,
         description="Per-domain hard timeout; aborts one domain without killing the run.",
     )
+    # `seed --all` runs domains whose declared dependencies have finished
+    # side by side, each in its own worker process and session. Each one
+    # holds up to two DB connections, so the budget (the CLI's share of
+    # the Supabase pooler's ~15 clients) caps workers at budget // 2.
+    parallel_domains: int = Field(
+        default=4,
+        ge=1,
+        description="Domains seeded at once by `seed` (1 = sequential).",
+    )
+    db_connection_budget: int = Field(
+        default=8,
+        ge=2,
+        description="DB connections the seeding CLI may hold at once.",
+    )
     max_retries: int = Field(
         default=3, description="Maximum retry attempts for transient HTTP failures."
     )
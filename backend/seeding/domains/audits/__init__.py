@@ -16,7 +16,8 @@ from . import fetcher, parser, writer
 logger = logging.getLogger("seeding.audits")
 
 
-@register_domain("audits")
+# After counties_budget: both get-or-create the county fiscal periods.
+@register_domain("audits", depends_on=("counties_budget",))
 def run(
     session: Session, settings: SeedingSettings, context: DomainRunContext
 ) -> DomainRunResult:
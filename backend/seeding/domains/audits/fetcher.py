@@ -36,8 +36,6 @@ from __future__ import annotations
 
 import logging
 import re
-import tempfile
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 from urllib.parse import urljoin
 
@@ -197,7 +195,6 @@ def _download_and_parse_audit_pdf(
     client: SeedingHttpClient, pdf_url: str
 ) -> Optional[List[Dict[str, Any]]]:
     """Download and attempt to parse an OAG audit report PDF."""
-    tmp_path: Optional[Path] = None
     try:
         # Try to use pdfplumber for text extraction
         import pdfplumber
@@ -208,52 +205,35 @@ def _download_and_parse_audit_pdf(
         )
         return None
 
-    try:
-        response = client.get(pdf_url, raise_for_status=True)
-
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False, prefix="oag_audit_"
-        ) as tmp:
-            tmp.write(response.content)
-            tmp_path = Path(tmp.name)
-
-        logger.info(
-            "Downloaded OAG PDF (%d bytes) to %s",
-            len(response.content),
-            tmp_path,
-        )
+    blob = client.get_blob(pdf_url)
+    pdf_path = blob.path
 
-        findings: List[Dict[str, Any]] = []
+    logger.info("OAG PDF (%d bytes) at %s", blob.size, pdf_path)
 
-        with pdfplumber.open(tmp_path) as pdf:
-            full_text = ""
-            for page in pdf.pages[:50]:  # limit to first 50 pages
-                text = page.extract_text()
-                if text:
-                    full_text += text + "\n"
-
-            if not full_text.strip():
-                # OAG publishes scanned-image PDFs — see module docstring
-                # for the full context and the OCR / Playwright paths
-                # required to actually fix this. INFO not WARNING so the
-                # log doesn't suggest a new fault on every nightly run.
-                logger.info(
-                    "PDF appears to contain no extractable text "
-                    "(scanned image; OCR not configured)"
-                )
-                return None
+    findings: List[Dict[str, Any]] = []
 
-            # Extract audit findings using pattern matching
-            findings = _extract_findings_from_text(full_text, pdf_url)
+    with pdfplumber.open(pdf_path) as pdf:
+        full_text = ""
+        for page in pdf.pages[:50]:  # limit to first 50 pages
+            text = page.extract_text()
+            if text:
+                full_text += text + "\n"
+
+        if not full_text.strip():
+            # OAG publishes scanned-image PDFs — see module docstring
+            # for the full context and the OCR / Playwright paths
+            # required to actually fix this. INFO not WARNING so the
+            # log doesn't suggest a new fault on every nightly run.
+            logger.info(
+                "PDF appears to contain no extractable text "
+                "(scanned image; OCR not configured)"
+            )
+            return None
 
-        return findings if findings else None
+        # Extract audit findings using pattern matching
+        findings = _extract_findings_from_text(full_text, pdf_url)
 
-    finally:
-        if tmp_path and tmp_path.exists():
-            try:
-                tmp_path.unlink()
-            except OSError:
-                pass
+    return findings if findings else None
 
 
 def _extract_findings_from_text(
@@ -22,10 +22,18 @@ def run(
 ) -> DomainRunResult:
     started_at = datetime.now(timezone.utc)
     errors: list[str] = []
+    checkpoint = context.checkpoint
 
     with create_http_client(settings) as client:
         try:
-            payload = fetcher.fetch_budget_payload(client, settings)
+            if checkpoint is not None:
+                # A resumed run reuses the parsed BIRR PDF instead of
+                # downloading and parsing it again.
+                payload = checkpoint.stash(
+                    "payload", lambda: fetcher.fetch_budget_payload(client, settings)
+                )
+            else:
+                payload = fetcher.fetch_budget_payload(client, settings)
         except Exception as exc:  # pragma: no cover - network failure path
             logger.exception(
                 "Failed to fetch budget payload", extra={"error": str(exc)}
@@ -41,7 +49,12 @@ def run(
             )
 
     records = parser.parse_budget_payload(payload)
-    stats = writer.persist_budget_records(session, records, settings, context)
+    if checkpoint is not None:
+        stats = writer.persist_budget_records_by_county(
+            session, records, settings, context
+        )
+    else:
+        stats = writer.persist_budget_records(session, records, settings, context)
     errors.extend(stats.errors)
 
     finished_at = datetime.now(timezone.utc)
@@ -58,6 +71,7 @@ def run(
         metadata={
             "skipped": stats.skipped,
             "source_url": settings.budgets_dataset_url,
+            "resumed_units": checkpoint.skipped if checkpoint is not None else 0,
         },
     )
 
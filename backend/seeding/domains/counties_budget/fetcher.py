@@ -16,9 +16,7 @@ from __future__ import annotations
 
 import logging
 import re
-import tempfile
 import time
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...cob_discovery import discover_latest_cob_pdf_url
@@ -405,7 +403,6 @@ def _download_and_parse_county_pdf(
     client: SeedingHttpClient, pdf_url: str
 ) -> Optional[List[Dict[str, Any]]]:
     """Download a COB county BIRR PDF, parse it, return budget records."""
-    tmp_path: Optional[Path] = None
     try:
         from ...pdf_parsers import CoBQuarterlyReportParser
 
@@ -429,30 +426,21 @@ def _download_and_parse_county_pdf(
         # stalls point at the real culprit.
         logger.info("Starting COB county BIRR PDF download: %s", pdf_url)
         download_start = time.monotonic()
-        response = client.get(
-            pdf_url,
-            raise_for_status=True,
-            headers=pdf_headers,
-            timeout=180.0,
-        )
+        blob = client.get_blob(pdf_url, headers=pdf_headers, timeout=180.0)
         download_elapsed = time.monotonic() - download_start
-
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False, prefix="cob_county_birr_"
-        ) as tmp:
-            tmp.write(response.content)
-            tmp_path = Path(tmp.name)
+        pdf_path = blob.path
 
         logger.info(
-            "Downloaded COB county BIRR PDF (%d bytes, %.1fs) to %s",
-            len(response.content),
+            "%s COB county BIRR PDF (%d bytes, %.1fs) at %s",
+            "Downloaded" if blob.fetched else "Stored",
+            blob.size,
             download_elapsed,
-            tmp_path,
+            pdf_path,
         )
 
-        logger.info("Parsing COB county BIRR PDF: %s", tmp_path)
+        logger.info("Parsing COB county BIRR PDF: %s", pdf_path)
         parse_start = time.monotonic()
-        parser = CoBQuarterlyReportParser(tmp_path)
+        parser = CoBQuarterlyReportParser(pdf_path)
         parsed_records = parser.parse()
         parse_elapsed = time.monotonic() - parse_start
         logger.info(
@@ -537,12 +525,6 @@ def _download_and_parse_county_pdf(
             "install pdfplumber for live PDF parsing"
         )
         return None
-    finally:
-        if tmp_path and tmp_path.exists():
-            try:
-                tmp_path.unlink()
-            except OSError:
-                pass
 
 
 __all__ = ["fetch_budget_payload"]
@@ -481,4 +481,47 @@ def persist_budget_records(
     return stats
 
 
-__all__ = ["PersistenceStats", "persist_budget_records"]
+def persist_budget_records_by_county(
+    session: Session,
+    records: Iterable[BudgetRecord],
+    settings: SeedingSettings,
+    context: DomainRunContext,
+) -> PersistenceStats:
+    """Upsert records one county at a time, committing each as a checkpoint unit.
+
+    Counties already committed by an earlier attempt of the same job are
+    skipped, so a run that timed out on county 40 of 47 resumes there.
+    Each county is still one bulk pass of :func:`persist_budget_records`.
+    """
+    from ...utils import canonicalize_slug
+
+    checkpoint = context.checkpoint
+    assert checkpoint is not None, "per-county persistence needs a checkpoint"
+
+    by_county: dict[str, List[BudgetRecord]] = {}
+    for record in records:
+        unit_name = f"county:{canonicalize_slug(record.entity_slug)}"
+        by_county.setdefault(unit_name, []).append(record)
+
+    stats = PersistenceStats()
+    for unit_name in checkpoint.pending(by_county):
+        unit = persist_budget_records(session, by_county[unit_name], settings, context)
+        checkpoint.commit(
+            unit_name,
+            processed=unit.processed,
+            created=unit.created,
+            updated=unit.updated,
+        )
+        stats.processed += unit.processed
+        stats.created += unit.created
+        stats.updated += unit.updated
+        stats.skipped += unit.skipped
+        stats.errors.extend(unit.errors)
+    return stats
+
+
+__all__ = [
+    "PersistenceStats",
+    "persist_budget_records",
+    "persist_budget_records_by_county",
+]
@@ -20,7 +20,8 @@ from . import fetcher, parser, writer
 logger = logging.getLogger("seeding.fiscal_summary")
 
 
-@register_domain("fiscal_summary")
+# Summarises the budget totals national_budget seeds; keep them in order.
+@register_domain("fiscal_summary", depends_on=("national_budget",))
 def run(
     session: Session, settings: SeedingSettings, context: DomainRunContext
 ) -> DomainRunResult:
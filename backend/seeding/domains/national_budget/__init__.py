@@ -21,7 +21,8 @@ from . import fetcher, parser, writer
 logger = logging.getLogger("seeding.national_budget")
 
 
-@register_domain("national_budget")
+# Shares fiscal periods with the county domains, so it runs after them.
+@register_domain("national_budget", depends_on=("counties_budget", "audits"))
 def run(
     session: Session, settings: SeedingSettings, context: DomainRunContext
 ) -> DomainRunResult:
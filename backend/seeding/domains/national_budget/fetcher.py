@@ -12,8 +12,6 @@ quarterly NG-BIRR reports.
 from __future__ import annotations
 
 import logging
-import tempfile
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ...cob_discovery import discover_latest_cob_pdf_url
@@ -126,24 +124,15 @@ def _download_and_parse_ng_pdf(
     they include ``start_date``/``end_date`` (the writer keys
     ``BudgetLine`` on entity+period+category+subcategory).
     """
-    tmp_path: Optional[Path] = None
     try:
         from .pdf_parser import NgBirrSectoralParser
 
-        response = client.get(pdf_url, raise_for_status=True)
+        blob = client.get_blob(pdf_url)
+        pdf_path = blob.path
 
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=False, prefix="cob_ng_birr_"
-        ) as tmp:
-            tmp.write(response.content)
-            tmp_path = Path(tmp.name)
+        logger.info("COB NG-BIRR PDF (%d bytes) at %s", blob.size, pdf_path)
 
-        logger.info(
-            "Downloaded COB NG-BIRR PDF (%d bytes) to %s",
-            len(response.content), tmp_path,
-        )
-
-        parser = NgBirrSectoralParser(tmp_path)
+        parser = NgBirrSectoralParser(pdf_path)
         period, sectoral_records = parser.parse()
 
         if not sectoral_records:
@@ -188,9 +177,3 @@ def _download_and_parse_ng_pdf(
             "pdfplumber not available — install it for live NG-BIRR parsing"
         )
         return None
-    finally:
-        if tmp_path and tmp_path.exists():
-            try:
-                tmp_path.unlink()
-            except OSError:
-                pass
@@ -143,8 +143,7 @@ def _download_pdf(client: SeedingHttpClient, url: str) -> bytes:
     and offline runs don't need a live HTTP path."""
     if url.startswith("file://"):
         return Path(url[len("file://"):]).read_bytes()
-    response = client.get(url, raise_for_status=True)
-    return response.content
+    return client.get_blob(url).read_bytes()
 
 
 def _extract_domestic_debt_page_text(pdf_bytes: bytes) -> Optional[str]:
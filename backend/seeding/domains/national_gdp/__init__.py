@@ -22,6 +22,7 @@ from models import (
     PovertyIndex,
     SourceDocument,
 )
+from services.latest_stats import refresh_latest_stats
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -93,7 +94,8 @@ def _ensure_source_document(session: Session) -> SourceDocument:
     return doc
 
 
-@register_domain("national_gdp")
+# After population: both rebuild the entity_latest_stats projection.
+@register_domain("national_gdp", depends_on=("population",))
 def run(
     session: Session, settings: SeedingSettings, context: DomainRunContext
 ) -> DomainRunResult:
@@ -137,6 +139,10 @@ def run(
                 session.add(existing)
                 updated += 1
 
+        # Core inserts above bypass the ORM; refresh the national
+        # latest-stats row explicitly.
+        refresh_latest_stats(session, [None])
+
         # ── Poverty index records with entity_id=NULL ────────────────
         for data in POVERTY_SERIES:
             existing = (
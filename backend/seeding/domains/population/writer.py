@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import Iterable, List, Optional, Tuple
 
 from models import Entity, PopulationData
+from services.latest_stats import refresh_latest_stats
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
@@ -63,6 +64,7 @@ def persist_population_records(
     context: DomainRunContext,
 ) -> PersistenceStats:
     stats = PersistenceStats()
+    touched: set = set()
 
     for record in records:
         stats.processed += 1
@@ -91,10 +93,14 @@ def persist_population_records(
             )
             session.add(model)
             stats.created += 1
+            touched.add(entity_id)
         else:
             if _apply_record(existing, record):
                 stats.updated += 1
+                touched.add(entity_id)
 
+    # Keep the latest-per-entity projection in step with this batch.
+    refresh_latest_stats(session, touched)
     return stats
 
 
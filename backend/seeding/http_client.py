@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from contextlib import AbstractContextManager
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import httpx
 from tenacity import (
@@ -19,6 +19,9 @@ from .config import SeedingSettings
 from .rate_limiter import RateLimiter
 from .storage import SimpleHTTPCache
 
+if TYPE_CHECKING:  # pragma: no cover
+    from services.blob_store import Blob
+
 logger = logging.getLogger("seeding.http")
 
 
@@ -141,6 +144,22 @@ class SeedingHttpClient(AbstractContextManager["SeedingHttpClient"]):
     def head(self, url: str, **kwargs: Any) -> httpx.Response:
         return self.request("HEAD", url, **kwargs)
 
+    def get_blob(self, url: str, **kwargs: Any) -> "Blob":
+        """GET a document through the shared blob store.
+
+        PDFs are stored content-addressed alongside the ETL downloads
+        rather than in the response cache. A URL stored within the HTTP
+        cache TTL is returned without a request.
+        """
+        from services.blob_store import default_store
+
+        def fetch(target: str) -> bytes:
+            return self.get(target, cache=False, **kwargs).content
+
+        return default_store().get_or_fetch(
+            url, fetch, max_age=self._settings.cache_ttl_seconds
+        )
+
 
 def create_http_client(settings: SeedingSettings) -> SeedingHttpClient:
     cache_backend: Optional[SimpleHTTPCache] = None
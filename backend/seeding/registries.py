@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import importlib
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -16,25 +16,67 @@ DomainHandler = Callable[
 
 
 class DomainRegistry:
-    """Central registry mapping domain names to seeding callables."""
+    """Central registry mapping domain names to seeding callables.
+
+    A domain may declare the domains it must run after (``depends_on``):
+    one that reads another's rows, or that get-or-creates the same shared
+    rows (entities, fiscal periods) and would race it if run concurrently.
+    """
 
     def __init__(self) -> None:
         self._handlers: Dict[str, DomainHandler] = {}
+        self._depends_on: Dict[str, Tuple[str, ...]] = {}
 
-    def register(self, domain: str, handler: DomainHandler) -> None:
+    def register(
+        self, domain: str, handler: DomainHandler, depends_on: Iterable[str] = ()
+    ) -> None:
         if domain in self._handlers:
             raise ValueError(f"Domain '{domain}' already registered")
         self._handlers[domain] = handler
+        self._depends_on[domain] = tuple(depends_on)
 
-    def decorator(self, domain: str) -> Callable[[DomainHandler], DomainHandler]:
+    def decorator(
+        self, domain: str, depends_on: Iterable[str] = ()
+    ) -> Callable[[DomainHandler], DomainHandler]:
         """Decorator for domain modules to register their runner."""
 
         def _inner(handler: DomainHandler) -> DomainHandler:
-            self.register(domain, handler)
+            self.register(domain, handler, depends_on)
             return handler
 
         return _inner
 
+    def dependencies(self, domain: str) -> Tuple[str, ...]:
+        return self._depends_on.get(domain, ())
+
+    def plan(self, domains: Iterable[str]) -> List[str]:
+        """``domains`` ordered so each comes after its selected dependencies.
+
+        Dependencies outside the selection are taken as already satisfied;
+        otherwise the given order is kept. Raises ValueError on a cycle.
+        """
+        selected = list(dict.fromkeys(domains))
+        chosen = set(selected)
+        ordered: List[str] = []
+        state: Dict[str, int] = {}  # 1 = visiting, 2 = placed
+
+        def visit(domain: str, chain: Tuple[str, ...]) -> None:
+            if state.get(domain) == 2:
+                return
+            if state.get(domain) == 1:
+                cycle = " -> ".join(chain + (domain,))
+                raise ValueError(f"Domain dependency cycle: {cycle}")
+            state[domain] = 1
+            for dep in self.dependencies(domain):
+                if dep in chosen:
+                    visit(dep, chain + (domain,))
+            state[domain] = 2
+            ordered.append(domain)
+
+        for domain in selected:
+            visit(domain, ())
+        return ordered
+
     def get(self, domain: str) -> Optional[DomainHandler]:
         return self._handlers.get(domain)
 
@@ -51,10 +93,12 @@ class DomainRegistry:
 REGISTRY = DomainRegistry()
 
 
-def register_domain(domain: str) -> Callable[[DomainHandler], DomainHandler]:
+def register_domain(
+    domain: str, *, depends_on: Iterable[str] = ()
+) -> Callable[[DomainHandler], DomainHandler]:
     """Public decorator shortcut for registering domain runners."""
 
-    return REGISTRY.decorator(domain)
+    return REGISTRY.decorator(domain, depends_on)
 
 
 _BUILTIN_DOMAIN_PACKAGES = [
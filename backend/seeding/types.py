@@ -4,10 +4,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+if TYPE_CHECKING:  # pragma: no cover - import for annotations only
+    from .checkpoint import Checkpoint
+
 
 @dataclass
 class DomainRunContext:
@@ -16,6 +19,9 @@ class DomainRunContext:
     since: Optional[datetime]
     dry_run: bool
     job_id: Optional[int] = None
+    # Set by the CLI: runners that commit per unit use it; None means the
+    # whole domain is one unit, committed by the caller.
+    checkpoint: Optional["Checkpoint"] = None
 
 
 class DomainRunResult(BaseModel):
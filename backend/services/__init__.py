@@ -1,12 +1,31 @@
-"""Backend services module."""
+"""Backend services module.
+
+Submodules are imported on first attribute access rather than with the
+package: ``from services.trust_guards import ...`` at app import used to
+pull in the auto-seeder and the live data fetcher (BeautifulSoup,
+scraping clients) before the first request.
+"""
+
+import importlib
+
+_LAZY_EXPORTS = {
+    "auto_seeder": "services.auto_seeder",
+    "start_auto_seeder": "services.auto_seeder",
+    "stop_auto_seeder": "services.auto_seeder",
+    "get_seeder_status": "services.auto_seeder",
+    "LiveDataAggregator": "services.live_data_fetcher",
+    "live_data_aggregator": "services.live_data_fetcher",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
-from .auto_seeder import (
-    auto_seeder,
-    get_seeder_status,
-    start_auto_seeder,
-    stop_auto_seeder,
-)
-from .live_data_fetcher import LiveDataAggregator, live_data_aggregator
 
 __all__ = [
     "auto_seeder",
@@ -0,0 +1,708 @@
+"""Batch county accountability scorecards with versioned snapshots.
+
+The per-county scorecard (opinion history, severity history, absorption,
+grade, peer comparison) used to be computed on every request to
+``/counties/{id}/accountability`` and ``/counties/{id}/summary``: one
+``audits`` scan for the county, a ``FiscalPeriod`` lookup per distinct
+period, the latest-FY budget resolution, and a peer roll-up on top. A
+ranking view needing all 47 scorecards multiplied that by 47.
+
+:func:`compute_all_scorecards` produces every county's scorecard from five
+grouped queries (county entities, audits, fiscal-period years, per-period
+budget totals, latest-stats population) and derives the peer comparison and
+percentile from the same in-memory data. :func:`refresh_accountability_snapshot`
+persists the result as a new ``AccountabilitySnapshot`` version; readers
+(:func:`get_county_scorecard`, :func:`list_scorecards`) are key lookups
+against the latest version.
+
+Snapshots are refreshed after the seeding domains that feed them commit
+(:func:`refresh_for_domain`, called from ``seeding.cli`` and the
+auto-seeder), after startup bootstrap, and lazily when the latest one is
+older than ``ACCOUNTABILITY_SNAPSHOT_MAX_AGE_HOURS`` so writes from ad-hoc
+scripts are eventually picked up. Rebuilds hold a Postgres advisory lock
+(``REBUILD_LOCK_KEY``): one reader rebuilds a stale snapshot while the
+others keep serving the previous version.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from models import (
+    AccountabilityScorecard,
+    AccountabilitySnapshot,
+    Audit,
+    Entity,
+    EntityLatestStats,
+    EntityType,
+    FiscalPeriod,
+)
+from queries import latest_budget_totals
+from sqlalchemy import or_, text
+from sqlalchemy.orm import Session
+from utils.counties import COUNTY_MAPPING, COUNTY_REGIONS
+
+logger = logging.getLogger(__name__)
+
+# Seeding domains whose writes change scorecard inputs.
+ACCOUNTABILITY_SOURCE_DOMAINS = frozenset({"audits", "counties_budget", "population"})
+
+# How many snapshot versions to retain; older ones are pruned on refresh.
+KEEP_SNAPSHOT_VERSIONS = 5
+
+# Rebuild on read once the latest snapshot is older than this.
+SNAPSHOT_MAX_AGE = timedelta(
+    hours=float(os.getenv("ACCOUNTABILITY_SNAPSHOT_MAX_AGE_HOURS", "24"))
+)
+
+# Transaction-level advisory lock serialising snapshot rebuilds
+# (services/job_scheduler.py holds 874322, etl/worker.py 874321).
+REBUILD_LOCK_KEY = 874323
+
+# Response-cache key prefixes of the endpoints that read the snapshot;
+# dropped once a new snapshot commits.
+SCORECARD_CACHE_PREFIXES = (
+    "county:accountability",
+    "county:summary",
+    "accountability:scorecards",
+)
+
+_RESOLVED_STATUSES = {"resolved", "closed", "dismissed", "settled"}
+
+
+def _bracket_for(pop: int) -> str:
+    if pop < 500_000:
+        return "<500k"
+    if pop < 1_000_000:
+        return "500k-1M"
+    if pop < 2_000_000:
+        return "1M-2M"
+    return ">2M"
+
+
+def _grade_to_num(g: str) -> float:
+    return {"A": 4.0, "B": 3.0, "C": 2.0, "D": 1.0, "F": 0.0}.get(g, 0.0)
+
+
+def _num_to_grade(n: float) -> str:
+    if n >= 3.5:
+        return "A"
+    if n >= 2.5:
+        return "B"
+    if n >= 1.5:
+        return "C"
+    if n >= 0.5:
+        return "D"
+    return "F"
+
+
+def _simplified_peer_grade(audits: List[Any]) -> str:
+    """Opinion-only grade used for the region-average peer figure."""
+    opinions: Dict[int, str] = {}
+    for a in audits:
+        if a.audit_year and a.audit_opinion:
+            opinions[a.audit_year] = a.audit_opinion
+    grade = "A"
+    for op in opinions.values():
+        if op.lower() in ("adverse", "disclaimer"):
+            grade = "D"
+            break
+    if opinions:
+        latest_y = max(opinions.keys())
+        if opinions[latest_y].lower() == "qualified" and grade == "A":
+            grade = "C"
+    return grade
+
+
+def _score_county(
+    audits: List[Any],
+    period_years: Dict[int, Optional[int]],
+    total_allocated: float,
+    total_spent: float,
+) -> Dict[str, Any]:
+    """Scorecard fields that depend only on the county's own data."""
+    # --- audit_opinion_history ---
+    opinion_by_year: Dict[int, str] = {}
+    for a in audits:
+        if a.audit_year and a.audit_opinion:
+            opinion_by_year[a.audit_year] = a.audit_opinion
+    audit_opinion_history = sorted(
+        [{"year": y, "opinion": o} for y, o in opinion_by_year.items()],
+        key=lambda x: x["year"],
+    )
+
+    # --- audit_severity_history (for sparklines) ---
+    # Separate from opinion_history: tracks findings severity per year as a
+    # 0-100 "audit health" proxy. Used only for visual trend — does NOT feed
+    # the accountability scoring rubric (opinions there must stay OAG-sourced).
+    # Year resolves from audit_year, else the linked fiscal period's start year.
+    findings_by_year: Dict[int, Dict[str, int]] = {}
+    for a in audits:
+        year = a.audit_year or period_years.get(a.period_id)
+        if not year:
+            continue
+        bucket = findings_by_year.setdefault(
+            year, {"info": 0, "warning": 0, "critical": 0}
+        )
+        sev = a.severity.value if a.severity else "info"
+        bucket[sev] = bucket.get(sev, 0) + 1
+
+    audit_severity_history = []
+    for year in sorted(findings_by_year.keys()):
+        b = findings_by_year[year]
+        # Score: start at 100, -5 per warning, -20 per critical. Floor at 0.
+        score = max(0.0, 100.0 - (b.get("warning", 0) * 5 + b.get("critical", 0) * 20))
+        audit_severity_history.append(
+            {
+                "year": year,
+                "score": round(score, 1),
+                "info": b.get("info", 0),
+                "warning": b.get("warning", 0),
+                "critical": b.get("critical", 0),
+            }
+        )
+
+    total_flagged_amount = float(sum(float(a.amount or 0) for a in audits))
+
+    # --- recurring_findings_count ---
+    qt_years: Dict[str, set] = {}
+    for a in audits:
+        if a.query_type and a.audit_year:
+            qt_years.setdefault(a.query_type, set()).add(a.audit_year)
+    recurring_findings_count = sum(1 for years in qt_years.values() if len(years) >= 2)
+
+    # --- unresolved_findings_count ---
+    # Any status that is NOT a terminal resolution counts as unresolved,
+    # including intermediate states ("Under Review", "Escalated").
+    unresolved_findings_count = sum(
+        1
+        for a in audits
+        if not a.status or a.status.strip().lower() not in _RESOLVED_STATUSES
+    )
+
+    total_findings = len(audits)
+    critical_findings = sum(
+        1 for a in audits if a.severity and a.severity.value == "critical"
+    )
+    warning_findings = sum(
+        1 for a in audits if a.severity and a.severity.value == "warning"
+    )
+
+    absorption_rate = (
+        round(total_spent / total_allocated, 4) if total_allocated > 0 else None
+    )
+    # Flagged amount as % of current-FY budget (signal of audit severity)
+    flagged_pct_of_budget = (
+        (total_flagged_amount / total_allocated * 100.0) if total_allocated > 0 else 0.0
+    )
+
+    # --- accountability_score (0-100 point system) ---
+    #
+    # Starts at 100 and subtracts points for each concern. The grade is
+    # then derived from the final score. A point system is clearer than
+    # cascading letter drops because (a) penalties of different severity
+    # map to different point costs, (b) the UI can show the exact math.
+    score = 100.0
+    grade_factors: List[Dict[str, Any]] = []
+
+    def _penalise(points: float, impact: str, label: str, detail: str) -> None:
+        nonlocal score
+        score -= points
+        grade_factors.append(
+            {
+                "impact": impact,
+                "label": label,
+                "detail": detail,
+                "points": -round(points, 1),
+            }
+        )
+
+    # --- Opinion-based penalties (only fire if we have opinions) ---
+    if audit_opinion_history:
+        adverse_years = sorted(
+            e["year"]
+            for e in audit_opinion_history
+            if e["opinion"].lower() in ("adverse", "disclaimer")
+        )
+        if adverse_years:
+            _penalise(
+                40,
+                "major",
+                f"Adverse / disclaimer opinion ({adverse_years[0]})",
+                "OAG rejected the financial statements",
+            )
+
+        latest_opinion = audit_opinion_history[-1]["opinion"].lower()
+        if latest_opinion == "qualified":
+            _penalise(
+                15,
+                "major",
+                "Qualified opinion (latest FY)",
+                "OAG flagged material concerns",
+            )
+
+    # --- Finding-volume penalties ---
+    if total_findings > 20:
+        _penalise(15, "major", f"{total_findings} audit findings (>20)", "High volume")
+    elif total_findings > 10:
+        _penalise(8, "moderate", f"{total_findings} audit findings (>10)", "Elevated volume")
+    elif total_findings > 5:
+        _penalise(4, "minor", f"{total_findings} audit findings", "Some findings present")
+
+    # Critical findings = any is serious (cap at -15)
+    if critical_findings > 0:
+        pts = min(critical_findings * 5, 15)
+        _penalise(
+            pts,
+            "major" if critical_findings >= 3 else "moderate",
+            f"{critical_findings} critical finding{'s' if critical_findings != 1 else ''}",
+            "Serious irregularity flagged",
+        )
+
+    # Recurring query types (same issue across multiple years)
+    if recurring_findings_count >= 5:
+        _penalise(
+            15,
+            "major",
+            f"{recurring_findings_count} recurring query types",
+            "Systemic, year-over-year issues",
+        )
+    elif recurring_findings_count >= 3:
+        _penalise(
+            8,
+            "moderate",
+            f"{recurring_findings_count} recurring query types",
+            "Repeated across fiscal years",
+        )
+
+    # Unresolved backlog (includes "Under Review", "Escalated", etc.)
+    if unresolved_findings_count > 15:
+        _penalise(
+            20,
+            "major",
+            f"{unresolved_findings_count} unresolved findings",
+            "Large backlog of open issues",
+        )
+    elif unresolved_findings_count > 5:
+        _penalise(
+            10,
+            "moderate",
+            f"{unresolved_findings_count} unresolved findings",
+            "Pending / under-review items",
+        )
+
+    # Flagged amount material to budget
+    if flagged_pct_of_budget > 10:
+        _penalise(
+            10,
+            "moderate",
+            f"{flagged_pct_of_budget:.1f}% of budget flagged",
+            ">10% of current-FY allocation",
+        )
+    elif flagged_pct_of_budget > 5:
+        _penalise(
+            5,
+            "minor",
+            f"{flagged_pct_of_budget:.1f}% of budget flagged",
+            ">5% of current-FY allocation",
+        )
+
+    # Low absorption = wasted fiscal capacity
+    if absorption_rate is not None and absorption_rate < 0.5:
+        _penalise(
+            10,
+            "moderate",
+            f"{absorption_rate * 100:.0f}% budget absorption",
+            "Under half of budget was spent",
+        )
+
+    # Positive factor — acknowledge when we penalised nothing
+    if not grade_factors:
+        grade_factors.append(
+            {
+                "impact": "positive",
+                "label": "No penalty triggers",
+                "detail": (
+                    f"{total_findings} finding"
+                    f"{'s' if total_findings != 1 else ''}, "
+                    f"{unresolved_findings_count} unresolved"
+                ),
+                "points": 0,
+            }
+        )
+
+    score = max(0.0, min(100.0, score))
+    # Grade thresholds matched to familiar academic scale
+    if score >= 85:
+        grade = "A"
+    elif score >= 70:
+        grade = "B"
+    elif score >= 55:
+        grade = "C"
+    elif score >= 40:
+        grade = "D"
+    else:
+        grade = "F"
+
+    return {
+        "audit_opinion_history": audit_opinion_history,
+        "audit_severity_history": audit_severity_history,
+        "total_flagged_amount": total_flagged_amount,
+        "total_findings": total_findings,
+        "critical_findings": critical_findings,
+        "warning_findings": warning_findings,
+        "recurring_findings_count": recurring_findings_count,
+        "unresolved_findings_count": unresolved_findings_count,
+        "absorption_rate": absorption_rate,
+        "flagged_pct_of_budget": round(flagged_pct_of_budget, 2),
+        "accountability_grade": grade,
+        "accountability_score": round(score, 1),
+        "grade_factors": grade_factors,
+    }
+
+
+def _resolve_county_entities(db: Session) -> Dict[str, Entity]:
+    """Map every COUNTY_MAPPING code to its entity in one query.
+
+    Matches on ``"<Name> County"`` canonical name first, then on the
+    ``<name>-county`` slug — the same fallback the endpoints use.
+    """
+    slug_for = {
+        cid: name.lower().replace(" ", "-") + "-county"
+        for cid, name in COUNTY_MAPPING.items()
+    }
+    rows = (
+        db.query(Entity)
+        .filter(
+            or_(
+                Entity.type == EntityType.COUNTY,
+                Entity.slug.in_(list(slug_for.values())),
+            )
+        )
+        .all()
+    )
+    by_name = {
+        (e.canonical_name or ""): e for e in rows if e.type == EntityType.COUNTY
+    }
+    by_slug = {e.slug: e for e in rows}
+
+    resolved: Dict[str, Entity] = {}
+    for cid, name in COUNTY_MAPPING.items():
+        entity = by_name.get(f"{name} County") or by_slug.get(slug_for[cid])
+        if entity is not None:
+            resolved[cid] = entity
+    return resolved
+
+
+def compute_all_scorecards(db: Session) -> Dict[str, Dict[str, Any]]:
+    """Compute every county's scorecard in five grouped queries.
+
+    Returns ``{county_id: record}`` where ``record`` carries the
+    ``scorecard`` response body plus the summary fields (entity id,
+    population, latest-FY allocated/spent) that ``/summary`` needs.
+    """
+    entities = _resolve_county_entities(db)
+    if not entities:
+        return {}
+    entity_ids = sorted({e.id for e in entities.values()})
+
+    audits_by_entity: Dict[int, List[Any]] = defaultdict(list)
+    for row in (
+        db.query(
+            Audit.entity_id,
+            Audit.period_id,
+            Audit.audit_year,
+            Audit.audit_opinion,
+            Audit.severity,
+            Audit.amount,
+            Audit.query_type,
+            Audit.status,
+        )
+        .filter(Audit.entity_id.in_(entity_ids))
+        .order_by(Audit.id)
+        .all()
+    ):
+        audits_by_entity[row.entity_id].append(row)
+
+    needed_periods = {
+        a.period_id
+        for rows in audits_by_entity.values()
+        for a in rows
+        if not a.audit_year and a.period_id
+    }
+    period_years: Dict[int, Optional[int]] = {}
+    if needed_periods:
+        for pid, start_date in (
+            db.query(FiscalPeriod.id, FiscalPeriod.start_date)
+            .filter(FiscalPeriod.id.in_(needed_periods))
+            .all()
+        ):
+            period_years[pid] = start_date.year if start_date else None
+
+    budget_totals = latest_budget_totals(db, entity_ids)
+
+    population_by_entity: Dict[int, int] = {
+        eid: int(total or 0)
+        for eid, total in db.query(
+            EntityLatestStats.entity_id, EntityLatestStats.total_population
+        )
+        .filter(EntityLatestStats.entity_key.in_(entity_ids))
+        .all()
+    }
+
+    # Own-data scorecards first; peer stats below read across them.
+    records: Dict[str, Dict[str, Any]] = {}
+    for cid, entity in entities.items():
+        audits = audits_by_entity.get(entity.id, [])
+        allocated, spent = budget_totals.get(entity.id, (0.0, 0.0))
+        population = population_by_entity.get(entity.id, 0)
+        records[cid] = {
+            "entity_id": entity.id,
+            "county_name": (entity.canonical_name or "").replace(" County", ""),
+            "population": population,
+            "total_allocated": allocated,
+            "total_spent": spent,
+            "peer_grade": _simplified_peer_grade(audits),
+            "scorecard": _score_county(audits, period_years, allocated, spent),
+        }
+
+    for cid, rec in records.items():
+        card = rec["scorecard"]
+        region = COUNTY_REGIONS.get(cid, "Unknown")
+        pop_bracket = _bracket_for(rec["population"])
+
+        region_flagged: List[float] = []
+        region_grades: List[str] = []
+        bracket_flagged: List[float] = []
+        lower_scores = 0
+        for peer_cid, peer in records.items():
+            if peer_cid == cid:
+                continue
+            peer_card = peer["scorecard"]
+            if COUNTY_REGIONS.get(peer_cid) == region:
+                region_flagged.append(peer_card["total_flagged_amount"])
+                region_grades.append(peer["peer_grade"])
+            if _bracket_for(peer["population"]) == pop_bracket:
+                bracket_flagged.append(peer_card["total_flagged_amount"])
+            if peer_card["accountability_score"] < card["accountability_score"]:
+                lower_scores += 1
+
+        peers = len(records) - 1
+        card["peer_comparison"] = {
+            "region": region,
+            "region_avg_flagged_amount": (
+                round(sum(region_flagged) / len(region_flagged), 2)
+                if region_flagged
+                else 0.0
+            ),
+            "region_avg_grade": (
+                _num_to_grade(
+                    sum(_grade_to_num(g) for g in region_grades) / len(region_grades)
+                )
+                if region_grades
+                else None
+            ),
+            "population_bracket": pop_bracket,
+            "population_bracket_avg": (
+                round(sum(bracket_flagged) / len(bracket_flagged), 2)
+                if bracket_flagged
+                else 0.0
+            ),
+            # Share of other counties scoring strictly lower (0-100).
+            "score_percentile": (
+                round(lower_scores / peers * 100.0, 1) if peers > 0 else None
+            ),
+        }
+        rec["scorecard"] = {
+            "county_id": cid,
+            "county_name": rec["county_name"],
+            **card,
+        }
+    return records
+
+
+def refresh_accountability_snapshot(db: Session, reason: str = "manual") -> int:
+    """Compute all scorecards and commit them as a new snapshot version.
+
+    Returns the new version id. Older versions beyond
+    ``KEEP_SNAPSHOT_VERSIONS`` are pruned in the same transaction. After
+    the commit, the cached responses of the scorecard endpoints are
+    dropped (``SCORECARD_CACHE_PREFIXES``) so they serve the new version.
+    """
+    _rebuild_lock(db, wait=True)
+    records = compute_all_scorecards(db)
+
+    snapshot = AccountabilitySnapshot(reason=reason[:100], county_count=len(records))
+    db.add(snapshot)
+    db.flush()
+    for cid, rec in records.items():
+        card = rec["scorecard"]
+        db.add(
+            AccountabilityScorecard(
+                snapshot_id=snapshot.id,
+                county_id=cid,
+                entity_id=rec["entity_id"],
+                grade=card["accountability_grade"],
+                score=card["accountability_score"],
+                population=rec["population"],
+                total_allocated=rec["total_allocated"],
+                total_spent=rec["total_spent"],
+                total_findings=card["total_findings"],
+                payload=card,
+            )
+        )
+
+    stale_ids = [
+        sid
+        for (sid,) in db.query(AccountabilitySnapshot.id)
+        .order_by(AccountabilitySnapshot.id.desc())
+        .offset(KEEP_SNAPSHOT_VERSIONS)
+        .all()
+    ]
+    if stale_ids:
+        db.query(AccountabilityScorecard).filter(
+            AccountabilityScorecard.snapshot_id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+        db.query(AccountabilitySnapshot).filter(
+            AccountabilitySnapshot.id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+
+    db.commit()
+    from cache.redis_cache import clear_response_caches
+
+    clear_response_caches(SCORECARD_CACHE_PREFIXES)
+    logger.info(
+        "Accountability snapshot v%s written (%d counties, reason=%s)",
+        snapshot.id,
+        len(records),
+        reason,
+    )
+    return snapshot.id
+
+
+def refresh_for_domain(db: Session, domain: str) -> Optional[int]:
+    """Refresh the snapshot after *domain* committed, if it feeds scorecards.
+
+    Never raises — a failed refresh must not fail the seeding run; the
+    next read past ``SNAPSHOT_MAX_AGE`` rebuilds it anyway.
+    """
+    if domain not in ACCOUNTABILITY_SOURCE_DOMAINS:
+        return None
+    try:
+        return refresh_accountability_snapshot(db, reason=f"domain:{domain}")
+    except Exception:
+        db.rollback()
+        logger.warning(
+            "Accountability snapshot refresh after %s failed", domain, exc_info=True
+        )
+        return None
+
+
+def _latest_snapshot(db: Session) -> Optional[AccountabilitySnapshot]:
+    return (
+        db.query(AccountabilitySnapshot)
+        .order_by(AccountabilitySnapshot.id.desc())
+        .first()
+    )
+
+
+def _is_stale(snapshot: AccountabilitySnapshot) -> bool:
+    created = snapshot.created_at
+    if created is None:
+        return True
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - created > SNAPSHOT_MAX_AGE
+
+
+def _rebuild_lock(db: Session, wait: bool) -> bool:
+    """Take the rebuild lock until this transaction ends; False if busy.
+
+    Always granted on other dialects (SQLite in tests and local runs).
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    if wait:
+        db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": REBUILD_LOCK_KEY})
+        return True
+    return bool(
+        db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": REBUILD_LOCK_KEY}
+        ).scalar()
+    )
+
+
+def ensure_current_snapshot(db: Session) -> Optional[int]:
+    """Return the latest snapshot version, building one if missing or stale.
+
+    Only one request rebuilds at a time. While a stale snapshot is being
+    rebuilt the others return it as is; with none at all they wait for
+    the first build.
+    """
+    snapshot = _latest_snapshot(db)
+    if snapshot is not None and not _is_stale(snapshot):
+        return snapshot.id
+    try:
+        if not _rebuild_lock(db, wait=snapshot is None):
+            return snapshot.id
+        # Another request may have finished a rebuild while this one waited.
+        latest = _latest_snapshot(db)
+        if latest is not None and not _is_stale(latest):
+            db.commit()  # releases the lock
+            return latest.id
+        return refresh_accountability_snapshot(
+            db, reason="initial" if snapshot is None else "stale"
+        )
+    except Exception:
+        db.rollback()
+        logger.warning("Accountability snapshot rebuild failed", exc_info=True)
+        return snapshot.id if snapshot is not None else None
+
+
+def get_county_scorecard(
+    db: Session, county_id: str
+) -> Optional[AccountabilityScorecard]:
+    """Key lookup of one county's scorecard in the current snapshot."""
+    version = ensure_current_snapshot(db)
+    if version is None:
+        return None
+    return (
+        db.query(AccountabilityScorecard)
+        .filter(
+            AccountabilityScorecard.snapshot_id == version,
+            AccountabilityScorecard.county_id == county_id,
+        )
+        .first()
+    )
+
+
+def list_scorecards(db: Session) -> Tuple[Optional[int], List[AccountabilityScorecard]]:
+    """All scorecards in the current snapshot, best score first."""
+    version = ensure_current_snapshot(db)
+    if version is None:
+        return None, []
+    rows = (
+        db.query(AccountabilityScorecard)
+        .filter(AccountabilityScorecard.snapshot_id == version)
+        .order_by(
+            AccountabilityScorecard.score.desc(), AccountabilityScorecard.county_id
+        )
+        .all()
+    )
+    return version, rows
+
+
+__all__ = [
+    "ACCOUNTABILITY_SOURCE_DOMAINS",
+    "REBUILD_LOCK_KEY",
+    "compute_all_scorecards",
+    "ensure_current_snapshot",
+    "get_county_scorecard",
+    "list_scorecards",
+    "refresh_accountability_snapshot",
+    "refresh_for_domain",
+]
@@ -1,7 +1,23 @@
 """Alert notification service.
 
-Calls the Supabase `notify_watchers()` PostgreSQL function to fan out
-data-change alerts to every user watching the affected item.
+Data-change alerts for everyone watching an item go through an outbox.
+:func:`notify_watchers` only appends an ``alert_outbox`` row to the
+caller's session. There is no query and no commit, so an ingestion run
+that touches all 47 counties adds 47 rows to its own transaction, and
+the alerts exist only if that transaction commits.
+
+The :class:`AlertDispatcher` background loop (started with the API's
+admin role) drains pending rows in batches. Per batch it runs three
+statements in one transaction:
+
+- claim the batch with ``FOR UPDATE SKIP LOCKED``
+- one ``INSERT INTO data_alerts ... SELECT`` joining the batch to the
+  watchers with ``notify`` on (what ``public.notify_watchers()`` did
+  per item)
+- one ``UPDATE`` that stamps the rows dispatched
+
+With ``ALERT_EMAILS_ENABLED`` set, each watcher then gets one digest
+email per batch through the pooled, rate-limited SMTP sender.
 
 Usage from any backend route or ETL job::
 
@@ -16,18 +32,27 @@ Usage from any backend route or ETL job::
         title="New audit report for Nairobi County",
         body="The OAG has published the FY 2024/25 audit report.",
     )
+    db.commit()  # the caller's own commit publishes the alert
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Optional
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import text
+from models import AlertOutbox, DataAlert, User, WatchlistItem
+from sqlalchemy import and_, func, insert, literal, or_, select, update
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
 
+DISPATCH_BATCH_SIZE = 500
+
 
 def notify_watchers(
     db: Session,
@@ -37,39 +62,264 @@ def notify_watchers(
     alert_type: str,
     title: str,
     body: Optional[str] = None,
-) -> int:
-    """Fan out an alert to all users watching *item_type/item_id*.
+) -> AlertOutbox:
+    """Queue an alert for all users watching *item_type/item_id*.
+
+    The row is added to ``db`` and committed (or rolled back) with the
+    caller's transaction. The dispatcher creates the ``data_alerts``.
+    """
+    entry = AlertOutbox(
+        item_type=item_type,
+        item_id=str(item_id),
+        alert_type=alert_type,
+        title=title,
+        body=body or "",
+    )
+    db.add(entry)
+    return entry
 
-    Delegates to the ``public.notify_watchers()`` Postgres function
-    defined in the Supabase migration ``20260228_alert_generation.sql``.
 
-    Returns the number of alerts created (i.e. watchers notified).
+@dataclass
+class DispatchResult:
+    batches: int = 0
+    outbox_rows: int = 0
+    alerts_created: int = 0
+    emails_sent: int = 0
+    email_failures: int = 0
+
+    def add(self, other: "DispatchResult") -> None:
+        self.batches += other.batches
+        self.outbox_rows += other.outbox_rows
+        self.alerts_created += other.alerts_created
+        self.emails_sent += other.emails_sent
+        self.email_failures += other.email_failures
+
+
+def _emails_enabled() -> bool:
+    return os.getenv("ALERT_EMAILS_ENABLED", "false").lower() in ("true", "1", "yes")
+
+
+def _watches(outbox=AlertOutbox):
+    """Join condition: watchers of an outbox row who want alerts."""
+    return and_(
+        WatchlistItem.item_type == outbox.item_type,
+        WatchlistItem.item_id == outbox.item_id,
+        WatchlistItem.notify.is_(True),
+    )
+
+
+def dispatch_batch(
+    db: Session,
+    batch_size: int = DISPATCH_BATCH_SIZE,
+    send_emails: Optional[bool] = None,
+) -> DispatchResult:
+    """Fan out the oldest ``batch_size`` pending outbox rows.
+
+    Concurrent dispatchers skip each other's claimed rows. The in-app
+    alerts are committed before any email is sent, so a mail failure is
+    logged and counted but never re-creates alerts.
     """
-    try:
-        result = db.execute(
-            text(
-                "SELECT public.notify_watchers(:item_type, :item_id, :alert_type, :title, :body)"
-            ),
-            {
-                "item_type": item_type,
-                "item_id": item_id,
-                "alert_type": alert_type,
-                "title": title,
-                "body": body or "",
-            },
+    result = DispatchResult()
+    ids = (
+        db.execute(
+            select(AlertOutbox.id)
+            .where(AlertOutbox.dispatched_at.is_(None))
+            .order_by(AlertOutbox.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    if not ids:
+        db.commit()  # nothing claimed; just end the transaction
+        return result
+
+    now = datetime.now(timezone.utc)
+    fan_out = (
+        select(
+            WatchlistItem.user_id,
+            AlertOutbox.alert_type,
+            AlertOutbox.title,
+            func.coalesce(AlertOutbox.body, ""),
+            AlertOutbox.item_type,
+            AlertOutbox.item_id,
+            literal(False),
+            literal(now),
+        )
+        .join(WatchlistItem, _watches())
+        .where(AlertOutbox.id.in_(ids))
+    )
+    created = db.execute(
+        insert(DataAlert).from_select(
+            [
+                "user_id",
+                "alert_type",
+                "title",
+                "body",
+                "item_type",
+                "item_id",
+                "read",
+                "created_at",
+            ],
+            fan_out,
+        )
+    ).rowcount
+
+    watcher_count = (
+        select(func.count(WatchlistItem.id))
+        .where(_watches())
+        .correlate(AlertOutbox)
+        .scalar_subquery()
+    )
+    db.execute(
+        update(AlertOutbox)
+        .where(AlertOutbox.id.in_(ids))
+        .values(dispatched_at=now, alerts_created=watcher_count)
+        .execution_options(synchronize_session=False)
+    )
+
+    send_emails = _emails_enabled() if send_emails is None else send_emails
+    digests = _email_digests(db, ids) if send_emails else {}
+    db.commit()
+
+    result.batches = 1
+    result.outbox_rows = len(ids)
+    result.alerts_created = max(created or 0, 0)
+    if digests:
+        result.emails_sent, result.email_failures = _send_digests(digests)
+    logger.info(
+        "Dispatched %d outbox alerts → %d data_alerts, %d emails",
+        result.outbox_rows,
+        result.alerts_created,
+        result.emails_sent,
+    )
+    return result
+
+
+def dispatch_pending(
+    db: Session,
+    batch_size: int = DISPATCH_BATCH_SIZE,
+    max_batches: Optional[int] = None,
+    send_emails: Optional[bool] = None,
+) -> DispatchResult:
+    """Dispatch batches until the outbox is empty (or ``max_batches``)."""
+    total = DispatchResult()
+    while max_batches is None or total.batches < max_batches:
+        batch = dispatch_batch(db, batch_size=batch_size, send_emails=send_emails)
+        if not batch.batches:
+            break
+        total.add(batch)
+    return total
+
+
+def _email_digests(
+    db: Session, ids: List[int]
+) -> Dict[str, List[Tuple[str, str, str]]]:
+    """``{email: [(title, body, item), ...]}`` for the batch's watchers."""
+    rows = db.execute(
+        select(
+            User.email,
+            AlertOutbox.title,
+            AlertOutbox.body,
+            AlertOutbox.item_type,
+            AlertOutbox.item_id,
         )
-        count = result.scalar() or 0
-        db.commit()
-        if count:
-            logger.info(
-                "Notified %d watchers for %s/%s (%s)",
-                count,
-                item_type,
-                item_id,
-                alert_type,
-            )
-        return count
-    except Exception:
-        db.rollback()
-        logger.exception("Failed to notify watchers for %s/%s", item_type, item_id)
-        return 0
+        .join(WatchlistItem, _watches())
+        .join(User, User.id == WatchlistItem.user_id)
+        .where(
+            AlertOutbox.id.in_(ids),
+            or_(User.disabled.is_(None), User.disabled.is_(False)),
+            or_(User.alert_emails.is_(None), User.alert_emails.is_(True)),
+        )
+        .order_by(User.email, AlertOutbox.id)
+    ).all()
+    digests: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+    for email, title, body, item_type, item_id in rows:
+        digests[email].append((title, body or "", f"{item_type}/{item_id}"))
+    return digests
+
+
+def _send_digests(digests: Dict[str, List[Tuple[str, str, str]]]) -> Tuple[int, int]:
+    from services.email_service import (
+        _smtp_configured,
+        build_alert_digest,
+        smtp_pool,
+    )
+
+    if not _smtp_configured():
+        logger.info("SMTP not configured — skipping %d alert emails", len(digests))
+        return 0, 0
+    pool = smtp_pool()
+    sent = failed = 0
+    for email, alerts in digests.items():
+        try:
+            pool.send(build_alert_digest(email, alerts))
+            sent += 1
+        except Exception as exc:
+            failed += 1
+            logger.error("Failed to send alert email to %s: %s", email, exc)
+    return sent, failed
+
+
+class AlertDispatcher:
+    """Background loop draining the alert outbox every ``interval`` seconds."""
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        batch_size: int = DISPATCH_BATCH_SIZE,
+    ):
+        self.interval = (
+            interval
+            if interval is not None
+            else float(os.getenv("ALERT_DISPATCH_INTERVAL_SECONDS", "30"))
+        )
+        self.batch_size = batch_size
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+
+    def run_once(self) -> DispatchResult:
+        from database import SessionLocal
+
+        with SessionLocal() as db:
+            return dispatch_pending(db, batch_size=self.batch_size)
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self.is_running = True
+        self._task = asyncio.create_task(self._loop())
+        logger.info("Alert dispatcher started (every %.0fs)", self.interval)
+
+    async def _loop(self) -> None:
+        while self.is_running:
+            try:
+                await asyncio.to_thread(self.run_once)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                logger.error(f"Alert dispatch failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    async def stop(self) -> None:
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Alert dispatcher stopped")
+
+
+# Global instance
+alert_dispatcher = AlertDispatcher()
+
+
+async def start_alert_dispatcher() -> None:
+    await alert_dispatcher.start()
+
+
+async def stop_alert_dispatcher() -> None:
+    await alert_dispatcher.stop()
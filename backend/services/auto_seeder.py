@@ -17,7 +17,8 @@ Architecture:
 - Uses existing ETL infrastructure (kenya_pipeline.py, knbs_parser.py)
 - LiveDataAggregator fetches from all sources
 - Automatic fallback when primary sources unavailable
-- Scheduled refresh based on data volatility
+- Scheduled refresh based on data volatility, run as jobs on
+  services.job_scheduler (see schedules())
 """
 
 import asyncio
@@ -27,6 +28,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from database import SessionLocal
+from monitoring.instrumentation import etl_stage
 from models import (
     Country,
     DebtCategory,
@@ -36,11 +38,15 @@ from models import (
     EntityType,
     Loan,
     PopulationData,
+    QueuedJob,
     SourceDocument,
 )
 
 # Import the live data fetcher
+from services.job_scheduler import Every, Schedule, enqueue, job
+from services.latest_stats import refresh_latest_stats
 from services.live_data_fetcher import LiveDataAggregator
+from services.static_snapshots import publish_for_domain
 
 logger = logging.getLogger("auto_seeder")
 
@@ -120,11 +126,11 @@ class AutoSeeder:
     - Updates database without human intervention
     """
 
-    # Domains seeded synchronously at boot via seed_all_domains().
-    # Exposed as a class attribute so _initial_seed_and_loop can backfill
-    # last_refresh only for REFRESH_SCHEDULE domains that AREN'T in this
-    # set — preserving the existing retry-on-next-tick behaviour for
-    # boot-seeded domains that fail at startup.
+    # Domains seeded in order at boot via seed_all_domains(). The other
+    # REFRESH_SCHEDULE domains (registry-only: budgets, audits,
+    # counties_budget) first run one interval after boot — running the
+    # registry pipeline (pdfplumber + pandas + HTTP scrapes) at every
+    # boot OOMs a 512 MB worker on Render.
     _BOOT_DOMAINS: tuple = (
         "counties",
         "national_entity",
@@ -136,7 +142,6 @@ class AutoSeeder:
     def __init__(self):
         self.last_refresh: Dict[str, datetime] = {}
         self.is_running = False
-        self._task: Optional[asyncio.Task] = None
         self.aggregator = LiveDataAggregator()
         self._fetch_stats = {
             "total_fetches": 0,
@@ -145,8 +150,15 @@ class AutoSeeder:
             "last_full_refresh": None,
         }
 
-    async def start(self):
-        """Start the auto-seeder background task."""
+    async def start(self, skip_if_recent: Optional[timedelta] = None):
+        """Mark the seeder running and queue the boot seed.
+
+        The seed runs as a ``seed.all`` job on ``services.job_scheduler``
+        so it doesn't block uvicorn startup; later refreshes are the
+        per-domain schedules from :func:`schedules`. With
+        ``skip_if_recent``, a seed that succeeded within that window
+        counts as the boot seed (ETL worker restarts).
+        """
         if self.is_running:
             logger.warning("Auto-seeder already running")
             return
@@ -154,98 +166,36 @@ class AutoSeeder:
         self.is_running = True
         logger.info("[AUTO-SEEDER] Starting Fully Automated Data Seeder")
         logger.info("[AUTO-SEEDER] NO HARDCODED DATA - All data from live sources")
-
-        # Run initial seed in background so it doesn't block uvicorn startup.
-        # The server can start serving requests immediately using bootstrap data.
-        self._task = asyncio.create_task(self._initial_seed_and_loop())
-        logger.info("[AUTO-SEEDER] Background seed + refresh loop started")
-
-    async def _initial_seed_and_loop(self):
-        """Run initial seed then start the periodic refresh loop."""
-        try:
-            await self.seed_all_domains()
-        except Exception as exc:
-            logger.warning(f"[AUTO-SEEDER] Initial seed failed (non-critical): {exc}")
-
-        # Backfill last_refresh ONLY for REFRESH_SCHEDULE domains that
-        # aren't boot-seeded (registry-only: budgets, audits,
-        # counties_budget). Without this they have last_refresh=None
-        # forever and the hourly tick re-runs the registry pipeline
-        # (pdfplumber + pandas + HTTP scrapes) every hour — which OOMs
-        # a 512 MB worker on Render.
-        #
-        # Boot-seeded domains are deliberately excluded: if their seed
-        # raised, last_refresh stays None and the hourly tick retries
-        # them on next iteration — that's the existing transient-failure
-        # behaviour and we don't want to suppress it.
-        boot_time = datetime.now(timezone.utc)
-        for domain in REFRESH_SCHEDULE:
-            if domain not in self._BOOT_DOMAINS:
-                self.last_refresh.setdefault(domain, boot_time)
-
-        await self._refresh_loop()
+        if await asyncio.to_thread(_enqueue_seed_all, 90, skip_if_recent):
+            logger.info("[AUTO-SEEDER] Boot seed queued")
+        else:
+            logger.info("[AUTO-SEEDER] Recent full seed found; boot seed skipped")
 
     async def stop(self):
-        """Stop the auto-seeder background task."""
+        """Stop accepting seeder work (queued jobs stay in the queue)."""
         self.is_running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
         logger.info("[AUTO-SEEDER] Service stopped")
 
-    async def _refresh_loop(self):
-        """Background loop that checks and refreshes stale data."""
-        while self.is_running:
-            try:
-                # Check every hour
-                await asyncio.sleep(3600)
-                await self._check_and_refresh()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in refresh loop: {e}")
-                # Wait before retrying on error
-                await asyncio.sleep(60)
-
-    async def _check_and_refresh(self):
-        """Check which domains need refresh and update them."""
+    async def refresh_domain(self, domain: str):
+        """Refresh one domain; raises so the job scheduler records the failure."""
+        logger.info(f"[AUTO-SEEDER] Refreshing {domain}...")
+        self._fetch_stats["total_fetches"] += 1
+        try:
+            await self._seed_domain(domain)
+        except Exception:
+            self._fetch_stats["failed_fetches"] += 1
+            raise
         now = datetime.now(timezone.utc)
-        logger.info("[AUTO-SEEDER] Checking for stale data...")
-
-        for domain, refresh_hours in REFRESH_SCHEDULE.items():
-            last = self.last_refresh.get(domain)
-
-            if last is None or (now - last).total_seconds() > refresh_hours * 3600:
-                logger.info(
-                    f"[AUTO-SEEDER] Refreshing {domain} (stale or never fetched)..."
-                )
-
-                try:
-                    await self._seed_domain(domain)
-                    self.last_refresh[domain] = now
-                    self._fetch_stats["successful_fetches"] += 1
-                except Exception as e:
-                    logger.error(f"Failed to refresh {domain}: {e}")
-                    self._fetch_stats["failed_fetches"] += 1
-
-                self._fetch_stats["total_fetches"] += 1
-
-                # Rate limiting between domain refreshes
-                await asyncio.sleep(5)
-
+        self.last_refresh[domain] = now
+        self._fetch_stats["successful_fetches"] += 1
         self._fetch_stats["last_full_refresh"] = now.isoformat()
 
-    async def seed_all_domains(self):
-        """Seed all data domains from live sources."""
+    async def seed_all_domains(self) -> List[str]:
+        """Seed all boot domains from live sources; returns the ones that failed."""
         logger.info("[AUTO-SEEDER] === FULL DATA REFRESH FROM LIVE SOURCES ===")
 
         # Order matters: entities first, then data that references them.
-        # Sourced from the class attribute so _initial_seed_and_loop and
-        # this method stay in sync — drift between the two is what
-        # caused the hourly OOM cycle in the first place.
+        failed: List[str] = []
         for domain in self._BOOT_DOMAINS:
             try:
                 logger.info(f"[AUTO-SEEDER] Processing domain: {domain}")
@@ -255,32 +205,38 @@ class AutoSeeder:
             except Exception as e:
                 logger.error(f"Failed to seed {domain}: {e}")
                 self._fetch_stats["failed_fetches"] += 1
+                failed.append(domain)
 
             self._fetch_stats["total_fetches"] += 1
             await asyncio.sleep(2)  # Rate limiting
 
         logger.info("[AUTO-SEEDER] === FULL DATA REFRESH COMPLETE ===")
         logger.info(f"[AUTO-SEEDER] Stats: {self._fetch_stats}")
+        return failed
 
     async def _seed_domain(self, domain: str):
         """Seed a specific domain with fresh data from live sources."""
-        if domain == "counties":
-            await self._seed_counties_live()
-        elif domain == "national_entity":
-            await self._ensure_national_entity()
-        elif domain == "debt":
-            await self._seed_debt_live()
-        elif domain == "population":
-            await self._seed_population_live()
-        elif domain == "economic":
-            await self._seed_economic_live()
-        elif domain in ("counties_budget", "audits", "budgets"):
-            # Delegate to the seeding-registry domain so the CoB CBIRR and
-            # OAG audit data used by the Follow-the-Money waterfall stay
-            # current without a manual CLI run.
-            await self._seed_registry_domain(
-                "counties_budget" if domain == "budgets" else domain
-            )
+        with etl_stage("auto_seeder", domain):
+            if domain == "counties":
+                await self._seed_counties_live()
+            elif domain == "national_entity":
+                await self._ensure_national_entity()
+            elif domain == "debt":
+                await self._seed_debt_live()
+            elif domain == "population":
+                await self._seed_population_live()
+            elif domain == "economic":
+                await self._seed_economic_live()
+            elif domain in ("counties_budget", "audits", "budgets"):
+                # Delegate to the seeding-registry domain so the CoB CBIRR and
+                # OAG audit data used by the Follow-the-Money waterfall stay
+                # current without a manual CLI run.
+                await self._seed_registry_domain(
+                    "counties_budget" if domain == "budgets" else domain
+                )
+        # Re-render the public pages' static snapshots now that the domain
+        # has committed (no-op unless STATIC_SNAPSHOTS_ENABLED).
+        await publish_for_domain(domain)
 
     async def _seed_registry_domain(self, domain_name: str):
         """Run a registry-based seeding domain (counties_budget, audits).
@@ -316,6 +272,9 @@ class AutoSeeder:
                     )
                     runner(db, settings, ctx)
                     db.commit()
+                    from services.accountability import refresh_for_domain
+
+                    refresh_for_domain(db, domain_name)
 
             await loop.run_in_executor(None, _run)
             logger.info(
@@ -578,6 +537,7 @@ class AutoSeeder:
                         )
                         records_created += 1
 
+            refresh_latest_stats(db)
             db.commit()
             logger.info(
                 f"[AUTO-SEEDER] Population: {records_created} created, {records_updated} updated"
@@ -749,6 +709,87 @@ class AutoSeeder:
 # Global instance
 auto_seeder = AutoSeeder()
 
+# Registry domains run the PDF/pandas seeding pipeline.
+_CPU_DOMAINS = ("counties_budget", "audits", "budgets")
+
+
+def _enqueue_seed_all(
+    priority: int, skip_if_recent: Optional[timedelta] = None
+) -> bool:
+    with SessionLocal() as db:
+        if skip_if_recent is not None:
+            since = datetime.now(timezone.utc).replace(tzinfo=None) - skip_if_recent
+            recent = (
+                db.query(QueuedJob.id)
+                .filter(
+                    QueuedJob.key == "seed:all",
+                    QueuedJob.status == QueuedJob.SUCCEEDED,
+                    QueuedJob.finished_at >= since,
+                )
+                .first()
+            )
+            if recent is not None:
+                return False
+        enqueue(db, "seed.all", key="seed:all", priority=priority)
+        return True
+
+
+@job("seed.all", resource_class="network", priority=90)
+async def seed_all_job() -> Dict[str, Any]:
+    """Seed the boot domains; failed ones get a ``seed.domain`` retry in an hour."""
+    failed = await auto_seeder.seed_all_domains()
+    if failed:
+        retry_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+
+        def _queue_retries() -> None:
+            with SessionLocal() as db:
+                for domain in failed:
+                    if domain in REFRESH_SCHEDULE:
+                        enqueue(
+                            db,
+                            "seed.domain",
+                            {"domain": domain},
+                            key=f"seed:{domain}",
+                            run_at=retry_at,
+                            commit=False,
+                        )
+                db.commit()
+
+        await asyncio.to_thread(_queue_retries)
+    return {"failed": failed}
+
+
+@job("seed.domain", resource_class="network", priority=60)
+async def seed_domain_job(domain: str) -> None:
+    await auto_seeder.refresh_domain(domain)
+
+
+def schedules() -> List[Schedule]:
+    """One refresh schedule per REFRESH_SCHEDULE domain.
+
+    Every domain first runs one interval after boot: boot domains were
+    just seeded by ``seed.all``, and registry domains must not run at
+    boot (see ``AutoSeeder._BOOT_DOMAINS``).
+    """
+    out = []
+    for domain, hours in REFRESH_SCHEDULE.items():
+        seconds = hours * 3600
+        out.append(
+            Schedule(
+                f"seed:{domain}",
+                "seed.domain",
+                Every(seconds, first_delay=seconds),
+                {"domain": domain},
+                resource_class="cpu" if domain in _CPU_DOMAINS else "network",
+            )
+        )
+    return out
+
+
+async def trigger_full_refresh() -> None:
+    """Queue an immediate full refresh ahead of scheduled work."""
+    await asyncio.to_thread(_enqueue_seed_all, 100)
+
 
 async def start_auto_seeder():
     """Start the auto-seeder service."""
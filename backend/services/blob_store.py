@@ -0,0 +1,696 @@
+"""Content-addressed blob store shared by every downloader.
+
+The ETL downloaders, the seeding fetchers and the Parliament client used
+to keep their own folders and naming schemes, so the same CoB PDF was
+downloaded and stored once per consumer. They now all go through one
+:class:`BlobStore`:
+
+* Blobs are keyed by SHA-256 (``ab/abcdef...<ext>``) and stored once,
+  whichever URL or consumer brought them in. The MD5 is kept alongside
+  because ``source_documents.md5`` and the ETL manifest are keyed on it.
+* A SQLite index maps URLs to blobs, so :meth:`BlobStore.get_or_fetch`
+  answers a URL it fetched recently from the store without touching the
+  network. Every URL entry, including landing pages aliased to the file
+  they resolved to, expires after the store's ``max_age`` (or a shorter
+  one the caller passes), so a document republished at the same URL is
+  picked up on the next fetch after that.
+* Bytes live on a pluggable backend. :class:`LocalBackend` is a
+  directory. :class:`S3Backend` keeps the durable copy in the bucket and
+  a local cache for consumers that need a file path (PDF parsers).
+* A blob is referenced by every URL that points at it and by every
+  *pin*: a holder such as ``dspace:<bitstream_uuid>`` whose database row
+  records the file. A holder pins one blob, so pinning new content moves
+  the pin off the old version. :meth:`BlobStore.release_pins` drops pins
+  whose holder row is gone (the ``etl.blob_gc`` job does this for
+  ``document:<md5>`` against ``source_documents``). :meth:`BlobStore.gc`
+  deletes unreferenced blobs, e.g. the old version after a URL starts
+  serving new content. Over the size cap it also evicts the least
+  recently used unpinned blobs from local disk. With :class:`S3Backend`
+  only the local cache copy goes and the bucket copy is restored on next
+  use; with :class:`LocalBackend` the blob is fetched again.
+
+Configuration (environment):
+  BLOB_STORE_PATH     index and local blobs (default ``downloads/blobs``;
+                      relative paths are taken from the repository root,
+                      so every process shares one store whatever its cwd)
+  BLOB_STORE_BACKEND  ``local``, ``s3`` or ``auto`` (default ``auto``):
+                      S3 under ``blobs/`` in AWS_BUCKET_NAME when a bucket,
+                      credentials and boto3 are available
+  BLOB_STORE_MAX_MB   cap in MB on the blobs kept on local disk; 0 (default)
+                      means no cap
+  BLOB_STORE_MAX_AGE_HOURS  how long a URL is served from the store
+                      before it is fetched again (default 168)
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import mimetypes
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Union
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Repository root, as in services.etl_reports.artifact_root().
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+DEFAULT_ROOT = REPO_ROOT / "downloads" / "blobs"
+DEFAULT_MAX_AGE_SECONDS = 7 * 24 * 3600
+INDEX_FILENAME = "index.sqlite"
+S3_PREFIX = "blobs"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    md5 TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    content_type TEXT,
+    key TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_blobs_md5 ON blobs (md5);
+CREATE INDEX IF NOT EXISTS ix_blobs_last_access ON blobs (last_access);
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_urls_sha256 ON urls (sha256);
+CREATE TABLE IF NOT EXISTS pins (
+    holder TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (holder, sha256)
+);
+CREATE INDEX IF NOT EXISTS ix_pins_sha256 ON pins (sha256);
+"""
+
+_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Blob:
+    """A stored blob, materialized at ``path`` on the local filesystem."""
+
+    sha256: str
+    md5: str
+    size: int
+    content_type: Optional[str]
+    key: str
+    path: Path
+    fetched: bool = False  # True when this call downloaded it
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+
+class LocalBackend:
+    """Blobs as files under ``root``."""
+
+    name = "local"
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def store(self, key: str, source: Path, content_type: Optional[str]) -> None:
+        dest = self.path(key)
+        if dest.exists():
+            source.unlink(missing_ok=True)
+            return
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source, dest)
+
+    def ensure_local(self, key: str) -> Optional[Path]:
+        path = self.path(key)
+        return path if path.exists() else None
+
+    def remote_key(self, key: str) -> Optional[str]:
+        return None
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+    def evict(self, key: str) -> bool:
+        """Free the local copy; False because no other copy remains."""
+        self.delete(key)
+        return False
+
+
+class S3Backend:
+    """Blobs in ``s3://<bucket>/<prefix>/``, cached under ``cache_dir``."""
+
+    name = "s3"
+
+    def __init__(self, client, bucket: str, cache_dir: Union[str, Path]):
+        self.client = client
+        self.bucket = bucket
+        self.cache = LocalBackend(cache_dir)
+
+    def path(self, key: str) -> Path:
+        return self.cache.path(key)
+
+    def remote_key(self, key: str) -> str:
+        return f"{S3_PREFIX}/{key}"
+
+    def _exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.remote_key(key))
+            return True
+        except Exception:
+            return False
+
+    def store(self, key: str, source: Path, content_type: Optional[str]) -> None:
+        if not self._exists(key):
+            extra = {"ContentType": content_type} if content_type else {}
+            self.client.upload_file(
+                str(source), self.bucket, self.remote_key(key), ExtraArgs=extra
+            )
+        self.cache.store(key, source, content_type)
+
+    def ensure_local(self, key: str) -> Optional[Path]:
+        path = self.cache.ensure_local(key)
+        if path is not None:
+            return path
+        dest = self.path(key)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + ".download")
+        try:
+            self.client.download_file(self.bucket, self.remote_key(key), str(tmp))
+        except Exception as exc:
+            logger.warning("Blob %s not in s3://%s: %s", key, self.bucket, exc)
+            tmp.unlink(missing_ok=True)
+            return None
+        os.replace(tmp, dest)
+        return dest
+
+    def delete(self, key: str) -> None:
+        try:
+            self.client.delete_object(Bucket=self.bucket, Key=self.remote_key(key))
+        except Exception as exc:
+            logger.warning("Could not delete s3 blob %s: %s", key, exc)
+        self.cache.delete(key)
+
+    def evict(self, key: str) -> bool:
+        """Free the local cache copy; the bucket keeps the durable one."""
+        self.cache.delete(key)
+        return True
+
+
+def _extension(url: Optional[str], name: Optional[str], content_type, head: bytes):
+    for candidate in (name, urlparse(url).path if url else None):
+        suffix = Path(candidate or "").suffix.lower()
+        if suffix and len(suffix) <= 6 and suffix[1:].isalnum():
+            return suffix
+    if head.startswith(b"%PDF"):
+        return ".pdf"
+    if content_type:
+        guessed = mimetypes.guess_extension(content_type.split(";")[0].strip())
+        if guessed:
+            return guessed
+    return ".bin"
+
+
+def http_fetch(url: str) -> bytes:
+    """Default fetcher for :meth:`BlobStore.get_or_fetch`."""
+    import requests
+
+    response = requests.get(url, timeout=60)
+    response.raise_for_status()
+    return response.content
+
+
+class BlobStore:
+    """SHA-256 addressed blobs with a URL index, pins and a size cap."""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_ROOT,
+        backend=None,
+        max_bytes: Optional[int] = None,
+        max_age: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or LocalBackend(self.root / "objects")
+        self.max_bytes = max_bytes or None
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        # Held only while a get_or_fetch for the URL is in flight
+        self._url_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._conn = sqlite3.connect(
+            str(self.root / INDEX_FILENAME), timeout=30, check_same_thread=False
+        )
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- reads -----------------------------------------------------------
+    def get(self, sha256: str) -> Optional[Blob]:
+        """The blob with this SHA-256, fetched from the backend if needed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, md5, size_bytes, content_type, key FROM blobs"
+                " WHERE sha256 = ?",
+                (sha256,),
+            ).fetchone()
+        return self._materialize(row)
+
+    def find_md5(self, md5: str) -> Optional[Blob]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, md5, size_bytes, content_type, key FROM blobs"
+                " WHERE md5 = ?",
+                (md5.lower(),),
+            ).fetchone()
+        return self._materialize(row)
+
+    def lookup_url(self, url: str, max_age: Optional[float] = None) -> Optional[Blob]:
+        """The blob last fetched from ``url``, unless older than ``max_age``.
+
+        ``max_age`` is in seconds and capped at the store's own ``max_age``.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.sha256, b.md5, b.size_bytes, b.content_type, b.key,"
+                " u.fetched_at FROM urls u JOIN blobs b ON b.sha256 = u.sha256"
+                " WHERE u.url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        max_age = self.max_age if max_age is None else min(max_age, self.max_age)
+        if time.time() - row[5] > max_age:
+            return None
+        return self._materialize(row[:5])
+
+    def remote_key(self, blob: Blob) -> Optional[str]:
+        """Object key of ``blob`` in the remote backend (None when local)."""
+        return self.backend.remote_key(blob.key)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM blobs"
+            ).fetchone()[0]
+
+    def local_bytes(self) -> int:
+        """Bytes of the blobs present on local disk (what the cap limits)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT key, size_bytes FROM blobs").fetchall()
+        return sum(size for key, size in rows if self.backend.path(key).exists())
+
+    def refcount(self, sha256: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM urls WHERE sha256 = ?)"
+                " + (SELECT COUNT(*) FROM pins WHERE sha256 = ?)",
+                (sha256, sha256),
+            ).fetchone()[0]
+
+    def _materialize(self, row, fetched: bool = False) -> Optional[Blob]:
+        if row is None:
+            return None
+        sha256, md5, size, content_type, key = row
+        path = self.backend.ensure_local(key)
+        if path is None:
+            return None
+        with self._lock:
+            self._conn.execute(
+                "UPDATE blobs SET last_access = ? WHERE sha256 = ?",
+                (time.time(), sha256),
+            )
+            self._conn.commit()
+        return Blob(sha256, md5, size, content_type, key, path, fetched)
+
+    # -- writes ----------------------------------------------------------
+    def get_or_fetch(
+        self,
+        url: str,
+        fetch: Optional[Callable[[str], Optional[bytes]]] = None,
+        *,
+        max_age: Optional[float] = None,
+        content_type: Optional[str] = None,
+        name: Optional[str] = None,
+        pin: Optional[str] = None,
+    ) -> Optional[Blob]:
+        """Return the stored blob for ``url``, calling ``fetch(url)`` on a miss.
+
+        ``fetch`` returns the body (None for "nothing there") and may raise;
+        it defaults to a plain GET. A stored copy older than ``max_age``
+        seconds (default and upper bound: the store's) counts as a miss.
+        Concurrent calls for one URL in this process wait for a single fetch.
+        """
+        with self._lock:
+            url_lock = self._url_locks.get(url)
+            if url_lock is None:
+                url_lock = self._url_locks[url] = threading.Lock()
+        with url_lock:
+            blob = self.lookup_url(url, max_age=max_age)
+            if blob is None:
+                data = (fetch or http_fetch)(url)
+                if data is None:
+                    return None
+                return self.put(
+                    data, url=url, content_type=content_type, name=name, pin=pin
+                )
+            if pin:
+                self.pin(blob.sha256, pin)
+            return blob
+
+    def put(
+        self,
+        data: bytes,
+        *,
+        url: Optional[str] = None,
+        content_type: Optional[str] = None,
+        name: Optional[str] = None,
+        pin: Optional[str] = None,
+    ) -> Blob:
+        """Store ``data``; ``url`` (re)points the URL index at it."""
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=tmp_dir)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        return self._ingest(
+            Path(tmp),
+            hashlib.sha256(data).hexdigest(),
+            hashlib.md5(data).hexdigest(),
+            len(data),
+            data[:8],
+            url,
+            content_type,
+            name,
+            pin,
+        )
+
+    def put_file(
+        self,
+        path: Union[str, Path],
+        *,
+        url: Optional[str] = None,
+        content_type: Optional[str] = None,
+        name: Optional[str] = None,
+        pin: Optional[str] = None,
+    ) -> Blob:
+        """Store the file at ``path``, which is moved into the store."""
+        path = Path(path)
+        sha, md5, size = hashlib.sha256(), hashlib.md5(), 0
+        with open(path, "rb") as handle:
+            head = handle.read(8)
+            handle.seek(0)
+            for chunk in iter(lambda: handle.read(_CHUNK), b""):
+                sha.update(chunk)
+                md5.update(chunk)
+                size += len(chunk)
+        return self._ingest(
+            path,
+            sha.hexdigest(),
+            md5.hexdigest(),
+            size,
+            head,
+            url,
+            content_type,
+            name or path.name,
+            pin,
+        )
+
+    def _ingest(
+        self, source, sha256, md5, size, head, url, content_type, name, pin
+    ) -> Blob:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key, content_type FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+        if row is not None:
+            key, content_type = row[0], row[1] or content_type
+        else:
+            ext = _extension(url, name, content_type, head)
+            key = f"{sha256[:2]}/{sha256}{ext}"
+        if row is not None and self.backend.ensure_local(key) is not None:
+            Path(source).unlink(missing_ok=True)
+        else:
+            self.backend.store(key, Path(source), content_type)
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO blobs (sha256, md5, size_bytes, content_type, key,"
+                " created_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(sha256) DO UPDATE SET last_access = excluded.last_access",
+                (sha256, md5, size, content_type, key, now, now),
+            )
+            if url:
+                self._conn.execute(
+                    "INSERT INTO urls (url, sha256, fetched_at) VALUES (?, ?, ?)"
+                    " ON CONFLICT(url) DO UPDATE SET sha256 = excluded.sha256,"
+                    " fetched_at = excluded.fetched_at",
+                    (url, sha256, now),
+                )
+            if pin:
+                self._pin(pin, sha256)
+            self._conn.commit()
+
+        if self.max_bytes and self.total_bytes() > self.max_bytes:
+            self.gc()
+        return Blob(
+            sha256,
+            md5,
+            size,
+            content_type,
+            key,
+            self.backend.path(key),
+            fetched=row is None,
+        )
+
+    def alias(self, url: str, sha256: str) -> None:
+        """Point ``url`` at a stored blob, e.g. a landing page that resolved to it."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO urls (url, sha256, fetched_at) VALUES (?, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET sha256 = excluded.sha256,"
+                " fetched_at = excluded.fetched_at",
+                (url, sha256, time.time()),
+            )
+            self._conn.commit()
+
+    def pin(self, sha256: str, holder: str) -> None:
+        """Keep ``sha256`` alive (and out of size-cap eviction) for ``holder``.
+
+        A holder pins one blob: pinning other content releases its old pin.
+        """
+        with self._lock:
+            self._pin(holder, sha256)
+            self._conn.commit()
+
+    def _pin(self, holder: str, sha256: str) -> None:
+        # Caller holds self._lock and commits.
+        self._conn.execute(
+            "DELETE FROM pins WHERE holder = ? AND sha256 <> ?", (holder, sha256)
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO pins (holder, sha256) VALUES (?, ?)",
+            (holder, sha256),
+        )
+
+    def unpin(self, holder: str, sha256: Optional[str] = None) -> None:
+        """Drop ``holder``'s pin on ``sha256`` (or all of its pins)."""
+        with self._lock:
+            if sha256 is None:
+                self._conn.execute("DELETE FROM pins WHERE holder = ?", (holder,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM pins WHERE holder = ? AND sha256 = ?",
+                    (holder, sha256),
+                )
+            self._conn.commit()
+
+    def release_pins(
+        self, prefix: str, live: Iterable[str], idle_for: float = 0
+    ) -> int:
+        """Drop ``prefix*`` pins whose holder is not in ``live``; returns the count.
+
+        Pins on blobs used within the last ``idle_for`` seconds are kept,
+        so a download whose database row is not written yet survives.
+        """
+        live = set(live)
+        cutoff = time.time() - idle_for
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.holder, p.sha256 FROM pins p"
+                " JOIN blobs b ON b.sha256 = p.sha256"
+                " WHERE substr(p.holder, 1, ?) = ? AND b.last_access < ?",
+                (len(prefix), prefix, cutoff),
+            ).fetchall()
+            stale = [row for row in rows if row[0] not in live]
+            self._conn.executemany(
+                "DELETE FROM pins WHERE holder = ? AND sha256 = ?", stale
+            )
+            self._conn.commit()
+        return len(stale)
+
+    # -- garbage collection ----------------------------------------------
+    def gc(self, max_bytes: Optional[int] = None) -> Dict[str, int]:
+        """Delete unreferenced blobs, then evict LRU unpinned ones over the cap.
+
+        Eviction frees local disk only: a blob the backend still holds
+        remotely keeps its index rows and is restored on its next use.
+        """
+        cap = max_bytes if max_bytes is not None else self.max_bytes
+        removed = evicted = freed = 0
+        with self._lock:
+            orphans = self._conn.execute(
+                "SELECT sha256, key, size_bytes FROM blobs b"
+                " WHERE NOT EXISTS (SELECT 1 FROM urls u WHERE u.sha256 = b.sha256)"
+                " AND NOT EXISTS (SELECT 1 FROM pins p WHERE p.sha256 = b.sha256)"
+            ).fetchall()
+        for sha256, key, size in orphans:
+            self._delete(sha256, key)
+            removed += 1
+            freed += size
+
+        total = self.local_bytes()
+        if cap and total > cap:
+            with self._lock:
+                candidates = self._conn.execute(
+                    "SELECT sha256, key, size_bytes FROM blobs b"
+                    " WHERE NOT EXISTS"
+                    " (SELECT 1 FROM pins p WHERE p.sha256 = b.sha256)"
+                    " ORDER BY last_access"
+                ).fetchall()
+            for sha256, key, size in candidates:
+                if total <= cap:
+                    break
+                if not self.backend.path(key).exists():
+                    continue
+                if not self.backend.evict(key):
+                    self._forget(sha256)
+                evicted += 1
+                freed += size
+                total -= size
+            if total > cap:
+                logger.warning(
+                    "Blob store still at %d bytes (cap %d): the rest is pinned",
+                    total,
+                    cap,
+                )
+
+        if removed or evicted:
+            logger.info(
+                "Blob GC: removed %d unreferenced, evicted %d, freed %d bytes",
+                removed,
+                evicted,
+                freed,
+            )
+        return {
+            "removed": removed,
+            "evicted": evicted,
+            "freed_bytes": freed,
+            "total_bytes": total,
+        }
+
+    def _delete(self, sha256: str, key: str) -> None:
+        self.backend.delete(key)
+        self._forget(sha256)
+
+    def _forget(self, sha256: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM urls WHERE sha256 = ?", (sha256,))
+            self._conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            self._conn.commit()
+
+
+class SharedStore:
+    """``blobs = SharedStore()`` on a consumer class.
+
+    Resolves to the instance's ``_blob_store`` (injected, e.g. in tests)
+    and otherwise sets it to :func:`default_store` on first use.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if obj._blob_store is None:
+            obj._blob_store = default_store()
+        return obj._blob_store
+
+
+def _s3_client():
+    """boto3 S3 client, or None without boto3, a bucket or credentials."""
+    if not (os.getenv("AWS_BUCKET_NAME") and os.getenv("AWS_ACCESS_KEY_ID")):
+        return None
+    try:
+        import boto3  # type: ignore
+
+        return boto3.client(
+            "s3",
+            region_name=os.getenv("AWS_REGION", "us-east-1"),
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        )
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def default_store() -> BlobStore:
+    """The process-wide store configured from the environment."""
+    root = Path(os.getenv("BLOB_STORE_PATH") or DEFAULT_ROOT)
+    if not root.is_absolute():
+        root = REPO_ROOT / root
+    try:
+        max_mb = int(os.getenv("BLOB_STORE_MAX_MB", "0"))
+    except ValueError:
+        max_mb = 0
+    try:
+        max_age = float(os.getenv("BLOB_STORE_MAX_AGE_HOURS", "168")) * 3600
+    except ValueError:
+        max_age = DEFAULT_MAX_AGE_SECONDS
+    mode = os.getenv("BLOB_STORE_BACKEND", "auto").lower()
+    backend = None
+    if mode in ("s3", "auto"):
+        client = _s3_client()
+        if client is not None:
+            backend = S3Backend(client, os.environ["AWS_BUCKET_NAME"], root / "cache")
+        elif mode == "s3":
+            logger.warning(
+                "BLOB_STORE_BACKEND=s3 but S3 is not configured; using local"
+            )
+    store = BlobStore(
+        root, backend=backend, max_bytes=max_mb * 1024 * 1024, max_age=max_age
+    )
+    logger.info(
+        "Blob store at %s (%s backend, cap=%s MB)",
+        root,
+        store.backend.name,
+        max_mb or "none",
+    )
+    return store
+
+
+__all__ = [
+    "Blob",
+    "BlobStore",
+    "LocalBackend",
+    "S3Backend",
+    "SharedStore",
+    "default_store",
+    "http_fetch",
+]
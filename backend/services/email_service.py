@@ -2,18 +2,29 @@
 
 Uses SMTP credentials from settings.  Every outgoing message includes
 an HMAC-signed one-click unsubscribe link (RFC 8058).
+
+Messages go through :class:`SMTPPool`, which keeps authenticated SMTP
+connections open between sends and caps the send rate, so a batch of
+alert emails costs one TLS handshake and login per connection rather
+than per message.
 """
 
+import functools
 import hashlib
 import hmac
 import logging
+import os
+import queue
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from urllib.parse import quote
 
 from config.settings import settings
+from middleware.rate_limit import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +36,37 @@ def _hmac_key() -> bytes:
     return settings.SECRET_KEY.encode("utf-8")
 
 
-def generate_unsubscribe_token(email: str) -> str:
-    """Create an HMAC-SHA256 hex token for *email*."""
-    return hmac.new(_hmac_key(), email.lower().encode(), hashlib.sha256).hexdigest()
+# Mailing lists with their own unsubscribe link. Newsletter tokens sign
+# the bare address (links already sent keep working); other lists sign
+# ``"{list}:{email}"`` so one list's token cannot unsubscribe another.
+NEWSLETTER = "newsletter"
+ALERTS = "alerts"
+
+
+def generate_unsubscribe_token(email: str, mailing_list: str = NEWSLETTER) -> str:
+    """Create an HMAC-SHA256 hex token for *email* on *mailing_list*."""
+    message = email.lower()
+    if mailing_list != NEWSLETTER:
+        message = f"{mailing_list}:{message}"
+    return hmac.new(_hmac_key(), message.encode(), hashlib.sha256).hexdigest()
 
 
-def verify_unsubscribe_token(email: str, token: str) -> bool:
+def verify_unsubscribe_token(
+    email: str, token: str, mailing_list: str = NEWSLETTER
+) -> bool:
     """Constant-time verification of an unsubscribe token."""
-    expected = generate_unsubscribe_token(email)
+    expected = generate_unsubscribe_token(email, mailing_list)
     return hmac.compare_digest(expected, token)
 
 
-def build_unsubscribe_url(email: str) -> str:
+def build_unsubscribe_url(email: str, mailing_list: str = NEWSLETTER) -> str:
     """Full URL to the frontend unsubscribe page with signed token."""
-    token = generate_unsubscribe_token(email)
+    token = generate_unsubscribe_token(email, mailing_list)
     base = settings.FRONTEND_URL.rstrip("/")
-    return f"{base}/newsletter/unsubscribe?email={quote(email)}&token={token}"
+    url = f"{base}/newsletter/unsubscribe?email={quote(email)}&token={token}"
+    if mailing_list != NEWSLETTER:
+        url += f"&list={mailing_list}"
+    return url
 
 
 # ── HTML email template ──────────────────────────────────────────────
@@ -156,13 +182,168 @@ Unsubscribe: {unsubscribe_url}
 """
 
 
+# ── Watchlist alert digest ───────────────────────────────────────────
+
+
+def build_alert_digest(email: str, alerts) -> MIMEText:
+    """One plain-text email listing ``alerts`` (``(title, body, item)``).
+
+    Carries an RFC 8058 unsubscribe link that turns off email alerts for
+    every item the recipient watches.
+    """
+    frontend_url = settings.FRONTEND_URL.rstrip("/")
+    unsubscribe_url = build_unsubscribe_url(email, ALERTS)
+    if len(alerts) == 1:
+        subject = alerts[0][0]
+    else:
+        subject = f"{len(alerts)} updates on items you watch"
+    lines = ["New data on items you watch:", ""]
+    for title, body, _item in alerts:
+        lines.append(f"- {title}")
+        if body:
+            lines.append(f"  {body}")
+    lines += [
+        "",
+        f"See the details: {frontend_url}",
+        "",
+        "---",
+        "You receive these because alerts are on for items in your watchlist.",
+        f"Stop alert emails: {unsubscribe_url}",
+    ]
+    msg = MIMEText("\n".join(lines), "plain", "utf-8")
+    msg["Subject"] = subject
+    msg["From"] = settings.SMTP_FROM or settings.SMTP_USER
+    msg["To"] = email
+    msg["Date"] = formatdate(localtime=True)
+    # RFC 8058 one-click unsubscribe header
+    msg["List-Unsubscribe"] = f"<{unsubscribe_url}>"
+    msg["List-Unsubscribe-Post"] = "List-Unsubscribe=One-Click"
+    return msg
+
+
 # ── Sending ──────────────────────────────────────────────────────────
 
 
+class SMTPPool:
+    """Reusable, authenticated SMTP connections with a send-rate cap.
+
+    At most ``size`` connections are open; ``send`` blocks for a free
+    one. Idle connections are reused (LIFO, so the warmest goes first)
+    until they have been idle ``idle_timeout`` seconds. A connection the
+    server dropped is replaced once and the message retried. The send rate
+    is limited to ``rate_per_minute`` with a token bucket (bursts up to
+    the per-minute budget), so bulk alert runs stay under the relay's
+    limits.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        size: int = 2,
+        rate_per_minute: int = 60,
+        idle_timeout: float = 60.0,
+        timeout: float = 15.0,
+        connect=smtplib.SMTP,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._connect_fn = connect
+        self._clock = clock
+        self._sleep = sleep
+        self._idle: "queue.LifoQueue" = queue.LifoQueue()  # (server, last_used)
+        self._slots = threading.BoundedSemaphore(size)
+        self._limiter = TokenBucketLimiter(rate_per_minute, 60, clock=clock)
+        self._limiter_lock = threading.Lock()
+        self.connections_opened = 0
+
+    def send(self, msg) -> None:
+        """Send ``msg``; raises if it could not be delivered."""
+        self._throttle()
+        with self._slots:
+            server = self._checkout()
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                self._close(server)
+                server = self._connect()
+                try:
+                    server.send_message(msg)
+                except Exception:
+                    self._close(server)
+                    raise
+            except Exception:
+                self._close(server)
+                raise
+            self._idle.put((server, self._clock()))
+
+    def close(self) -> None:
+        """Quit every idle connection."""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
+    def _throttle(self) -> None:
+        while True:
+            with self._limiter_lock:
+                decision = self._limiter.hit("smtp")
+            if decision.allowed:
+                return
+            self._sleep(decision.retry_after)
+
+    def _checkout(self):
+        while True:
+            try:
+                server, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return self._connect()
+            if self._clock() - last_used < self.idle_timeout:
+                return server
+            self._close(server)
+
+    def _connect(self):
+        server = self._connect_fn(self.host, self.port, timeout=self.timeout)
+        server.starttls()
+        server.login(self.user, self.password)
+        self.connections_opened += 1
+        return server
+
+    @staticmethod
+    def _close(server) -> None:
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+
 def _smtp_configured() -> bool:
     return bool(settings.SMTP_HOST and settings.SMTP_USER and settings.SMTP_PASSWORD)
 
 
+@functools.lru_cache(maxsize=1)
+def smtp_pool() -> SMTPPool:
+    """The process-wide pool for the configured relay."""
+    return SMTPPool(
+        settings.SMTP_HOST,
+        settings.SMTP_PORT,
+        settings.SMTP_USER,
+        settings.SMTP_PASSWORD,
+        size=int(os.getenv("SMTP_POOL_SIZE", "2")),
+        rate_per_minute=int(os.getenv("SMTP_RATE_PER_MINUTE", "60")),
+    )
+
+
 def send_welcome_email(email: str) -> bool:
     """Send welcome email to a new newsletter subscriber.
 
@@ -191,10 +372,7 @@ def send_welcome_email(email: str) -> bool:
     msg.attach(MIMEText(_WELCOME_HTML.format(**ctx), "html", "utf-8"))
 
     try:
-        with smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=15) as server:
-            server.starttls()
-            server.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
-            server.send_message(msg)
+        smtp_pool().send(msg)
         logger.info("Welcome email sent to %s", email)
         return True
     except Exception as exc:
@@ -0,0 +1,704 @@
+"""ETL job runner for the admin/worker deployment role.
+
+Light and deep discovery/ingest runs per source, on-demand batches, the
+weekly digest e-mail, and the handlers and recurring schedules
+``services.job_scheduler`` runs them with. ``routers.etl_jobs`` mounts the HTTP side; neither module is imported by a public read-only
+API process (``API_ROLE=public``).
+"""
+
+import asyncio
+import concurrent.futures
+import datetime
+import importlib
+import logging
+import os
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from monitoring.instrumentation import etl_stage
+from services.etl_reports import (
+    artifact_dir,
+    artifact_root,
+    known_dir,
+    send_email,
+    settings,
+)
+from services.job_scheduler import Calendar, Every, Schedule, job
+
+logger = logging.getLogger(__name__)
+
+# Repository root: the top-level ``etl`` package and ``etl/downloads`` live here.
+_PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+)
+
+
+async def run_etl_for_source(source_key: str) -> Dict[str, Any]:
+    """Discover and process a small batch for one source and write a run log file."""
+    try:
+        pipeline = _get_pipeline()
+    except Exception as e:  # pragma: no cover
+        logging.error(f"ETL import failed: {e}")
+        return {"error": str(e)}
+
+    discovered = await pipeline.discover_budget_documents_async(source_key)
+    processed = 0
+    successful = 0
+    async with pipeline.browser_session():
+        for doc in discovered[:5]:
+            result = await pipeline.download_and_process_document(doc)
+            processed += 1
+            if result:
+                successful += 1
+            # polite spacing
+            await asyncio.sleep(2)
+
+    run = {
+        "source": source_key,
+        "discovered": len(discovered),
+        "processed": processed,
+        "successful": successful,
+        "ended_at": datetime.datetime.now().isoformat(),
+    }
+
+    # Write file-based run log
+    try:
+        etl_dir = os.path.join(_PROJECT_ROOT, "etl")
+        downloads_dir = os.path.join(etl_dir, "downloads")
+        os.makedirs(downloads_dir, exist_ok=True)
+        log_file = os.path.join(downloads_dir, "etl_run_logs.jsonl")
+        with open(log_file, "a", encoding="utf-8") as f:
+            import json as _json
+
+            f.write(_json.dumps(run) + "\n")
+    except Exception:
+        pass
+
+    return run
+
+
+def _load_known_urls(path: str) -> set:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return set(line.strip() for line in f if line.strip())
+    except Exception:
+        return set()
+
+
+def _save_known_urls(path: str, urls: set) -> None:
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            for u in sorted(urls):
+                f.write(u + "\n")
+    except Exception as e:
+        logger.error(f"Failed saving known urls: {e}")
+
+
+def _open_frontier() -> Optional[Any]:
+    """The crawl frontier shared with ``KenyaDataPipeline`` discovery, if enabled."""
+    sys.path.append(_PROJECT_ROOT)
+    try:
+        mod = importlib.import_module("etl.crawl_frontier")
+        if not mod.frontier_enabled():
+            return None
+        return mod.CrawlFrontier(mod.default_frontier_path())
+    except Exception as e:
+        logger.warning(f"Crawl frontier unavailable: {e}")
+        return None
+
+
+async def _detect_changes(
+    docs: List[Dict[str, Any]], known: set, started: float
+) -> List[Dict[str, Any]]:
+    """Known landing pages whose content changed since the previous visit.
+
+    Pages discovery already crawled in this run reuse that result. Others
+    are revalidated with a conditional GET only once their adaptive
+    revisit interval is due, so unchanged pages cost a 304 or nothing.
+    """
+    frontier = _open_frontier()
+    if frontier is None:
+        return []
+    changed: List[Dict[str, Any]] = []
+    try:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(15.0)) as client:
+            for d in docs:
+                u = d.get("url") or d.get("file_url")
+                if not u or u not in known:
+                    continue
+                if re.search(r"\.(pdf|xlsx?|csv|docx?|zip)(?:$|\?)", u, re.I):
+                    continue
+                entry = frontier.get(u)
+                if entry is not None and (entry.fetched_at or 0) >= started:
+                    if (entry.changed_at or 0) >= started and entry.visits > 1:
+                        changed.append(d)
+                    continue
+                if not frontier.is_due(u, entry):
+                    continue
+                try:
+                    r = await client.get(
+                        u,
+                        headers={
+                            "User-Agent": "Mozilla/5.0",
+                            **frontier.conditional_headers(u, entry),
+                        },
+                    )
+                except Exception:
+                    continue
+                content_type = r.headers.get("content-type", "").lower()
+                if r.status_code == 200 and "html" not in content_type:
+                    continue  # a document behind an extensionless URL
+                had_body = entry is not None and entry.status == 200
+                if frontier.record(u, r.status_code, r.headers, r.content) and had_body:
+                    changed.append(d)
+    finally:
+        frontier.close()
+    return changed
+
+
+# ---- ETL job execution -------------------------------------------------------
+# Runs are tracked in the job queue (services.job_scheduler); the cpu class
+# limit keeps deep runs one at a time.
+executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="etl"
+)
+
+
+_pipeline: Optional[Any] = None
+
+
+def _get_pipeline() -> Any:
+    """One ``KenyaDataPipeline`` per process; its init loads extractors and TLS bundles.
+
+    Concurrent jobs share it. Each discovery call opens its own fetcher,
+    browser pools are keyed by event loop, and the crawl frontier, blob
+    store and processed manifest lock their own writes. Only
+    ``crawl_stats`` is shared unguarded; it is reset per crawl, so its
+    counts are approximate while runs overlap.
+    """
+    global _pipeline
+    if _pipeline is None:
+        sys.path.append(_PROJECT_ROOT)
+        kp_mod = importlib.import_module("etl.kenya_pipeline")
+        _pipeline = getattr(kp_mod, "KenyaDataPipeline")()
+    return _pipeline
+
+
+async def discover(source_key: str) -> List[Dict[str, Any]]:
+    # Async httpx crawl with per-host limits; parsing runs in worker threads
+    return await _get_pipeline().discover_budget_documents_async(source_key)
+
+
+# Polite spacing between documents of one ingest batch.
+INGEST_SPACING_SECONDS = 1.0
+
+
+async def ingest_batch(
+    source_key: str, docs: List[Dict[str, Any]], limit: int = 25
+) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Download/process up to limit docs; return (processed, successful, failures)."""
+    pipeline = _get_pipeline()
+
+    def _sync_process_batch(p, batch):
+        """Run the whole batch on one new event loop in a worker thread.
+
+        download_and_process_document uses sync requests internally. One
+        loop and one browser_session span the batch, so headless downloads
+        share a single pooled browser instead of launching one per document.
+        """
+        import asyncio as _aio
+
+        async def _run():
+            processed = successful = 0
+            failures: List[Dict[str, Any]] = []
+            async with p.browser_session():
+                for i, doc in enumerate(batch):
+                    if i:
+                        await _aio.sleep(INGEST_SPACING_SECONDS)
+                    try:
+                        ok = await p.download_and_process_document(doc)
+                    except Exception as e:
+                        failures.append({"doc": doc, "error": str(e)})
+                        continue
+                    processed += 1
+                    if ok:
+                        successful += 1
+                    else:
+                        failures.append({"doc": doc, "error": "process_failed"})
+            return processed, successful, failures
+
+        loop = _aio.new_event_loop()
+        try:
+            return loop.run_until_complete(_run())
+        finally:
+            loop.close()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, _sync_process_batch, pipeline, docs[:limit]
+    )
+
+
+@job("etl.run", resource_class="network")
+async def run_job(source_key: str, job_type: str = "light") -> Dict[str, Any]:
+    start = datetime.datetime.now()
+    art_dir = artifact_dir()
+    known_path = os.path.join(known_dir(), f"known_{source_key}.txt")
+    known = _load_known_urls(known_path)
+
+    with etl_stage(source_key, "discover"):
+        discovered = await discover(source_key)
+    urls = [d.get("url") or d.get("file_url") for d in discovered]
+    new_docs = [
+        d for d in discovered if (d.get("url") or d.get("file_url")) not in known
+    ]
+
+    with etl_stage(source_key, "change_detect"):
+        changed_docs = await _detect_changes(discovered, known, start.timestamp())
+
+    processed = successful = 0
+    failures: List[Dict[str, Any]] = []
+
+    if job_type == "deep":
+        INGEST_LIMITS = {"treasury": 25, "cob": 20, "oag": 15}
+        limit = INGEST_LIMITS.get(source_key, 25)
+        with etl_stage(source_key, "ingest"):
+            processed, successful, failures = await ingest_batch(
+                source_key, new_docs, limit=limit
+            )
+
+    # Write artifacts
+    import csv  # local import to avoid top-level cost
+    import json
+
+    tsv_path = os.path.join(art_dir, f"{source_key}_{job_type}_discovered.tsv")
+    with open(tsv_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f, delimiter="\t")
+        w.writerow(["Title", "URL"])
+        for d in discovered:
+            w.writerow(
+                [
+                    (d.get("title") or "").strip(),
+                    d.get("url") or d.get("file_url"),
+                ]
+            )
+
+    summary = {
+        "source": source_key,
+        "job_type": job_type,
+        "started_at": start.isoformat(),
+        "ended_at": datetime.datetime.now().isoformat(),
+        "discovered": len(discovered),
+        "new": len(new_docs),
+        "changed": len(changed_docs),
+        "processed": processed,
+        "successful": successful,
+        "failed": len(failures),
+        "artifact_tsv": os.path.relpath(tsv_path, artifact_root()),
+    }
+
+    json_path = os.path.join(art_dir, f"{source_key}_{job_type}_summary.json")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {**summary, "failures": failures[:50]}, f, ensure_ascii=False, indent=2
+        )
+
+    # Update known
+    _save_known_urls(known_path, set(u for u in urls if u))
+
+    # Notify
+    subject = f"[ETL {settings.environment}] {source_key.upper()} {job_type}: +{summary['new']} new, {summary['failed']} failed"
+    top_new = "\n".join(
+        [
+            f"- {(d.get('title') or '').strip()} — {(d.get('url') or d.get('file_url'))}"
+            for d in new_docs[:10]
+        ]
+    )
+    top_fail = "\n".join(
+        [
+            f"- {(f.get('doc') or {}).get('url') or (f.get('doc') or {}).get('file_url')} :: {f.get('error')}"
+            for f in failures[:10]
+        ]
+    )
+    body = (
+        f"Source: {source_key}\nJob: {job_type}\nDiscovered: {summary['discovered']}\nNew: {summary['new']}\nChanged: {summary['changed']}\n"
+        f"Processed: {processed} (ok {successful}, failed {summary['failed']})\nArtifacts: {summary['artifact_tsv']}\n\n"
+        f"New (top 10):\n{top_new or '—'}\n\nFailures (top 10):\n{top_fail or '—'}\n"
+    )
+    send_email(subject, body)
+
+    logger.info(f"ETL job finished: {summary}")
+    return summary
+
+
+# ---- On-demand jobs ----------------------------------------------------------
+# Enqueued by the admin endpoints in routers.etl_jobs / routers.etl_admin and
+# run wherever the job scheduler executes (in-process or the ETL worker).
+
+
+async def _process_batch(
+    pipeline: Any, docs: List[Dict[str, Any]], label: str
+) -> Tuple[int, int, List[Any]]:
+    processed = 0
+    successful = 0
+    doc_ids: List[Any] = []
+    async with pipeline.browser_session():
+        for d in docs:
+            try:
+                res = await pipeline.download_and_process_document(d)
+                processed += 1
+                if res:
+                    successful += 1
+                    doc_ids.append(res.get("document_id"))
+            except Exception as e:
+                logger.error(f"{label} batch doc failed: {e}")
+            # gentle pacing
+            await asyncio.sleep(2)
+    return processed, successful, doc_ids
+
+
+@job("etl.treasury_batch", resource_class="cpu", priority=70)
+async def run_treasury_batch() -> Dict[str, Any]:
+    """Targeted Treasury batch: latest 10 QEBR + 3 ABP + 5 Circulars."""
+    pipeline = _get_pipeline()
+    docs = await pipeline.discover_budget_documents_async("treasury")
+    if hasattr(pipeline, "select_treasury_batch"):
+        batch = pipeline.select_treasury_batch(docs)
+    else:
+        batch = docs[:18]
+    processed, successful, doc_ids = await _process_batch(pipeline, batch, "Treasury")
+    return {
+        "requested": {"qebr": 10, "abp": 3, "circulars": 5},
+        "processed": processed,
+        "successful": successful,
+        "document_ids": doc_ids,
+    }
+
+
+def _cob_batch_score(d: Dict[str, Any]) -> tuple:
+    """Prefer items that look like BIRR PDFs and include FY in title."""
+    t = (d.get("title") or "").lower()
+    fy = 1 if re.search(r"fy\s*20\d{2}|20\d{2}\s*[/–-]\s*20\d{2}", t) else 0
+    birr = 1 if ("budget" in t and ("implementation" in t or "review" in t)) else 0
+    nat = 1 if "national" in t else 0
+    cty = 1 if "county" in t or "consolidated" in t else 0
+    return (fy + birr + nat + cty, t)
+
+
+@job("etl.cob_batch", resource_class="cpu", priority=70)
+async def run_cob_batch(limit: int = 25) -> Dict[str, Any]:
+    """COB batch across national and consolidated county BIRR pages."""
+    pipeline = _get_pipeline()
+    docs = await pipeline.discover_budget_documents_async("cob")
+    ranked = sorted(docs, key=_cob_batch_score, reverse=True)
+    processed, successful, doc_ids = await _process_batch(
+        pipeline, ranked[: max(1, min(limit, 50))], "COB"
+    )
+    return {
+        "requested": {"limit": limit},
+        "discovered": len(docs),
+        "processed": processed,
+        "successful": successful,
+        "document_ids": doc_ids,
+    }
+
+
+@job("etl.kenya_pipeline", resource_class="network", priority=70)
+def run_kenya_etl_pipeline() -> Dict[str, Any]:
+    """Connectivity + extraction run of ``etl_test_runner.SimpleKenyaETL``."""
+    sys.path.append(_PROJECT_ROOT)
+    from etl_test_runner import SimpleKenyaETL
+
+    results = SimpleKenyaETL().run_full_pipeline()
+    logger.info(
+        "Kenya ETL: %s accessible sources, %s entities, %s documents",
+        results.get("sources_accessible"),
+        results.get("entities_extracted"),
+        results.get("documents_processed"),
+    )
+    return results
+
+
+def _update_ingestion_job(ingestion_job_id: int, **fields: Any) -> None:
+    from database import SessionLocal
+    from models import IngestionJob
+
+    with SessionLocal() as db:
+        row = db.get(IngestionJob, ingestion_job_id)
+        if row is None:
+            return
+        for name, value in fields.items():
+            setattr(row, name, value)
+        db.commit()
+
+
+@job("etl.trigger", resource_class="cpu", priority=80)
+async def run_triggered_ingestion(
+    ingestion_job_id: int, source: str, dry_run: bool = False
+) -> Dict[str, Any]:
+    """A manual ``/admin/etl/trigger`` run, recorded on its ``ingestion_jobs`` row.
+
+    Dry runs discover only (light); others ingest too (deep).
+    """
+    from models import IngestionStatus
+
+    await asyncio.to_thread(
+        _update_ingestion_job, ingestion_job_id, status=IngestionStatus.RUNNING
+    )
+    try:
+        summary = await run_job(source, "light" if dry_run else "deep")
+    except Exception as exc:
+        await asyncio.to_thread(
+            _update_ingestion_job,
+            ingestion_job_id,
+            status=IngestionStatus.FAILED,
+            errors=[str(exc)],
+            finished_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+        raise
+    await asyncio.to_thread(
+        _update_ingestion_job,
+        ingestion_job_id,
+        status=(
+            IngestionStatus.COMPLETED_WITH_ERRORS
+            if summary["failed"]
+            else IngestionStatus.COMPLETED
+        ),
+        items_processed=summary["processed"],
+        items_created=summary["new"],
+        finished_at=datetime.datetime.now(datetime.timezone.utc),
+    )
+    return summary
+
+
+# ---- Scheduled jobs ----------------------------------------------------------
+# Handlers for services.job_scheduler; schedules() lists the recurring runs.
+
+# Days between deep (ingest) runs per source. Light runs follow the
+# publishing calendar in etl.smart_scheduler instead of a fixed interval.
+DEEP_INTERVAL_DAYS = {"oag": 30, "cob": 14, "treasury": 7}
+
+
+def _run_parliament(mode: str) -> Dict[str, Any]:
+    """Run Parliament ``mode`` (ingest or reconcile) + validate as a subprocess.
+
+    A subprocess avoids import shadowing between backend/etl/ (normalizer)
+    and the top-level etl/ package.
+    """
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "etl.parliament_orchestrator",
+                "--commit",
+                f"--{mode}-only",
+            ],
+            cwd=_PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=3600,
+            env={**os.environ, "PARLIAMENT_PIPELINE_ENABLED": "1"},
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"Parliament {mode} timed out after 3600s")
+    if result.returncode != 0:
+        logger.error(
+            "Parliament %s failed (rc=%d): %s",
+            mode,
+            result.returncode,
+            result.stderr[-1000:],
+        )
+        raise RuntimeError(f"Parliament {mode} exited with {result.returncode}")
+    logger.info("Parliament %s completed:\n%s", mode, result.stdout[-1000:])
+    return {"returncode": result.returncode}
+
+
+@job("etl.parliament_ingest", resource_class="network")
+def parliament_ingest() -> Dict[str, Any]:
+    """Daily: discover and insert new Parliament items."""
+    return _run_parliament("ingest")
+
+
+@job("etl.parliament_reconcile", resource_class="db")
+def parliament_reconcile() -> Dict[str, Any]:
+    """Weekly: re-resolve Parliament entity metadata."""
+    if os.getenv("PARLIAMENT_RECONCILE_ENABLED", "1") == "0":
+        logger.info("Parliament reconcile disabled via PARLIAMENT_RECONCILE_ENABLED=0")
+        return {"status": "skipped"}
+    return _run_parliament("reconcile")
+
+
+@job("etl.blob_gc", resource_class="db", priority=20)
+def blob_gc() -> Dict[str, Any]:
+    """Daily: release pins of deleted documents, drop unreferenced blobs and
+    enforce BLOB_STORE_MAX_MB."""
+    from database import SessionLocal
+    from models import SourceDocument
+    from services.blob_store import default_store
+
+    store = default_store()
+    with SessionLocal() as db:
+        md5s = db.query(SourceDocument.md5).filter(SourceDocument.md5.isnot(None))
+        live = {f"document:{md5}" for (md5,) in md5s}
+    released = store.release_pins("document:", live, idle_for=24 * 3600)
+    return {"released_pins": released, **store.gc()}
+
+
+def schedules() -> List[Schedule]:
+    """Recurring ETL source runs, Parliament jobs, blob GC and the weekly digest."""
+    day = 24 * 3600
+    out: List[Schedule] = []
+    for source, days in DEEP_INTERVAL_DAYS.items():
+        out.append(
+            Schedule(
+                f"etl:{source}:light",
+                "etl.run",
+                Calendar(source),
+                {"source_key": source, "job_type": "light"},
+            )
+        )
+        # Deep runs parse PDFs: CPU class, so they queue behind each other
+        # instead of competing with the crawls.
+        out.append(
+            Schedule(
+                f"etl:{source}:deep",
+                "etl.run",
+                Every(days * day, jitter=900, first_delay=days * day),
+                {"source_key": source, "job_type": "deep"},
+                priority=40,
+                resource_class="cpu",
+            )
+        )
+
+    if os.getenv("PARLIAMENT_PIPELINE_ENABLED", "0") == "1":
+        logger.info("Parliament pipeline enabled — scheduling ingest & reconcile jobs")
+        out.append(
+            Schedule(
+                "etl:parliament:ingest",
+                "etl.parliament_ingest",
+                Every(day, jitter=900, first_delay=day),
+            )
+        )
+        out.append(
+            Schedule(
+                "etl:parliament:reconcile",
+                "etl.parliament_reconcile",
+                Every(7 * day, jitter=900, first_delay=7 * day),
+            )
+        )
+    else:
+        logger.info("Parliament pipeline disabled (PARLIAMENT_PIPELINE_ENABLED != 1)")
+
+    out.append(
+        Schedule(
+            "etl:blob_gc",
+            "etl.blob_gc",
+            Every(day, jitter=900, first_delay=day),
+            priority=20,
+        )
+    )
+    out.append(
+        Schedule(
+            "etl:weekly_digest",
+            "etl.weekly_digest",
+            Every(7 * day, jitter=900, first_delay=7 * day),
+            priority=20,
+        )
+    )
+    return out
+
+
+@job("etl.weekly_digest", resource_class="network")
+async def send_weekly_digest() -> None:
+    """Email a weekly summary across sources based on the current known files and last summaries."""
+    try:
+        root = artifact_root()
+        reports_dir = os.path.join(root, "reports")
+        # Find the latest summary files
+        latest: Dict[str, Dict[str, Any]] = {}
+        if os.path.isdir(reports_dir):
+            for day in sorted(os.listdir(reports_dir), reverse=True)[
+                :14
+            ]:  # last 2 weeks
+                day_dir = os.path.join(reports_dir, day)
+                if not os.path.isdir(day_dir):
+                    continue
+                for name in os.listdir(day_dir):
+                    if name.endswith("_summary.json"):
+                        src = name.split("_")[0]
+                        try:
+                            import json as _json
+
+                            with open(
+                                os.path.join(day_dir, name), "r", encoding="utf-8"
+                            ) as f:
+                                latest[src] = _json.load(f)
+                        except Exception:
+                            pass
+        lines = ["Weekly ETL Digest"]
+        for src in sorted(latest.keys()):
+            s = latest[src]
+            lines.append(
+                f"- {src.upper()}: discovered {s.get('discovered',0)}, new {s.get('new',0)}, processed {s.get('processed',0)} (ok {s.get('successful',0)}, failed {s.get('failed',0)})"
+            )
+        body = "\n".join(lines)
+        send_email(f"[ETL {settings.environment}] Weekly Digest", body)
+    except Exception as e:
+        logger.error(f"Weekly digest failed: {e}")
+
+
+def run_simple_kenya_etl():
+    """Simple Kenya ETL function that doesn't rely on complex imports."""
+    import requests
+
+    results = {
+        "documents_fetched": 0,
+        "documents_processed": 0,
+        "entities_found": [],
+        "sources_checked": [],
+    }
+
+    # Test Kenya Treasury website
+    try:
+        response = requests.get("https://treasury.go.ke", timeout=10)
+        if response.status_code == 200:
+            results["sources_checked"].append(
+                {
+                    "source": "Kenya National Treasury",
+                    "status": "accessible",
+                    "status_code": response.status_code,
+                }
+            )
+            results["documents_fetched"] += 1
+        else:
+            results["sources_checked"].append(
+                {
+                    "source": "Kenya National Treasury",
+                    "status": "error",
+                    "status_code": response.status_code,
+                }
+            )
+    except Exception as e:
+        results["sources_checked"].append(
+            {
+                "source": "Kenya National Treasury",
+                "status": "unreachable",
+                "error": str(e),
+            }
+        )
+
+    # Mock some entities that would be extracted
+    results["entities_found"] = [
+        {"name": "Ministry of Health", "type": "ministry", "code": "MOH"},
+        {"name": "Ministry of Education", "type": "ministry", "code": "MOE"},
+        {"name": "National Treasury", "type": "ministry", "code": "NT"},
+    ]
+    results["documents_processed"] = len(results["entities_found"])
+
+    return results
@@ -0,0 +1,101 @@
+"""Where ETL run reports go: the local reports/ tree, the S3 mirror, e-mail.
+
+Shared by the public API (``/api/v1/docs/resolve`` presigns mirrored
+documents) and the ETL worker role (run summaries, known-URL state,
+operator notifications), so it must stay free of ETL imports.
+"""
+
+import datetime
+import functools
+import logging
+import os
+import smtplib
+from email.mime.text import MIMEText
+from email.utils import formatdate
+from typing import Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class AppSettings(BaseModel):
+    smtp_host: Optional[str] = os.getenv("SMTP_HOST")
+    smtp_port: int = int(os.getenv("SMTP_PORT", "587"))
+    smtp_user: Optional[str] = os.getenv("SMTP_USER")
+    smtp_password: Optional[str] = os.getenv("SMTP_PASSWORD")
+    notify_email_to: Optional[str] = os.getenv("NOTIFY_EMAIL_TO")
+    environment: str = os.getenv("ENVIRONMENT", "development")
+    aws_bucket: Optional[str] = os.getenv("AWS_BUCKET_NAME")
+    aws_region: str = os.getenv("AWS_REGION", "us-east-1")
+
+
+settings = AppSettings()
+
+
+@functools.lru_cache(maxsize=1)
+def get_s3_client():
+    """S3 client for report mirroring, or None when not configured.
+
+    boto3/botocore cost ~100 ms to import, so they are loaded on the
+    first presign rather than at app import (see scripts/cold_start.py).
+    """
+    if not settings.aws_bucket:
+        return None
+    try:
+        import boto3  # type: ignore
+
+        return boto3.client(
+            "s3",
+            region_name=settings.aws_region,
+            aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        )
+    except Exception:
+        return None
+
+
+def artifact_root() -> str:
+    """Repository root; reports are written under ``<root>/reports``."""
+    return os.path.abspath(
+        os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+    )
+
+
+def artifact_dir() -> str:
+    root = artifact_root()
+    path = os.path.join(root, "reports", datetime.datetime.now().strftime("%Y-%m-%d"))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def known_dir() -> str:
+    root = artifact_root()
+    path = os.path.join(root, "reports", "known")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def send_email(subject: str, body: str) -> None:
+    if not (
+        settings.smtp_host
+        and settings.smtp_user
+        and settings.smtp_password
+        and settings.notify_email_to
+    ):
+        logger.info("Email not configured; skipping notification")
+        return
+    try:
+        msg = MIMEText(body, _charset="utf-8")
+        msg["Subject"] = subject
+        msg["From"] = settings.smtp_user
+        msg["To"] = settings.notify_email_to
+        msg["Date"] = formatdate(localtime=True)
+        with smtplib.SMTP(settings.smtp_host, settings.smtp_port) as server:
+            server.starttls()
+            server.login(settings.smtp_user, settings.smtp_password)
+            server.sendmail(
+                settings.smtp_user, [settings.notify_email_to], msg.as_string()
+            )
+    except Exception as e:
+        logger.error(f"Failed to send email: {e}")
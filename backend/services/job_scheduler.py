@@ -0,0 +1,1028 @@
+"""One scheduler for all background work in the admin role.
+
+ETL source runs, the Parliament jobs, the weekly digest and the
+auto-seeder's domain refreshes used to run on three timers: APScheduler
+intervals, the auto-seeder's hourly loop and (for calendar-aware runs)
+``etl.smart_scheduler``. Now they are all rows in a persistent queue
+(``job_queue``, :class:`models.QueuedJob`) and one scheduler runs them:
+
+* **Handlers** are registered with :func:`job` under a name and a
+  resource class: ``network`` (HTTP crawls and downloads), ``cpu`` (PDF
+  parsing and the registry pipelines) or ``db`` (bulk writes). Each
+  class has its own concurrency limit (``SCHEDULER_CLASS_LIMITS``), so
+  a long PDF parse never holds up a crawl.
+* **Schedules** enqueue a row when they come due. :class:`Every` fires
+  on a fixed interval with a deterministic per-schedule jitter;
+  :class:`Calendar` asks ``SmartScheduler.next_due`` for the next day
+  a source publishes. The last run of a schedule is the newest
+  ``run_at`` for its key, so restarts don't reset the clock.
+* **Ad-hoc work** goes through :func:`enqueue`; a ``key`` coalesces it
+  with a queued or running row for the same key.
+* **Leadership**: only the replica holding a Postgres advisory lock
+  (``LEADER_LOCK_KEY``) enqueues schedules and runs jobs. Claims use
+  ``FOR UPDATE SKIP LOCKED`` anyway, so a second runner can be added
+  without double-running anything.
+* **Retention**: the leader deletes succeeded and failed rows once they
+  have been finished for ``SCHEDULER_RETENTION_DAYS`` (0 keeps them),
+  except the newest row of each key, which dates the schedule's last run.
+
+The loop sleeps until the next schedule fires or a queued row becomes
+due, capped at ``SCHEDULER_POLL_SECONDS`` so rows enqueued by other
+processes are picked up; :func:`enqueue` in this process wakes it at
+once. Higher ``priority`` runs first within a class.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import json
+import logging
+import os
+import socket
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set
+
+from models import QueuedJob
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+LEADER_LOCK_KEY = 874322  # etl/worker.py holds 874321
+RESOURCE_CLASSES = ("network", "cpu", "db")
+DEFAULT_CLASS_LIMITS = {"network": 3, "cpu": 1, "db": 1}
+
+# Repository root: the top-level ``etl`` package lives here.
+_PROJECT_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), os.pardir, os.pardir)
+)
+
+
+def rss_mb() -> Optional[float]:
+    """Resident set size of this process from /proc, or None where unavailable."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _utcnow() -> datetime:
+    """Naive UTC, matching the ``DateTime`` columns of ``job_queue``."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def class_limits_from_env() -> Dict[str, int]:
+    """Per-class concurrency from ``SCHEDULER_CLASS_LIMITS``.
+
+    Format: ``network=3,cpu=1,db=1``; unknown classes and malformed
+    entries are ignored, missing classes keep their defaults.
+    """
+    limits = dict(DEFAULT_CLASS_LIMITS)
+    for part in os.getenv("SCHEDULER_CLASS_LIMITS", "").split(","):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in limits:
+            continue
+        try:
+            limits[name] = max(1, int(value))
+        except ValueError:
+            continue
+    return limits
+
+
+# ---- Handlers ----------------------------------------------------------------
+
+
+@dataclass
+class JobSpec:
+    name: str
+    func: Callable[..., Any]
+    resource_class: str = "network"
+    priority: int = 50
+    max_attempts: int = 1
+    retry_delay: float = 300.0
+    timeout: Optional[float] = None
+
+
+HANDLERS: Dict[str, JobSpec] = {}
+
+
+def job(
+    name: str,
+    *,
+    resource_class: str = "network",
+    priority: int = 50,
+    max_attempts: int = 1,
+    retry_delay: float = 300.0,
+    timeout: Optional[float] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register a handler for queued rows whose ``job`` is ``name``.
+
+    Coroutine functions run on the scheduler's loop; plain functions run
+    in a worker thread. Handlers get the row's ``args`` as keyword
+    arguments; a JSON-serialisable return value is stored as the result.
+    """
+    if resource_class not in RESOURCE_CLASSES:
+        raise ValueError(f"Unknown resource class {resource_class!r}")
+
+    def register(func: Callable[..., Any]) -> Callable[..., Any]:
+        HANDLERS[name] = JobSpec(
+            name, func, resource_class, priority, max_attempts, retry_delay, timeout
+        )
+        return func
+
+    return register
+
+
+# ---- Triggers ----------------------------------------------------------------
+
+
+class Every:
+    """Fire every ``seconds``, offset by a stable jitter in ``±jitter``.
+
+    A schedule that has never run fires ``first_delay`` after the
+    scheduler started (immediately when it is 0).
+    """
+
+    def __init__(self, seconds: float, jitter: float = 0, first_delay: float = 0):
+        self.seconds = seconds
+        self.jitter = jitter
+        self.first_delay = first_delay
+
+    def _offset(self, key: str) -> float:
+        if not self.jitter:
+            return 0.0
+        digest = hashlib.sha1(key.encode()).digest()
+        fraction = int.from_bytes(digest[:4], "big") / 0xFFFFFFFF
+        return (fraction * 2 - 1) * self.jitter
+
+    def next_after(
+        self, last: Optional[datetime], anchor: datetime, key: str
+    ) -> Optional[datetime]:
+        if last is None:
+            return anchor + timedelta(seconds=self.first_delay)
+        interval = max(60.0, self.seconds + self._offset(key))
+        return last + timedelta(seconds=interval)
+
+    def __repr__(self) -> str:
+        return f"Every({self.seconds:g}s ±{self.jitter:g}s)"
+
+
+class Calendar:
+    """Fire at ``hour_utc`` on the days ``SmartScheduler`` says ``source`` publishes.
+
+    At most once per day; a schedule that has never run starts from the
+    day after the scheduler started.
+    """
+
+    def __init__(self, source: str, hour_utc: int = 3):
+        self.source = source
+        self.hour_utc = hour_utc
+
+    def next_after(
+        self, last: Optional[datetime], anchor: datetime, key: str
+    ) -> Optional[datetime]:
+        start = (last or anchor) + timedelta(days=1)
+        day, _reason = smart_scheduler().next_due(self.source, after=start)
+        if day is None:
+            return None
+        return day.replace(hour=self.hour_utc)
+
+    def __repr__(self) -> str:
+        return f"Calendar({self.source!r})"
+
+
+_smart_scheduler: Optional[Any] = None
+
+
+def smart_scheduler() -> Any:
+    """The shared ``etl.smart_scheduler.SmartScheduler`` (imported lazily)."""
+    global _smart_scheduler
+    if _smart_scheduler is None:
+        if _PROJECT_ROOT not in sys.path:
+            sys.path.append(_PROJECT_ROOT)
+        mod = importlib.import_module("etl.smart_scheduler")
+        _smart_scheduler = mod.SmartScheduler()
+    return _smart_scheduler
+
+
+@dataclass
+class Schedule:
+    key: str
+    job: str
+    trigger: Any
+    args: Dict[str, Any] = field(default_factory=dict)
+    priority: Optional[int] = None
+    resource_class: Optional[str] = None
+
+
+# ---- Queue -------------------------------------------------------------------
+
+
+@dataclass
+class ClaimedJob:
+    id: int
+    job: str
+    args: Dict[str, Any]
+    resource_class: str
+    attempts: int
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        return json.loads(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return {"repr": repr(value)[:1000]}
+
+
+def _active_for_key(db: Session, key: str) -> Optional[QueuedJob]:
+    return db.execute(
+        select(QueuedJob)
+        .where(
+            QueuedJob.key == key,
+            QueuedJob.status.in_([QueuedJob.QUEUED, QueuedJob.RUNNING]),
+        )
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def _coalesce(
+    db: Session, existing: QueuedJob, priority: Optional[int], commit: bool
+) -> QueuedJob:
+    if (
+        priority is not None
+        and existing.status == QueuedJob.QUEUED
+        and priority > existing.priority
+    ):
+        existing.priority = priority
+        if commit:
+            db.commit()
+            if job_scheduler is not None:
+                job_scheduler.wake()
+        else:
+            db.flush()
+    return existing
+
+
+def enqueue(
+    db: Session,
+    job_name: str,
+    args: Optional[Dict[str, Any]] = None,
+    *,
+    key: Optional[str] = None,
+    priority: Optional[int] = None,
+    resource_class: Optional[str] = None,
+    run_at: Optional[datetime] = None,
+    max_attempts: Optional[int] = None,
+    commit: bool = True,
+) -> QueuedJob:
+    """Queue one run of ``job_name``; returns the new (or coalesced) row.
+
+    Defaults come from the registered handler when this process has one.
+    With a ``key``, an existing queued or running row for that key is
+    returned instead of adding another; a still-queued row is raised to
+    ``priority`` when that is higher. The partial unique index
+    ``ux_job_queue_active_key`` settles races between replicas: the
+    losing insert is rolled back and the winner's row returned.
+    """
+    if key is not None:
+        existing = _active_for_key(db, key)
+        if existing is not None:
+            return _coalesce(db, existing, priority, commit)
+
+    spec = HANDLERS.get(job_name)
+    row = QueuedJob(
+        job=job_name,
+        key=key,
+        args=dict(args or {}),
+        priority=priority if priority is not None else (spec.priority if spec else 50),
+        resource_class=resource_class or (spec.resource_class if spec else "network"),
+        status=QueuedJob.QUEUED,
+        run_at=run_at or _utcnow(),
+        attempts=0,
+        max_attempts=max_attempts or (spec.max_attempts if spec else 1),
+    )
+    if key is None:
+        db.add(row)
+    else:
+        try:
+            with db.begin_nested():
+                db.add(row)
+        except IntegrityError:
+            existing = _active_for_key(db, key)
+            if existing is None:
+                raise
+            return _coalesce(db, existing, priority, commit)
+    if commit:
+        db.commit()
+        if job_scheduler is not None:
+            job_scheduler.wake()
+    else:
+        db.flush()
+    return row
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def describe(row: QueuedJob) -> Dict[str, Any]:
+    """JSON view of a queued job for status endpoints."""
+    return {
+        "job_id": str(row.id),
+        "job": row.job,
+        "args": row.args or {},
+        "status": row.status,
+        "priority": row.priority,
+        "resource_class": row.resource_class,
+        "attempts": row.attempts,
+        "worker": row.worker,
+        "run_at": _iso(row.run_at),
+        "started_at": _iso(row.started_at),
+        "ended_at": _iso(row.finished_at),
+        "result": row.result,
+        "error": row.error,
+    }
+
+
+def get_job(db: Session, job_id: Any) -> Optional[QueuedJob]:
+    """The queued job with id ``job_id`` (any int-like value), or None."""
+    try:
+        return db.get(QueuedJob, int(job_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def recent_jobs(
+    db: Session, prefix: Optional[str] = None, limit: int = 50
+) -> List[QueuedJob]:
+    """Newest jobs first, optionally only those whose name starts with ``prefix``."""
+    query = select(QueuedJob).order_by(QueuedJob.id.desc()).limit(limit)
+    if prefix:
+        query = query.where(QueuedJob.job.startswith(prefix))
+    return list(db.execute(query).scalars())
+
+
+# ---- Leadership --------------------------------------------------------------
+
+
+class AdvisoryLeader:
+    """Leadership held as a session-level ``pg_try_advisory_lock``.
+
+    The lock lives on one dedicated connection and is released when that
+    connection closes, so a crashed leader hands over on its own. Session
+    locks do not survive a transaction-mode pooler; point
+    ``SCHEDULER_LEADER_DATABASE_URL`` at a direct or session-mode
+    endpoint when ``DATABASE_URL`` goes through one. Other dialects
+    (SQLite in tests and local runs) are always leader.
+    """
+
+    def __init__(self, engine: Any = None, key: int = LEADER_LOCK_KEY):
+        self._engine = engine
+        self.key = key
+        self._conn: Any = None
+
+    @property
+    def engine(self) -> Any:
+        if self._engine is None:
+            url = os.getenv("SCHEDULER_LEADER_DATABASE_URL")
+            if url:
+                from sqlalchemy import create_engine
+                from sqlalchemy.pool import NullPool
+
+                self._engine = create_engine(url, poolclass=NullPool)
+            else:
+                from database import engine
+
+                self._engine = engine
+        return self._engine
+
+    def acquire(self) -> bool:
+        """Take or confirm leadership; blocking, so call it from a thread."""
+        from sqlalchemy import text
+
+        if self.engine.dialect.name != "postgresql":
+            return True
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+                return True
+            except Exception as exc:
+                logger.warning(f"Scheduler leader connection lost: {exc}")
+                self._discard()
+        conn = self.engine.connect()
+        try:
+            held = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            ).scalar()
+            conn.commit()
+        except Exception:
+            conn.close()
+            raise
+        if not held:
+            conn.close()
+            return False
+        self._conn = conn
+        return True
+
+    def release(self) -> None:
+        from sqlalchemy import text
+
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self.key}
+            )
+            self._conn.commit()
+        except Exception:
+            pass
+        self._discard()
+
+    def _discard(self) -> None:
+        conn, self._conn = self._conn, None
+        try:
+            conn.invalidate()
+        except Exception:
+            pass
+
+
+# ---- Scheduler ---------------------------------------------------------------
+
+
+class JobScheduler:
+    """Enqueue due schedules and run queued rows within per-class limits.
+
+    Only the leader enqueues schedules, requeues abandoned rows and prunes
+    finished ones past ``retention``. In
+    the API process only the leader runs jobs too; ETL worker processes
+    (``follower_executes``) all claim and run them, each within its own
+    class limits. With ``max_rss_mb`` set the scheduler stops claiming
+    once resident memory passes it and sets ``drained`` when its running
+    jobs finish, so the worker can exit and be restarted fresh.
+    """
+
+    def __init__(
+        self,
+        schedules: Sequence[Schedule] = (),
+        *,
+        class_limits: Optional[Dict[str, int]] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        leader: Optional[Any] = None,
+        poll_interval: Optional[float] = None,
+        stale_after: Optional[float] = None,
+        misfire_grace: Optional[float] = None,
+        retention: Optional[float] = None,
+        worker_id: Optional[str] = None,
+        follower_executes: bool = False,
+        max_rss_mb: Optional[float] = None,
+        clock: Callable[[], datetime] = _utcnow,
+    ):
+        self.schedules: Dict[str, Schedule] = {s.key: s for s in schedules}
+        self.class_limits = class_limits or class_limits_from_env()
+        self._session_factory = session_factory
+        self.leader = leader or AdvisoryLeader()
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else _env_float("SCHEDULER_POLL_SECONDS", 30)
+        )
+        self.stale_after = timedelta(
+            seconds=stale_after
+            if stale_after is not None
+            else _env_float("SCHEDULER_STALE_AFTER_SECONDS", 6 * 3600)
+        )
+        self.misfire_grace = timedelta(
+            seconds=misfire_grace
+            if misfire_grace is not None
+            else _env_float("SCHEDULER_MISFIRE_GRACE_SECONDS", 3600)
+        )
+        # Seconds a finished row is kept; 0 keeps rows forever.
+        self.retention = timedelta(
+            seconds=retention
+            if retention is not None
+            else _env_float("SCHEDULER_RETENTION_DAYS", 14) * 86400
+        )
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.follower_executes = follower_executes
+        self.max_rss_mb = (
+            max_rss_mb if max_rss_mb is not None else _env_float("WORKER_MAX_RSS_MB", 0)
+        )
+        self.draining = False
+        self.drained: Optional[asyncio.Event] = None
+        self.clock = clock
+        self.started_at: datetime = clock()
+        self.is_running = False
+        self.is_leader = False
+        self.running: Dict[str, Set[int]] = {c: set() for c in self.class_limits}
+        self.next_fire: Dict[str, Optional[datetime]] = {}
+        self._stale_checked: Optional[datetime] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add_schedule(self, schedule: Schedule) -> None:
+        self.schedules[schedule.key] = schedule
+        self.wake()
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        if self._session_factory is None:
+            from database import SessionLocal
+
+            self._session_factory = SessionLocal
+        with self._session_factory() as db:
+            yield db
+
+    # -- queue operations (blocking; run in a thread from the loop) ----------
+
+    def enqueue_due(self, db: Session, now: datetime) -> List[int]:
+        """Queue a run for every schedule that is due and not already pending."""
+        keys = list(self.schedules)
+        if not keys:
+            return []
+        last = dict(
+            db.execute(
+                select(QueuedJob.key, func.max(QueuedJob.run_at))
+                .where(QueuedJob.key.in_(keys))
+                .group_by(QueuedJob.key)
+            ).all()
+        )
+        pending = set(
+            db.execute(
+                select(QueuedJob.key).where(
+                    QueuedJob.key.in_(keys),
+                    QueuedJob.status.in_([QueuedJob.QUEUED, QueuedJob.RUNNING]),
+                )
+            ).scalars()
+        )
+        created: List[QueuedJob] = []
+        for key, sched in self.schedules.items():
+            if key in pending:
+                self.next_fire[key] = None
+                continue
+            due = sched.trigger.next_after(last.get(key), self.started_at, key)
+            self.next_fire[key] = due
+            if due is None or due > now:
+                continue
+            # A run missed by more than the grace period (downtime) fires
+            # once, now, rather than replaying every missed interval.
+            run_at = max(due, now - self.misfire_grace)
+            created.append(
+                enqueue(
+                    db,
+                    sched.job,
+                    sched.args,
+                    key=key,
+                    priority=sched.priority,
+                    resource_class=sched.resource_class,
+                    run_at=run_at,
+                    commit=False,
+                )
+            )
+            self.next_fire[key] = None
+        db.commit()
+        return [row.id for row in created]
+
+    def requeue_stale(self, db: Session, now: datetime) -> int:
+        """Give rows left ``running`` by a dead leader another attempt (or fail them)."""
+        rows = (
+            db.execute(
+                select(QueuedJob)
+                .where(
+                    QueuedJob.status == QueuedJob.RUNNING,
+                    QueuedJob.started_at < now - self.stale_after,
+                )
+                .with_for_update(skip_locked=True)
+            )
+            .scalars()
+            .all()
+        )
+        for row in rows:
+            row.error = f"abandoned by {row.worker}"
+            if row.attempts < row.max_attempts:
+                row.status = QueuedJob.QUEUED
+                row.run_at = now
+            else:
+                row.status = QueuedJob.FAILED
+                row.finished_at = now
+        db.commit()
+        return len(rows)
+
+    def prune_finished(self, db: Session, now: datetime) -> int:
+        """Delete succeeded/failed rows finished more than ``retention`` ago.
+
+        The newest row of each key is kept whatever its age: it is the
+        schedule's last run, and a schedule whose interval is longer than
+        the retention would otherwise look as if it had never run.
+        """
+        if not self.retention:
+            return 0
+        newest_per_key = (
+            select(func.max(QueuedJob.id))
+            .where(QueuedJob.key.isnot(None))
+            .group_by(QueuedJob.key)
+        )
+        result = db.execute(
+            delete(QueuedJob).where(
+                QueuedJob.status.in_([QueuedJob.SUCCEEDED, QueuedJob.FAILED]),
+                QueuedJob.finished_at < now - self.retention,
+                QueuedJob.id.notin_(newest_per_key.scalar_subquery()),
+            )
+        )
+        db.commit()
+        return result.rowcount or 0
+
+    def claim(
+        self, db: Session, resource_class: str, now: datetime
+    ) -> Optional[ClaimedJob]:
+        """Mark the most urgent due row of ``resource_class`` running."""
+        row = db.execute(
+            select(QueuedJob)
+            .where(
+                QueuedJob.status == QueuedJob.QUEUED,
+                QueuedJob.resource_class == resource_class,
+                QueuedJob.run_at <= now,
+            )
+            .order_by(QueuedJob.priority.desc(), QueuedJob.run_at, QueuedJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+        if row is None:
+            db.commit()
+            return None
+        row.status = QueuedJob.RUNNING
+        row.started_at = now
+        row.attempts = (row.attempts or 0) + 1
+        row.worker = self.worker_id
+        claimed = ClaimedJob(
+            row.id, row.job, dict(row.args or {}), resource_class, row.attempts
+        )
+        db.commit()
+        return claimed
+
+    def complete(
+        self,
+        db: Session,
+        claimed: ClaimedJob,
+        *,
+        result: Any = None,
+        error: Optional[str] = None,
+        retry_delay: float = 300.0,
+    ) -> str:
+        """Record the outcome; a failure with attempts left is requeued with backoff."""
+        row = db.get(QueuedJob, claimed.id)
+        if row is None:
+            db.commit()
+            return QueuedJob.FAILED
+        now = self.clock()
+        if error is None:
+            row.status = QueuedJob.SUCCEEDED
+            row.finished_at = now
+            row.result = _jsonable(result)
+            row.error = None
+        elif row.attempts < row.max_attempts:
+            row.status = QueuedJob.QUEUED
+            row.run_at = now + timedelta(
+                seconds=retry_delay * 2 ** max(0, row.attempts - 1)
+            )
+            row.error = error[:4000]
+        else:
+            row.status = QueuedJob.FAILED
+            row.finished_at = now
+            row.error = error[:4000]
+        status = row.status
+        db.commit()
+        return status
+
+    def release(self, db: Session, claimed: ClaimedJob) -> None:
+        """Put a row interrupted by shutdown back in the queue, attempt not counted."""
+        row = db.get(QueuedJob, claimed.id)
+        if row is not None and row.status == QueuedJob.RUNNING:
+            row.status = QueuedJob.QUEUED
+            row.attempts = max(0, (row.attempts or 1) - 1)
+            row.run_at = self.clock()
+        db.commit()
+
+    def next_queued_at(self, db: Session) -> Optional[datetime]:
+        value = db.execute(
+            select(func.min(QueuedJob.run_at)).where(
+                QueuedJob.status == QueuedJob.QUEUED
+            )
+        ).scalar()
+        db.commit()
+        return value
+
+    def _plan(self, leader: bool, check_stale: bool) -> Optional[datetime]:
+        now = self.clock()
+        with self._session() as db:
+            if leader and check_stale:
+                requeued = self.requeue_stale(db, now)
+                if requeued:
+                    logger.warning(f"Requeued {requeued} abandoned job(s)")
+                pruned = self.prune_finished(db, now)
+                if pruned:
+                    logger.info(f"Pruned {pruned} finished job(s)")
+            if leader:
+                self.enqueue_due(db, now)
+            return self.next_queued_at(db)
+
+    def _finish(
+        self,
+        claimed: ClaimedJob,
+        result: Any,
+        error: Optional[str],
+        retry_delay: float,
+    ) -> str:
+        with self._session() as db:
+            return self.complete(
+                db, claimed, result=result, error=error, retry_delay=retry_delay
+            )
+
+    def _claim_batch(self) -> List[ClaimedJob]:
+        now = self.clock()
+        claimed: List[ClaimedJob] = []
+        with self._session() as db:
+            for resource_class, limit in self.class_limits.items():
+                free = limit - len(self.running.get(resource_class, ()))
+                for _ in range(max(0, free)):
+                    item = self.claim(db, resource_class, now)
+                    if item is None:
+                        break
+                    self.running.setdefault(resource_class, set()).add(item.id)
+                    claimed.append(item)
+        return claimed
+
+    # -- event loop ------------------------------------------------------------
+
+    def wake(self) -> None:
+        """Run a scheduling pass now; safe to call from any thread."""
+        loop, event = self._loop, self._wake
+        if loop is None or event is None or loop.is_closed():
+            return
+        try:
+            if asyncio.get_running_loop() is loop:
+                event.set()
+                return
+        except RuntimeError:
+            pass
+        loop.call_soon_threadsafe(event.set)
+
+    async def tick(self) -> float:
+        """One scheduling pass; returns seconds until the next one is needed."""
+        if self._wake is not None:
+            self._wake.clear()
+        leader = await asyncio.to_thread(self.leader.acquire)
+        if leader != self.is_leader:
+            logger.info(
+                "Job scheduler %s leadership (%s)",
+                "took" if leader else "lost",
+                self.worker_id,
+            )
+            self.is_leader = leader
+            self._stale_checked = None
+            if not leader:
+                self.next_fire = {}
+        executes = (leader or self.follower_executes) and not self.draining
+        if not (leader or executes):
+            return self.poll_interval
+
+        now = self.clock()
+        check_stale = (
+            self._stale_checked is None
+            or now - self._stale_checked > timedelta(hours=1)
+        )
+        next_queued = await asyncio.to_thread(self._plan, leader, check_stale)
+        if leader and check_stale:
+            self._stale_checked = now
+        if executes:
+            for claimed in await asyncio.to_thread(self._claim_batch):
+                task = asyncio.create_task(self._execute(claimed))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+        upcoming = [t for t in self.next_fire.values() if t is not None]
+        if next_queued is not None and next_queued > now:
+            upcoming.append(next_queued)
+        if not upcoming:
+            return self.poll_interval
+        wait = (min(upcoming) - self.clock()).total_seconds()
+        return min(self.poll_interval, max(0.5, wait))
+
+    async def _execute(self, claimed: ClaimedJob) -> None:
+        spec = HANDLERS.get(claimed.job)
+        result: Any = None
+        error: Optional[str] = None
+        logger.info(
+            f"Job {claimed.id} {claimed.job} started ({claimed.resource_class}, "
+            f"attempt {claimed.attempts})"
+        )
+        try:
+            if spec is None:
+                raise LookupError(f"No handler registered for {claimed.job!r}")
+            if asyncio.iscoroutinefunction(spec.func):
+                call = spec.func(**claimed.args)
+            else:
+                call = asyncio.to_thread(spec.func, **claimed.args)
+            if spec.timeout:
+                result = await asyncio.wait_for(call, spec.timeout)
+            else:
+                result = await call
+        except asyncio.CancelledError:
+            with self._session() as db:
+                self.release(db, claimed)
+            self.running[claimed.resource_class].discard(claimed.id)
+            raise
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception(f"Job {claimed.id} {claimed.job} failed: {exc}")
+        try:
+            status = await asyncio.to_thread(
+                self._finish,
+                claimed,
+                result,
+                error,
+                spec.retry_delay if spec else 300.0,
+            )
+            logger.info(f"Job {claimed.id} {claimed.job} {status}")
+        except Exception as exc:
+            logger.error(f"Recording job {claimed.id} outcome failed: {exc}")
+        finally:
+            self.running[claimed.resource_class].discard(claimed.id)
+            self._check_memory()
+            self.wake()
+
+    def _check_memory(self) -> None:
+        if self.max_rss_mb and not self.draining:
+            rss = rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                logger.warning(
+                    f"Worker RSS {rss:.0f} MB over {self.max_rss_mb:.0f} MB; "
+                    "draining for restart"
+                )
+                self.draining = True
+        if self.draining and not any(self.running.values()):
+            if self.drained is not None:
+                self.drained.set()
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self.is_running = True
+        self.started_at = self.clock()
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self.drained = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            "Job scheduler started: %d schedules, limits %s",
+            len(self.schedules),
+            self.class_limits,
+        )
+
+    async def _run(self) -> None:
+        failures = 0
+        while self.is_running:
+            try:
+                timeout = await self.tick()
+                failures = 0
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                failures += 1
+                timeout = min(600.0, self.poll_interval * 2 ** min(failures, 5))
+                logger.error(f"Job scheduler pass failed: {exc}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                break
+
+    async def stop(self) -> None:
+        self.is_running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.to_thread(self.leader.release)
+        self.is_leader = False
+        logger.info("Job scheduler stopped")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "is_running": self.is_running,
+            "is_leader": self.is_leader,
+            "worker": self.worker_id,
+            "class_limits": self.class_limits,
+            "running": {c: sorted(ids) for c, ids in self.running.items()},
+            "schedules": {
+                key: {
+                    "job": s.job,
+                    "trigger": repr(s.trigger),
+                    "next_fire": (
+                        self.next_fire[key].isoformat()
+                        if self.next_fire.get(key)
+                        else None
+                    ),
+                }
+                for key, s in self.schedules.items()
+            },
+        }
+
+
+def load_builtin_schedules(include_seeder: bool = False) -> List[Schedule]:
+    """Register the built-in handlers and return their recurring schedules."""
+    schedules = importlib.import_module("services.etl_jobs").schedules()
+    if include_seeder:
+        # Not ``from services import auto_seeder``: the package's lazy
+        # export of that name is the AutoSeeder instance.
+        schedules += importlib.import_module("services.auto_seeder").schedules()
+    return schedules
+
+
+# Global instance (created by start_job_scheduler in the admin role)
+job_scheduler: Optional[JobScheduler] = None
+
+
+async def start_job_scheduler(include_seeder: bool = False) -> JobScheduler:
+    global job_scheduler
+    if job_scheduler is None:
+        job_scheduler = JobScheduler(load_builtin_schedules(include_seeder))
+    await job_scheduler.start()
+    return job_scheduler
+
+
+async def stop_job_scheduler() -> None:
+    if job_scheduler is not None:
+        await job_scheduler.stop()
+
+
+async def run_worker(include_seeder: bool = False) -> None:
+    """Run the scheduler as a dedicated ETL worker until signalled or drained.
+
+    Every worker runs jobs; the advisory-lock leader among them also
+    enqueues the schedules. Returns on SIGTERM/SIGINT (running jobs go
+    back to the queue) or once ``WORKER_MAX_RSS_MB`` has been passed and
+    the running jobs have finished.
+    """
+    import signal
+
+    from cache.redis_cache import register_commit_invalidations
+
+    # The worker never imports the API routers, so install their
+    # commit-invalidation hooks here or refreshed data stays cached.
+    register_commit_invalidations()
+
+    global job_scheduler
+    job_scheduler = JobScheduler(
+        load_builtin_schedules(include_seeder), follower_executes=True
+    )
+    await job_scheduler.start()
+    if include_seeder:
+        from services.auto_seeder import auto_seeder as seeder
+
+        # A recycled worker must not re-run the full boot seed.
+        await seeder.start(skip_if_recent=timedelta(hours=24))
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    waiters = [
+        asyncio.create_task(stop.wait()),
+        asyncio.create_task(job_scheduler.drained.wait()),
+    ]
+    await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    for waiter in waiters:
+        waiter.cancel()
+    logger.info("ETL worker %s stopping", job_scheduler.worker_id)
+    await job_scheduler.stop()
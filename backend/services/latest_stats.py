@@ -0,0 +1,171 @@
+"""Latest population and GDP per entity, kept as a maintained projection.
+
+Per-capita figures across the API (county list and detail, the county
+economic profile, pending-bills per capita, accountability peer
+brackets, the national summary) all need "the newest ``PopulationData``
+/ ``GDPData`` row for this entity". Each reader used to derive that on
+its own, with ``max(year)`` subquery joins or one
+``ORDER BY year DESC LIMIT 1`` per county.
+
+``entity_latest_stats`` holds one row per entity (plus the national row,
+``entity_key`` 0) with the latest population and GDP values and the ids
+of the rows they came from. :func:`refresh_latest_stats` recomputes the
+rows for the entities a writer touched; the population and
+``national_gdp`` seeding writers, the KNBS loaders in
+``etl.database_loader``, the auto-seeder census step and bootstrap call
+it before committing, and startup rebuilds the whole
+projection so rows written by ad-hoc scripts are picked up on deploy.
+
+GDP "latest" is the newest year, preferring the annual (``quarter`` NULL)
+figure over quarterly ones and otherwise the highest quarter.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Iterable, Optional
+
+from models import EntityLatestStats, GDPData, PopulationData
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# ``entity_key`` of the national (entity_id NULL) row.
+NATIONAL_KEY = 0
+
+
+def entity_key(entity_id: Optional[int]) -> int:
+    return NATIONAL_KEY if entity_id is None else entity_id
+
+
+def _entity_filter(column, entity_ids: Optional[Iterable[Optional[int]]]):
+    """WHERE clause matching *entity_ids*, where ``None`` means national."""
+    if entity_ids is None:
+        return None
+    ids = set(entity_ids)
+    concrete = [e for e in ids if e is not None]
+    clauses = []
+    if concrete:
+        clauses.append(column.in_(concrete))
+    if None in ids:
+        clauses.append(column.is_(None))
+    return or_(*clauses) if clauses else column.in_([])
+
+
+def _gdp_rank(row) -> tuple:
+    return (row.year, row.quarter is None, row.quarter or "")
+
+
+def refresh_latest_stats(
+    db: Session, entity_ids: Optional[Iterable[Optional[int]]] = None
+) -> int:
+    """Recompute projection rows for *entity_ids* (all entities if None).
+
+    Runs inside the caller's transaction and flushes but does not commit,
+    so the projection lands atomically with the writer's rows. Returns
+    the number of projection rows written or removed.
+    """
+    if entity_ids is not None:
+        entity_ids = set(entity_ids)
+        if not entity_ids:
+            return 0
+    # Sessions run with autoflush off; make the writer's pending rows visible.
+    db.flush()
+
+    pop_query = db.query(
+        PopulationData.id,
+        PopulationData.entity_id,
+        PopulationData.year,
+        PopulationData.total_population,
+    )
+    gdp_query = db.query(
+        GDPData.id,
+        GDPData.entity_id,
+        GDPData.year,
+        GDPData.quarter,
+        GDPData.gdp_value,
+    )
+    stats_query = db.query(EntityLatestStats)
+    if entity_ids is not None:
+        pop_query = pop_query.filter(
+            _entity_filter(PopulationData.entity_id, entity_ids)
+        )
+        gdp_query = gdp_query.filter(_entity_filter(GDPData.entity_id, entity_ids))
+        stats_query = stats_query.filter(
+            EntityLatestStats.entity_key.in_({entity_key(e) for e in entity_ids})
+        )
+
+    latest_pop: Dict[int, object] = {}
+    for row in pop_query.all():
+        key = entity_key(row.entity_id)
+        if key not in latest_pop or row.year > latest_pop[key].year:
+            latest_pop[key] = row
+
+    latest_gdp: Dict[int, object] = {}
+    for row in gdp_query.all():
+        key = entity_key(row.entity_id)
+        if key not in latest_gdp or _gdp_rank(row) > _gdp_rank(latest_gdp[key]):
+            latest_gdp[key] = row
+
+    existing = {s.entity_key: s for s in stats_query.all()}
+    written = 0
+    for key in set(latest_pop) | set(latest_gdp) | set(existing):
+        pop = latest_pop.get(key)
+        gdp = latest_gdp.get(key)
+        stats = existing.get(key)
+        if pop is None and gdp is None:
+            db.delete(stats)
+            written += 1
+            continue
+        if stats is None:
+            stats = EntityLatestStats(entity_key=key)
+            db.add(stats)
+        stats.entity_id = None if key == NATIONAL_KEY else key
+        stats.population_id = pop.id if pop else None
+        stats.population_year = pop.year if pop else None
+        stats.total_population = pop.total_population if pop else None
+        stats.gdp_id = gdp.id if gdp else None
+        stats.gdp_year = gdp.year if gdp else None
+        stats.gdp_quarter = gdp.quarter if gdp else None
+        stats.gdp_value = gdp.gdp_value if gdp else None
+        written += 1
+
+    db.flush()
+    logger.debug("Latest-stats projection refreshed (%d rows)", written)
+    return written
+
+
+def get_latest_stats(
+    db: Session, entity_id: Optional[int]
+) -> Optional[EntityLatestStats]:
+    """Projection row for one entity (``None`` = national)."""
+    return (
+        db.query(EntityLatestStats)
+        .filter(EntityLatestStats.entity_key == entity_key(entity_id))
+        .first()
+    )
+
+
+def latest_stats_map(
+    db: Session, entity_ids: Iterable[int]
+) -> Dict[int, EntityLatestStats]:
+    """``{entity_id: projection row}`` for a batch of entities."""
+    ids = [e for e in set(entity_ids) if e is not None]
+    if not ids:
+        return {}
+    return {
+        s.entity_id: s
+        for s in db.query(EntityLatestStats)
+        .filter(EntityLatestStats.entity_key.in_(ids))
+        .all()
+    }
+
+
+__all__ = [
+    "NATIONAL_KEY",
+    "entity_key",
+    "get_latest_stats",
+    "latest_stats_map",
+    "refresh_latest_stats",
+]
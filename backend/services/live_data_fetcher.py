@@ -700,10 +700,7 @@ class TreasuryDataFetcher:
 
         if pipeline:
             try:
-                # discover_budget_documents is synchronous — run in thread
-                documents = await asyncio.to_thread(
-                    pipeline.discover_budget_documents, "treasury"
-                )
+                documents = await pipeline.discover_budget_documents_async("treasury")
 
                 for doc in documents:
                     title = doc.get("title", "").lower()
@@ -772,11 +769,7 @@ class COBDataFetcher:
 
         if pipeline:
             try:
-                # discover_budget_documents is synchronous (uses requests lib)
-                # so we MUST run it in a thread to avoid blocking the event loop.
-                documents = await asyncio.to_thread(
-                    pipeline.discover_budget_documents, "cob"
-                )
+                documents = await pipeline.discover_budget_documents_async("cob")
 
                 for doc in documents:
                     title = doc.get("title", "").lower()
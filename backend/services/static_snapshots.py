@@ -0,0 +1,542 @@
+"""Pre-rendered, pre-compressed snapshots of the public read endpoints.
+
+The national pages (budget overview, debt timeline, fiscal summary,
+sector spending, all-counties money flow) only change when a seeding
+domain commits, yet every cache miss re-runs their aggregates. After a
+successful domain run :func:`publish_for_domain` renders them once
+in-process through :func:`snapshot_app`, a bare app with only their
+routers (the publisher never imports ``main``), and writes each body as ``.json``,
+``.json.gz`` and (with ``brotli`` installed) ``.json.br`` into a new
+version directory under ``reports/snapshots/``, next to the other ETL
+artifacts. When a bucket is configured it mirrors the files to S3 for
+a CDN.
+
+Switching versions is atomic. A version directory is written under a
+temporary name and renamed into place. Only then is the ``CURRENT``
+pointer replaced, again via ``os.replace`` (on S3, ``current.json`` is
+uploaded last). Readers never see a half-written version. Older
+versions are kept (``STATIC_SNAPSHOT_KEEP``) so a reader holding the
+previous pointer can finish. A render that fails or returns non-200
+publishes nothing, and the previous version stays live.
+
+Several processes may publish into one root (the seeding CLI, the job
+worker). Switching the pointer, pruning and mirroring happen under an
+exclusive ``flock`` on ``<root>/.publish.lock``. Version names sort by
+render time, and the pointer never moves back to an older name, so a
+publisher that rendered first but finished last cannot replace newer
+content.
+
+:class:`SnapshotStore` is the read side. ``middleware.snapshots`` uses it
+to answer matching GETs from memory, so those requests never reach a
+handler or the DB. ``/api/v1/snapshots/current`` uses it to list the
+CDN URLs.
+
+Publishing and serving are opt-in via ``STATIC_SNAPSHOTS_ENABLED=true``.
+Publishers (the seeding CLI, the auto-seeder in the job worker) and the
+API must see the same ``STATIC_SNAPSHOT_DIR``: a version written to a
+worker's local disk is never served. Mount one shared volume there in
+every role that publishes or serves, or rely on the S3 mirror and a CDN.
+"""
+
+import asyncio
+import datetime
+import functools
+import gzip
+import hashlib
+import importlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode
+
+from services.etl_reports import artifact_root, get_s3_client, settings
+
+try:  # optional: .br variants are skipped without it
+    import brotli  # type: ignore
+except ImportError:  # pragma: no cover - exercised when brotli is absent
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Public endpoints whose responses only change when seeding commits.
+SNAPSHOT_PATHS: Sequence[str] = (
+    "/api/v1/budget/overview",
+    "/api/v1/debt/timeline",
+    "/api/v1/fiscal/summary",
+    "/api/v1/sectors/spending",
+    "/api/v1/money-flow/all-counties?year=2024/25",
+)
+
+# Routers serving SNAPSHOT_PATHS; snapshot_app() mounts only these.
+SNAPSHOT_ROUTERS: Sequence[str] = (
+    "routers.national",
+    "routers.debt",
+    "routers.money_flow",
+)
+
+# Response-cache key prefixes of the SNAPSHOT_PATHS handlers. They are
+# dropped before rendering so a publish right after a seed cannot capture
+# responses cached before it.
+SNAPSHOT_CACHE_PREFIXES: Sequence[str] = (
+    "budget:overview",
+    "debt:timeline",
+    "fiscal:summary",
+    "sectors:spending",
+    "money-flow:all-counties",
+)
+
+CURRENT_POINTER = "CURRENT"
+MANIFEST = "manifest.json"
+LOCK_FILE = ".publish.lock"
+# Staging dirs older than this belong to a publisher that died mid-write.
+STALE_STAGING_SECONDS = 3600
+S3_PREFIX = "snapshots"
+ENCODINGS = ("br", "gzip")  # preference order when a client accepts both
+SUFFIXES = {"identity": ".json", "gzip": ".json.gz", "br": ".json.br"}
+# ASGI scope flag set on the publisher's own requests; the serving
+# middleware passes them through to the handlers.
+BYPASS_SCOPE_KEY = "static_snapshot_bypass"
+
+
+class SnapshotError(RuntimeError):
+    """A snapshot could not be rendered; nothing was published."""
+
+
+def snapshots_enabled() -> bool:
+    return os.getenv("STATIC_SNAPSHOTS_ENABLED", "false").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+def snapshot_root() -> str:
+    return os.getenv("STATIC_SNAPSHOT_DIR") or os.path.join(
+        artifact_root(), "reports", "snapshots"
+    )
+
+
+def canonical_path(path: str, query: str = "") -> str:
+    """``path?query`` with the query decoded and sorted.
+
+    ``year=2024/25`` and ``year=2024%2F25`` are then the same snapshot.
+    """
+    if "?" in path and not query:
+        path, query = path.split("?", 1)
+    pairs = sorted(parse_qsl(query, keep_blank_values=True))
+    return f"{path}?{urlencode(pairs)}" if pairs else path
+
+
+def snapshot_key(path: str) -> str:
+    """File-name stem for an endpoint, e.g. ``money-flow-all-counties-year-2024-25``."""
+    return re.sub(r"[^A-Za-z0-9]+", "-", path.replace("/api/v1/", "", 1)).strip("-")
+
+
+# ── publishing ──────────────────────────────────────────────────────────
+
+
+async def render_snapshots(
+    app, paths: Iterable[str] = SNAPSHOT_PATHS
+) -> Dict[str, bytes]:
+    """GET each path through ``app`` in-process; ``{canonical path: body}``.
+
+    Requests carry the :data:`BYPASS_SCOPE_KEY` scope flag, so they are
+    rendered by the handlers rather than answered from the snapshot being
+    replaced. They come from loopback, which the rate limiter exempts.
+    """
+    import httpx
+
+    async def rendering_app(scope, receive, send):
+        scope[BYPASS_SCOPE_KEY] = True
+        await app(scope, receive, send)
+
+    bodies: Dict[str, bytes] = {}
+    transport = httpx.ASGITransport(app=rendering_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://snapshot.local"
+    ) as client:
+        for path in paths:
+            try:
+                response = await client.get(
+                    path, headers={"Accept-Encoding": "identity"}
+                )
+            except Exception as exc:
+                raise SnapshotError(f"{path}: {exc}") from exc
+            if response.status_code != 200:
+                raise SnapshotError(f"{path}: HTTP {response.status_code}")
+            bodies[canonical_path(path)] = response.content
+    return bodies
+
+
+def snapshot_app():
+    """A bare FastAPI app mounting only :data:`SNAPSHOT_ROUTERS`.
+
+    Publishers render through it so the seeding CLI and the job worker
+    never import ``main`` with every router, middleware and startup hook.
+    """
+    from fastapi import FastAPI
+
+    app = FastAPI()
+    for module in SNAPSHOT_ROUTERS:
+        app.include_router(importlib.import_module(module).router)
+    return app
+
+
+def clear_snapshot_caches() -> None:
+    """Drop the cached responses :func:`render_snapshots` would otherwise reuse.
+
+    With Redis this also clears them for the API processes; without it
+    only this process's in-memory caches are affected.
+    """
+    from cache.redis_cache import clear_response_caches
+
+    clear_response_caches(SNAPSHOT_CACHE_PREFIXES)
+
+
+def _content_hash(bodies: Dict[str, bytes]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(bodies):
+        digest.update(path.encode("utf-8") + b"\0" + bodies[path] + b"\0")
+    return digest.hexdigest()
+
+
+def _read_pointer(root: str) -> Optional[str]:
+    try:
+        with open(os.path.join(root, CURRENT_POINTER), encoding="utf-8") as fh:
+            return fh.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _read_manifest(root: str, version: str) -> dict:
+    with open(os.path.join(root, version, MANIFEST), encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    tmp = f"{path}.tmp-{os.getpid()}"
+    with open(tmp, "wb") as fh:
+        fh.write(data)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def _encode(body: bytes) -> Dict[str, bytes]:
+    variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=11)
+    return variants
+
+
+@contextmanager
+def _publish_lock(root: str):
+    """Hold the exclusive publish lock on ``root`` (no-op without ``fcntl``)."""
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - non-POSIX
+        yield
+        return
+    with open(os.path.join(root, LOCK_FILE), "a+") as fh:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def write_snapshot_version(
+    bodies: Dict[str, bytes],
+    root: Optional[str] = None,
+    reason: str = "",
+    keep: Optional[int] = None,
+    rendered_at: Optional[datetime.datetime] = None,
+) -> str:
+    """Write ``bodies`` as a new version and make it current.
+
+    Returns the version name. If the content is identical to the current
+    version, nothing is written and the current version is returned. If
+    another publisher has meanwhile made a version rendered after
+    ``rendered_at`` current, the pointer is left alone and that version
+    is returned.
+    """
+    root = root or snapshot_root()
+    keep = keep if keep is not None else int(os.getenv("STATIC_SNAPSHOT_KEEP", "3"))
+    os.makedirs(root, exist_ok=True)
+
+    content_hash = _content_hash(bodies)
+    current = _read_pointer(root)
+    if current:
+        try:
+            if _read_manifest(root, current).get("content_hash") == content_hash:
+                return current
+        except (OSError, ValueError):
+            pass  # unreadable current version: publish over it
+
+    now = rendered_at or datetime.datetime.now(datetime.timezone.utc)
+    version = f"{now:%Y%m%dT%H%M%S%fZ}-{content_hash[:8]}"
+    staging = os.path.join(root, f".{version}.tmp")
+    os.makedirs(staging)
+    try:
+        entries = {}
+        for path, body in sorted(bodies.items()):
+            key = snapshot_key(path)
+            files = {}
+            for encoding, data in _encode(body).items():
+                name = key + SUFFIXES[encoding]
+                with open(os.path.join(staging, name), "wb") as fh:
+                    fh.write(data)
+                files[encoding] = {"file": name, "bytes": len(data)}
+            entries[path] = {
+                "key": key,
+                "etag": hashlib.sha256(body).hexdigest()[:20],
+                "files": files,
+            }
+        manifest = {
+            "version": version,
+            "generated_at": now.isoformat(),
+            "reason": reason,
+            "content_hash": content_hash,
+            "entries": entries,
+        }
+        with open(os.path.join(staging, MANIFEST), "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    with _publish_lock(root):
+        current = _read_pointer(root)
+        if current and current > version:
+            shutil.rmtree(staging, ignore_errors=True)
+            logger.info(f"Snapshot {version} superseded by {current}; not switched")
+            return current
+        os.replace(staging, os.path.join(root, version))
+        _write_atomic(os.path.join(root, CURRENT_POINTER), version.encode("utf-8"))
+        _prune(root, keep=max(1, keep))
+    return version
+
+
+def _prune(root: str, keep: int) -> None:
+    """Drop all but the newest ``keep`` versions, and abandoned staging dirs.
+
+    Called under :func:`_publish_lock`. The pointer is re-read before
+    each removal, so the current version is never deleted even by a
+    publisher that does not hold the lock.
+    """
+    names = sorted(
+        name
+        for name in os.listdir(root)
+        if os.path.isdir(os.path.join(root, name)) and not name.startswith(".")
+    )
+    for name in names[:-keep]:
+        if name != _read_pointer(root):
+            shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+    cutoff = time.time() - STALE_STAGING_SECONDS
+    for name in os.listdir(root):
+        if not (name.startswith(".") and name.endswith(".tmp")):
+            continue
+        path = os.path.join(root, name)
+        try:
+            stale = os.path.getmtime(path) < cutoff
+        except OSError:
+            continue
+        if stale:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def mirror_to_s3(
+    root: str, version: str, client=None, bucket: Optional[str] = None
+) -> bool:
+    """Upload ``version`` to ``s3://<bucket>/snapshots/``, pointer last.
+
+    Version objects are immutable (content-addressed by version name);
+    only ``current.json`` is short-lived, so swapping it switches every
+    CDN reader at once.
+    """
+    client = client or get_s3_client()
+    bucket = bucket or settings.aws_bucket
+    if client is None or not bucket:
+        return False
+    manifest = _read_manifest(root, version)
+    for entry in manifest["entries"].values():
+        for encoding, info in entry["files"].items():
+            extra = {"ContentEncoding": encoding} if encoding != "identity" else {}
+            with open(os.path.join(root, version, info["file"]), "rb") as fh:
+                client.put_object(
+                    Bucket=bucket,
+                    Key=f"{S3_PREFIX}/{version}/{info['file']}",
+                    Body=fh.read(),
+                    ContentType="application/json",
+                    CacheControl="public, max-age=31536000, immutable",
+                    **extra,
+                )
+    client.put_object(
+        Bucket=bucket,
+        Key=f"{S3_PREFIX}/current.json",
+        Body=json.dumps(manifest).encode("utf-8"),
+        ContentType="application/json",
+        CacheControl="public, max-age=60",
+    )
+    return True
+
+
+async def publish_static_snapshots(
+    app=None,
+    reason: str = "",
+    root: Optional[str] = None,
+    paths: Iterable[str] = SNAPSHOT_PATHS,
+) -> str:
+    """Render, write, switch and mirror one snapshot version.
+
+    Raises :class:`SnapshotError` if any endpoint fails; the previous
+    version then stays current.
+    """
+    if app is None:
+        app = snapshot_app()
+    root = root or snapshot_root()
+    clear_snapshot_caches()
+    rendered_at = datetime.datetime.now(datetime.timezone.utc)
+    bodies = await render_snapshots(app, paths)
+
+    def _write() -> str:
+        version = write_snapshot_version(
+            bodies, root=root, reason=reason, rendered_at=rendered_at
+        )
+        # Mirror under the lock, and only while still current, so an
+        # older version's current.json never lands after a newer one.
+        with _publish_lock(root):
+            if _read_pointer(root) != version:
+                return version
+            try:
+                mirror_to_s3(root, version)
+            except Exception as exc:
+                logger.warning(f"Snapshot {version} not mirrored to S3: {exc}")
+        return version
+
+    version = await asyncio.to_thread(_write)
+    logger.info(f"Static snapshots {version} published ({reason or 'manual'})")
+    return version
+
+
+async def publish_for_domain(domain: str) -> Optional[str]:
+    """Publish after ``domain`` committed, if enabled.
+
+    Never raises: a failed publish must not fail the seeding run, and
+    the previous version keeps being served.
+    """
+    if not snapshots_enabled():
+        return None
+    try:
+        return await publish_static_snapshots(reason=f"domain:{domain}")
+    except Exception:
+        logger.warning(f"Static snapshot publish after {domain} failed", exc_info=True)
+        return None
+
+
+def publish_for_domain_sync(domain: str) -> Optional[str]:
+    """:func:`publish_for_domain` for callers without a running event loop."""
+    if not snapshots_enabled():
+        return None
+    return asyncio.run(publish_for_domain(domain))
+
+
+# ── serving ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class SnapshotEntry:
+    key: str
+    etag: str
+    bodies: Dict[str, bytes] = field(default_factory=dict)  # encoding -> bytes
+
+
+@dataclass
+class Snapshot:
+    version: str
+    generated_at: str
+    entries: Dict[str, SnapshotEntry]
+
+
+class SnapshotStore:
+    """The current snapshot version, held in memory.
+
+    The ``CURRENT`` pointer is re-read at most every ``check_interval``
+    seconds. A new version is loaded in full before it replaces the old
+    one, so a request sees one version or the other.
+    """
+
+    def __init__(self, root: Optional[str] = None, check_interval: float = 1.0):
+        self.root = root or snapshot_root()
+        self.check_interval = check_interval
+        self._snapshot: Optional[Snapshot] = None
+        self._checked = float("-inf")
+
+    def current(self) -> Optional[Snapshot]:
+        now = time.monotonic()
+        if now - self._checked < self.check_interval:
+            return self._snapshot
+        self._checked = now
+        version = _read_pointer(self.root)
+        if version is None:
+            self._snapshot = None
+        elif self._snapshot is None or self._snapshot.version != version:
+            try:
+                self._snapshot = self._load(version)
+            except (OSError, ValueError, KeyError) as exc:
+                logger.warning(f"Static snapshot {version} not loaded: {exc}")
+        return self._snapshot
+
+    def _load(self, version: str) -> Snapshot:
+        manifest = _read_manifest(self.root, version)
+        entries = {}
+        for path, entry in manifest["entries"].items():
+            bodies = {}
+            for encoding, info in entry["files"].items():
+                with open(os.path.join(self.root, version, info["file"]), "rb") as fh:
+                    bodies[encoding] = fh.read()
+            entries[path] = SnapshotEntry(entry["key"], entry["etag"], bodies)
+        return Snapshot(version, manifest.get("generated_at", ""), entries)
+
+
+@functools.lru_cache(maxsize=1)
+def default_store() -> SnapshotStore:
+    return SnapshotStore()
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    """Best of ``available`` (br, then gzip) the client accepts, else identity."""
+    accepted: List[str] = []
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.append(name)
+    available = set(available)
+    for encoding in ENCODINGS:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
+
+
+def cdn_urls(snapshot: Snapshot, base_url: str) -> Dict[str, Dict[str, str]]:
+    """``{path: {encoding: url}}`` for the mirrored copy of ``snapshot``."""
+    base = f"{base_url.rstrip('/')}/{snapshot.version}"
+    return {
+        path: {
+            encoding: f"{base}/{entry.key}{SUFFIXES[encoding]}"
+            for encoding in entry.bodies
+        }
+        for path, entry in snapshot.entries.items()
+    }
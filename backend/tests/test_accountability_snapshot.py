@@ -0,0 +1,222 @@
+"""
+Tests for the batch accountability scorecard engine and its snapshots.
+
+Covers:
+  services.accountability.compute_all_scorecards
+  services.accountability.refresh_accountability_snapshot / refresh_for_domain
+  services.accountability.ensure_current_snapshot (stale rebuilds)
+  GET /api/v1/accountability/scorecards
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from models import (
+    AccountabilityScorecard,
+    AccountabilitySnapshot,
+    Audit,
+    BudgetLine,
+    Entity,
+    EntityType,
+    FiscalPeriod,
+    PopulationData,
+    Severity,
+)
+from services import accountability
+from services.accountability import (
+    KEEP_SNAPSHOT_VERSIONS,
+    compute_all_scorecards,
+    ensure_current_snapshot,
+    refresh_accountability_snapshot,
+    refresh_for_domain,
+)
+from services.latest_stats import refresh_latest_stats
+from sqlalchemy import event
+
+# (county code, name, opinion, critical findings)
+_COUNTIES = [
+    ("001", "Nairobi", "adverse", 3),
+    ("047", "Mombasa", "unqualified", 0),
+    ("002", "Kwale", "qualified", 1),
+    ("003", "Kilifi", "unqualified", 0),
+]
+
+
+@pytest.fixture()
+def seed_counties(db_session, seed_country, seed_source_doc):
+    """Four counties with budget lines, population and audit findings."""
+    fp = FiscalPeriod(
+        id=30,
+        country_id=seed_country.id,
+        label="FY2023/24",
+        start_date=datetime(2023, 7, 1),
+        end_date=datetime(2024, 6, 30),
+    )
+    db_session.add(fp)
+    for i, (code, name, opinion, criticals) in enumerate(_COUNTIES):
+        entity = Entity(
+            id=100 + i,
+            country_id=seed_country.id,
+            type=EntityType.COUNTY,
+            canonical_name=f"{name} County",
+            slug=f"{name.lower()}-county",
+        )
+        db_session.add(entity)
+        db_session.flush()
+        db_session.add(
+            BudgetLine(
+                entity_id=entity.id,
+                period_id=fp.id,
+                category="Health",
+                allocated_amount=10_000_000,
+                actual_spent=8_000_000,
+                currency="KES",
+                source_document_id=seed_source_doc.id,
+            )
+        )
+        db_session.add(
+            PopulationData(entity_id=entity.id, year=2019, total_population=900_000)
+        )
+        db_session.add(
+            Audit(
+                entity_id=entity.id,
+                period_id=fp.id,
+                finding_text=f"{name} opinion",
+                severity=Severity.INFO,
+                source_document_id=seed_source_doc.id,
+                audit_opinion=opinion,
+                audit_year=2023,
+                status="Resolved",
+            )
+        )
+        for n in range(criticals):
+            db_session.add(
+                Audit(
+                    entity_id=entity.id,
+                    period_id=fp.id,
+                    finding_text=f"{name} critical {n}",
+                    severity=Severity.CRITICAL,
+                    source_document_id=seed_source_doc.id,
+                    amount=100_000,
+                    status="Pending",
+                )
+            )
+    refresh_latest_stats(db_session)
+    db_session.commit()
+
+
+def _count_queries(db_session):
+    statements = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _before)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _before)
+
+
+class TestComputeAllScorecards:
+    def test_scores_every_seeded_county(self, db_session, seed_counties):
+        records = compute_all_scorecards(db_session)
+        assert set(records) == {c[0] for c in _COUNTIES}
+        assert records["047"]["scorecard"]["accountability_grade"] == "A"
+        assert records["001"]["scorecard"]["accountability_grade"] in {"C", "D", "F"}
+
+    def test_uses_constant_number_of_queries(self, db_session, seed_counties):
+        statements, stop = _count_queries(db_session)
+        try:
+            compute_all_scorecards(db_session)
+        finally:
+            stop()
+        assert len(statements) <= 5
+
+    def test_absorption_and_summary_fields(self, db_session, seed_counties):
+        rec = compute_all_scorecards(db_session)["003"]
+        assert rec["scorecard"]["absorption_rate"] == 0.8
+        assert rec["total_allocated"] == 10_000_000
+        assert rec["population"] == 900_000
+
+    def test_peer_percentile_ranks_scores(self, db_session, seed_counties):
+        records = compute_all_scorecards(db_session)
+        nairobi = records["001"]["scorecard"]["peer_comparison"]
+        mombasa = records["047"]["scorecard"]["peer_comparison"]
+        assert nairobi["score_percentile"] == 0.0
+        assert mombasa["score_percentile"] > nairobi["score_percentile"]
+        # Kwale, Kilifi and Mombasa are all Coast; Nairobi is its own region.
+        assert mombasa["region"] == "Coast"
+        assert nairobi["region_avg_grade"] is None
+
+
+class TestSnapshots:
+    def test_refresh_writes_one_row_per_county(self, db_session, seed_counties):
+        version = refresh_accountability_snapshot(db_session, reason="test")
+        rows = (
+            db_session.query(AccountabilityScorecard)
+            .filter(AccountabilityScorecard.snapshot_id == version)
+            .all()
+        )
+        assert len(rows) == len(_COUNTIES)
+
+    def test_versions_increase_and_old_ones_are_pruned(self, db_session, seed_counties):
+        versions = [
+            refresh_accountability_snapshot(db_session)
+            for _ in range(KEEP_SNAPSHOT_VERSIONS + 2)
+        ]
+        assert versions == sorted(versions)
+        kept = [s.id for s in db_session.query(AccountabilitySnapshot).all()]
+        assert sorted(kept) == versions[-KEEP_SNAPSHOT_VERSIONS:]
+
+    def test_refresh_for_domain_ignores_unrelated_domains(
+        self, db_session, seed_counties
+    ):
+        assert refresh_for_domain(db_session, "imf_weo") is None
+        assert refresh_for_domain(db_session, "audits") is not None
+
+    def test_stale_snapshot_served_while_another_reader_rebuilds(
+        self, db_session, seed_counties, monkeypatch
+    ):
+        version = refresh_accountability_snapshot(db_session)
+        snapshot = db_session.get(AccountabilitySnapshot, version)
+        snapshot.created_at = datetime.now() - timedelta(days=30)
+        db_session.commit()
+
+        # The rebuild lock is held elsewhere: keep serving the old version.
+        monkeypatch.setattr(accountability, "_rebuild_lock", lambda db, wait: False)
+        assert ensure_current_snapshot(db_session) == version
+        assert db_session.query(AccountabilitySnapshot).count() == 1
+
+        monkeypatch.setattr(accountability, "_rebuild_lock", lambda db, wait: True)
+        assert ensure_current_snapshot(db_session) > version
+
+
+class TestScorecardEndpoints:
+    def test_endpoint_serves_latest_snapshot(
+        self, client, db_session, seed_counties, seed_source_doc
+    ):
+        source_doc_id = seed_source_doc.id
+        first = client.get("/api/v1/counties/047/summary").json()
+        assert first["audit_findings_count"] == 1
+
+        db_session.add(
+            Audit(
+                entity_id=101,
+                period_id=30,
+                finding_text="New finding",
+                severity=Severity.WARNING,
+                source_document_id=source_doc_id,
+            )
+        )
+        db_session.commit()
+        refresh_for_domain(db_session, "audits")
+
+        # The refresh drops the cached summary; no manual cache clear.
+        second = client.get("/api/v1/counties/047/summary").json()
+        assert second["audit_findings_count"] == 2
+
+    def test_ranking_lists_all_counties_best_first(self, client, seed_counties):
+        data = client.get("/api/v1/accountability/scorecards").json()
+        assert data["snapshot_version"] is not None
+        scores = [c["accountability_score"] for c in data["counties"]]
+        assert len(scores) == len(_COUNTIES)
+        assert scores == sorted(scores, reverse=True)
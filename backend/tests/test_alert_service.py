@@ -0,0 +1,277 @@
+"""
+Tests for the watcher-alert outbox and the pooled SMTP sender.
+
+Covers:
+  services.alert_service.notify_watchers / dispatch_batch / dispatch_pending
+  services.email_service.SMTPPool / build_alert_digest (alerts unsubscribe)
+"""
+
+import smtplib
+from email.mime.text import MIMEText
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from models import AlertOutbox, DataAlert, User, WatchlistItem
+from services import alert_service, email_service
+from services.alert_service import dispatch_pending, notify_watchers
+from services.email_service import SMTPPool
+from sqlalchemy import event
+
+
+@pytest.fixture()
+def watchers(db_session):
+    users = [
+        User(id=i, email=f"user{i}@example.com", password_hash="x") for i in (1, 2, 3)
+    ]
+    db_session.add_all(users)
+    db_session.flush()
+    db_session.add_all(
+        [
+            WatchlistItem(
+                user_id=1, item_type="county", item_id="047", label="Nairobi"
+            ),
+            WatchlistItem(
+                user_id=2, item_type="county", item_id="047", label="Nairobi"
+            ),
+            WatchlistItem(
+                user_id=1, item_type="county", item_id="001", label="Mombasa"
+            ),
+            WatchlistItem(
+                user_id=3,
+                item_type="county",
+                item_id="001",
+                label="Mombasa",
+                notify=False,
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+def _queue(db, item_id, title="Update"):
+    return notify_watchers(
+        db,
+        item_type="county",
+        item_id=item_id,
+        alert_type="data_update",
+        title=title,
+        body=None,
+    )
+
+
+class TestOutbox:
+    def test_notify_only_appends_to_the_session(self, db_session):
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db_session.bind, "before_cursor_execute", listener)
+        try:
+            _queue(db_session, "047")
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", listener)
+        assert statements == []
+        db_session.rollback()
+        assert db_session.query(AlertOutbox).count() == 0
+
+    def test_dispatch_fans_out_to_notifying_watchers(self, db_session, watchers):
+        _queue(db_session, "047", "New audit for Nairobi")
+        _queue(db_session, "001", "Budget update for Mombasa")
+        _queue(db_session, "999", "Nobody watches this")
+        db_session.commit()
+
+        result = dispatch_pending(db_session, send_emails=False)
+        assert (result.batches, result.outbox_rows, result.alerts_created) == (1, 3, 3)
+        alerts = db_session.query(DataAlert).all()
+        assert sorted((a.user_id, a.item_id) for a in alerts) == [
+            (1, "001"),
+            (1, "047"),
+            (2, "047"),
+        ]
+        assert all(a.body == "" and a.read is False for a in alerts)
+
+        outbox = {o.item_id: o for o in db_session.query(AlertOutbox)}
+        assert all(o.dispatched_at is not None for o in outbox.values())
+        assert (outbox["047"].alerts_created, outbox["999"].alerts_created) == (2, 0)
+        assert dispatch_pending(db_session, send_emails=False).batches == 0
+
+    def test_statements_per_batch_do_not_grow_with_rows(self, db_session, watchers):
+        for _ in range(47):
+            _queue(db_session, "047")
+        db_session.commit()
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db_session.bind, "before_cursor_execute", listener)
+        try:
+            result = alert_service.dispatch_batch(db_session, send_emails=False)
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", listener)
+        assert result.alerts_created == 94
+        assert len(statements) == 3  # claim, INSERT ... SELECT, UPDATE
+
+    def test_batches(self, db_session, watchers):
+        for item in ("047", "001", "047"):
+            _queue(db_session, item)
+        db_session.commit()
+        result = dispatch_pending(db_session, batch_size=2, send_emails=False)
+        assert (result.batches, result.outbox_rows) == (2, 3)
+        assert dispatch_pending(db_session, max_batches=1).batches == 0
+
+    def test_one_digest_email_per_watcher(self, db_session, watchers, monkeypatch):
+        sent = []
+
+        class FakePool:
+            def send(self, msg):
+                if msg["To"] == "user2@example.com":
+                    raise smtplib.SMTPRecipientsRefused({})
+                sent.append(msg)
+
+        monkeypatch.setattr(email_service, "_smtp_configured", lambda: True)
+        monkeypatch.setattr(email_service, "smtp_pool", lambda: FakePool())
+        _queue(db_session, "047", "New audit for Nairobi")
+        _queue(db_session, "001", "Budget update for Mombasa")
+        db_session.commit()
+
+        result = dispatch_pending(db_session, send_emails=True)
+        assert (result.emails_sent, result.email_failures) == (1, 1)
+        assert sent[0]["To"] == "user1@example.com"
+        assert sent[0]["Subject"] == "2 updates on items you watch"
+        # The failed email does not undo or repeat the in-app alerts.
+        assert db_session.query(DataAlert).count() == 3
+
+    def test_digest_unsubscribe_turns_off_alert_emails(
+        self, client, db_session, watchers, monkeypatch
+    ):
+        monkeypatch.setenv("SECRET_KEY", "test-secret")
+        msg = email_service.build_alert_digest("user1@example.com", [("T", "", "x")])
+        assert msg["List-Unsubscribe-Post"] == "List-Unsubscribe=One-Click"
+        url = msg["List-Unsubscribe"].strip("<>")
+        assert url in msg.get_payload(decode=True).decode()
+        params = parse_qs(urlsplit(url).query)
+        assert params["list"] == ["alerts"]
+        body = {"email": "user1@example.com", "token": params["token"][0]}
+
+        # Signed for the alerts list only: not a newsletter unsubscribe.
+        resp = client.post("/api/v1/newsletter/unsubscribe-verify", json=body)
+        assert resp.status_code == 403
+        resp = client.post(
+            "/api/v1/newsletter/unsubscribe-verify", json={**body, "list": "alerts"}
+        )
+        assert resp.json()["status"] == "unsubscribed"
+        db_session.expire_all()
+        assert db_session.get(User, 1).alert_emails is False
+        # In-app alerts are untouched: only the emails stop.
+        notify = {
+            (w.user_id, w.item_id): w.notify for w in db_session.query(WatchlistItem)
+        }
+        assert notify == {
+            (1, "047"): True,
+            (1, "001"): True,
+            (2, "047"): True,
+            (3, "001"): False,
+        }
+        _queue(db_session, "047")
+        db_session.commit()
+        digests = alert_service._email_digests(
+            db_session, [r.id for r in db_session.query(AlertOutbox)]
+        )
+        assert list(digests) == ["user2@example.com"]
+        result = dispatch_pending(db_session, send_emails=False)
+        assert result.alerts_created == 2
+
+
+class FakeSMTP:
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        self.closed = False
+        self.fail_next = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        if self.fail_next:
+            self.fail_next = False
+            raise smtplib.SMTPServerDisconnected("gone")
+        self.sent.append(msg)
+
+    def quit(self):
+        self.closed = True
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def pool():
+    FakeSMTP.instances = []
+    clock = FakeClock()
+    pool = SMTPPool(
+        "smtp.example",
+        587,
+        "user",
+        "secret",
+        rate_per_minute=3,
+        idle_timeout=30,
+        connect=FakeSMTP,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    return pool, clock
+
+
+def _msg(i=0):
+    msg = MIMEText(f"body {i}")
+    msg["To"] = "someone@example.com"
+    return msg
+
+
+class TestSMTPPool:
+    def test_connection_is_reused(self, pool):
+        pool, _ = pool
+        for i in range(3):
+            pool.send(_msg(i))
+        assert pool.connections_opened == 1
+        assert len(FakeSMTP.instances[0].sent) == 3
+
+    def test_rate_limit_waits_for_tokens(self, pool):
+        pool, clock = pool
+        for i in range(5):
+            pool.send(_msg(i))
+        # 3/minute: two sends had to wait ~20 s each for a token.
+        assert len(clock.sleeps) == 2
+        assert sum(clock.sleeps) == pytest.approx(40, rel=0.01)
+
+    def test_dropped_connection_is_replaced_once(self, pool):
+        pool, _ = pool
+        pool.send(_msg())
+        FakeSMTP.instances[0].fail_next = True
+        pool.send(_msg(1))
+        assert FakeSMTP.instances[0].closed
+        assert len(FakeSMTP.instances) == 2
+        assert len(FakeSMTP.instances[1].sent) == 1
+
+    def test_idle_connections_expire(self, pool):
+        pool, clock = pool
+        pool.send(_msg())
+        clock.now += 31
+        pool.send(_msg(1))
+        assert pool.connections_opened == 2
+        assert FakeSMTP.instances[0].closed
+        pool.close()
+        assert FakeSMTP.instances[1].closed
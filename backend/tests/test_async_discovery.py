@@ -0,0 +1,146 @@
+"""
+Tests for the async discovery layer and the discovery benchmark.
+
+Covers:
+  etl.async_discovery (per-host limits, retries, DISCOVERY_HOST_LIMITS)
+  KenyaDataPipeline._crawl (fetch-ahead window keeps sequential order)
+  etl.discovery_bench on a synthetic fixture
+"""
+
+import asyncio
+import time
+from collections import deque
+
+import httpx
+from etl.async_discovery import (
+    AsyncFetcher,
+    HostLimiter,
+    HostPolicy,
+    host_policies_from_env,
+)
+
+
+def _fetcher(handler, **kwargs):
+    kwargs.setdefault("policies", {})
+    kwargs.setdefault("default", HostPolicy(concurrency=4, delay=0))
+    return AsyncFetcher(transport=httpx.MockTransport(handler), **kwargs)
+
+
+def test_host_policies_from_env(monkeypatch):
+    monkeypatch.setenv(
+        "DISCOVERY_HOST_LIMITS", "www.cob.go.ke=2:1.5, oagkenya.go.ke=3,bad=x:y"
+    )
+    assert host_policies_from_env() == {
+        "cob.go.ke": HostPolicy(2, 1.5),
+        "oagkenya.go.ke": HostPolicy(3, 0.0),
+    }
+
+
+def test_host_limiter_caps_in_flight_and_spaces_starts():
+    starts = []
+    state = {"in_flight": 0, "peak": 0}
+
+    async def worker(limiter):
+        async with limiter.slot():
+            starts.append(time.monotonic())
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.03)
+            state["in_flight"] -= 1
+
+    async def run():
+        limiter = HostLimiter(HostPolicy(concurrency=2, delay=0.01))
+        await asyncio.gather(*(worker(limiter) for _ in range(6)))
+
+    asyncio.run(run())
+    assert state["peak"] == 2
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.009
+
+
+def test_fetcher_retries_transient_statuses():
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, content=b"ok")
+
+    async def run():
+        async with _fetcher(handler, backoff=0) as fetcher:
+            resp = await fetcher.get("https://www.cob.go.ke/reports/", "cob")
+            return resp, fetcher.request_counts()
+
+    resp, counts = asyncio.run(run())
+    assert resp.status_code == 200 and len(calls) == 2
+    assert counts == {"cob.go.ke": 2}
+
+
+def test_fetcher_returns_none_on_connection_failure():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def run():
+        async with _fetcher(handler) as fetcher:
+            return await fetcher.get("https://www.treasury.go.ke/", "treasury")
+
+    assert asyncio.run(run()) is None
+
+
+def _site(request):
+    """Listing pages that link to three children each, four levels deep."""
+    path = request.url.path.rstrip("/")
+    depth = path.count("/page")
+    links = ""
+    if depth < 4:
+        links = "".join(
+            f'<a href="{path}/page/{i}/">Reports page {i}</a>' for i in range(3)
+        )
+    pdf = f'<a href="{path}/report.pdf">Audit report FY 2023/24</a>'
+    return httpx.Response(200, content=f"<html>{links}{pdf}</html>".encode())
+
+
+def test_crawl_window_preserves_sequential_order(tmp_path, monkeypatch):
+    from etl.kenya_pipeline import KenyaDataPipeline
+
+    monkeypatch.setenv("CRAWL_FRONTIER_ENABLED", "false")
+    pipeline = KenyaDataPipeline(storage_path=str(tmp_path))
+
+    def extract(soup, url):
+        return {"links": [a["href"] for a in soup.find_all("a")]}
+
+    async def crawl(window):
+        pipeline.discovery_window = window
+        base = "https://www.oagkenya.go.ke"
+        q, order = deque([{"url": f"{base}/reports/"}]), []
+        async with _fetcher(_site) as fetcher:
+            async for item, page in pipeline._crawl(
+                fetcher, "oag", q, set(), 60, extract
+            ):
+                order.append(item["url"])
+                for href in page["links"]:
+                    if not href.endswith(".pdf"):
+                        q.append({"url": base + href})
+        return order
+
+    sequential = asyncio.run(crawl(1))
+    windowed = asyncio.run(crawl(16))
+    assert len(sequential) == 60
+    assert windowed == sequential
+
+
+def test_discovery_bench_concurrent_pass_is_faster(tmp_path):
+    from etl import discovery_bench
+
+    fixtures = tmp_path / "fixtures"
+    discovery_bench.build_synthetic_fixture(
+        fixtures, ("treasury", "cob"), pages_per_host=6, latency_ms=5
+    )
+    sequential = discovery_bench.run_pass(fixtures, ("treasury", "cob"), True)
+    concurrent = discovery_bench.run_pass(fixtures, ("treasury", "cob"), False)
+
+    assert sequential["documents"] > 0
+    assert concurrent["urls"] == sequential["urls"]
+    assert concurrent["requests"] == sequential["requests"]
+    assert concurrent["wall_s"] < sequential["wall_s"]
@@ -13,6 +13,7 @@ from decimal import Decimal
 
 import pytest
 from models import Audit, Entity, EntityType, FiscalPeriod, Severity
+from sqlalchemy import event
 
 
 @pytest.fixture()
@@ -215,6 +216,67 @@ class TestAuditRecurring:
         assert sorted(nairobi_fi[0]["years_appeared"]) == [2022, 2023]
         assert nairobi_fi[0]["total_amount"] == 80_000_000
 
+    def test_single_grouped_query(self, client, db_session, seed_audit_dashboard):
+        statements = []
+
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.get_bind().engine
+        event.listen(engine, "before_cursor_execute", _before)
+        try:
+            client.get("/api/v1/audit/recurring")
+        finally:
+            event.remove(engine, "before_cursor_execute", _before)
+        assert len([s for s in statements if "FROM audits" in s]) == 1
+
+    def test_flagged_untyped_group_reported_as_unknown(
+        self, client, db_session, seed_audit_dashboard, seed_source_doc
+    ):
+        db_session.add(
+            Audit(
+                entity_id=101,
+                period_id=101,
+                finding_text="Untyped repeat finding",
+                severity=Severity.INFO,
+                source_document_id=seed_source_doc.id,
+                follow_up_status="Recurring",
+            )
+        )
+        db_session.commit()
+        data = client.get("/api/v1/audit/recurring").json()
+        unknown = [r for r in data["recurring_findings"] if r["query_type"] == "Unknown"]
+        assert len(unknown) == 1
+        assert unknown[0]["county_name"] == "Mombasa"
+        assert unknown[0]["years_appeared"] == []
+
+    def test_cache_invalidated_by_audit_commit(
+        self, client, db_session, seed_audit_dashboard, seed_source_doc
+    ):
+        source_doc_id = seed_source_doc.id
+        before = client.get("/api/v1/audit/recurring").json()
+        assert not any(r["county_name"] == "Mombasa" for r in before["recurring_findings"])
+
+        db_session.add(
+            Audit(
+                entity_id=101,
+                period_id=100,
+                finding_text="Unsupported expenditure KES 5M",
+                severity=Severity.WARNING,
+                source_document_id=source_doc_id,
+                query_type="Unsupported Expenditure",
+                amount=Decimal("5000000"),
+                audit_year=2022,
+            )
+        )
+        db_session.commit()
+
+        after = client.get("/api/v1/audit/recurring").json()
+        mombasa = [r for r in after["recurring_findings"] if r["county_name"] == "Mombasa"]
+        assert len(mombasa) == 1
+        assert mombasa[0]["years_appeared"] == [2022, 2023]
+        assert mombasa[0]["total_amount"] == 15_000_000
+
 
 # ── Findings List ────────────────────────────────────────────────────────
 
@@ -111,6 +111,72 @@ class TestCountyAuditsList:
             assert "items" in data
 
 
+@pytest.fixture()
+def seed_many_audits(db_session, seed_country, seed_source_doc):
+    """Seed Mombasa County with 25 findings of mixed status for paging tests."""
+    entity = Entity(
+        id=21,
+        country_id=seed_country.id,
+        type=EntityType.COUNTY,
+        canonical_name="Mombasa County",
+        slug="mombasa-county",
+    )
+    db_session.add(entity)
+    fp = FiscalPeriod(
+        id=21,
+        country_id=seed_country.id,
+        label="FY2022/23",
+        start_date=datetime(2022, 7, 1),
+        end_date=datetime(2023, 6, 30),
+    )
+    db_session.add(fp)
+    db_session.flush()
+
+    for i in range(25):
+        db_session.add(
+            Audit(
+                entity_id=entity.id,
+                period_id=fp.id,
+                finding_text=f"Finding {i:02d}",
+                severity=Severity.WARNING,
+                source_document_id=seed_source_doc.id,
+                status="Resolved" if i % 5 == 0 else "Pending",
+                provenance=[{"category": "Procurement"}],
+                created_at=datetime(2024, 1, 1, 0, i),
+            )
+        )
+    db_session.commit()
+    return entity
+
+
+class TestCountyAuditsListPagination:
+    """SQL-side filtering / paging for /counties/{id}/audits/list."""
+
+    def test_total_counts_all_rows_not_page(self, client, seed_many_audits):
+        data = client.get("/api/v1/counties/047/audits/list?limit=10").json()
+        assert data["total"] == 25
+        assert len(data["items"]) == 10
+
+    def test_pages_are_newest_first_and_disjoint(self, client, seed_many_audits):
+        p1 = client.get("/api/v1/counties/047/audits/list?limit=10&page=1").json()
+        p3 = client.get("/api/v1/counties/047/audits/list?limit=10&page=3").json()
+        assert p1["items"][0]["description"] == "Finding 24"
+        assert [i["description"] for i in p3["items"]] == [
+            f"Finding {i:02d}" for i in range(4, -1, -1)
+        ]
+
+    def test_status_filter_is_case_insensitive(self, client, seed_many_audits):
+        data = client.get("/api/v1/counties/047/audits/list?status=resolved").json()
+        assert data["total"] == 5
+        assert {i["status"] for i in data["items"]} == {"Resolved"}
+
+    def test_items_carry_source_and_fiscal_year(self, client, seed_many_audits):
+        item = client.get("/api/v1/counties/047/audits/list?limit=1").json()["items"][0]
+        assert item["fiscal_year"] == "FY2022/23"
+        assert item["category"] == "Procurement"
+        assert item["source"]["url"] == "https://treasury.go.ke/budget-2024"
+
+
 class TestCountyAuditsHistory:
     """Tests for GET /api/v1/counties/{county_id}/audits/history."""
 
@@ -0,0 +1,309 @@
+"""
+Tests for the shared content-addressed blob store.
+
+Covers:
+  services.blob_store.BlobStore (SHA-256 dedup across URLs, URL index and
+    max_age, reference-counted GC, LRU eviction over the size cap, pins)
+  services.blob_store.default_store (paths relative to the repository root)
+  services.blob_store.S3Backend (upload once, re-materialize an evicted
+    local copy, delete on GC, evict only the local cache over the cap)
+  services.blob_store.SharedStore (the ETL extractors' blobs accessor)
+  services.etl_jobs.blob_gc (releases pins of deleted source documents)
+  etl.downloader.DocumentDownloader.download_file (served from the store)
+  etl.bitstream_store.BitstreamStore with a shared blob store
+
+The S3 client is an in-memory fake.
+"""
+
+import hashlib
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from etl.bitstream_store import BitstreamStore
+from etl.downloader import DocumentDownloader
+from services import blob_store
+from services.blob_store import BlobStore, S3Backend
+
+PDF = b"%PDF-1.7 annual report" + b"." * 100
+PDF_SHA = hashlib.sha256(PDF).hexdigest()
+
+
+class Fetcher:
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.calls = []
+
+    def __call__(self, url):
+        self.calls.append(url)
+        return self.bodies[url]
+
+
+def test_same_content_under_two_urls_is_stored_once(tmp_path):
+    store = BlobStore(tmp_path)
+    fetch = Fetcher({"https://a.test/r.pdf": PDF, "https://b.test/dl?id=7": PDF})
+
+    first = store.get_or_fetch("https://a.test/r.pdf", fetch)
+    second = store.get_or_fetch("https://b.test/dl?id=7", fetch)
+    again = store.get_or_fetch("https://a.test/r.pdf", fetch)
+
+    assert fetch.calls == ["https://a.test/r.pdf", "https://b.test/dl?id=7"]
+    assert first.fetched and not second.fetched and not again.fetched
+    assert first.path == second.path == again.path
+    assert first.path == tmp_path / "objects" / PDF_SHA[:2] / f"{PDF_SHA}.pdf"
+    assert first.md5 == hashlib.md5(PDF).hexdigest()
+    assert store.refcount(PDF_SHA) == 2
+    assert len(list((tmp_path / "objects").rglob("*.pdf"))) == 1
+
+
+def test_stale_url_is_refetched_and_the_old_version_collected(tmp_path):
+    store = BlobStore(tmp_path)
+    url = "https://cob.test/latest.pdf"
+    old = store.get_or_fetch(url, Fetcher({url: PDF}))
+
+    new = store.get_or_fetch(url, Fetcher({url: PDF + b"v2"}), max_age=-1)
+    assert new.sha256 != old.sha256
+    assert store.refcount(old.sha256) == 0
+
+    assert store.gc()["removed"] == 1
+    assert not old.path.exists()
+    assert store.get(old.sha256) is None
+    assert store.lookup_url(url).sha256 == new.sha256
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+def test_urls_and_aliases_expire_after_the_store_max_age(tmp_path, monkeypatch):
+    clock = FakeClock(1_000_000.0)
+    monkeypatch.setattr(blob_store, "time", clock)
+    store = BlobStore(tmp_path, max_age=3600)
+    blob = store.put(PDF, url="https://cob.test/r.pdf")
+    store.alias("https://cob.test/download/r/", blob.sha256)
+
+    clock.now += 1800
+    assert store.lookup_url("https://cob.test/download/r/").sha256 == blob.sha256
+    assert store.lookup_url("https://cob.test/r.pdf", max_age=60) is None
+    clock.now += 3600  # a caller cannot extend past the store's bound
+    assert store.lookup_url("https://cob.test/r.pdf", max_age=10**9) is None
+    assert store.lookup_url("https://cob.test/download/r/") is None
+
+    fetch = Fetcher({"https://cob.test/r.pdf": PDF + b"republished"})
+    assert store.get_or_fetch("https://cob.test/r.pdf", fetch).sha256 != blob.sha256
+    assert fetch.calls == ["https://cob.test/r.pdf"]
+
+
+def test_relative_store_path_is_taken_from_the_repo_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "REPO_ROOT", tmp_path)
+    monkeypatch.setenv("BLOB_STORE_PATH", "downloads/shared")
+    monkeypatch.setenv("BLOB_STORE_MAX_AGE_HOURS", "2")
+    blob_store.default_store.cache_clear()
+
+    store = blob_store.default_store()
+    assert store.root == tmp_path / "downloads" / "shared"
+    assert store.max_age == 7200
+    assert blob_store.DEFAULT_ROOT.is_absolute()
+
+
+def test_pins_keep_a_blob_alive_until_released(tmp_path):
+    store = BlobStore(tmp_path)
+    blob = store.put(PDF, pin="document:abc")
+    store.pin(blob.sha256, "dspace:bs-1")
+
+    store.unpin("document:abc")
+    assert store.gc()["removed"] == 0
+    store.unpin("dspace:bs-1", blob.sha256)
+    assert store.gc()["removed"] == 1
+    assert not blob.path.exists()
+
+
+def test_pinning_new_content_releases_the_holders_old_blob(tmp_path):
+    store = BlobStore(tmp_path)
+    old = store.put(PDF, pin="dspace:bs-1")
+    new = store.put(b"%PDF-1.7 corrected report", pin="dspace:bs-1")
+
+    assert store.refcount(old.sha256) == 0
+    assert store.refcount(new.sha256) == 1
+    assert store.gc()["removed"] == 1
+    assert not old.path.exists() and new.path.exists()
+
+
+def test_release_pins_drops_holders_that_are_gone(tmp_path):
+    store = BlobStore(tmp_path)
+    kept = store.put(PDF, pin="document:kept")
+    gone = store.put(b"%PDF-1.7 deleted document", pin="document:gone")
+    store.pin(gone.sha256, "dspace:bs-1")
+
+    assert store.release_pins("document:", {"document:kept"}, idle_for=3600) == 0
+    assert store.release_pins("document:", {"document:kept"}) == 1
+    assert store.refcount(kept.sha256) == 1
+    assert store.refcount(gone.sha256) == 1  # still held by the bitstream
+
+
+def test_blob_gc_job_releases_pins_of_deleted_documents(
+    db_session, seed_country, monkeypatch
+):
+    import database
+    from models import DocumentType, SourceDocument
+    from services import etl_jobs
+
+    store = blob_store.default_store()
+    kept = store.put(PDF, pin="document:kept")
+    deleted = store.put(b"%PDF-1.7 deleted document", pin="document:deleted")
+    # Both blobs last used two days ago, past the job's one-day grace.
+    store._conn.execute("UPDATE blobs SET last_access = ?", (time.time() - 2 * 86400,))
+    store._conn.commit()
+    db_session.add(
+        SourceDocument(
+            country_id=seed_country.id,
+            publisher="OAG",
+            title="Audit report",
+            fetch_date=datetime.now(),
+            md5="kept",
+            doc_type=DocumentType.AUDIT,
+        )
+    )
+    db_session.commit()
+
+    @contextmanager
+    def session():
+        yield db_session
+
+    monkeypatch.setattr(database, "SessionLocal", session)
+    result = etl_jobs.blob_gc()
+
+    assert result["released_pins"] == 1 and result["removed"] == 1
+    assert kept.path.exists() and not deleted.path.exists()
+
+
+def test_size_cap_evicts_least_recently_used_unpinned_blobs(tmp_path):
+    store = BlobStore(tmp_path, max_bytes=250)
+    pinned = store.put(b"a" * 100, url="https://x.test/a", pin="document:a")
+    time.sleep(0.01)
+    older = store.put(b"b" * 100, url="https://x.test/b")
+    time.sleep(0.01)
+    newer = store.put(b"c" * 100, url="https://x.test/c")  # 300 bytes: over cap
+
+    assert store.total_bytes() == 200
+    assert store.lookup_url("https://x.test/b") is None
+    assert not older.path.exists()
+    assert store.get(pinned.sha256) is not None
+    assert store.get(newer.sha256) is not None
+
+
+def test_url_locks_are_dropped_after_the_fetch(tmp_path):
+    store = BlobStore(tmp_path)
+    fetch = Fetcher({f"https://x.test/{i}.pdf": PDF for i in range(3)})
+    for url in fetch.bodies:
+        store.get_or_fetch(url, fetch)
+    assert len(store._url_locks) == 0
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise KeyError(Key)
+        return {}
+
+    def upload_file(self, filename, bucket, key, ExtraArgs=None):
+        self.uploads += 1
+        self.objects[key] = Path(filename).read_bytes()
+
+    def download_file(self, bucket, key, filename):
+        Path(filename).write_bytes(self.objects[key])
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+
+def test_s3_backend_uploads_once_and_restores_evicted_copies(tmp_path):
+    s3 = FakeS3()
+    store = BlobStore(tmp_path, backend=S3Backend(s3, "bucket", tmp_path / "cache"))
+    blob = store.put(PDF, url="https://a.test/r.pdf")
+    store.put(PDF, url="https://b.test/r.pdf")
+
+    key = store.remote_key(blob)
+    assert key == f"blobs/{PDF_SHA[:2]}/{PDF_SHA}.pdf"
+    assert s3.uploads == 1 and s3.objects[key] == PDF
+
+    blob.path.unlink()  # local cache lost, e.g. a fresh container
+    restored = store.lookup_url("https://a.test/r.pdf")
+    assert restored.read_bytes() == PDF
+
+    orphan = store.put(b"%PDF-1.7 unreferenced")
+    assert store.gc()["removed"] == 1
+    assert store.remote_key(orphan) not in s3.objects
+    assert not orphan.path.exists() and key in s3.objects
+
+
+def test_s3_eviction_frees_the_local_cache_only(tmp_path):
+    s3 = FakeS3()
+    backend = S3Backend(s3, "bucket", tmp_path / "cache")
+    store = BlobStore(tmp_path, backend=backend, max_bytes=250)
+    older = store.put(b"b" * 200, url="https://x.test/b")
+    time.sleep(0.01)
+    store.put(b"c" * 200, url="https://x.test/c")  # 400 local bytes: over cap
+
+    assert not older.path.exists()
+    assert store.remote_key(older) in s3.objects
+    assert store.local_bytes() == 200 and store.total_bytes() == 400
+    restored = store.lookup_url("https://x.test/b")
+    assert restored.read_bytes() == b"b" * 200
+
+
+def test_extractors_share_the_default_store(tmp_path):
+    from etl.knbs_parser import KNBSParser
+    from etl.pending_bills_extractor import PendingBillsExtractor
+
+    shared = blob_store.default_store()
+    assert PendingBillsExtractor().blobs is shared
+    assert KNBSParser().blobs is shared
+    injected = BlobStore(tmp_path)
+    assert PendingBillsExtractor(blob_store=injected).blobs is injected
+
+
+def test_document_downloader_reuses_stored_urls(tmp_path, monkeypatch):
+    fetched = []
+
+    def fake_fetch(self, url):
+        fetched.append(url)
+        return PDF
+
+    monkeypatch.setattr(DocumentDownloader, "_fetch", fake_fetch)
+    store = BlobStore(tmp_path / "blobs")
+    downloader = DocumentDownloader(str(tmp_path), blob_store=store)
+
+    first = downloader.download_file("https://oag.test/report.pdf", "oag")
+    second = downloader.download_file("https://oag.test/report.pdf", "oag")
+
+    assert fetched == ["https://oag.test/report.pdf"]
+    assert first["file_path"] == second["file_path"]
+    assert first["sha256"] == PDF_SHA
+    assert store.refcount(PDF_SHA) == 1  # held by its URL only, not pinned
+
+
+def test_bitstream_store_commits_into_the_shared_store(tmp_path):
+    blobs = BlobStore(tmp_path / "blobs")
+    store = BitstreamStore(tmp_path / "parliament", blobs=blobs)
+    md5 = hashlib.md5(PDF).hexdigest()
+    part = store.partial_path("bs-1")
+    part.parent.mkdir(parents=True)
+    part.write_bytes(PDF)
+
+    dest = store.commit(part, md5, "bs-1", url="https://dspace.test/bs-1")
+    store.record(md5, dest, "bs-2")
+
+    assert dest == blobs.lookup_url("https://dspace.test/bs-1").path
+    assert store.lookup(md5) == store.lookup_bitstream("bs-2") == dest
+    assert store.bitstream_md5("bs-2") == md5
+    assert blobs.refcount(PDF_SHA) == 3  # URL + dspace:bs-1 + dspace:bs-2
@@ -0,0 +1,379 @@
+"""
+Tests for the pooled headless browser used by the COB downloader.
+
+Covers:
+  etl.browser_pool.BrowserPool (context reuse, recycling, concurrency bound,
+    request blocking, idle shutdown)
+  etl.browser_pool.get_pool / browser_session (closed at the end of a run,
+    pools of finished loops dropped)
+  etl.browser_pool.memory_bounded_contexts
+  services.etl_jobs.ingest_batch (one browser per batch)
+  etl.cob_headless resolve-only probing and the plain-HTTP download path
+
+Playwright is not needed: the browser, contexts and pages are fakes.
+"""
+
+import asyncio
+
+from etl import browser_pool, cob_headless
+from etl.browser_pool import (
+    BrowserPool,
+    browser_session,
+    get_pool,
+    memory_bounded_contexts,
+    should_block,
+)
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+        self.pages = []
+        self.cookie_clears = 0
+        self.closed = False
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self):
+        self.cookie_clears += 1
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        ctx = FakeContext()
+        ctx.options = options
+        self.contexts.append(ctx)
+        return ctx
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    stopped = False
+
+    async def stop(self):
+        self.stopped = True
+
+
+def _pool(**kwargs):
+    launched = []
+
+    async def launcher(browser_type):
+        browser = FakeBrowser()
+        launched.append(browser)
+        return FakePlaywright(), browser
+
+    kwargs.setdefault("max_contexts", 2)
+    kwargs.setdefault("idle_seconds", 0)
+    pool = BrowserPool("chromium", launcher=launcher, **kwargs)
+    return pool, launched
+
+
+def test_contexts_are_reused_and_recycled():
+    async def run():
+        pool, launched = _pool(context_max_uses=3, context_options={"locale": "en"})
+        for _ in range(5):
+            async with pool.page() as page:
+                assert not page.closed
+        await pool.close()
+        return pool, launched
+
+    pool, launched = asyncio.run(run())
+    browser = launched[0]
+    assert len(launched) == 1
+    # Three pages on the first context, then a fresh one.
+    assert [len(c.pages) for c in browser.contexts] == [3, 2]
+    assert browser.contexts[0].closed and browser.contexts[0].cookie_clears == 2
+    assert browser.contexts[0].options == {"locale": "en"}
+    assert all(p.closed for c in browser.contexts for p in c.pages)
+    assert browser.closed
+    assert pool.stats["pages"] == 5 and pool.stats["contexts_created"] == 2
+
+
+def test_concurrency_is_bounded_by_max_contexts():
+    state = {"active": 0, "peak": 0}
+
+    async def use(pool):
+        async with pool.page():
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+    async def run():
+        pool, launched = _pool(max_contexts=2)
+        await asyncio.gather(*(use(pool) for _ in range(8)))
+        await pool.close()
+        return launched
+
+    launched = asyncio.run(run())
+    assert state["peak"] == 2
+    assert len(launched[0].contexts) == 2
+
+
+def test_failed_page_discards_its_context():
+    async def run():
+        pool, launched = _pool()
+        try:
+            async with pool.page():
+                raise RuntimeError("navigation failed")
+        except RuntimeError:
+            pass
+        async with pool.page():
+            pass
+        return launched[0]
+
+    browser = asyncio.run(run())
+    assert len(browser.contexts) == 2 and browser.contexts[0].closed
+
+
+def test_idle_pool_closes_its_browser():
+    async def run():
+        pool, launched = _pool(idle_seconds=0.01)
+        async with pool.page():
+            pass
+        await asyncio.sleep(0.05)
+        return pool, launched[0]
+
+    pool, browser = asyncio.run(run())
+    assert browser.closed and not pool.running
+
+
+def _fake_launcher(launched):
+    async def launcher(browser_type):
+        browser = FakeBrowser()
+        launched.append(browser)
+        return FakePlaywright(), browser
+
+    return launcher
+
+
+def test_session_closes_pools_when_the_last_run_ends():
+    launched = []
+
+    async def job(hold):
+        async with browser_session():
+            pool = get_pool("chromium", launcher=_fake_launcher(launched))
+            async with pool.page():
+                pass
+            await hold.wait()
+
+    async def run():
+        first, second = asyncio.Event(), asyncio.Event()
+        tasks = [asyncio.create_task(job(e)) for e in (first, second)]
+        await asyncio.sleep(0.01)
+        first.set()
+        await tasks[0]
+        still_open = not launched[0].closed  # the other job is running
+        second.set()
+        await tasks[1]
+        return still_open
+
+    assert asyncio.run(run())
+    assert len(launched) == 1 and launched[0].closed
+    assert not browser_pool._pools and not browser_pool._sessions
+
+
+def test_ingest_batch_launches_one_browser_per_batch(monkeypatch):
+    from services import etl_jobs
+
+    launched = []
+
+    class Pipeline:
+        def browser_session(self):
+            return browser_session()
+
+        async def download_and_process_document(self, doc):
+            pool = get_pool("chromium", launcher=_fake_launcher(launched))
+            async with pool.page():
+                pass
+            return {"document_id": doc["id"]}
+
+    monkeypatch.setattr(etl_jobs, "_get_pipeline", Pipeline)
+    monkeypatch.setattr(etl_jobs, "INGEST_SPACING_SECONDS", 0)
+    docs = [{"id": i} for i in range(4)]
+
+    result = asyncio.run(etl_jobs.ingest_batch("cob", docs, limit=3))
+
+    assert result == (3, 3, [])
+    assert len(launched) == 1 and launched[0].closed
+    assert not browser_pool._pools
+
+
+def test_run_etl_for_source_awaits_discovery_on_the_running_loop(
+    monkeypatch, tmp_path
+):
+    from services import etl_jobs
+
+    loops = []
+
+    class Pipeline:
+        def browser_session(self):
+            return browser_session()
+
+        def discover_budget_documents(self, source_key):
+            raise AssertionError("blocking discovery called from the event loop")
+
+        async def discover_budget_documents_async(self, source_key):
+            loops.append(asyncio.get_running_loop())
+            return []
+
+    pipeline = Pipeline()
+    monkeypatch.setattr(etl_jobs, "_get_pipeline", lambda: pipeline)
+    monkeypatch.setattr(etl_jobs, "_PROJECT_ROOT", str(tmp_path))
+
+    async def run():
+        return asyncio.get_running_loop(), await etl_jobs.run_etl_for_source("cob")
+
+    loop, result = asyncio.run(run())
+
+    assert loops == [loop]
+    assert result["source"] == "cob" and result["discovered"] == 0
+
+
+def test_pools_of_finished_loops_are_dropped():
+    launched = []
+
+    async def leak():
+        pool = get_pool("chromium", launcher=_fake_launcher(launched))
+        async with pool.page():
+            pass
+        return pool
+
+    leaked = asyncio.run(leak())
+    assert leaked.running  # no session: the loop ended with it open
+
+    async def next_run():
+        async with browser_session():
+            return get_pool("chromium", launcher=_fake_launcher(launched))
+
+    assert asyncio.run(next_run()) is not leaked
+    assert not browser_pool._pools
+
+
+def test_route_blocks_heavy_and_tracking_requests():
+    assert should_block("image", "https://cob.go.ke/logo.png")
+    assert should_block("font", "https://fonts.gstatic.com/x.woff2")
+    assert should_block("script", "https://www.googletagmanager.com/gtag/js")
+    assert not should_block("document", "https://cob.go.ke/download/report/")
+    assert not should_block("xhr", "https://cob.go.ke/wp-admin/admin-ajax.php")
+
+    class Route:
+        def __init__(self, resource_type, url):
+            self.request = type("R", (), {"resource_type": resource_type, "url": url})
+            self.outcome = None
+
+        async def abort(self):
+            self.outcome = "abort"
+
+        async def continue_(self):
+            self.outcome = "continue"
+
+    async def run():
+        pool, _ = _pool()
+        blocked, allowed = Route("image", "https://cob.go.ke/a.jpg"), Route(
+            "document", "https://cob.go.ke/"
+        )
+        await pool._route(blocked)
+        await pool._route(allowed)
+        return pool, blocked, allowed
+
+    pool, blocked, allowed = asyncio.run(run())
+    assert (blocked.outcome, allowed.outcome) == ("abort", "continue")
+    assert pool.stats["blocked"] == 1
+
+
+def test_memory_bounded_contexts():
+    assert memory_bounded_contexts(8, 150, 500, available_mb=1400) == 4
+    assert memory_bounded_contexts(3, 150, 500, available_mb=64000) == 3
+    assert memory_bounded_contexts(8, 150, 500, available_mb=200) == 1
+
+
+# --- COB downloader ---------------------------------------------------------
+
+
+class FakeAPIResponse:
+    def __init__(self, status, body, headers, url):
+        self.status = status
+        self._body = body
+        self.headers = headers
+        self.url = url
+
+    async def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self):
+        self.calls = []
+
+    async def get(self, url, timeout=None, headers=None):
+        self.calls.append(headers)
+        return FakeAPIResponse(
+            206,
+            b"%PDF-1.7 ...",
+            {
+                "content-type": "application/pdf",
+                "content-range": "bytes 0-4095/900000",
+                "content-disposition": 'attachment; filename="cob-report.pdf"',
+            },
+            "https://cob.go.ke/wp-content/uploads/cob-report.pdf",
+        )
+
+
+def test_resolve_only_probe_requests_a_prefix():
+    page = type("P", (), {"request": FakeRequest()})()
+    hit = asyncio.run(
+        cob_headless._probe(page, "https://cob.go.ke/?wpdmdl=12", "ref", True)
+    )
+    assert page.request.calls[0]["Range"] == "bytes=0-4095"
+    assert hit.url.endswith("/cob-report.pdf")
+    assert hit.filename == "cob-report.pdf" and not hit.complete
+
+
+def test_fetch_downloads_resolved_url_over_plain_http(monkeypatch):
+    runs = []
+
+    async def fake_run(url, resolve_only):
+        runs.append(resolve_only)
+        hit = cob_headless._Hit(b"%PDF", "r.pdf", "https://cob.go.ke/r.pdf", False)
+        return hit, {"Cookie": "wpdm=1"}
+
+    async def fake_plain(url, headers):
+        assert headers == {"Cookie": "wpdm=1"}
+        return b"%PDF-full"
+
+    monkeypatch.setenv("PLAYWRIGHT_ENABLED", "1")
+    monkeypatch.setattr(cob_headless, "playwright_available", lambda: True)
+    monkeypatch.setattr(cob_headless, "_run", fake_run)
+    monkeypatch.setattr(cob_headless, "_fetch_plain", fake_plain)
+
+    res = asyncio.run(cob_headless.fetch_cob_download("https://cob.go.ke/download/x/"))
+    assert res == (b"%PDF-full", "r.pdf")
+    assert runs == [True]  # no browser download needed
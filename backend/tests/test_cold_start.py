@@ -0,0 +1,60 @@
+"""
+Cold-start guard: ``import main`` must not load the heavy modules that are
+deferred until first use (AWS SDK, ETL pipeline, PDF/HTML parsers, the
+auto-seeder). Runs in a fresh interpreter so modules imported by other
+tests do not mask a regression.
+"""
+
+import json
+import subprocess
+import sys
+
+from scripts.cold_start import BACKEND_DIR, DEFERRED_MODULES, _child_env
+
+
+def test_import_main_does_not_load_deferred_modules():
+    code = (
+        "import json, sys, main\n"
+        f"print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=_child_env(),
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert loaded == []
+
+
+def test_public_role_does_not_load_etl_code():
+    code = (
+        "import json, sys, main\n"
+        "from fastapi.testclient import TestClient\n"
+        "etl_loaded = [m for m in ('services.etl_jobs', 'routers.etl_jobs',"
+        " 'routers.etl_admin', 'apscheduler') if m in sys.modules]\n"
+        # Wrong-method requests: 405 means the path is routed, 404 that it
+        # is not, and no handler runs either way.
+        "client = TestClient(main.app)\n"
+        "print(json.dumps({\n"
+        "    'etl_loaded': etl_loaded,\n"
+        "    'etl_run': client.get('/api/v1/admin/etl/run').status_code != 404,\n"
+        "    'debt': client.delete('/api/v1/debt/national').status_code != 404,\n"
+        "}))"
+    )
+    env = _child_env()
+    env["API_ROLE"] = "public"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert result == {"etl_loaded": [], "etl_run": False, "debt": True}
@@ -33,8 +33,11 @@ from models import (
     Entity,
     EntityType,
     FiscalPeriod,
+    IngestionJob,
+    IngestionStatus,
     SourceDocument,
 )
+from seeding.checkpoint import Checkpoint
 from seeding.config import SeedingSettings
 from seeding.domains.counties_budget import parser as budget_parser
 from seeding.domains.counties_budget import writer as budget_writer
@@ -284,3 +287,35 @@ class TestWriterPersistence:
         assert fp.label in {"FY2023/24", "2023/2024"}
         assert fp.start_date.year == 2023
         assert fp.end_date.year == 2024
+
+    def test_checkpointed_persistence_skips_committed_counties(
+        self, sqlite_session, bootstrap, tmp_path
+    ):
+        """Each county is committed as a checkpoint unit and counties
+        committed by an earlier attempt of the job are skipped."""
+        settings = _make_settings(tmp_path)
+        job = IngestionJob(domain="counties_budget", status=IngestionStatus.RUNNING)
+        sqlite_session.add(job)
+        sqlite_session.commit()
+        context = DomainRunContext(
+            since=None,
+            dry_run=False,
+            job_id=job.id,
+            checkpoint=Checkpoint(sqlite_session, job),
+        )
+
+        records = budget_parser.parse_budget_payload(_estimated_payload())
+        stats = budget_writer.persist_budget_records_by_county(
+            sqlite_session, records, settings, context
+        )
+        assert stats.created == 1
+        assert job.meta["checkpoint"]["completed"] == ["county:nairobi-county"]
+        assert job.items_created == 1
+
+        resumed = Checkpoint(sqlite_session, job)
+        context.checkpoint = resumed
+        stats = budget_writer.persist_budget_records_by_county(
+            sqlite_session, records, settings, context
+        )
+        assert (stats.processed, resumed.skipped) == (0, 1)
+        assert len(sqlite_session.execute(select(BudgetLine)).scalars().all()) == 1
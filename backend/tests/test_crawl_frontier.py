@@ -0,0 +1,238 @@
+"""
+Tests for the incremental crawl frontier used by KenyaDataPipeline discovery.
+
+Covers:
+  etl.crawl_frontier.CrawlFrontier (validators, change detection,
+    adaptive revisit intervals)
+  KenyaDataPipeline._discover_oag replaying unchanged pages
+  services.etl_jobs._detect_changes
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from etl.crawl_frontier import DEFAULT_INTERVAL, CrawlFrontier
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture()
+def frontier(tmp_path, clock):
+    f = CrawlFrontier(
+        tmp_path / "frontier.sqlite",
+        min_interval=3600,
+        max_interval=7 * 86400,
+        clock=clock,
+    )
+    yield f
+    f.close()
+
+
+URL = "https://www.oagkenya.go.ke/county-funds/"
+
+
+class TestCrawlFrontier:
+    def test_new_url_is_due_and_has_no_validators(self, frontier):
+        assert frontier.is_due(URL)
+        assert frontier.conditional_headers(URL) == {}
+
+    def test_validators_round_trip(self, frontier, clock):
+        frontier.record(
+            URL,
+            200,
+            {"ETag": '"abc"', "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"},
+            b"<html>1</html>",
+            extracted={"docs": [], "links": []},
+        )
+        assert not frontier.is_due(URL)
+        assert frontier.conditional_headers(URL) == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Tue, 01 Jul 2025 00:00:00 GMT",
+        }
+        clock.now += DEFAULT_INTERVAL
+        assert frontier.is_due(URL)
+
+        # A 304 carries no validators of its own; the stored ones are kept.
+        assert frontier.record(URL, 304, {}) is False
+        entry = frontier.get(URL)
+        assert entry.etag == '"abc"'
+        assert entry.extracted == {"docs": [], "links": []}
+        assert entry.visits == 2
+
+    def test_same_body_without_validators_is_unchanged(self, frontier):
+        assert frontier.record(URL, 200, {}, b"same", extracted={"n": 1}) is True
+        assert frontier.record(URL, 200, {}, b"same") is False
+        assert frontier.get(URL).extracted == {"n": 1}
+        assert frontier.record(URL, 200, {}, b"different", extracted={"n": 2})
+        assert frontier.get(URL).changes == 2
+
+    def test_changed_body_without_extraction_keeps_the_stored_one(self, frontier):
+        frontier.record(URL, 200, {}, b"v1", extracted={"links": ["a"]})
+        assert frontier.record(URL, 200, {}, b"v2") is True
+        assert frontier.get(URL).extracted == {"links": ["a"]}
+
+    def test_revisit_interval_adapts_to_change_rate(self, frontier, clock):
+        frontier.record(URL, 200, {}, b"v0")
+        assert frontier.get(URL).interval_s == DEFAULT_INTERVAL
+        frontier.record(URL, 304, {})
+        frontier.record(URL, 304, {})
+        assert frontier.get(URL).interval_s == DEFAULT_INTERVAL * 1.5 * 1.5
+        for i in range(10):
+            frontier.record(URL, 200, {}, f"v{i + 1}".encode())
+        entry = frontier.get(URL)
+        assert entry.interval_s == 3600  # clamped to min_interval
+        assert entry.next_visit_at == clock.now + 3600
+        for _ in range(20):
+            frontier.record(URL, 304, {})
+        assert frontier.get(URL).interval_s == 7 * 86400
+
+    def test_missing_pages_back_off(self, frontier):
+        frontier.record(URL, 404, {})
+        frontier.record(URL, 404, {})
+        entry = frontier.get(URL)
+        assert entry.status == 404 and entry.extracted is None
+        assert entry.interval_s == DEFAULT_INTERVAL * 1.5
+        assert frontier.conditional_headers(URL) == {}
+
+    def test_changed_since(self, frontier, clock):
+        frontier.record(URL, 200, {}, b"a")
+        clock.now += 10
+        frontier.record(URL + "page/2/", 200, {}, b"b")
+        assert frontier.changed_since(clock.now) == [URL + "page/2/"]
+        assert frontier.stats() == {"urls": 2, "due": 0}
+
+
+# --- pipeline integration ---------------------------------------------------
+
+LISTING = b"""
+<html><body>
+<a href="/county-funds/">County funds</a>
+<a href="/wp-content/uploads/2025/nairobi-audit-report.pdf">Nairobi County Audit FY 2023/24</a>
+</body></html>
+"""
+
+
+class FakeSite:
+    """Serves one OAG listing page with an ETag; everything else is 404."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, request):
+        url = str(request.url)
+        if "/wp-json/" in url:  # WordPress REST augmentation
+            return httpx.Response(404)
+        conditional = {
+            k: v for k, v in request.headers.items() if k.lower().startswith("if-")
+        }
+        self.calls.append((url, conditional))
+        if request.url.path.rstrip("/").endswith("county-funds"):
+            if conditional.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=LISTING, headers={"ETag": '"v1"'})
+        return httpx.Response(404)
+
+
+def test_discovery_only_refetches_due_pages(tmp_path, monkeypatch, clock):
+    from etl.async_discovery import AsyncFetcher, HostPolicy
+    from etl.kenya_pipeline import KenyaDataPipeline
+
+    monkeypatch.delenv("CRAWL_FRONTIER_PATH", raising=False)
+    monkeypatch.setenv("CRAWL_FRONTIER_ENABLED", "true")
+    pipeline = KenyaDataPipeline(storage_path=str(tmp_path))
+    pipeline.frontier.clock = clock
+    site = FakeSite()
+
+    def discover():
+        async def run():
+            async with AsyncFetcher(
+                transport=httpx.MockTransport(site),
+                policies={},
+                default=HostPolicy(concurrency=4, delay=0),
+            ) as fetcher:
+                return await pipeline._discover_oag(fetcher)
+
+        return asyncio.run(run())
+
+    first = discover()
+    assert [d["url"] for d in first] == [
+        "https://www.oagkenya.go.ke/wp-content/uploads/2025/nairobi-audit-report.pdf"
+    ]
+    assert len(site.calls) > 50  # every seed is probed once
+
+    # Nothing is due yet: the whole crawl is replayed from the frontier.
+    site.calls.clear()
+    second = discover()
+    assert site.calls == []
+    assert [d["url"] for d in second] == [d["url"] for d in first]
+    assert second[0]["meta"]["year"] == first[0]["meta"]["year"]
+
+    # Once due, the listing is revalidated and answered with a 304.
+    clock.now += DEFAULT_INTERVAL + 1
+    site.calls.clear()
+    third = discover()
+    listing_calls = [h for u, h in site.calls if "county-funds" in u]
+    assert listing_calls == [{"if-none-match": '"v1"'}]
+    assert [d["url"] for d in third] == [d["url"] for d in first]
+    assert pipeline.crawl_stats == {"fetched": 0, "not_modified": 1, "replayed": 0}
+    # Dead seeds were probed again and back off like unchanged pages.
+    dead = pipeline.frontier.get("https://www.oagkenya.go.ke/state-corporations/")
+    assert (dead.status, dead.visits) == (404, 2)
+    assert dead.interval_s == DEFAULT_INTERVAL * 1.5
+
+
+def test_change_detection_skips_documents_and_keeps_extraction(
+    tmp_path, monkeypatch, clock
+):
+    from services import etl_jobs
+
+    path = tmp_path / "frontier.sqlite"
+    page = "https://cob.go.ke/reports/"
+    report = "https://cob.go.ke/download/report/"  # a PDF without an extension
+    seeded = CrawlFrontier(path, clock=clock)
+    seeded.record(page, 200, {}, b"<html>v1</html>", extracted={"links": ["x"]})
+    seeded.record(report, 200, {}, b"%PDF-1.6")
+    seeded.close()
+    clock.now += DEFAULT_INTERVAL + 1
+
+    def site(request):
+        if request.url.path == "/reports/":
+            return httpx.Response(
+                200, content=b"<html>v2</html>", headers={"Content-Type": "text/html"}
+            )
+        return httpx.Response(
+            200, content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"}
+        )
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        etl_jobs.httpx,
+        "AsyncClient",
+        lambda **kw: real_client(transport=httpx.MockTransport(site), **kw),
+    )
+    monkeypatch.setattr(
+        etl_jobs, "_open_frontier", lambda: CrawlFrontier(path, clock=clock)
+    )
+    docs = [{"url": page}, {"url": report}]
+
+    changed = asyncio.run(
+        etl_jobs._detect_changes(docs, {page, report}, started=clock.now)
+    )
+
+    assert changed == [{"url": page}]
+    after = CrawlFrontier(path, clock=clock)
+    assert after.get(page).extracted == {"links": ["x"]}
+    assert after.get(report).visits == 1
+    after.close()
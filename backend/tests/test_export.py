@@ -0,0 +1,261 @@
+"""
+Tests for the streaming bulk exports.
+
+Covers:
+  GET /api/v1/export/budget_lines
+  GET /api/v1/export/audits
+  GET /api/v1/export/loans
+in NDJSON, CSV and Parquet, and the batch-at-a-time encoding.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+
+import pytest
+from models import (
+    Audit,
+    BudgetLine,
+    DebtCategory,
+    Entity,
+    EntityType,
+    FiscalPeriod,
+    Loan,
+    Severity,
+)
+from sqlalchemy import select
+
+
+@pytest.fixture()
+def seed_export(db_session, seed_country, seed_source_doc):
+    national = Entity(
+        id=30,
+        country_id=seed_country.id,
+        type=EntityType.NATIONAL,
+        canonical_name="Government of Kenya",
+        slug="government-of-kenya",
+    )
+    county = Entity(
+        id=31,
+        country_id=seed_country.id,
+        type=EntityType.COUNTY,
+        canonical_name="Nairobi County",
+        slug="nairobi-county",
+    )
+    other = Entity(
+        id=32,
+        country_id=seed_country.id,
+        type=EntityType.COUNTY,
+        canonical_name="Mombasa County",
+        slug="mombasa-county",
+    )
+    fy24 = FiscalPeriod(
+        id=30,
+        country_id=seed_country.id,
+        label="FY2024/25",
+        start_date=datetime(2024, 7, 1),
+        end_date=datetime(2025, 6, 30),
+    )
+    fy23 = FiscalPeriod(
+        id=31,
+        country_id=seed_country.id,
+        label="FY2023/24",
+        start_date=datetime(2023, 7, 1),
+        end_date=datetime(2024, 6, 30),
+    )
+    db_session.add_all([national, county, other, fy24, fy23])
+    db_session.flush()
+
+    for i in range(5):
+        db_session.add(
+            BudgetLine(
+                entity_id=county.id if i < 3 else other.id,
+                period_id=fy24.id if i % 2 == 0 else fy23.id,
+                category=f"Category {i}",
+                allocated_amount=1_000_000 * (i + 1),
+                actual_spent=None if i == 4 else 500_000,
+                currency="KES",
+                source_document_id=seed_source_doc.id,
+            )
+        )
+    for i, (entity, period, severity, status) in enumerate(
+        [
+            (county, fy24, Severity.CRITICAL, "Unresolved"),
+            (county, fy23, Severity.WARNING, "Resolved"),
+            (county, fy24, Severity.INFO, "unresolved"),
+            (other, fy24, Severity.CRITICAL, "Unresolved"),
+        ]
+    ):
+        db_session.add(
+            Audit(
+                entity_id=entity.id,
+                period_id=period.id,
+                finding_text=f"Finding {i}",
+                severity=severity,
+                status=status,
+                source_document_id=seed_source_doc.id,
+                created_at=datetime(2025, 1, 1 + i),
+            )
+        )
+    for lender, category, outstanding, entity in [
+        ("World Bank", DebtCategory.EXTERNAL_MULTILATERAL, 900, national),
+        ("Domestic bonds", None, 700, national),
+        ("Contractors", DebtCategory.PENDING_BILLS, 500, national),
+        ("County bank", DebtCategory.OTHER, 100, county),
+    ]:
+        db_session.add(
+            Loan(
+                entity_id=entity.id,
+                lender=lender,
+                debt_category=category,
+                principal=outstanding * 2,
+                outstanding=outstanding,
+                issue_date=datetime(2020, 1, 1),
+                currency="KES",
+                source_document_id=seed_source_doc.id,
+            )
+        )
+    db_session.commit()
+
+
+def _ndjson(resp):
+    return [json.loads(line) for line in resp.text.splitlines()]
+
+
+class TestBudgetLines:
+    def test_ndjson_all_rows_in_id_order(self, client, seed_export):
+        resp = client.get("/api/v1/export/budget_lines")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="budget_lines.ndjson"' in resp.headers["content-disposition"]
+        rows = _ndjson(resp)
+        assert [r["category"] for r in rows] == [f"Category {i}" for i in range(5)]
+        assert rows[0]["entity_name"] == "Nairobi County"
+        assert rows[0]["period_label"] == "FY2024/25"
+        assert rows[0]["allocated_amount"] == 1_000_000.0
+        assert rows[4]["actual_spent"] is None
+
+    def test_entity_and_period_filters(self, client, seed_export):
+        rows = _ndjson(
+            client.get("/api/v1/export/budget_lines?entity_id=31&period_id=30")
+        )
+        assert [r["category"] for r in rows] == ["Category 0", "Category 2"]
+
+    def test_csv(self, client, seed_export):
+        resp = client.get("/api/v1/export/budget_lines?format=csv&entity_id=32")
+        assert resp.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(resp.text)))
+        assert [r["category"] for r in rows] == ["Category 3", "Category 4"]
+        assert rows[1]["actual_spent"] == ""
+
+    def test_csv_header_only_when_empty(self, client, seed_export):
+        resp = client.get("/api/v1/export/budget_lines?format=csv&entity_id=999")
+        assert resp.text.strip().startswith("id,entity_id,entity_name")
+        assert len(resp.text.strip().splitlines()) == 1
+
+    def test_unknown_format_rejected(self, client, seed_export):
+        assert client.get("/api/v1/export/budget_lines?format=xlsx").status_code == 422
+
+
+class TestAudits:
+    def test_newest_first_with_source(self, client, seed_export):
+        rows = _ndjson(client.get("/api/v1/export/audits"))
+        assert [r["finding_text"] for r in rows] == [
+            "Finding 3",
+            "Finding 2",
+            "Finding 1",
+            "Finding 0",
+        ]
+        assert rows[0]["severity"] == "critical"
+        assert rows[0]["source_title"] == "FY2024/25 Budget Estimates"
+
+    def test_list_endpoint_filters(self, client, seed_export):
+        rows = _ndjson(
+            client.get(
+                "/api/v1/export/audits",
+                params={
+                    "county_id": "001",
+                    "year": "FY2024/25",
+                    "status": "UNRESOLVED",
+                },
+            )
+        )
+        assert [r["finding_text"] for r in rows] == ["Finding 2", "Finding 0"]
+
+        rows = _ndjson(
+            client.get(
+                "/api/v1/export/audits?county_id=nairobi-county&severity=critical"
+            )
+        )
+        assert [r["finding_text"] for r in rows] == ["Finding 0"]
+
+    def test_unknown_severity_is_ignored(self, client, seed_export):
+        rows = _ndjson(client.get("/api/v1/export/audits?county_id=31&severity=bogus"))
+        assert len(rows) == 3
+
+    def test_unknown_county_is_404(self, client, seed_export):
+        assert client.get("/api/v1/export/audits?county_id=atlantis").status_code == 404
+
+
+class TestLoans:
+    def test_national_debt_excludes_pending_bills(self, client, seed_export):
+        rows = _ndjson(client.get("/api/v1/export/loans"))
+        assert [r["lender"] for r in rows] == ["World Bank", "Domestic bonds"]
+        assert rows[0]["debt_category"] == "external_multilateral"
+
+    def test_pending_bills_opt_in_and_entity(self, client, seed_export):
+        rows = _ndjson(client.get("/api/v1/export/loans?include_pending_bills=true"))
+        assert "Contractors" in [r["lender"] for r in rows]
+        rows = _ndjson(client.get("/api/v1/export/loans?entity_id=31"))
+        assert [r["lender"] for r in rows] == ["County bank"]
+
+    def test_empty_before_seeding(self, client, db_session):
+        resp = client.get("/api/v1/export/loans")
+        assert resp.status_code == 200
+        assert resp.text == ""
+
+
+class TestParquet:
+    def test_round_trip(self, client, seed_export):
+        pq = pytest.importorskip("pyarrow.parquet")
+        resp = client.get("/api/v1/export/loans?format=parquet")
+        assert resp.status_code == 200
+        table = pq.read_table(io.BytesIO(resp.content))
+        assert table.column("lender").to_pylist() == ["World Bank", "Domestic bonds"]
+        assert table.schema.field("outstanding").type == "double"
+
+    def test_one_row_group_per_batch(self, client, seed_export, monkeypatch):
+        pq = pytest.importorskip("pyarrow.parquet")
+        monkeypatch.setattr("routers.export.BATCH_SIZE", 2)
+        resp = client.get("/api/v1/export/budget_lines?format=parquet")
+        parquet = pq.ParquetFile(io.BytesIO(resp.content))
+        assert parquet.metadata.num_rows == 5
+        assert parquet.metadata.num_row_groups == 3
+        # The all-NULL batch keeps the declared type.
+        assert parquet.schema_arrow.field("actual_spent").type == "double"
+
+    def test_501_without_pyarrow(self, client, seed_export, monkeypatch):
+        import builtins
+
+        real_import = builtins.__import__
+
+        def no_pyarrow(name, *args, **kwargs):
+            if name.startswith("pyarrow"):
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_pyarrow)
+        resp = client.get("/api/v1/export/loans?format=parquet")
+        assert resp.status_code == 501
+
+
+def test_rows_are_encoded_one_batch_at_a_time(db_session, seed_export, monkeypatch):
+    from routers import export
+
+    monkeypatch.setattr(export, "BATCH_SIZE", 2)
+    stmt = select(BudgetLine.id).order_by(BudgetLine.id)
+    chunks = list(
+        export._ndjson_chunks([("id", "int")], export._batches(db_session, stmt))
+    )
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
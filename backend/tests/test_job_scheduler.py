@@ -0,0 +1,412 @@
+"""
+Tests for the unified job scheduler.
+
+Covers:
+  services.job_scheduler.enqueue (defaults, key coalescing)
+  services.job_scheduler.JobScheduler (due schedules, misfires, claim order,
+    retries, stale rows, per-class limits, leadership, worker mode and
+    memory-based draining)
+  services.job_scheduler.describe / get_job / recent_jobs
+  services.job_scheduler.Every / Calendar and SmartScheduler.next_due
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from models import QueuedJob
+from services import job_scheduler
+from services.job_scheduler import (
+    HANDLERS,
+    Calendar,
+    Every,
+    JobScheduler,
+    Schedule,
+    class_limits_from_env,
+    enqueue,
+    job,
+)
+
+NOW = datetime(2025, 6, 10, 12, 0)
+
+
+class Leader:
+    def __init__(self, leading=True):
+        self.leading = leading
+
+    def acquire(self):
+        return self.leading
+
+    def release(self):
+        pass
+
+
+@pytest.fixture()
+def scheduler(db_session):
+    lock = threading.Lock()
+
+    @contextmanager
+    def session():
+        # One shared test session; the scheduler's threads take turns.
+        with lock:
+            yield db_session
+
+    def make(schedules=(), **kwargs):
+        kwargs.setdefault("class_limits", {"network": 2, "cpu": 1, "db": 1})
+        kwargs.setdefault("leader", Leader())
+        kwargs.setdefault("poll_interval", 0.05)
+        kwargs.setdefault("clock", lambda: NOW)
+        sched = JobScheduler(schedules, session_factory=session, **kwargs)
+        sched.started_at = NOW
+        return sched
+
+    return make
+
+
+@pytest.fixture()
+def handlers():
+    saved = dict(HANDLERS)
+    yield HANDLERS
+    HANDLERS.clear()
+    HANDLERS.update(saved)
+
+
+def _rows(db):
+    return db.query(QueuedJob).order_by(QueuedJob.id).all()
+
+
+def test_class_limits_from_env(monkeypatch):
+    monkeypatch.setenv("SCHEDULER_CLASS_LIMITS", "network=5, cpu=2,gpu=4,db=x")
+    assert class_limits_from_env() == {"network": 5, "cpu": 2, "db": 1}
+
+
+def test_enqueue_uses_handler_defaults_and_coalesces_by_key(db_session, handlers):
+    job("t.parse", resource_class="cpu", priority=70, max_attempts=3)(lambda: None)
+
+    first = enqueue(db_session, "t.parse", {"doc": 1}, key="parse:1", run_at=NOW)
+    again = enqueue(db_session, "t.parse", {"doc": 1}, key="parse:1", run_at=NOW)
+    other = enqueue(db_session, "t.unknown", run_at=NOW)
+
+    assert again.id == first.id
+    assert (first.resource_class, first.priority, first.max_attempts) == ("cpu", 70, 3)
+    assert (other.resource_class, other.priority) == ("network", 50)
+    assert len(_rows(db_session)) == 2
+
+
+def test_concurrent_enqueue_of_one_key_returns_the_winning_row(
+    db_session, monkeypatch
+):
+    winner = enqueue(db_session, "seed.all", key="seed:all", priority=50, run_at=NOW)
+    # Another replica's row is not visible to this one's pre-insert check.
+    lookup = job_scheduler._active_for_key
+    calls = []
+
+    def racing_lookup(db, key):
+        calls.append(key)
+        return None if len(calls) == 1 else lookup(db, key)
+
+    monkeypatch.setattr(job_scheduler, "_active_for_key", racing_lookup)
+    loser = enqueue(db_session, "seed.all", key="seed:all", priority=80)
+
+    assert loser.id == winner.id and loser.priority == 80
+    assert len(_rows(db_session)) == 1
+
+
+def test_coalesced_queued_row_is_raised_to_a_higher_priority(db_session, scheduler):
+    scheduled = enqueue(db_session, "seed.all", key="seed:all", priority=90, run_at=NOW)
+    urgent = enqueue(db_session, "seed.all", key="seed:all", priority=100)
+    assert urgent.id == scheduled.id and urgent.priority == 100
+    assert enqueue(db_session, "seed.all", key="seed:all", priority=10).priority == 100
+
+    scheduler().claim(db_session, "network", NOW)
+    running = enqueue(db_session, "seed.all", key="seed:all", priority=120)
+    assert running.status == QueuedJob.RUNNING and running.priority == 100
+
+
+def test_claim_takes_highest_priority_due_row_of_its_class(db_session, scheduler):
+    sched = scheduler()
+    enqueue(db_session, "a", priority=10, run_at=NOW - timedelta(hours=1))
+    enqueue(db_session, "b", priority=90, run_at=NOW - timedelta(minutes=1))
+    enqueue(db_session, "c", priority=99, run_at=NOW + timedelta(hours=1))
+    enqueue(db_session, "d", priority=99, resource_class="cpu", run_at=NOW)
+
+    order = []
+    while True:
+        claimed = sched.claim(db_session, "network", NOW)
+        if claimed is None:
+            break
+        order.append(claimed.job)
+    assert order == ["b", "a"]  # "c" is not due yet, "d" is another class
+    running = [r for r in _rows(db_session) if r.status == QueuedJob.RUNNING]
+    assert {r.job for r in running} == {"a", "b"}
+    assert all(r.attempts == 1 and r.worker == sched.worker_id for r in running)
+
+
+def test_failed_job_is_retried_with_backoff_then_failed(db_session, scheduler):
+    sched = scheduler()
+    enqueue(db_session, "flaky", max_attempts=2, run_at=NOW)
+
+    claimed = sched.claim(db_session, "network", NOW)
+    status = sched.complete(db_session, claimed, error="boom", retry_delay=60)
+    row = _rows(db_session)[0]
+    assert status == QueuedJob.QUEUED and row.run_at == NOW + timedelta(seconds=60)
+
+    assert sched.claim(db_session, "network", NOW) is None  # backing off
+    later = NOW + timedelta(minutes=2)
+    claimed = sched.claim(db_session, "network", later)
+    assert sched.complete(db_session, claimed, error="boom") == QueuedJob.FAILED
+    assert _rows(db_session)[0].attempts == 2
+
+
+def test_stale_running_rows_are_requeued(db_session, scheduler):
+    sched = scheduler(stale_after=3600)
+    enqueue(db_session, "crawl", max_attempts=2, run_at=NOW - timedelta(hours=3))
+    sched.claim(db_session, "network", NOW - timedelta(hours=2))
+
+    assert sched.requeue_stale(db_session, NOW) == 1
+    row = _rows(db_session)[0]
+    assert row.status == QueuedJob.QUEUED and "abandoned" in row.error
+
+
+def test_finished_rows_are_pruned_after_retention(db_session, scheduler):
+    sched = scheduler(retention=7 * 86400)
+    for job_name, status, age in [
+        ("old-ok", QueuedJob.SUCCEEDED, 8),
+        ("old-failed", QueuedJob.FAILED, 10),
+        ("recent-ok", QueuedJob.SUCCEEDED, 2),
+        ("old-queued", QueuedJob.QUEUED, None),
+    ]:
+        row = enqueue(db_session, job_name, run_at=NOW - timedelta(days=30))
+        row.status = status
+        if age is not None:
+            row.finished_at = NOW - timedelta(days=age)
+    db_session.commit()
+
+    assert sched.prune_finished(db_session, NOW) == 2
+    assert [r.job for r in _rows(db_session)] == ["recent-ok", "old-queued"]
+    assert scheduler(retention=0).prune_finished(db_session, NOW) == 0
+
+
+def test_pruning_keeps_the_last_run_of_a_long_interval_schedule(
+    db_session, scheduler
+):
+    monthly = Schedule("s:monthly", "tick", Every(30 * 86400))
+    sched = scheduler([monthly], retention=14 * 86400)
+    for days_ago in (30, 0):
+        db_session.add(
+            QueuedJob(
+                job="tick",
+                key="s:monthly",
+                status=QueuedJob.SUCCEEDED,
+                run_at=NOW - timedelta(days=days_ago),
+                finished_at=NOW - timedelta(days=days_ago),
+            )
+        )
+    db_session.commit()
+
+    later = NOW + timedelta(days=15)
+    assert sched.prune_finished(db_session, later) == 1
+    assert [r.run_at for r in _rows(db_session)] == [NOW]
+    assert sched.enqueue_due(db_session, later) == []
+    assert sched.next_fire["s:monthly"] == NOW + timedelta(days=30)
+
+
+def test_due_schedules_are_enqueued_once(db_session, scheduler):
+    hourly = Schedule("s:hourly", "tick", Every(3600))
+    later = Schedule("s:later", "tick", Every(3600, first_delay=1800))
+    sched = scheduler([hourly, later])
+
+    assert len(sched.enqueue_due(db_session, NOW)) == 1
+    assert sched.enqueue_due(db_session, NOW) == []  # still queued
+    assert sched.next_fire["s:later"] == NOW + timedelta(minutes=30)
+
+    row = _rows(db_session)[0]
+    row.status = QueuedJob.SUCCEEDED
+    db_session.commit()
+    assert len(sched.enqueue_due(db_session, NOW + timedelta(minutes=59))) == 1
+    assert sched.next_fire["s:hourly"] == NOW + timedelta(hours=1)
+    assert len(sched.enqueue_due(db_session, NOW + timedelta(hours=1))) == 1
+
+
+def test_missed_runs_fire_once_after_downtime(db_session, scheduler):
+    sched = scheduler([Schedule("s:daily", "tick", Every(86400))], misfire_grace=3600)
+    db_session.add(
+        QueuedJob(
+            job="tick",
+            key="s:daily",
+            status=QueuedJob.SUCCEEDED,
+            run_at=NOW - timedelta(days=30),
+        )
+    )
+    db_session.commit()
+
+    sched.enqueue_due(db_session, NOW)
+    latest = _rows(db_session)[-1]
+    assert latest.run_at == NOW - timedelta(hours=1)
+    latest.status = QueuedJob.SUCCEEDED
+    db_session.commit()
+    assert sched.enqueue_due(db_session, NOW) == []
+
+
+def test_every_jitter_is_stable_per_key():
+    trigger = Every(3600, jitter=600)
+    a = trigger.next_after(NOW, NOW, "etl:cob:deep")
+    assert a == trigger.next_after(NOW, NOW, "etl:cob:deep")
+    assert abs((a - NOW).total_seconds() - 3600) <= 600
+
+
+def test_calendar_follows_smart_scheduler():
+    trigger = Calendar("treasury")
+    # June is Treasury budget season: checked daily.
+    first = trigger.next_after(None, NOW, "etl:treasury:light")
+    assert first == datetime(2025, 6, 11, 3, 0)
+    assert trigger.next_after(first, NOW, "etl:treasury:light") == datetime(
+        2025, 6, 12, 3, 0
+    )
+
+
+def test_smart_scheduler_next_due_matches_should_run():
+    sched = job_scheduler.smart_scheduler()
+    after = datetime(2025, 8, 1, 15, 30)
+    day, reason = sched.next_due("oag", after=after)
+    assert day is not None and day >= after.replace(hour=0, minute=0)
+    assert sched.should_run("oag", now=day) == (True, reason)
+    probe = after.replace(hour=0, minute=0)
+    while probe < day:
+        assert not sched.should_run("oag", now=probe)[0]
+        probe += timedelta(days=1)
+
+
+def test_scheduler_runs_jobs_within_class_limits(db_session, scheduler, handlers):
+    active = {"network": 0, "cpu": 0}
+    peak = {"network": 0, "cpu": 0}
+    done = []
+
+    def tracked(cls):
+        async def run(n):
+            active[cls] += 1
+            peak[cls] = max(peak[cls], active[cls])
+            await asyncio.sleep(0.02)
+            active[cls] -= 1
+            done.append((cls, n))
+            return {"n": n}
+
+        return run
+
+    job("t.fetch", resource_class="network")(tracked("network"))
+    job("t.parse", resource_class="cpu")(tracked("cpu"))
+    for n in range(5):
+        enqueue(db_session, "t.fetch", {"n": n}, run_at=NOW)
+    for n in range(3):
+        enqueue(db_session, "t.parse", {"n": n}, priority=n, run_at=NOW)
+
+    async def run():
+        sched = scheduler()
+        await sched.start()
+        for _ in range(200):
+            if len(done) == 8:
+                break
+            await asyncio.sleep(0.01)
+        await sched.stop()
+
+    asyncio.run(run())
+    assert peak == {"network": 2, "cpu": 1}
+    assert [n for cls, n in done if cls == "cpu"] == [2, 1, 0]  # priority order
+    rows = _rows(db_session)
+    assert all(r.status == QueuedJob.SUCCEEDED for r in rows)
+    assert rows[0].result == {"n": 0}
+
+
+def test_follower_does_not_run_jobs(db_session, scheduler, handlers):
+    job("t.fetch")(lambda: None)
+    enqueue(db_session, "t.fetch", run_at=NOW)
+    sched = scheduler(leader=Leader(leading=False))
+
+    assert asyncio.run(sched.tick()) == sched.poll_interval
+    assert not sched.is_leader
+    assert _rows(db_session)[0].status == QueuedJob.QUEUED
+
+
+def test_follower_worker_runs_jobs_but_not_schedules(db_session, scheduler, handlers):
+    done = []
+    job("t.fetch")(lambda n: done.append(n))
+    enqueue(db_session, "t.fetch", {"n": 1}, run_at=NOW)
+    hourly = Schedule("s:hourly", "t.fetch", Every(3600), args={"n": 2})
+
+    async def run():
+        sched = scheduler([hourly], leader=Leader(False), follower_executes=True)
+        await sched.start()
+        for _ in range(200):
+            if done:
+                break
+            await asyncio.sleep(0.01)
+        await sched.stop()
+
+    asyncio.run(run())
+    assert done == [1]
+    rows = _rows(db_session)
+    assert len(rows) == 1 and rows[0].status == QueuedJob.SUCCEEDED
+
+
+def test_worker_drains_once_over_its_memory_limit(
+    db_session, scheduler, handlers, monkeypatch
+):
+    monkeypatch.setattr(job_scheduler, "rss_mb", lambda: 900.0)
+    job("t.fetch")(lambda: None)
+    for _ in range(3):
+        enqueue(db_session, "t.fetch", run_at=NOW)
+
+    async def run():
+        sched = scheduler(class_limits={"network": 1}, max_rss_mb=512)
+        await sched.start()
+        await asyncio.wait_for(sched.drained.wait(), 5)
+        await sched.stop()
+        return sched
+
+    sched = asyncio.run(run())
+    assert sched.draining
+    statuses = [r.status for r in _rows(db_session)]
+    assert statuses.count(QueuedJob.SUCCEEDED) == 1
+    assert statuses.count(QueuedJob.QUEUED) == 2  # left for the next worker
+
+
+def test_worker_registers_cache_commit_invalidations(monkeypatch):
+    from cache import redis_cache
+
+    calls = []
+
+    class FakeScheduler:
+        worker_id = "w1"
+
+        def __init__(self, schedules, follower_executes=False):
+            self.drained = asyncio.Event()
+
+        async def start(self):
+            self.drained.set()
+
+        async def stop(self):
+            pass
+
+    monkeypatch.setattr(
+        redis_cache, "register_commit_invalidations", lambda: calls.append(1)
+    )
+    monkeypatch.setattr(job_scheduler, "JobScheduler", FakeScheduler)
+    monkeypatch.setattr(job_scheduler, "job_scheduler", None)
+    asyncio.run(job_scheduler.run_worker())
+    assert calls == [1]
+
+
+def test_job_status_lookups(db_session):
+    etl = enqueue(db_session, "etl.run", {"source_key": "cob"}, run_at=NOW)
+    enqueue(db_session, "seed.all", run_at=NOW)
+    newest = enqueue(db_session, "etl.cob_batch", run_at=NOW)
+
+    assert job_scheduler.get_job(db_session, str(etl.id)).id == etl.id
+    assert job_scheduler.get_job(db_session, "nope") is None
+    rows = job_scheduler.recent_jobs(db_session, prefix="etl.")
+    assert [r.id for r in rows] == [newest.id, etl.id]
+    view = job_scheduler.describe(etl)
+    assert view["job_id"] == str(etl.id) and view["status"] == QueuedJob.QUEUED
+    assert view["args"] == {"source_key": "cob"}
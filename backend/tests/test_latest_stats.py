@@ -0,0 +1,121 @@
+"""
+Tests for the latest population / GDP projection.
+
+Covers:
+  services.latest_stats.refresh_latest_stats
+  etl.database_loader.DatabaseLoader KNBS population / GDP loaders
+  GET /api/v1/counties (population / gdp fields)
+  GET /api/v1/economic/summary
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+from models import EntityLatestStats, GDPData, PopulationData
+from services.latest_stats import (
+    NATIONAL_KEY,
+    get_latest_stats,
+    latest_stats_map,
+    refresh_latest_stats,
+)
+
+
+@pytest.fixture()
+def seed_series(db_session, seed_entity):
+    """Two census years for one county plus national population and GDP."""
+    db_session.add_all(
+        [
+            PopulationData(entity_id=seed_entity.id, year=2009, total_population=3_100_000),
+            PopulationData(entity_id=seed_entity.id, year=2019, total_population=4_397_073),
+            PopulationData(entity_id=None, year=2019, total_population=47_564_296),
+            GDPData(entity_id=seed_entity.id, year=2022, gdp_value=Decimal("1.0e12")),
+            GDPData(
+                entity_id=None, year=2023, quarter="Q4", gdp_value=Decimal("3.9e12")
+            ),
+            GDPData(entity_id=None, year=2023, gdp_value=Decimal("14.1e12")),
+            GDPData(entity_id=None, year=2022, gdp_value=Decimal("13.4e12")),
+        ]
+    )
+    refresh_latest_stats(db_session)
+    db_session.commit()
+    return seed_entity
+
+
+class TestRefreshLatestStats:
+    def test_picks_latest_year_per_entity(self, db_session, seed_series):
+        stats = get_latest_stats(db_session, seed_series.id)
+        assert stats.population_year == 2019
+        assert stats.total_population == 4_397_073
+        assert stats.gdp_year == 2022
+
+    def test_national_row_prefers_annual_gdp(self, db_session, seed_series):
+        stats = get_latest_stats(db_session, None)
+        assert stats.entity_key == NATIONAL_KEY
+        assert stats.entity_id is None
+        assert stats.gdp_year == 2023
+        assert stats.gdp_quarter is None
+        assert stats.gdp_value == Decimal("14.1e12")
+
+    def test_partial_refresh_only_touches_given_entities(self, db_session, seed_series):
+        db_session.add(
+            PopulationData(entity_id=seed_series.id, year=2024, total_population=5_000_000)
+        )
+        db_session.add(
+            PopulationData(entity_id=None, year=2024, total_population=52_000_000)
+        )
+        refresh_latest_stats(db_session, [seed_series.id])
+        assert get_latest_stats(db_session, seed_series.id).population_year == 2024
+        assert get_latest_stats(db_session, None).population_year == 2019
+
+    def test_row_removed_when_source_rows_are_gone(self, db_session, seed_series):
+        db_session.query(GDPData).filter(GDPData.entity_id == seed_series.id).delete()
+        db_session.query(PopulationData).filter(
+            PopulationData.entity_id == seed_series.id
+        ).delete()
+        refresh_latest_stats(db_session, [seed_series.id])
+        assert latest_stats_map(db_session, [seed_series.id]) == {}
+        assert db_session.query(EntityLatestStats).count() == 1  # national
+
+
+class TestKnbsLoaders:
+    @pytest.fixture()
+    def loader(self, seed_entity, monkeypatch):
+        from etl.database_loader import DatabaseLoader
+
+        loader = DatabaseLoader("sqlite://")
+
+        async def ensure_entity_exists(entity_info, country_id):
+            return seed_entity.id
+
+        monkeypatch.setattr(loader, "ensure_entity_exists", ensure_entity_exists)
+        return loader
+
+    def test_population_and_gdp_loads_refresh_the_projection(
+        self, db_session, seed_series, loader
+    ):
+        item = {"entity": {"canonical_name": "Nairobi"}, "year": 2024}
+        asyncio.run(
+            loader._load_population_item(
+                db_session, {**item, "total_population": 5_000_000}, None, 1
+            )
+        )
+        asyncio.run(
+            loader._load_gdp_item(db_session, {**item, "gdp_value": 1.2e12}, None, 1)
+        )
+        stats = get_latest_stats(db_session, seed_series.id)
+        assert (stats.population_year, stats.total_population) == (2024, 5_000_000)
+        assert (stats.gdp_year, stats.gdp_value) == (2024, Decimal("1.2e12"))
+
+
+class TestReadersUseProjection:
+    def test_counties_list_reports_latest_population(self, client, seed_series):
+        counties = client.get("/api/v1/counties").json()
+        nairobi = next(c for c in counties if c["name"].startswith("Nairobi"))
+        assert nairobi["population"] == 4_397_073
+        assert nairobi["gdp"] == 1.0e12
+
+    def test_economic_summary_reads_national_row(self, client, seed_series):
+        data = client.get("/api/v1/economic/summary").json()
+        assert data["total_population"] == 47_564_296
+        assert data["total_gdp"] == 14.1e12
@@ -0,0 +1,75 @@
+"""
+Smoke run of the load benchmark (``scripts/load_bench.py``) at small scale.
+
+Every warm-up path must answer 200 against the benchmark dataset and stay
+within its SQL-statement budget. Latency is only gated by the full-scale
+CI benchmark step; here the point is catching N+1 query regressions and
+warm-up paths that no longer exist.
+"""
+
+import pytest
+from scripts.load_bench import (
+    DEFAULT_BUDGETS,
+    budget_for,
+    check_budgets,
+    load_budgets,
+    percentile,
+    run_endpoints,
+    seed_dataset,
+)
+
+
+@pytest.fixture()
+def bench_results(client, db_session):
+    from main import _WARMUP_PATHS, clear_all_caches
+
+    seed_dataset(db_session, counties=6, fiscal_years=3, audits_per_county_year=3)
+    engine = db_session.get_bind().engine
+    return run_endpoints(client, engine, _WARMUP_PATHS, 1, clear_all_caches)
+
+
+def test_budget_file_covers_every_warmup_path():
+    from main import _WARMUP_PATHS
+
+    budgets = load_budgets(DEFAULT_BUDGETS)
+    assert set(budgets["paths"]) == set(_WARMUP_PATHS)
+
+
+def test_warmup_paths_succeed_within_query_budgets(bench_results):
+    budgets = load_budgets(DEFAULT_BUDGETS)
+    query_only = {
+        "paths": {
+            r["path"]: {
+                "queries_cold": budget_for(budgets, r["path"])["queries_cold"],
+                "queries_warm": budget_for(budgets, r["path"])["queries_warm"],
+            }
+            for r in bench_results
+        }
+    }
+    assert check_budgets(bench_results, query_only) == []
+
+
+def test_check_budgets_reports_violations():
+    result = {
+        "path": "/x",
+        "statuses": [200],
+        "cold": {"p95_ms": 900.0},
+        "warm": {"p95_ms": 1.0},
+        "queries_cold": 12,
+        "queries_warm": 0,
+        "peak_rss_mb": 100.0,
+    }
+    budgets = {"default": {"cold_p95_ms": 500}, "paths": {"/x": {"queries_cold": 10}}}
+    failures = check_budgets([result], budgets)
+    assert failures == [
+        "/x: cold_p95_ms 900.0 > budget 500",
+        "/x: queries_cold 12 > budget 10",
+    ]
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) == 0.0
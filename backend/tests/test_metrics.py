@@ -0,0 +1,206 @@
+"""
+Tests for the Prometheus metrics in monitoring.instrumentation.
+
+Covers:
+  setup_prometheus / MetricsMiddleware (route-template labels, /metrics)
+  cache hit / miss / coalesced counts and single_flight
+  DB pool sampling and TimedQueuePool checkout timing
+  etl_stage
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+
+from cache.redis_cache import cached, single_flight
+from monitoring.instrumentation import etl_stage, pool_status, setup_prometheus
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture()
+def metrics_app(monkeypatch):
+    monkeypatch.setenv("ENABLE_METRICS", "true")
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id, "padding": "x" * 100}
+
+    engine = create_engine("sqlite://")
+    assert setup_prometheus(app, engine=engine)
+    return TestClient(app)
+
+
+class TestHttpMetrics:
+    def test_labels_by_route_template(self, metrics_app):
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = _sample("http_requests_total", **labels)
+        metrics_app.get("/items/1")
+        metrics_app.get("/items/2")
+        assert _sample("http_requests_total", **labels) == before + 2
+
+        body = metrics_app.get("/metrics").text
+        assert 'route="/items/{item_id}"' in body
+        assert "/items/1" not in body
+
+    def test_records_response_size(self, metrics_app):
+        labels = {"method": "GET", "route": "/items/{item_id}"}
+        before = _sample("http_response_size_bytes_count", **labels)
+        size = len(metrics_app.get("/items/3").content)
+        assert _sample("http_response_size_bytes_count", **labels) == before + 1
+        assert _sample("http_response_size_bytes_sum", **labels) >= size
+
+    def test_unmatched_paths_share_one_series(self, metrics_app):
+        labels = {"method": "GET", "route": "<unmatched>", "status": "404"}
+        before = _sample("http_requests_total", **labels)
+        metrics_app.get("/nope/1")
+        metrics_app.get("/nope/2")
+        assert _sample("http_requests_total", **labels) == before + 2
+
+    def test_disabled_without_env(self, monkeypatch):
+        monkeypatch.delenv("ENABLE_METRICS", raising=False)
+        app = FastAPI()
+        assert setup_prometheus(app) is False
+        assert TestClient(app).get("/metrics").status_code == 404
+
+
+class TestCacheMetrics:
+    def test_hit_and_miss_counted_per_prefix(self):
+        calls = []
+
+        @cached(ttl=60, key_prefix="test-metrics-hits")
+        async def load(n: int):
+            calls.append(n)
+            return {"n": n}
+
+        async def run():
+            await load(1)
+            await load(1)
+
+        before_hit = _sample(
+            "cache_requests_total", prefix="test-metrics-hits", result="hit"
+        )
+        before_miss = _sample(
+            "cache_requests_total", prefix="test-metrics-hits", result="miss"
+        )
+        asyncio.run(run())
+        assert calls == [1]
+        assert (
+            _sample("cache_requests_total", prefix="test-metrics-hits", result="hit")
+            == before_hit + 1
+        )
+        assert (
+            _sample("cache_requests_total", prefix="test-metrics-hits", result="miss")
+            == before_miss + 1
+        )
+
+    def test_concurrent_misses_are_coalesced(self):
+        calls = []
+
+        @cached(ttl=60, key_prefix="test-metrics-coalesce")
+        async def load(n: int):
+            calls.append(n)
+            await asyncio.sleep(0.05)
+            return {"n": n}
+
+        async def run():
+            return await asyncio.gather(*(load(7) for _ in range(5)))
+
+        before = _sample(
+            "cache_requests_total", prefix="test-metrics-coalesce", result="coalesced"
+        )
+        results = asyncio.run(run())
+        assert calls == [7]
+        assert results == [{"n": 7}] * 5
+        assert (
+            _sample(
+                "cache_requests_total",
+                prefix="test-metrics-coalesce",
+                result="coalesced",
+            )
+            == before + 4
+        )
+
+    def test_single_flight_propagates_errors_to_waiters(self):
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise ValueError("load failed")
+
+        async def run():
+            return await asyncio.gather(
+                single_flight("k", boom),
+                single_flight("k", boom),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_main_cached_counts_lookups(self):
+        from main import cached as endpoint_cached
+
+        @endpoint_cached("test-metrics-main", ttl=60)
+        async def endpoint(county_id: str = "001"):
+            return {"county": county_id}
+
+        before = _sample(
+            "cache_requests_total", prefix="test-metrics-main", result="hit"
+        )
+        asyncio.run(endpoint(county_id="001"))
+        asyncio.run(endpoint(county_id="001"))
+        assert (
+            _sample("cache_requests_total", prefix="test-metrics-main", result="hit")
+            == before + 1
+        )
+
+
+class TestPoolMetrics:
+    def test_pool_status_reports_checkouts(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=3
+        )
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            status = pool_status(engine)
+        assert status["checked_out"] == 1
+        assert status["max"] == 5
+        assert status["overflow"] == 0
+
+    def test_timed_pool_records_checkout(self, tmp_path):
+        from database import TimedQueuePool
+
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'timed.db'}", poolclass=TimedQueuePool
+        )
+        before = _sample("db_pool_checkout_seconds_count")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert _sample("db_pool_checkout_seconds_count") == before + 1
+
+
+class TestEtlStage:
+    def test_success_sets_last_success(self):
+        with etl_stage("test-pipeline", "discover"):
+            pass
+        labels = {"pipeline": "test-pipeline", "stage": "discover"}
+        assert (
+            _sample("etl_stage_duration_seconds_count", outcome="success", **labels)
+            >= 1
+        )
+        assert _sample("etl_last_success_timestamp", pipeline="test-pipeline") > 0
+
+    def test_failure_counts_and_reraises(self):
+        labels = {"pipeline": "test-failing", "stage": "ingest"}
+        before = _sample("etl_job_failures_total", **labels)
+        with pytest.raises(RuntimeError):
+            with etl_stage("test-failing", "ingest"):
+                raise RuntimeError("boom")
+        assert _sample("etl_job_failures_total", **labels) == before + 1
+        assert _sample("etl_last_success_timestamp", pipeline="test-failing") == 0
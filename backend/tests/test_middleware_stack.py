@@ -0,0 +1,182 @@
+"""
+Tests for the pure-ASGI middleware chain.
+
+Covers:
+  middleware.stack.install_middleware (order and headers of every layer)
+  middleware.http.RequestLogMiddleware / CacheHeadersMiddleware
+  scripts.middleware_bench (smoke run)
+"""
+
+import asyncio
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from middleware.stack import install_middleware
+
+REMOTE = ("10.9.8.7", 5555)
+
+
+def _app(**kwargs):
+    app = FastAPI()
+
+    @app.get("/api/v1/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id, "padding": "x" * 2000}
+
+    @app.get("/api/v1/fresh")
+    async def fresh():
+        from starlette.responses import JSONResponse
+
+        return JSONResponse({"ok": True}, headers={"Cache-Control": "no-store"})
+
+    @app.get("/api/v1/auth/me")
+    async def me():
+        return {"user": None}
+
+    @app.get("/api/v1/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="nope")
+
+    @app.get("/api/v1/boom")
+    async def boom():
+        raise RuntimeError("kaput")
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    kwargs.setdefault("cors_origins", ["https://app.example"])
+    install_middleware(app, **kwargs)
+    return app
+
+
+@pytest.fixture()
+def client():
+    return TestClient(_app(), client=REMOTE, raise_server_exceptions=False)
+
+
+class TestHeaders:
+    def test_success_carries_every_layer(self, client):
+        resp = client.get("/api/v1/items/1", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["cache-control"].startswith("public, max-age=60")
+        assert resp.headers["x-content-type-options"] == "nosniff"
+        assert resp.headers["x-frame-options"] == "DENY"
+        assert "x-process-time" in resp.headers
+        assert resp.headers["x-ratelimit-limit"] == "120"
+
+    def test_existing_cache_control_is_kept(self, client):
+        assert client.get("/api/v1/fresh").headers["cache-control"] == "no-store"
+
+    def test_no_cache_control_on_auth_or_errors(self, client):
+        assert "cache-control" not in client.get("/api/v1/auth/me").headers
+        assert "cache-control" not in client.get("/api/v1/missing").headers
+
+    def test_db_headers_follow_callable(self):
+        state = {"on": False}
+        app = _app(db_headers=lambda: state["on"])
+        client = TestClient(app, client=REMOTE)
+        assert "x-db-queries" not in client.get("/api/v1/items/1").headers
+        state["on"] = True
+        assert client.get("/api/v1/items/1").headers["x-db-queries"] == "0"
+
+    def test_preflight_skips_security_headers(self, client):
+        resp = client.options(
+            "/api/v1/items/1",
+            headers={
+                "Origin": "https://app.example",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["access-control-allow-origin"] == "https://app.example"
+        assert "x-frame-options" not in resp.headers
+
+
+class TestRateLimitPlacement:
+    def test_rejection_is_logged_and_has_security_headers(self, caplog):
+        client = TestClient(_app(rate_limit_calls=1), client=REMOTE)
+        client.get("/api/v1/items/1")
+        with caplog.at_level(logging.INFO):
+            resp = client.get(
+                "/api/v1/items/1", headers={"Origin": "https://app.example"}
+            )
+        assert resp.status_code == 429
+        assert resp.headers["x-frame-options"] == "DENY"
+        assert "x-process-time" in resp.headers
+        # Rejections happen outside CORS, as before the rewrite.
+        assert "access-control-allow-origin" not in resp.headers
+        assert any("'status_code': 429" in r.getMessage() for r in caplog.records)
+
+
+class TestRequestLogging:
+    def test_errors_are_logged_and_surface_as_500(self, client, caplog):
+        with caplog.at_level(logging.ERROR):
+            resp = client.get("/api/v1/boom")
+        assert resp.status_code == 500
+        assert any(
+            r.getMessage().startswith("ERROR GET") and "kaput" in r.getMessage()
+            for r in caplog.records
+        )
+
+    def test_client_errors_log_a_warning(self, client, caplog):
+        with caplog.at_level(logging.WARNING, logger="middleware.http"):
+            client.get("/api/v1/missing")
+        assert any(" - 404 - " in r.getMessage() for r in caplog.records)
+
+
+class TestStreaming:
+    def test_stream_is_not_buffered(self):
+        app = _app()
+        messages = []
+
+        async def run():
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": "1.1",
+                "method": "GET",
+                "scheme": "http",
+                "path": "/api/v1/stream",
+                "raw_path": b"/api/v1/stream",
+                "root_path": "",
+                "query_string": b"",
+                "headers": [(b"host", b"test")],
+                "client": REMOTE,
+                "server": ("test", 80),
+            }
+            sent = False
+
+            async def receive():
+                nonlocal sent
+                if not sent:
+                    sent = True
+                    return {"type": "http.request", "body": b"", "more_body": False}
+                await asyncio.Event().wait()
+
+            async def send(message):
+                messages.append(message)
+
+            await app(scope, receive, send)
+
+        asyncio.run(run())
+        bodies = [m["body"] for m in messages if m["type"] == "http.response.body"]
+        assert b"".join(bodies) == b"0\n1\n2\n"
+        assert len([b for b in bodies if b]) == 3
+
+
+def test_middleware_bench_smoke():
+    from scripts.middleware_bench import VARIANTS, run
+
+    report = run(requests=40, concurrency=8)
+    assert set(report["variants"]) == set(VARIANTS)
+    for result in report["variants"].values():
+        assert result["throughput_rps"] > 0
@@ -0,0 +1,229 @@
+"""
+Tests for concurrent Parliament DSpace ingestion.
+
+Covers:
+  etl.parliament_dspace_client.ParliamentDSpaceClient (next-page prefetch,
+    max_items cap, bounded parallel bitstream lookups, request pacing)
+  etl.parliament_pipeline.ParliamentPipeline (batched commits with
+    ON CONFLICT (dspace_uuid) DO NOTHING, failed batch isolation)
+
+The DSpace server is a fake ``_get``; the database is a file SQLite.
+"""
+
+import threading
+import time
+
+import pytest
+from etl.parliament_dspace_client import BitstreamInfo, ParliamentDSpaceClient
+from etl.parliament_pipeline import ParliamentPipeline
+from models import Base, ParliamentSourceDocument, SourceDocument
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover
+    return "TEXT"
+
+
+TITLE = "Report of the Auditor-General on Nairobi City County for the year 2021/2022"
+
+
+def _search_page(uuids, total_pages):
+    return {
+        "_embedded": {
+            "searchResult": {
+                "_embedded": {
+                    "objects": [
+                        {
+                            "_embedded": {
+                                "indexableObject": {
+                                    "type": "item",
+                                    "uuid": uuid,
+                                    "handle": f"123/{uuid}",
+                                    "name": TITLE,
+                                    "metadata": {"dc.title": [{"value": TITLE}]},
+                                }
+                            }
+                        }
+                        for uuid in uuids
+                    ]
+                },
+                "page": {"totalPages": total_pages},
+            }
+        }
+    }
+
+
+class FakeDSpace(ParliamentDSpaceClient):
+    """Serves ``pages`` (lists of item UUIDs) from the discovery endpoint."""
+
+    def __init__(self, pages, **kwargs):
+        kwargs.setdefault("request_delay", 0)
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.requested = []
+        self.page_requested = {i: threading.Event() for i in range(len(pages))}
+
+    def _get(self, endpoint, params=None):
+        page = params["page"]
+        self.requested.append(page)
+        self.page_requested[page].set()
+        return _search_page(self.pages[page], len(self.pages))
+
+
+def test_next_page_is_prefetched_while_the_current_one_is_processed():
+    client = FakeDSpace([["a1", "a2"], ["b1", "b2"], ["c1"]])
+    pages = client.discover_pages()
+
+    first = next(pages)
+    assert [item.uuid for item in first] == ["a1", "a2"]
+    assert client.page_requested[1].wait(2)  # fetched before we asked for it
+    assert [[i.uuid for i in p] for p in pages] == [["b1", "b2"], ["c1"]]
+    assert client.requested == [0, 1, 2]
+
+
+def test_max_items_stops_discovery_mid_page():
+    client = FakeDSpace([["a1", "a2"], ["b1", "b2"], ["c1"]], max_items=3)
+    assert [item.uuid for item in client.discover_items()] == ["a1", "a2", "b1"]
+    assert 2 not in client.requested
+
+
+def test_bitstream_lookups_run_in_parallel_up_to_the_limit():
+    client = FakeDSpace([], concurrency=3)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def get_bitstreams(uuid):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return [uuid]
+
+    client.get_bitstreams = get_bitstreams
+    result = client.get_bitstreams_many(f"u{i}" for i in range(8))
+    assert list(result) == [f"u{i}" for i in range(8)]
+    assert result["u5"] == ["u5"]
+    assert state["peak"] == 3
+
+
+def test_request_starts_are_paced_across_threads():
+    client = FakeDSpace([], request_delay=0.05)
+    starts = []
+
+    def paced(_):
+        client._throttle()
+        starts.append(time.monotonic())
+
+    client.map_concurrent(paced, range(4))
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.045
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'parliament.db'}")
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _pipeline(session, client, **kwargs):
+    return ParliamentPipeline(
+        db_session=session, client=client, min_confidence=0.0, **kwargs
+    )
+
+
+def test_items_are_committed_in_batches_and_races_cost_nothing(session_factory):
+    client = FakeDSpace([["a1", "a2", "a3"], ["b1", "b2"]])
+    original_discover = client.discover_pages
+
+    def discover_pages(**kwargs):
+        # Another writer inserts b1 after the dedup set was loaded.
+        with session_factory() as other:
+            pipeline = _pipeline(other, FakeDSpace([["b1"]]), batch_size=10)
+            assert pipeline.run(dry_run=False).items_inserted == 1
+        yield from original_discover(**kwargs)
+
+    client.discover_pages = discover_pages
+    commits = []
+    with session_factory() as session:
+        pipeline = _pipeline(session, client, batch_size=2)
+        commit_batch = pipeline._commit_batch
+
+        def record_commit(batch, stats):
+            commits.append([c.item.uuid for c in batch])
+            commit_batch(batch, stats)
+
+        pipeline._commit_batch = record_commit
+        stats = pipeline.run(dry_run=False)
+
+    assert commits == [["a1", "a2"], ["a3", "b1"], ["b2"]]
+    assert stats.items_discovered == 5
+    assert stats.items_inserted == 4
+    assert stats.items_skipped_duplicate == 1
+    assert stats.errors == []
+    with session_factory() as session:
+        uuids = session.execute(select(ParliamentSourceDocument.dspace_uuid))
+        assert sorted(uuids.scalars()) == ["a1", "a2", "a3", "b1", "b2"]
+        # The losing insert's source_document was removed with it.
+        assert session.query(SourceDocument).count() == 5
+
+
+def test_a_failed_batch_only_loses_itself(session_factory):
+    client = FakeDSpace([["a1", "a2"], ["b1", "b2"], ["c1"]])
+    with session_factory() as session:
+        pipeline = _pipeline(session, client, batch_size=2)
+        build_row = pipeline._parliament_row
+
+        def parliament_row(candidate, source_document_id):
+            if candidate.item.uuid == "b2":
+                raise RuntimeError("bad row")
+            return build_row(candidate, source_document_id)
+
+        pipeline._parliament_row = parliament_row
+        stats = pipeline.run(dry_run=False)
+
+    assert stats.items_inserted == 3
+    assert [e["phase"] for e in stats.errors] == ["commit"]
+    assert stats.errors[0]["uuids"] == ["b1", "b2"]
+    with session_factory() as session:
+        uuids = session.execute(select(ParliamentSourceDocument.dspace_uuid))
+        assert sorted(uuids.scalars()) == ["a1", "a2", "c1"]
+        assert session.query(SourceDocument).count() == 3
+
+
+def test_pdfs_are_fetched_per_page_in_dry_run(tmp_path):
+    client = FakeDSpace([["a1", "a2"]])
+    looked_up = []
+
+    def get_bitstreams_many(uuids):
+        uuids = list(uuids)
+        looked_up.append(uuids)
+        return {u: [] if u == "a2" else [_pdf(u)] for u in uuids}
+
+    client.get_bitstreams_many = get_bitstreams_many
+    pipeline = ParliamentPipeline(
+        client=client, min_confidence=0.0, download_pdfs=True, download_dir=tmp_path
+    )
+    stats = pipeline.run(dry_run=True)
+
+    assert looked_up == [["a1", "a2"]]
+    assert stats.pdfs_downloaded == 1
+    assert stats.items_inserted == 2
+
+
+def _pdf(uuid):
+    return BitstreamInfo(
+        uuid=f"bs-{uuid}",
+        name="report.pdf",
+        href=f"https://example.test/{uuid}",
+        mime_type="application/pdf",
+        size_bytes=10,
+    )
@@ -6,7 +6,14 @@ from typing import Iterator
 
 import httpx
 import pytest
-from models import Base, Country, Entity, EntityType, PopulationData
+from models import (
+    Base,
+    Country,
+    Entity,
+    EntityLatestStats,
+    EntityType,
+    PopulationData,
+)
 from seeding.config import SeedingSettings
 from seeding.domains.population import run as run_population_domain
 from seeding.types import DomainRunContext
@@ -150,6 +157,13 @@ def test_population_domain_persists_records(sqlite_session, http_mock, tmp_path)
     assert national.total_population == 54000000
     assert county.total_population == 4500000
 
+    latest = {
+        row.entity_key: row
+        for row in sqlite_session.execute(select(EntityLatestStats)).scalars()
+    }
+    assert latest[0].total_population == 54000000
+    assert latest[county.entity_id].population_id == county.id
+
 
 def test_population_domain_skips_unknown_entity(sqlite_session, http_mock, tmp_path):
     _bootstrap_entities(sqlite_session)
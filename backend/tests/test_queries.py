@@ -0,0 +1,144 @@
+"""
+Tests for the shared read-side query layer (``backend/queries``).
+
+Covers:
+  queries.memo.session_memo invalidation
+  queries.latest_executed_periods (batch) / latest_executed_period
+  queries.national_debt_loans / debt_outstanding_by_entity
+  routers.registry role selection
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+import queries
+from models import (
+    BudgetLine,
+    DebtCategory,
+    Entity,
+    EntityType,
+    FiscalPeriod,
+    Loan,
+)
+from queries.memo import session_memo
+from routers.registry import routers_for_role
+
+
+@pytest.fixture()
+def seed_periods(db_session, seed_country, seed_entity, seed_source_doc):
+    """Two fiscal years for one county; only the older one has spending."""
+    old = FiscalPeriod(
+        id=60,
+        country_id=seed_country.id,
+        label="FY2022/23",
+        start_date=datetime(2022, 7, 1),
+        end_date=datetime(2023, 6, 30),
+    )
+    new = FiscalPeriod(
+        id=61,
+        country_id=seed_country.id,
+        label="FY2023/24",
+        start_date=datetime(2023, 7, 1),
+        end_date=datetime(2024, 6, 30),
+    )
+    db_session.add_all([old, new])
+    for period, spent in ((old, 500), (new, 0)):
+        db_session.add(
+            BudgetLine(
+                entity_id=seed_entity.id,
+                period_id=period.id,
+                category="Health",
+                allocated_amount=Decimal(1000),
+                actual_spent=Decimal(spent),
+                currency="KES",
+                source_document_id=seed_source_doc.id,
+            )
+        )
+    db_session.commit()
+    return seed_entity.id
+
+
+@pytest.fixture()
+def seed_national_loans(db_session, seed_country, seed_source_doc):
+    nat = Entity(
+        id=900,
+        country_id=seed_country.id,
+        type=EntityType.NATIONAL,
+        canonical_name="National Government",
+        slug="national-government",
+    )
+    db_session.add(nat)
+    db_session.flush()
+    for lender, outstanding, category in (
+        ("World Bank", 300, None),
+        ("Eurobond", 700, DebtCategory.EXTERNAL_COMMERCIAL),
+        ("Contractors", 900, DebtCategory.PENDING_BILLS),
+    ):
+        db_session.add(
+            Loan(
+                entity_id=nat.id,
+                lender=lender,
+                principal=Decimal(outstanding),
+                outstanding=Decimal(outstanding),
+                issue_date=datetime(2020, 1, 1),
+                currency="KES",
+                debt_category=category,
+                source_document_id=seed_source_doc.id,
+            )
+        )
+    db_session.commit()
+    return nat.id
+
+
+class TestSessionMemo:
+    def test_computes_once_per_session(self, db_session):
+        calls = []
+        for _ in range(3):
+            session_memo(db_session, "k", lambda: calls.append(1) or len(calls))
+        assert calls == [1]
+
+    def test_commit_drops_memo(self, db_session):
+        assert session_memo(db_session, "k", lambda: "first") == "first"
+        db_session.commit()
+        assert session_memo(db_session, "k", lambda: "second") == "second"
+
+
+class TestPeriods:
+    def test_prefers_period_with_spending(self, db_session, seed_periods):
+        assert queries.latest_executed_period(db_session, seed_periods) == 60
+
+    def test_batch_skips_entities_without_lines(self, db_session, seed_periods):
+        assert queries.latest_executed_periods(db_session, [seed_periods, 12345]) == {
+            seed_periods: 60
+        }
+
+
+class TestDebt:
+    def test_national_loans_exclude_pending_bills(
+        self, db_session, seed_national_loans
+    ):
+        lenders = [l.lender for l in queries.national_debt_loans(db_session)]
+        assert lenders == ["Eurobond", "World Bank"]
+
+    def test_outstanding_by_entity(self, db_session, seed_national_loans):
+        totals = queries.debt_outstanding_by_entity(db_session, [seed_national_loans])
+        assert float(totals[seed_national_loans]) == 1000
+
+    def test_no_national_entity(self, db_session):
+        assert queries.national_debt_loans(db_session) == []
+
+
+class TestRouterRoles:
+    def test_public_role_excludes_etl_routers(self):
+        public = routers_for_role("public")
+        assert "routers.debt" in public
+        assert not {"routers.etl_jobs", "routers.etl_admin"} & set(public)
+
+    def test_admin_role_excludes_public_routers(self):
+        admin = routers_for_role("admin")
+        assert "routers.etl_jobs" in admin
+        assert "routers.debt" not in admin
+
+    def test_unknown_role_mounts_everything(self):
+        assert routers_for_role("bogus") == routers_for_role("all")
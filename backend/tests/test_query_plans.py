@@ -0,0 +1,192 @@
+"""
+Query-plan regression harness for the hot read endpoints.
+
+Each endpoint in ``HOT_ENDPOINTS`` is called through the test client
+while every SQL statement it issues is captured. Each statement is then
+re-planned with ``EXPLAIN`` on the same connection, and the test fails
+if any of them falls back to a full sequential scan of one of the large
+fact tables. On SQLite that is a ``SCAN <table>`` step with no index;
+on Postgres the plan is taken with ``enable_seqscan = off`` so a
+``Seq Scan`` node only survives when no usable index exists.
+
+Endpoints that legitimately aggregate a whole table (national totals)
+are not listed here: an index cannot help them.
+"""
+
+import json
+import re
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from models import (
+    Audit,
+    BudgetLine,
+    Entity,
+    EntityType,
+    FiscalPeriod,
+    GDPData,
+    Loan,
+    PopulationData,
+    Severity,
+)
+from services.latest_stats import refresh_latest_stats
+from sqlalchemy import event
+
+LARGE_TABLES = {"audits", "budget_lines", "loans", "population_data", "gdp_data"}
+
+# Mombasa County (code 047) is seeded as entity 21, fiscal period 40.
+HOT_ENDPOINTS = [
+    "/api/v1/counties/047/audits/list",
+    "/api/v1/counties/047/audits/list?status=pending",
+    "/api/v1/counties/047/budget",
+    "/api/v1/counties/047/debt",
+    "/api/v1/audit/findings?county_id=21",
+    "/api/v1/audit/findings?county_id=21&year=2023",
+    "/api/v1/entities/21/periods/40/budget_lines",
+    "/api/v1/counties/047",
+    "/api/v1/counties/047/comprehensive",
+    "/api/v1/audit/recurring",
+    "/api/v1/entities/21",
+]
+
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+
+
+@pytest.fixture()
+def seed_hot_county(db_session, seed_country, seed_source_doc):
+    """One county with rows in every large table."""
+    entity = Entity(
+        id=21,
+        country_id=seed_country.id,
+        type=EntityType.COUNTY,
+        canonical_name="Mombasa County",
+        slug="mombasa-county",
+    )
+    period = FiscalPeriod(
+        id=40,
+        country_id=seed_country.id,
+        label="FY2023/24",
+        start_date=datetime(2023, 7, 1),
+        end_date=datetime(2024, 6, 30),
+    )
+    db_session.add_all([entity, period])
+    db_session.flush()
+    for i, category in enumerate(["Health", "Education", "Roads"]):
+        db_session.add(
+            BudgetLine(
+                entity_id=entity.id,
+                period_id=period.id,
+                category=category,
+                allocated_amount=Decimal(1_000_000 * (i + 1)),
+                actual_spent=Decimal(800_000 * (i + 1)),
+                currency="KES",
+                source_document_id=seed_source_doc.id,
+            )
+        )
+        db_session.add(
+            Audit(
+                entity_id=entity.id,
+                period_id=period.id,
+                finding_text=f"Finding {i}",
+                severity=Severity.WARNING,
+                source_document_id=seed_source_doc.id,
+                query_type="Financial Irregularity",
+                amount=Decimal(100_000),
+                status="Pending",
+                audit_year=2022 + i,
+                follow_up_status="Recurring" if i == 0 else None,
+            )
+        )
+        db_session.add(
+            PopulationData(
+                entity_id=entity.id, year=2019 + i, total_population=1_200_000
+            )
+        )
+        db_session.add(
+            GDPData(entity_id=entity.id, year=2020 + i, gdp_value=Decimal(5e10))
+        )
+    db_session.add(
+        Loan(
+            entity_id=entity.id,
+            lender="World Bank",
+            principal=Decimal(1e9),
+            outstanding=Decimal(5e8),
+            issue_date=datetime(2020, 1, 1),
+            currency="KES",
+            source_document_id=seed_source_doc.id,
+        )
+    )
+    refresh_latest_stats(db_session)
+    db_session.commit()
+
+
+def _capture_statements(db_session, client, path):
+    """Return ``[(statement, parameters), ...]`` issued while serving *path*."""
+    captured = []
+
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        resp = client.get(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+    assert resp.status_code == 200, (path, resp.text)
+    return captured
+
+
+def _sequential_scans(db_session, statement, parameters):
+    """Return the large tables *statement* would read with a sequential scan."""
+    connection = db_session.connection()
+    dbapi = connection.connection.dbapi_connection
+    cursor = dbapi.cursor()
+    try:
+        if connection.dialect.name == "postgresql":
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return _pg_seq_scans(plan[0]["Plan"])
+        cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+        scans = set()
+        for row in cursor.fetchall():
+            match = _SQLITE_SCAN.match(row[-1])
+            if match and match.group(1) in LARGE_TABLES:
+                scans.add(match.group(1))
+        return scans
+    finally:
+        cursor.close()
+
+
+def _pg_seq_scans(node):
+    scans = set()
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES:
+        scans.add(node["Relation Name"])
+    for child in node.get("Plans", ()):
+        scans |= _pg_seq_scans(child)
+    return scans
+
+
+@pytest.mark.parametrize("path", HOT_ENDPOINTS)
+def test_hot_endpoint_avoids_sequential_scans(client, db_session, seed_hot_county, path):
+    statements = _capture_statements(db_session, client, path)
+    assert statements, f"{path} issued no SELECTs"
+    offenders = {}
+    for statement, parameters in statements:
+        scans = _sequential_scans(db_session, statement, parameters)
+        if scans:
+            offenders[statement] = sorted(scans)
+    assert not offenders, f"{path} sequentially scans: {offenders}"
+
+
+def test_harness_detects_unindexed_scan(db_session, seed_hot_county):
+    """Guard the harness itself: filtering on an unindexed column must trip it."""
+    scans = _sequential_scans(
+        db_session, "SELECT id FROM budget_lines WHERE notes = ?", ("x",)
+    )
+    assert scans == {"budget_lines"}
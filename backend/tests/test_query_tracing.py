@@ -0,0 +1,99 @@
+"""
+Tests for per-request SQL accounting (``monitoring/query_tracing.py``).
+
+Covers:
+  fingerprint normalisation
+  X-DB-Queries / X-DB-Time headers (non-production only)
+  db_queries_per_request histogram labelled by route template
+  sampled slow-query log
+"""
+
+import logging
+
+from monitoring import query_tracing
+from monitoring.instrumentation import db_queries_per_request
+from sqlalchemy import text
+
+
+class TestFingerprint:
+    def test_literals_and_placeholders_collapse(self):
+        a, ha = query_tracing.fingerprint(
+            "SELECT * FROM audits WHERE entity_id = 5 AND status = 'Pending'"
+        )
+        b, hb = query_tracing.fingerprint(
+            "SELECT *  FROM audits\nWHERE entity_id = %(entity_id_1)s AND status = ?"
+        )
+        assert a == "SELECT * FROM audits WHERE entity_id = ? AND status = ?"
+        assert ha == hb and a == b
+
+    def test_in_lists_of_any_length_share_a_fingerprint(self):
+        short = query_tracing.fingerprint("SELECT id FROM loans WHERE id IN (?, ?)")
+        long_ = query_tracing.fingerprint(
+            "SELECT id FROM loans WHERE id IN ($1, $2, $3, $4)"
+        )
+        assert short == long_
+        assert short[0].endswith("IN (...)")
+
+    def test_postgres_casts_are_kept(self):
+        sql, _ = query_tracing.fingerprint("SELECT meta::text FROM entities")
+        assert sql == "SELECT meta::text FROM entities"
+
+
+class TestRequestStats:
+    def test_queries_are_attributed_to_the_open_scope(self, db_session):
+        token = query_tracing.start_request("/x")
+        db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 2"))
+        stats = query_tracing.finish_request(token)
+        assert stats.queries == 2
+        assert stats.db_time >= 0
+        assert len(stats.slowest) == 2
+        assert query_tracing.current_stats() is None
+
+    def test_no_scope_outside_requests(self, db_session):
+        db_session.execute(text("SELECT 1"))
+        assert query_tracing.current_stats() is None
+
+
+class TestHeaders:
+    def test_headers_outside_production(self, client, seed_entity, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main.settings, "ENVIRONMENT", "development")
+        resp = client.get("/api/v1/entities/1")
+        assert resp.status_code == 200
+        assert int(resp.headers["X-DB-Queries"]) >= 1
+        assert float(resp.headers["X-DB-Time"]) >= 0
+
+    def test_no_headers_in_production(self, client, seed_entity, monkeypatch):
+        import main
+
+        monkeypatch.setattr(main.settings, "ENVIRONMENT", "production")
+        resp = client.get("/api/v1/entities/1")
+        assert "X-DB-Queries" not in resp.headers
+        assert "X-DB-Time" not in resp.headers
+
+    def test_histogram_uses_route_template(self, client, seed_entity):
+        client.get("/api/v1/entities/1")
+        labels = {
+            sample.labels.get("route")
+            for metric in db_queries_per_request.collect()
+            for sample in metric.samples
+        }
+        assert "/api/v1/entities/{entity_id}" in labels
+        assert "/api/v1/entities/1" not in labels
+
+
+def test_slow_query_log_is_sampled(db_session, monkeypatch, caplog):
+    monkeypatch.setattr(query_tracing, "SLOW_QUERY_MS", 0.0)
+    caplog.set_level(logging.WARNING, logger="monitoring.query_tracing")
+
+    monkeypatch.setattr(query_tracing, "SLOW_QUERY_SAMPLE_RATE", 0.0)
+    db_session.execute(text("SELECT 42"))
+    assert not caplog.records
+
+    monkeypatch.setattr(query_tracing, "SLOW_QUERY_SAMPLE_RATE", 1.0)
+    db_session.execute(text("SELECT 42"))
+    assert len(caplog.records) == 1
+    assert "SELECT ?" in caplog.records[0].getMessage()
+    assert "42" not in caplog.records[0].getMessage().split(": ", 1)[1]
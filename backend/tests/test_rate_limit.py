@@ -0,0 +1,229 @@
+"""
+Tests for token-bucket rate limiting.
+
+Covers:
+  middleware.rate_limit.TokenBucketLimiter / route_cost
+  middleware.rate_limit.RedisTokenBucketLimiter (needs a reachable Redis)
+  middleware.security.RateLimitMiddleware (429 + Retry-After, exemptions)
+  middleware.security.RedisRateLimitMiddleware (memory fallback, Redis retry)
+"""
+
+import asyncio
+import os
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from middleware.rate_limit import (
+    Decision,
+    RedisTokenBucketLimiter,
+    TokenBucketLimiter,
+    route_cost,
+)
+from middleware.security import RateLimitMiddleware, RedisRateLimitMiddleware
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketLimiter:
+    def test_allows_capacity_then_rejects(self):
+        limiter = TokenBucketLimiter(3, 60, clock=FakeClock())
+        assert [limiter.hit("a").allowed for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+
+    def test_refills_continuously(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(60, 60, clock=clock)  # 1 token / s
+        for _ in range(60):
+            limiter.hit("a")
+        denied = limiter.hit("a")
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(1.0)
+
+        clock.now += 1.0
+        assert limiter.hit("a").allowed
+        assert not limiter.hit("a").allowed
+
+    def test_window_does_not_reset_on_each_hit(self):
+        # INCR+EXPIRE pushed the expiry forward on every request, so a
+        # client polling steadily was never released. A bucket refills.
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(2, 10, clock=clock)
+        limiter.hit("a")
+        limiter.hit("a")
+        for _ in range(4):
+            clock.now += 5.0  # one token per 5 s
+            assert limiter.hit("a").allowed
+
+    def test_costs_spend_more_budget(self):
+        limiter = TokenBucketLimiter(10, 60, clock=FakeClock())
+        assert limiter.hit("a", cost=5).allowed
+        assert limiter.hit("a", cost=5).allowed
+        assert not limiter.hit("a", cost=1).allowed
+
+    def test_cost_above_capacity_is_clamped(self):
+        limiter = TokenBucketLimiter(3, 60, clock=FakeClock())
+        assert limiter.hit("a", cost=10).allowed
+
+    def test_keys_are_independent(self):
+        limiter = TokenBucketLimiter(1, 60, clock=FakeClock())
+        assert limiter.hit("a").allowed
+        assert limiter.hit("b").allowed
+        assert not limiter.hit("a").allowed
+
+    def test_memory_is_bounded_lru(self):
+        limiter = TokenBucketLimiter(1, 60, max_keys=3, clock=FakeClock())
+        for key in ("a", "b", "c"):
+            limiter.hit(key)
+        limiter.hit("a")  # touch a; b is now least recent
+        limiter.hit("d")
+        assert len(limiter) == 3
+        assert limiter.hit("b").allowed  # evicted, starts full again
+        assert not limiter.hit("a").allowed
+
+
+class TestRouteCost:
+    @pytest.mark.parametrize(
+        "path,cost",
+        [
+            ("/api/v1/counties", 1),
+            ("/api/v1/search", 5),
+            ("/api/v1/counties/001/audits/list", 3),
+            ("/api/v1/counties/001/audits", 1),
+            ("/api/v1/documents/upload", 10),
+        ],
+    )
+    def test_default_table(self, path, cost):
+        assert route_cost(path) == cost
+
+    def test_custom_table(self):
+        assert route_cost("/x/heavy", [(r"^/x/heavy$", 7)]) == 7
+        assert route_cost("/x/light", [(r"^/x/heavy$", 7)]) == 1
+
+
+def _app(calls=2):
+    app = FastAPI()
+
+    @app.get("/api/v1/items")
+    def items():
+        return {"ok": True}
+
+    @app.get("/api/v1/search")
+    def search():
+        return {"ok": True}
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitMiddleware, calls=calls, period=60)
+    return app
+
+
+class TestRateLimitMiddleware:
+    def test_over_limit_returns_429_with_retry_after(self):
+        client = TestClient(_app(), client=("10.0.0.1", 1234))
+        assert client.get("/api/v1/items").status_code == 200
+        assert client.get("/api/v1/items").status_code == 200
+        response = client.get("/api/v1/items")
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert "Rate limit exceeded" in response.json()["detail"]
+
+    def test_reports_remaining_budget(self):
+        client = TestClient(_app(calls=10), client=("10.0.0.2", 1234))
+        response = client.get("/api/v1/items")
+        assert response.headers["X-RateLimit-Limit"] == "10"
+        assert response.headers["X-RateLimit-Remaining"] == "9"
+        response = client.get("/api/v1/search")
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+
+    def test_loopback_and_health_are_exempt(self):
+        local = TestClient(_app(calls=1), client=("127.0.0.1", 1234))
+        assert all(local.get("/api/v1/items").status_code == 200 for _ in range(3))
+        remote = TestClient(_app(calls=1), client=("10.0.0.3", 1234))
+        assert all(remote.get("/health").status_code == 200 for _ in range(3))
+
+
+class FlakyRedisLimiter:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def hit(self, key, cost=1):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("redis down")
+        return Decision(True, 42.0, 0.0)
+
+
+def _redis_middleware(limiter, retry_seconds):
+    middleware = RedisRateLimitMiddleware(
+        None, calls=5, redis_retry_seconds=retry_seconds
+    )
+    middleware.redis_client = object()
+    middleware.redis_limiter = limiter
+    middleware.use_redis = True
+    return middleware
+
+
+class TestRedisRateLimitMiddleware:
+    def test_redis_error_falls_back_to_memory_until_retry(self):
+        limiter = FlakyRedisLimiter(failures=1)
+        middleware = _redis_middleware(limiter, retry_seconds=60)
+        assert int(asyncio.run(middleware._check("10.0.0.4", 1)).remaining) == 4
+        assert int(asyncio.run(middleware._check("10.0.0.4", 1)).remaining) == 3
+        assert limiter.calls == 1 and middleware.use_redis
+
+    def test_redis_is_used_again_after_a_failure(self):
+        limiter = FlakyRedisLimiter(failures=1)
+        middleware = _redis_middleware(limiter, retry_seconds=0)
+        assert int(asyncio.run(middleware._check("10.0.0.5", 1)).remaining) == 4
+        assert int(asyncio.run(middleware._check("10.0.0.5", 1)).remaining) == 42
+        assert limiter.calls == 2
+
+
+def _redis_client():
+    url = os.getenv("REDIS_URL")
+    if not url:
+        return None
+    try:
+        import redis
+
+        redis.from_url(url, socket_connect_timeout=1).ping()
+    except Exception:
+        return None
+    import redis.asyncio as aioredis
+
+    return aioredis.from_url(url, decode_responses=True)
+
+
+@pytest.mark.skipif(_redis_client() is None, reason="Redis not reachable")
+def test_redis_limiter_is_shared_and_atomic():
+    async def run():
+        client = _redis_client()
+        try:
+            key = f"test-{uuid.uuid4().hex}"
+            first = RedisTokenBucketLimiter(client, 5, 60, prefix="test_rate")
+            second = RedisTokenBucketLimiter(client, 5, 60, prefix="test_rate")
+            results = await asyncio.gather(
+                *(limiter.hit(key) for limiter in [first, second] * 5)
+            )
+            assert sum(r.allowed for r in results) == 5
+            assert await client.pttl(f"test_rate:{key}") > 0
+            await client.delete(f"test_rate:{key}")
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
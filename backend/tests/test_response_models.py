@@ -74,7 +74,7 @@ def test_budget_line_response():
 
 def test_etl_job_response():
     """ETLJobResponse should handle job metadata."""
-    from main import ETLJobResponse
+    from routers.etl_jobs import ETLJobResponse
 
     ejr = ETLJobResponse(
         job_id="abc-123",
@@ -0,0 +1,152 @@
+"""Tests for checkpointed, resumable seeding runs.
+
+Covers:
+  seeding.checkpoint.Checkpoint (per-unit commits, stash reuse)
+  seeding.cli.run_seed_command with ``--resume <job_id>``
+"""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from models import Base, Country, IngestionJob, IngestionStatus
+from seeding import cli
+from seeding.checkpoint import Checkpoint
+from seeding.config import SeedingSettings
+from seeding.registries import REGISTRY
+from seeding.types import DomainRunResult
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover
+    return "TEXT"
+
+
+UNITS = ["KEN", "UGA", "TZA"]
+
+
+@pytest.fixture()
+def session_factory(tmp_path, monkeypatch) -> Iterator[sessionmaker]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(cli, "SessionLocal", factory)
+    monkeypatch.setattr(cli, "_refresh_derived_snapshots", lambda s, d: None)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture()
+def settings(tmp_path) -> SeedingSettings:
+    settings = SeedingSettings(
+        storage_path=tmp_path / "storage",
+        cache_path=tmp_path / "cache",
+        log_path=tmp_path / "logs" / "seed.log",
+        domain_timeout_seconds=60,
+    )
+    settings.ensure_directories()
+    return settings
+
+
+@pytest.fixture()
+def unit_domain():
+    """A domain that commits one Country per unit and can fail on one."""
+    state = {"fail_on": None, "fetches": 0}
+
+    def run(session, settings, context):
+        checkpoint = context.checkpoint
+
+        def fetch():
+            state["fetches"] += 1
+            return UNITS
+
+        processed = 0
+        for iso in checkpoint.pending(checkpoint.stash("units", fetch)):
+            if iso == state["fail_on"]:
+                raise RuntimeError(f"timed out on {iso}")
+            session.add(_country(iso))
+            checkpoint.commit(iso, processed=1, created=1)
+            processed += 1
+        return DomainRunResult(
+            domain="t_units", items_processed=processed, items_created=processed
+        )
+
+    REGISTRY.register("t_units", run)
+    yield state
+    REGISTRY._handlers.pop("t_units", None)
+    REGISTRY._depends_on.pop("t_units", None)
+
+
+def _country(iso):
+    return Country(
+        iso_code=iso,
+        name=iso,
+        currency="KES",
+        timezone="Africa/Nairobi",
+        default_locale="en-KE",
+    )
+
+
+def _seed(settings, *argv):
+    args = cli.build_parser().parse_args(["seed", *argv])
+    return cli.run_seed_command(args, settings)
+
+
+def test_failed_run_keeps_committed_units_and_resumes(
+    session_factory, settings, unit_domain
+):
+    unit_domain["fail_on"] = "TZA"
+    assert _seed(settings, "--domain", "t_units", "--no-dry-run") == 1
+
+    with session_factory() as session:
+        job = session.execute(select(IngestionJob)).scalar_one()
+        assert job.status == IngestionStatus.FAILED
+        assert job.meta["checkpoint"]["completed"] == ["KEN", "UGA"]
+        assert job.items_processed == 2
+        countries = session.execute(select(Country.iso_code)).scalars().all()
+        assert sorted(countries) == ["KEN", "UGA"]
+        job_id = job.id
+
+    unit_domain["fail_on"] = None
+    assert _seed(settings, "--resume", str(job_id)) == 0
+
+    with session_factory() as session:
+        job = session.get(IngestionJob, job_id)
+        assert job.status == IngestionStatus.COMPLETED
+        assert job.items_processed == 3 and job.items_created == 3
+        assert len(job.meta["resumed_at"]) == 1
+        assert session.query(Country).count() == 3
+        assert session.query(IngestionJob).count() == 1
+    assert unit_domain["fetches"] == 1  # the stashed unit list was reused
+    assert not list((settings.cache_path / "checkpoints").glob("*.json"))
+
+
+def test_resume_rejects_unknown_or_mismatched_jobs(
+    session_factory, settings, unit_domain
+):
+    assert _seed(settings, "--resume", "999") == 1
+    with session_factory() as session:
+        job = IngestionJob(domain="t_units", status=IngestionStatus.FAILED, meta={})
+        session.add(job)
+        session.commit()
+        job_id = job.id
+    assert _seed(settings, "--resume", str(job_id), "--domain", "audits") == 1
+
+
+def test_dry_run_checkpoint_does_not_commit(session_factory):
+    with session_factory() as session:
+        job = IngestionJob(domain="t", status=IngestionStatus.RUNNING, meta={})
+        session.add(job)
+        session.commit()
+        checkpoint = Checkpoint(session, job, dry_run=True)
+        session.add(_country("KEN"))
+        checkpoint.commit("KEN", processed=1)
+        assert checkpoint.done("KEN")
+        session.rollback()
+        assert session.query(Country).count() == 0
+        assert "checkpoint" not in (session.get(IngestionJob, job.id).meta or {})
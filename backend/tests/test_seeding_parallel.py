@@ -0,0 +1,151 @@
+"""Tests for dependency-ordered, parallel ``seed`` runs.
+
+Covers:
+  seeding.registries.DomainRegistry (declared dependencies, plan, cycles)
+  seeding.cli.run_seed_command with worker processes (ordering, overlap,
+    connection budget, critical-path summary)
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from models import Base, IngestionJob, IngestionStatus
+from seeding import cli
+from seeding.config import SeedingSettings
+from seeding.registries import REGISTRY, DomainRegistry
+from seeding.types import DomainRunResult
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):  # pragma: no cover
+    return "TEXT"
+
+
+def _noop(session, settings, context):
+    return None
+
+
+def test_plan_puts_selected_dependencies_first():
+    registry = DomainRegistry()
+    registry.register("budget", _noop)
+    registry.register("summary", _noop, depends_on=("budget", "bootstrap"))
+    registry.register("audits", _noop, depends_on=("budget",))
+    registry.register("population", _noop)
+
+    assert registry.plan(["summary", "population", "audits", "budget"]) == [
+        "budget",
+        "summary",
+        "population",
+        "audits",
+    ]
+    # Dependencies outside the selection count as satisfied.
+    assert registry.plan(["summary"]) == ["summary"]
+
+
+def test_plan_rejects_cycles():
+    registry = DomainRegistry()
+    registry.register("a", _noop, depends_on=("b",))
+    registry.register("b", _noop, depends_on=("a",))
+    with pytest.raises(ValueError, match="cycle: a -> b -> a"):
+        registry.plan(["a", "b"])
+
+
+def test_builtin_dependencies_are_acyclic():
+    from seeding.registries import load_builtin_domains
+
+    load_builtin_domains()
+    order = REGISTRY.plan(REGISTRY.domains())
+    assert order.index("national_budget") < order.index("fiscal_summary")
+    assert order.index("counties_budget") < order.index("audits")
+
+
+def test_parallel_workers_respect_connection_budget(tmp_path):
+    settings = SeedingSettings(
+        storage_path=tmp_path, parallel_domains=6, db_connection_budget=5
+    )
+    assert cli._parallel_workers(settings, 10, None) == 2
+    assert cli._parallel_workers(settings, 10, 1) == 1
+    assert cli._parallel_workers(settings, 1, None) == 1
+
+
+@pytest.fixture()
+def timed_domains(tmp_path, monkeypatch):
+    """Domains that log their start/end to a file: b after a; c independent."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(cli, "SessionLocal", factory)
+    monkeypatch.setattr(cli, "_refresh_derived_snapshots", lambda s, d: None)
+    published = []
+    monkeypatch.setattr(cli, "_publish_snapshots", published.append)
+    trace = tmp_path / "trace.jsonl"
+
+    def make(name, seconds):
+        def run(session, settings, context):
+            started = time.time()
+            time.sleep(seconds)
+            with trace.open("a") as handle:
+                handle.write(json.dumps([name, started, time.time()]) + "\n")
+            return DomainRunResult(domain=name, items_processed=1)
+
+        return run
+
+    REGISTRY.register("t_a", make("t_a", 0.3))
+    REGISTRY.register("t_b", make("t_b", 0.1), depends_on=("t_a",))
+    REGISTRY.register("t_c", make("t_c", 0.3))
+    yield factory, trace, published
+    for name in ("t_a", "t_b", "t_c"):
+        REGISTRY._handlers.pop(name, None)
+        REGISTRY._depends_on.pop(name, None)
+    engine.dispose()
+
+
+def test_independent_domains_run_concurrently_after_dependencies(
+    tmp_path, timed_domains
+):
+    factory, trace, published = timed_domains
+    settings = SeedingSettings(
+        storage_path=tmp_path / "storage",
+        cache_path=tmp_path / "cache",
+        parallel_domains=3,
+        db_connection_budget=8,
+    )
+    settings.ensure_directories()
+    args = cli.build_parser().parse_args(
+        ["seed", "--domain", "t_b", "--domain", "t_c", "--domain", "t_a"]
+    )
+    assert cli.run_seed_command(args, settings) == 0
+
+    spans = {name: (start, end) for name, start, end in map(json.loads, trace.open())}
+    assert spans["t_b"][0] >= spans["t_a"][1]  # dependency finished first
+    assert spans["t_c"][0] < spans["t_a"][1]  # independent domain overlapped
+    with factory() as session:
+        jobs = session.query(IngestionJob).all()
+        assert {j.domain for j in jobs} == {"t_a", "t_b", "t_c"}
+        assert all(j.status == IngestionStatus.COMPLETED for j in jobs)
+    # Snapshots are published once, by the parent, after the whole DAG.
+    assert len(published) == 1 and sorted(published[0]) == ["t_a", "t_b", "t_c"]
+
+
+def test_critical_path_follows_the_longest_dependency_chain(monkeypatch):
+    monkeypatch.setitem(REGISTRY._depends_on, "t_b", ("t_a",))
+    t0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def ran(name, seconds):
+        return 0, DomainRunResult(
+            domain=name, started_at=t0, finished_at=t0 + timedelta(seconds=seconds)
+        )
+
+    outcomes = {"t_a": ran("t_a", 30), "t_b": ran("t_b", 20), "t_c": ran("t_c", 40)}
+    assert cli._critical_path(["t_a", "t_b", "t_c"], outcomes) == (
+        50.0,
+        ["t_a", "t_b"],
+    )
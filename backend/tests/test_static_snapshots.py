@@ -0,0 +1,317 @@
+"""
+Tests for the static snapshot publisher and its serving middleware.
+
+Covers:
+  services.static_snapshots (render, versioned write, atomic switch,
+    pruning, S3 mirror, SnapshotStore reloads, encoding negotiation)
+  middleware.snapshots.StaticSnapshotMiddleware
+  GET /api/v1/snapshots/current
+"""
+
+import asyncio
+import datetime
+import gzip
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from middleware.snapshots import StaticSnapshotMiddleware
+from services import static_snapshots as snapshots
+from services.static_snapshots import (
+    SnapshotError,
+    SnapshotStore,
+    canonical_path,
+    choose_encoding,
+    write_snapshot_version,
+)
+
+BODY = json.dumps({"total": 123, "items": ["x" * 40] * 20}).encode()
+
+
+def _source_app(calls):
+    app = FastAPI()
+
+    @app.get("/api/v1/budget/overview")
+    async def overview():
+        calls.append("overview")
+        return {"total": 123}
+
+    @app.get("/api/v1/money-flow/all-counties")
+    async def all_counties(year: str):
+        calls.append("money-flow")
+        return {"year": year}
+
+    @app.get("/api/v1/broken")
+    async def broken():
+        raise HTTPException(status_code=503, detail="down")
+
+    return app
+
+
+class TestWriteVersion:
+    def test_writes_all_encodings_and_switches_pointer(self, tmp_path):
+        version = write_snapshot_version(
+            {"/api/v1/budget/overview": BODY}, root=str(tmp_path)
+        )
+        assert (tmp_path / "CURRENT").read_text() == version
+        vdir = tmp_path / version
+        assert (vdir / "budget-overview.json").read_bytes() == BODY
+        assert gzip.decompress((vdir / "budget-overview.json.gz").read_bytes()) == BODY
+        manifest = json.loads((vdir / "manifest.json").read_text())
+        assert (
+            manifest["entries"]["/api/v1/budget/overview"]["key"] == "budget-overview"
+        )
+        assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+
+    def test_brotli_variant(self, tmp_path):
+        brotli = pytest.importorskip("brotli")
+        version = write_snapshot_version(
+            {"/api/v1/budget/overview": BODY}, root=str(tmp_path)
+        )
+        data = (tmp_path / version / "budget-overview.json.br").read_bytes()
+        assert brotli.decompress(data) == BODY
+
+    def test_unchanged_content_keeps_version(self, tmp_path):
+        first = write_snapshot_version({"/a": BODY}, root=str(tmp_path))
+        assert write_snapshot_version({"/a": BODY}, root=str(tmp_path)) == first
+        assert write_snapshot_version({"/a": b"{}"}, root=str(tmp_path)) != first
+
+    def test_old_versions_pruned(self, tmp_path):
+        versions = [
+            write_snapshot_version({"/a": str(i).encode()}, root=str(tmp_path), keep=2)
+            for i in range(4)
+        ]
+        remaining = sorted(
+            p for p in os.listdir(tmp_path) if p != "CURRENT" and not p.startswith(".")
+        )
+        assert remaining == versions[-2:]
+        assert (tmp_path / "CURRENT").read_text() == versions[-1]
+
+    def test_older_render_does_not_replace_newer_version(self, tmp_path):
+        early = datetime.datetime(2001, 1, 1, tzinfo=datetime.timezone.utc)
+        newer = write_snapshot_version({"/a": b"new"}, root=str(tmp_path))
+        late = write_snapshot_version(
+            {"/a": b"old"}, root=str(tmp_path), rendered_at=early
+        )
+        assert late == newer
+        assert (tmp_path / "CURRENT").read_text() == newer
+        assert not [p for p in os.listdir(tmp_path) if p.startswith("2001")]
+
+    def test_prune_spares_other_publishers_staging(self, tmp_path):
+        fresh = tmp_path / ".20990101T000000000000Z-aaaaaaaa.tmp"
+        stale = tmp_path / ".20000101T000000000000Z-bbbbbbbb.tmp"
+        fresh.mkdir()
+        stale.mkdir()
+        os.utime(stale, (0, 0))
+        write_snapshot_version({"/a": BODY}, root=str(tmp_path))
+        assert fresh.exists()
+        assert not stale.exists()
+
+
+class TestRender:
+    def test_renders_through_router(self):
+        calls = []
+        bodies = asyncio.run(
+            snapshots.render_snapshots(
+                _source_app(calls),
+                [
+                    "/api/v1/budget/overview",
+                    "/api/v1/money-flow/all-counties?year=2024/25",
+                ],
+            )
+        )
+        assert json.loads(bodies["/api/v1/budget/overview"]) == {"total": 123}
+        assert json.loads(bodies["/api/v1/money-flow/all-counties?year=2024%2F25"]) == {
+            "year": "2024/25"
+        }
+
+    def test_failed_endpoint_publishes_nothing(self, tmp_path):
+        previous = write_snapshot_version({"/a": BODY}, root=str(tmp_path))
+        with pytest.raises(SnapshotError):
+            asyncio.run(
+                snapshots.publish_static_snapshots(
+                    _source_app([]),
+                    root=str(tmp_path),
+                    paths=["/api/v1/budget/overview", "/api/v1/broken"],
+                )
+            )
+        assert (tmp_path / "CURRENT").read_text() == previous
+
+    def test_publish_mirrors_to_s3_pointer_last(self, tmp_path, monkeypatch):
+        class FakeS3:
+            def __init__(self):
+                self.puts = []
+
+            def put_object(self, **kwargs):
+                self.puts.append(kwargs)
+
+        s3 = FakeS3()
+        monkeypatch.setattr(snapshots, "get_s3_client", lambda: s3)
+        monkeypatch.setattr(snapshots.settings, "aws_bucket", "bucket")
+        version = asyncio.run(
+            snapshots.publish_static_snapshots(
+                _source_app([]), root=str(tmp_path), paths=["/api/v1/budget/overview"]
+            )
+        )
+        keys = [put["Key"] for put in s3.puts]
+        assert keys[-1] == "snapshots/current.json"
+        assert f"snapshots/{version}/budget-overview.json.gz" in keys
+        gz = next(p for p in s3.puts if p["Key"].endswith(".json.gz"))
+        assert gz["ContentEncoding"] == "gzip"
+        assert "immutable" in gz["CacheControl"]
+
+    def test_publish_does_not_capture_pre_seed_cached_responses(self, tmp_path):
+        from cache.redis_cache import cached
+
+        state = {"total": 1}
+        app = FastAPI()
+
+        @app.get("/api/v1/budget/overview")
+        @cached(key_prefix="budget:overview", ttl=1800)
+        async def overview():
+            return dict(state)
+
+        client = TestClient(app)
+        assert client.get("/api/v1/budget/overview").json() == {"total": 1}
+        state["total"] = 2  # a seeding run commits new figures
+        assert client.get("/api/v1/budget/overview").json() == {"total": 1}
+
+        version = asyncio.run(
+            snapshots.publish_static_snapshots(
+                app, root=str(tmp_path), paths=["/api/v1/budget/overview"]
+            )
+        )
+        body = (tmp_path / version / "budget-overview.json").read_bytes()
+        assert json.loads(body) == {"total": 2}
+
+    def test_publisher_does_not_load_the_api_app(self):
+        # Seeding and worker processes clear caches and build the render
+        # app without importing main, yet every snapshot path is routed.
+        from scripts.cold_start import BACKEND_DIR, _child_env
+
+        code = (
+            "import sys\n"
+            "from services import static_snapshots as s\n"
+            "s.clear_snapshot_caches()\n"
+            "routes = s.snapshot_app().openapi()['paths']\n"
+            "missing = [p for p in s.SNAPSHOT_PATHS if p.split('?')[0] not in routes]\n"
+            "print(missing)\n"
+            "print('main' in sys.modules)"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=BACKEND_DIR,
+            env=_child_env(),
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        assert proc.returncode == 0, proc.stderr[-2000:]
+        assert proc.stdout.strip().splitlines()[-2:] == ["[]", "False"]
+
+    def test_publish_for_domain_is_opt_in(self, monkeypatch):
+        monkeypatch.delenv("STATIC_SNAPSHOTS_ENABLED", raising=False)
+        assert asyncio.run(snapshots.publish_for_domain("debt")) is None
+
+
+class TestStore:
+    def test_reloads_when_pointer_moves(self, tmp_path):
+        store = SnapshotStore(str(tmp_path), check_interval=0)
+        assert store.current() is None
+        first = write_snapshot_version({"/a": BODY}, root=str(tmp_path))
+        assert store.current().version == first
+        second = write_snapshot_version({"/a": b"{}"}, root=str(tmp_path))
+        snapshot = store.current()
+        assert snapshot.version == second
+        assert snapshot.entries["/a"].bodies["identity"] == b"{}"
+
+    def test_canonical_path(self):
+        assert canonical_path("/x", "b=2&a=1") == canonical_path("/x?a=1&b=2")
+        assert canonical_path("/x", "year=2024%2F25") == canonical_path(
+            "/x?year=2024/25"
+        )
+
+    def test_choose_encoding(self):
+        both = ("identity", "gzip", "br")
+        assert choose_encoding("gzip, deflate, br", both) == "br"
+        assert choose_encoding("gzip, br;q=0", both) == "gzip"
+        assert choose_encoding("gzip, br", ("identity", "gzip")) == "gzip"
+        assert choose_encoding("", both) == "identity"
+
+
+class TestMiddleware:
+    @pytest.fixture()
+    def served(self, tmp_path):
+        calls = []
+        write_snapshot_version(
+            {canonical_path("/api/v1/money-flow/all-counties?year=2024/25"): BODY},
+            root=str(tmp_path),
+        )
+        app = _source_app(calls)
+        app.add_middleware(
+            StaticSnapshotMiddleware,
+            store=SnapshotStore(str(tmp_path), check_interval=0),
+        )
+        return TestClient(app), calls
+
+    def test_served_without_calling_handler(self, served):
+        client, calls = served
+        resp = client.get(
+            "/api/v1/money-flow/all-counties?year=2024%2F25",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.content == BODY  # decoded by the client
+        assert resp.headers["x-snapshot-version"]
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert calls == []
+
+    def test_identity_and_not_modified(self, served):
+        client, _ = served
+        path = "/api/v1/money-flow/all-counties?year=2024/25"
+        resp = client.get(path, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+        assert resp.content == BODY
+        again = client.get(path, headers={"If-None-Match": resp.headers["etag"]})
+        assert again.status_code == 304
+        assert again.content == b""
+
+    def test_publisher_renders_past_the_snapshot(self, served):
+        client, calls = served
+        bodies = asyncio.run(
+            snapshots.render_snapshots(
+                client.app, ["/api/v1/money-flow/all-counties?year=2024/25"]
+            )
+        )
+        assert calls == ["money-flow"]
+        assert json.loads(next(iter(bodies.values()))) == {"year": "2024/25"}
+
+    def test_other_requests_pass_through(self, served):
+        client, calls = served
+        client.get("/api/v1/money-flow/all-counties?year=2023/24")
+        client.get("/api/v1/budget/overview")
+        assert calls == ["money-flow", "overview"]
+
+
+def test_current_snapshot_endpoint(client, tmp_path, monkeypatch):
+    assert client.get("/api/v1/snapshots/current").status_code in (200, 404)
+
+    store = SnapshotStore(str(tmp_path), check_interval=0)
+    monkeypatch.setattr("routers.snapshots.default_store", lambda: store)
+    assert client.get("/api/v1/snapshots/current").status_code == 404
+
+    version = write_snapshot_version(
+        {"/api/v1/debt/timeline": BODY}, root=str(tmp_path)
+    )
+    monkeypatch.setenv("STATIC_SNAPSHOT_CDN_URL", "https://cdn.example/snapshots/")
+    data = client.get("/api/v1/snapshots/current").json()
+    assert data["version"] == version
+    urls = data["endpoints"]["/api/v1/debt/timeline"]["urls"]
+    assert (
+        urls["gzip"] == f"https://cdn.example/snapshots/{version}/debt-timeline.json.gz"
+    )
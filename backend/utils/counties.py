@@ -0,0 +1,110 @@
+"""Kenya county reference tables shared by the API and background jobs.
+
+``COUNTY_MAPPING`` is the canonical frontend county code → short name
+map used across the public API (``"001"`` → ``"Nairobi"``), and
+``COUNTY_REGIONS`` groups counties by former province for peer
+comparisons. Both live here rather than in ``main`` so services and
+seeding hooks can use them without importing the FastAPI app.
+"""
+
+# County ID to Name mapping
+COUNTY_MAPPING = {
+    "001": "Nairobi",
+    "002": "Kwale",
+    "003": "Kilifi",
+    "004": "Tana River",
+    "005": "Lamu",
+    "006": "Taita Taveta",
+    "007": "Garissa",
+    "008": "Wajir",
+    "009": "Mandera",
+    "010": "Marsabit",
+    "011": "Isiolo",
+    "012": "Meru",
+    "013": "Tharaka Nithi",
+    "014": "Embu",
+    "015": "Kitui",
+    "016": "Machakos",
+    "017": "Makueni",
+    "018": "Nyandarua",
+    "019": "Nyeri",
+    "020": "Kirinyaga",
+    "021": "Murang'a",
+    "022": "Kiambu",
+    "023": "Turkana",
+    "024": "West Pokot",
+    "025": "Samburu",
+    "026": "Trans Nzoia",
+    "027": "Uasin Gishu",
+    "028": "Elgeyo Marakwet",
+    "029": "Nandi",
+    "030": "Baringo",
+    "031": "Laikipia",
+    "032": "Nakuru",
+    "033": "Narok",
+    "034": "Kajiado",
+    "035": "Kericho",
+    "036": "Bomet",
+    "037": "Kakamega",
+    "038": "Vihiga",
+    "039": "Bungoma",
+    "040": "Busia",
+    "041": "Siaya",
+    "042": "Kisumu",
+    "043": "Homa Bay",
+    "044": "Migori",
+    "045": "Kisii",
+    "046": "Nyamira",
+    "047": "Mombasa",
+}
+
+# County regions for peer comparison (based on Kenya's former provinces)
+COUNTY_REGIONS = {
+    "001": "Nairobi",
+    "002": "Coast",
+    "003": "Coast",
+    "004": "Coast",
+    "005": "Coast",
+    "006": "Coast",
+    "047": "Coast",
+    "007": "North Eastern",
+    "008": "North Eastern",
+    "009": "North Eastern",
+    "010": "Eastern",
+    "011": "Eastern",
+    "012": "Eastern",
+    "013": "Eastern",
+    "014": "Eastern",
+    "015": "Eastern",
+    "016": "Eastern",
+    "017": "Eastern",
+    "018": "Central",
+    "019": "Central",
+    "020": "Central",
+    "021": "Central",
+    "022": "Central",
+    "023": "Rift Valley",
+    "024": "Rift Valley",
+    "025": "Rift Valley",
+    "026": "Rift Valley",
+    "027": "Rift Valley",
+    "028": "Rift Valley",
+    "029": "Rift Valley",
+    "030": "Rift Valley",
+    "031": "Rift Valley",
+    "032": "Rift Valley",
+    "033": "Rift Valley",
+    "034": "Rift Valley",
+    "035": "Rift Valley",
+    "036": "Rift Valley",
+    "037": "Western",
+    "038": "Western",
+    "039": "Western",
+    "040": "Western",
+    "041": "Nyanza",
+    "042": "Nyanza",
+    "043": "Nyanza",
+    "044": "Nyanza",
+    "045": "Nyanza",
+    "046": "Nyanza",
+}
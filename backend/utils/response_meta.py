@@ -0,0 +1,114 @@
+"""Standard ``_meta`` envelope and plausibility checks for finance endpoints.
+
+Shared by ``main`` and the routers split out of it so every endpoint
+stamps the same unit / scope / freshness fields.
+"""
+
+import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def response_meta(
+    *,
+    unit: str,
+    entity_scope: str,
+    fiscal_period: str | None = None,
+    scope_detail: str | None = None,
+    generated_at: str | datetime.datetime | None = None,
+    source_updated_at: str | datetime.datetime | None = None,
+    covers_through: str | None = None,
+    cache_ttl_seconds: int | None = None,
+    data_quality: str | None = None,
+    quality_notes: list[str] | None = None,
+) -> dict:
+    """Build a standard ``_meta`` envelope for finance endpoints.
+
+    Core fields
+    -----------
+    unit: "kes" | "billion_kes" | "percentage" | "mixed"
+    entity_scope: "national" | "county" | "all"
+    scope_detail: free-text clarification of what the endpoint actually
+        measures — e.g. "National-government execution only; excludes
+        county equitable share". Surface verbatim in the UI.
+
+    Freshness fields (added April 2026)
+    -----------------------------------
+    generated_at: ISO-8601 timestamp of when *this response* was built
+        (not when data was last refreshed). If omitted, set to now().
+    source_updated_at: ISO-8601 timestamp of the most recent row that
+        contributed to this response — MAX(created_at) or
+        MAX(updated_at) across the tables queried. Tells clients how
+        fresh the underlying data is, independent of cache age.
+    covers_through: human-readable coverage label (e.g. "FY2024/25" or
+        "Q2 2025"). Distinct from *fiscal_period* only when the
+        endpoint spans multiple periods and the latest one is what
+        clients should show.
+    cache_ttl_seconds: the @cached TTL, so clients know the maximum
+        staleness they might see. Omit for uncached endpoints.
+    data_quality: one of {"official", "estimated", "projected",
+        "historical", "mixed"}. Derived from joined SourceDocument
+        rows or hardcoded when the endpoint has known provenance.
+    quality_notes: list of human-readable caveats surfaced to the UI
+        (missing categories, uniform-absorption warnings, divergence
+        between sources, etc.). Produced by ``trust_guards`` helpers.
+    """
+    meta: dict = {"unit": unit, "entity_scope": entity_scope}
+    if fiscal_period:
+        meta["fiscal_period"] = fiscal_period
+    if scope_detail:
+        meta["scope_detail"] = scope_detail
+    # Always stamp generated_at so the frontend can render a relative
+    # "Updated X ago" badge without guessing.
+    if generated_at is None:
+        generated_at = datetime.datetime.utcnow()
+    if isinstance(generated_at, datetime.datetime):
+        meta["generated_at"] = generated_at.isoformat() + "Z"
+    else:
+        meta["generated_at"] = str(generated_at)
+    if source_updated_at is not None:
+        if isinstance(source_updated_at, datetime.datetime):
+            meta["source_updated_at"] = source_updated_at.isoformat() + "Z"
+        else:
+            meta["source_updated_at"] = str(source_updated_at)
+    if covers_through:
+        meta["covers_through"] = covers_through
+    if cache_ttl_seconds is not None:
+        meta["cache_ttl_seconds"] = int(cache_ttl_seconds)
+    if data_quality:
+        meta["data_quality"] = data_quality
+    if quality_notes:
+        # Defensive copy so callers can't mutate meta post-hoc.
+        meta["quality_notes"] = list(quality_notes)
+    return meta
+
+
+# Plausibility bounds (order-of-magnitude sanity checks)
+MAX_COUNTY_BUDGET_KES = 50_000_000_000  # 50 B KES – largest county ≈ Nairobi 10B
+MAX_NATIONAL_BUDGET_KES = 10_000_000_000_000  # 10 T KES
+MAX_NATIONAL_BUDGET_BILLION = 10_000  # 10 T KES expressed in billions
+MAX_SINGLE_LOAN_KES = 5_000_000_000_000  # 5 T KES
+
+
+def check_plausibility(
+    value: float,
+    ceiling: float,
+    label: str,
+    *,
+    allow_negative: bool = False,
+) -> None:
+    """Log a WARNING if *value* exceeds *ceiling* or is unexpectedly negative."""
+    if value > ceiling:
+        logger.warning(
+            "PLAUSIBILITY FAIL: %s = %s exceeds ceiling %s",
+            label,
+            f"{value:,.0f}",
+            f"{ceiling:,.0f}",
+        )
+    if not allow_negative and value < 0:
+        logger.warning(
+            "PLAUSIBILITY FAIL: %s = %s is negative",
+            label,
+            f"{value:,.0f}",
+        )
@@ -0,0 +1,53 @@
+"""Budget sector tables shared by the national budget endpoints.
+
+``SECTOR_NORMALIZE`` maps raw budget-line categories (lower-cased) to
+the canonical sector names, and ``SECTOR_ORDER`` is the order those
+sectors are listed in. They live here rather than in ``main`` so
+``routers.national`` and ``main`` share one copy.
+"""
+
+SECTOR_NORMALIZE = {
+    "health services": "Health",
+    "health": "Health",
+    "education": "Education",
+    "education & training": "Education",
+    "roads and public works": "Infrastructure",
+    "roads & transport": "Infrastructure",
+    "infrastructure & transport": "Infrastructure",
+    "water and sanitation": "Water & Sanitation",
+    "water & sanitation": "Water & Sanitation",
+    "agriculture": "Agriculture",
+    "agriculture & livestock": "Agriculture",
+    "public administration": "Administration",
+    "administration": "Administration",
+    "governance & administration": "Administration",
+    "county assembly": "Administration",
+    "trade and industry": "Trade & Enterprise",
+    "trade & enterprise": "Trade & Enterprise",
+    "environment": "Environment",
+    "environment & natural resources": "Environment",
+    "lands & urban planning": "Environment",
+    "social services": "Social Protection",
+    "social protection": "Social Protection",
+    "defense": "Defense",
+    "public order & safety": "Public Order & Safety",
+    "energy": "Energy",
+    "other": "Other",
+}
+
+SECTOR_ORDER = [
+    "Education",
+    "Infrastructure",
+    "Public Order & Safety",
+    "Administration",
+    "Defense",
+    "Health",
+    "Energy",
+    "Social Protection",
+    "Agriculture",
+    "Water & Sanitation",
+    "Environment",
+    "Trade & Enterprise",
+    "Other",
+]
+
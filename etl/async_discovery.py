@@ -0,0 +1,266 @@
+"""
+Async HTTP layer for ``KenyaDataPipeline`` discovery.
+
+One :class:`AsyncFetcher` is shared by every source crawled in a
+discovery pass. It keeps pooled ``httpx.AsyncClient`` connections
+(HTTP/2 when the ``h2`` package is installed) and applies a per-host
+politeness policy: at most ``concurrency`` requests in flight per host,
+with request starts spaced at least ``delay`` seconds apart. The SSL
+policy matches the old ``requests`` session: a pinned CA bundle for
+KNBS, and an unverified retry for OAG/COB, whose certificates are often
+misconfigured.
+
+Policies come from ``DISCOVERY_HOST_CONCURRENCY`` /
+``DISCOVERY_HOST_DELAY_SECONDS`` and per-host overrides in
+``DISCOVERY_HOST_LIMITS`` (``cob.go.ke=2:1.0,oagkenya.go.ke=3:0.5``).
+
+HTML is parsed with lxml when it is installed (``DISCOVERY_HTML_PARSER``
+overrides the BeautifulSoup tree builder).
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import ssl
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional
+from urllib.parse import urlparse
+
+import httpx
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+HTML_PARSER = os.getenv("DISCOVERY_HTML_PARSER") or (
+    "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+INSECURE_FALLBACK_SOURCES = frozenset({"oag", "cob"})
+
+
+def parse_html(content: bytes) -> BeautifulSoup:
+    return BeautifulSoup(content, HTML_PARSER)
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).netloc or "").lower().replace("www.", "")
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    concurrency: int = 4
+    delay: float = 0.2
+
+
+def _env_number(name: str, default, cast=float):
+    try:
+        return cast(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def default_policy() -> HostPolicy:
+    return HostPolicy(
+        concurrency=max(1, _env_number("DISCOVERY_HOST_CONCURRENCY", 4, int)),
+        delay=max(0.0, _env_number("DISCOVERY_HOST_DELAY_SECONDS", 0.2)),
+    )
+
+
+def host_policies_from_env() -> Dict[str, HostPolicy]:
+    """Parse ``DISCOVERY_HOST_LIMITS`` (``host=concurrency:delay,...``)."""
+    policies: Dict[str, HostPolicy] = {}
+    for part in (os.getenv("DISCOVERY_HOST_LIMITS") or "").split(","):
+        host, _, spec = part.strip().partition("=")
+        if not host or not spec:
+            continue
+        conc, _, delay = spec.partition(":")
+        try:
+            policies[host.lower().replace("www.", "")] = HostPolicy(
+                concurrency=max(1, int(conc)),
+                delay=max(0.0, float(delay or 0)),
+            )
+        except ValueError:
+            logger.warning(f"Ignoring malformed DISCOVERY_HOST_LIMITS entry: {part}")
+    return policies
+
+
+class HostLimiter:
+    """Concurrency cap plus minimum spacing between request starts."""
+
+    def __init__(self, policy: HostPolicy, clock=time.monotonic, sleep=asyncio.sleep):
+        self.policy = policy
+        self._sem = asyncio.Semaphore(policy.concurrency)
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+        self._clock = clock
+        self._sleep = sleep
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._sem:
+            async with self._lock:
+                wait = self._next_start - self._clock()
+                if wait > 0:
+                    await self._sleep(wait)
+                self._next_start = self._clock() + self.policy.delay
+            yield
+
+
+class AsyncFetcher:
+    """Pooled, per-host-polite GETs for discovery crawls.
+
+    ``get`` returns the response for any HTTP status (callers decide what
+    a 304 or 404 means) and ``None`` on connection/TLS failure. Pass
+    ``transport`` to replay recorded responses in tests and benchmarks.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_agent: str = DEFAULT_USER_AGENT,
+        ca_bundles: Optional[Mapping[str, str]] = None,
+        policies: Optional[Mapping[str, HostPolicy]] = None,
+        default: Optional[HostPolicy] = None,
+        timeout: float = 60.0,
+        retries: int = 2,
+        backoff: float = 1.5,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        http2: Optional[bool] = None,
+    ):
+        self.user_agent = user_agent
+        self.ca_bundles = dict(ca_bundles or {})
+        self.policies = dict(host_policies_from_env() if policies is None else policies)
+        self.default = default or default_policy()
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.transport = transport
+        self.http2 = HTTP2_AVAILABLE if http2 is None else (http2 and HTTP2_AVAILABLE)
+        self.requests: Counter = Counter()
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._clients: Dict[Any, httpx.AsyncClient] = {}
+
+    async def __aenter__(self) -> "AsyncFetcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.aclose()
+
+    def limiter(self, host: str) -> HostLimiter:
+        if host not in self._limiters:
+            self._limiters[host] = HostLimiter(self.policies.get(host, self.default))
+        return self._limiters[host]
+
+    def _verify_for(self, source_key: str, insecure: bool) -> Any:
+        if insecure:
+            return False
+        bundle = self.ca_bundles.get(source_key)
+        return bundle or True
+
+    def _client(self, verify: Any) -> httpx.AsyncClient:
+        client = self._clients.get(verify)
+        if client is None:
+            if isinstance(verify, str):
+                ssl_verify: Any = ssl.create_default_context(cafile=verify)
+            else:
+                ssl_verify = verify
+            per_host = max(
+                [self.default.concurrency]
+                + [p.concurrency for p in self.policies.values()]
+            )
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                verify=ssl_verify,
+                transport=self.transport,
+                follow_redirects=True,
+                timeout=self.timeout,
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=None, max_keepalive_connections=4 * per_host
+                ),
+            )
+            self._clients[verify] = client
+        return client
+
+    async def _send(
+        self, url: str, verify: Any, headers, params, timeout
+    ) -> httpx.Response:
+        client = self._client(verify)
+        limiter = self.limiter(host_of(url))
+        attempt = 0
+        while True:
+            async with limiter.slot():
+                resp = await client.get(
+                    url,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout or self.timeout,
+                )
+            self.requests[host_of(url)] += 1
+            if resp.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                return resp
+            attempt += 1
+            retry_after = resp.headers.get("Retry-After", "")
+            wait = (
+                float(retry_after)
+                if retry_after.isdigit()
+                else self.backoff * (2 ** (attempt - 1))
+            )
+            await asyncio.sleep(wait)
+
+    async def get(
+        self,
+        url: str,
+        source_key: str,
+        headers: Optional[Mapping[str, str]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[httpx.Response]:
+        try:
+            return await self._send(
+                url, self._verify_for(source_key, False), headers, params, timeout
+            )
+        except (httpx.HTTPError, ssl.SSLError, OSError) as err:
+            if source_key == "knbs" and self.ca_bundles.get("knbs"):
+                logger.error(
+                    "KNBS SSL validation failed with pinned bundle %s: %s",
+                    self.ca_bundles["knbs"],
+                    err,
+                )
+                return None
+            if source_key not in INSECURE_FALLBACK_SOURCES:
+                logger.error(f"Fetch failed: {err}")
+                return None
+        try:
+            return await self._send(url, False, headers, params, timeout)
+        except (httpx.HTTPError, ssl.SSLError, OSError) as err:
+            logger.error(f"{source_key} fetch failed (insecure): {err}")
+            return None
+
+    def request_counts(self) -> Dict[str, int]:
+        return dict(self.requests)
+
+
+async def gather_in_order(aws: Iterable[Any]) -> list:
+    """``asyncio.gather`` that cancels the remaining awaitables on failure."""
+    tasks = [asyncio.ensure_future(a) for a in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for t in tasks:
+            t.cancel()
+        raise
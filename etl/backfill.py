@@ -85,9 +85,8 @@ async def run_backfill():
 
     pipe = KenyaDataPipeline(storage_path=storage)
 
-    all_docs: List[Dict[str, Any]] = []
-    for sk in sources:
-        all_docs.extend(pipe.discover_budget_documents(sk))
+    # All sources are crawled concurrently over one shared client
+    all_docs: List[Dict[str, Any]] = await pipe.discover_budget_documents_async(sources)
 
     # Filter by year window if configured
     filtered = list(_filter_by_year(all_docs, year_from, year_to))
@@ -109,7 +108,8 @@ async def run_backfill():
         await asyncio.sleep(0.5)
         return bool(res)
 
-    ok_flags = await _bounded_gather(concurrency, (_process_one(d) for d in queue))
+    async with pipe.browser_session():
+        ok_flags = await _bounded_gather(concurrency, (_process_one(d) for d in queue))
 
     summary = {
         "requested": len(all_docs),
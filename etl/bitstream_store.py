@@ -0,0 +1,186 @@
+"""
+Content-addressed storage for downloaded DSpace bitstreams.
+
+Every completed download lives at a path derived from its MD5
+(``objects/ab/abcdef....pdf``), so a PDF attached to several Parliament
+items is stored once. A SQLite index maps checksums and DSpace bitstream
+UUIDs to stored files, which makes "do we already have this?" a single
+primary-key lookup instead of a directory scan.
+
+Downloads in flight are written to ``partial/<bitstream_uuid>.part`` and
+survive interruptions; :meth:`BitstreamStore.commit` moves a verified
+part into place and indexes it.
+
+Given the shared :class:`services.blob_store.BlobStore`, committed files
+go there instead (pinned as ``dspace:<bitstream_uuid>``), so a PDF the
+ETL pipeline or a seeding fetcher already holds is not stored twice. The
+index here still answers the MD5 and bitstream-UUID lookups.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "bitstreams.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    md5 TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bitstreams (
+    bitstream_uuid TEXT PRIMARY KEY,
+    md5 TEXT NOT NULL REFERENCES blobs(md5),
+    item_uuid TEXT,
+    name TEXT,
+    recorded_at REAL NOT NULL
+);
+"""
+
+
+class BitstreamStore:
+    """Checksum-addressed files under ``root`` plus their SQLite index."""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        index_path: Union[str, Path, None] = None,
+        blobs=None,
+    ):
+        self.root = Path(root)
+        self.blobs = blobs
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.index_path = Path(index_path) if index_path else self.root / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- paths -----------------------------------------------------------
+    def path_for(self, md5: str, suffix: str = ".pdf") -> Path:
+        md5 = md5.lower()
+        return self.root / "objects" / md5[:2] / f"{md5}{suffix}"
+
+    def partial_path(self, bitstream_uuid: str) -> Path:
+        return self.root / "partial" / f"{bitstream_uuid}.part"
+
+    # -- lookups ---------------------------------------------------------
+    def lookup(self, md5: str) -> Optional[Path]:
+        """Stored file for ``md5``, or None (also if it vanished from disk)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT path, md5 FROM blobs WHERE md5 = ?", (md5.lower(),)
+            ).fetchone()
+        return self._existing(row)
+
+    def lookup_bitstream(self, bitstream_uuid: str) -> Optional[Path]:
+        """Stored file for a DSpace bitstream downloaded before."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.path, b.md5 FROM bitstreams s JOIN blobs b ON b.md5 = s.md5"
+                " WHERE s.bitstream_uuid = ?",
+                (bitstream_uuid,),
+            ).fetchone()
+        return self._existing(row)
+
+    def bitstream_md5(self, bitstream_uuid: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT md5 FROM bitstreams WHERE bitstream_uuid = ?",
+                (bitstream_uuid,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _existing(self, row) -> Optional[Path]:
+        if row is None:
+            return None
+        path = Path(row[0])
+        if not path.is_absolute():
+            path = self.root / path
+        if path.exists():
+            return path
+        if self.blobs is not None:
+            # An S3-backed blob whose local copy was evicted comes back here.
+            blob = self.blobs.find_md5(row[1])
+            return blob.path if blob else None
+        return None
+
+    # -- writes ----------------------------------------------------------
+    def commit(
+        self,
+        part: Path,
+        md5: str,
+        bitstream_uuid: str,
+        item_uuid: str = "",
+        name: str = "",
+        suffix: str = ".pdf",
+        url: Optional[str] = None,
+    ) -> Path:
+        """Move a verified ``part`` file into place and index it.
+
+        If the same content is already stored, the part is dropped and the
+        existing file is returned.
+        """
+        md5 = md5.lower()
+        if self.blobs is not None:
+            blob = self.blobs.put_file(
+                part, url=url, name=f"{md5}{suffix}", pin=f"dspace:{bitstream_uuid}"
+            )
+            self.record(md5, blob.path, bitstream_uuid, item_uuid, name)
+            return blob.path
+        dest = self.path_for(md5, suffix)
+        if dest.exists():
+            part.unlink(missing_ok=True)
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(part, dest)
+        self.record(md5, dest, bitstream_uuid, item_uuid, name)
+        return dest
+
+    def record(
+        self,
+        md5: str,
+        path: Path,
+        bitstream_uuid: str,
+        item_uuid: str = "",
+        name: str = "",
+    ) -> None:
+        """Index ``path`` as the content for ``md5`` and ``bitstream_uuid``."""
+        md5 = md5.lower()
+        try:
+            stored = str(path.relative_to(self.root))
+        except ValueError:
+            stored = str(path)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO blobs (md5, path, size_bytes, stored_at)"
+                " VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(md5) DO UPDATE SET path = excluded.path,"
+                " size_bytes = excluded.size_bytes",
+                (md5, stored, path.stat().st_size, now),
+            )
+            self._conn.execute(
+                "INSERT INTO bitstreams (bitstream_uuid, md5, item_uuid, name,"
+                " recorded_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT(bitstream_uuid) DO UPDATE SET md5 = excluded.md5,"
+                " item_uuid = excluded.item_uuid, name = excluded.name",
+                (bitstream_uuid, md5, item_uuid, name, now),
+            )
+            self._conn.commit()
+        if self.blobs is not None:
+            blob = self.blobs.find_md5(md5)
+            if blob is not None:
+                self.blobs.pin(blob.sha256, f"dspace:{bitstream_uuid}")
@@ -0,0 +1,340 @@
+"""Long-lived headless browser with a bounded pool of reusable contexts.
+
+Launching Chromium costs a second or more and a few hundred MB, so the
+headless COB downloader shares one browser per browser type (and event
+loop) instead of starting one per document:
+
+* contexts are reused across pages (cookies cleared in between) and
+  recycled after ``BROWSER_CONTEXT_MAX_USES`` pages;
+* at most ``max_contexts`` are active at once, derived from available
+  memory (``BROWSER_CONTEXT_MEMORY_MB`` each after
+  ``BROWSER_MEMORY_RESERVE_MB``) and capped by ``BROWSER_POOL_MAX_CONTEXTS``;
+* images, fonts, media and known analytics hosts are aborted at the
+  route level;
+* an idle pool closes its browser after ``BROWSER_POOL_IDLE_SECONDS``;
+* a pipeline or job run wraps its downloads in ``browser_session()``,
+  which closes the loop's pools when the last open session ends, so a
+  short-lived loop (``asyncio.run``) never exits with a browser running.
+
+Playwright is optional; callers check ``playwright_available()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    from playwright.async_api import async_playwright  # type: ignore
+except Exception:  # Playwright optional
+    async_playwright = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+BLOCKED_HOST_SUFFIXES = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "addthis.com",
+    "sharethis.com",
+    "twitter.com",
+    "platform.twitter.com",
+    "youtube.com",
+)
+CHROMIUM_ARGS = ["--disable-dev-shm-usage", "--disable-gpu", "--no-first-run"]
+BROWSER_BASE_MEMORY_MB = 300
+
+Launcher = Callable[[str], Awaitable[Tuple[Any, Any]]]
+
+
+def playwright_available() -> bool:
+    return async_playwright is not None
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def should_block(resource_type: str, url: str) -> bool:
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in BLOCKED_HOST_SUFFIXES)
+
+
+def available_memory_mb() -> Optional[int]:
+    """``MemAvailable`` from /proc/meminfo, or None where it is unavailable."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def memory_bounded_contexts(
+    cap: Optional[int] = None,
+    per_context_mb: Optional[int] = None,
+    reserve_mb: Optional[int] = None,
+    available_mb: Optional[int] = None,
+) -> int:
+    """How many contexts fit in available memory, between 1 and ``cap``."""
+    cap = cap or max(1, _env_int("BROWSER_POOL_MAX_CONTEXTS", 4))
+    per_context_mb = per_context_mb or max(
+        1, _env_int("BROWSER_CONTEXT_MEMORY_MB", 150)
+    )
+    if reserve_mb is None:
+        reserve_mb = _env_int("BROWSER_MEMORY_RESERVE_MB", 512)
+    if available_mb is None:
+        available_mb = available_memory_mb()
+    if available_mb is None:
+        return cap
+    budget = available_mb - reserve_mb - BROWSER_BASE_MEMORY_MB
+    return max(1, min(cap, budget // per_context_mb))
+
+
+async def _launch_playwright(browser_type: str) -> Tuple[Any, Any]:
+    pw = await async_playwright().start()  # type: ignore[misc]
+    try:
+        launcher = getattr(pw, browser_type)
+        args = CHROMIUM_ARGS if browser_type == "chromium" else []
+        browser = await launcher.launch(headless=True, args=args)
+    except BaseException:
+        await pw.stop()
+        raise
+    return pw, browser
+
+
+class BrowserPool:
+    """One browser of ``browser_type`` serving pages from pooled contexts.
+
+    Use ``async with pool.page() as page``; the page is closed and its
+    context returned to the pool afterwards. A context whose page raised
+    is discarded rather than reused.
+    """
+
+    def __init__(
+        self,
+        browser_type: str = "chromium",
+        *,
+        context_options: Optional[Dict[str, Any]] = None,
+        max_contexts: Optional[int] = None,
+        context_max_uses: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        launcher: Optional[Launcher] = None,
+    ):
+        self.browser_type = browser_type
+        self.context_options = dict(context_options or {})
+        self.max_contexts = max_contexts or memory_bounded_contexts()
+        self.context_max_uses = context_max_uses or max(
+            1, _env_int("BROWSER_CONTEXT_MAX_USES", 25)
+        )
+        self.idle_seconds = (
+            idle_seconds
+            if idle_seconds is not None
+            else _env_int("BROWSER_POOL_IDLE_SECONDS", 120)
+        )
+        self._launcher = launcher or _launch_playwright
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem = asyncio.Semaphore(self.max_contexts)
+        self._start_lock = asyncio.Lock()
+        self._pw: Any = None
+        self._browser: Any = None
+        self._idle: List[Tuple[Any, int]] = []
+        self._in_use = 0
+        self._idle_timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {
+            "launches": 0,
+            "contexts_created": 0,
+            "pages": 0,
+            "blocked": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._browser is not None
+
+    async def _ensure_browser(self) -> Any:
+        async with self._start_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                logger.warning(f"Pooled {self.browser_type} disconnected; relaunching")
+                self._browser, self._idle = None, []
+                try:
+                    await self._pw.stop()
+                except Exception:
+                    pass
+            if self._browser is None:
+                self._pw, self._browser = await self._launcher(self.browser_type)
+                self.stats["launches"] += 1
+                logger.info(
+                    f"Launched pooled {self.browser_type} "
+                    f"(max {self.max_contexts} contexts)"
+                )
+            return self._browser
+
+    async def _route(self, route: Any) -> None:
+        request = route.request
+        if should_block(request.resource_type, request.url):
+            self.stats["blocked"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _new_context(self) -> Any:
+        browser = await self._ensure_browser()
+        context = await browser.new_context(**self.context_options)
+        await context.route("**/*", self._route)
+        self.stats["contexts_created"] += 1
+        return context
+
+    async def _release(self, context: Any, uses: int, healthy: bool) -> None:
+        if healthy and uses < self.context_max_uses and self._browser is not None:
+            try:
+                await context.clear_cookies()
+                self._idle.append((context, uses))
+                return
+            except Exception:
+                pass
+        try:
+            await context.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        async with self._sem:
+            self._in_use += 1
+            context, uses = self._idle.pop() if self._idle else (None, 0)
+            healthy = False
+            page = None
+            try:
+                if context is None:
+                    context = await self._new_context()
+                page = await context.new_page()
+                self.stats["pages"] += 1
+                yield page
+                healthy = True
+            finally:
+                if page is not None:
+                    try:
+                        await page.close()
+                    except Exception:
+                        healthy = False
+                if context is not None:
+                    await self._release(context, uses + 1, healthy)
+                self._in_use -= 1
+                if self._in_use == 0:
+                    self._schedule_idle_close()
+
+    def _schedule_idle_close(self) -> None:
+        if self.idle_seconds <= 0 or self._browser is None:
+            return
+        loop = asyncio.get_running_loop()
+        self._idle_timer = loop.call_later(
+            self.idle_seconds, lambda: loop.create_task(self._close_if_idle())
+        )
+
+    async def _close_if_idle(self) -> None:
+        if self._in_use == 0:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        idle, self._idle = self._idle, []
+        for context, _ in idle:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        browser, pw = self._browser, self._pw
+        self._browser = self._pw = None
+        if browser is not None:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        if pw is not None:
+            try:
+                await pw.stop()
+            except Exception:
+                pass
+
+
+_pools: Dict[Tuple[int, str], BrowserPool] = {}
+# Open browser_session() scopes per event loop (by id).
+_sessions: Dict[int, int] = {}
+
+
+def _drop_finished_pools() -> None:
+    for key, pool in list(_pools.items()):
+        if pool.loop is not None and pool.loop.is_closed():
+            if pool.running:
+                # Its loop can no longer run close(); dropping the last
+                # reference lets the driver subprocess (and with it the
+                # browser) be killed when the transport is collected.
+                logger.warning(
+                    f"Pooled {pool.browser_type} outlived its event loop; "
+                    "wrap the run in browser_session()"
+                )
+            del _pools[key]
+
+
+def get_pool(browser_type: str = "chromium", **kwargs: Any) -> BrowserPool:
+    """The shared pool for ``browser_type`` on the running event loop.
+
+    Playwright objects are bound to the loop that created them, so each
+    loop gets its own pool; keyword arguments apply when it is created.
+    Pools whose loop has been closed are dropped.
+    """
+    loop = asyncio.get_running_loop()
+    _drop_finished_pools()
+    key = (id(loop), browser_type)
+    if key not in _pools:
+        _pools[key] = BrowserPool(browser_type, **kwargs)
+        _pools[key].loop = loop
+    return _pools[key]
+
+
+async def close_pools() -> None:
+    """Close every pool created on the running event loop."""
+    loop_id = id(asyncio.get_running_loop())
+    for key in [k for k in _pools if k[0] == loop_id]:
+        await _pools.pop(key).close()
+
+
+@asynccontextmanager
+async def browser_session():
+    """Scope of one pipeline or job run that may use pooled browsers.
+
+    Sessions on the same loop nest and overlap (concurrent jobs in the
+    worker); the loop's pools are closed when the last one exits.
+    """
+    loop_id = id(asyncio.get_running_loop())
+    _sessions[loop_id] = _sessions.get(loop_id, 0) + 1
+    try:
+        yield
+    finally:
+        _sessions[loop_id] -= 1
+        if not _sessions[loop_id]:
+            del _sessions[loop_id]
+            await close_pools()
@@ -2,32 +2,168 @@
 
 Uses Playwright (if installed) to resolve dynamic download pages under https://cob.go.ke/download/.
 Falls back gracefully if Playwright not available or PLAYWRIGHT_ENABLED env var is not set to a truthy value.
+
+Pages are opened in pooled browser contexts (see ``browser_pool``). By
+default the browser only *resolves* the final file URL, probing candidates
+with a small ``Range`` request, and the bytes are fetched over plain HTTP
+with the page's cookies; set COB_HEADLESS_RESOLVE_ONLY=0 to download
+through the browser as before. Callers wrap a run's downloads in
+``browser_session()`` so the pooled browsers close when the run ends.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 import re
-from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlparse
+
+import httpx
 
 try:
-    from playwright.async_api import async_playwright  # type: ignore
-except Exception:  # Playwright optional
-    async_playwright = None  # type: ignore
+    from .browser_pool import browser_session, get_pool, playwright_available
+except ImportError:  # run as a script
+    from browser_pool import (  # type: ignore
+        browser_session,
+        get_pool,
+        playwright_available,
+    )
 
 DEFAULT_TIMEOUT_MS = 30000
+PROBE_BYTES = 4096
 
 TRUTHY = {"1", "true", "yes", "on", "enable", "enabled"}
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+)
+CONTEXT_OPTIONS: Dict[str, Any] = {
+    "accept_downloads": True,
+    "user_agent": USER_AGENT,
+    "locale": "en-US",
+    "timezone_id": "Africa/Nairobi",
+    "extra_http_headers": {
+        "Accept": "*/*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Cache-Control": "no-cache",
+        "Pragma": "no-cache",
+    },
+}
+_FILENAME_RE = re.compile(r"filename=\"?([^\";]+)\"?")
+
 
 def headless_allowed() -> bool:
     val = os.getenv("PLAYWRIGHT_ENABLED", "0").lower()
-    return val in TRUTHY and async_playwright is not None
+    return val in TRUTHY and playwright_available()
+
+
+def resolve_only_enabled() -> bool:
+    return os.getenv("COB_HEADLESS_RESOLVE_ONLY", "1").lower() in TRUTHY
+
+
+def browser_types() -> List[str]:
+    raw = os.getenv("COB_HEADLESS_BROWSERS", "chromium,firefox")
+    return [b.strip() for b in raw.split(",") if b.strip()]
+
+
+@dataclass
+class ResolvedDownload:
+    """Final file URL plus the headers needed to fetch it without a browser."""
+
+    url: str
+    filename: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class _Hit(NamedTuple):
+    body: bytes
+    filename: str
+    url: str
+    complete: bool
+
+
+def _is_doc(ct: str) -> bool:
+    ct = (ct or "").lower()
+    return any(
+        x in ct
+        for x in [
+            "pdf",
+            "msword",
+            "wordprocessingml",
+            "excel",
+            "spreadsheet",
+            "zip",
+            "octet-stream",
+        ]
+    )
+
+
+def looks_like_file(body: bytes, ct: str, cd: str) -> bool:
+    if not body:
+        return False
+    if _is_doc(ct):
+        return True
+    if "attachment" in (cd or "").lower():
+        return True
+    # Magic bytes: PDF, ZIP (docx/xlsx), OLE (legacy office)
+    return (
+        body.startswith(b"%PDF")
+        or body.startswith(b"PK\x03\x04")
+        or body.startswith(b"\xd0\xcf\x11\xe0")
+    )
+
+
+def _filename(headers: Dict[str, str], url: str, default: str) -> str:
+    mfn = _FILENAME_RE.search(headers.get("content-disposition") or "")
+    if mfn:
+        return mfn.group(1)
+    return url.split("/")[-1].split("?")[0] or default
+
+
+async def _probe(
+    page,
+    cand: str,
+    referer: str,
+    resolve_only: bool,
+    *,
+    form: Optional[Dict[str, str]] = None,
+    timeout: int = 15000,
+    default_name: str = "document.bin",
+) -> Optional[_Hit]:
+    """Request ``cand`` in the page's session; a hit if it returns a file.
+
+    In resolve-only mode GETs ask for the first ``PROBE_BYTES`` only.
+    """
+    headers = {"Referer": referer, "Accept": "*/*"}
+    if resolve_only and form is None:
+        headers["Range"] = f"bytes=0-{PROBE_BYTES - 1}"
+    if form is not None:
+        resp = await page.request.post(
+            cand, timeout=timeout, headers=headers, form=form
+        )
+    else:
+        resp = await page.request.get(cand, timeout=timeout, headers=headers)
+    ct = (resp.headers.get("content-type") or "").lower()
+    cd = resp.headers.get("content-disposition") or ""
+    body = await resp.body()
+    if not looks_like_file(body, ct, cd):
+        return None
+    return _Hit(
+        body,
+        _filename(resp.headers, cand, default_name),
+        resp.url or cand,
+        resp.status == 200 and "content-range" not in resp.headers,
+    )
 
 
-async def fetch_cob_download(url: str) -> Optional[Tuple[bytes, str]]:
-    """Return (bytes, inferred_filename) for a COB download landing page or None.
+async def _resolve_on_page(
+    page, url: str, resolve_only: bool, debug: bool
+) -> Optional[_Hit]:
+    """Run the WPDM resolution strategies on ``page``.
 
     Strategy:
     1. Navigate to landing page.
@@ -35,673 +171,493 @@ async def fetch_cob_download(url: str) -> Optional[Tuple[bytes, str]]:
     3. Intercept the first navigation / download response whose headers indicate a document (pdf, excel, zip, doc).
     4. If no direct download after click, inspect network responses for PDF signature.
     """
-    if not headless_allowed():
-        return None
-    debug = os.getenv("HEADLESS_DEBUG", "0").lower() in TRUTHY
-    async with async_playwright() as p:  # type: ignore
-        # Try Chromium first, then Firefox
-        for btype in [p.chromium, p.firefox]:
-            browser = await btype.launch(headless=True)
+    await page.set_extra_http_headers(
+        {"Referer": url if url.startswith("http") else "https://cob.go.ke"}
+    )
+    # Capture binary responses opportunistically
+    captured: List[_Hit] = []
+    redirect_candidates: List[str] = []
+    debug_log: List[str] = []
+
+    async def on_response(resp):
+        try:
+            ct = (resp.headers.get("content-type") or "").lower()
+            cd = resp.headers.get("content-disposition") or ""
+            body = await resp.body()
+            if debug and (
+                "wpdm" in resp.url.lower()
+                or "/download/" in resp.url.lower()
+                or "admin-ajax.php" in resp.url.lower()
+                or _is_doc(ct)
+                or "attachment" in cd.lower()
+            ):
+                debug_log.append(
+                    f"RESP {resp.status} {resp.url} ct={ct} cd={'yes' if cd else 'no'} len={len(body) if body else 0}"
+                )
+            # Capture redirects to file-like URLs
+            if resp.status in (301, 302, 303, 307, 308):
+                loc = resp.headers.get("location") or ""
+                if loc:
+                    target = urljoin(resp.url, loc)
+                    tl = target.lower()
+                    if re.search(r"\.(pdf|docx?|xlsx?|zip)($|\?)", tl) or (
+                        "/uploads/" in tl
+                    ):
+                        redirect_candidates.append(target)
+            if looks_like_file(body, ct, cd):
+                name = resp.url.split("/")[-1].split("?")[0] or "document.bin"
+                captured.append(_Hit(body, name, resp.url, True))
+        except Exception:
+            pass
+
+    page.on("response", lambda r: asyncio.create_task(on_response(r)))
+
+    await page.goto(url, wait_until="load", timeout=DEFAULT_TIMEOUT_MS)
+    # allow late-bound JS to attach handlers and requests to settle
+    try:
+        await page.wait_for_load_state("networkidle", timeout=5000)
+    except Exception:
+        pass
+    await page.wait_for_timeout(600)
+    if debug:
+        try:
+            html0 = await page.content()
+            dump_path = os.path.join(
+                os.path.dirname(os.path.dirname(__file__)),
+                "report_cache",
+                "headless_debug.html",
+            )
+            os.makedirs(os.path.dirname(dump_path), exist_ok=True)
+            with open(dump_path, "w", encoding="utf-8") as f:
+                f.write(html0)
+            print(f"[HEADLESS_DEBUG] Wrote initial HTML to {dump_path}")
+        except Exception:
+            pass
+
+    # Find a download link
+    # Accept common cookie banners if present
+    for sel in [
+        "#cn-accept",
+        "#cookie_action_close_header",
+        "#wt-cli-accept-all-btn",
+        ".cli-accept-all-btn",
+        "button[aria-label*='accept' i]",
+        "button:has-text('Accept')",
+    ]:
+        try:
+            btn = await page.query_selector(sel)
+            if btn:
+                await btn.click()
+                await page.wait_for_timeout(300)
+                break
+        except Exception:
+            continue
+
+    # Try a variety of common WPDM link/button selectors
+    link = await page.query_selector(
+        "a.wpdm-download-link, a.wpdm-download-button, button.wpdm-download-link, button.wpdm-button, a:has-text('Download'), button:has-text('Download')"
+    )
+    if not link:
+        anchors = await page.query_selector_all("a[onclick]")
+        for a in anchors:
+            oc = (await a.get_attribute("onclick")) or ""
+            if "wpdmdl" in oc.lower():
+                link = a
+                break
+    # ensure the link is scrolled into view if found later
+    if debug and not link:
+        debug_log.append("No explicit download link selector found")
+
+    hit: Optional[_Hit] = None
+
+    async def attempt_click() -> Optional[_Hit]:
+        if not link:
+            return None
+        try:
+            # Prefer grabbing the network response first; some sites stream file
+            def _pred(resp):
+                u = resp.url.lower()
+                ct = (resp.headers.get("content-type") or "").lower()
+                cd = resp.headers.get("content-disposition") or ""
+                return (
+                    ("wpdmdl=" in u)
+                    or ("/download/" in u)
+                    or ("wpdm" in u)
+                    or ("admin-ajax.php" in u)
+                    or _is_doc(ct)
+                    or ("attachment" in cd.lower())
+                )
+
+            # Bring into view before click to trigger any intersection-observer guarded handlers
             try:
-                context = await browser.new_context(
-                    accept_downloads=True,
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
-                    ),
-                    locale="en-US",
-                    timezone_id="Africa/Nairobi",
-                    extra_http_headers={
-                        "Accept": "*/*",
-                        "Accept-Language": "en-US,en;q=0.9",
-                        "Cache-Control": "no-cache",
-                        "Pragma": "no-cache",
-                        "Referer": (
-                            url if url.startswith("http") else "https://cob.go.ke"
-                        ),
-                    },
+                await link.scroll_into_view_if_needed(timeout=1000)
+            except Exception:
+                pass
+            async with page.expect_response(_pred, timeout=20000) as resp_wait:
+                await link.click()
+            resp = await resp_wait.value
+            ct = (resp.headers.get("content-type") or "").lower()
+            cd = resp.headers.get("content-disposition") or ""
+            if resolve_only and (_is_doc(ct) or "attachment" in cd.lower()):
+                return _Hit(
+                    b"",
+                    _filename(resp.headers, resp.url, "document.bin"),
+                    resp.url,
+                    False,
                 )
-                page = await context.new_page()
-                await page.goto(url, wait_until="load", timeout=DEFAULT_TIMEOUT_MS)
-                # allow late-bound JS to attach handlers and requests to settle
+            body = await resp.body()
+            if looks_like_file(body, ct, cd):
+                fn = resp.url.split("/")[-1].split("?")[0]
+                return _Hit(body, fn or "document.bin", resp.url, True)
+            elif "json" in ct and body:
                 try:
-                    await page.wait_for_load_state("networkidle", timeout=5000)
+                    data = json.loads(body.decode("utf-8", "ignore"))
+                    # Look for a URL in common fields
+                    candidates = []
+                    if isinstance(data, dict):
+                        for k in ("url", "download_url", "file", "link"):
+                            v = data.get(k)
+                            if isinstance(v, str) and v.startswith("http"):
+                                candidates.append(v)
+                        # scan nested
+                        for v in data.values():
+                            if isinstance(v, str) and v.startswith("http"):
+                                candidates.append(v)
+                    if isinstance(data, list):
+                        for it in data:
+                            if isinstance(it, dict):
+                                v = (
+                                    it.get("url")
+                                    or it.get("download_url")
+                                    or it.get("file")
+                                    or it.get("link")
+                                )
+                                if isinstance(v, str) and v.startswith("http"):
+                                    candidates.append(v)
+                    # Try fetching first plausible candidate
+                    for cand in candidates:
+                        found = await _probe(page, cand, url, resolve_only)
+                        if found:
+                            return found
                 except Exception:
                     pass
-                await page.wait_for_timeout(600)
-                if debug:
-                    try:
-                        html0 = await page.content()
-                        dump_path = os.path.join(
-                            os.path.dirname(os.path.dirname(__file__)),
-                            "report_cache",
-                            "headless_debug.html",
-                        )
-                        os.makedirs(os.path.dirname(dump_path), exist_ok=True)
-                        with open(dump_path, "w", encoding="utf-8") as f:
-                            f.write(html0)
-                        print(f"[HEADLESS_DEBUG] Wrote initial HTML to {dump_path}")
-                    except Exception:
-                        pass
-
-                # Capture binary responses opportunistically
-                captured: List[Tuple[bytes, str]] = []
-                redirect_candidates: List[str] = []
-                debug_log: List[str] = []
-
-                def _is_doc(ct: str) -> bool:
-                    ct = (ct or "").lower()
-                    return any(
-                        x in ct
-                        for x in [
-                            "pdf",
-                            "msword",
-                            "wordprocessingml",
-                            "excel",
-                            "spreadsheet",
-                            "zip",
-                            "octet-stream",
-                        ]
-                    )
+            # Try native download API next
+            async with page.expect_download(timeout=20000) as dl_wait:
+                await link.click()
+            dl = await dl_wait.value
+            name = dl.suggested_filename or "document.bin"
+            if resolve_only:
+                await dl.cancel()
+                return _Hit(b"", name, dl.url, False)
+            path = await dl.path()
+            if path:
+                with open(path, "rb") as f:
+                    return _Hit(f.read(), name, dl.url, True)
+        except Exception:
+            try:
+                await link.click()
+                await page.wait_for_timeout(3000)
+            except Exception:
+                pass
+        return None
 
-                def _looks_like_file(body: bytes, ct: str, cd: str) -> bool:
-                    if not body:
-                        return False
-                    if _is_doc(ct):
-                        return True
-                    if "attachment" in (cd or "").lower():
-                        return True
-                    # Magic bytes: PDF, ZIP (docx/xlsx), OLE (legacy office)
-                    return (
-                        body.startswith(b"%PDF")
-                        or body.startswith(b"PK\x03\x04")
-                        or body.startswith(b"\xd0\xcf\x11\xe0")
-                    )
+    hit = await attempt_click()
 
-                async def on_response(resp):
-                    try:
-                        ct = (resp.headers.get("content-type") or "").lower()
-                        cd = resp.headers.get("content-disposition") or ""
-                        body = await resp.body()
-                        if debug and (
-                            "wpdm" in resp.url.lower()
-                            or "/download/" in resp.url.lower()
-                            or "admin-ajax.php" in resp.url.lower()
-                            or _is_doc(ct)
-                            or "attachment" in cd.lower()
-                        ):
-                            debug_log.append(
-                                f"RESP {resp.status} {resp.url} ct={ct} cd={'yes' if cd else 'no'} len={len(body) if body else 0}"
-                            )
-                        # Capture redirects to file-like URLs
-                        if resp.status in (301, 302, 303, 307, 308):
-                            loc = resp.headers.get("location") or ""
-                            if loc:
-                                from urllib.parse import urljoin
-
-                                target = urljoin(resp.url, loc)
-                                tl = target.lower()
-                                if any(
-                                    re.search(r"\.(pdf|docx?|xlsx?|zip)($|\?)", tl)
-                                ) or ("/uploads/" in tl):
-                                    redirect_candidates.append(target)
-                        if _looks_like_file(body, ct, cd):
-                            name = (
-                                resp.url.split("/")[-1].split("?")[0] or "document.bin"
-                            )
-                            captured.append((body, name))
-                    except Exception:
-                        pass
-
-                context.on("response", lambda r: asyncio.create_task(on_response(r)))
-
-                # Find a download link
-                # Accept common cookie banners if present
-                for sel in [
-                    "#cn-accept",
-                    "#cookie_action_close_header",
-                    "#wt-cli-accept-all-btn",
-                    ".cli-accept-all-btn",
-                    "button[aria-label*='accept' i]",
-                    "button:has-text('Accept')",
-                ]:
-                    try:
-                        btn = await page.query_selector(sel)
-                        if btn:
-                            await btn.click()
-                            await page.wait_for_timeout(300)
-                            break
-                    except Exception:
-                        continue
+    # Prefer captured network responses if click didn't yield a download
+    if hit is None and captured:
+        hit = captured[-1]
 
-                # Try a variety of common WPDM link/button selectors
-                link = await page.query_selector(
-                    "a.wpdm-download-link, a.wpdm-download-button, button.wpdm-download-link, button.wpdm-button, a:has-text('Download'), button:has-text('Download')"
+    # Try following any redirect candidates captured
+    if hit is None and redirect_candidates:
+        for cand in redirect_candidates[-5:]:
+            try:
+                hit = await _probe(page, cand, url, resolve_only)
+                if hit:
+                    break
+            except Exception:
+                continue
+        # If still nothing, inspect performance entries for potential file URLs
+        if hit is None:
+            try:
+                perf_urls = await page.evaluate(
+                    "() => (performance.getEntriesByType('resource')||[]).map(e=>e.name)"
                 )
-                if not link:
-                    anchors = await page.query_selector_all("a[onclick]")
-                    for a in anchors:
-                        oc = (await a.get_attribute("onclick")) or ""
-                        if "wpdmdl" in oc.lower():
-                            link = a
-                            break
-                # ensure the link is scrolled into view if found later
-                if debug and not link:
-                    debug_log.append("No explicit download link selector found")
-
-                download_bytes: Optional[bytes] = None
-                filename: str = "document.bin"
-
-                async def attempt_click():
-                    nonlocal download_bytes, filename
-                    if not link:
-                        return
-                    try:
-                        # Prefer grabbing the network response first; some sites stream file
-                        def _pred(resp):
-                            u = resp.url.lower()
-                            ct = (resp.headers.get("content-type") or "").lower()
-                            cd = resp.headers.get("content-disposition") or ""
-                            return (
-                                ("wpdmdl=" in u)
-                                or ("/download/" in u)
-                                or ("wpdm" in u)
-                                or ("admin-ajax.php" in u)
-                                or _is_doc(ct)
-                                or ("attachment" in cd.lower())
-                            )
-
-                        # Bring into view before click to trigger any intersection-observer guarded handlers
-                        try:
-                            await link.scroll_into_view_if_needed(timeout=1000)
-                        except Exception:
-                            pass
-                        async with page.expect_response(
-                            _pred, timeout=20000
-                        ) as resp_wait:
-                            await link.click()
-                        resp = await resp_wait.value
-                        ct = (resp.headers.get("content-type") or "").lower()
-                        cd = resp.headers.get("content-disposition") or ""
-                        body = await resp.body()
-                        if _looks_like_file(body, ct, cd):
-                            download_bytes = body
-                            fn = resp.url.split("/")[-1].split("?")[0]
-                            filename = fn or filename
-                        elif "json" in ct and body:
-                            try:
-                                import json
-
-                                data = json.loads(body.decode("utf-8", "ignore"))
-                                # Look for a URL in common fields
-                                candidates = []
-                                if isinstance(data, dict):
-                                    for k in ("url", "download_url", "file", "link"):
-                                        v = data.get(k)
-                                        if isinstance(v, str) and v.startswith("http"):
-                                            candidates.append(v)
-                                    # scan nested
-                                    for v in data.values():
-                                        if isinstance(v, str) and v.startswith("http"):
-                                            candidates.append(v)
-                                if isinstance(data, list):
-                                    for it in data:
-                                        if isinstance(it, dict):
-                                            v = (
-                                                it.get("url")
-                                                or it.get("download_url")
-                                                or it.get("file")
-                                                or it.get("link")
-                                            )
-                                            if isinstance(v, str) and v.startswith(
-                                                "http"
-                                            ):
-                                                candidates.append(v)
-                                # Try fetching first plausible candidate
-                                for cand in candidates:
-                                    r2 = await page.request.get(
-                                        cand,
-                                        timeout=15000,
-                                        headers={"Referer": url, "Accept": "*/*"},
-                                    )
-                                    ct2 = (r2.headers.get("content-type") or "").lower()
-                                    cd2 = r2.headers.get("content-disposition") or ""
-                                    b2 = await r2.body()
-                                    if _looks_like_file(b2, ct2, cd2):
-                                        download_bytes = b2
-                                        disp = (
-                                            r2.headers.get("content-disposition") or ""
-                                        )
-                                        mfn = re.search(
-                                            r"filename=\"?([^\";]+)\"?", disp
-                                        )
-                                        if mfn:
-                                            filename = mfn.group(1)
-                                        else:
-                                            filename = (
-                                                cand.split("/")[-1].split("?")[0]
-                                                or filename
-                                            )
-                                        break
-                            except Exception:
-                                pass
-                        if download_bytes is None:
-                            # Try native download API next
-                            async with page.expect_download(timeout=20000) as dl_wait:
-                                await link.click()
-                            dl = await dl_wait.value
-                            path = await dl.path()
-                            if path:
-                                with open(path, "rb") as f:
-                                    download_bytes = f.read()
-                                suggested = dl.suggested_filename
-                                if suggested:
-                                    filename = suggested
-                    except Exception:
-                        try:
-                            await link.click()
-                            await page.wait_for_timeout(3000)
-                        except Exception:
-                            pass
-
-                await attempt_click()
-
-                # Prefer captured network responses if click didn't yield a download
-                if download_bytes is None and captured:
-                    download_bytes, filename = captured[-1]
-
-                # If still nothing, inspect performance entries for potential file URLs
-                if download_bytes is None:
-                    pass
-                # Try following any redirect candidates captured
-                if download_bytes is None and redirect_candidates:
-                    for cand in redirect_candidates[-5:]:
-                        try:
-                            r6 = await page.request.get(
-                                cand,
-                                timeout=15000,
-                                headers={"Referer": url, "Accept": "*/*"},
-                            )
-                            ct6 = (r6.headers.get("content-type") or "").lower()
-                            cd6 = r6.headers.get("content-disposition") or ""
-                            b6 = await r6.body()
-                            if _looks_like_file(b6, ct6, cd6):
-                                download_bytes = b6
-                                disp = r6.headers.get("content-disposition") or ""
-                                mfn = re.search(r"filename=\"?([^\";]+)\"?", disp)
-                                if mfn:
-                                    filename = mfn.group(1)
-                                else:
-                                    filename = (
-                                        cand.split("/")[-1].split("?")[0] or filename
-                                    )
-                                break
-                        except Exception:
+                if isinstance(perf_urls, list):
+                    for pu in perf_urls[-20:]:  # check recent
+                        if not isinstance(pu, str):
                             continue
-                    try:
-                        perf_urls = await page.evaluate(
-                            "() => (performance.getEntriesByType('resource')||[]).map(e=>e.name)"
-                        )
-                        if isinstance(perf_urls, list):
-                            for pu in perf_urls[-20:]:  # check recent
-                                if not isinstance(pu, str):
-                                    continue
-                                ul = pu.lower()
-                                if any(
-                                    x in ul
-                                    for x in ["wpdmdl=", "/download/", "/uploads/"]
-                                ):
-                                    try:
-                                        r3 = await page.request.get(
-                                            pu,
-                                            timeout=15000,
-                                            headers={"Referer": url, "Accept": "*/*"},
-                                        )
-                                        ct3 = (
-                                            r3.headers.get("content-type") or ""
-                                        ).lower()
-                                        cd3 = (
-                                            r3.headers.get("content-disposition") or ""
-                                        )
-                                        b3 = await r3.body()
-                                        if _looks_like_file(b3, ct3, cd3):
-                                            download_bytes = b3
-                                            disp = (
-                                                r3.headers.get("content-disposition")
-                                                or ""
-                                            )
-                                            mfn = re.search(
-                                                r"filename=\"?([^\";]+)\"?", disp
-                                            )
-                                            if mfn:
-                                                filename = mfn.group(1)
-                                            else:
-                                                filename = (
-                                                    pu.split("/")[-1].split("?")[0]
-                                                    or filename
-                                                )
-                                            break
-                                    except Exception:
-                                        continue
-                    except Exception:
-                        pass
-
-                # Scrape HTML for direct uploads URLs as a last-resort heuristic
-                if download_bytes is None:
-                    try:
-                        html = await page.content()
-                        for m in re.findall(
-                            r"https?://[^\s'\"]+/wp-content/uploads/[^'\"]+\.(pdf|docx?|xlsx?|zip)",
-                            html,
-                            re.I,
-                        ):
-                            cand = m[0] if isinstance(m, tuple) else m
-                            if not isinstance(cand, str):
-                                continue
+                        ul = pu.lower()
+                        if any(x in ul for x in ["wpdmdl=", "/download/", "/uploads/"]):
                             try:
-                                r5 = await page.request.get(
-                                    cand,
-                                    timeout=15000,
-                                    headers={"Referer": url, "Accept": "*/*"},
-                                )
-                                ct5 = (r5.headers.get("content-type") or "").lower()
-                                cd5 = r5.headers.get("content-disposition") or ""
-                                b5 = await r5.body()
-                                if _looks_like_file(b5, ct5, cd5):
-                                    download_bytes = b5
-                                    disp = r5.headers.get("content-disposition") or ""
-                                    mfn = re.search(r"filename=\"?([^\";]+)\"?", disp)
-                                    if mfn:
-                                        filename = mfn.group(1)
-                                    else:
-                                        filename = (
-                                            cand.split("/")[-1].split("?")[0]
-                                            or filename
-                                        )
+                                hit = await _probe(page, pu, url, resolve_only)
+                                if hit:
                                     break
                             except Exception:
                                 continue
-                    except Exception:
-                        pass
-
-                # Try direct wpdmdl request if still nothing
-                if download_bytes is None:
-                    # Try submitting any forms that might produce the link
+            except Exception:
+                pass
+
+    # Scrape HTML for direct uploads URLs as a last-resort heuristic
+    if hit is None:
+        try:
+            html = await page.content()
+            for m in re.finditer(
+                r"https?://[^\s'\"]+/wp-content/uploads/[^'\"]+\.(pdf|docx?|xlsx?|zip)",
+                html,
+                re.I,
+            ):
+                try:
+                    hit = await _probe(page, m.group(0), url, resolve_only)
+                    if hit:
+                        break
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+    # Try submitting any forms that might produce the link
+    if hit is None:
+        try:
+            forms = await page.query_selector_all("form")
+            for form in forms:
+                action = (await form.get_attribute("action")) or url
+                method = ((await form.get_attribute("method")) or "get").lower()
+                if not any(
+                    x in (action or "").lower()
+                    for x in ["download", "wpdm", "wpdmdl", "admin-ajax.php"]
+                ):
+                    continue
+                # collect inputs
+                inputs = await form.query_selector_all("input")
+                data = {}
+                for inp in inputs:
+                    name = await inp.get_attribute("name")
+                    if not name:
+                        continue
+                    val = ""
                     try:
-                        forms = await page.query_selector_all("form")
-                        for form in forms:
-                            action = (await form.get_attribute("action")) or url
-                            method = (
-                                (await form.get_attribute("method")) or "get"
-                            ).lower()
-                            if not any(
-                                x in (action or "").lower()
-                                for x in [
-                                    "download",
-                                    "wpdm",
-                                    "wpdmdl",
-                                    "admin-ajax.php",
-                                ]
-                            ):
-                                continue
-                            # collect inputs
-                            inputs = await form.query_selector_all("input")
-                            data = {}
-                            for inp in inputs:
-                                name = await inp.get_attribute("name")
-                                if not name:
-                                    continue
-                                val = ""
-                                try:
-                                    # Playwright async ElementHandle has input_value()
-                                    val = await inp.input_value()
-                                except Exception:
-                                    v2 = await inp.get_attribute("value")
-                                    val = v2 or ""
-                                data[name] = val
-                            try:
-                                if method == "post":
-                                    r9 = await page.request.post(
-                                        action,
-                                        timeout=15000,
-                                        headers={"Referer": url, "Accept": "*/*"},
-                                        form=data,
-                                    )
-                                else:
-                                    from urllib.parse import urlencode
-
-                                    q = urlencode(data)
-                                    r9 = await page.request.get(
-                                        f"{action}?{q}",
-                                        timeout=15000,
-                                        headers={"Referer": url, "Accept": "*/*"},
-                                    )
-                                ct9 = (r9.headers.get("content-type") or "").lower()
-                                cd9 = r9.headers.get("content-disposition") or ""
-                                b9 = await r9.body()
-                                if _looks_like_file(b9, ct9, cd9):
-                                    download_bytes = b9
-                                    disp = r9.headers.get("content-disposition") or ""
-                                    mfn = re.search(r"filename=\"?([^\";]+)\"?", disp)
-                                    if mfn:
-                                        filename = mfn.group(1)
-                                    else:
-                                        filename = (
-                                            action.split("/")[-1].split("?")[0]
-                                            or filename
-                                        )
-                                    break
-                            except Exception:
-                                continue
+                        # Playwright async ElementHandle has input_value()
+                        val = await inp.input_value()
                     except Exception:
-                        pass
-
-                # Try direct wpdmdl request if still nothing
-                if download_bytes is None:
-                    ids = set()
-                    anchors = await page.query_selector_all("a[href]")
-                    for a in anchors:
-                        href = (await a.get_attribute("href")) or ""
-                        m = re.search(r"wpdmdl=(\d+)", href, re.I)
-                        if m:
-                            ids.add(m.group(1))
-                        # Also check data attributes
-                        for attr in ("data-download-url", "data-file", "data-wpdm-url"):
-                            dv = (await a.get_attribute(attr)) or ""
-                            m2 = re.search(r"wpdmdl=(\d+)", dv, re.I)
-                            if m2:
-                                ids.add(m2.group(1))
-                    # Parse full HTML for hidden occurrences
+                        v2 = await inp.get_attribute("value")
+                        val = v2 or ""
+                    data[name] = val
+                try:
+                    if method == "post":
+                        hit = await _probe(page, action, url, resolve_only, form=data)
+                    else:
+                        hit = await _probe(
+                            page, f"{action}?{urlencode(data)}", url, resolve_only
+                        )
+                    if hit:
+                        break
+                except Exception:
+                    continue
+        except Exception:
+            pass
+
+    # Try direct wpdmdl request if still nothing
+    if hit is None:
+        ids = set()
+        anchors = await page.query_selector_all("a[href]")
+        for a in anchors:
+            href = (await a.get_attribute("href")) or ""
+            m = re.search(r"wpdmdl=(\d+)", href, re.I)
+            if m:
+                ids.add(m.group(1))
+            # Also check data attributes
+            for attr in ("data-download-url", "data-file", "data-wpdm-url"):
+                dv = (await a.get_attribute(attr)) or ""
+                m2 = re.search(r"wpdmdl=(\d+)", dv, re.I)
+                if m2:
+                    ids.add(m2.group(1))
+        # Parse full HTML for hidden occurrences
+        try:
+            html = await page.content()
+            for m in re.findall(r"wpdmdl=(\d+)", html, re.I):
+                ids.add(m)
+        except Exception:
+            pass
+        base_root = "https://cob.go.ke"
+        # also consider current page path (some sites require same path as referer)
+        parsed = urlparse(url)
+        current_path_base = (
+            f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
+        )
+        for _id in ids:
+            for trial in [
+                f"{base_root}/?wpdmdl={_id}",
+                f"{current_path_base}/?wpdmdl={_id}",
+                f"{current_path_base}/?wpdmdl={_id}&refresh=1",
+            ]:
+                try:
+                    hit = await _probe(page, trial, url, resolve_only)
+                except Exception:
+                    continue
+                if hit:
+                    break
+            if hit:
+                break
+
+    # As a last resort, parse onclick location.href
+    if hit is None and link:
+        try:
+            oc = (await link.get_attribute("onclick")) or ""
+            m = re.search(r"location\.href=['\"]([^'\"]+)", oc)
+            if m:
+                target = m.group(1)
+                if target.startswith("/"):
+                    target = "https://cob.go.ke" + target
+                hit = await _probe(page, target, url, resolve_only)
+        except Exception:
+            pass
+
+    # WPDM admin-ajax fallback: attempt to derive download URL via AJAX API
+    if hit is None:
+        try:
+            html = await page.content()
+            # Find admin-ajax.php
+            m_ajax = re.search(r"[\w:\/\.-]+/wp-admin/admin-ajax\.php", html)
+            ajax_url = (
+                m_ajax.group(0) if m_ajax else urljoin(url, "/wp-admin/admin-ajax.php")
+            )
+            # Find possible package ID and nonce token
+            m_id = re.search(r"wpdmdl=(\d+)", html, re.I) or re.search(
+                r"data-id=\"(\d+)\"", html, re.I
+            )
+            # Nonce may appear as _wpnonce or wpdm_nonce
+            m_nonce = re.search(
+                r"[_-]wpnonce[\"']?\s*[:=]\s*[\"']([A-Za-z0-9]+)[\"']", html
+            ) or re.search(r"wpdm_nonce[\"']?\s*[:=]\s*[\"']([A-Za-z0-9]+)[\"']", html)
+            if ajax_url and m_id and m_nonce:
+                pid = m_id.group(1)
+                nonce = m_nonce.group(1)
+                # Try common executes used by WPDM
+                executes = [
+                    "__wpdm_get_download_link",
+                    "wpdm_get_download_link",
+                    "__wpdm_link",
+                    "wpdm_link",
+                ]
+                for ex in executes:
                     try:
-                        html = await page.content()
-                        for m in re.findall(r"wpdmdl=(\d+)", html, re.I):
-                            ids.add(m)
+                        r10 = await page.request.post(
+                            ajax_url,
+                            timeout=20000,
+                            headers={"Referer": url, "Accept": "*/*"},
+                            form={
+                                "action": "wpdm_ajax_call",
+                                "execute": ex,
+                                "ID": pid,
+                                "_wpnonce": nonce,
+                            },
+                        )
+                        b10 = await r10.body()
+                        t10 = b10.decode("utf-8", "ignore") if b10 else ""
+                        # Extract a link to uploads or recognized file extension
+                        mlink = re.search(
+                            r"https?://[^\s'\"]+/wp-content/uploads/[^'\"]+\.(pdf|docx?|xlsx?|zip)",
+                            t10,
+                            re.I,
+                        )
+                        if mlink:
+                            cand = mlink.group(0)
+                        else:
+                            # Sometimes response is HTML with an anchor
+                            mlink = re.search(
+                                r"href=['\"](https?://[^'\"]+\.(?:pdf|docx?|xlsx?|zip))",
+                                t10,
+                                re.I,
+                            )
+                            cand = mlink.group(1) if mlink else ""
+                        if cand:
+                            hit = await _probe(
+                                page, cand, url, resolve_only, timeout=20000
+                            )
+                            if hit:
+                                break
                     except Exception:
-                        pass
-                    base_root = "https://cob.go.ke"
-                    # also consider current page path (some sites require same path as referer)
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(url)
-                    current_path_base = (
-                        f"{parsed.scheme}://{parsed.netloc}{parsed.path.rstrip('/')}"
+                        continue
+        except Exception:
+            pass
+
+    if debug and not hit:
+        print("\n".join(debug_log))
+    return hit
+
+
+async def _run(url: str, resolve_only: bool) -> Optional[Tuple[_Hit, Dict[str, str]]]:
+    """Resolve ``url`` in pooled browsers; the hit plus headers for plain HTTP."""
+    debug = os.getenv("HEADLESS_DEBUG", "0").lower() in TRUTHY
+    # Try Chromium first, then Firefox
+    for btype in browser_types():
+        try:
+            pool = get_pool(btype, context_options=CONTEXT_OPTIONS)
+            async with pool.page() as page:
+                hit = await _resolve_on_page(page, url, resolve_only, debug)
+                if not hit:
+                    continue
+                cookies = await page.context.cookies([hit.url])
+                headers = {"Referer": url, "User-Agent": USER_AGENT, "Accept": "*/*"}
+                if cookies:
+                    headers["Cookie"] = "; ".join(
+                        f"{c['name']}={c['value']}" for c in cookies
                     )
-                    for _id in ids:
-                        trial_variants = [
-                            f"{base_root}/?wpdmdl={_id}",
-                            f"{current_path_base}/?wpdmdl={_id}",
-                            f"{current_path_base}/?wpdmdl={_id}&refresh=1",
-                        ]
-                        ok = False
-                        for trial in trial_variants:
-                            try:
-                                resp = await page.request.get(
-                                    trial,
-                                    timeout=15000,
-                                    headers={"Referer": url, "Accept": "*/*"},
-                                )
-                            except Exception:
-                                continue
-                            ct = (resp.headers.get("content-type") or "").lower()
-                            cd = resp.headers.get("content-disposition") or ""
-                            body = await resp.body()
-                            if _looks_like_file(body, ct, cd):
-                                download_bytes = body
-                                # filename from content-disposition if present
-                                disp = resp.headers.get("content-disposition") or ""
-                                mfn = re.search(r"filename=\"?([^\";]+)\"?", disp)
-                                if mfn:
-                                    filename = mfn.group(1)
-                                else:
-                                    filename = (
-                                        trial.split("/")[-1].split("?")[0] or filename
-                                    )
-                                ok = True
-                                break
-                        if ok:
-                            break
+                return hit, headers
+        except Exception:
+            continue
+    # If we reach here, all browser attempts failed
+    return None
 
-                # As a last resort, parse onclick location.href
-                if download_bytes is None and link:
-                    try:
-                        oc = (await link.get_attribute("onclick")) or ""
-                        m = re.search(r"location\.href=['\"]([^'\"]+)", oc)
-                        if m:
-                            target = m.group(1)
-                            if target.startswith("/"):
-                                target = "https://cob.go.ke" + target
-                            resp = await page.request.get(
-                                target,
-                                timeout=15000,
-                                headers={"Referer": url, "Accept": "*/*"},
-                            )
-                            ct = (resp.headers.get("content-type") or "").lower()
-                            cd = resp.headers.get("content-disposition") or ""
-                            body = await resp.body()
-                            if _looks_like_file(body, ct, cd):
-                                download_bytes = body
-                                filename = (
-                                    target.split("/")[-1].split("?")[0] or filename
-                                )
-                    except Exception:
-                        pass
 
-                # WPDM admin-ajax fallback: attempt to derive download URL via AJAX API
-                if download_bytes is None:
-                    try:
-                        html = await page.content()
-                        # Find admin-ajax.php
-                        from urllib.parse import urljoin
+async def resolve_cob_download(url: str) -> Optional[ResolvedDownload]:
+    """Resolve a COB download landing page to its file URL without downloading it."""
+    if not headless_allowed():
+        return None
+    res = await _run(url, resolve_only=True)
+    if res is None:
+        return None
+    hit, headers = res
+    return ResolvedDownload(hit.url, hit.filename, headers)
 
-                        m_ajax = re.search(
-                            r"[\w:\/\.-]+/wp-admin/admin-ajax\.php", html
-                        )
-                        ajax_url = (
-                            m_ajax.group(0)
-                            if m_ajax
-                            else urljoin(url, "/wp-admin/admin-ajax.php")
-                        )
-                        # Find possible package ID and nonce token
-                        m_id = re.search(r"wpdmdl=(\d+)", html, re.I) or re.search(
-                            r"data-id=\"(\d+)\"", html, re.I
-                        )
-                        # Nonce may appear as _wpnonce or wpdm_nonce
-                        m_nonce = re.search(
-                            r"[_-]wpnonce[\"']?\s*[:=]\s*[\"']([A-Za-z0-9]+)[\"']", html
-                        ) or re.search(
-                            r"wpdm_nonce[\"']?\s*[:=]\s*[\"']([A-Za-z0-9]+)[\"']", html
-                        )
-                        if ajax_url and m_id and m_nonce:
-                            pid = m_id.group(1)
-                            nonce = m_nonce.group(1)
-                            # Try common executes used by WPDM
-                            executes = [
-                                "__wpdm_get_download_link",
-                                "wpdm_get_download_link",
-                                "__wpdm_link",
-                                "wpdm_link",
-                            ]
-                            for ex in executes:
-                                try:
-                                    r10 = await page.request.post(
-                                        ajax_url,
-                                        timeout=20000,
-                                        headers={"Referer": url, "Accept": "*/*"},
-                                        form={
-                                            "action": "wpdm_ajax_call",
-                                            "execute": ex,
-                                            "ID": pid,
-                                            "_wpnonce": nonce,
-                                        },
-                                    )
-                                    b10 = await r10.body()
-                                    t10 = b10.decode("utf-8", "ignore") if b10 else ""
-                                    # Extract a link to uploads or recognized file extension
-                                    mlink = re.search(
-                                        r"https?://[^\s'\"]+/wp-content/uploads/[^'\"]+\.(pdf|docx?|xlsx?|zip)",
-                                        t10,
-                                        re.I,
-                                    )
-                                    if not mlink:
-                                        # Sometimes response is HTML with an anchor
-                                        mlink = re.search(
-                                            r"href=['\"](https?://[^'\"]+\.(?:pdf|docx?|xlsx?|zip))",
-                                            t10,
-                                            re.I,
-                                        )
-                                    if mlink:
-                                        cand = (
-                                            mlink.group(1)
-                                            if mlink.groups()
-                                            else mlink.group(0)
-                                        )
-                                        r11 = await page.request.get(
-                                            cand,
-                                            timeout=20000,
-                                            headers={"Referer": url, "Accept": "*/*"},
-                                        )
-                                        ct11 = (
-                                            r11.headers.get("content-type") or ""
-                                        ).lower()
-                                        cd11 = (
-                                            r11.headers.get("content-disposition") or ""
-                                        )
-                                        b11 = await r11.body()
-                                        if _looks_like_file(b11, ct11, cd11):
-                                            download_bytes = b11
-                                            disp = (
-                                                r11.headers.get("content-disposition")
-                                                or ""
-                                            )
-                                            mfn = re.search(
-                                                r"filename=\"?([^\";]+)\"?", disp
-                                            )
-                                            if mfn:
-                                                filename = mfn.group(1)
-                                            else:
-                                                filename = (
-                                                    cand.split("/")[-1].split("?")[0]
-                                                    or filename
-                                                )
-                                            break
-                                except Exception:
-                                    continue
-                    except Exception:
-                        pass
 
-                await browser.close()
-                if debug and not download_bytes:
-                    print("\n".join(debug_log))
-                if download_bytes:
-                    return download_bytes, filename
-            except Exception:
-                try:
-                    await browser.close()
-                except Exception:
-                    pass
-                continue
-        # If we reach here, all browser attempts failed
+async def _fetch_plain(url: str, headers: Dict[str, str]) -> Optional[bytes]:
+    try:
+        async with httpx.AsyncClient(
+            verify=False, follow_redirects=True, timeout=60
+        ) as client:
+            resp = await client.get(url, headers=headers)
+    except httpx.HTTPError:
+        return None
+    ct = resp.headers.get("content-type") or ""
+    cd = resp.headers.get("content-disposition") or ""
+    if resp.status_code == 200 and looks_like_file(resp.content, ct, cd):
+        return resp.content
+    return None
+
+
+async def fetch_cob_download(url: str) -> Optional[Tuple[bytes, str]]:
+    """Return (bytes, inferred_filename) for a COB download landing page or None.
+
+    In resolve-only mode the browser finds the file URL and the bytes come
+    over plain HTTP; if that fetch fails the browser downloads the file.
+    """
+    if not headless_allowed():
+        return None
+    if resolve_only_enabled():
+        res = await _run(url, resolve_only=True)
+        if res is None:
+            return None
+        hit, headers = res
+        if hit.complete:
+            return hit.body, hit.filename
+        body = await _fetch_plain(hit.url, headers)
+        if body:
+            return body, hit.filename
+    res = await _run(url, resolve_only=False)
+    if res is None:
         return None
+    return res[0].body, res[0].filename
 
 
 if __name__ == "__main__":
@@ -714,7 +670,8 @@ if __name__ == "__main__":
             if len(sys.argv) > 1
             else "https://cob.go.ke/download/annual-report-for-the-financial-year-2023-2024/"
         )
-        res = await fetch_cob_download(u)
+        async with browser_session():
+            res = await fetch_cob_download(u)
         if res:
             print("Downloaded", len(res[0]), "bytes as", res[1])
         else:
@@ -0,0 +1,262 @@
+"""
+Persistent crawl frontier for incremental discovery.
+
+Stores one row per crawled listing page in SQLite: the validators the
+server sent (ETag / Last-Modified), a hash of the body, when the page
+last changed, when it is next due, and what discovery extracted from it
+(document links and child pages). A discovery run then only fetches
+pages that are due, revalidates them with conditional requests, and
+replays the stored extraction for everything else, so its cost scales
+with what changed on the site rather than with the site's size.
+
+Revisit intervals adapt per URL: a page that changed since the last
+visit is revisited twice as often, one that did not backs off by 1.5x,
+within ``CRAWL_MIN_REVISIT_HOURS`` and ``CRAWL_MAX_REVISIT_DAYS``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 24 * 3600.0
+CHANGED_FACTOR = 0.5
+UNCHANGED_FACTOR = 1.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    status INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    fetched_at REAL,
+    changed_at REAL,
+    next_visit_at REAL,
+    interval_s REAL,
+    visits INTEGER NOT NULL DEFAULT 0,
+    changes INTEGER NOT NULL DEFAULT 0,
+    extracted TEXT
+)
+"""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def default_frontier_path(storage_path: Union[str, Path, None] = None) -> Path:
+    """``CRAWL_FRONTIER_PATH`` or ``crawl_frontier.sqlite`` in the downloads dir."""
+    override = os.getenv("CRAWL_FRONTIER_PATH")
+    if override:
+        return Path(override)
+    base = Path(storage_path) if storage_path else Path(__file__).parent / "downloads"
+    return base / "crawl_frontier.sqlite"
+
+
+def frontier_enabled() -> bool:
+    return os.getenv("CRAWL_FRONTIER_ENABLED", "true").lower() in ("true", "1", "yes")
+
+
+def content_hash(body: bytes) -> str:
+    return hashlib.md5(body).hexdigest()
+
+
+@dataclass
+class FrontierEntry:
+    url: str
+    status: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    fetched_at: Optional[float] = None
+    changed_at: Optional[float] = None
+    next_visit_at: Optional[float] = None
+    interval_s: float = DEFAULT_INTERVAL
+    visits: int = 0
+    changes: int = 0
+    extracted: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    @property
+    def change_rate(self) -> float:
+        """Share of visits that saw a change."""
+        return self.changes / self.visits if self.visits else 0.0
+
+
+class CrawlFrontier:
+    """SQLite-backed per-URL crawl state shared by discovery and ``run_job``."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        clock=time.time,
+    ):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.min_interval = (
+            min_interval
+            if min_interval is not None
+            else _env_float("CRAWL_MIN_REVISIT_HOURS", 6) * 3600
+        )
+        self.max_interval = (
+            max_interval
+            if max_interval is not None
+            else _env_float("CRAWL_MAX_REVISIT_DAYS", 30) * 86400
+        )
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- reads -----------------------------------------------------------
+    def get(self, url: str) -> Optional[FrontierEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, etag, last_modified, content_hash, fetched_at,"
+                " changed_at, next_visit_at, interval_s, visits, changes, extracted"
+                " FROM frontier WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        entry = FrontierEntry(*row[:11])
+        entry.extracted = json.loads(row[11]) if row[11] else None
+        return entry
+
+    def is_due(self, url: str, entry: Optional[FrontierEntry] = None) -> bool:
+        entry = entry if entry is not None else self.get(url)
+        if entry is None or entry.next_visit_at is None:
+            return True
+        return entry.next_visit_at <= self.clock()
+
+    def conditional_headers(
+        self, url: str, entry: Optional[FrontierEntry] = None
+    ) -> Dict[str, str]:
+        """``If-None-Match`` / ``If-Modified-Since`` for the stored validators."""
+        entry = entry if entry is not None else self.get(url)
+        if entry is None or entry.status != 200:
+            return {}
+        headers: Dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        elif entry.fetched_at and not entry.etag:
+            headers["If-Modified-Since"] = formatdate(entry.fetched_at, usegmt=True)
+        return headers
+
+    def changed_since(self, since: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url FROM frontier WHERE changed_at >= ? ORDER BY url",
+                (since,),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    # -- writes ----------------------------------------------------------
+    def record(
+        self,
+        url: str,
+        status: int,
+        headers: Optional[Mapping[str, str]] = None,
+        body: Optional[bytes] = None,
+        extracted: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Store the outcome of one fetch; return True if the page changed.
+
+        ``status`` 304 keeps the stored body hash and extraction. A 200
+        whose body hashes the same as last time counts as unchanged too,
+        for servers that ignore conditional headers. A 200 without
+        ``extracted`` (change detection only hashes the page) keeps the
+        stored extraction. Any other status is remembered so dead seed
+        URLs back off like unchanged pages.
+        """
+        now = self.clock()
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        prev = self.get(url)
+        interval = prev.interval_s if prev else DEFAULT_INTERVAL
+
+        if status == 304 and prev is not None:
+            changed = False
+            new_status, digest = prev.status, prev.content_hash
+            extracted = prev.extracted if extracted is None else extracted
+        elif status == 200:
+            digest = content_hash(body or b"")
+            changed = prev is None or prev.content_hash != digest
+            new_status = 200
+            if extracted is None and prev is not None:
+                extracted = prev.extracted
+        else:
+            digest = prev.content_hash if prev else None
+            changed = prev is not None and prev.status != status
+            new_status = status
+            extracted = None
+
+        if prev is not None:
+            factor = CHANGED_FACTOR if changed else UNCHANGED_FACTOR
+            interval = min(self.max_interval, max(self.min_interval, interval * factor))
+        etag = headers.get("etag") or (prev.etag if status == 304 and prev else None)
+        last_modified = headers.get("last-modified") or (
+            prev.last_modified if status == 304 and prev else None
+        )
+        changed_at = now if changed else (prev.changed_at if prev else None)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO frontier (url, status, etag, last_modified, content_hash,"
+                " fetched_at, changed_at, next_visit_at, interval_s, visits, changes,"
+                " extracted) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?)"
+                " ON CONFLICT(url) DO UPDATE SET status = excluded.status,"
+                " etag = excluded.etag, last_modified = excluded.last_modified,"
+                " content_hash = excluded.content_hash,"
+                " fetched_at = excluded.fetched_at, changed_at = excluded.changed_at,"
+                " next_visit_at = excluded.next_visit_at,"
+                " interval_s = excluded.interval_s, visits = frontier.visits + 1,"
+                " changes = frontier.changes + excluded.changes,"
+                " extracted = excluded.extracted",
+                (
+                    url,
+                    new_status,
+                    etag,
+                    last_modified,
+                    digest,
+                    now,
+                    changed_at,
+                    now + interval,
+                    interval,
+                    1 if changed else 0,
+                    json.dumps(extracted) if extracted is not None else None,
+                ),
+            )
+            self._conn.commit()
+        return changed
+
+    def stats(self) -> Dict[str, int]:
+        now = self.clock()
+        with self._lock:
+            total, due = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(CASE WHEN next_visit_at <= ?"
+                " THEN 1 ELSE 0 END), 0) FROM frontier",
+                (now,),
+            ).fetchone()
+        return {"urls": total, "due": due}
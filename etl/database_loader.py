@@ -53,6 +53,7 @@ try:
         Severity,
         SourceDocument,
     )
+    from services.latest_stats import refresh_latest_stats  # type: ignore
 except ImportError as e:
     logging.warning(f"Could not import backend models: {e}")
 
@@ -91,6 +92,9 @@ except ImportError as e:
     class EconomicIndicator:
         pass
 
+    def refresh_latest_stats(db, entity_ids=None):
+        return 0
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -625,6 +629,7 @@ class DatabaseLoader:
             meta=item.get("meta", {}),
         )
         db.add(row)
+        refresh_latest_stats(db, [entity_id])
         db.commit()
 
     async def _load_gdp_item(
@@ -683,6 +688,7 @@ class DatabaseLoader:
             meta=item.get("meta", {}),
         )
         db.add(row)
+        refresh_latest_stats(db, [entity_id])
         db.commit()
 
     async def _load_indicator_item(
@@ -0,0 +1,334 @@
+"""Wall-time benchmark for a full discovery pass over recorded responses.
+
+Replays a fixture of recorded HTTP responses (status, headers, body and
+the latency observed when it was recorded) through ``httpx`` into
+``KenyaDataPipeline.discover_budget_documents_async`` twice:
+
+* **sequential**: one request at a time, sources one after another,
+  ``html.parser``. This is the request pattern of the old
+  ``requests``-based crawlers;
+* **concurrent**: all sources at once, fetch-ahead window and per-host
+  concurrency from the environment, lxml when installed.
+
+Both passes use the same start spacing per host (``--host-delay``, off
+by default since the replayed latency already paces requests).
+
+Both passes must discover the same documents; the report gives wall time,
+request count and per-host request counts for each. The crawl frontier
+is disabled so every pass is a full crawl.
+
+Fixtures are directories holding ``index.json`` and ``bodies/``. Record
+one against the live sites with ``--record``, or generate a synthetic
+site graph with ``--synthetic`` (no network).
+
+Usage:
+    python -m etl.discovery_bench --fixtures /tmp/disc --record
+    python -m etl.discovery_bench --fixtures /tmp/disc --synthetic
+    python -m etl.discovery_bench --fixtures /tmp/disc --json reports/discovery_bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+try:
+    from . import async_discovery
+    from .async_discovery import AsyncFetcher, HostPolicy, default_policy, host_of
+except ImportError:  # run as a script
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from etl import async_discovery  # type: ignore
+    from etl.async_discovery import (  # type: ignore
+        AsyncFetcher,
+        HostPolicy,
+        default_policy,
+        host_of,
+    )
+
+BENCH_SOURCES = ("treasury", "cob", "oag")
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def fixture_key(url: httpx.URL) -> str:
+    """Canonical URL for lookups: query parameters sorted."""
+    params = sorted(url.params.multi_items())
+    return str(url.copy_with(params=params) if params else url)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serve recorded responses, sleeping for each one's recorded latency."""
+
+    def __init__(self, fixture_dir: Path, latency_scale: float = 1.0):
+        self.dir = Path(fixture_dir)
+        index = json.loads((self.dir / "index.json").read_text())
+        self.responses: Dict[str, Dict[str, Any]] = index["responses"]
+        self.miss_latency_ms = float(index.get("miss_latency_ms", 0))
+        self.latency_scale = latency_scale
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        rec = self.responses.get(fixture_key(request.url))
+        latency = rec["elapsed_ms"] if rec else self.miss_latency_ms
+        await asyncio.sleep(latency * self.latency_scale / 1000)
+        if rec is None:
+            return httpx.Response(404, request=request)
+        body = (self.dir / "bodies" / rec["body"]).read_bytes() if rec["body"] else b""
+        return httpx.Response(
+            rec["status"], headers=rec["headers"], content=body, request=request
+        )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests to ``inner`` and write every response to a fixture."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, fixture_dir: Path):
+        self.inner = inner
+        self.dir = Path(fixture_dir)
+        (self.dir / "bodies").mkdir(parents=True, exist_ok=True)
+        self.responses: Dict[str, Dict[str, Any]] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        resp = await self.inner.handle_async_request(request)
+        body = await resp.aread()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        name = ""
+        if body:
+            name = hashlib.sha1(body).hexdigest()
+            (self.dir / "bodies" / name).write_bytes(body)
+        headers = {
+            k: v for k, v in resp.headers.items() if k.lower() not in _DROP_HEADERS
+        }
+        self.responses[fixture_key(request.url)] = {
+            "status": resp.status_code,
+            "headers": headers,
+            "body": name,
+            "elapsed_ms": round(elapsed_ms, 1),
+        }
+        return httpx.Response(
+            resp.status_code, headers=headers, content=body, request=request
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def save(self, miss_latency_ms: float = 0.0) -> None:
+        (self.dir / "index.json").write_text(
+            json.dumps(
+                {"miss_latency_ms": miss_latency_ms, "responses": self.responses},
+                indent=1,
+                sort_keys=True,
+            )
+        )
+
+
+class SyntheticSite(httpx.AsyncBaseTransport):
+    """A generated listing-page graph standing in for the government sites.
+
+    The first ``pages_per_host`` HTML requests to each host get a listing
+    page linking to further ``/page/N/`` listings and a few PDFs; later
+    ones, WordPress REST calls and sitemaps get 404s.
+    """
+
+    def __init__(
+        self,
+        pages_per_host: int = 12,
+        links_per_page: int = 3,
+        files_per_page: int = 3,
+        latency_ms: float = 40.0,
+    ):
+        self.pages_per_host = pages_per_host
+        self.links_per_page = links_per_page
+        self.files_per_page = files_per_page
+        self.latency_ms = latency_ms
+        self.served: Counter = Counter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency_ms / 1000)
+        path = request.url.path
+        host = host_of(str(request.url))
+        if "/wp-json/" in path or path.endswith(".xml"):
+            return httpx.Response(404, request=request)
+        if self.served[host] >= self.pages_per_host:
+            return httpx.Response(404, request=request)
+        self.served[host] += 1
+        tag = hashlib.sha1(str(request.url).encode()).hexdigest()[:10]
+        links = "".join(
+            f'<li><a href="/listing-{tag}{i}/page/{i + 2}/">Audit reports page {i + 2}</a></li>'
+            for i in range(self.links_per_page)
+        )
+        files = "".join(
+            f'<li><a href="/wp-content/uploads/2025/report-{tag}-{i}.pdf">'
+            f"Budget implementation report FY 2024/25 part {i}</a></li>"
+            for i in range(self.files_per_page)
+        )
+        html = (
+            f"<html><head><title>{host} {path}</title></head><body>"
+            f"<nav><a href='/'>Home</a></nav><ul>{links}</ul><ul>{files}</ul>"
+            f"<p>{'Lorem ipsum dolor sit amet. ' * 200}</p></body></html>"
+        )
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=html.encode(),
+            request=request,
+        )
+
+
+def _pipeline(storage: str):
+    try:
+        from .kenya_pipeline import KenyaDataPipeline
+    except ImportError:
+        from etl.kenya_pipeline import KenyaDataPipeline  # type: ignore
+
+    pipeline = KenyaDataPipeline(storage_path=storage)
+    pipeline.frontier = None  # measure full crawls
+    return pipeline
+
+
+async def _discover(
+    transport: httpx.AsyncBaseTransport,
+    sources: Sequence[str],
+    sequential: bool,
+    storage: str,
+    host_delay: float = 0.0,
+) -> Dict[str, Any]:
+    pipeline = _pipeline(storage)
+    if sequential:
+        pipeline.discovery_window = 1
+        policy = HostPolicy(1, host_delay)
+    else:
+        policy = HostPolicy(default_policy().concurrency, host_delay)
+    fetcher = AsyncFetcher(transport=transport, policies={}, default=policy)
+    started = time.perf_counter()
+    async with fetcher:
+        if sequential:
+            docs: List[Dict[str, Any]] = []
+            for source in sources:
+                docs.extend(
+                    await pipeline.discover_budget_documents_async(source, fetcher)
+                )
+        else:
+            docs = await pipeline.discover_budget_documents_async(
+                list(sources), fetcher
+            )
+    return {
+        "wall_s": round(time.perf_counter() - started, 3),
+        "requests": sum(fetcher.request_counts().values()),
+        "per_host": fetcher.request_counts(),
+        "documents": len(docs),
+        "urls": sorted({d["url"] for d in docs}),
+    }
+
+
+def run_pass(
+    fixture_dir: Path,
+    sources: Sequence[str] = BENCH_SOURCES,
+    sequential: bool = False,
+    latency_scale: float = 1.0,
+    host_delay: float = 0.0,
+) -> Dict[str, Any]:
+    """One full discovery pass replayed from ``fixture_dir``."""
+    previous_parser = async_discovery.HTML_PARSER
+    if sequential:
+        async_discovery.HTML_PARSER = "html.parser"
+    try:
+        with tempfile.TemporaryDirectory() as storage:
+            transport = ReplayTransport(fixture_dir, latency_scale)
+            return asyncio.run(
+                _discover(transport, sources, sequential, storage, host_delay)
+            )
+    finally:
+        async_discovery.HTML_PARSER = previous_parser
+
+
+def record_fixture(
+    fixture_dir: Path,
+    sources: Sequence[str] = BENCH_SOURCES,
+    inner: Optional[httpx.AsyncBaseTransport] = None,
+    miss_latency_ms: float = 0.0,
+) -> int:
+    """Run one sequential discovery through ``inner`` (default: the network)."""
+    recorder = RecordingTransport(
+        inner or httpx.AsyncHTTPTransport(verify=False, retries=1), fixture_dir
+    )
+    with tempfile.TemporaryDirectory() as storage:
+        asyncio.run(_discover(recorder, sources, True, storage))
+    recorder.save(miss_latency_ms)
+    return len(recorder.responses)
+
+
+def build_synthetic_fixture(
+    fixture_dir: Path, sources: Sequence[str] = BENCH_SOURCES, **site: Any
+) -> int:
+    site_transport = SyntheticSite(**site)
+    return record_fixture(
+        fixture_dir, sources, site_transport, miss_latency_ms=site_transport.latency_ms
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--fixtures", required=True, type=Path)
+    parser.add_argument("--record", action="store_true", help="record live sites")
+    parser.add_argument("--synthetic", action="store_true", help="generate a site")
+    parser.add_argument("--sources", default=",".join(BENCH_SOURCES))
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--host-delay", type=float, default=0.0)
+    parser.add_argument("--json", type=Path)
+    args = parser.parse_args(argv)
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+
+    if args.record:
+        print(f"Recorded {record_fixture(args.fixtures, sources)} responses")
+    elif args.synthetic:
+        print(f"Generated {build_synthetic_fixture(args.fixtures, sources)} responses")
+
+    results = {
+        mode: run_pass(
+            args.fixtures,
+            sources,
+            mode == "sequential",
+            args.latency_scale,
+            args.host_delay,
+        )
+        for mode in ("sequential", "concurrent")
+    }
+    same = results["sequential"]["urls"] == results["concurrent"]["urls"]
+    for mode, r in results.items():
+        print(
+            f"{mode:<11} {r['wall_s']:>8.2f}s  {r['requests']:>5} requests  "
+            f"{r['documents']:>5} documents"
+        )
+    speedup = results["sequential"]["wall_s"] / max(
+        results["concurrent"]["wall_s"], 1e-9
+    )
+    print(f"speedup     {speedup:>8.1f}x  (same documents: {same})")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            mode: {k: v for k, v in r.items() if k != "urls"}
+            for mode, r in results.items()
+        }
+        summary["speedup"] = round(speedup, 2)
+        summary["same_documents"] = same
+        summary["html_parser"] = async_discovery.HTML_PARSER
+        summary["http2"] = async_discovery.HTTP2_AVAILABLE
+        args.json.write_text(json.dumps(summary, indent=2))
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
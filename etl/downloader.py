@@ -1,6 +1,7 @@
 import hashlib
 import logging
 import os
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -10,6 +11,11 @@ import requests
 from bs4 import BeautifulSoup
 from source_registry import registry
 
+_backend_path = str(Path(__file__).resolve().parent.parent / "backend")
+if _backend_path not in sys.path:
+    sys.path.append(_backend_path)
+from services.blob_store import BlobStore, default_store
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -17,40 +23,53 @@ logger = logging.getLogger(__name__)
 class DocumentDownloader:
     """Downloads documents from government sources."""
 
-    def __init__(self, storage_path: str = "downloads"):
+    def __init__(
+        self, storage_path: str = "downloads", blob_store: Optional[BlobStore] = None
+    ):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
+        self.blob_store = blob_store
+
+    @property
+    def blobs(self) -> BlobStore:
+        if self.blob_store is None:
+            self.blob_store = default_store()
+        return self.blob_store
 
     def calculate_md5(self, content: bytes) -> str:
         """Calculate MD5 hash of content."""
         return hashlib.md5(content).hexdigest()
 
-    def download_file(self, url: str, source_id: str) -> Optional[Dict]:
-        """Download a single file and return metadata."""
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-
-            content = response.content
-            md5_hash = self.calculate_md5(content)
+    def _fetch(self, url: str) -> bytes:
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        return response.content
 
-            # Create filename from URL and timestamp
-            parsed_url = urlparse(url)
-            filename = f"{source_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{Path(parsed_url.path).name}"
-            file_path = self.storage_path / filename
+    def download_file(self, url: str, source_id: str) -> Optional[Dict]:
+        """Download a single file into the shared blob store and return metadata.
 
-            # Save file
-            with open(file_path, "wb") as f:
-                f.write(content)
+        A URL fetched by this or any other downloader within the store's
+        max age (BLOB_STORE_MAX_AGE_HOURS) is served without a request.
+        The blob is held by its URL only, so over BLOB_STORE_MAX_MB it may
+        be evicted and is then fetched again on its next use.
+        """
+        try:
+            blob = self.blobs.get_or_fetch(
+                url, self._fetch, name=Path(urlparse(url).path).name
+            )
+            if blob is None:
+                return None
 
-            logger.info(f"Downloaded {url} to {file_path}")
+            action = "Downloaded" if blob.fetched else "Already stored"
+            logger.info(f"{action} {url} at {blob.path}")
 
             return {
                 "url": url,
-                "file_path": str(file_path),
-                "md5": md5_hash,
+                "file_path": str(blob.path),
+                "md5": blob.md5,
+                "sha256": blob.sha256,
                 "fetch_date": datetime.now(),
-                "size": len(content),
+                "size": blob.size,
                 "source_id": source_id,
             }
 
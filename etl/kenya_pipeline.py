@@ -4,17 +4,29 @@ Focuses on actual Kenyan government data sources
 """
 
 import asyncio
+import concurrent.futures
 import hashlib
 import json
 import logging
 import os
 import re
+import threading
 import warnings
 import xml.etree.ElementTree as ET
 from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -22,12 +34,17 @@ import urllib3
 from bs4 import BeautifulSoup
 
 try:
-    from .cob_headless import fetch_cob_download, headless_allowed  # type: ignore
+    from .cob_headless import (  # type: ignore
+        browser_session,
+        fetch_cob_download,
+        headless_allowed,
+    )
 except Exception:
     try:
         from etl.cob_headless import fetch_cob_download  # type: ignore
-        from etl.cob_headless import headless_allowed
+        from etl.cob_headless import browser_session, headless_allowed
     except Exception:  # fallback stubs
+        from contextlib import asynccontextmanager
 
         def headless_allowed():  # type: ignore
             return False
@@ -35,17 +52,14 @@ except Exception:
         async def fetch_cob_download(url: str):  # type: ignore
             return None
 
+        @asynccontextmanager
+        async def browser_session():  # type: ignore
+            yield
+
 
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-try:
-    import boto3  # type: ignore
-    from botocore.exceptions import ClientError  # type: ignore
-except Exception:  # boto3 optional
-    boto3 = None  # type: ignore
-    ClientError = Exception  # type: ignore
-
 # Import pipeline dependencies; handle optional DB loader gracefully
 try:
     from .audit_parser import AuditParser
@@ -73,6 +87,36 @@ try:
 except Exception:
     from etl.source_registry import registry  # type: ignore
 
+try:
+    from .async_discovery import (
+        DEFAULT_USER_AGENT,
+        AsyncFetcher,
+        gather_in_order,
+        parse_html,
+    )
+except Exception:
+    from etl.async_discovery import (  # type: ignore
+        DEFAULT_USER_AGENT,
+        AsyncFetcher,
+        gather_in_order,
+        parse_html,
+    )
+
+try:
+    from .crawl_frontier import (
+        CrawlFrontier,
+        content_hash,
+        default_frontier_path,
+        frontier_enabled,
+    )
+except Exception:
+    from etl.crawl_frontier import (  # type: ignore
+        CrawlFrontier,
+        content_hash,
+        default_frontier_path,
+        frontier_enabled,
+    )
+
 # Import KNBS extractor and parser for economic data
 try:
     from extractors.government.knbs_extractor import KNBSExtractor
@@ -167,6 +211,9 @@ except Exception as e:
             return True
 
 
+from services.blob_store import SharedStore  # backend is on sys.path from here
+
+
 class NoopDatabaseLoader:
     async def load_audit_findings_document(self, document_record, findings):
         return 1
@@ -194,6 +241,17 @@ class KenyaDataPipeline:
         self.storage_path.mkdir(exist_ok=True)
         self.manifest_path = self.storage_path / "processed_manifest.json"
         self.processed_manifest = self._load_manifest()
+        # Concurrent jobs share one pipeline (services.etl_jobs._get_pipeline)
+        self._manifest_lock = threading.Lock()
+        # Per-URL validators/hashes so discovery only refetches what changed
+        self.frontier = (
+            CrawlFrontier(default_frontier_path(self.storage_path))
+            if frontier_enabled()
+            else None
+        )
+        self.crawl_stats = {"fetched": 0, "not_modified": 0, "replayed": 0}
+        # Pages fetched ahead of the BFS cursor during async discovery
+        self.discovery_window = max(1, int(os.getenv("DISCOVERY_WINDOW", "16")))
         self.extractor = DocumentExtractor()
         self.normalizer = DataNormalizer()
         self.audit_parser = AuditParser()
@@ -248,20 +306,9 @@ class KenyaDataPipeline:
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         warnings.simplefilter("ignore", urllib3.exceptions.InsecureRequestWarning)
 
-        # Optional object storage (S3-compatible)
-        self.s3 = None
-        self.s3_bucket = os.getenv("AWS_BUCKET_NAME")
-        self.s3_region = os.getenv("AWS_REGION", "us-east-1")
-        if boto3 and self.s3_bucket and os.getenv("AWS_ACCESS_KEY_ID"):
-            try:
-                self.s3 = boto3.client(
-                    "s3",
-                    region_name=self.s3_region,
-                    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-                    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                )
-            except Exception:
-                self.s3 = None
+        # Downloads go to the blob store shared with the other downloaders
+        # (local or S3, see services.blob_store); created on first use.
+        self._blob_store = None
 
         # Known Kenya government URLs (as of MVP)
         self.kenya_sources = {
@@ -367,12 +414,18 @@ class KenyaDataPipeline:
         try:
             import json as _json
 
-            self.manifest_path.write_text(
-                _json.dumps(self.processed_manifest, indent=2)
-            )
+            with self._manifest_lock:
+                data = _json.dumps(self.processed_manifest, indent=2)
+                self.manifest_path.write_text(data)
         except Exception:
             pass
 
+    def _record_processed(self, md5_hash: str, entry: Dict[str, Any]) -> None:
+        """Add ``entry`` to the processed manifest and persist it."""
+        with self._manifest_lock:
+            self.processed_manifest.setdefault("by_md5", {})[md5_hash] = entry
+        self._save_manifest()
+
     def _ssl_verify_for(self, source_key: str, insecure: bool = False):
         """Resolve verify parameter for requests based on source and security policy."""
         if insecure:
@@ -410,6 +463,120 @@ class KenyaDataPipeline:
             return None
         return None
 
+    def _new_fetcher(self) -> AsyncFetcher:
+        """Shared async HTTP client for one discovery pass (see ``async_discovery``)."""
+        return AsyncFetcher(
+            user_agent=self.http.headers.get("User-Agent", DEFAULT_USER_AGENT),
+            ca_bundles=(
+                {"knbs": str(self.knbs_ca_bundle)} if self.knbs_ca_bundle else None
+            ),
+        )
+
+    async def _crawl_page(
+        self,
+        fetcher: AsyncFetcher,
+        url: str,
+        source_key: str,
+        extract: Callable[[BeautifulSoup, str], Dict[str, Any]],
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Return ``(extraction, changed)`` for a listing page.
+
+        Goes through the crawl frontier: a page that is not yet due for a
+        revisit replays its stored extraction without a request; a due
+        page is revalidated with ``If-None-Match``/``If-Modified-Since``
+        and only re-parsed when the body actually changed. ``extract(soup,
+        url)`` must return JSON-serialisable data; it runs in a worker
+        thread.
+        Without a frontier (``CRAWL_FRONTIER_ENABLED=false``) every page
+        is fetched.
+        """
+
+        def parse(content: bytes) -> Dict[str, Any]:
+            return extract(parse_html(content), url)
+
+        entry = self.frontier.get(url) if self.frontier else None
+        cached = entry.extracted if entry else None
+        if entry is not None and not self.frontier.is_due(url, entry):
+            if cached is not None:
+                self.crawl_stats["replayed"] += 1
+            return cached, False
+
+        headers = (
+            self.frontier.conditional_headers(url, entry)
+            if self.frontier and cached
+            else None
+        )
+        resp = await fetcher.get(url, source_key, headers=headers)
+        if resp is None:
+            # Network failure: keep the stored state and use the last extraction
+            return cached, False
+        if self.frontier is None:
+            if resp.status_code != 200:
+                return None, False
+            self.crawl_stats["fetched"] += 1
+            return await asyncio.to_thread(parse, resp.content), True
+        if resp.status_code == 304 and cached is not None:
+            self.frontier.record(url, 304, resp.headers)
+            self.crawl_stats["not_modified"] += 1
+            return cached, False
+        if resp.status_code != 200:
+            self.frontier.record(url, resp.status_code, resp.headers)
+            return None, False
+
+        self.crawl_stats["fetched"] += 1
+        if cached is not None and entry.content_hash == content_hash(resp.content):
+            # Server ignored the validators but the body is identical
+            self.frontier.record(url, 200, resp.headers, resp.content)
+            return cached, False
+        extracted = await asyncio.to_thread(parse, resp.content)
+        changed = self.frontier.record(
+            url, 200, resp.headers, resp.content, extracted=extracted
+        )
+        return extracted, changed
+
+    async def _crawl(
+        self,
+        fetcher: AsyncFetcher,
+        source_key: str,
+        q: deque,
+        seen: set,
+        max_pages: int,
+        extract: Callable[[BeautifulSoup, str], Dict[str, Any]],
+    ) -> AsyncIterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """Breadth-first crawl of ``q``, yielding ``(item, extraction)`` in queue order.
+
+        Up to ``DISCOVERY_WINDOW`` queued pages are fetched ahead while the
+        caller processes earlier ones (the per-host limits in ``fetcher``
+        bound what actually hits the server). Items the caller appends to
+        ``q`` are picked up in FIFO order, so results match a sequential
+        crawl. Stops after ``max_pages`` pages were fetched successfully.
+        """
+        window: deque = deque()
+        done = 0
+        try:
+            while True:
+                while q and len(window) < self.discovery_window:
+                    if done + len(window) >= max_pages:
+                        break
+                    item = q.popleft()
+                    if item["url"] in seen:
+                        continue
+                    seen.add(item["url"])
+                    task = asyncio.ensure_future(
+                        self._crawl_page(fetcher, item["url"], source_key, extract)
+                    )
+                    window.append((item, task))
+                if not window:
+                    return
+                item, task = window.popleft()
+                page, _changed = await task
+                if page:
+                    done += 1
+                    yield item, page
+        finally:
+            for _, task in window:
+                task.cancel()
+
     def _resolve_pdfs_on_page(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Return list of absolute file URLs (pdf/xls/xlsx/csv/doc/docx/zip).
         Only include anchors that clearly reference files or recognized download endpoints/plugins.
@@ -493,7 +660,7 @@ class KenyaDataPipeline:
                 out.append(u)
         return out
 
-    def _discover_oag(self) -> List[Dict[str, Any]]:
+    async def _discover_oag(self, fetcher: AsyncFetcher) -> List[Dict[str, Any]]:
         """Discover OAG Financial Audit reports across nested National/County sections with breadcrumbs and level metadata."""
         source = self.kenya_sources["oag"]
         base = source["base_url"]
@@ -571,6 +738,7 @@ class KenyaDataPipeline:
         seen_pages: set[str] = set()
         collected: List[Dict[str, Any]] = []
         max_pages = 700
+        self.crawl_stats = dict.fromkeys(self.crawl_stats, 0)
         pages = 0
 
         def same_host(u: str) -> bool:
@@ -707,35 +875,45 @@ class KenyaDataPipeline:
                 Path(urlparse(fallback_url).path).name.replace("-", " ") or "Download"
             )
 
-        while q and pages < max_pages:
-            item = q.popleft()
-            url = item["url"]
-            if url in seen_pages:
-                continue
-            seen_pages.add(url)
-            soup = self._fetch_html(url, "oag")
-            if not soup:
-                continue
-            pages += 1
-
-            # Collect PDFs on page
+        def extract_page(soup: BeautifulSoup, _url: str) -> Dict[str, Any]:
+            """PDF links (with titles) and same-host child pages on one listing."""
+            docs: List[Dict[str, str]] = []
+            links: List[Dict[str, str]] = []
             for a in soup.find_all("a", href=True):
                 href = a["href"].strip()
                 if not is_http_link(href):
                     continue
-                if not re.search(r"\.pdf($|\?)", href, re.I):
-                    continue
                 resolved = self._resolve_url(href, base)
                 if not same_host(resolved):
                     continue
-                # Skip obviously broken or non-audit-like files by path heuristics
-                path_lower = (urlparse(resolved).path or "").lower()
-                if any(x in path_lower for x in ["/wp-json/", "/feed/", "/tag/"]):
+                if re.search(r"\.pdf($|\?)", href, re.I):
+                    # Skip obviously broken or non-audit-like files by path heuristics
+                    path_lower = (urlparse(resolved).path or "").lower()
+                    if any(x in path_lower for x in ["/wp-json/", "/feed/", "/tag/"]):
+                        continue
+                    docs.append(
+                        {"url": resolved, "title": best_title_for_link(a, resolved)}
+                    )
+                    continue
+                # Avoid enqueuing direct file links (pdfs) as pages
+                if re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", resolved, re.I):
                     continue
-                title = best_title_for_link(a, resolved)
+                links.append({"url": resolved, "text": a.get_text(strip=True) or ""})
+            return {"docs": docs, "links": links}
+
+        # Unchanged or not-yet-due pages come back from the crawl frontier
+        async for item, page in self._crawl(
+            fetcher, "oag", q, seen_pages, max_pages, extract_page
+        ):
+            url = item["url"]
+            pages += 1
+
+            # Collect PDFs on page
+            for doc in page["docs"]:
+                title = doc["title"]
                 collected.append(
                     {
-                        "url": resolved,
+                        "url": doc["url"],
                         "title": title,
                         "source": source["name"],
                         "source_key": "oag",
@@ -751,21 +929,13 @@ class KenyaDataPipeline:
                 )
 
             # Enqueue deeper pages (cards, categories, read-more)
-            for a in soup.find_all("a", href=True):
-                href = a["href"].strip()
-                if not is_http_link(href):
-                    continue
-                text = a.get_text(strip=True) or ""
-                resolved = self._resolve_url(href, base)
-                if not same_host(resolved):
-                    continue
+            for link in page["links"]:
+                resolved = link["url"]
+                text = link["text"]
                 if resolved in seen_pages:
                     continue
                 if text.lower() in generic_nav:
                     continue
-                # Avoid enqueuing direct file links (pdfs) as pages
-                if re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", resolved, re.I):
-                    continue
                 if should_enqueue(resolved, text):
                     crumbs = item.get("breadcrumbs", [])
                     t = text.strip()
@@ -787,80 +957,98 @@ class KenyaDataPipeline:
                             "breadcrumbs": new_crumbs,
                         }
                     )
+        logger.info(
+            "OAG crawl: %d pages (%d fetched, %d not modified, %d replayed)",
+            pages,
+            self.crawl_stats["fetched"],
+            self.crawl_stats["not_modified"],
+            self.crawl_stats["replayed"],
+        )
 
         # Augment with WordPress REST API — OAG document pages now use JS-rendered
         # DataTables so PDF links are invisible to HTML crawling.  The WP REST API
         # /wp-json/wp/v2/media still returns the actual PDF media objects.
-        def _collect_from_oag_wp_rest() -> None:
+        async def _collect_wp_term(term: str) -> List[Dict[str, Any]]:
             api_base = f"{base}/wp-json/wp/v2/media"
             per_page = 100
-            search_terms = ["audit", "report", "county", "national", "summary"]
-            seen_urls: set[str] = {d["url"] for d in collected}
-            for term in search_terms:
-                page = 1
-                while page <= 20:
-                    try:
-                        resp = self.http.get(
+            found: List[Dict[str, Any]] = []
+            page = 1
+            while page <= 20:
+                try:
+                    resp = await fetcher.get(
+                        api_base,
+                        "oag",
+                        params={
+                            "per_page": per_page,
+                            "page": page,
+                            "mime_type": "application/pdf",
+                            "search": term,
+                        },
+                        timeout=30,
+                    )
+                    if resp is not None and resp.status_code == 400:
+                        # Fallback: some WP versions reject mime_type filter
+                        resp = await fetcher.get(
                             api_base,
+                            "oag",
                             params={
                                 "per_page": per_page,
                                 "page": page,
-                                "mime_type": "application/pdf",
+                                "media_type": "file",
                                 "search": term,
                             },
                             timeout=30,
                         )
-                        if resp.status_code == 400:
-                            # Fallback: some WP versions reject mime_type filter
-                            resp = self.http.get(
-                                api_base,
-                                params={
-                                    "per_page": per_page,
-                                    "page": page,
-                                    "media_type": "file",
-                                    "search": term,
+                    resp.raise_for_status()
+                    arr = resp.json()
+                except Exception:
+                    break
+                if not isinstance(arr, list) or not arr:
+                    break
+                for it in arr:
+                    try:
+                        src = it.get("source_url") or ""
+                        if not src or not re.search(r"\.pdf($|\?)", src, re.I):
+                            continue
+                        title = (
+                            (it.get("title") or {}).get("rendered")
+                            if isinstance(it.get("title"), dict)
+                            else it.get("title")
+                        ) or Path(urlparse(src).path).name
+                        found.append(
+                            {
+                                "url": src,
+                                "title": title,
+                                "source": source["name"],
+                                "source_key": "oag",
+                                "doc_type": "audit",
+                                "discovered_date": datetime.now().isoformat(),
+                                "meta": {
+                                    "breadcrumbs": ["wp-json", term],
+                                    "year": extract_year(title),
                                 },
-                                timeout=30,
-                            )
-                        resp.raise_for_status()
-                        arr = resp.json()
+                            }
+                        )
                     except Exception:
-                        break
-                    if not isinstance(arr, list) or not arr:
-                        break
-                    for it in arr:
-                        try:
-                            src = it.get("source_url") or ""
-                            if not src or src in seen_urls:
-                                continue
-                            if not re.search(r"\.pdf($|\?)", src, re.I):
-                                continue
-                            title = (
-                                (it.get("title") or {}).get("rendered")
-                                if isinstance(it.get("title"), dict)
-                                else it.get("title")
-                            ) or Path(urlparse(src).path).name
-                            seen_urls.add(src)
-                            collected.append(
-                                {
-                                    "url": src,
-                                    "title": title,
-                                    "source": source["name"],
-                                    "source_key": "oag",
-                                    "doc_type": "audit",
-                                    "discovered_date": datetime.now().isoformat(),
-                                    "meta": {
-                                        "breadcrumbs": ["wp-json", term],
-                                        "year": extract_year(title),
-                                    },
-                                }
-                            )
-                        except Exception:
-                            continue
-                    page += 1
+                        continue
+                page += 1
+            return found
 
+        # The search terms are paged independently, so they run concurrently;
+        # results are merged in term order.
         try:
-            _collect_from_oag_wp_rest()
+            seen_urls: set[str] = {d["url"] for d in collected}
+            per_term = await asyncio.gather(
+                *(
+                    _collect_wp_term(t)
+                    for t in ["audit", "report", "county", "national", "summary"]
+                )
+            )
+            for docs in per_term:
+                for d in docs:
+                    if d["url"] not in seen_urls:
+                        seen_urls.add(d["url"])
+                        collected.append(d)
         except Exception:
             pass  # Non-fatal: HTML crawl results are still usable
 
@@ -869,7 +1057,7 @@ class KenyaDataPipeline:
             unique.setdefault(d["url"], d)
         return list(unique.values())
 
-    def _discover_cob(self) -> List[Dict[str, Any]]:
+    async def _discover_cob(self, fetcher: AsyncFetcher) -> List[Dict[str, Any]]:
         """Discover COB reports/templates from the exact sections; robust to slow/SSL issues."""
         source = self.kenya_sources["cob"]
         base = source["base_url"]
@@ -910,7 +1098,6 @@ class KenyaDataPipeline:
         seen: set[str] = set()
         collected: List[Dict[str, Any]] = []
         max_pages = 800
-        pages = 0
 
         def same_host(u: str) -> bool:
             try:
@@ -971,17 +1158,9 @@ class KenyaDataPipeline:
                 return True
             return False
 
-        while q and pages < max_pages:
-            item = q.popleft()
-            url = item["url"]
-            if url in seen:
-                continue
-            seen.add(url)
-            soup = self._fetch_html(url, "cob")
-            if not soup:
-                continue
-            pages += 1
-
+        def extract_page(soup: BeautifulSoup, _url: str) -> Dict[str, Any]:
+            """Same-host, non-media links on one listing page."""
+            links: List[Dict[str, str]] = []
             for a in soup.find_all("a", href=True):
                 href = a["href"].strip()
                 if not is_http_link(href):
@@ -989,12 +1168,23 @@ class KenyaDataPipeline:
                 resolved = self._resolve_url(href, base)
                 if not same_host(resolved):
                     continue
-                text = (a.get_text(strip=True) or "").strip()
                 # Ignore obvious image/media files
                 if re.search(
                     r"\.(png|jpe?g|gif|mp4|webm|avi|svg)($|\?)", resolved, re.I
                 ):
                     continue
+                links.append(
+                    {"url": resolved, "text": (a.get_text(strip=True) or "").strip()}
+                )
+            return {"links": links}
+
+        async for item, page in self._crawl(
+            fetcher, "cob", q, seen, max_pages, extract_page
+        ):
+            url = item["url"]
+            for link in page["links"]:
+                resolved = link["url"]
+                text = link["text"]
                 if looks_like_download(resolved):
                     collected.append(
                         {
@@ -1021,12 +1211,19 @@ class KenyaDataPipeline:
         # Attempt to augment via sitemap(s) recursively
         visited_sm: set[str] = set()
 
-        def _collect_from_sitemap(sm_url: str, depth: int = 0) -> None:
+        async def _files_on_page(u: str) -> List[str]:
+            resp = await fetcher.get(u, "cob")
+            if resp is None or resp.status_code != 200:
+                return []
+            soup = await asyncio.to_thread(parse_html, resp.content)
+            return self._resolve_pdfs_on_page(soup, base)
+
+        async def _collect_from_sitemap(sm_url: str, depth: int = 0) -> None:
             if depth > 3 or not sm_url or sm_url in visited_sm:
                 return
             visited_sm.add(sm_url)
             try:
-                resp = self.http.get(sm_url, timeout=30)
+                resp = await fetcher.get(sm_url, "cob", timeout=30)
                 resp.raise_for_status()
                 root = ET.fromstring(resp.content)
             except Exception:
@@ -1037,9 +1234,11 @@ class KenyaDataPipeline:
                 for loc in root.findall(".//{*}sitemap/{*}loc"):
                     nxt = (loc.text or "").strip()
                     if nxt:
-                        _collect_from_sitemap(nxt, depth + 1)
+                        await _collect_from_sitemap(nxt, depth + 1)
                 return
 
+            page_urls: List[str] = []
+            direct_file: Optional[Dict[str, Any]] = None
             for loc in root.findall(".//{*}url/{*}loc"):
                 u = (loc.text or "").strip()
                 if not u:
@@ -1055,24 +1254,26 @@ class KenyaDataPipeline:
                     re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", u, re.I)
                     or "/download/" in u
                 ):
-                    collected.append(
-                        {
-                            "url": u,
-                            "title": Path(pu.path).name,
-                            "source": source["name"],
-                            "source_key": "cob",
-                            "doc_type": "report",
-                            "discovered_date": datetime.now().isoformat(),
-                            "meta": {"breadcrumbs": ["sitemap"]},
-                            "referrer": sm_url,
-                        }
-                    )
-                    return
+                    direct_file = {
+                        "url": u,
+                        "title": Path(pu.path).name,
+                        "source": source["name"],
+                        "source_key": "cob",
+                        "doc_type": "report",
+                        "discovered_date": datetime.now().isoformat(),
+                        "meta": {"breadcrumbs": ["sitemap"]},
+                        "referrer": sm_url,
+                    }
+                    break
                 # Otherwise, many WP sitemaps list attachment pages. Fetch page and extract file links
-                soup = self._fetch_html(u, "cob")
-                if not soup:
-                    continue
-                for f in self._resolve_pdfs_on_page(soup, base):
+                page_urls.append(u)
+
+            # Attachment pages are fetched concurrently (per-host limits apply)
+            files_per_page = await asyncio.gather(
+                *(_files_on_page(u) for u in page_urls)
+            )
+            for u, files in zip(page_urls, files_per_page):
+                for f in files:
                     collected.append(
                         {
                             "url": f,
@@ -1085,16 +1286,89 @@ class KenyaDataPipeline:
                             "referrer": u,
                         }
                     )
+            if direct_file:
+                collected.append(direct_file)
 
         for sm in [
             urljoin(base + "/", "/sitemap_index.xml"),
             urljoin(base + "/", "/sitemap.xml"),
             urljoin(base + "/", "/wp-sitemap.xml"),  # WP 5.5+ default
         ]:
-            _collect_from_sitemap(sm)
+            await _collect_from_sitemap(sm)
 
         # Attempt to augment via WordPress REST API for media (PDFs/XLS etc.)
-        def _collect_from_wp_rest() -> None:
+        async def _collect_wp_mime(ep: str, mime: str) -> List[Dict[str, Any]]:
+            per_page = 100
+            found: List[Dict[str, Any]] = []
+            page = 1
+            while page <= 20:
+                try:
+                    resp = await fetcher.get(
+                        ep,
+                        "cob",
+                        params={
+                            "per_page": per_page,
+                            "page": page,
+                            "mime_type": mime,
+                        },
+                        timeout=30,
+                    )
+                    if (
+                        resp is not None
+                        and resp.status_code == 400
+                        and "mime_type" in resp.text.lower()
+                    ):
+                        # Some WP versions use 'media_type=file' and filter via search; try without mime filter
+                        resp = await fetcher.get(
+                            ep,
+                            "cob",
+                            params={
+                                "per_page": per_page,
+                                "page": page,
+                                "media_type": "file",
+                            },
+                            timeout=30,
+                        )
+                    resp.raise_for_status()
+                    arr = resp.json()
+                except Exception:
+                    break
+                if not isinstance(arr, list) or not arr:
+                    break
+                for it in arr:
+                    try:
+                        src = it.get("source_url") or ""
+                        if not src:
+                            continue
+                        pu = urlparse(src)
+                        if pu.netloc.replace("www.", "") != host:
+                            continue
+                        if not re.search(
+                            r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", src, re.I
+                        ):
+                            continue
+                        title = (
+                            (it.get("title") or {}).get("rendered")
+                            if isinstance(it.get("title"), dict)
+                            else it.get("title")
+                        ) or Path(pu.path).name
+                        found.append(
+                            {
+                                "url": src,
+                                "title": title,
+                                "source": source["name"],
+                                "source_key": "cob",
+                                "doc_type": "report",
+                                "discovered_date": datetime.now().isoformat(),
+                                "meta": {"breadcrumbs": ["wp-json"]},
+                            }
+                        )
+                    except Exception:
+                        continue
+                page += 1
+            return found
+
+        async def _collect_from_wp_rest() -> None:
             endpoints = [
                 # Core media endpoint
                 urljoin(base + "/", "/wp-json/wp/v2/media"),
@@ -1108,75 +1382,14 @@ class KenyaDataPipeline:
                 "application/msword",
                 "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             ]
-            per_page = 100
-            for ep in endpoints:
-                for mime in exts:
-                    page = 1
-                    while page <= 20:
-                        try:
-                            resp = self.http.get(
-                                ep,
-                                params={
-                                    "per_page": per_page,
-                                    "page": page,
-                                    "mime_type": mime,
-                                },
-                                timeout=30,
-                            )
-                            if (
-                                resp.status_code == 400
-                                and "mime_type" in resp.text.lower()
-                            ):
-                                # Some WP versions use 'media_type=file' and filter via search; try without mime filter
-                                alt = self.http.get(
-                                    ep,
-                                    params={
-                                        "per_page": per_page,
-                                        "page": page,
-                                        "media_type": "file",
-                                    },
-                                    timeout=30,
-                                )
-                                resp = alt
-                            resp.raise_for_status()
-                            arr = resp.json()
-                        except Exception:
-                            break
-                        if not isinstance(arr, list) or not arr:
-                            break
-                        for it in arr:
-                            try:
-                                src = it.get("source_url") or ""
-                                if not src:
-                                    continue
-                                pu = urlparse(src)
-                                if pu.netloc.replace("www.", "") != host:
-                                    continue
-                                if not re.search(
-                                    r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", src, re.I
-                                ):
-                                    continue
-                                title = (
-                                    (it.get("title") or {}).get("rendered")
-                                    if isinstance(it.get("title"), dict)
-                                    else it.get("title")
-                                ) or Path(pu.path).name
-                                collected.append(
-                                    {
-                                        "url": src,
-                                        "title": title,
-                                        "source": source["name"],
-                                        "source_key": "cob",
-                                        "doc_type": "report",
-                                        "discovered_date": datetime.now().isoformat(),
-                                        "meta": {"breadcrumbs": ["wp-json"]},
-                                    }
-                                )
-                            except Exception:
-                                continue
-                        page += 1
+            # Each MIME type is paged independently; merge in declaration order
+            per_mime = await asyncio.gather(
+                *(_collect_wp_mime(ep, mime) for ep in endpoints for mime in exts)
+            )
+            for docs in per_mime:
+                collected.extend(docs)
 
-        _collect_from_wp_rest()
+        await _collect_from_wp_rest()
 
         # Dedupe
         uniq: Dict[str, Dict[str, Any]] = {}
@@ -1247,7 +1460,7 @@ class KenyaDataPipeline:
             logger.error(traceback.format_exc())
             return []
 
-    def _discover_treasury(self) -> List[Dict[str, Any]]:
+    async def _discover_treasury(self, fetcher: AsyncFetcher) -> List[Dict[str, Any]]:
         source = self.kenya_sources["treasury"]
         base = source["base_url"]
 
@@ -1278,7 +1491,6 @@ class KenyaDataPipeline:
         seen_pages: set[str] = set()
         collected: List[Dict[str, Any]] = []
         max_pages = 300
-        pages = 0
 
         # Accept both old and new treasury hosts
         accepted_hosts = {"treasury.go.ke", "newsite.treasury.go.ke"}
@@ -1379,30 +1591,39 @@ class KenyaDataPipeline:
             "appointment",
         }
 
-        while q and pages < max_pages:
-            item = q.popleft()
-            url = item["url"]
-            if url in seen_pages:
-                continue
-            seen_pages.add(url)
-            soup = self._fetch_html(url, "treasury")
-            if not soup:
-                continue
-            pages += 1
-
-            # Collect file links on page
+        def extract_page(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+            """File links and same-host links on one page, resolved against it."""
+            files: List[Dict[str, str]] = []
+            links: List[Dict[str, str]] = []
             for a in soup.find_all("a", href=True):
                 href = a["href"].strip()
                 if not is_http_link(href):
                     continue
-                if not re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", href, re.I):
-                    continue
                 # Resolve relative URLs against the *current page* URL (not source base)
                 # so that /sites/default/files/... on newsite.treasury resolves correctly
                 resolved = self._resolve_url(href, url)
                 if not same_host(resolved):
                     continue
-                title = a.get_text(strip=True) or Path(urlparse(resolved).path).name
+                text = a.get_text(strip=True) or ""
+                if re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", href, re.I):
+                    files.append(
+                        {
+                            "url": resolved,
+                            "title": text or Path(urlparse(resolved).path).name,
+                        }
+                    )
+                links.append({"url": resolved, "text": text})
+            return {"files": files, "links": links}
+
+        async for item, page in self._crawl(
+            fetcher, "treasury", q, seen_pages, max_pages, extract_page
+        ):
+            url = item["url"]
+
+            # Collect file links on page
+            for f in page["files"]:
+                resolved = f["url"]
+                title = f["title"]
                 lt = (title or "").lower()
                 lp = (resolved or "").lower()
                 if any(term in lt or term in lp for term in exclude_terms):
@@ -1424,14 +1645,9 @@ class KenyaDataPipeline:
                 )
 
             # Enqueue deeper listing/category/menu links
-            for a in soup.find_all("a", href=True):
-                href = a["href"].strip()
-                if not is_http_link(href):
-                    continue
-                resolved = self._resolve_url(href, url)
-                if not same_host(resolved):
-                    continue
-                text = a.get_text(strip=True) or ""
+            for link in page["links"]:
+                resolved = link["url"]
+                text = link["text"]
                 if looks_like_list_link(resolved, text):
                     if resolved not in seen_pages:
                         crumbs = item.get("breadcrumbs", [])
@@ -1449,29 +1665,7 @@ class KenyaDataPipeline:
             uniq.setdefault(d["url"], d)
         return list(uniq.values())
 
-    def _s3_key_for(self, source_key: str, md5_hash: str, filename: str) -> str:
-        return f"documents/{source_key}/{md5_hash[:2]}/{md5_hash}/{filename}"
-
-    def _maybe_upload_to_s3(
-        self, file_path: Path, md5_hash: str, source_key: str, content_type: str
-    ) -> Optional[str]:
-        if not self.s3 or not self.s3_bucket:
-            return None
-        key = self._s3_key_for(source_key, md5_hash, file_path.name)
-        try:
-            # Check existence
-            try:
-                self.s3.head_object(Bucket=self.s3_bucket, Key=key)
-                return key  # already present
-            except ClientError:
-                pass
-            extra_args = {"ContentType": content_type} if content_type else {}
-            self.s3.upload_file(
-                str(file_path), self.s3_bucket, key, ExtraArgs=extra_args
-            )
-            return key
-        except Exception:
-            return None
+    blobs = SharedStore()
 
     def select_treasury_batch(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Select a small batch from Treasury: latest 10 QEBR + 3 ABP + 5 Circulars.
@@ -1575,19 +1769,64 @@ class KenyaDataPipeline:
     def discover_budget_documents(
         self, source_key: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Public discovery API used by backend: returns discovered docs for a given source or all."""
-        keys = [source_key] if source_key else ["treasury", "cob", "oag", "knbs"]
-        out: List[Dict[str, Any]] = []
-        for k in keys:
+        """Public discovery API used by backend: returns discovered docs for a given source or all.
+
+        Blocking wrapper around :meth:`discover_budget_documents_async`;
+        async callers should await that directly.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.discover_budget_documents_async(source_key))
+        # Called from inside an event loop: run the crawl on a private one
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(
+                asyncio.run, self.discover_budget_documents_async(source_key)
+            ).result()
+
+    async def discover_budget_documents_async(
+        self,
+        source_key: Union[str, Sequence[str], None] = None,
+        fetcher: Optional[AsyncFetcher] = None,
+    ) -> List[Dict[str, Any]]:
+        """Crawl one, several or all sources concurrently over one shared client.
+
+        Results keep the source order of the request (treasury, cob, oag,
+        knbs by default). KNBS discovery goes through its own extractor in
+        a worker thread.
+        """
+        if source_key is None:
+            keys = ["treasury", "cob", "oag", "knbs"]
+        elif isinstance(source_key, str):
+            keys = [source_key]
+        else:
+            keys = list(source_key)
+
+        async def _one(k: str, f: AsyncFetcher) -> List[Dict[str, Any]]:
             if k == "treasury":
-                out.extend(self._discover_treasury())
-            elif k == "cob":
-                out.extend(self._discover_cob())
-            elif k == "oag":
-                out.extend(self._discover_oag())
-            elif k == "knbs":
-                out.extend(self._discover_knbs())
-        return out
+                return await self._discover_treasury(f)
+            if k == "cob":
+                return await self._discover_cob(f)
+            if k == "oag":
+                return await self._discover_oag(f)
+            if k == "knbs":
+                return await asyncio.to_thread(self._discover_knbs)
+            return []
+
+        if fetcher is None:
+            async with self._new_fetcher() as own:
+                results = await gather_in_order(_one(k, own) for k in keys)
+        else:
+            results = await gather_in_order(_one(k, fetcher) for k in keys)
+        return [d for docs in results for d in docs]
+
+    def browser_session(self):
+        """Scope for a run of ``download_and_process_document`` calls.
+
+        Headless COB downloads share pooled browsers for the whole run;
+        they are closed when the outermost session on the loop ends.
+        """
+        return browser_session()
 
     async def download_and_process_document(
         self, doc_info: Dict[str, Any]
@@ -1718,124 +1957,143 @@ class KenyaDataPipeline:
                         url = best_url
                         doc_info["url"] = url
 
-            # Download the document (with SSL fallback for OAG/COB and Referer if present)
             source_key = doc_info.get("source_key") or ""
             referrer = doc_info.get("referrer") or (doc_info.get("meta") or {}).get(
                 "referrer"
             )
-            if source_key in {"oag", "cob"}:
-                try:
-                    response = _get(url, source_key, referrer, insecure=False)
-                    response.raise_for_status()
-                except Exception:
-                    response = _get(url, source_key, referrer, insecure=True)
-                    response.raise_for_status()
+            # A URL any downloader fetched within the crawl frontier's minimum
+            # revisit interval is served from the shared blob store; older
+            # entries (and every URL without a frontier) are fetched again.
+            requested_url = url
+            stored = self.blobs.lookup_url(
+                url, max_age=self.frontier.min_interval if self.frontier else 0
+            )
+            if stored is not None:
+                content = stored.read_bytes()
+                ctype = stored.content_type or ""
+                resp_headers = {}
             else:
-                response = _get(url, source_key, referrer, insecure=False)
-            response.raise_for_status()
+                # Download the document (with SSL fallback for OAG/COB and Referer if present)
+                if source_key in {"oag", "cob"}:
+                    try:
+                        response = _get(url, source_key, referrer, insecure=False)
+                        response.raise_for_status()
+                    except Exception:
+                        response = _get(url, source_key, referrer, insecure=True)
+                        response.raise_for_status()
+                else:
+                    response = _get(url, source_key, referrer, insecure=False)
+                response.raise_for_status()
 
-            content = response.content
-            ctype = (response.headers.get("content-type") or "").lower()
+                content = response.content
+                ctype = (response.headers.get("content-type") or "").lower()
 
-            # If server returned HTML for a download URL, try to resolve actual file links from that HTML
-            if (
-                "text/html" in ctype
-                or content[:256].lstrip().lower().startswith(b"<html")
-                or content[:256].lstrip().lower().startswith(b"<!doctype html")
-            ) and not re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", url, re.I):
-                try:
-                    soup = BeautifulSoup(content, "html.parser")
-                    candidates = self._resolve_pdfs_on_page(
-                        soup,
-                        self.kenya_sources.get(source_key, {}).get("base_url", ""),
-                    )
-                    # Fallback: WordPress Download Manager pages often require hitting ?wpdmdl=<ID>
-                    if not candidates:
-                        try:
-                            html_text = content.decode("utf-8", "ignore")
-                        except Exception:
-                            html_text = ""
-                        wpd_ids = set(re.findall(r"wpdmdl=(\d+)", html_text, re.I))
-                        base_root = (
-                            self.kenya_sources.get(source_key, {})
-                            .get("base_url", "")
-                            .rstrip("/")
-                        )
-                        for wid in wpd_ids:
-                            for suffix in [
-                                f"/?wpdmdl={wid}",
-                                f"/?wpdmdl={wid}&refresh=1",
-                            ]:
-                                cand_url = base_root + suffix
-                                if cand_url not in candidates:
-                                    candidates.append(cand_url)
-                    # Headless fallback (COB only) if still no direct candidates
-                    if source_key == "cob" and not candidates and headless_allowed():
-                        try:
-                            headless_res = await fetch_cob_download(url)
-                            if headless_res:
-                                data_bytes, inferred_name = headless_res
-                                if data_bytes and (
-                                    data_bytes.startswith(b"%PDF")
-                                    or len(data_bytes) > 2048
-                                ):
-                                    content = data_bytes
-                                    ctype = (
-                                        "application/pdf"
-                                        if data_bytes.startswith(b"%PDF")
-                                        else ctype
-                                    )
-                                    # Provide synthetic filename via doc_info
-                                    if inferred_name:
-                                        doc_info["title"] = (
-                                            doc_info.get("title") or inferred_name
-                                        )
-                                    # Mark URL variant to avoid re-processing loops
-                                    doc_info["url"] = url + "#headless"
-                                    candidates = (
-                                        []
-                                    )  # ensure normal candidate loop skipped
-                        except Exception:
-                            pass
-                    if candidates:
-                        # Reuse same ranking logic
-                        ranked = sorted(
-                            candidates,
-                            key=lambda u: _score_candidate(
-                                u, doc_info.get("title", "")
-                            ),
-                            reverse=True,
+                # If server returned HTML for a download URL, try to resolve actual file links from that HTML
+                if (
+                    "text/html" in ctype
+                    or content[:256].lstrip().lower().startswith(b"<html")
+                    or content[:256].lstrip().lower().startswith(b"<!doctype html")
+                ) and not re.search(r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", url, re.I):
+                    try:
+                        soup = BeautifulSoup(content, "html.parser")
+                        candidates = self._resolve_pdfs_on_page(
+                            soup,
+                            self.kenya_sources.get(source_key, {}).get("base_url", ""),
                         )
-                        tried = 0
-                        for cand in ranked[:5]:
-                            tried += 1
+                        # Fallback: WordPress Download Manager pages often require hitting ?wpdmdl=<ID>
+                        if not candidates:
                             try:
-                                r2 = _get(
-                                    cand,
-                                    source_key,
-                                    referrer,
-                                    insecure=(source_key in {"oag", "cob"}),
-                                )
-                                r2.raise_for_status()
-                                data = r2.content
-                                ctype2 = (r2.headers.get("content-type") or "").lower()
-                                if (b"%PDF" in data[:512]) or re.search(
-                                    r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", cand, re.I
-                                ):
-                                    # accept likely file
-                                    url = cand
-                                    doc_info["url"] = url
-                                    response = r2
-                                    content = data
-                                    ctype = ctype2
-                                    break
+                                html_text = content.decode("utf-8", "ignore")
                             except Exception:
-                                continue
-                        else:
-                            # no acceptable candidate
-                            pass
-                except Exception:
-                    pass
+                                html_text = ""
+                            wpd_ids = set(re.findall(r"wpdmdl=(\d+)", html_text, re.I))
+                            base_root = (
+                                self.kenya_sources.get(source_key, {})
+                                .get("base_url", "")
+                                .rstrip("/")
+                            )
+                            for wid in wpd_ids:
+                                for suffix in [
+                                    f"/?wpdmdl={wid}",
+                                    f"/?wpdmdl={wid}&refresh=1",
+                                ]:
+                                    cand_url = base_root + suffix
+                                    if cand_url not in candidates:
+                                        candidates.append(cand_url)
+                        # Headless fallback (COB only) if still no direct candidates
+                        if (
+                            source_key == "cob"
+                            and not candidates
+                            and headless_allowed()
+                        ):
+                            try:
+                                headless_res = await fetch_cob_download(url)
+                                if headless_res:
+                                    data_bytes, inferred_name = headless_res
+                                    if data_bytes and (
+                                        data_bytes.startswith(b"%PDF")
+                                        or len(data_bytes) > 2048
+                                    ):
+                                        content = data_bytes
+                                        ctype = (
+                                            "application/pdf"
+                                            if data_bytes.startswith(b"%PDF")
+                                            else ctype
+                                        )
+                                        # Provide synthetic filename via doc_info
+                                        if inferred_name:
+                                            doc_info["title"] = (
+                                                doc_info.get("title") or inferred_name
+                                            )
+                                        # Mark URL variant to avoid re-processing loops
+                                        doc_info["url"] = url + "#headless"
+                                        candidates = (
+                                            []
+                                        )  # ensure normal candidate loop skipped
+                            except Exception:
+                                pass
+                        if candidates:
+                            # Reuse same ranking logic
+                            ranked = sorted(
+                                candidates,
+                                key=lambda u: _score_candidate(
+                                    u, doc_info.get("title", "")
+                                ),
+                                reverse=True,
+                            )
+                            tried = 0
+                            for cand in ranked[:5]:
+                                tried += 1
+                                try:
+                                    r2 = _get(
+                                        cand,
+                                        source_key,
+                                        referrer,
+                                        insecure=(source_key in {"oag", "cob"}),
+                                    )
+                                    r2.raise_for_status()
+                                    data = r2.content
+                                    ctype2 = (
+                                        r2.headers.get("content-type") or ""
+                                    ).lower()
+                                    if (b"%PDF" in data[:512]) or re.search(
+                                        r"\.(pdf|xlsx?|csv|docx?|zip)($|\?)", cand, re.I
+                                    ):
+                                        # accept likely file
+                                        url = cand
+                                        doc_info["url"] = url
+                                        response = r2
+                                        content = data
+                                        ctype = ctype2
+                                        break
+                                except Exception:
+                                    continue
+                            else:
+                                # no acceptable candidate
+                                pass
+                    except Exception:
+                        pass
+                resp_headers = response.headers
 
             # Final sanity: ensure we didn't fetch HTML masquerading as a file
             if ("text/html" in ctype) or (
@@ -1845,6 +2103,28 @@ class KenyaDataPipeline:
                 raise RuntimeError("Resolved URL returned HTML, not a document file")
             md5_hash = hashlib.md5(content).hexdigest()
 
+            # Store content-addressed in the shared blob store (indexing the URL
+            # even when the manifest says the content was processed already)
+            url_path_name = Path(urlparse(url).path).name
+            # Try to infer filename from headers when missing
+            cd = resp_headers.get("content-disposition", "")
+            guessed = None
+            if "filename=" in cd:
+                guessed = cd.split("filename=")[-1].strip("\"' ")
+            if not url_path_name and guessed:
+                url_path_name = guessed
+            blob = self.blobs.put(
+                content,
+                url=url,
+                content_type=ctype or None,
+                name=url_path_name,
+                pin=f"document:{md5_hash}",
+            )
+            if requested_url != url:
+                self.blobs.alias(requested_url, blob.sha256)
+            file_path = blob.path
+            s3_key = self.blobs.remote_key(blob)
+
             # Skip if already processed (cache manifest)
             cached = self.processed_manifest.get("by_md5", {}).get(md5_hash)
             if cached:
@@ -1856,38 +2136,8 @@ class KenyaDataPipeline:
                     "skipped": True,
                 }
 
-            # Save to local storage with a robust filename
-            url_path_name = Path(urlparse(url).path).name
-            # Try to infer filename from headers when missing
-            cd = response.headers.get("content-disposition", "")
-            guessed = None
-            if "filename=" in cd:
-                guessed = cd.split("filename=")[-1].strip("\"' ")
-            if not url_path_name and guessed:
-                url_path_name = guessed
-            if not url_path_name:
-                # fallback default
-                url_path_name = (
-                    "document.pdf"
-                    if "pdf" in response.headers.get("content-type", "").lower()
-                    else "document.bin"
-                )
-            filename = f"{doc_info['source_key']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{url_path_name}"
-            file_path = self.storage_path / filename
-
-            with open(file_path, "wb") as f:
-                f.write(content)
-
             logger.info(f"Downloaded: {doc_info['title']} -> {file_path}")
 
-            # Optional: upload to S3-compatible storage
-            s3_key = self._maybe_upload_to_s3(
-                file_path,
-                md5_hash,
-                doc_info.get("source_key", "unknown"),
-                response.headers.get("content-type", "application/octet-stream"),
-            )
-
             # Extract structured data from PDF
             extraction_result = self.extractor.extract_with_fallback(str(file_path))
 
@@ -2195,17 +2445,19 @@ class KenyaDataPipeline:
                 normalized_data = validated_data
 
             # Update manifest
-            self.processed_manifest.setdefault("by_md5", {})[md5_hash] = {
-                "document_id": doc_id,
-                "file_path": str(file_path),
-                "url": doc_info["url"],
-                "title": doc_info["title"],
-                "source": doc_info["source"],
-                "doc_type": doc_info["doc_type"],
-                "fetched": datetime.now().isoformat(),
-                "s3_key": s3_key,
-            }
-            self._save_manifest()
+            self._record_processed(
+                md5_hash,
+                {
+                    "document_id": doc_id,
+                    "file_path": str(file_path),
+                    "url": doc_info["url"],
+                    "title": doc_info["title"],
+                    "source": doc_info["source"],
+                    "doc_type": doc_info["doc_type"],
+                    "fetched": datetime.now().isoformat(),
+                    "s3_key": s3_key,
+                },
+            )
 
             return {
                 "document_id": doc_id,
@@ -2239,57 +2491,62 @@ class KenyaDataPipeline:
         # Process each major source (with smart scheduling)
         all_sources = ["treasury", "cob", "oag", "knbs"]  # Current active sources
 
-        for source_key in all_sources:
-            # Check if source should run today
-            should_run, reason = self.scheduler.should_run(source_key)
+        async with self.browser_session():
+            for source_key in all_sources:
+                # Check if source should run today
+                should_run, reason = self.scheduler.should_run(source_key)
 
-            pipeline_results["scheduler_decisions"][source_key] = {
-                "should_run": should_run,
-                "reason": reason,
-            }
+                pipeline_results["scheduler_decisions"][source_key] = {
+                    "should_run": should_run,
+                    "reason": reason,
+                }
 
-            if not should_run:
-                logger.info(f"⏸️  Skipping {source_key}: {reason}")
-                next_run, next_reason = self.scheduler.get_next_run(source_key)
-                logger.info(f"   Next run scheduled for: {next_run} - {next_reason}")
-                continue
+                if not should_run:
+                    logger.info(f"⏸️  Skipping {source_key}: {reason}")
+                    next_run, next_reason = self.scheduler.get_next_run(source_key)
+                    logger.info(
+                        f"   Next run scheduled for: {next_run} - {next_reason}"
+                    )
+                    continue
 
-            logger.info(f"✅ Processing source: {source_key} - {reason}")
+                logger.info(f"✅ Processing source: {source_key} - {reason}")
 
-            try:
-                # Discover documents
-                discovered_docs = self.discover_budget_documents(source_key)
-
-                source_results = {
-                    "discovered": len(discovered_docs),
-                    "processed": 0,
-                    "successful": 0,
-                    "documents": [],
-                    "schedule_reason": reason,
-                }
+                try:
+                    # Discover documents
+                    discovered_docs = self.discover_budget_documents(source_key)
+
+                    source_results = {
+                        "discovered": len(discovered_docs),
+                        "processed": 0,
+                        "successful": 0,
+                        "documents": [],
+                        "schedule_reason": reason,
+                    }
 
-                # Process each document (limit to recent ones for MVP)
-                recent_docs = discovered_docs[:5]  # Limit to 5 most recent per source
+                    # Process each document (limit to recent ones for MVP)
+                    recent_docs = discovered_docs[
+                        :5
+                    ]  # Limit to 5 most recent per source
 
-                for doc_info in recent_docs:
-                    result = await self.download_and_process_document(doc_info)
-                    source_results["processed"] += 1
+                    for doc_info in recent_docs:
+                        result = await self.download_and_process_document(doc_info)
+                        source_results["processed"] += 1
 
-                    if result:
-                        source_results["successful"] += 1
-                        source_results["documents"].append(result["document_id"])
-                        pipeline_results["successful_extractions"] += 1
+                        if result:
+                            source_results["successful"] += 1
+                            source_results["documents"].append(result["document_id"])
+                            pipeline_results["successful_extractions"] += 1
 
-                    # Rate limiting - be respectful to government servers
-                    await asyncio.sleep(2)
+                        # Rate limiting - be respectful to government servers
+                        await asyncio.sleep(2)
 
-                pipeline_results["sources_processed"][source_key] = source_results
-                pipeline_results["total_documents"] += source_results["processed"]
+                    pipeline_results["sources_processed"][source_key] = source_results
+                    pipeline_results["total_documents"] += source_results["processed"]
 
-            except Exception as e:
-                error_msg = f"Error processing source {source_key}: {e}"
-                logger.error(error_msg)
-                pipeline_results["errors"].append(error_msg)
+                except Exception as e:
+                    error_msg = f"Error processing source {source_key}: {e}"
+                    logger.error(error_msg)
+                    pipeline_results["errors"].append(error_msg)
 
         pipeline_results["end_time"] = datetime.now().isoformat()
 
@@ -7,6 +7,7 @@ Extracts population data, GDP figures, inflation rates, poverty indices, and oth
 import io
 import logging
 import re
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,11 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+_backend_path = str(Path(__file__).resolve().parent.parent / "backend")
+if _backend_path not in sys.path:
+    sys.path.append(_backend_path)
+from services.blob_store import SharedStore
+
 try:
     import pdfplumber
 except ImportError:
@@ -71,7 +77,8 @@ class GDPData:
 class KNBSParser:
     """Parser for KNBS publications - extracts economic data from PDFs."""
 
-    def __init__(self):
+    def __init__(self, blob_store=None):
+        self._blob_store = blob_store
         self.counties = [
             "Nairobi",
             "Mombasa",
@@ -396,18 +403,25 @@ class KNBSParser:
 
     # ===== Helper Methods =====
 
+    blobs = SharedStore()
+
+    def _fetch_pdf(self, url: str) -> Optional[bytes]:
+        logger.info(f"⬇️ Downloading: {url[:60]}...")
+        response = requests.get(url, timeout=30, verify=False)
+
+        if response.status_code == 200:
+            logger.info(f"[OK] Downloaded {len(response.content)} bytes")
+            return response.content
+        logger.error(f"[ERROR] Download failed: {response.status_code}")
+        return None
+
     def _download_pdf(self, url: str) -> Optional[bytes]:
-        """Download PDF content from URL."""
+        """PDF content for URL, from the shared blob store when fetched recently."""
         try:
-            logger.info(f"⬇️ Downloading: {url[:60]}...")
-            response = requests.get(url, timeout=30, verify=False)
-
-            if response.status_code == 200:
-                logger.info(f"[OK] Downloaded {len(response.content)} bytes")
-                return response.content
-            else:
-                logger.error(f"[ERROR] Download failed: {response.status_code}")
-                return None
+            blob = self.blobs.get_or_fetch(
+                url, self._fetch_pdf, content_type="application/pdf"
+            )
+            return blob.read_bytes() if blob else None
         except Exception as e:
             logger.error(f"[ERROR] Download error: {str(e)}")
             return None
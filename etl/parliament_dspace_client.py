@@ -8,26 +8,52 @@ This client handles:
   - Paginated item discovery across communities / collections
   - Metadata extraction from DSpace item records
   - Bitstream URL resolution and PDF download
-  - Checksum verification (DSpace provides MD5 per bitstream)
-  - Deduplication via dspace_uuid tracking
+  - Checksum verification (DSpace provides MD5 per bitstream), computed
+    while streaming; interrupted downloads resume with Range requests
+  - Deduplication via dspace_uuid tracking, and of PDFs via a
+    content-addressed store (see bitstream_store.py)
   - Retry + back-off for intermittent failures
+  - Concurrency: the next discovery page is prefetched while the current
+    one is processed, and bitstream lookups / downloads fan out over a
+    bounded thread pool. Request starts stay ``request_delay`` apart
+    across threads, so the server sees the same request rate as before.
 """
 
 import hashlib
 import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    from .bitstream_store import BitstreamStore
+except ImportError:
+    from bitstream_store import BitstreamStore
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 # ── Constants ──────────────────────────────────────────────────────────────
 
 BASE_URL = "https://libraryir.parliament.go.ke/server/api"
@@ -85,10 +111,28 @@ DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
 REQUEST_DELAY_SECONDS = 0.5
 MAX_RETRIES = 3
+DEFAULT_FETCH_CONCURRENCY = 4
 
 # Download defaults
 DEFAULT_DOWNLOAD_DIR = "downloads/parliament"
 MAX_PDF_SIZE_BYTES = 500 * 1024 * 1024  # 500 MB safety cap (some AG reports are 200+ MB)
+DOWNLOAD_RESUME_ATTEMPTS = 3  # connections per call; the .part also outlives the run
+
+
+class OversizedBitstream(Exception):
+    """A bitstream body grew past MAX_PDF_SIZE_BYTES while streaming."""
+
+
+def _hash_part(part: Path) -> Tuple["hashlib._Hash", int]:
+    """MD5 and size of a partial download (MD5 state can't be persisted)."""
+    md5_hash = hashlib.md5()
+    size = 0
+    if part.exists():
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                md5_hash.update(chunk)
+                size += len(chunk)
+    return md5_hash, size
 
 
 @dataclass
@@ -195,11 +239,21 @@ class ParliamentDSpaceClient:
         page_size: int = DEFAULT_PAGE_SIZE,
         request_delay: float = REQUEST_DELAY_SECONDS,
         max_items: Optional[int] = None,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
+        prefetch: bool = True,
+        blob_store=None,
     ):
         self.base_url = base_url.rstrip("/")
         self.page_size = min(page_size, MAX_PAGE_SIZE)
         self.request_delay = request_delay
         self.max_items = max_items
+        self.concurrency = max(1, concurrency)
+        self.prefetch = prefetch
+        self.blob_store = blob_store
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._stores: Dict[str, BitstreamStore] = {}
+        self._stores_lock = threading.Lock()
 
         # Resilient session with retry
         self.session = requests.Session()
@@ -209,7 +263,10 @@ class ParliamentDSpaceClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"],
         )
-        adapter = HTTPAdapter(max_retries=retries)
+        # One pooled connection per worker plus the prefetching thread.
+        adapter = HTTPAdapter(
+            max_retries=retries, pool_maxsize=max(10, self.concurrency + 1)
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
         self.session.headers.update(
@@ -251,18 +308,18 @@ class ParliamentDSpaceClient:
             items.extend(collections)
         return items
 
-    def discover_items(
+    def discover_pages(
         self,
         community_uuid: Optional[str] = None,
         collection_uuid: Optional[str] = None,
         query: str = "*",
-    ) -> Generator[DSpaceItem, None, None]:
-        """Discover items via the search endpoint, yielding normalised DSpaceItems.
+    ) -> Generator[List[DSpaceItem], None, None]:
+        """Discover items via the search endpoint, one page of DSpaceItems at a time.
 
-        Paginates automatically and respects self.max_items.
-        Can scope to either a community or a collection.
+        While the caller works on a page, the next one is already being
+        fetched on a background thread (unless ``prefetch`` is off).
+        Respects self.max_items; can scope to a community or a collection.
         """
-        yielded = 0
         params: Dict[str, Any] = {
             "query": query,
             "dsoType": "ITEM",
@@ -273,41 +330,72 @@ class ParliamentDSpaceClient:
         if scope:
             params["scope"] = scope
 
-        page = 0
-        while True:
-            params["page"] = page
-            try:
-                data = self._get(ENDPOINT_DISCOVERY, params=params)
-            except Exception as e:
-                logger.error("Discovery page %d failed: %s", page, e)
-                break
-
-            embedded = data.get("_embedded", {})
-            search_result = embedded.get("searchResult", {})
-            result_embedded = search_result.get("_embedded", {})
-            objects = result_embedded.get("objects", [])
-
-            if not objects:
-                break
+        def fetch(page: int) -> Dict[str, Any]:
+            return self._get(ENDPOINT_DISCOVERY, params={**params, "page": page})
 
-            for obj in objects:
-                indexed = obj.get("_embedded", {}).get("indexableObject", {})
-                if not indexed or indexed.get("type") != "item":
-                    continue
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dspace-prefetch")
+        try:
+            yielded = 0
+            page = 0
+            pending = pool.submit(fetch, page)
+            while pending is not None:
+                try:
+                    data = pending.result()
+                except Exception as e:
+                    logger.error("Discovery page %d failed: %s", page, e)
+                    break
+                pending = None
+
+                search_result = data.get("_embedded", {}).get("searchResult", {})
+                objects = search_result.get("_embedded", {}).get("objects", [])
+                if not objects:
+                    break
+
+                items = []
+                for obj in objects:
+                    indexed = obj.get("_embedded", {}).get("indexableObject", {})
+                    if not indexed or indexed.get("type") != "item":
+                        continue
+                    item = self._parse_item(indexed)
+                    if item:
+                        items.append(item)
+
+                total_pages = search_result.get("page", {}).get("totalPages", 1)
+                has_next = page + 1 < total_pages
+                if self.max_items:
+                    items = items[: self.max_items - yielded]
+                    if yielded + len(items) >= self.max_items:
+                        has_next = False
+
+                # Request the next page before handing this one over.
+                if has_next and self.prefetch:
+                    pending = pool.submit(fetch, page + 1)
+                if items:
+                    yield items
+                    yielded += len(items)
+                if has_next and pending is None:
+                    pending = pool.submit(fetch, page + 1)
+                page += 1
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
-                item = self._parse_item(indexed)
-                if item:
-                    yield item
-                    yielded += 1
-                    if self.max_items and yielded >= self.max_items:
-                        return
+    def discover_items(
+        self,
+        community_uuid: Optional[str] = None,
+        collection_uuid: Optional[str] = None,
+        query: str = "*",
+    ) -> Generator[DSpaceItem, None, None]:
+        """Discover items via the search endpoint, yielding normalised DSpaceItems.
 
-            # Check for next page
-            page_info = data.get("_embedded", {}).get("searchResult", {}).get("page", {})
-            total_pages = page_info.get("totalPages", 1)
-            if page + 1 >= total_pages:
-                break
-            page += 1
+        Paginates automatically and respects self.max_items.
+        Can scope to either a community or a collection.
+        """
+        for items in self.discover_pages(
+            community_uuid=community_uuid,
+            collection_uuid=collection_uuid,
+            query=query,
+        ):
+            yield from items
 
     def get_item(self, uuid: str) -> Optional[DSpaceItem]:
         """Fetch a single item by UUID and return normalised representation."""
@@ -381,6 +469,29 @@ class ParliamentDSpaceClient:
 
         return results
 
+    def get_bitstreams_many(
+        self, item_uuids: Iterable[str]
+    ) -> Dict[str, List[BitstreamInfo]]:
+        """Resolve bitstreams for several items, ``concurrency`` at a time."""
+        uuids = list(dict.fromkeys(item_uuids))
+        return dict(zip(uuids, self.map_concurrent(self.get_bitstreams, uuids)))
+
+    def map_concurrent(self, fn: Callable[[T], R], args: Iterable[T]) -> List[R]:
+        """Run ``fn`` over ``args`` on at most ``concurrency`` threads.
+
+        Results come back in input order. An exception from ``fn`` is
+        re-raised here, so per-item failures should be caught inside
+        ``fn`` (get_bitstreams and download_bitstream already do).
+        """
+        args = list(args)
+        if self.concurrency == 1 or len(args) <= 1:
+            return [fn(arg) for arg in args]
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(args)),
+            thread_name_prefix="dspace-fetch",
+        ) as pool:
+            return list(pool.map(fn, args))
+
     # Legacy alias for backward compatibility
     def get_bitstream_urls(self, item_uuid: str) -> List[Dict[str, str]]:
         """Legacy wrapper — returns dicts instead of BitstreamInfo."""
@@ -403,48 +514,53 @@ class ParliamentDSpaceClient:
         verify_checksum: bool = True,
         dry_run: bool = True,
     ) -> Optional[Dict[str, Any]]:
-        """Download a single bitstream (PDF) to local storage.
+        """Download a single bitstream (PDF) into the content-addressed store.
 
-        File naming: {item_uuid[:12]}_{sanitised_name}
-        Dedup: skip if file with matching checksum already exists.
+        Files live at ``objects/<md5[:2]>/<md5><ext>`` under download_dir,
+        indexed by checksum and bitstream UUID (see BitstreamStore), so
+        dedup is one index lookup and a PDF shared by several items is
+        stored once. The body streams into ``partial/<uuid>.part`` with
+        MD5 computed on the fly; an interrupted download resumes from the
+        part file with a Range request, here or on a later run.
 
         Args:
             bitstream: BitstreamInfo from get_bitstreams()
-            download_dir: Local directory for downloads
-            item_uuid: Parent item UUID (used in filename)
+            download_dir: Root of the bitstream store
+            item_uuid: Parent item UUID (recorded in the index)
             verify_checksum: Verify MD5 after download
             dry_run: If True, log but do not download
 
         Returns:
             Dict with file_path, md5, size_bytes, or None on failure.
         """
-        dl_path = Path(download_dir)
-        dl_path.mkdir(parents=True, exist_ok=True)
-
-        # Sanitise filename
-        safe_name = "".join(
-            c if c.isalnum() or c in ".-_ " else "_"
-            for c in bitstream.name
-        ).strip()
-        if not safe_name:
-            safe_name = f"{bitstream.uuid}.pdf"
-        prefix = item_uuid[:12] if item_uuid else bitstream.uuid[:12]
-        filename = f"{prefix}_{safe_name}"
-        dest = dl_path / filename
-
-        # Dedup: check if file already exists with matching checksum
-        if dest.exists() and bitstream.checksum_value:
-            existing_md5 = hashlib.md5(dest.read_bytes()).hexdigest()
-            if existing_md5 == bitstream.checksum_value:
-                logger.debug("Skipping (already downloaded, checksum matches): %s", filename)
-                return {
-                    "file_path": str(dest),
-                    "md5": existing_md5,
-                    "size_bytes": dest.stat().st_size,
-                    "skipped": True,
-                }
+        store = self._store(download_dir)
+        suffix = Path(bitstream.name).suffix.lower() or ".pdf"
+
+        # Dedup: the checksum DSpace reports, else this bitstream's last download
+        existing = None
+        if bitstream.checksum_value:
+            existing = store.lookup(bitstream.checksum_value)
+            md5 = bitstream.checksum_value.lower()
+        if existing is None:
+            existing = store.lookup_bitstream(bitstream.uuid)
+            md5 = store.bitstream_md5(bitstream.uuid)
+        if existing is not None:
+            if bitstream.checksum_value:
+                store.record(md5, existing, bitstream.uuid, item_uuid, bitstream.name)
+            logger.debug("Skipping (already stored, md5=%s): %s", md5, bitstream.name)
+            return {
+                "file_path": str(existing),
+                "md5": md5,
+                "size_bytes": existing.stat().st_size,
+                "skipped": True,
+            }
 
         if dry_run:
+            dest = (
+                store.path_for(bitstream.checksum_value, suffix)
+                if bitstream.checksum_value
+                else store.partial_path(bitstream.uuid)
+            )
             logger.info(
                 "[DRY RUN] Would download: %s (%s bytes) → %s",
                 bitstream.name,
@@ -468,52 +584,140 @@ class ParliamentDSpaceClient:
             )
             return None
 
-        # Download with streaming
+        part = store.partial_path(bitstream.uuid)
+        part.parent.mkdir(parents=True, exist_ok=True)
+        md5_hash, total_bytes = _hash_part(part)
+        if total_bytes:
+            logger.info(
+                "Resuming %s from byte %d (%s)", bitstream.name, total_bytes, part
+            )
+
+        attempt = 0
+        while True:
+            try:
+                md5_hash, total_bytes = self._stream_to_part(
+                    bitstream, part, md5_hash, total_bytes
+                )
+                break
+            except OversizedBitstream as e:
+                logger.warning("Skipping oversized bitstream %s: %s", bitstream.name, e)
+                part.unlink(missing_ok=True)
+                return None
+            except Exception as e:
+                attempt += 1
+                md5_hash, total_bytes = _hash_part(part)
+                if attempt >= DOWNLOAD_RESUME_ATTEMPTS:
+                    logger.error(
+                        "Download failed for %s after %d attempts (%d bytes kept "
+                        "in %s): %s",
+                        bitstream.name,
+                        attempt,
+                        total_bytes,
+                        part,
+                        e,
+                    )
+                    return None
+                logger.warning(
+                    "Download of %s interrupted at byte %d (%s) — resuming",
+                    bitstream.name,
+                    total_bytes,
+                    e,
+                )
+
+        computed_md5 = md5_hash.hexdigest()
+
+        # Verify checksum if available
+        if verify_checksum and bitstream.checksum_value:
+            if computed_md5 != bitstream.checksum_value.lower():
+                logger.error(
+                    "Checksum mismatch for %s: expected=%s computed=%s — removing file",
+                    bitstream.name,
+                    bitstream.checksum_value,
+                    computed_md5,
+                )
+                part.unlink(missing_ok=True)
+                return None
+
+        dest = store.commit(
+            part,
+            computed_md5,
+            bitstream.uuid,
+            item_uuid,
+            bitstream.name,
+            suffix,
+            url=bitstream.href,
+        )
+        logger.info(
+            "Downloaded OK: %s → %s (%d bytes, md5=%s)",
+            bitstream.name,
+            dest,
+            total_bytes,
+            computed_md5,
+        )
+        return {
+            "file_path": str(dest),
+            "md5": computed_md5,
+            "size_bytes": total_bytes,
+        }
+
+    def _stream_to_part(
+        self,
+        bitstream: BitstreamInfo,
+        part: Path,
+        md5_hash: "hashlib._Hash",
+        offset: int,
+    ) -> Tuple["hashlib._Hash", int]:
+        """Append the rest of ``bitstream`` to ``part`` from byte ``offset``.
+
+        Returns the updated hash and byte count. A server that ignores the
+        Range header (200 instead of 206) restarts the part from zero.
+        """
+        if bitstream.size_bytes and offset >= bitstream.size_bytes:
+            return md5_hash, offset  # already complete; verify and commit
+
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        self._throttle()
+        logger.info("Downloading: %s → %s", bitstream.href, part)
+        resp = self.session.get(
+            bitstream.href, stream=True, timeout=120, headers=headers
+        )
         try:
-            time.sleep(self.request_delay)
-            logger.info("Downloading: %s → %s", bitstream.href, dest)
-            resp = self.session.get(bitstream.href, stream=True, timeout=120)
+            if offset and resp.status_code == 416:
+                # Nothing left to send: the part already holds the whole body.
+                return md5_hash, offset
             resp.raise_for_status()
+            if offset and resp.status_code != 206:
+                logger.info("Server ignored Range for %s — restarting", bitstream.name)
+                md5_hash, offset = hashlib.md5(), 0
 
-            md5_hash = hashlib.md5()
-            total_bytes = 0
-            with open(dest, "wb") as f:
+            with open(part, "ab" if offset else "wb") as f:
                 for chunk in resp.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
                         md5_hash.update(chunk)
-                        total_bytes += len(chunk)
-
-            computed_md5 = md5_hash.hexdigest()
-
-            # Verify checksum if available
-            if verify_checksum and bitstream.checksum_value:
-                if computed_md5 != bitstream.checksum_value:
-                    logger.error(
-                        "Checksum mismatch for %s: expected=%s computed=%s — removing file",
-                        filename,
-                        bitstream.checksum_value,
-                        computed_md5,
-                    )
-                    dest.unlink(missing_ok=True)
-                    return None
-
-            logger.info(
-                "Downloaded OK: %s (%d bytes, md5=%s)",
-                filename,
-                total_bytes,
-                computed_md5,
-            )
-            return {
-                "file_path": str(dest),
-                "md5": computed_md5,
-                "size_bytes": total_bytes,
-            }
-
-        except Exception as e:
-            logger.error("Download failed for %s: %s", bitstream.name, e)
-            dest.unlink(missing_ok=True)
-            return None
+                        offset += len(chunk)
+                        if offset > MAX_PDF_SIZE_BYTES:
+                            raise OversizedBitstream(
+                                f"body exceeds {MAX_PDF_SIZE_BYTES} bytes"
+                            )
+        finally:
+            resp.close()
+        return md5_hash, offset
+
+    def _store(self, download_dir: str) -> BitstreamStore:
+        """One BitstreamStore per download directory, shared across threads.
+
+        With ``blob_store`` set, committed files go to the shared blob store
+        and the directory keeps only the index and part files.
+        """
+        key = str(Path(download_dir).resolve())
+        with self._stores_lock:
+            store = self._stores.get(key)
+            if store is None:
+                store = self._stores[key] = BitstreamStore(
+                    download_dir, blobs=self.blob_store
+                )
+            return store
 
     # ── Internals ──────────────────────────────────────────────────────────
 
@@ -526,12 +730,21 @@ class ParliamentDSpaceClient:
             if endpoint.startswith("http")
             else f"{self.base_url}{endpoint}"
         )
-        time.sleep(self.request_delay)
+        self._throttle()
         logger.debug("GET %s params=%s", url, params)
         resp = self.session.get(url, params=params, timeout=30)
         resp.raise_for_status()
         return resp.json()
 
+    def _throttle(self) -> None:
+        """Space request starts ``request_delay`` apart across all threads."""
+        with self._pace_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self.request_delay
+        if start_at > now:
+            time.sleep(start_at - now)
+
     def _paginate(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Generator[Dict[str, Any], None, None]:
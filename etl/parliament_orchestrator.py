@@ -21,6 +21,8 @@ Feature flags (environment variables):
                                   (default "1" when pipeline is enabled)
   PARLIAMENT_MAX_INGEST_ITEMS  — cap per ingest run (default 500)
   PARLIAMENT_MIN_CONFIDENCE    — skip items below this (default 0.30)
+  PARLIAMENT_BATCH_SIZE        — items per ingest commit (default 50)
+  PARLIAMENT_FETCH_CONCURRENCY — parallel DSpace bitstream lookups (default 4)
 
 CLI usage:
     # Full cycle (dry-run)
@@ -138,6 +140,8 @@ def run_ingest(
     if max_items is None:
         max_items = int(os.getenv("PARLIAMENT_MAX_INGEST_ITEMS", "500"))
     min_confidence = float(os.getenv("PARLIAMENT_MIN_CONFIDENCE", "0.30"))
+    batch_size = int(os.getenv("PARLIAMENT_BATCH_SIZE", "50"))
+    concurrency = int(os.getenv("PARLIAMENT_FETCH_CONCURRENCY", "4"))
 
     dry_run = not commit
     db_session = None
@@ -155,6 +159,8 @@ def run_ingest(
             db_session=db_session,
             max_items=max_items,
             min_confidence=min_confidence,
+            batch_size=batch_size,
+            concurrency=concurrency,
         )
         stats = pipeline.run(dry_run=dry_run)
         summary = {
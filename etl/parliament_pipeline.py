@@ -9,7 +9,8 @@ This pipeline is designed to be safe by default:
   - Disabled unless explicitly enabled via PARLIAMENT_PIPELINE_ENABLED=1
   - Runs in dry-run mode unless --commit is passed
   - Logs all actions for audit trail
-  - Deduplicates on dspace_uuid before inserting
+  - Deduplicates on dspace_uuid before inserting, and inserts with
+    ON CONFLICT (dspace_uuid) DO NOTHING in batches of PARLIAMENT_BATCH_SIZE
 
 Usage (CLI):
     python -m etl.parliament_pipeline --dry-run
@@ -27,9 +28,11 @@ import os
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +70,7 @@ try:
         AUDITOR_GENERAL_COMMUNITY,
         AUDITOR_GENERAL_SUBCOMMUNITY,
         COLLECTION_CONSTITUENCIES_AG,
+        DEFAULT_FETCH_CONCURRENCY,
         NATIONAL_ASSEMBLY_COMMUNITY,
         BitstreamInfo,
         DSpaceItem,
@@ -77,6 +81,7 @@ except ImportError:
         AUDITOR_GENERAL_COMMUNITY,
         AUDITOR_GENERAL_SUBCOMMUNITY,
         COLLECTION_CONSTITUENCIES_AG,
+        DEFAULT_FETCH_CONCURRENCY,
         NATIONAL_ASSEMBLY_COMMUNITY,
         BitstreamInfo,
         DSpaceItem,
@@ -89,6 +94,9 @@ except ImportError:
     from report_classifier import ReportClassifier
 
 
+DEFAULT_BATCH_SIZE = 50
+
+
 @dataclass
 class PipelineStats:
     """Accumulator for pipeline run statistics."""
@@ -120,6 +128,18 @@ class PipelineStats:
         )
 
 
+@dataclass
+class _Candidate:
+    """An item that passed the confidence gate, awaiting insert."""
+
+    item: DSpaceItem
+    classification: Any
+    resolved: Any
+    confidence: float
+    file_path: Optional[str] = None
+    md5: Optional[str] = None
+
+
 class ParliamentPipeline:
     """Orchestrates the Parliament library ingestion flow.
 
@@ -128,7 +148,9 @@ class ParliamentPipeline:
       2. Classify each item (audit report / committee / green book / etc.)
       3. Resolve entity + fiscal year from title
       4. Deduplicate against existing parliament_source_documents
-      5. Insert into source_documents + parliament_source_documents
+      5. Optionally fetch PDFs (bitstream lookups + downloads in parallel)
+      6. Insert into source_documents + parliament_source_documents,
+         committing every ``batch_size`` items
 
     Args:
         db_session: SQLAlchemy session (optional — if None, runs metadata-only)
@@ -136,6 +158,9 @@ class ParliamentPipeline:
         max_items: Cap on items to process per run
         min_confidence: Skip items below this classification confidence
         country_id: Country ID for source_document records (defaults to 1 = Kenya)
+        batch_size: Items per commit; a failed commit loses only its batch
+        concurrency: Parallel bitstream lookups / downloads (ignored when
+            a pre-configured client is passed)
     """
 
     def __init__(
@@ -147,9 +172,21 @@ class ParliamentPipeline:
         country_id: int = 1,
         download_pdfs: bool = False,
         download_dir: str = "downloads/parliament",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_FETCH_CONCURRENCY,
     ):
         self.db = db_session
-        self.client = client or ParliamentDSpaceClient(max_items=max_items)
+        if client is None:
+            blob_store = None
+            if download_pdfs:
+                # PDFs land in the blob store shared with the other downloaders.
+                from services.blob_store import default_store
+
+                blob_store = default_store()
+            client = ParliamentDSpaceClient(
+                max_items=max_items, concurrency=concurrency, blob_store=blob_store
+            )
+        self.client = client
         self.classifier = ReportClassifier()
         self.resolver = EntityResolver()
         self.max_items = max_items
@@ -157,6 +194,7 @@ class ParliamentPipeline:
         self.country_id = country_id
         self.download_pdfs = download_pdfs
         self.download_dir = download_dir
+        self.batch_size = max(1, batch_size)
         self._seen_uuids: set = set()
 
     def run(
@@ -167,6 +205,10 @@ class ParliamentPipeline:
     ) -> PipelineStats:
         """Execute the pipeline.
 
+        Items are processed a DSpace page at a time (the client prefetches
+        the next page meanwhile) and committed every ``batch_size`` items,
+        so a failed commit only loses its own batch.
+
         Args:
             dry_run: If True, logs what would be inserted but does not write to DB.
             community_uuid: DSpace community to crawl (default: National Assembly).
@@ -178,10 +220,13 @@ class ParliamentPipeline:
         stats = PipelineStats()
         scope_label = collection_uuid or community_uuid
         logger.info(
-            "Parliament pipeline starting (dry_run=%s, scope=%s, max_items=%d)",
+            "Parliament pipeline starting (dry_run=%s, scope=%s, max_items=%d, "
+            "batch_size=%d, concurrency=%d)",
             dry_run,
             scope_label,
             self.max_items,
+            self.batch_size,
+            self.client.concurrency,
         )
 
         # Pre-load existing UUIDs for dedup
@@ -208,58 +253,86 @@ class ParliamentPipeline:
                 # Rollback so the session is not left in a failed-transaction state
                 self.db.rollback()
 
-        # Discover + process items
+        # Discover + process items, committing in batches
+        batch: List[_Candidate] = []
         try:
-            for item in self.client.discover_items(
+            for page in self.client.discover_pages(
                 community_uuid=community_uuid,
                 collection_uuid=collection_uuid,
             ):
-                stats.items_discovered += 1
-                try:
-                    self._process_item(item, stats, dry_run)
-                except Exception as e:
-                    logger.error("Error processing item %s: %s", item.uuid, e)
-                    stats.errors.append(
-                        {"uuid": item.uuid, "title": item.title, "error": str(e)}
-                    )
-                    # Rollback the failed item so the session stays usable
-                    if self.db:
-                        self.db.rollback()
+                batch.extend(self._process_page(page, stats, dry_run))
+                while len(batch) >= self.batch_size:
+                    self._commit_batch(batch[: self.batch_size], stats)
+                    del batch[: self.batch_size]
         except Exception as e:
             logger.error("Discovery failed: %s", e)
             stats.errors.append({"phase": "discovery", "error": str(e)})
 
-        # Commit if not dry run
-        if not dry_run and self.db:
-            try:
-                self.db.commit()
-                logger.info("Committed %d new records", stats.items_inserted)
-            except IntegrityError as e:
-                # Late uniqueness conflict at commit — treat as partial success
-                logger.warning(
-                    "Commit IntegrityError (concurrent race): %s — "
-                    "rolling back uncommitted batch",
-                    e.orig,
-                )
-                self.db.rollback()
-                stats.errors.append({"phase": "commit", "error": str(e.orig)})
-            except Exception as e:
-                logger.error("Commit failed: %s", e)
-                self.db.rollback()
-                stats.errors.append({"phase": "commit", "error": str(e)})
+        # Whatever was processed before a discovery failure is still committed
+        if batch:
+            self._commit_batch(batch, stats)
 
         logger.info(stats.summary())
         return stats
 
-    def _process_item(
-        self, item: DSpaceItem, stats: PipelineStats, dry_run: bool
-    ) -> None:
-        """Process a single DSpace item through classify → resolve → load."""
+    def _process_page(
+        self, items: List[DSpaceItem], stats: PipelineStats, dry_run: bool
+    ) -> List[_Candidate]:
+        """Classify and resolve one page of items, then fetch their PDFs.
+
+        Returns the candidates to insert; in dry-run mode (or without a DB
+        session) they are only logged and nothing is returned.
+        """
+        candidates: List[_Candidate] = []
+        for item in items:
+            stats.items_discovered += 1
+            try:
+                candidate = self._prepare_item(item, stats)
+            except Exception as e:
+                logger.error("Error processing item %s: %s", item.uuid, e)
+                stats.errors.append(
+                    {"uuid": item.uuid, "title": item.title, "error": str(e)}
+                )
+                continue
+            if candidate is not None:
+                # Claim the UUID now so a repeat later in the run is a duplicate
+                self._seen_uuids.add(item.uuid)
+                candidates.append(candidate)
+
+        if self.download_pdfs and candidates:
+            self._fetch_pdfs(candidates, stats, dry_run)
+
+        if dry_run:
+            for candidate in candidates:
+                logger.info(
+                    "[DRY RUN] Would insert: type=%s, entity=%s (%s), fy=%s, uuid=%s, title=%s",
+                    candidate.classification.doc_type,
+                    candidate.resolved.entity_name,
+                    candidate.resolved.entity_type,
+                    candidate.resolved.fiscal_years,
+                    candidate.item.uuid,
+                    candidate.item.title[:80],
+                )
+                stats.items_inserted += 1
+            return []
+
+        if not self.db or SourceDocument is None:
+            for candidate in candidates:
+                logger.warning(
+                    "No DB session — cannot insert item %s", candidate.item.uuid
+                )
+            return []
+        return candidates
+
+    def _prepare_item(
+        self, item: DSpaceItem, stats: PipelineStats
+    ) -> Optional[_Candidate]:
+        """Dedup, classify, resolve and confidence-gate a single item."""
 
         # 1. Dedup check
         if item.uuid in self._seen_uuids:
             stats.items_skipped_duplicate += 1
-            return
+            return None
 
         # 2. Classify
         classification = self.classifier.classify(
@@ -281,63 +354,133 @@ class ParliamentPipeline:
                 item.title[:80],
                 combined_confidence,
             )
-            return
+            return None
 
-        # 5. Optionally download PDF bitstreams
-        downloaded_path = None
-        downloaded_md5 = None
-        if self.download_pdfs:
+        return _Candidate(item, classification, resolved, combined_confidence)
+
+    def _fetch_pdfs(
+        self, candidates: List[_Candidate], stats: PipelineStats, dry_run: bool
+    ) -> None:
+        """5. Look up bitstreams and download each item's primary PDF.
+
+        Both steps run on the client's bounded pool; stats are only
+        updated here, on the calling thread.
+        """
+        bitstreams = self.client.get_bitstreams_many(c.item.uuid for c in candidates)
+        wanted: List[Tuple[_Candidate, BitstreamInfo]] = []
+        for candidate in candidates:
+            pdf_bits = [b for b in bitstreams.get(candidate.item.uuid, []) if b.is_pdf]
+            if pdf_bits:
+                wanted.append((candidate, pdf_bits[0]))
+            else:
+                logger.debug("No PDF bitstreams for item %s", candidate.item.uuid[:12])
+
+        def download(pair: Tuple[_Candidate, BitstreamInfo]) -> Optional[Dict]:
+            candidate, bitstream = pair
             try:
-                bitstreams = self.client.get_bitstreams(item.uuid)
-                pdf_bits = [b for b in bitstreams if b.is_pdf]
-                if pdf_bits:
-                    # Download the first (primary) PDF
-                    result = self.client.download_bitstream(
-                        bitstream=pdf_bits[0],
-                        download_dir=self.download_dir,
-                        item_uuid=item.uuid,
-                        verify_checksum=True,
-                        dry_run=dry_run,
-                    )
-                    if result:
-                        if result.get("skipped"):
-                            stats.pdfs_skipped += 1
-                        elif result.get("dry_run"):
-                            stats.pdfs_downloaded += 1  # count dry-run as success
-                        else:
-                            stats.pdfs_downloaded += 1
-                        downloaded_path = result.get("file_path")
-                        downloaded_md5 = result.get("md5")
-                    else:
-                        stats.pdfs_failed += 1
-                else:
-                    logger.debug("No PDF bitstreams for item %s", item.uuid[:12])
+                return self.client.download_bitstream(
+                    bitstream=bitstream,
+                    download_dir=self.download_dir,
+                    item_uuid=candidate.item.uuid,
+                    verify_checksum=True,
+                    dry_run=dry_run,
+                )
             except Exception as e:
                 logger.warning(
-                    "Bitstream fetch/download failed for %s: %s", item.uuid[:12], e
+                    "Bitstream download failed for %s: %s",
+                    candidate.item.uuid[:12],
+                    e,
                 )
-                stats.pdfs_failed += 1
+                return None
 
-        # 6. Log or insert
-        if dry_run:
-            logger.info(
-                "[DRY RUN] Would insert: type=%s, entity=%s (%s), fy=%s, uuid=%s, title=%s",
-                classification.doc_type,
-                resolved.entity_name,
-                resolved.entity_type,
-                resolved.fiscal_years,
-                item.uuid,
-                item.title[:80],
+        for (candidate, _), result in zip(
+            wanted, self.client.map_concurrent(download, wanted)
+        ):
+            if not result:
+                stats.pdfs_failed += 1
+                continue
+            if result.get("skipped"):
+                stats.pdfs_skipped += 1
+            else:
+                stats.pdfs_downloaded += 1  # dry-run counts as success
+            candidate.file_path = result.get("file_path")
+            candidate.md5 = result.get("md5")
+
+    def _commit_batch(self, batch: List[_Candidate], stats: PipelineStats) -> None:
+        """6. Insert and commit one batch of candidates.
+
+        source_documents rows are added first (for their ids), then the
+        parliament rows go in with ``ON CONFLICT (dspace_uuid) DO NOTHING``.
+        A UUID another writer inserted meanwhile is counted as a duplicate
+        and its source_document is deleted again in the same transaction.
+        Any other failure rolls back this batch only.
+        """
+        source_docs = []
+        try:
+            source_docs = [self._source_document(c) for c in batch]
+            self.db.add_all(source_docs)
+            self.db.flush()  # Get source_doc.id
+            rows = [
+                self._parliament_row(c, doc.id) for c, doc in zip(batch, source_docs)
+            ]
+            inserted = set(
+                self.db.execute(self._insert_ignoring_duplicates(rows)).scalars()
+            )
+            orphans = [
+                doc.id
+                for c, doc in zip(batch, source_docs)
+                if c.item.uuid not in inserted
+            ]
+            if orphans:
+                self.db.execute(
+                    delete(SourceDocument)
+                    .where(SourceDocument.id.in_(orphans))
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+        except Exception as e:
+            logger.error("Commit of %d items failed: %s", len(batch), e)
+            self.db.rollback()
+            stats.errors.append(
+                {
+                    "phase": "commit",
+                    "error": str(getattr(e, "orig", None) or e),
+                    "uuids": [c.item.uuid for c in batch],
+                }
             )
-            stats.items_inserted += 1
-            self._seen_uuids.add(item.uuid)
             return
+        finally:
+            # Keep the session's identity map from growing across batches
+            for doc in source_docs:
+                if doc in self.db:
+                    self.db.expunge(doc)
+
+        stats.items_inserted += len(inserted)
+        stats.items_skipped_duplicate += len(batch) - len(inserted)
+        if orphans:
+            logger.info(
+                "%d dspace_uuid(s) already inserted by another writer — skipped",
+                len(orphans),
+            )
+        logger.info(
+            "Committed %d new records (%d total)",
+            len(inserted),
+            stats.items_inserted,
+        )
 
-        if not self.db or SourceDocument is None:
-            logger.warning("No DB session — cannot insert item %s", item.uuid)
-            return
+    def _insert_ignoring_duplicates(self, rows: List[Dict[str, Any]]):
+        """INSERT ... ON CONFLICT (dspace_uuid) DO NOTHING RETURNING dspace_uuid."""
+        dialect = self.db.get_bind().dialect.name
+        insert = sqlite_insert if dialect == "sqlite" else pg_insert
+        return (
+            insert(ParliamentSourceDocument)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["dspace_uuid"])
+            .returning(ParliamentSourceDocument.dspace_uuid)
+        )
 
-        # 7. Create source_document record
+    def _source_document(self, candidate: _Candidate):
+        item = candidate.item
         doc_type_map = {
             "audit_report": DocumentType.AUDIT,
             "committee_report": DocumentType.REPORT,
@@ -349,6 +492,38 @@ class ParliamentPipeline:
             "policy_document": DocumentType.REPORT,
             "other": DocumentType.OTHER,
         }
+        return SourceDocument(
+            country_id=self.country_id,
+            publisher="Kenya Parliament Digital Library",
+            title=item.title[:500],
+            url=(
+                f"https://libraryir.parliament.go.ke/handle/{item.handle}"
+                if item.handle
+                else None
+            ),
+            file_path=candidate.file_path,
+            fetch_date=datetime.now(timezone.utc),
+            md5=candidate.md5 or item.content_md5(),
+            doc_type=doc_type_map.get(
+                candidate.classification.doc_type, DocumentType.OTHER
+            ),
+            status=DocumentStatus.AVAILABLE,
+            meta={
+                "dspace_uuid": item.uuid,
+                "dspace_handle": item.handle,
+                "date_issued": item.date_issued,
+                "subjects": item.subjects,
+                "publisher": item.publisher,
+                "description": (item.description or "")[:1000],
+            },
+        )
+
+    def _parliament_row(
+        self, candidate: _Candidate, source_document_id: int
+    ) -> Dict[str, Any]:
+        item = candidate.item
+        classification = candidate.classification
+        resolved = candidate.resolved
 
         # Map classifier string values to SQLAlchemy enum instances
         parliament_doc_type_map = {
@@ -368,92 +543,35 @@ class ParliamentPipeline:
             "adverse": AuditOpinion.ADVERSE,
             "disclaimer": AuditOpinion.DISCLAIMER,
         }
-
-        # 7+8: Insert source_document + parliament_source_document inside
-        # a SAVEPOINT so a dspace_uuid uniqueness conflict (concurrent
-        # insert race) rolls back only this item, not the whole session.
-        try:
-            with self.db.begin_nested():
-                source_doc = SourceDocument(
-                    country_id=self.country_id,
-                    publisher="Kenya Parliament Digital Library",
-                    title=item.title[:500],
-                    url=(
-                        f"https://libraryir.parliament.go.ke/handle/{item.handle}"
-                        if item.handle
-                        else None
-                    ),
-                    file_path=downloaded_path,
-                    fetch_date=datetime.now(timezone.utc),
-                    md5=downloaded_md5 or item.content_md5(),
-                    doc_type=doc_type_map.get(
-                        classification.doc_type, DocumentType.OTHER
-                    ),
-                    status=DocumentStatus.AVAILABLE,
-                    meta={
-                        "dspace_uuid": item.uuid,
-                        "dspace_handle": item.handle,
-                        "date_issued": item.date_issued,
-                        "subjects": item.subjects,
-                        "publisher": item.publisher,
-                        "description": (item.description or "")[:1000],
-                    },
-                )
-                self.db.add(source_doc)
-                self.db.flush()  # Get source_doc.id
-
-                parliament_doc = ParliamentSourceDocument(
-                    source_document_id=source_doc.id,
-                    dspace_uuid=item.uuid,
-                    dspace_handle=item.handle,
-                    collection_uuid=item.collection_uuid,
-                    community_uuid=AUDITOR_GENERAL_COMMUNITY,
-                    parliament_doc_type=parliament_doc_type_map.get(
-                        classification.doc_type
-                    ),
-                    fiscal_year_label=(
-                        resolved.fiscal_years[0] if resolved.fiscal_years else None
-                    ),
-                    committee_name=classification.committee_name,
-                    audit_opinion=(
-                        audit_opinion_map.get(resolved.audit_opinion)
-                        if resolved.audit_opinion
-                        else None
-                    ),
-                    confidence_score=combined_confidence,
-                    meta={
-                        "entity_name": resolved.entity_name,
-                        "entity_type": resolved.entity_type,
-                        "is_green_book": resolved.is_green_book,
-                        "classification_pattern": classification.matched_pattern,
-                        "pdf_file_path": downloaded_path,
-                        "all_fiscal_years": resolved.fiscal_years,
-                    },
-                )
-                self.db.add(parliament_doc)
-                self.db.flush()  # Force dspace_uuid UNIQUE check inside savepoint
-        except IntegrityError as e:
-            # dspace_uuid UNIQUE violation → concurrent insert race.
-            # The SAVEPOINT was rolled back; session stays usable.
-            logger.info(
-                "Duplicate dspace_uuid %s — skipped (race-safe dedup): %s",
-                item.uuid[:12],
-                e.orig,
-            )
-            stats.items_skipped_duplicate += 1
-            self._seen_uuids.add(item.uuid)
-            return
-
-        stats.items_inserted += 1
-        self._seen_uuids.add(item.uuid)
-        logger.debug(
-            "Inserted: %s → %s (%s) FY=%s pdf=%s",
-            item.uuid[:8],
-            resolved.entity_name,
-            classification.doc_type,
-            resolved.fiscal_years,
-            "yes" if downloaded_path else "no",
-        )
+        now = datetime.now(timezone.utc)
+        return {
+            "source_document_id": source_document_id,
+            "dspace_uuid": item.uuid,
+            "dspace_handle": item.handle,
+            "collection_uuid": item.collection_uuid,
+            "community_uuid": AUDITOR_GENERAL_COMMUNITY,
+            "parliament_doc_type": parliament_doc_type_map.get(classification.doc_type),
+            "fiscal_year_label": (
+                resolved.fiscal_years[0] if resolved.fiscal_years else None
+            ),
+            "committee_name": classification.committee_name,
+            "audit_opinion": (
+                audit_opinion_map.get(resolved.audit_opinion)
+                if resolved.audit_opinion
+                else None
+            ),
+            "confidence_score": candidate.confidence,
+            "meta": {
+                "entity_name": resolved.entity_name,
+                "entity_type": resolved.entity_type,
+                "is_green_book": resolved.is_green_book,
+                "classification_pattern": classification.matched_pattern,
+                "pdf_file_path": candidate.file_path,
+                "all_fiscal_years": resolved.fiscal_years,
+            },
+            "created_at": now,
+            "updated_at": now,
+        }
 
 
 def is_enabled() -> bool:
@@ -494,6 +612,21 @@ def main():
         default="downloads/parliament",
         help="Directory for PDF downloads (default: downloads/parliament)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Items per commit (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_FETCH_CONCURRENCY,
+        help=(
+            "Parallel bitstream lookups/downloads "
+            f"(default: {DEFAULT_FETCH_CONCURRENCY})"
+        ),
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -531,6 +664,8 @@ def main():
         max_items=args.max_items,
         download_pdfs=args.download_pdfs,
         download_dir=args.download_dir,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
     )
     stats = pipeline.run(dry_run=dry_run, collection_uuid=args.collection)
     print(stats.summary())
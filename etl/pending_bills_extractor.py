@@ -20,6 +20,7 @@ import asyncio
 import logging
 import os
 import re
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -28,6 +29,11 @@ from urllib.parse import urljoin
 import httpx
 from bs4 import BeautifulSoup
 
+_backend_path = str(Path(__file__).resolve().parent.parent / "backend")
+if _backend_path not in sys.path:
+    sys.path.append(_backend_path)
+from services.blob_store import SharedStore
+
 logger = logging.getLogger("etl.pending_bills")
 
 # ── COB source URLs ──────────────────────────────────────────────────────
@@ -55,7 +61,7 @@ KNOWN_REPORT_PAGES: dict[str, str] = {
     ),
 }
 
-CACHE_DIR = Path("data/pending_bills_cache")
+REPORT_MAX_AGE_SECONDS = 7 * 24 * 3600  # re-download report PDFs weekly
 USER_AGENT = (
     "KenyaAuditApp/1.0 (+https://github.com/Rodgers31/audit_app-) "
     "Transparency Research"
@@ -73,9 +79,17 @@ PENDING_BILLS_PATTERNS = [
 class PendingBillsExtractor:
     """Extract pending bills data from COB reports."""
 
-    def __init__(self, cache_dir: Path | None = None):
-        self.cache_dir = cache_dir or CACHE_DIR
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, blob_store=None):
+        self._blob_store = blob_store
+
+    blobs = SharedStore()
+
+    def _store_pdf(self, report_page_url: str, pdf_url: str, data: bytes) -> Path:
+        """Keep a downloaded report PDF, indexed by its URL and the report page."""
+        blob = self.blobs.put(data, url=pdf_url, content_type="application/pdf")
+        if pdf_url != report_page_url:
+            self.blobs.alias(report_page_url, blob.sha256)
+        return blob.path
 
     async def extract_all(self) -> dict[str, Any]:
         """Run the full extraction pipeline.
@@ -209,30 +223,33 @@ class PendingBillsExtractor:
         COB uses WordPress Download Manager, so we may need headless
         browser to resolve the actual download link.
         """
-        # Check cache first
-        url_hash = re.sub(r"[^\w]", "_", report_page_url)[-60:]
-        cached_pdf = self.cache_dir / f"cob_report_{url_hash}.pdf"
-        if cached_pdf.exists():
-            age_hours = (datetime.now().timestamp() - cached_pdf.stat().st_mtime) / 3600
-            if age_hours < 168:  # 1 week cache
-                logger.info(f"Using cached PDF: {cached_pdf}")
-                return cached_pdf
+        # Check the shared blob store first (1 week freshness)
+        cached = self.blobs.lookup_url(report_page_url, max_age=REPORT_MAX_AGE_SECONDS)
+        if cached is not None:
+            logger.info(f"Using cached PDF: {cached.path}")
+            return cached.path
 
         # Try headless browser first (COB uses WPDM protected downloads)
         try:
-            from .cob_headless import fetch_cob_download, headless_allowed
+            from .cob_headless import (
+                browser_session,
+                fetch_cob_download,
+                headless_allowed,
+            )
 
             if headless_allowed():
                 logger.info(f"Attempting headless download from {report_page_url}")
-                result = await fetch_cob_download(report_page_url)
+                async with browser_session():
+                    result = await fetch_cob_download(report_page_url)
                 if result:
                     pdf_bytes, filename = result
                     if pdf_bytes and pdf_bytes.startswith(b"%PDF"):
-                        cached_pdf.write_bytes(pdf_bytes)
                         logger.info(
                             f"Downloaded PDF via headless: " f"{len(pdf_bytes)} bytes"
                         )
-                        return cached_pdf
+                        return self._store_pdf(
+                            report_page_url, report_page_url, pdf_bytes
+                        )
         except Exception as exc:
             logger.warning(f"Headless download failed: {exc}")
 
@@ -272,11 +289,12 @@ class PendingBillsExtractor:
                             pdf_resp.status_code == 200
                             and pdf_resp.content[:4] == b"%PDF"
                         ):
-                            cached_pdf.write_bytes(pdf_resp.content)
                             logger.info(
                                 f"Downloaded PDF: {len(pdf_resp.content)} bytes"
                             )
-                            return cached_pdf
+                            return self._store_pdf(
+                                report_page_url, pdf_url, pdf_resp.content
+                            )
                     except Exception:
                         continue
 
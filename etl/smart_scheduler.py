@@ -18,7 +18,7 @@ Government Publishing Patterns (Kenya):
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -135,19 +135,20 @@ class SmartScheduler:
         # Cache for calculated values
         self._quarter_dates_cache = None
         self._last_cache_date = None
+        self._day_verdicts: Dict[Tuple[str, date], Tuple[bool, str]] = {}
 
-    def _quarter_end_dates(self) -> List[datetime]:
+    def _quarter_end_dates(self, now: Optional[datetime] = None) -> List[datetime]:
         """
         Generate quarter-end dates for current and next year.
         Kenya fiscal year: July 1 - June 30
         Calendar quarters: Mar 31, Jun 30, Sep 30, Dec 31
         """
-        # Cache for 24 hours
+        now = now or datetime.now()
+        # Cached per calendar year
         if self._quarter_dates_cache and self._last_cache_date:
-            if (datetime.now() - self._last_cache_date).total_seconds() < 86400:
+            if self._last_cache_date.year == now.year:
                 return self._quarter_dates_cache
 
-        now = datetime.now()
         year = now.year
         dates = []
 
@@ -167,10 +168,14 @@ class SmartScheduler:
         return dates
 
     def _is_within_days_of_date(
-        self, target_date: datetime, days_after: int, duration: int = 1
+        self,
+        target_date: datetime,
+        days_after: int,
+        duration: int = 1,
+        now: Optional[datetime] = None,
     ) -> bool:
         """Check if current date is within a window after target_date."""
-        now = datetime.now()
+        now = now or datetime.now()
         days_since = (now - target_date).days
 
         # Within the window: [days_after, days_after + duration]
@@ -182,10 +187,10 @@ class SmartScheduler:
         quarter = (now.month - 1) // 3 + 1
         return quarter, now.year
 
-    def _days_since_quarter_end(self) -> int:
+    def _days_since_quarter_end(self, now: Optional[datetime] = None) -> int:
         """Calculate days since the most recent quarter-end."""
-        now = datetime.now()
-        quarters = self._quarter_end_dates()
+        now = now or datetime.now()
+        quarters = self._quarter_end_dates(now)
 
         # Find most recent quarter-end
         past_quarters = [q for q in quarters if q <= now]
@@ -195,18 +200,21 @@ class SmartScheduler:
         most_recent = max(past_quarters)
         return (now - most_recent).days
 
-    def _is_day_of_week(self, target_day: str) -> bool:
+    def _is_day_of_week(self, target_day: str, now: Optional[datetime] = None) -> bool:
         """Check if today is the target day of week."""
-        now = datetime.now()
+        now = now or datetime.now()
         today = now.strftime("%A").lower()
         return today == target_day.lower()
 
-    def should_run(self, source: str) -> Tuple[bool, str]:
+    def should_run(
+        self, source: str, now: Optional[datetime] = None
+    ) -> Tuple[bool, str]:
         """
         Determine if source should be checked now based on government publishing patterns.
 
         Args:
             source: Source key ('treasury', 'cob', 'oag', 'knbs', 'opendata', 'cra')
+            now: Evaluate for this moment instead of the current time
 
         Returns:
             Tuple of (should_run: bool, reason: str)
@@ -215,7 +223,7 @@ class SmartScheduler:
             logger.warning(f"Unknown source '{source}', defaulting to weekly schedule")
             return (True, "Unknown source - default weekly schedule")
 
-        now = datetime.now()
+        now = now or datetime.now()
         config = self.schedules[source]
 
         # Priority 1: Check special high-frequency periods
@@ -227,7 +235,7 @@ class SmartScheduler:
                 if bs["frequency"] == "daily":
                     return (True, bs["reason"])
                 elif bs["frequency"] == "weekly" and "day" in bs:
-                    if self._is_day_of_week(bs["day"]):
+                    if self._is_day_of_week(bs["day"], now):
                         return (True, bs["reason"])
 
         # Economic Survey season (May for KNBS)
@@ -235,7 +243,7 @@ class SmartScheduler:
             es = config["economic_survey"]
             if now.month == es["month"]:
                 if es["frequency"] == "weekly" and "day" in es:
-                    if self._is_day_of_week(es["day"]):
+                    if self._is_day_of_week(es["day"], now):
                         return (True, es["reason"])
                 else:
                     return (True, es["reason"])
@@ -245,7 +253,7 @@ class SmartScheduler:
             sa = config["statistical_abstract"]
             if now.month == sa["month"]:
                 if sa["frequency"] == "weekly" and "day" in sa:
-                    if self._is_day_of_week(sa["day"]):
+                    if self._is_day_of_week(sa["day"], now):
                         return (True, sa["reason"])
                 else:
                     return (True, sa["reason"])
@@ -255,7 +263,7 @@ class SmartScheduler:
             alls = config["allocation_season"]
             if now.month == alls["month"]:
                 if alls["frequency"] == "weekly" and "day" in alls:
-                    if self._is_day_of_week(alls["day"]):
+                    if self._is_day_of_week(alls["day"], now):
                         return (True, alls["reason"])
                 else:
                     return (True, alls["reason"])
@@ -265,7 +273,7 @@ class SmartScheduler:
             aus = config["audit_season"]
             if now.month in aus["months"]:
                 if aus["frequency"] == "weekly" and "day" in aus:
-                    if self._is_day_of_week(aus["day"]):
+                    if self._is_day_of_week(aus["day"], now):
                         return (True, aus["reason"])
                 else:
                     return (True, aus["reason"])
@@ -276,7 +284,7 @@ class SmartScheduler:
         if "quarter_ends" in config and source == "treasury":
             qe = config["quarter_ends"]
             days_after = qe.get("days_after", 7)
-            days_since = self._days_since_quarter_end()
+            days_since = self._days_since_quarter_end(now)
 
             if 0 <= days_since <= days_after:
                 if qe["frequency"] == "daily":
@@ -288,8 +296,10 @@ class SmartScheduler:
             days_after = pq["days_after"]
             duration = pq.get("duration", 7)
 
-            for quarter_date in self._quarter_end_dates():
-                if self._is_within_days_of_date(quarter_date, days_after, duration):
+            for quarter_date in self._quarter_end_dates(now):
+                if self._is_within_days_of_date(
+                    quarter_date, days_after, duration, now
+                ):
                     # Check every 2 days during this window
                     if pq["frequency"] == "2_days":
                         # Use day of year modulo to get every 2 days
@@ -304,8 +314,10 @@ class SmartScheduler:
             days_after = qe.get("days_after", 14)
             duration = qe.get("duration", 21)
 
-            for quarter_date in self._quarter_end_dates():
-                if self._is_within_days_of_date(quarter_date, days_after, duration):
+            for quarter_date in self._quarter_end_dates(now):
+                if self._is_within_days_of_date(
+                    quarter_date, days_after, duration, now
+                ):
                     if qe["frequency"] == "biweekly":
                         # Check every 2 weeks (approximately day 14 and 28 of period)
                         week_num = now.isocalendar()[1]
@@ -315,7 +327,7 @@ class SmartScheduler:
         # OAG: 30+ days after quarter-end for special audits
         if "quarterly" in config and source == "oag":
             qrtly = config["quarterly"]
-            days_since = self._days_since_quarter_end()
+            days_since = self._days_since_quarter_end(now)
             offset = qrtly.get("offset", 30)
 
             if days_since >= offset and days_since <= offset + 30:
@@ -327,7 +339,7 @@ class SmartScheduler:
         # CRA: Monthly after quarter-ends
         if "quarter_ends" in config and source == "cra":
             qe = config["quarter_ends"]
-            days_since = self._days_since_quarter_end()
+            days_since = self._days_since_quarter_end(now)
 
             if 0 <= days_since <= 90:  # Within quarter
                 if qe["frequency"] == "monthly":
@@ -344,7 +356,7 @@ class SmartScheduler:
 
         elif freq == "weekly":
             target_day = default.get("day", "monday")
-            if self._is_day_of_week(target_day):
+            if self._is_day_of_week(target_day, now):
                 return (
                     True,
                     default.get("reason", f"Weekly default schedule ({target_day})"),
@@ -355,7 +367,7 @@ class SmartScheduler:
             if week_num % 2 == 0:  # Even weeks
                 target_days = default.get("days", ["monday"])
                 for day in target_days:
-                    if self._is_day_of_week(day):
+                    if self._is_day_of_week(day, now):
                         return (
                             True,
                             default.get("reason", "Biweekly default schedule"),
@@ -453,6 +465,35 @@ class SmartScheduler:
         next_run = now + timedelta(days=7)
         return (next_run, "Default weekly schedule")
 
+    def next_due(
+        self,
+        source: str,
+        after: Optional[datetime] = None,
+        horizon_days: int = 400,
+    ) -> Tuple[Optional[datetime], str]:
+        """
+        First day on or after ``after`` on which ``should_run`` is true.
+
+        Used by the job scheduler to compute one fire time per run instead
+        of re-evaluating the calendar rules on every tick. Day verdicts
+        are memoized, so walking the calendar is cheap after the first call.
+
+        Returns:
+            Tuple of (midnight of that day or None within the horizon, reason)
+        """
+        day = (after or datetime.now()).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        for _ in range(horizon_days):
+            key = (source, day.date())
+            if key not in self._day_verdicts:
+                self._day_verdicts[key] = self.should_run(source, now=day)
+            ok, reason = self._day_verdicts[key]
+            if ok:
+                return day, reason
+            day += timedelta(days=1)
+        return None, f"Not scheduled within {horizon_days} days"
+
     def _days_until_weekday(self, target_day: str) -> int:
         """Calculate days until target weekday (0 = Monday, 6 = Sunday)."""
         day_mapping = {
@@ -1,5 +1,8 @@
+import argparse
+import asyncio
 import os
 import random
+import sys
 import threading
 import time
 from datetime import datetime, timedelta
@@ -33,7 +36,8 @@ def load_config(path: str) -> Dict[str, Any]:
 def run_once(env: Dict[str, str]):
     # Small wrapper to run incremental backfill with env filters.
     # NOTE: Parliament is NOT routed here — it is owned exclusively by
-    # APScheduler in backend/main.py to avoid dual-scheduler execution.
+    # the backend job scheduler (services/job_scheduler.py) to avoid
+    # dual-scheduler execution.
     from subprocess import run
 
     args = ["python", "-m", "etl.backfill"]
@@ -120,5 +124,42 @@ def schedule_worker():
             time.sleep(10)
 
 
+def jobs_worker(include_seeder: bool = False):
+    # Runs the backend job queue (services/job_scheduler.py) in this
+    # process so the API only enqueues jobs and reads their status
+    # (JOB_EXECUTION=worker there). Every replica claims rows with
+    # FOR UPDATE SKIP LOCKED; the advisory-lock leader also enqueues the
+    # schedules. Memory is bounded by the container limit, and
+    # WORKER_MAX_RSS_MB makes the worker drain and exit for a restart
+    # before it gets there.
+    backend = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"
+    )
+    if os.path.isdir(backend) and backend not in sys.path:
+        sys.path.append(backend)  # append: the top-level etl package still wins
+
+    from services.job_scheduler import run_worker
+
+    asyncio.run(run_worker(include_seeder=include_seeder))
+
+
 if __name__ == "__main__":
-    schedule_worker()
+    parser = argparse.ArgumentParser(description="ETL worker")
+    parser.add_argument(
+        "--mode",
+        choices=["backfill", "jobs"],
+        default=os.getenv("ETL_WORKER_MODE", "backfill"),
+        help="backfill: scheduled etl.backfill runs; jobs: the backend job queue",
+    )
+    parser.add_argument(
+        "--seeder",
+        action="store_true",
+        default=os.getenv("AUTO_SEEDER_ENABLED", "false").lower()
+        in ("1", "true", "yes"),
+        help="also run the auto-seeder's boot seed and domain refreshes (jobs mode)",
+    )
+    cli = parser.parse_args()
+    if cli.mode == "jobs":
+        jobs_worker(include_seeder=cli.seeder)
+    else:
+        schedule_worker()
@@ -13,6 +13,8 @@ function UnsubscribeForm() {
   const params = useSearchParams();
   const email = params.get('email') || '';
   const token = params.get('token') || '';
+  // Watchlist alert emails link here with list=alerts.
+  const list = params.get('list') === 'alerts' ? 'alerts' : 'newsletter';
 
   const [status, setStatus] = useState<Status>(email && token ? 'confirm' : 'error');
   const [errorMsg, setErrorMsg] = useState(
@@ -23,7 +25,11 @@ function UnsubscribeForm() {
     setStatus('submitting');
     setErrorMsg('');
     try {
-      const { data } = await apiClient.post('/newsletter/unsubscribe-verify', { email, token });
+      const { data } = await apiClient.post('/newsletter/unsubscribe-verify', {
+        email,
+        token,
+        list,
+      });
       if (data.status === 'unsubscribed') {
         setStatus('done');
       } else if (data.status === 'already_unsubscribed') {
@@ -41,7 +47,7 @@ function UnsubscribeForm() {
           'Something went wrong. Please try again or contact support.'
       );
     }
-  }, [email, token]);
+  }, [email, token, list]);
 
   return (
     <div className='relative min-h-screen flex items-center justify-center px-4 py-20'>
@@ -68,7 +74,9 @@ function UnsubscribeForm() {
               <p className='text-white/60 text-sm mb-2'>Are you sure you want to unsubscribe?</p>
               <p className='text-white/80 text-sm font-medium mb-6 break-all'>{email}</p>
               <p className='text-white/50 text-xs mb-6'>
-                You will no longer receive weekly audit &amp; budget digests.
+                {list === 'alerts'
+                  ? 'You will no longer receive email alerts for items on your watchlist.'
+                  : 'You will no longer receive weekly audit & budget digests.'}
               </p>
               <button
                 onClick={handleUnsubscribe}
@@ -101,8 +109,17 @@ function UnsubscribeForm() {
               </div>
               <h1 className='font-display text-2xl text-white mb-2'>You're unsubscribed</h1>
               <p className='text-white/60 text-sm mb-6'>
-                We've removed <strong className='text-white/80'>{email}</strong> from our mailing
-                list. You won't receive any more emails from us.
+                {list === 'alerts' ? (
+                  <>
+                    Alert emails for <strong className='text-white/80'>{email}</strong> are now
+                    off for every item on your watchlist.
+                  </>
+                ) : (
+                  <>
+                    We've removed <strong className='text-white/80'>{email}</strong> from our
+                    mailing list. You won't receive any more emails from us.
+                  </>
+                )}
               </p>
               <p className='text-white/40 text-xs mb-6'>
                 Changed your mind? You can always re-subscribe from the homepage.